@@ -0,0 +1,449 @@
+"""
+Micro-Benchmarks for the performance sensitive portions of Fracta.
+
+Run from the repository root:
+    python examples/99_test/benchmarks.py            # Run every benchmark
+    python examples/99_test/benchmarks.py bar_append # Run a single benchmark
+"""
+
+import io
+import sys
+import time
+import tempfile
+import tracemalloc
+import asyncio
+import multiprocessing as mp
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from inspect import signature
+from json import JSONEncoder, dumps
+from math import floor
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+import fracta as fta
+from fracta import js_cmd, util, rolling, BarCache
+from fracta import series_common as sc
+from fracta.dataframe_ext import BarStore, Series_DF
+from fracta.shm_queue import ShmQueue
+
+BENCHMARKS: dict[str, Callable[[], None]] = {}
+
+
+def benchmark(func: Callable[[], None]) -> Callable[[], None]:
+    "Register a function as a runnable benchmark"
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def synthetic_ohlcv(n: int, freq: str = "1min") -> pd.DataFrame:
+    "Random-walk OHLCV DataFrame of length n"
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    spread = np.abs(rng.normal(0, 0.05, n))
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2000-01-03", periods=n, freq=freq, tz="UTC"),
+            "open": close - rng.normal(0, 0.02, n),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(100, 10_000, n).astype("float64"),
+        }
+    )
+
+
+def _report(name: str, n_ops: int, elapsed: float):
+    print(f"    {name:<36} {1e6 * elapsed / n_ops:>10.2f} us/op  {n_ops / elapsed:>14,.0f} ops/sec")
+
+
+# region --------------------------- Benchmarks --------------------------- #
+
+
+@benchmark
+def bar_append():
+    """
+    Per-append cost of adding a bar to a Series_DF at increasing history lengths.
+    The Columnar BarStore should remain flat while the pd.concat() baseline grows with N.
+    """
+    n_appends = 500
+    for n_hist in (1_000, 10_000, 100_000, 1_000_000):
+        print(f"  History Length: {n_hist:,}")
+        src = synthetic_ohlcv(n_hist + n_appends)
+        hist, new = src.iloc[:n_hist].copy(), src.iloc[n_hist:]
+        bars = [fta.OhlcData.from_dict(row) for row in new.to_dict("records")]
+
+        series = Series_DF(hist.copy())
+        start = time.perf_counter()
+        for bar in bars:
+            series.append_new_bar(bar)
+        _report("Series_DF.append_new_bar()", n_appends, time.perf_counter() - start)
+
+        # Baseline: Previous implementation that re-built the DataFrame on every new bar.
+        if n_hist > 100_000:
+            continue  # Too slow to be worth waiting on.
+        df = hist.set_index("time")
+        start = time.perf_counter()
+        for bar in bars:
+            row = pd.DataFrame([bar.as_dict]).set_index("time")
+            df = pd.concat([df, row])
+        _report("pd.concat() baseline", n_appends, time.perf_counter() - start)
+
+
+@benchmark
+def tick_aggregation():
+    "Ticks per second that can be aggregated into the last bar of a single Series_DF"
+    n_ticks = 200_000
+    rng = np.random.default_rng(7)
+    prices = (100 + np.cumsum(rng.normal(0, 0.01, n_ticks))).tolist()
+    volumes = rng.integers(1, 100, n_ticks).astype("float64").tolist()
+
+    series = Series_DF(synthetic_ohlcv(10_000))
+    ticks = [fta.SingleValueData(series.curr_bar_open_time, p, volume=v) for p, v in zip(prices, volumes)]
+    start = time.perf_counter()
+    for tick in ticks:
+        series.update_curr_bar(tick, accumulate=True)
+    _report("Series_DF.update_curr_bar()", n_ticks, time.perf_counter() - start)
+
+    # Raw aggregation, Materializing a dataclass once every 100 ticks
+    aggregator = series.ticks
+    start = time.perf_counter()
+    for i, (price, volume) in enumerate(zip(prices, volumes)):
+        aggregator.tick(price, volume, accumulate=True)
+        if i % 100 == 0:
+            aggregator.flush()
+    _report("TickAggregator.tick(), flush / 100", n_ticks, time.perf_counter() - start)
+
+
+
+@benchmark
+def series_transport():
+    "Size and formatting time of a SET_SERIES_DATA command using the JSON and Columnar data transports"
+    for n_bars in (5_000, 50_000):
+        print(f"  Bars: {n_bars:,}")
+        xfer_df = synthetic_ohlcv(n_bars)
+        xfer_df["time"] = xfer_df["time"].astype("int64") / 10**9
+
+        for transport in ("json", "columnar"):
+            fmt = js_cmd.cmd_rolodex(transport)[js_cmd.JS_CMD.SET_SERIES_DATA]
+            start = time.perf_counter()
+            cmd = fmt("f_id", "i_id", "s_id", xfer_df)
+            elapsed = time.perf_counter() - start
+            print(f"    {transport:<10} {1e3 * elapsed:>10.1f} ms  {len(cmd) / 2**20:>8.2f} MB")
+
+
+def _transfer_baseline(df: pd.DataFrame, valid_keys: set, value_map: dict) -> pd.DataFrame:
+    "Previous series_common transfer formatting that renamed & copied the whole DataFrame"
+    rename_keys = valid_keys.intersection(value_map.keys())
+    rename_dict = {value_map[k]: k for k in rename_keys if k != value_map[k] and value_map[k] in df.columns}
+    tmp_df = df.drop(columns=list(set(rename_dict.values()).intersection(df.columns))).rename(columns=rename_dict)
+    tmp_df.drop(columns=list(set(tmp_df.columns).difference(valid_keys)), inplace=True)
+    tmp_df.index.set_names("time", inplace=True)
+    tmp_df.reset_index(inplace=True)
+    tmp_df["time"] = tmp_df["time"].astype("int64") / 10**9
+    return tmp_df
+
+
+@benchmark
+def series_transfer():
+    """
+    Time & peak memory of formatting a 1M bar Series_DF for a Series' set_data(), which formats it
+    twice: once for the displayed candlesticks and once for the volume histogram.
+    """
+    series_df = Series_DF(synthetic_ohlcv(1_000_000))
+    cases = (
+        (fta.SeriesType.Candlestick, {"value": "close", "close": "close"}),
+        (fta.SeriesType.Histogram, {"value": "volume", "close": "volume"}),
+    )
+
+    def baseline():
+        for series_type, value_map in cases:
+            _transfer_baseline(series_df.df, series_type.params.difference({"volume"}), value_map)
+
+    def projected():
+        for series_type, value_map in cases:
+            sc.transfer_dataframe(series_df, series_type, value_map)
+
+    for name, func in (("Rename & Copy baseline", baseline), ("Cached Projection", projected)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"    {name:<36} {1e3 * elapsed:>10.1f} ms  {peak / 2**20:>8.1f} MB peak")
+
+
+def _from_dict_baseline(cls: type, obj: dict):
+    params = signature(cls).parameters
+    return cls(**{k: v for k, v in obj.items() if k in params})
+
+
+def _drop_nones(items) -> dict:
+    return {k: v for (k, v) in items if v is not None}
+
+
+class _ORMEncoderBaseline(JSONEncoder):
+    "Previous JSON Encoder of js_cmd.dump(). ORM Objects are converted by default() as they're found."
+
+    def default(self, o):
+        if isinstance(o, pd.Timestamp):
+            return floor(o.timestamp())
+        if is_dataclass(o) and not isinstance(o, type):
+            return asdict(o, dict_factory=_drop_nones)
+        if isinstance(o, pd.DataFrame):
+            return [{k: v for k, v in m.items() if pd.notnull(v)} for m in o.to_dict(orient="records")]
+        if isinstance(o, fta.Color):
+            return repr(o)
+        if isinstance(o, Enum):
+            return o.value
+        return super().default(o)
+
+
+def _dump_baseline(obj) -> str:
+    return dumps(obj, cls=_ORMEncoderBaseline, separators=(",", ":"))
+
+
+@benchmark
+def series_data_codecs():
+    """
+    Per-call cost of from_dict(), as_dict() & JSON encoding for each of the series data classes.
+    Compared to the previous implementations that called inspect.signature() & dataclasses.asdict().
+    """
+    n_ops = 20_000
+    src = {
+        "time": pd.Timestamp("2024-01-02 14:30", tz="UTC"),
+        "value": 101.5,
+        "open": 100.0,
+        "high": 102.0,
+        "low": 99.5,
+        "close": 101.5,
+        "volume": 1500.0,
+        "color": "#26a69a",
+        "rth": 0,
+    }
+    classes = (fta.SingleValueData, fta.LineData, fta.HistogramData, fta.OhlcData, fta.BarData, fta.CandlestickData)
+
+    for cls in classes:
+        print(f"  {cls.__name__}:")
+        bar = cls.from_dict(src)
+        cases = (
+            ("from_dict() signature baseline", lambda cls=cls: _from_dict_baseline(cls, src)),
+            ("from_dict()", lambda cls=cls: cls.from_dict(src)),
+            ("as_dict asdict() baseline", lambda bar=bar: asdict(bar, dict_factory=_drop_nones)),
+            ("as_dict", lambda bar=bar: bar.as_dict),
+            ("dump() asdict() baseline", lambda bar=bar: _dump_baseline(bar)),
+            ("dump()", lambda bar=bar: js_cmd.dump(bar)),
+        )
+        for name, func in cases:
+            start = time.perf_counter()
+            for _ in range(n_ops):
+                func()
+            _report(name, n_ops, time.perf_counter() - start)
+
+
+@benchmark
+def json_encoding():
+    """
+    Per-command cost of formatting the most common data carrying commands with the previous
+    JSONEncoder.default() baseline and with each of the JSON backends of js_cmd.dump().
+    """
+    n_ops = 5_000
+    rolodex, cmd = js_cmd.VIEW_CMD_ROLODEX, js_cmd.JS_CMD
+    ids = ("f_id", "i_id", "s_id")
+    xfer_df = synthetic_ohlcv(1_000)
+    xfer_df["time"] = xfer_df["time"].astype("int64") // 10**9
+    bars = [fta.CandlestickData.from_dict(row) for row in synthetic_ohlcv(n_ops).to_dict("records")]
+    markers = [sc.Marker(bar.time, sc.MarkerShape.Arrow_Up, sc.MarkerLoc.Above, text="Buy") for bar in bars]
+
+    mix = (
+        ("update_series_data", n_ops, lambda i: rolodex[cmd.UPDATE_SERIES_DATA](*ids, bars[i])),
+        ("add_marker", n_ops, lambda i: rolodex[cmd.ADD_SERIES_MARKER](*ids, f"m{i}", markers[i])),
+        ("set_series_data (1,000 bars)", 50, lambda _: rolodex[cmd.SET_SERIES_DATA](*ids, xfer_df)),
+    )
+    backends = [("JSONEncoder baseline", None), ("json", "json")]
+    if js_cmd.orjson is not None:
+        backends.append(("orjson", "orjson"))
+
+    dump = js_cmd.dump
+    for backend_name, backend in backends:
+        print(f"  {backend_name}:")
+        if backend is None:
+            js_cmd.dump = _dump_baseline
+        else:
+            js_cmd.dump = dump
+            js_cmd.set_json_backend(backend)
+        for name, n, func in mix:
+            start = time.perf_counter()
+            for i in range(n):
+                func(i)
+            _report(name, n, time.perf_counter() - start)
+    js_cmd.dump = dump
+    js_cmd.set_json_backend()
+
+
+@benchmark
+def indicator_update():
+    """
+    Per-update latency of a 9 period moving average. The streaming stats of the rolling module are
+    compared to the previous data.tail(period).mean() & enlarge-by-label path of the SMA Indicator.
+    Every new bar receives 4 intra-bar revisions.
+    """
+    period, n_hist, n_new, n_revisions = 9, 50_000, 2_000, 4
+    src = synthetic_ohlcv(n_hist + n_new).set_index("time")["close"]
+    hist = src.iloc[:n_hist]
+    n_ops = n_new * (1 + n_revisions)
+
+    # Baseline: tail().mean() written into a pd.Series by label.
+    data, average = hist.copy(), hist.rolling(period).mean()
+    start = time.perf_counter()
+    for t, price in src.iloc[n_hist:].items():
+        for _ in range(1 + n_revisions):
+            data[t] = price
+            average[t] = data.tail(period).mean()
+    _report("tail().mean() baseline", n_ops, time.perf_counter() - start)
+
+    for name, stat_cls in (("SMA", rolling.RollingMean), ("EMA", rolling.EMA), ("RMA", rolling.RMA)):
+        stat = stat_cls(period)
+        store = BarStore(stat.seed(hist).to_frame("average"))
+        start = time.perf_counter()
+        for t, price in src.iloc[n_hist:].items():
+            store.append(t, {"average": stat.update(price, True)})
+            for _ in range(n_revisions):
+                store.update_last({"average": stat.update(price, False)})
+        _report(f"rolling.{stat_cls.__name__} ({name})", n_ops, time.perf_counter() - start)
+
+
+@benchmark
+def bar_cache():
+    """
+    Time to load a history through a BarCache. The data provider is simulated by writing & parsing
+    a CSV of the requested bars. A cold load fetches, and caches, every bar. 100 bars later, a warm
+    load reads the cached bars and only fetches the bars from the last cached bar onward.
+    """
+
+    def fetch(rows: pd.DataFrame) -> pd.DataFrame:
+        return pd.read_csv(io.StringIO(rows.to_csv(index=False)))
+
+    symbol, tf = fta.Symbol("BENCH"), fta.TF(1, "m")
+    for n_bars in (50_000, 500_000):
+        print(f"  Bars: {n_bars:,}")
+        src = synthetic_ohlcv(n_bars + 100)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BarCache(directory)
+
+            start = time.perf_counter()
+            cache.merge(symbol, tf, fetch(src.iloc[:n_bars]))
+            print(f"    {'Cold: Fetch & Cache':<36} {1e3 * (time.perf_counter() - start):>10.1f} ms")
+
+            start = time.perf_counter()
+            cached = cache.load(symbol, tf)
+            assert cached is not None
+            df, _ = cache.merge(symbol, tf, fetch(src[src["time"] >= cached["time"].iloc[-1]]))
+            print(f"    {'Warm: Load, Fetch & Merge the tail':<36} {1e3 * (time.perf_counter() - start):>10.1f} ms")
+            assert len(df) == len(src)
+
+
+def _drain(queue, n_msgs: int, done):
+    "Consumer Process for the ipc_transport benchmark"
+    for _ in range(n_msgs):
+        queue.get()
+    done.set()
+
+
+@benchmark
+def ipc_transport():
+    "Throughput of the fwd_queue to a consumer process using an mp.Queue and a Shared Memory ShmQueue"
+    xfer_df = synthetic_ohlcv(50_000)
+    xfer_df["time"] = xfer_df["time"].astype("int64") / 10**9
+    tick = fta.SingleValueData(pd.Timestamp("2024-01-01", tz="UTC"), 100.0)
+    cases = {
+        "History Load (50k bars) x 50": (50, (js_cmd.JS_CMD.SET_SERIES_DATA, "f", "i", "s", xfer_df)),
+        "Tick Flood x 50,000": (50_000, (js_cmd.JS_CMD.UPDATE_SERIES_DATA, "f", "i", "s", tick)),
+    }
+
+    for case, (n_msgs, msg) in cases.items():
+        print(f"  {case}")
+        for name, queue in (("mp.Queue", mp.Queue()), ("ShmQueue", ShmQueue())):
+            done = mp.Event()
+            consumer = mp.Process(target=_drain, args=(queue, n_msgs, done))
+            consumer.start()
+            start = time.perf_counter()
+            for _ in range(n_msgs):
+                queue.put(msg)
+            done.wait()
+            _report(name, n_msgs, time.perf_counter() - start)
+            consumer.join()
+            if isinstance(queue, ShmQueue):
+                queue.close()
+
+
+def _stamp(queue, n_msgs: int, interval: float):
+    "Producer Process for the rtn_latency benchmark. Simulates a user clicking every 'interval' seconds"
+    for _ in range(n_msgs):
+        time.sleep(interval)
+        queue.put((time.perf_counter(),))
+
+
+def _latency_report(name: str, latencies: list[float]):
+    arr = 1e3 * np.array(latencies)
+    mean, p50, p99 = arr.mean(), np.median(arr), np.percentile(arr, 99)
+    print(f"    {name:<36} mean {mean:>7.2f} ms  p50 {p50:>7.2f} ms  p99 {p99:>7.2f} ms")
+
+
+@benchmark
+def rtn_latency():
+    """
+    Time from a message being put on the rtn_queue by the View Process to its handler running on the
+    Window's event loop. Compares the previous 50ms polling loop to util.consume_queue().
+    """
+    n_msgs, interval = 200, 0.013
+
+    async def polling(queue, stop_event, latencies):
+        while not stop_event.is_set():
+            if queue.empty():
+                await asyncio.sleep(0.05)
+            else:
+                latencies.append(time.perf_counter() - queue.get()[0])
+
+    async def consumer(queue, stop_event, latencies):
+        def handler(msgs):
+            now = time.perf_counter()
+            latencies.extend(now - msg[0] for msg in msgs)
+
+        await util.consume_queue(queue, stop_event, handler)
+
+    for name, manager in (("Polling every 50ms", polling), ("util.consume_queue()", consumer)):
+        queue, stop_event, latencies = mp.Queue(), mp.Event(), []
+        producer = mp.Process(target=_stamp, args=(queue, n_msgs, interval))
+
+        async def run(manager, queue, stop_event, latencies, producer):
+            task = asyncio.create_task(manager(queue, stop_event, latencies))
+            producer.start()
+            while len(latencies) < n_msgs:
+                await asyncio.sleep(0.01)
+            stop_event.set()
+            await task
+
+        asyncio.run(run(manager, queue, stop_event, latencies, producer))
+        producer.join()
+        _latency_report(name, latencies)
+
+
+# endregion
+
+
+def main(names: list[str]):
+    "Run the requested benchmarks, or all of them if none are given."
+    for name in names or list(BENCHMARKS.keys()):
+        if name not in BENCHMARKS:
+            print(f"Unknown Benchmark '{name}'. Options: {', '.join(BENCHMARKS.keys())}")
+            continue
+        print(f"{name}:")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
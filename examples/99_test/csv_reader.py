@@ -4,6 +4,7 @@ import asyncio
 import pandas as pd
 
 from fracta import Symbol, TF, indicators, OhlcData, SingleValueData
+from fracta.events import CancelToken
 
 
 def symbol_search_handler(ticker: str, **_) -> Optional[list[Symbol]]:
@@ -43,25 +44,28 @@ def data_request_handler(symbol: Symbol, timeframe: TF) -> Optional[pd.DataFrame
                 return pd.read_csv("examples/data/lwpc_ohlc.csv")
 
 
-async def socket_request_handler(symbol: Symbol, series: indicators.Series):
+async def socket_request_handler(symbol: Symbol, series: indicators.Series, token: CancelToken):
     """
-    Request Handler for Web-Sockets. The requested 'state' is determined by Symbol Changes
-    and the frame.socket_open Boolean. The user should keep this Boolean as up-to-date as possible.
+    Request Handler for Web-Sockets. Called once the data request of a Symbol / Timeframe change
+    has been emitted.
 
-    #Note: The implementation below, while simple and functional, is actually bugged. If a symbol
-    change from FRACTA to FRACTA-TICK (or vise-versa) is requested, this function has no way of
-    breaking the for-loop. Hence, data from one loop is sent to the other. This would be fixed by
-    allowing this function to spawn an Async Task and return. On the Symbol change the task could
-    then be killed when this function is called w/ the state = 'close' parameter.
+    The token is cancelled when the Series requests a different symbol or timeframe. Since this is
+    an async function, the Emitter also cancels this task along with the token, so data from the
+    old symbol's loop is never sent to the new one. Checking the token directly lets a handler
+    that is running in a thread, or one that shouldn't be interrupted mid-update, exit cleanly.
     """
     if symbol.ticker == "FRACTA":
         df = pd.read_csv("examples/data/lwpc_next_ohlcv.csv")
         for _, _, t, o, h, l, c, v in df.itertuples():
+            if token.cancelled:
+                return
             series.update_data(OhlcData(t, o, h, l, c, v))
             await asyncio.sleep(0.04)
 
     if symbol.ticker == "FRACTA-TICK":
         df = pd.read_csv("examples/data/lwpc_ticks.csv")
         for _, _, t, p in df.itertuples():
+            if token.cancelled:
+                return
             series.update_data(SingleValueData(t, p))
             await asyncio.sleep(0.02)
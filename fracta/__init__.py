@@ -32,6 +32,7 @@ from .orm.series_data import (
 )
 
 from .window import Window, Container, Frame, ChartingFrame
+from .bar_cache import BarCache
 from .indicator import Indicator, IndicatorOptions
 from . import indicators
 from . import broker_apis
@@ -41,6 +42,7 @@ __all__ = (
     "Container",
     "Frame",
     "ChartingFrame",
+    "BarCache",
     #
     # Types
     "TF",
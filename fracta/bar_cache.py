@@ -0,0 +1,246 @@
+"""
+Persistent, On-Disk, Bar Cache.
+
+Sits between a Series' data request and the data_request handler. Bars that were previously fetched
+for a (Symbol, Timeframe) are served from disk immediately, then only the bars that are missing
+from the cache are requested from the data provider and merged into the cache.
+
+Each entry is a directory holding one raw, append-only, binary file per column and a small JSON meta
+file. Columns are read straight into arrays so a warm load is bounded by the disk, not the parser.
+Loaded data is always a copy, never a map of the files, since a later merge rewrites them in place.
+"""
+
+from __future__ import annotations
+import os
+import re
+import json
+import time
+import shutil
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .orm.types import Symbol, TF
+from .dataframe_ext import _standardize_names
+
+logger = logging.getLogger("fracta_log")
+
+_META = "meta.json"
+_TIME = "time"
+
+
+class BarCache:
+    """
+    Directory of cached bars keyed by (Symbol, Timeframe).
+
+    Only the standardized numeric columns of the data returned by a data_request handler are
+    cached. Entries are evicted once they have not been loaded for 'max_age' seconds and then,
+    least recently used first, until the cache is no larger than 'max_bytes'.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: Optional[int] = 2 * 2**30,
+        max_age: Optional[float] = 30 * 86_400,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        # Size & last use of every entry, by directory name. Only scanned from disk once.
+        self._sizes: dict[str, int] = {}
+        self._used: dict[str, float] = {}
+        for path in self._entries():
+            self._sizes[path.name] = _entry_size(path)
+            self._used[path.name] = (path / _META).stat().st_mtime
+        self.evict()
+
+    @staticmethod
+    def key(symbol: Symbol, timeframe: TF) -> str:
+        "Directory name of the cache entry for the given symbol & timeframe"
+        parts = (symbol.source or "", symbol.exchange or "", symbol.ticker, str(timeframe))
+        return re.sub(r"[^A-Za-z0-9.=-]", "_", "_".join(parts))
+
+    @property
+    def nbytes(self) -> int:
+        "Size of every entry in the cache"
+        return sum(self._sizes.values())
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self.directory.iterdir() if (path / _META).is_file()]
+
+    # region --------- Read --------- #
+
+    def load(self, symbol: Symbol, timeframe: TF) -> Optional[pd.DataFrame]:
+        "Return the cached bars for the given symbol & timeframe, or None if nothing is cached"
+        path = self.directory / self.key(symbol, timeframe)
+        if (maps := self._read(path)) is None:
+            return None
+        cols = {name: np.array(arr) for name, arr in maps.items()}
+        del maps  # Release the maps so a merge can rewrite the files
+
+        # Mark as recently used. The file's mtime carries the last use over to the next session.
+        self._used[path.name] = time.time()
+        os.utime(path / _META)
+        return _to_frame(cols)
+
+    def _read(self, path: Path) -> Optional[dict[str, np.ndarray]]:
+        """
+        Memory-Map the columns of an entry. Returns None if the entry is missing or invalid.
+        The maps must not outlive the call that made them since writes truncate the mapped files.
+        """
+        try:
+            meta = json.loads((path / _META).read_text())
+            rows = meta["rows"]
+            return {
+                name: np.memmap(path / f"{name}.bin", dtype=np.dtype(dtype), mode="r", shape=(rows,))
+                for name, dtype in meta["columns"].items()
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Discarding invalid bar cache entry '%s': %s", path.name, e)
+            self._remove(path)
+            return None
+
+    # endregion
+
+    # region --------- Write --------- #
+
+    def merge(
+        self, symbol: Symbol, timeframe: TF, data: pd.DataFrame | list[dict[str, Any]]
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Merge freshly fetched bars into the cache. Fetched bars replace every cached bar at or after
+        the first fetched bar's time, so the cache file is only truncated & appended to.
+        Returns the full merged data and whether the fetched bars changed the cached data.
+        """
+        new = _to_columns(data)
+        path = self.directory / self.key(symbol, timeframe)
+        cached = self._read(path)
+
+        if new is None or len(new[_TIME]) == 0:
+            return (data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)), True
+        if cached is None or cached.keys() != new.keys():
+            self._write(path, new, 0)
+            return _to_frame(new), True
+
+        cut = int(np.searchsorted(cached[_TIME], new[_TIME][0], side="left"))
+        rows = len(cached[_TIME])
+        changed = rows - cut != len(new[_TIME]) or not all(
+            np.array_equal(cached[name][cut:], arr, equal_nan=arr.dtype.kind == "f") for name, arr in new.items()
+        )
+
+        merged, promoted = {}, False
+        for name, arr in new.items():
+            if arr.dtype != cached[name].dtype:
+                promoted |= np.result_type(arr, cached[name]) != cached[name].dtype
+                arr = new[name] = arr.astype(np.result_type(arr, cached[name]))
+            merged[name] = np.concatenate((cached[name][:cut], arr))
+        del cached  # Release the maps before the files are truncated
+
+        if changed and promoted:
+            # A promoted column, e.g. int -> float volume, can't be appended. Re-write the whole entry
+            self._write(path, merged, 0)
+        elif changed:
+            self._write(path, new, cut)
+        return _to_frame(merged), changed
+
+    def _write(self, path: Path, cols: dict[str, np.ndarray], start: int):
+        "Write the given columns into an entry starting at row 'start', dropping all rows after them"
+        try:
+            path.mkdir(exist_ok=True)
+            for name, arr in cols.items():
+                arr = np.ascontiguousarray(arr)
+                with open(path / f"{name}.bin", "r+b" if start > 0 else "wb") as f:
+                    f.truncate(start * arr.itemsize)
+                    f.seek(start * arr.itemsize)
+                    f.write(arr.tobytes())
+
+            meta = {
+                "rows": start + len(cols[_TIME]),
+                "columns": {name: arr.dtype.str for name, arr in cols.items()},
+            }
+            # Rows beyond 'rows' are never read, so the entry remains valid until the meta is replaced.
+            tmp = path / (_META + ".tmp")
+            tmp.write_text(json.dumps(meta))
+            os.replace(tmp, path / _META)
+        except OSError as e:
+            logger.warning("Failed to write bar cache entry '%s': %s", path.name, e)
+            self._remove(path)
+            return
+
+        self._sizes[path.name] = _entry_size(path)
+        self._used[path.name] = time.time()
+        self.evict()
+
+    # endregion
+
+    # region --------- Eviction --------- #
+
+    def remove(self, symbol: Symbol, timeframe: TF):
+        "Remove the cache entry of the given symbol & timeframe"
+        self._remove(self.directory / self.key(symbol, timeframe))
+
+    def clear(self):
+        "Remove every entry in the cache"
+        for path in self._entries():
+            self._remove(path)
+
+    def _remove(self, path: Path):
+        shutil.rmtree(path, ignore_errors=True)
+        self._sizes.pop(path.name, None)
+        self._used.pop(path.name, None)
+
+    def evict(self):
+        "Remove entries that have exceeded the cache's age limit and then its size limit"
+        entries = sorted(self._used, key=self._used.__getitem__)
+
+        if self.max_age is not None:
+            expiry = time.time() - self.max_age
+            while len(entries) > 0 and self._used[entries[0]] < expiry:
+                self._remove(self.directory / entries.pop(0))
+
+        if self.max_bytes is not None:
+            total = self.nbytes
+            for name in entries:
+                if total <= self.max_bytes:
+                    break
+                total -= self._sizes[name]
+                self._remove(self.directory / name)
+
+    # endregion
+
+
+def _entry_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+def _to_columns(data: pd.DataFrame | list[dict[str, Any]]) -> Optional[dict[str, np.ndarray]]:
+    "Standardized, numeric, columns of the given data with time as int64 UTC nanoseconds"
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    _standardize_names(df)
+    if _TIME not in df.columns:
+        return None
+
+    df[_TIME] = pd.to_datetime(df[_TIME], utc=True)
+    if not df[_TIME].is_monotonic_increasing:
+        df = df.sort_values(_TIME)
+    cols = {_TIME: pd.DatetimeIndex(df[_TIME]).as_unit("ns").asi8}
+    for name, col in df.items():
+        if name != _TIME and isinstance(col.dtype, np.dtype) and col.dtype.kind in "biuf":
+            cols[str(name)] = col.to_numpy()
+    return cols
+
+
+def _to_frame(cols: dict[str, np.ndarray]) -> pd.DataFrame:
+    data: dict[str, Any] = {name: arr for name, arr in cols.items() if name != _TIME}
+    return pd.DataFrame(
+        {_TIME: pd.DatetimeIndex(np.asarray(cols[_TIME]).view("datetime64[ns]")).tz_localize("UTC"), **data},
+        copy=False,
+    )
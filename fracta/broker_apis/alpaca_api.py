@@ -96,6 +96,10 @@ class AlpacaAPI:
         "Set a Pychart Window's Event Callbacks & Filters for use with Alpaca"
         window.events.data_request += self.get_hist
         window.events.symbol_search += self.search_symbols
+        # Alpaca's history & asset requests block, sometimes for seconds. Keep them off the event loop.
+        for emitter in (window.events.data_request, window.events.symbol_search):
+            if emitter.executor is None:
+                emitter.executor = 2
         window.events.open_socket += self.open_socket
         window.events.close_socket += self.close_socket
 
@@ -137,12 +141,13 @@ class AlpacaAPI:
             "symbol_or_symbols": symbol.ticker,
             "timeframe": _format_time(timeframe),
         }
-        if limit is not None:
+        if start is not None:
+            # Delta fetch, e.g. from the last bar of a BarCache hit. Only the bars from start onward are needed.
+            args["start"] = start.to_pydatetime() if isinstance(start, Timestamp) else start
+        elif limit is not None:
             args["limit"] = limit
             # Start @ # Number of bars back so a current time is always shown
-            args["start"] = str(Timestamp.now() - (50_000 * timeframe.as_timedelta()))
-        if start is not None:
-            args["start"] = start
+            args["start"] = str(Timestamp.now() - (limit * timeframe.as_timedelta()))
         if end is not None:
             args["end"] = end
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+from math import ceil, log2
 from typing import Optional
 
 import pandas as pd
@@ -10,6 +11,7 @@ from . import util
 from . import indicators
 from . import window as win
 from . import indicator as ind
+from . import decimation
 from .js_cmd import JS_CMD
 
 from . import AnyBasicData, SingleValueData
@@ -27,14 +29,23 @@ class ChartingFrame(win.Frame):
     """
 
     Frame_Type = win.FrameTypes.CHART
+    # Bars from the left edge of the loaded data the view must be within to load older data
+    LAZY_LOAD_MARGIN = 50
 
     def __init__(self, parent: win.Container, _js_id: Optional[str] = None) -> None:
         super().__init__(parent, _js_id)
 
+        # Number of the most recent bars that are sent to the screen. None == All Bars.
+        self.bars_back: Optional[int] = self._window.lazy_load_bars
+        # Seconds of the buckets that all displayed bars are merged into. None == Full Resolution.
+        self.decimation_span: Optional[int] = None
+
         # Indicators & Panes append themselves to these ID_Dicts.
         # See Indicator DocString for reasoning.
         self.panes = util.ID_Dict[Pane](f"{self._js_id}_p")
         self.indicators = util.ID_Dict[ind.Indicator]("i")
+        # Dependency Graph that schedules the set & update calls of the Indicators
+        self.indicator_graph = ind.IndicatorGraph(self._window.indicator_pool, self._fwd_queue)
 
         # Add main pane and Series, neither should ever be deleted
         self.add_pane(Pane.__special_id__)
@@ -56,6 +67,48 @@ class ChartingFrame(win.Frame):
     def __update_whitespace__(self, data: AnyBasicData, curr_time: SingleValueData):
         self._fwd_queue.put((JS_CMD.UPDATE_WHITESPACE_DATA, self._js_id, data, curr_time))
 
+    def __reset_bars_back__(self):
+        "Reset the number of displayed bars and their decimation. Should be called before new data is set."
+        self.bars_back = self._window.lazy_load_bars
+        self.decimation_span = None
+
+    def __visible_range_change__(self, from_index: float, to_index: float, width: Optional[float] = None):
+        """
+        Load older bars onto the screen when the visible range nears the start of the loaded data,
+        then re-decimate the displayed bars if the number of bars per pixel has changed enough.
+        """
+        if width is not None and self._window.decimation_spacing is not None:
+            self._update_decimation(to_index - from_index, width)
+
+        if self.bars_back is None or self._window.lazy_load_bars is None:
+            return
+        main_data = self.main_series.main_data
+        if main_data is None or self.bars_back >= len(main_data):
+            return  # Everything is already displayed
+        if from_index < self.LAZY_LOAD_MARGIN:
+            self.set_bars_back(self.bars_back + self._window.lazy_load_bars)
+
+    def _update_decimation(self, visible_bars: float, width: float):
+        "Pick the decimation span that displays bars roughly 'decimation_spacing' pixels apart"
+        main_data = self.main_series.main_data
+        if main_data is None or len(main_data) == 0 or width <= 0:
+            return
+        epoch = main_data.epoch_seconds
+        if self.bars_back is not None:
+            epoch = epoch[-self.bars_back :]
+
+        # Visible bars are reported in displayed, possibly decimated, bars. Convert them to raw bars.
+        raw_per_bar = 1.0
+        if self.decimation_span is not None:
+            raw_per_bar = len(epoch) / len(decimation.bucket_starts(epoch, self.decimation_span))
+        density = max(visible_bars, 1) * raw_per_bar * self._window.decimation_spacing / width
+
+        # Powers of two so small zooms don't re-send the displayed data
+        factor = 2 ** ceil(log2(density)) if density > 1 else 1
+        span = None if factor == 1 else factor * main_data.timeframe.unix_len
+        if span != self.decimation_span:
+            self.set_decimation(span)
+
     # endregion
 
     def add_pane(self, js_id: Optional[str] = None) -> Pane:
@@ -79,6 +132,37 @@ class ChartingFrame(win.Frame):
         "Main Display Pane of the Frame"
         return self.panes[self.panes.prefix + Pane.__special_id__]
 
+    @property
+    def display_start(self) -> Optional[pd.Timestamp]:
+        "Open time of the first bar of the Main Series that is displayed. None if all bars are displayed."
+        if self.bars_back is None:
+            return None
+        main_data = self.main_series.main_data
+        if main_data is None or self.bars_back >= len(main_data):
+            return None
+        return main_data.df.index[-self.bars_back]
+
+    def set_bars_back(self, bars_back: Optional[int]):
+        """
+        Set the number of the most recent Main Series bars that are displayed. When more bars are
+        displayed only the newly exposed, older, bars of each Series are sent. None displays all bars.
+        """
+        prev_start = self.display_start
+        self.bars_back = bars_back
+        for indicator in self.indicators.values():
+            indicator.__display_range_change__(prev_start)
+
+    def set_decimation(self, span: Optional[int]):
+        """
+        Set the length, in seconds, of the buckets that the bars of every Series on this frame are
+        merged into before they are displayed. None displays every bar. The visible time range is kept.
+        """
+        self.decimation_span = span
+        self._fwd_queue.put((JS_CMD.HOLD_VISIBLE_RANGE, self._js_id))
+        for indicator in self.indicators.values():
+            indicator.__decimation_change__()
+        self._fwd_queue.put((JS_CMD.RESTORE_VISIBLE_RANGE, self._js_id))
+
     @property
     def main_series(self) -> indicators.Series:
         "Series Indicator that contain's the Frame's main symbol data"
@@ -1,20 +1,28 @@
 "Pandas Dataframe extensions to manage Series Data and Market Calendars"
 
 from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import fields
 from functools import partial
 from importlib import import_module
 import logging
-from math import inf
+from math import nan
+from time import monotonic
 from types import ModuleType
 from typing import TYPE_CHECKING, Dict, Optional, Any
 
+import numpy as np
 import pandas as pd
+from pandas.arrays import DatetimeArray
+from pandas.tseries.frequencies import to_offset
 
 from .orm import series_data as sd
-from .orm.types import TF
+from .orm.types import Symbol, TF
 
 log = logging.getLogger("fracta_log")
 
+_DAY_NS = 86_400 * 10**9
+
 # Trading Hours Integer Encoding
 EXT_MAP = {
     "pre": 1,
@@ -139,19 +147,464 @@ def _column_name_check(
     return {intersection[0]: aliases[0]}
 
 
+# endregion
+
+# region --------------------------- Columnar Bar Storage --------------------------- #
+
+UTC_DTYPE = pd.DatetimeTZDtype("ns", "UTC")
+
+
+def _utc_index(values: np.ndarray) -> pd.DatetimeIndex:
+    "Wrap an int64 array of UTC Epoch nanoseconds in a DatetimeIndex without copying the array"
+    # DatetimeArray._simple_new() is private, but it is the only constructor that will attach a
+    # timezone without copying the underlying array. Fall back to the public, copying, constructor.
+    try:
+        arr = DatetimeArray._simple_new(values.view("M8[ns]"), dtype=UTC_DTYPE)  # pylint: disable=protected-access
+        return pd.DatetimeIndex(arr, copy=False)
+    except (AttributeError, TypeError):
+        return pd.DatetimeIndex(values.view("M8[ns]"), dtype=UTC_DTYPE)
+
+
+def _fits(dtype: np.dtype, value: Any) -> bool:
+    "Check that a value can be written into an array of the given dtype without loss of information"
+    match dtype.kind:
+        case "O":
+            return True
+        case "f":
+            return value is None or isinstance(value, (int, float, np.number))
+        case "i" | "u":
+            return isinstance(value, (int, np.integer))
+        case "b":
+            return isinstance(value, (bool, np.bool_))
+        case "M":
+            return value is None or isinstance(value, (pd.Timestamp, np.datetime64))
+        case _:
+            return False
+
+
+def _promote(dtype: np.dtype, value: Any) -> np.dtype:
+    "Returns the dtype a column must be cast to so it can store the given value. (Missing values = None)"
+    if dtype.kind in "iub" and (value is None or isinstance(value, (int, float, np.number))):
+        # Mimic Pandas' behavior of storing missing integers as NaN
+        return np.dtype("float64")
+    return np.dtype("O")
+
+
+def _missing(dtype: np.dtype) -> Any:
+    "The value written to a column of the given dtype when a row doesn't define it"
+    match dtype.kind:
+        case "f":
+            return np.nan
+        case "M":
+            return np.datetime64("NaT")
+        case _:
+            return None
+
+
+def _box(value: Any) -> Any:
+    "Convert a Numpy Scalar to a native python object so it can be JSON Serialized"
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value, tz="UTC") if not np.isnat(value) else None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class BarStore:
+    """
+    Columnar, Numpy backed, Storage of time-series bars.
+
+    Every column is held in a pre-allocated array that doubles in capacity when it fills. This
+    makes appending a bar amortized O(1) instead of the O(N) copy that pd.concat() preforms.
+
+    A DataFrame of the filled portion of the arrays is only constructed when requested through
+    the 'df' property. This DataFrame shares memory with the store and is cached until the shape
+    of the store changes. Writes to the last bar are made in place so they are reflected in any
+    DataFrame / Series that has already been handed out.
+    """
+
+    MIN_CAPACITY = 256
+
+    def __init__(self, df: pd.DataFrame):
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise TypeError("BarStore requires a DataFrame with a DatetimeIndex.")
+
+        self._len = len(df)
+        self._capacity = max(self.MIN_CAPACITY, 2 * self._len)
+        self._df: Optional[pd.DataFrame] = None
+        self._seconds: Optional[np.ndarray] = None
+        # Incremented whenever a column array is re-allocated. Allows references to be cached.
+        self.version = 0
+
+        index = df.index.tz_convert("UTC") if df.index.tz is not None else df.index.tz_localize("UTC")
+        self._time = np.empty(self._capacity, dtype="int64")
+        self._time[: self._len] = index.as_unit("ns").asi8
+
+        self._cols: Dict[str, np.ndarray] = {}
+        for name in df.columns:
+            self._ingest(str(name), np.asarray(df[name]))
+
+    def __len__(self) -> int:
+        return self._len
+
+    # region --------- Properties --------- #
+
+    @property
+    def columns(self) -> list[str]:
+        "Column Names within the store"
+        return list(self._cols.keys())
+
+    @property
+    def capacity(self) -> int:
+        "Number of rows that can be stored before the arrays must be re-allocated"
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        "Bytes allocated by the store's arrays, including unused capacity"
+        return self._time.nbytes + sum(arr.nbytes for arr in self._cols.values())
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        "UTC DatetimeIndex of the stored bars. Shares memory with the store."
+        return _utc_index(self._time[: self._len])
+
+    @property
+    def df(self) -> pd.DataFrame:
+        "DataFrame view of the stored bars. The view is only valid until the next append."
+        if self._df is None:
+            self._df = pd.DataFrame(
+                {name: arr[: self._len] for name, arr in self._cols.items()},
+                index=self.index,
+                copy=False,
+            )
+        return self._df
+
+    @property
+    def epoch_seconds(self) -> np.ndarray:
+        "Read-Only, float64, Unix Epoch seconds of the stored bars. Cached until the next append."
+        if self._seconds is None or len(self._seconds) != self._len:
+            self._seconds = self._time[: self._len] / 10**9
+            self._seconds.flags.writeable = False
+        return self._seconds
+
+    @property
+    def first_time(self) -> pd.Timestamp:
+        "Open time of the first bar"
+        return pd.Timestamp(int(self._time[0]), tz="UTC")
+
+    @property
+    def last_time(self) -> pd.Timestamp:
+        "Open time of the last bar"
+        return pd.Timestamp(int(self._time[self._len - 1]), tz="UTC")
+
+    # endregion
+
+    def column(self, name: str) -> np.ndarray:
+        "Returns the filled portion of a column. Shares memory with the store."
+        return self._cols[name][: self._len]
+
+    def array(self, name: str) -> np.ndarray:
+        """
+        Returns the entire, pre-allocated, array of a column in its stored dtype.
+        The reference is only valid while the store's version remains unchanged.
+        """
+        return self._cols[name]
+
+    def last(self, name: str, default: Any = None) -> Any:
+        "Returns the value of a column at the last bar"
+        if name not in self._cols or self._len == 0:
+            return default
+        return _box(self._cols[name][self._len - 1])
+
+    def last_row(self) -> dict[str, Any]:
+        "Returns the last bar as a dictionary that includes a 'time' key"
+        row = {name: _box(arr[self._len - 1]) for name, arr in self._cols.items()}
+        row["time"] = self.last_time
+        return row
+
+    def update_last(self, values: dict[str, Any]):
+        "Overwrite values of the last bar in place. Keys that are not existing columns are ignored."
+        i = self._len - 1
+        for key, value in values.items():
+            if key in self._cols:
+                self._write(key, i, value)
+
+    def append(self, time: pd.Timestamp, values: dict[str, Any]):
+        """
+        Append a new bar. Columns that are not defined by values are filled with a missing value.
+        Keys that are not existing columns are added as new columns.
+        """
+        if self._len == self._capacity:
+            self._grow()
+
+        i = self._len
+        self._time[i] = pd.Timestamp(time).value
+        self._len += 1
+
+        for key, value in values.items():
+            if key not in self._cols:
+                self._add_column(key, value)
+            self._write(key, i, value)
+
+        for key, arr in self._cols.items():
+            if key not in values:
+                self._write(key, i, _missing(arr.dtype))
+
+        self._df = None
+
+    def set_column(self, name: str, values: pd.Series | np.ndarray | list):
+        "Set, or overwrite, an entire column of the store"
+        values = np.asarray(values)
+        if len(values) != self._len:
+            raise ValueError(f"Column '{name}' has length {len(values)}, expected {self._len}.")
+        self._ingest(name, values)
+        self._df = None
+
+    def drop_column(self, name: str):
+        "Remove a column from the store if it exists"
+        if self._cols.pop(name, None) is not None:
+            self._df = None
+            self.version += 1
+
+    def filter(self, mask: np.ndarray):
+        "Keep only the rows where the given boolean mask is True"
+        keep = np.flatnonzero(mask[: self._len])
+        self._len = len(keep)
+        self._time[: self._len] = self._time[keep]
+        for arr in self._cols.values():
+            arr[: self._len] = arr[keep]
+        self._df = None
+        self._seconds = None
+
+    def truncate(self, n: int):
+        "Drop every row from row 'n' onward. The arrays keep their capacity so rows can be re-appended"
+        self._len = min(self._len, max(n, 0))
+        self._df = None
+
+    def extend(self, df: pd.DataFrame):
+        """
+        Append the rows of a DataFrame with a DatetimeIndex, one copy per column. Columns of the store
+        that the DataFrame lacks are filled with a missing value, columns the store lacks are ignored.
+        """
+        n = len(df)
+        while self._len + n > self._capacity:
+            self._grow()
+
+        index = df.index.tz_convert("UTC") if df.index.tz is not None else df.index.tz_localize("UTC")
+        rows = slice(self._len, self._len + n)
+        self._time[rows] = index.as_unit("ns").asi8
+        for name, arr in self._cols.items():
+            if name in df.columns:
+                values = np.asarray(df[name])
+                dtype = np.result_type(arr.dtype, values.dtype)
+            else:
+                values = None
+                dtype = _promote(arr.dtype, None) if arr.dtype.kind in "iub" else arr.dtype
+            if dtype != arr.dtype:
+                arr = self._cols[name] = arr.astype(dtype)
+                self.version += 1
+            arr[rows] = values if values is not None else _missing(dtype)
+
+        self._len += n
+        self._df = None
+
+    def _ingest(self, name: str, values: np.ndarray):
+        arr = np.empty(self._capacity, dtype=values.dtype)
+        arr[: len(values)] = values
+        self._cols[name] = arr
+        self.version += 1
+
+    def _add_column(self, name: str, value: Any):
+        dtype = np.dtype("float64") if isinstance(value, (int, float, np.number)) else np.dtype("O")
+        arr = np.empty(self._capacity, dtype=dtype)
+        arr[: self._len] = _missing(dtype)
+        self._cols[name] = arr
+        self.version += 1
+
+    def _write(self, name: str, i: int, value: Any):
+        arr = self._cols[name]
+        if not _fits(arr.dtype, value):
+            arr = self._cols[name] = arr.astype(_promote(arr.dtype, value))
+            self._df = None
+            self.version += 1
+        if value is None:
+            value = _missing(arr.dtype)
+        arr[i] = value
+
+    def _grow(self):
+        "Double the capacity of every column. Amortized over the appends, this is O(1)"
+        self._capacity *= 2
+        self._time = np.resize(self._time, self._capacity)
+        for name, arr in self._cols.items():
+            new_arr = np.empty(self._capacity, dtype=arr.dtype)
+            new_arr[: self._len] = arr[: self._len]
+            self._cols[name] = new_arr
+        self._df = None
+        self.version += 1
+
+
+class TickAggregator:
+    """
+    Aggregates realtime updates into the last bar of a BarStore.
+
+    Updates are applied with scalar arithmetic directly on the store's column arrays so no
+    intermediate dicts, Series, or dataclasses are created per tick. Columns keep their dtype; a
+    fractional value promotes an integer column rather than being truncated. A dataclass of the bar is only
+    materialized when flush() is called, ideally once per batch of ticks that is sent to the screen.
+    """
+
+    def __init__(self, store: BarStore, data_cls: type):
+        self._store = store
+        self._data_cls = data_cls
+        self._fields = [f.name for f in fields(data_cls) if f.name not in ("time", "custom_values")]
+        self._version = -1
+
+        self._bar_fields: list[str] = []
+        self._high: Optional[np.ndarray] = None
+        self._low: Optional[np.ndarray] = None
+        self._close: Optional[np.ndarray] = None
+        self._value: Optional[np.ndarray] = None
+        self._volume: Optional[np.ndarray] = None
+
+    def _bind(self):
+        "Cache references to the store's column arrays. Must be redone when the store re-allocates."
+        cols = set(self._store.columns)
+
+        def _get(name: str) -> Optional[np.ndarray]:
+            return self._store.array(name) if name in cols else None
+
+        self._high, self._low, self._close = _get("high"), _get("low"), _get("close")
+        self._value, self._volume = _get("value"), _get("volume")
+        self._bar_fields = [name for name in self._fields if name in cols]
+        self._version = self._store.version
+
+    def tick(self, price: Optional[float], volume: Optional[float] = None, accumulate: bool = False):
+        "Aggregate a single traded price, and optionally its volume, into the last bar"
+        if self._version != self._store.version:
+            self._bind()
+        i = len(self._store) - 1
+
+        if self._value is not None:
+            self._set(self._value, "value", i, nan if price is None else price)
+        elif self._close is not None:
+            if price is not None:
+                # Negated comparisons so a NaN high/low is also overwritten
+                if not price <= self._high[i]:  # type: ignore
+                    self._set(self._high, "high", i, price)
+                if not price >= self._low[i]:  # type: ignore
+                    self._set(self._low, "low", i, price)
+            self._set(self._close, "close", i, nan if price is None else price)
+
+        if volume is not None and self._volume is not None:
+            self._add_volume(i, volume, accumulate)
+
+    def bar(
+        self,
+        high: Optional[float],
+        low: Optional[float],
+        close: Optional[float],
+        volume: Optional[float] = None,
+        accumulate: bool = False,
+    ):
+        "Aggregate a partial OHLC bar into the last bar"
+        if self._version != self._store.version:
+            self._bind()
+        i = len(self._store) - 1
+
+        if self._value is not None:
+            self._set(self._value, "value", i, nan if close is None else close)
+        elif self._close is not None:
+            if high is not None and not high <= self._high[i]:  # type: ignore
+                self._set(self._high, "high", i, high)
+            if low is not None and not low >= self._low[i]:  # type: ignore
+                self._set(self._low, "low", i, low)
+            self._set(self._close, "close", i, nan if close is None else close)
+
+        if volume is not None and self._volume is not None:
+            self._add_volume(i, volume, accumulate)
+
+    def update(self, data: sd.AnyBasicData, accumulate: bool = False):
+        "Aggregate a Single Value or OHLC Dataclass into the last bar. Whitespace is ignored."
+        match data:
+            case sd.OhlcData():
+                self.bar(data.high, data.low, data.close, data.volume, accumulate)
+            case sd.SingleValueData():
+                self.tick(data.value, data.volume, accumulate)
+
+    def flush(self) -> sd.AnyBasicData:
+        "Materialize the last bar as an instance of the store's data class"
+        if self._version != self._store.version:
+            self._bind()
+        store = self._store
+        return self._data_cls(store.last_time, **{name: store.last(name) for name in self._bar_fields})
+
+    def _add_volume(self, i: int, volume: float, accumulate: bool):
+        vol = self._volume
+        if accumulate and vol[i] == vol[i]:  # type: ignore # (NaN != NaN)
+            volume = vol[i] + volume  # type: ignore
+        self._set(vol, "volume", i, volume)  # type: ignore
+
+    def _set(self, arr: np.ndarray, name: str, i: int, value: Any):
+        "Write a value into a bound column. Non-float columns go through the store so they are promoted if needed"
+        if arr.dtype.kind == "f":
+            arr[i] = value
+        else:
+            self._store.update_last({name: _box(value)})
+            if self._version != self._store.version:
+                self._bind()
+
+
 # endregion
 
 # region --------------------------- Pandas Dataframe Object Wrappers --------------------------- #
 
-# TODO: Integrate a method of tracking what is displayed and use that to limit the amount displayed.
-# Currently, All data is sent to the screen. This may be thousands of data-points that may never be
-# viewed. To limit the load on the Multi-processor fwd_queue an 'infinite history' system is needed
-# e.g. : https://tradingview.github.io/lightweight-charts/tutorials/demos/infinite-history
-#
-# I imagine this code will originate w/ a JS Window API callback in the rtn_queue. From there,
-# The Main_Series of the respective frame will handle the call; Updating a 'bars-back' variable in
-# the Frame's Main Series[_DF/Ind]. This update will then propagate down through the indicator stack
-# so each indicator can inform their respective series_common elements to display a certain range.
+# Only a portion of the data stored in a Series_DF may be displayed. When Window(lazy_load_bars=N)
+# is set, ChartingFrame.bars_back limits what each SeriesCommon sends to the screen. Older bars
+# are paged in as the JS Window reports, through PY_CMD.VISIBLE_RANGE_CHANGE, that it has been
+# scrolled near the start of the displayed data.
+
+
+def _freq_code(timeframe: TF) -> str | pd.Timedelta:
+    "The frequency code, matching Series_DF.freq_code, of the given timeframe"
+    return timeframe.as_timedelta() if timeframe.unix_len <= 86400 else timeframe.toStr
+
+
+def _resamples_to(base: TF, target: TF) -> bool:
+    "True if bars of the base timeframe fit evenly into bars of the target timeframe"
+    if base.unix_len >= target.unix_len:
+        return False
+    if target.period in ("M", "Y"):
+        return base.unix_len <= 86400  # Months & Years aren't a fixed length. Sessions are.
+    return target.unix_len % base.unix_len == 0
+
+
+def _aggregate(store: BarStore, first: int, starts: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Aggregate the bars of a store from row 'first' onward into the bins that begin at each of the
+    'starts' offsets. Columns that have no known aggregation, e.g. colors, are dropped.
+    """
+    ends = np.append(starts[1:], len(store) - first) - 1
+    rtn = {}
+    for name in store.columns:
+        col = store.column(name)[first:]
+        match name:
+            case "open" | "rth":
+                rtn[name] = col[starts]
+            case "high":
+                rtn[name] = np.fmax.reduceat(col, starts)
+            case "low":
+                rtn[name] = np.fmin.reduceat(col, starts)
+            case "close" | "value":
+                rtn[name] = col[ends]
+            case "volume" | "ticks":
+                rtn[name] = np.add.reduceat(np.nan_to_num(col), starts)
+
+    if "vwap" in store.columns and "volume" in store.columns:
+        vol = np.nan_to_num(store.column("volume")[first:])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rtn["vwap"] = np.add.reduceat(store.column("vwap")[first:] * vol, starts) / rtn["volume"]
+    return rtn
 
 
 class Series_DF:
@@ -167,6 +620,7 @@ class Series_DF:
         self,
         pandas_df: pd.DataFrame,
         exchange: Optional[str] = None,
+        timeframe: Optional[TF] = None,
     ):
         if len(pandas_df) <= 1:
             self._data_type = sd.SeriesType.WhitespaceData
@@ -180,14 +634,15 @@ class Series_DF:
         _standardize_names(pandas_df)
         # Set Consistent Time format (Pd.Timestamp, UTC, TZ Aware)
         pandas_df["time"] = pd.to_datetime(pandas_df["time"], utc=True)
-        self._pd_tf = determine_timedelta(pandas_df["time"])
-        self._tf = TF.from_timedelta(self._pd_tf)
+        # The Timeframe is determined from the data unless it's known, e.g. when the data is resampled
+        self._pd_tf = determine_timedelta(pandas_df["time"]) if timeframe is None else timeframe.as_timedelta()
+        self._tf = TF.from_timedelta(self._pd_tf) if timeframe is None else timeframe
         self.calendar = CALENDARS.request_calendar(exchange, pandas_df["time"].iloc[0], pandas_df["time"].iloc[-1])
-        self.df = pandas_df.set_index("time")
-        self._mark_ext()
+        self._store = BarStore(self._mark_ext(pandas_df.set_index("time")))
 
         # Data Type is used to simplify updating. Should be considered a constant
         self._data_type: sd.AnyBasicSeriesType = sd.SeriesType.data_type(pandas_df)
+        self._ticks = TickAggregator(self._store, self._data_type.cls)
 
         if self._pd_tf >= pd.Timedelta(days=1):
             # True if 'Time' lacks an opening Time
@@ -195,16 +650,45 @@ class Series_DF:
         else:
             self.only_days = False
 
-        self._next_bar_time = CALENDARS.next_timestamp(self.calendar, self.df.index[-1], self.freq_code, self._ext)
+        self._next_bar_time = CALENDARS.next_timestamp(
+            self.calendar, self.curr_bar_open_time, self.freq_code, self._ext
+        )
         if self.only_days:
             self._next_bar_time = self._next_bar_time.normalize()
 
+    def __len__(self) -> int:
+        return len(self._store)
+
     # region --------- Properties --------- #
 
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        The Series Data as a DataFrame. This DataFrame shares memory with the underlying BarStore
+        and is only valid until the next bar is appended. Columns should be added or removed
+        through set_column() and drop_column() so the change persists.
+        """
+        return self._store.df
+
+    @property
+    def store(self) -> BarStore:
+        "The Columnar BarStore that holds the Series Data"
+        return self._store
+
     @property
     def columns(self) -> set[str]:
         "Column Names within the Dataframe"
-        return set(self.df.columns)
+        return set(self._store.columns)
+
+    @property
+    def nbytes(self) -> int:
+        "Bytes allocated by the underlying BarStore"
+        return self._store.nbytes
+
+    @property
+    def epoch_seconds(self) -> np.ndarray:
+        "Read-Only Unix Epoch seconds of each bar. Shared by every Series that displays this data"
+        return self._store.epoch_seconds
 
     @property
     def ext(self) -> bool | None:
@@ -234,7 +718,7 @@ class Series_DF:
     @property
     def curr_bar_open_time(self) -> pd.Timestamp:
         "Open Time of the Current Bar"
-        return self.df.index[-1]
+        return self._store.last_time
 
     @property
     def curr_bar_close_time(self) -> pd.Timestamp:
@@ -247,44 +731,113 @@ class Series_DF:
         return self._next_bar_time
 
     @property
-    def current_bar(self) -> sd.AnyBasicData:
-        "The current bar (last entry in the dataframe) returned as AnyBasicType"
-        data_dict = self.df.iloc[-1].to_dict()
-        data_dict["time"] = self.df.index[-1]
-        return self.data_type.cls.from_dict(data_dict)
+    def ticks(self) -> TickAggregator:
+        "Tick Aggregator of the last bar. Use for high frequency updates that don't need a dataclass per tick."
+        return self._ticks
 
     @property
-    def _dt_index(self) -> pd.DatetimeIndex:
-        # Override the unknown index type with the known type
-        return self.df.index  # type:ignore
+    def current_bar(self) -> sd.AnyBasicData:
+        "The current bar (last entry in the dataframe) returned as AnyBasicType"
+        return self.data_type.cls.from_dict(self._store.last_row())
 
     # endregion
 
-    def _mark_ext(self, force_rth: bool = False):
-        if "rth" in self.columns:
+    def _mark_ext(self, df: pd.DataFrame, force_rth: bool = False) -> pd.DataFrame:
+        "Mark the Trading Session of each bar in the given DataFrame. Returns the marked DataFrame"
+        dt_index: pd.DatetimeIndex = df.index  # type:ignore
+        if "rth" in df.columns:
             # In case only part of the df has ext classification, fill the remainder
-            missing_rth = self._dt_index[self.df["rth"].isna()]
-            rth_col = CALENDARS.mark_session(self.calendar, missing_rth)
+            missing_rth = dt_index[df["rth"].isna()]
+            rth_col = CALENDARS.mark_session(self.calendar, missing_rth) if len(missing_rth) > 0 else None
             if rth_col is not None:
-                self.df.loc[rth_col.index, "rth"] = rth_col
+                df.loc[rth_col.index, "rth"] = rth_col
         else:
             # Calculate the Full Trading Hours Session
-            rth_col = CALENDARS.mark_session(self.calendar, self._dt_index)
+            rth_col = CALENDARS.mark_session(self.calendar, dt_index)
             if rth_col is not None:
-                self.df["rth"] = rth_col
+                df["rth"] = rth_col
 
-        if "rth" not in self.columns:
+        if "rth" not in df.columns:
             self._ext = None
         elif force_rth:
-            self.df = self.df[self.df["rth"] == EXT_MAP["rth"]]
+            df = df[df["rth"] == EXT_MAP["rth"]]
             self._ext = False
-        elif (self.df["rth"] == 0).all():
+        elif (df["rth"] == 0).all():
             # Only RTH Sessions
             self._ext = False
         else:
             # Some RTH, Some ETH Sessions
             self._ext = True
 
+        return df
+
+    def set_column(self, name: str, values: pd.Series | np.ndarray | list):
+        "Set, or overwrite, a column of the Series Data. Values must match the length of the data."
+        self._store.set_column(name, values)
+
+    def drop_column(self, name: str):
+        "Remove a column from the Series Data if it exists"
+        self._store.drop_column(name)
+
+    def merge(self, data: pd.DataFrame | list[dict[str, Any]]):
+        """
+        Merge freshly fetched bars into the data, e.g. the bars fetched from the last bar of a cached
+        Series_DF onward. Fetched bars replace every bar at or after the first fetched bar's time.
+        The fetched bars are written into the store's spare capacity, only they are preprocessed,
+        and the columns they lack are filled as missing values.
+        """
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        if len(df) == 0:
+            return
+        _standardize_names(df)
+        df = df.set_index(pd.DatetimeIndex(pd.to_datetime(df["time"], utc=True))).drop(columns="time")
+        self.calendar = CALENDARS.request_calendar(self.calendar, df.index[0], df.index[-1])
+        if "rth" in self._store.columns and "rth" not in df.columns:
+            if (rth := CALENDARS.mark_session(self.calendar, df.index)) is not None:
+                df["rth"] = rth
+
+        self._store.truncate(int(np.searchsorted(self._store.index.as_unit("ns").asi8, df.index[0].value)))
+        self._store.extend(df)
+
+        self._next_bar_time = CALENDARS.next_timestamp(
+            self.calendar, self.curr_bar_open_time, self.freq_code, self._ext
+        )
+        if self.only_days:
+            self._next_bar_time = self._next_bar_time.normalize()
+
+    def bin_opens(self, timeframe: TF, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+        "Opening times of the Higher-Timeframe bars, built from this data's calendar, that span [start, end]"
+        opens = CALENDARS.bar_opens(self.calendar, _freq_code(timeframe), start, end, self._ext)
+        return opens.normalize() if self.only_days else opens
+
+    def resample(self, timeframe: TF) -> Series_DF:
+        """
+        Derive a Higher-Timeframe Series_DF from this data in a single vectorized pass. Bars are
+        binned by the bar opens of this data's calendar, so bins begin at session boundaries, and
+        ETH bars are only binned when this data contains them.
+        """
+        times = self._store.index.as_unit("ns").asi8
+        opens = self.bin_opens(timeframe, self._store.first_time, self._store.last_time)
+        bins = np.searchsorted(opens.as_unit("ns").asi8, times, side="right") - 1
+
+        first = int(np.searchsorted(bins, 0))  # Bars before the first bin can't be placed
+        starts = np.flatnonzero(np.diff(bins[first:], prepend=-1))
+        df = pd.DataFrame(_aggregate(self._store, first, starts))
+        df.insert(0, "time", opens[bins[first + starts]])
+        return Series_DF(df, self.calendar, timeframe)
+
+    def update(self, data: sd.AnyBasicData, accumulate: bool = False) -> tuple[sd.AnyBasicData, bool]:
+        "Aggregate data into the current bar or append it as a new bar. Returns the updated bar & if it's new"
+        if data.time < self._next_bar_time:  # type: ignore
+            return self.update_curr_bar(data, accumulate=accumulate), False
+
+        if data.time != self._next_bar_time:
+            # Update given is a new bar, but not the expected time
+            # Ensure it fits the data's time interval e.g. 12:00:0071 -> 12:00:00
+            # TODO: Update the time calc. This will error for HTF when timedelta is invalid
+            data.time -= (data.time - self._next_bar_time) % self._pd_tf  # type: ignore
+        return self.append_new_bar(data), True
+
     def update_curr_bar(self, data: sd.AnyBasicData, accumulate: bool = False) -> sd.AnyBasicData:
         """
         Updates the OHLC / Single Value DataFrame from the given bar. The Bar is assumed to be
@@ -295,54 +848,11 @@ class Series_DF:
         """
         if not isinstance(data, (sd.SingleValueData, sd.OhlcData)):
             return data  # Whitespace data, Nothing to update
-        last_bar = self.current_bar
-
-        # Update values in last_bar depending on the data-types given.
-        match last_bar, data:
-            case sd.SingleValueData(), sd.SingleValueData():
-                last_bar.value = data.value
-            case sd.OhlcData(), sd.SingleValueData():
-                last_bar.high = max(
-                    (last_bar.high if last_bar.high is not None else -inf),
-                    (data.value if data.value is not None else -inf),
-                )
-                last_bar.low = min(
-                    (last_bar.low if last_bar.low is not None else inf),
-                    (data.value if data.value is not None else inf),
-                )
-                last_bar.close = data.value
-                data.value = last_bar.close
-            case sd.OhlcData(), sd.OhlcData():
-                last_bar.high = max(
-                    (last_bar.high if last_bar.high is not None else -inf),
-                    (data.high if data.high is not None else -inf),
-                )
-                last_bar.low = min(
-                    (last_bar.low if last_bar.low is not None else inf),
-                    (data.low if data.low is not None else inf),
-                )
-                last_bar.close = data.close
-            # Last Two are VERY unlikely Scenarios
-            case sd.SingleValueData(), sd.OhlcData():
-                last_bar.value = data.close
-            case sd.WhitespaceData(), _:
-                last_bar = data
-                if accumulate:  # Needed as setup for volume accumulation
-                    data.volume = 0
-
-        # update volume
-        if last_bar.volume is not None and data.volume is not None:
-            if accumulate:
-                last_bar.volume += data.volume
-            else:
-                last_bar.volume = data.volume
-
-        # Ensure time is constant, If not a new bar will be created on screen
-        last_bar.time = self.curr_bar_open_time
-        self.df = update_dataframe(self.df, last_bar)
 
-        # The next line ensures the return dataclass matches the type stored by the Dataframe.
-        return self.data_type.cls.from_dict(last_bar.as_dict)
+        # Values are written in place; the time of the last bar is never changed by an update.
+        self._ticks.update(data, accumulate)
+        # The returned dataclass matches the type stored by the Dataframe.
+        return self._ticks.flush()
 
     def append_new_bar(self, data: sd.AnyBasicData) -> sd.AnyBasicData:
         "Update the OHLC / Single Value DataFrame from a new bar. Data Assumed as next in sequence"
@@ -369,7 +879,9 @@ class Series_DF:
         dataclass_inst = self.data_type.cls.from_dict(data_dict)
 
         time = data_dict.pop("time")
-        self.df = pd.concat([self.df, pd.DataFrame([data_dict], index=[time])])
+        if "rth" in self._store.columns and "rth" not in data_dict:
+            data_dict["rth"] = CALENDARS.session_at_time(self.calendar, time)
+        self._store.append(time, data_dict)
 
         self._next_bar_time = CALENDARS.next_timestamp(self.calendar, time, self.freq_code, self._ext)
         if self.only_days:
@@ -379,14 +891,113 @@ class Series_DF:
 
 
 class LTF_DF:
-    "Pandas DataFrame Extension to Store and Update Lower-Timeframe Data"
+    """
+    Lower-Timeframe Data that is held alongside a Higher-Timeframe, major, Series_DF.
+
+    The first minor row of each major bar is located with a searchsorted on the time index, so the
+    contiguous block of minor bars within any major bar can be retrieved in O(1), e.g. all of the
+    1m bars within a 1h bar, without filtering. The lookup is extended lazily as major bars are
+    appended. Until the LTF is bound to a major Series_DF only the minor data is available.
+    """
 
-    def __init__(self, major_tf: TF, minor_tf: TF):
-        self.major_tf = major_tf
-        self.minor_tf = minor_tf
+    def __init__(self, minor: Series_DF, major: Optional[Series_DF] = None):
+        self.minor = minor
+        self.major: Optional[Series_DF] = None
+        self._starts = np.empty(0, dtype=np.int64)
+        self.bind(major)
 
-        if major_tf <= minor_tf:
-            ...
+    @property
+    def timeframe(self) -> TF:
+        "Timeframe of the lower timeframe data"
+        return self.minor.timeframe
+
+    def bind(self, major: Optional[Series_DF]):
+        "Bind the lower timeframe data to a, new, major Series_DF"
+        if major is not None and major.timeframe <= self.minor.timeframe:
+            raise ValueError(f"LTF_DF {self.minor.timeframe = } must be less than {major.timeframe = }")
+        self.major = major
+        self._starts = np.empty(0, dtype=np.int64)
+
+    def update(self, data: sd.AnyBasicData, accumulate: bool = False):
+        "Apply a realtime update to the lower timeframe data. Updates to bars that have closed are ignored"
+        if data.time >= self.minor.curr_bar_open_time:  # type: ignore
+            self.minor.update(data, accumulate=accumulate)
+
+    def _sync(self) -> np.ndarray:
+        "Locate the first minor row of every major bar appended since the last call. Returns the starts"
+        if self.major is None:
+            raise ValueError("LTF_DF is not bound to a major Series_DF.")
+        n = len(self._starts)
+        if n < len(self.major):
+            minor_times = self.minor.store.index.as_unit("ns").asi8
+            major_times = self.major.store.index.as_unit("ns").asi8[n:]
+            self._starts = np.append(self._starts, np.searchsorted(minor_times, major_times, side="left"))
+        return self._starts
+
+    @property
+    def ranges(self) -> tuple[np.ndarray, np.ndarray]:
+        "The [start, end) minor rows of every major bar as two arrays"
+        starts = self._sync()
+        return starts, np.append(starts[1:], len(self.minor))
+
+    def range(self, i: int) -> tuple[int, int]:
+        "The [start, end) minor rows of the i-th major bar. Negative indices count from the last bar"
+        starts = self._sync()
+        i = i + len(starts) if i < 0 else i
+        return int(starts[i]), int(starts[i + 1]) if i + 1 < len(starts) else len(self.minor)
+
+    def bars(self, i: int) -> pd.DataFrame:
+        "The minor bars within the i-th major bar. Negative indices count from the last bar"
+        start, end = self.range(i)
+        return self.minor.df.iloc[start:end]
+
+    def bars_at(self, time: pd.Timestamp) -> pd.DataFrame:
+        "The minor bars within the major bar that contains the given time"
+        if self.major is None:
+            raise ValueError("LTF_DF is not bound to a major Series_DF.")
+        i = int(self.major.store.index.searchsorted(time, side="right")) - 1
+        return self.bars(i) if i >= 0 else self.minor.df.iloc[0:0]
+
+
+class HTF_DF:
+    """
+    Higher-Timeframe Data that is derived from, and kept in sync with, a finer base Series_DF.
+
+    Realtime updates are applied to the base. The derived bar that contains the base's last bar is
+    then re-aggregated from the base bars within it, so the derived data always equals a resample
+    of the base. The cost of an update is proportional to the number of base bars per derived bar.
+    """
+
+    def __init__(self, base: Series_DF, timeframe: TF):
+        self.base = base
+        self.timeframe = timeframe
+        self.data = base.resample(timeframe)
+        self._bin_start = 0  # Row of the base's first bar within the derived current bar
+        if self.data.data_type != sd.SeriesType.WhitespaceData:
+            self._bin_start = int(base.store.index.searchsorted(self.data.curr_bar_open_time))
+
+    def update(self, data: sd.AnyBasicData, accumulate: bool = False) -> tuple[sd.AnyBasicData, bool]:
+        "Apply an update to the base, then fold it into the derived data. Returns the derived bar & if it's new"
+        base = self.base
+        if data.time < base.curr_bar_open_time:  # type: ignore
+            return self.data.current_bar, False  # Updates to bars that have closed are ignored
+        base.update(data, accumulate=accumulate)
+
+        new_bar = base.curr_bar_open_time >= self.data.next_bar_time
+        if new_bar:
+            self._bin_start = len(base) - 1
+        values = {k: v[0] for k, v in _aggregate(base.store, self._bin_start, np.zeros(1, dtype=int)).items()}
+
+        if not new_bar:
+            self.data.store.update_last(values)
+            return self.data.ticks.flush(), False
+
+        # The base may have skipped bins, e.g. a gap in trading. Place the bar in the one it belongs to.
+        opens = self.data.bin_opens(self.timeframe, self.data.next_bar_time, base.curr_bar_open_time)
+        bar_open = opens[opens <= base.curr_bar_open_time][-1]
+        bar = self.data.append_new_bar(self.data.data_type.cls.from_dict({"time": bar_open, **values}))
+        self.data.store.update_last(values)  # Columns the dataclass doesn't hold, e.g. ticks & rth
+        return bar, True
 
 
 class Whitespace_DF:
@@ -412,55 +1023,187 @@ class Whitespace_DF:
         self.only_days = base_data.only_days
 
         # Create Datetime Index from the calendar given the known start_date and projected end_date
-        self.dt_index = CALENDARS.date_range(
+        dt_index = CALENDARS.date_range(
             self.calendar,
             self.tf,
-            base_data.df.index[-1],
+            base_data.curr_bar_open_time,
             periods=self.BUFFER_LEN + 1,
             include_ETH=base_data.ext,
         )
 
         if self.only_days:
-            self.dt_index = self.dt_index.normalize()
+            dt_index = dt_index.normalize()
 
-        if len(self.dt_index) < self.BUFFER_LEN:
+        if len(dt_index) < self.BUFFER_LEN:
             # Log an Error, No need to raise an exception though, failure isn't that critical.
             # I'm mostly just curious if the code i wrote in pandas_mcal works in all cases or not
             log.error(
                 "Whitespace Dataframe under-estimated end-date!. len_df = %s",
-                len(self.dt_index),
+                len(dt_index),
             )
 
+        # The projection is held as a sorted array of UTC nanoseconds with room to be appended to.
+        # Only the last BUFFER_LEN + 1 times, the current bar and its projection, are ever kept.
+        self._tz = dt_index.tz
+        self._times = np.empty(2 * (self.BUFFER_LEN + 1), dtype=np.int64)
+        self._len = len(dt_index)
+        self._times[: self._len] = dt_index.as_unit("ns").asi8
+        self._df: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        "Number of whitespace bars projected ahead of the current bar"
+        return min(self._len, self.BUFFER_LEN)
+
     @property
-    def df(self):
+    def times(self) -> np.ndarray:
+        "Read-Only view of the projected times as UTC nanoseconds, starting with the current bar"
+        view = self._times[: self._len]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def dt_index(self) -> pd.DatetimeIndex:
+        "Projected times as a DatetimeIndex, starting with the current bar"
+        return self._to_index(self.times)
+
+    @property
+    def df(self) -> pd.DataFrame:
         "Returns the underlying dt_index as a Dataframe for re-parsing into a list of records."
         # Lightweight Charts requires the list of records since it stores everything as JSON.
-        return pd.DataFrame({"time": self.dt_index[-self.BUFFER_LEN :]})
+        # Cached until the next extend(). The returned frame must be treated as read-only.
+        if self._df is None:
+            self._df = pd.DataFrame({"time": self._to_index(self.times[-self.BUFFER_LEN :])})
+        return self._df
+
+    def time_at(self, index: int) -> pd.Timestamp:
+        "Time of the whitespace bar at the given index of df, Negative indices are valid."
+        return pd.Timestamp(int(self.times[-len(self) :][index]), tz=self._tz)
+
+    def _to_index(self, times: np.ndarray) -> pd.DatetimeIndex:
+        return _utc_index(times).tz_convert(self._tz)
 
     def next_timestamp(self, curr_time: pd.Timestamp) -> pd.Timestamp:
         "Returns the timestamp immediately after the timestamp given as an input"
-        if curr_time < self.dt_index[0]:
+        times = self.times
+        curr_ns = pd.Timestamp(curr_time).value
+        if curr_ns < times[0]:
             raise ValueError(  # Don't think there's a need to handle this case
                 f"Requested next time from Whitespace_DF but {curr_time = } "
                 f"comes before the first index of the DF: {self.dt_index = }."
             )
-        if curr_time < self.dt_index[-1]:
+        if curr_ns < times[-1]:
             # avoid calculation if possible
-            return self.dt_index[curr_time < self.dt_index][0]
+            return pd.Timestamp(int(times[np.searchsorted(times, curr_ns, side="right")]), tz=self._tz)
 
-        time = CALENDARS.next_timestamp(self.calendar, self.dt_index[-1], self.tf, self.ext)
+        time = CALENDARS.next_timestamp(self.calendar, self.time_at(-1), self.tf, self.ext)
 
         return time.normalize() if self.only_days else time
 
     def extend(self) -> sd.AnyBasicData:
         "Extends the dataframe with one datapoint of whitespace. This whitespace datapoint is a valid trading time."
-        next_bar_time = CALENDARS.next_timestamp(self.calendar, self.dt_index[-1], self.tf, self.ext)
+        next_bar_time = CALENDARS.next_timestamp(self.calendar, self.time_at(-1), self.tf, self.ext)
         if self.only_days:
             next_bar_time = next_bar_time.normalize()
-        self.dt_index = self.dt_index.union([next_bar_time])
+
+        if self._len == len(self._times):
+            # Full, Shift the retained times to the front. Occurs once every BUFFER_LEN appends.
+            keep = self.BUFFER_LEN
+            self._times[:keep] = self._times[self._len - keep : self._len]
+            self._len = keep
+        self._times[self._len] = pd.Timestamp(next_bar_time).value
+        self._len += 1
+        self._df = None
         return sd.WhitespaceData(next_bar_time)
 
 
+class SeriesCache:
+    """
+    Memory Budgeted, Least Recently Used, Cache of prepared Series_DFs keyed by the
+    (Symbol, Timeframe, Exchange) of the data.
+
+    A Series places its Series_DF into the cache when it changes symbol or timeframe and takes it
+    back out when that symbol & timeframe is requested again. This skips all of the preprocessing
+    done by Series_DF.__init__(). Since an entry is removed from the cache while in use, a Series_DF
+    is never shared by two Series.
+
+    Cached entries do not receive realtime updates. A Series that takes an entry back out fetches
+    the bars from the entry's last bar onward and merges them in with Series_DF.merge(). Entries
+    older than 'max_age' seconds are discarded rather than returned.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 2**20, max_age: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[tuple, tuple[Series_DF, int, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(symbol: Symbol, timeframe: TF) -> tuple:
+        "Key of the given symbol & timeframe"
+        return (symbol.ticker, symbol.source, symbol.exchange, str(timeframe))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        "Hit, Miss, Entry, and Byte counts of the cache"
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self), "nbytes": self.nbytes}
+
+    def put(self, symbol: Symbol, timeframe: TF, data: Series_DF):
+        "Place a Series_DF into the cache, evicting the least recently used entries to stay within budget"
+        if getattr(data, "_store", None) is None:
+            return  # Insufficient data, Series_DF was never initialized
+        self._pop(key := self.key(symbol, timeframe))
+
+        nbytes = data.nbytes
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = (data, nbytes, monotonic())
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def take(self, symbol: Symbol, timeframe: TF) -> Optional[Series_DF]:
+        "Remove and return the cached Series_DF of the given symbol & timeframe, if there is one"
+        entry = self._pop(self.key(symbol, timeframe))
+        if entry is None or (self.max_age is not None and monotonic() - entry[2] > self.max_age):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def take_base(self, symbol: Symbol, timeframe: TF) -> Optional[Series_DF]:
+        """
+        Remove and return the cached Series_DF of the given symbol that is the coarsest timeframe
+        that can be resampled into the given timeframe, if there is one.
+        """
+        ticker, source, exchange, _ = self.key(symbol, timeframe)
+        bases = [
+            (data.timeframe.unix_len, key)
+            for key, (data, _, _) in self._entries.items()
+            if key[:3] == (ticker, source, exchange) and _resamples_to(data.timeframe, timeframe)
+        ]
+        if len(bases) == 0:
+            return None
+        entry = self._pop(max(bases)[1])
+        if entry is None or (self.max_age is not None and monotonic() - entry[2] > self.max_age):
+            return None
+        return entry[0]
+
+    def clear(self):
+        "Remove every entry from the cache"
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _pop(self, key: tuple) -> Optional[tuple[Series_DF, int, float]]:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self.nbytes -= entry[1]
+        return entry
+
+
 # endregion
 
 # region --------------------------- Pandas_Market_Calendars Adapter --------------------------- #
@@ -525,9 +1268,15 @@ class Calendars:
     to a significant performance improvement.
     """
 
+    OPEN_TIMES_CHUNK = 2048  # Number of bar open times added to an open_times table at once
+
     def __init__(self):
         self.mkt_cache: Dict[str, "MarketCalendar"] = {}
         self.schedule_cache: Dict[str, pd.DataFrame] = {}
+        # Sorted UTC nanosecond bar open times, and their search keys, keyed by (calendar, freq, ETH)
+        self.open_times: Dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+        # Session boundaries & the session that begins at each, keyed by calendar. Built per schedule
+        self.session_tables: Dict[str, tuple[pd.DataFrame, np.ndarray, np.ndarray]] = {}
         # TODO: Implement a last used time to clean out memory for stale schedules?
         # self.mkt_cache_last_use_time = {}
 
@@ -642,10 +1391,27 @@ class Calendars:
         mkt_calendar = self.mkt_cache[calendar]
         days = mkt_calendar.date_range_htf(freq, start, end, periods, closed="left")
         time = "pre" if include_ETH and "pre" in mkt_calendar.market_times else "market_open"
-        return pd.DatetimeIndex(
-            mkt_calendar.schedule_from_days(days, market_times=[time])[time],
-            dtype="datetime64[ns]",
-        )
+        return pd.DatetimeIndex(mkt_calendar.schedule_from_days(days, market_times=[time])[time]).as_unit("ns")
+
+    def bar_opens(
+        self,
+        calendar: str,
+        freq: str | pd.Timedelta,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        include_ETH: bool | None = False,
+    ) -> pd.DatetimeIndex:
+        "Open times of every bar, at the given frequency, that contains a time within [start, end]"
+        if calendar == "24/7":
+            if isinstance(freq, pd.Timedelta):
+                return pd.date_range(start.floor(freq), end, freq=freq)
+            freq = freq + "S" if freq[-1] in {"M", "Q", "Y"} else freq
+            return pd.date_range(to_offset(freq).rollback(start.normalize()), end, freq=freq)
+
+        # A bar containing 'start' opens at most one period before it. The range's end is exclusive
+        # so it's padded as well. Bars outside of [start, end] are harmless to the caller.
+        pad = freq if isinstance(freq, pd.Timedelta) else pd.Timedelta(TF.fromStr(freq).unix_len + 7 * 86400, "s")
+        return self.date_range(calendar, freq, start - pad, end + pad, include_ETH=include_ETH)
 
     def next_timestamp(
         self,
@@ -654,35 +1420,58 @@ class Calendars:
         freq: str | pd.Timedelta,
         include_ETH: bool | None = False,
     ) -> pd.Timestamp:
-        "Returns the next bar's opening time from a given timestamp. Not always efficient, so store this result"
-        if isinstance(freq, str) and freq[-1] in {"M", "Q", "Y"}:
-            next_time = pd.date_range(current_time, freq=freq + "S", periods=2)[-1]
-        else:
-            next_time = current_time + pd.Timedelta(freq)
+        "Returns the next bar's opening time from a given timestamp."
+        if calendar != "24/7":
+            return self._next_open(calendar, freq, current_time, bool(include_ETH))
 
-        if calendar == "24/7":
-            return next_time
+        if isinstance(freq, str) and freq[-1] in {"M", "Q", "Y"}:
+            return pd.date_range(current_time, freq=freq + "S", periods=2)[-1]
+        return current_time + pd.Timedelta(freq)
 
-        # Calculate Next date from LTF Date_Range.
-        if isinstance(freq, pd.Timedelta):
-            try:
-                if self.mkt_cache[calendar].open_at_time(
-                    self.schedule_cache[calendar], next_time, False, not include_ETH
-                ):
-                    return next_time
-            except ValueError:
-                # Schedule Doesn't Cover the Time Needed call Date_Range to generate more schedule.
-                pass
-
-            dt = self._date_range_ltf(calendar, freq, current_time, None, 2, include_ETH)
-            return dt[-1]
-
-        # Calculate Next date from HTF Date_Range.
-        mkt_cal = self.mkt_cache[calendar]
-        days = mkt_cal.date_range_htf(freq, start=current_time, periods=2)
-        time = "pre" if include_ETH and "pre" in mkt_cal.market_times else "market_open"
-        dt = mkt_cal.schedule_from_days(days, market_times=[time])[time]
-        return mkt_cal.schedule_from_days(days, market_times=[time])[time].iloc[-1]
+    def _next_open(
+        self, calendar: str, freq: str | pd.Timedelta, current_time: pd.Timestamp, include_ETH: bool
+    ) -> pd.Timestamp:
+        "Look up the first bar open after the given time from the calendar's table of bar open times"
+        # HTF bars are matched by UTC date since only_days data is stamped at midnight, not the open.
+        htf = not isinstance(freq, pd.Timedelta)
+        curr = pd.Timestamp(current_time).value
+        if htf:
+            curr -= curr % _DAY_NS
+
+        key = (calendar, freq, include_ETH)
+        table = self.open_times.get(key)
+        if table is None or curr < table[1][0]:
+            table = self._open_times(calendar, freq, current_time, include_ETH, htf)
+        elif curr >= table[1][-1]:
+            # Exhausted, Extend the table from its last open. Re-build it if that still isn't enough.
+            opens, keys = table
+            last = pd.Timestamp(int(opens[-1]), tz="UTC")
+            ext_opens, ext_keys = self._open_times(calendar, freq, last, include_ETH, htf)
+            new = ext_opens > opens[-1]
+            opens = np.concatenate((opens, ext_opens[new]))
+            table = (opens, np.concatenate((keys, ext_keys[new])) if htf else opens)
+            if curr >= table[1][-1]:
+                table = self._open_times(calendar, freq, current_time, include_ETH, htf)
+        self.open_times[key] = table
+
+        opens, keys = table
+        return pd.Timestamp(int(opens[np.searchsorted(keys, curr, side="right")]), tz="UTC")
+
+    def _open_times(
+        self, calendar: str, freq: str | pd.Timedelta, start: pd.Timestamp, include_ETH: bool, htf: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        "A chunk of bar open times, from the given start, and the keys they are searched by"
+        dt_index = self.date_range(calendar, freq, start, periods=self.OPEN_TIMES_CHUNK, include_ETH=include_ETH)
+        if len(dt_index) == 0:
+            # Start is beyond the end of the cached schedule, which date_range() returns as empty.
+            schedule = self.schedule_cache[calendar]
+            extra_days = self.mkt_cache[calendar].schedule(
+                schedule.index[-1] + pd.Timedelta("1D"), start.tz_localize(None) + pd.Timedelta("16W")
+            )
+            self.schedule_cache[calendar] = pd.concat([schedule, extra_days])
+            dt_index = self.date_range(calendar, freq, start, periods=self.OPEN_TIMES_CHUNK, include_ETH=include_ETH)
+        opens = dt_index.as_unit("ns").asi8
+        return opens, (opens - opens % _DAY_NS if htf else opens)
 
     def mark_session(self, calendar: str, time_index: pd.DatetimeIndex) -> pd.Series | None:
         "Return a Series that denotes the appropriate Trading Hours Session for the given Calendar"
@@ -696,16 +1485,30 @@ class Calendars:
         if mcal is None or calendar == "24/7":
             return None
 
-        # Unbelievable, but this truly is the easiest and most efficient way to determine the active session.
+        schedule = self.schedule_cache[calendar]
+        table = self.session_tables.get(calendar)
+        if table is None or table[0] is not schedule:
+            table = self.session_tables[calendar] = self._session_table(schedule)
+
+        _, bounds, sessions = table
+        t = pd.Timestamp(dt).value
+        if bounds[0] <= t < bounds[-1]:
+            return int(sessions[np.searchsorted(bounds, t, side="right") - 1])
+
+        # Outside the schedule, Let pandas_market_calendars handle, and raise, the error
         time_index = pd.DatetimeIndex([dt])
-        return int(
-            mcal.mark_session(
-                self.schedule_cache[calendar],
-                time_index,
-                label_map=EXT_MAP,
-                closed="left",
-            ).iloc[0]
-        )
+        return int(mcal.mark_session(schedule, time_index, label_map=EXT_MAP, closed="left").iloc[0])
+
+    @staticmethod
+    def _session_table(schedule: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Every session boundary of a schedule with the session that begins at each boundary. The session
+        of any time within the schedule is then the session of the last boundary at or before that time.
+        """
+        bounds = pd.DatetimeIndex(schedule.to_numpy().ravel()).dropna().unique().sort_values()
+        # Sessions are constant between boundaries so labeling the boundaries labels every time.
+        sessions = mcal.mark_session(schedule, bounds[:-1], label_map=EXT_MAP, closed="left")
+        return schedule, bounds.as_unit("ns").asi8, sessions.to_numpy(dtype=np.int64)
 
 
 # Initialize the shared Calendars sudo-singleton instance
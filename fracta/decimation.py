@@ -0,0 +1,182 @@
+"""
+Level of Detail Decimation of Transfer DataFrames.
+
+When a chart is zoomed out far enough that many bars share a single pixel, the bars of every Series
+on the frame are merged into buckets of a fixed number of seconds before being sent to the screen.
+Buckets are aligned to the Unix Epoch so the same bucket times are produced for every Series that
+shares a time index.
+
+Each Series is reduced by one of the following modes:
+- 'ohlc' : Aggregated like a resample, first open, highest high, lowest low, last close.
+- 'sum' : Volume-like Series, e.g. a volume histogram. Values are summed over the bucket.
+- 'extremes' : Other Single Value Series keep both the min and the max row of each bucket, in the
+    order they occurred, so spikes in either direction stay visible where a mean would flatten them.
+
+Aggregated buckets ('ohlc' & 'sum') are displayed at the time of their first bar. The rows kept
+by 'extremes' are displayed at their own bar times.
+"""
+
+from __future__ import annotations
+from dataclasses import replace
+from math import isnan, nan
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from .orm import series_data as sd
+
+Mode = Literal["ohlc", "sum", "extremes"]
+
+# Data columns that are totals of each bar rather than a level. These are summed over a bucket.
+SUMMED_COLUMNS = ("volume", "ticks")
+
+
+def bucket_starts(epoch: np.ndarray, span: int) -> np.ndarray:
+    "Offsets of the first row of each bucket of 'span' seconds. Epoch must be sorted, in seconds."
+    if len(epoch) == 0:
+        return np.empty(0, dtype=np.intp)
+    keys = epoch // span
+    return np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+
+
+def decimate(xfer_df: pd.DataFrame, span: int, mode: Mode) -> pd.DataFrame:
+    "Merge the rows of a transfer dataframe into buckets of 'span' seconds"
+    epoch = xfer_df["time"].to_numpy()
+    starts = bucket_starts(epoch, span)
+    if len(starts) == len(epoch):
+        return xfer_df  # Already at, or coarser than, the bucket resolution
+
+    if mode == "extremes":
+        rows = _extreme_rows(xfer_df, starts)
+        return xfer_df.iloc[rows].reset_index(drop=True)
+
+    ends = np.append(starts[1:], len(xfer_df)) - 1
+    cols = {}
+    for name, col in xfer_df.items():
+        arr = col.to_numpy()
+        if name == "time":
+            continue
+        elif mode == "ohlc" and name == "open":
+            cols[name] = arr[starts]
+        elif mode == "ohlc" and name == "high":
+            cols[name] = np.fmax.reduceat(arr, starts)
+        elif mode == "ohlc" and name == "low":
+            cols[name] = np.fmin.reduceat(arr, starts)
+        elif name in SUMMED_COLUMNS or (mode == "sum" and name == "value"):
+            cols[name] = _nansum_reduceat(arr, starts)
+        else:
+            cols[name] = arr[ends]  # close, colors, etc. follow the last bar of the bucket
+    return pd.DataFrame({"time": epoch[starts], **cols}, copy=False)
+
+
+def _nansum_reduceat(arr: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    "Sum of each bucket, ignoring NaNs. A bucket of only NaNs sums to NaN"
+    arr = arr.astype("float64", copy=False)
+    valid = ~np.isnan(arr)
+    sums = np.add.reduceat(np.where(valid, arr, 0), starts)
+    return np.where(np.add.reduceat(valid, starts) > 0, sums, nan)
+
+
+def _extreme_rows(xfer_df: pd.DataFrame, starts: np.ndarray) -> np.ndarray:
+    """
+    Sorted rows of the min and the max of each bucket. A bucket contributes one row when its min
+    and max are the same row. Frames without a value to compare keep the first row of each bucket.
+    """
+    name = "value" if "value" in xfer_df.columns else "close" if "close" in xfer_df.columns else None
+    if name is None:
+        return starts
+
+    values = xfer_df[name].to_numpy(dtype="float64")
+    lengths = np.diff(np.append(starts, len(values)))
+    lows = _first_match(values, np.fmin.reduceat(values, starts), starts, lengths)
+    highs = _first_match(values, np.fmax.reduceat(values, starts), starts, lengths)
+    return np.unique(np.concatenate((lows, highs)))
+
+
+def _first_match(values: np.ndarray, targets: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    "Row of the first value in each bucket equal to its target. The bucket's first row when there are none."
+    hits = np.flatnonzero(values == np.repeat(targets, lengths))
+    if len(hits) == 0:
+        return starts
+    first = np.searchsorted(hits, starts)
+    rows = hits[np.minimum(first, len(hits) - 1)]
+    return np.where((first < len(hits)) & (rows < starts + lengths), rows, starts)
+
+
+class LastBucket:
+    """
+    The last bucket of a dataset aggregated by the 'ohlc' or 'sum' mode. Realtime updates arrive at
+    full resolution so they're merged into this bucket before being displayed. The bucket keeps the
+    open, the high & low, and the summed value of the bars before the most recent one so that an
+    update to the most recent bar never replaces the extremes or totals of the bucket.
+
+    Rows kept by the 'extremes' mode are displayed at their own times, so no bucket is needed.
+    """
+
+    def __init__(self, xfer_df: pd.DataFrame, span: int, mode: Mode):
+        epoch = xfer_df["time"].to_numpy()
+        start = int(bucket_starts(epoch, span)[-1])
+        self.span = span
+        self.mode = mode
+        self.key = int(epoch[-1]) // span
+        self.time = int(epoch[start])
+        self.bar_time = int(epoch[-1])
+
+        def _col(name: str) -> np.ndarray:
+            if name in xfer_df.columns:
+                return xfer_df[name].to_numpy(dtype="float64")[start:]
+            return np.full(len(epoch) - start, nan)
+
+        self.open = float(_col("open")[0])
+        # High, Low & Total of the bars in the bucket before the most recent bar
+        highs, lows = _col("high"), _col("low")
+        values = _col("value") if mode == "sum" else np.full(len(highs), nan)
+        self.high = float(np.fmax.reduce(highs[:-1])) if len(highs) > 1 else nan
+        self.low = float(np.fmin.reduce(lows[:-1])) if len(lows) > 1 else nan
+        self.total = float(np.nansum(values[:-1]))
+        self.bar_high, self.bar_low, self.bar_value = float(highs[-1]), float(lows[-1]), float(values[-1])
+
+    def merge(self, data: sd.AnySeriesData) -> sd.AnySeriesData:
+        "Place a realtime update into the bucket. Returns the update as it should be displayed"
+        bar_time = data.time.value // 1_000_000_000
+        high = getattr(data, "high", None)
+        low = getattr(data, "low", None)
+        value = getattr(data, "value", None) if self.mode == "sum" else None
+
+        if bar_time // self.span != self.key:
+            # Update opens a new bucket
+            self.key, self.time = bar_time // self.span, bar_time
+            self.open = _float(getattr(data, "open", None))
+            self.high = self.low = nan
+            self.total = 0.0
+        elif bar_time != self.bar_time:
+            # A new bar within the bucket, the previous bar is now closed.
+            self.high = _fmax(self.high, self.bar_high)
+            self.low = _fmin(self.low, self.bar_low)
+            self.total += 0.0 if isnan(self.bar_value) else self.bar_value
+        self.bar_time = bar_time
+        self.bar_high, self.bar_low, self.bar_value = _float(high), _float(low), _float(value)
+
+        changes: dict = {"time": pd.Timestamp(self.time, unit="s", tz="UTC")}
+        if hasattr(data, "open") and not isnan(self.open):
+            changes["open"] = self.open
+        if high is not None:
+            changes["high"] = _fmax(self.high, high)
+        if low is not None:
+            changes["low"] = _fmin(self.low, low)
+        if value is not None and not isnan(value):
+            changes["value"] = self.total + value
+        return replace(data, **changes)
+
+
+def _float(x: Optional[float]) -> float:
+    return nan if x is None else float(x)
+
+
+def _fmax(a: float, b: float) -> float:
+    return b if isnan(a) else a if isnan(b) else max(a, b)
+
+
+def _fmin(a: float, b: float) -> float:
+    return b if isnan(a) else a if isnan(b) else min(a, b)
@@ -1,6 +1,11 @@
 """Core Machinery of the Event Call & Response System used primarily by indicators"""
 
-from asyncio import iscoroutinefunction, create_task
+from asyncio import Semaphore, Task, iscoroutinefunction, create_task, get_running_loop, wait_for
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from inspect import signature
+from logging import getLogger
 from typing import (
     Protocol,
     Self,
@@ -11,13 +16,15 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from .orm import types
 
 if TYPE_CHECKING:
     from .indicators import Series
 
+log = getLogger("fracta_log")
+
 
 class Events:
     "A Super Object that is a Collection of Emitters"
@@ -28,6 +35,12 @@ class Events:
         self.open_socket = Emitter[Socket_Open_Protocol]()
         self.close_socket = Emitter[Socket_Close_Protocol]()
 
+    def shutdown(self):
+        "Cancel the tasks of, and shut down any executors owned by, every Emitter"
+        for emitter in vars(self).values():
+            if isinstance(emitter, Emitter):
+                emitter.shutdown()
+
 
 # region -------------------------- Python Event Protocol Definitions -------------------------- #
 # pylint: disable=invalid-name disable=missing-class-docstring
@@ -44,6 +57,14 @@ class Data_request_sync(Protocol):
     def __call__(self, symbol: types.Symbol, timeframe: types.TF) -> DataFrame | list[dict[str, Any]] | None: ...
 class Data_request_async(Protocol):
     def __call__(self, symbol: types.Symbol, timeframe: types.TF) -> DataFrame | list[dict[str, Any]] | None: ...
+class Data_request_delta_sync(Protocol):
+    def __call__(
+        self, symbol: types.Symbol, timeframe: types.TF, start: Optional[Timestamp] = None
+    ) -> DataFrame | list[dict[str, Any]] | None: ...
+class Data_request_delta_async(Protocol):
+    async def __call__(
+        self, symbol: types.Symbol, timeframe: types.TF, start: Optional[Timestamp] = None
+    ) -> DataFrame | list[dict[str, Any]] | None: ...
 
 
 # Symbol Search Request Protocol
@@ -75,6 +96,10 @@ class Socket_Open_sync(Protocol):
     def __call__(self, symbol: types.Symbol, series: "Series") -> None: ...
 class Socket_Open_async(Protocol):
     async def __call__(self, symbol: types.Symbol, series: "Series") -> None: ...
+class Socket_Open_token_sync(Protocol):
+    def __call__(self, symbol: types.Symbol, series: "Series", token: "CancelToken") -> None: ...
+class Socket_Open_token_async(Protocol):
+    async def __call__(self, symbol: types.Symbol, series: "Series", token: "CancelToken") -> None: ...
 
 
 class Socket_Close_sync(Protocol):
@@ -88,13 +113,61 @@ Command_Protocol: TypeAlias = Command_sync | Command_async
 Symbol_Search_Protocol: TypeAlias = (
     Symbol_search_sync_1 | Symbol_search_sync_2 | Symbol_search_async_1 | Symbol_search_async_2
 )
-Data_Request_Protocol: TypeAlias = Data_request_sync | Data_request_async
-Socket_Open_Protocol: TypeAlias = Socket_Open_sync | Socket_Open_async
+Data_Request_Protocol: TypeAlias = (
+    Data_request_sync | Data_request_async | Data_request_delta_sync | Data_request_delta_async
+)
+Socket_Open_Protocol: TypeAlias = (
+    Socket_Open_sync | Socket_Open_async | Socket_Open_token_sync | Socket_Open_token_async
+)
 Socket_Close_Protocol: TypeAlias = Socket_Close_sync | Socket_close_async
 
 # endregion
 
 
+class CancelToken:
+    """
+    Token that is handed out with each request emitted on behalf of a Series. The token is
+    cancelled once the request is superseded, e.g. by a symbol or timeframe change.
+
+    Async tasks that were launched for the request are cancelled along with the token and any
+    response that arrives after the token is cancelled is discarded. Handlers that declare a
+    'token' parameter are given the token so long running loops, e.g. sockets, can exit early.
+    """
+
+    __slots__ = ("_cancelled", "_tasks")
+
+    def __init__(self):
+        self._cancelled = False
+        self._tasks: set[Task] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        "True once the request this token was issued for has been superseded"
+        return self._cancelled
+
+    def cancel(self):
+        "Cancel the token and all tasks that were launched with it"
+        self._cancelled = True
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def add_task(self, task: Task):
+        "Tie the lifetime of an async task to this token"
+        if self._cancelled:
+            task.cancel()
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _takes_arg(func: Callable, name: str) -> bool:
+    try:
+        return name in signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 # Pylint Thinks "T" is undefined.
 # pylint: disable=undefined-variable
 class Emitter[T: Callable](list[T]):
@@ -116,15 +189,83 @@ class Emitter[T: Callable](list[T]):
     Emitter_inst() emits a call to all appended functions.
     Emitter_inst(rsp_args={[my_arg]:[static_arg]}), calls all appended functions,
     then once each function returns, calls responder_func(*[appended_function_return], **{rsp_args})
-    """
 
-    # TODO : Make this class track async tasks that it has created so they can be closed
-    # This will likely entail making the class definitively only handle one response function
+    An emit can be given a CancelToken. The token is passed to any function that has a 'token'
+    parameter, the async tasks of the emit are cancelled with the token, and the responder is
+    not called for any function that returns after the token was cancelled.
+
+    An emit can also be given an 'on_response' callback. It's called, without arguments, after the
+    responder returns so the emitter of the event can act once the response has been applied.
+
+    'opt_kwargs' are key-word arguments that are only passed to the functions that declare them,
+    e.g. the 'start' of a delta fetch that only some data_request handlers can make use of.
 
-    def __init__(self, responder: Optional[Callable] = None, single_emit: bool = True):
+    When given an executor, blocking functions are run by that executor instead of on the event
+    loop and the responder is called back on the loop once they return. An int creates a
+    ThreadPoolExecutor with that many workers that is owned by the Emitter and shut down by
+    shutdown(). A ProcessPoolExecutor may be used for CPU heavy functions so long as the function
+    and its arguments can be pickled.
+
+    'max_concurrent' limits the number of calls, async or executor, that can be in progress at
+    once. 'timeout' is the number of seconds a call is given before its result is discarded. A
+    function running in an executor can't be interrupted, so it will run to completion regardless.
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable] = None,
+        single_emit: bool = True,
+        *,
+        executor: Optional[Executor | int] = None,
+        max_concurrent: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
         super().__init__()
         self.__single_emitter__ = single_emit
         self.responder = responder
+        self.timeout = timeout
+        self._tasks: set[Task] = set()
+        self._executor: Optional[Executor] = None
+        self._owns_executor = False
+        self.executor = executor  # type: ignore
+        self.max_concurrent = max_concurrent
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        "Executor that blocking functions are run by. None runs them inline on the event loop."
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Optional[Executor | int]):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._owns_executor = isinstance(executor, int)
+        if isinstance(executor, int):
+            executor = ThreadPoolExecutor(executor, thread_name_prefix="fracta_emitter")
+        self._executor = executor
+
+    @property
+    def max_concurrent(self) -> Optional[int]:
+        "Maximum number of calls that can be in progress at once. None is unlimited."
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, limit: Optional[int]):
+        self._max_concurrent = limit
+        self._limiter = Semaphore(limit) if limit is not None else nullcontext()
+
+    def cancel_tasks(self):
+        "Cancel every async task launched by this Emitter that has yet to complete"
+        for task in self._tasks.copy():
+            task.cancel()
+
+    def shutdown(self):
+        "Cancel all pending tasks and shut down the executor if it was created by this Emitter"
+        self.cancel_tasks()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._owns_executor = False
 
     def __iadd__(self, func: T) -> Self:
         if func not in self:
@@ -146,32 +287,77 @@ class Emitter[T: Callable](list[T]):
 
     # rsp_kwargs are set when the event is emitted, They are arguments
     # passed directly to the response function of the emitter.
-    def __call__(self, *args, rsp_kwargs: Optional[dict[str, Any]] = None, **kwargs):
+    def __call__(
+        self,
+        *args,
+        rsp_kwargs: Optional[dict[str, Any]] = None,
+        token: Optional[CancelToken] = None,
+        on_response: Optional[Callable[[], Any]] = None,
+        opt_kwargs: Optional[dict[str, Any]] = None,
+        **kwargs,
+    ):
         if len(self) == 0:
             return  # No Functions have been appended to this Emitter Yet
 
+        opt_kwargs = dict(opt_kwargs or {}, token=token) if token is not None else opt_kwargs
         for caller in self:
-            if iscoroutinefunction(caller):
-                # Run Self, Asynchronously
-                create_task(self._async_response_wrap_(caller, *args, **kwargs, rsp_kwargs=rsp_kwargs))
+            call_kwargs = kwargs
+            if opt_kwargs:
+                call_kwargs = kwargs | {k: v for k, v in opt_kwargs.items() if _takes_arg(caller, k)}
+            if iscoroutinefunction(caller) or self._executor is not None:
+                # Run Self, Asynchronously or in the Executor
+                task = create_task(
+                    self._async_response_wrap_(
+                        caller, token, on_response, *args, **call_kwargs, rsp_kwargs=rsp_kwargs
+                    )
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                if token is not None:
+                    token.add_task(task)
             else:
                 # Run Self, Synchronously
-                rsp = caller(*args, **kwargs)
-                if self.responder is None:
+                rsp = caller(*args, **call_kwargs)
+                if self.responder is None or (token is not None and token.cancelled):
                     return
 
                 self.responder(  # only unpack rsp tuples, not lists
                     *rsp if isinstance(rsp, tuple) else (rsp,),
                     **rsp_kwargs if rsp_kwargs is not None else {},
                 )
+                if on_response is not None:
+                    on_response()
 
-    async def _async_response_wrap_(self, call, *args, rsp_kwargs: Optional[dict[str, Any]] = None, **kwargs):
+    async def _async_response_wrap_(
+        self,
+        call,
+        cancel_token: Optional[CancelToken],
+        on_response: Optional[Callable[[], Any]],
+        /,
+        *args,
+        rsp_kwargs: Optional[dict[str, Any]] = None,
+        **kwargs,
+    ):
         "Simple Wrapper to await the initial caller function."
-        rsp = await call(*args, **kwargs)
-        if self.responder is None:
+        async with self._limiter:
+            if iscoroutinefunction(call):
+                awaitable = call(*args, **kwargs)
+            else:
+                awaitable = get_running_loop().run_in_executor(self._executor, partial(call, *args, **kwargs))
+
+            try:
+                rsp = await wait_for(awaitable, self.timeout)
+            except TimeoutError:
+                name = getattr(call, "__name__", call)
+                log.warning("%s timed out after %ss. Result discarded.", name, self.timeout)
+                return
+
+        if self.responder is None or (cancel_token is not None and cancel_token.cancelled):
             return
 
         self.responder(
-            *rsp if isinstance(rsp, tuple) else rsp,  # only unpack tuples, not lists
+            *rsp if isinstance(rsp, tuple) else (rsp,),  # only unpack tuples, not lists
             **rsp_kwargs if rsp_kwargs is not None else {},
         )
+        if on_response is not None:
+            on_response()
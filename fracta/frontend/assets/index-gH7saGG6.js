@@ -16,7 +16,7 @@
  * TradingView Lightweight Charts™ v4.2.0
  * Copyright (c) 2024 TradingView, Inc.
  * Licensed under Apache License 2.0 https://www.apache.org/licenses/LICENSE-2.0
- */const Lh={upColor:"#26a69a",downColor:"#ef5350",wickVisible:!0,borderVisible:!0,borderColor:"#378658",borderUpColor:"#26a69a",borderDownColor:"#ef5350",wickColor:"#737375",wickUpColor:"#26a69a",wickDownColor:"#ef5350"},Th={upColor:"#26a69a",downColor:"#ef5350",openVisible:!0,thinBars:!0},Ph={color:"#2196f3",lineStyle:0,lineWidth:3,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},zh={topColor:"rgba( 46, 220, 135, 0.4)",bottomColor:"rgba( 40, 221, 100, 0)",invertFilledArea:!1,lineColor:"#33D778",lineStyle:0,lineWidth:3,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},Dh={baseValue:{type:"price",price:0},topFillColor1:"rgba(38, 166, 154, 0.28)",topFillColor2:"rgba(38, 166, 154, 0.05)",topLineColor:"rgba(38, 166, 154, 1)",bottomFillColor1:"rgba(239, 83, 80, 0.05)",bottomFillColor2:"rgba(239, 83, 80, 0.28)",bottomLineColor:"rgba(239, 83, 80, 1)",lineWidth:3,lineStyle:0,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},Ah={color:"#26a69a",base:0},Qr={color:"#2196f3"},to={title:"",visible:!0,lastValueVisible:!0,priceLineVisible:!0,priceLineSource:0,priceLineWidth:1,priceLineColor:"",priceLineStyle:2,baseLineVisible:!0,baseLineWidth:1,baseLineColor:"#B2B5BE",baseLineStyle:0,priceFormat:{type:"price",precision:2,minMove:.01}};var Ss,Ms;function se(i,t){const e={0:[],1:[i.lineWidth,i.lineWidth],2:[2*i.lineWidth,2*i.lineWidth],3:[6*i.lineWidth,6*i.lineWidth],4:[i.lineWidth,4*i.lineWidth]}[t];i.setLineDash(e)}function eo(i,t,e,s){i.beginPath();const n=i.lineWidth%2?.5:0;i.moveTo(e,t+n),i.lineTo(s,t+n),i.stroke()}function qt(i,t){if(!i)throw new Error("Assertion failed"+(t?": "+t:""))}function mt(i){if(i===void 0)throw new Error("Value is undefined");return i}function M(i){if(i===null)throw new Error("Value is null");return i}function ue(i){return M(mt(i))}(function(i){i[i.Simple=0]="Simple",i[i.WithSteps=1]="WithSteps",i[i.Curved=2]="Curved"})(Ss||(Ss={})),function(i){i[i.Solid=0]="Solid",i[i.Dotted=1]="Dotted",i[i.Dashed=2]="Dashed",i[i.LargeDashed=3]="LargeDashed",i[i.SparseDotted=4]="SparseDotted"}(Ms||(Ms={}));const zn={khaki:"#f0e68c",azure:"#f0ffff",aliceblue:"#f0f8ff",ghostwhite:"#f8f8ff",gold:"#ffd700",goldenrod:"#daa520",gainsboro:"#dcdcdc",gray:"#808080",green:"#008000",honeydew:"#f0fff0",floralwhite:"#fffaf0",lightblue:"#add8e6",lightcoral:"#f08080",lemonchiffon:"#fffacd",hotpink:"#ff69b4",lightyellow:"#ffffe0",greenyellow:"#adff2f",lightgoldenrodyellow:"#fafad2",limegreen:"#32cd32",linen:"#faf0e6",lightcyan:"#e0ffff",magenta:"#f0f",maroon:"#800000",olive:"#808000",orange:"#ffa500",oldlace:"#fdf5e6",mediumblue:"#0000cd",transparent:"#0000",lime:"#0f0",lightpink:"#ffb6c1",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",midnightblue:"#191970",orchid:"#da70d6",mediumorchid:"#ba55d3",mediumturquoise:"#48d1cc",orangered:"#ff4500",royalblue:"#4169e1",powderblue:"#b0e0e6",red:"#f00",coral:"#ff7f50",turquoise:"#40e0d0",white:"#fff",whitesmoke:"#f5f5f5",wheat:"#f5deb3",teal:"#008080",steelblue:"#4682b4",bisque:"#ffe4c4",aquamarine:"#7fffd4",aqua:"#0ff",sienna:"#a0522d",silver:"#c0c0c0",springgreen:"#00ff7f",antiquewhite:"#faebd7",burlywood:"#deb887",brown:"#a52a2a",beige:"#f5f5dc",chocolate:"#d2691e",chartreuse:"#7fff00",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cadetblue:"#5f9ea0",tomato:"#ff6347",fuchsia:"#f0f",blue:"#00f",salmon:"#fa8072",blanchedalmond:"#ffebcd",slateblue:"#6a5acd",slategray:"#708090",thistle:"#d8bfd8",tan:"#d2b48c",cyan:"#0ff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",blueviolet:"#8a2be2",black:"#000",darkmagenta:"#8b008b",darkslateblue:"#483d8b",darkkhaki:"#bdb76b",darkorchid:"#9932cc",darkorange:"#ff8c00",darkgreen:"#006400",darkred:"#8b0000",dodgerblue:"#1e90ff",darkslategray:"#2f4f4f",dimgray:"#696969",deepskyblue:"#00bfff",firebrick:"#b22222",forestgreen:"#228b22",indigo:"#4b0082",ivory:"#fffff0",lavenderblush:"#fff0f5",feldspar:"#d19275",indianred:"#cd5c5c",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightskyblue:"#87cefa",lightslategray:"#789",lightslateblue:"#8470ff",snow:"#fffafa",lightseagreen:"#20b2aa",lightsalmon:"#ffa07a",darksalmon:"#e9967a",darkviolet:"#9400d3",mediumpurple:"#9370d8",mediumaquamarine:"#66cdaa",skyblue:"#87ceeb",lavender:"#e6e6fa",lightsteelblue:"#b0c4de",mediumvioletred:"#c71585",mintcream:"#f5fffa",navajowhite:"#ffdead",navy:"#000080",olivedrab:"#6b8e23",palevioletred:"#d87093",violetred:"#d02090",yellow:"#ff0",yellowgreen:"#9acd32",lawngreen:"#7cfc00",pink:"#ffc0cb",paleturquoise:"#afeeee",palegoldenrod:"#eee8aa",darkolivegreen:"#556b2f",darkseagreen:"#8fbc8f",darkturquoise:"#00ced1",peachpuff:"#ffdab9",deeppink:"#ff1493",violet:"#ee82ee",palegreen:"#98fb98",mediumseagreen:"#3cb371",peru:"#cd853f",saddlebrown:"#8b4513",sandybrown:"#f4a460",rosybrown:"#bc8f8f",purple:"#800080",seagreen:"#2e8b57",seashell:"#fff5ee",papayawhip:"#ffefd5",mediumslateblue:"#7b68ee",plum:"#dda0dd",mediumspringgreen:"#00fa9a"};function xt(i){return i<0?0:i>255?255:Math.round(i)||0}function io(i){return i<=0||i>1?Math.min(Math.max(i,0),1):Math.round(1e4*i)/1e4}const Ih=/^#([0-9a-f])([0-9a-f])([0-9a-f])([0-9a-f])?$/i,Oh=/^#([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})?$/i,Rh=/^rgb\(\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*\)$/,Vh=/^rgba\(\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d*\.?\d+)\s*\)$/;function Oe(i){(i=i.toLowerCase())in zn&&(i=zn[i]);{const t=Vh.exec(i)||Rh.exec(i);if(t)return[xt(parseInt(t[1],10)),xt(parseInt(t[2],10)),xt(parseInt(t[3],10)),io(t.length<5?1:parseFloat(t[4]))]}{const t=Oh.exec(i);if(t)return[xt(parseInt(t[1],16)),xt(parseInt(t[2],16)),xt(parseInt(t[3],16)),1]}{const t=Ih.exec(i);if(t)return[xt(17*parseInt(t[1],16)),xt(17*parseInt(t[2],16)),xt(17*parseInt(t[3],16)),1]}throw new Error(`Cannot parse color: ${i}`)}function so(i){return .199*i[0]+.687*i[1]+.114*i[2]}function Ei(i){const t=Oe(i);return{t:`rgb(${t[0]}, ${t[1]}, ${t[2]})`,i:so(t)>160?"black":"white"}}class st{constructor(){this.h=[]}l(t,e,s){const n={o:t,_:e,u:s===!0};this.h.push(n)}v(t){const e=this.h.findIndex(s=>t===s.o);e>-1&&this.h.splice(e,1)}p(t){this.h=this.h.filter(e=>e._!==t)}m(t,e,s){const n=[...this.h];this.h=this.h.filter(r=>!r.u),n.forEach(r=>r.o(t,e,s))}M(){return this.h.length>0}S(){this.h=[]}}function Pt(i,...t){for(const e of t)for(const s in e)e[s]!==void 0&&(typeof e[s]!="object"||i[s]===void 0||Array.isArray(e[s])?i[s]=e[s]:Pt(i[s],e[s]));return i}function At(i){return typeof i=="number"&&isFinite(i)}function Re(i){return typeof i=="number"&&i%1==0}function Fe(i){return typeof i=="string"}function Ke(i){return typeof i=="boolean"}function Vt(i){const t=i;if(!t||typeof t!="object")return t;let e,s,n;for(s in e=Array.isArray(t)?[]:{},t)t.hasOwnProperty(s)&&(n=t[s],e[s]=n&&typeof n=="object"?Vt(n):n);return e}function Wh(i){return i!==null}function Ve(i){return i===null?void 0:i}const Bs="-apple-system, BlinkMacSystemFont, 'Trebuchet MS', Roboto, Ubuntu, sans-serif";function be(i,t,e){return t===void 0&&(t=Bs),`${e=e!==void 0?`${e} `:""}${i}px ${t}`}class Bh{constructor(t){this.k={C:1,T:5,P:NaN,R:"",D:"",V:"",O:"",B:0,A:0,I:0,L:0,N:0},this.F=t}W(){const t=this.k,e=this.j(),s=this.H();return t.P===e&&t.D===s||(t.P=e,t.D=s,t.R=be(e,s),t.L=2.5/12*e,t.B=t.L,t.A=e/12*t.T,t.I=e/12*t.T,t.N=0),t.V=this.$(),t.O=this.U(),this.k}$(){return this.F.W().layout.textColor}U(){return this.F.q()}j(){return this.F.W().layout.fontSize}H(){return this.F.W().layout.fontFamily}}class Ns{constructor(){this.Y=[]}Z(t){this.Y=t}X(t,e,s){this.Y.forEach(n=>{n.X(t,e,s)})}}class zt{X(t,e,s){t.useBitmapCoordinateSpace(n=>this.K(n,e,s))}}class Nh extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.G===null||this.G.tt===null)return;const n=this.G.tt,r=this.G,o=Math.max(1,Math.floor(e))%2/2,l=h=>{t.beginPath();for(let a=n.to-1;a>=n.from;--a){const c=r.it[a],u=Math.round(c.nt*e)+o,f=c.st*s,m=h*s+o;t.moveTo(u,f),t.arc(u,f,m,0,2*Math.PI)}t.fill()};r.et>0&&(t.fillStyle=r.rt,l(r.ht+r.et)),t.fillStyle=r.lt,l(r.ht)}}function jh(){return{it:[{nt:0,st:0,ot:0,_t:0}],lt:"",rt:"",ht:0,et:0,tt:null}}const Fh={from:0,to:1};class Uh{constructor(t,e){this.ut=new Ns,this.ct=[],this.dt=[],this.ft=!0,this.F=t,this.vt=e,this.ut.Z(this.ct)}bt(t){const e=this.F.wt();e.length!==this.ct.length&&(this.dt=e.map(jh),this.ct=this.dt.map(s=>{const n=new Nh;return n.J(s),n}),this.ut.Z(this.ct)),this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.ut}Mt(){const t=this.vt.W().mode===2,e=this.F.wt(),s=this.vt.xt(),n=this.F.St();e.forEach((r,o)=>{var l;const h=this.dt[o],a=r.kt(s);if(t||a===null||!r.yt())return void(h.tt=null);const c=M(r.Ct());h.lt=a.Tt,h.ht=a.ht,h.et=a.Pt,h.it[0]._t=a._t,h.it[0].st=r.Dt().Rt(a._t,c.Vt),h.rt=(l=a.Ot)!==null&&l!==void 0?l:this.F.Bt(h.it[0].st/r.Dt().At()),h.it[0].ot=s,h.it[0].nt=n.It(s),h.tt=Fh})}}class Hh extends zt{constructor(t){super(),this.zt=t}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null)return;const r=this.zt.Lt.yt,o=this.zt.Et.yt;if(!r&&!o)return;const l=Math.round(this.zt.nt*s),h=Math.round(this.zt.st*n);t.lineCap="butt",r&&l>=0&&(t.lineWidth=Math.floor(this.zt.Lt.et*s),t.strokeStyle=this.zt.Lt.V,t.fillStyle=this.zt.Lt.V,se(t,this.zt.Lt.Nt),function(a,c,u,f){a.beginPath();const m=a.lineWidth%2?.5:0;a.moveTo(c+m,u),a.lineTo(c+m,f),a.stroke()}(t,l,0,e.height)),o&&h>=0&&(t.lineWidth=Math.floor(this.zt.Et.et*n),t.strokeStyle=this.zt.Et.V,t.fillStyle=this.zt.Et.V,se(t,this.zt.Et.Nt),eo(t,h,0,e.width))}}class Xh{constructor(t){this.ft=!0,this.Ft={Lt:{et:1,Nt:0,V:"",yt:!1},Et:{et:1,Nt:0,V:"",yt:!1},nt:0,st:0},this.Wt=new Hh(this.Ft),this.jt=t}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt}Mt(){const t=this.jt.yt(),e=M(this.jt.Ht()),s=e.$t().W().crosshair,n=this.Ft;if(s.mode===2)return n.Et.yt=!1,void(n.Lt.yt=!1);n.Et.yt=t&&this.jt.Ut(e),n.Lt.yt=t&&this.jt.qt(),n.Et.et=s.horzLine.width,n.Et.Nt=s.horzLine.style,n.Et.V=s.horzLine.color,n.Lt.et=s.vertLine.width,n.Lt.Nt=s.vertLine.style,n.Lt.V=s.vertLine.color,n.nt=this.jt.Yt(),n.st=this.jt.Zt()}}function Kh(i,t,e,s,n,r){i.fillRect(t+r,e,s-2*r,r),i.fillRect(t+r,e+n-r,s-2*r,r),i.fillRect(t,e,r,n),i.fillRect(t+s-r,e,r,n)}function ki(i,t,e,s,n,r){i.save(),i.globalCompositeOperation="copy",i.fillStyle=r,i.fillRect(t,e,s,n),i.restore()}function Dn(i,t,e,s,n,r){i.beginPath(),i.roundRect?i.roundRect(t,e,s,n,r):(i.lineTo(t+s-r[1],e),r[1]!==0&&i.arcTo(t+s,e,t+s,e+r[1],r[1]),i.lineTo(t+s,e+n-r[2]),r[2]!==0&&i.arcTo(t+s,e+n,t+s-r[2],e+n,r[2]),i.lineTo(t+r[3],e+n),r[3]!==0&&i.arcTo(t,e+n,t,e+n-r[3],r[3]),i.lineTo(t,e+r[0]),r[0]!==0&&i.arcTo(t,e,t+r[0],e,r[0]))}function An(i,t,e,s,n,r,o=0,l=[0,0,0,0],h=""){if(i.save(),!o||!h||h===r)return Dn(i,t,e,s,n,l),i.fillStyle=r,i.fill(),void i.restore();const a=o/2;var c;Dn(i,t+a,e+a,s-o,n-o,(c=-a,l.map(u=>u===0?u:u+c))),r!=="transparent"&&(i.fillStyle=r,i.fill()),h!=="transparent"&&(i.lineWidth=o,i.strokeStyle=h,i.closePath(),i.stroke()),i.restore()}function no(i,t,e,s,n,r,o){i.save(),i.globalCompositeOperation="copy";const l=i.createLinearGradient(0,0,0,n);l.addColorStop(0,r),l.addColorStop(1,o),i.fillStyle=l,i.fillRect(t,e,s,n),i.restore()}class In{constructor(t,e){this.J(t,e)}J(t,e){this.zt=t,this.Xt=e}At(t,e){return this.zt.yt?t.P+t.L+t.B:0}X(t,e,s,n){if(!this.zt.yt||this.zt.Kt.length===0)return;const r=this.zt.V,o=this.Xt.t,l=t.useBitmapCoordinateSpace(h=>{const a=h.context;a.font=e.R;const c=this.Gt(h,e,s,n),u=c.Jt,f=(m,g)=>{c.Qt?An(a,u.ti,u.ii,u.ni,u.si,m,u.ei,[u.ht,0,0,u.ht],g):An(a,u.ri,u.ii,u.ni,u.si,m,u.ei,[0,u.ht,u.ht,0],g)};return f(o,"transparent"),this.zt.hi&&(a.fillStyle=r,a.fillRect(u.ri,u.li,u.ai-u.ri,u.oi)),f("transparent",o),this.zt._i&&(a.fillStyle=e.O,a.fillRect(c.Qt?u.ui-u.ei:0,u.ii,u.ei,u.ci-u.ii)),c});t.useMediaCoordinateSpace(({context:h})=>{const a=l.di;h.font=e.R,h.textAlign=l.Qt?"right":"left",h.textBaseline="middle",h.fillStyle=r,h.fillText(this.zt.Kt,a.fi,(a.ii+a.ci)/2+a.pi)})}Gt(t,e,s,n){var r;const{context:o,bitmapSize:l,mediaSize:h,horizontalPixelRatio:a,verticalPixelRatio:c}=t,u=this.zt.hi||!this.zt.mi?e.T:0,f=this.zt.bi?e.C:0,m=e.L+this.Xt.wi,g=e.B+this.Xt.gi,p=e.A,_=e.I,w=this.zt.Kt,x=e.P,$=s.Mi(o,w),E=Math.ceil(s.xi(o,w)),L=x+m+g,F=e.C+p+_+E+u,W=Math.max(1,Math.floor(c));let z=Math.round(L*c);z%2!=W%2&&(z+=1);const R=f>0?Math.max(1,Math.floor(f*a)):0,U=Math.round(F*a),at=Math.round(u*a),Me=(r=this.Xt.Si)!==null&&r!==void 0?r:this.Xt.ki,Zt=Math.round(Me*c)-Math.floor(.5*c),S=Math.floor(Zt+W/2-z/2),T=S+z,D=n==="right",ot=D?h.width-f:f,B=D?l.width-R:R;let I,G,et;return D?(I=B-U,G=B-at,et=ot-u-p-f):(I=B+U,G=B+at,et=ot+u+p),{Qt:D,Jt:{ii:S,li:Zt,ci:T,ni:U,si:z,ht:2*a,ei:R,ti:I,ri:B,ai:G,oi:W,ui:l.width},di:{ii:S/c,ci:T/c,fi:et,pi:$}}}}class Li{constructor(t){this.yi={ki:0,t:"#000",gi:0,wi:0},this.Ci={Kt:"",yt:!1,hi:!0,mi:!1,Ot:"",V:"#FFF",_i:!1,bi:!1},this.Ti={Kt:"",yt:!1,hi:!1,mi:!0,Ot:"",V:"#FFF",_i:!0,bi:!0},this.ft=!0,this.Pi=new(t||In)(this.Ci,this.yi),this.Ri=new(t||In)(this.Ti,this.yi)}Kt(){return this.Di(),this.Ci.Kt}ki(){return this.Di(),this.yi.ki}bt(){this.ft=!0}At(t,e=!1){return Math.max(this.Pi.At(t,e),this.Ri.At(t,e))}Vi(){return this.yi.Si||0}Oi(t){this.yi.Si=t}Bi(){return this.Di(),this.Ci.yt||this.Ti.yt}Ai(){return this.Di(),this.Ci.yt}gt(t){return this.Di(),this.Ci.hi=this.Ci.hi&&t.W().ticksVisible,this.Ti.hi=this.Ti.hi&&t.W().ticksVisible,this.Pi.J(this.Ci,this.yi),this.Ri.J(this.Ti,this.yi),this.Pi}Ii(){return this.Di(),this.Pi.J(this.Ci,this.yi),this.Ri.J(this.Ti,this.yi),this.Ri}Di(){this.ft&&(this.Ci.hi=!0,this.Ti.hi=!1,this.zi(this.Ci,this.Ti,this.yi))}}class qh extends Li{constructor(t,e,s){super(),this.jt=t,this.Li=e,this.Ei=s}zi(t,e,s){if(t.yt=!1,this.jt.W().mode===2)return;const n=this.jt.W().horzLine;if(!n.labelVisible)return;const r=this.Li.Ct();if(!this.jt.yt()||this.Li.Ni()||r===null)return;const o=Ei(n.labelBackgroundColor);s.t=o.t,t.V=o.i;const l=2/12*this.Li.P();s.wi=l,s.gi=l;const h=this.Ei(this.Li);s.ki=h.ki,t.Kt=this.Li.Fi(h._t,r),t.yt=!0}}const Gh=/[1-9]/g;class ro{constructor(){this.zt=null}J(t){this.zt=t}X(t,e){if(this.zt===null||this.zt.yt===!1||this.zt.Kt.length===0)return;const s=t.useMediaCoordinateSpace(({context:f})=>(f.font=e.R,Math.round(e.Wi.xi(f,M(this.zt).Kt,Gh))));if(s<=0)return;const n=e.ji,r=s+2*n,o=r/2,l=this.zt.Hi;let h=this.zt.ki,a=Math.floor(h-o)+.5;a<0?(h+=Math.abs(0-a),a=Math.floor(h-o)+.5):a+r>l&&(h-=Math.abs(l-(a+r)),a=Math.floor(h-o)+.5);const c=a+r,u=Math.ceil(0+e.C+e.T+e.L+e.P+e.B);t.useBitmapCoordinateSpace(({context:f,horizontalPixelRatio:m,verticalPixelRatio:g})=>{const p=M(this.zt);f.fillStyle=p.t;const _=Math.round(a*m),w=Math.round(0*g),x=Math.round(c*m),$=Math.round(u*g),E=Math.round(2*m);if(f.beginPath(),f.moveTo(_,w),f.lineTo(_,$-E),f.arcTo(_,$,_+E,$,E),f.lineTo(x-E,$),f.arcTo(x,$,x,$-E,E),f.lineTo(x,w),f.fill(),p.hi){const L=Math.round(p.ki*m),F=w,W=Math.round((F+e.T)*g);f.fillStyle=p.V;const z=Math.max(1,Math.floor(m)),R=Math.floor(.5*m);f.fillRect(L-R,F,z,W-F)}}),t.useMediaCoordinateSpace(({context:f})=>{const m=M(this.zt),g=0+e.C+e.T+e.L+e.P/2;f.font=e.R,f.textAlign="left",f.textBaseline="middle",f.fillStyle=m.V;const p=e.Wi.Mi(f,"Apr0");f.translate(a+n,g+p),f.fillText(m.Kt,0,0)})}}class Yh{constructor(t,e,s){this.ft=!0,this.Wt=new ro,this.Ft={yt:!1,t:"#4c525e",V:"white",Kt:"",Hi:0,ki:NaN,hi:!0},this.vt=t,this.$i=e,this.Ei=s}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt.J(this.Ft),this.Wt}Mt(){const t=this.Ft;if(t.yt=!1,this.vt.W().mode===2)return;const e=this.vt.W().vertLine;if(!e.labelVisible)return;const s=this.$i.St();if(s.Ni())return;t.Hi=s.Hi();const n=this.Ei();if(n===null)return;t.ki=n.ki;const r=s.Ui(this.vt.xt());t.Kt=s.qi(M(r)),t.yt=!0;const o=Ei(e.labelBackgroundColor);t.t=o.t,t.V=o.i,t.hi=s.W().ticksVisible}}class js{constructor(){this.Yi=null,this.Zi=0}Xi(){return this.Zi}Ki(t){this.Zi=t}Dt(){return this.Yi}Gi(t){this.Yi=t}Ji(t){return[]}Qi(){return[]}yt(){return!0}}var On;(function(i){i[i.Normal=0]="Normal",i[i.Magnet=1]="Magnet",i[i.Hidden=2]="Hidden"})(On||(On={}));class Zh extends js{constructor(t,e){super(),this.tn=null,this.nn=NaN,this.sn=0,this.en=!0,this.rn=new Map,this.hn=!1,this.ln=NaN,this.an=NaN,this._n=NaN,this.un=NaN,this.$i=t,this.cn=e,this.dn=new Uh(t,this),this.fn=((n,r)=>o=>{const l=r(),h=n();if(o===M(this.tn).vn())return{_t:h,ki:l};{const a=M(o.Ct());return{_t:o.pn(l,a),ki:l}}})(()=>this.nn,()=>this.an);const s=((n,r)=>()=>{const o=this.$i.St().mn(n()),l=r();return o&&Number.isFinite(l)?{ot:o,ki:l}:null})(()=>this.sn,()=>this.Yt());this.bn=new Yh(this,t,s),this.wn=new Xh(this)}W(){return this.cn}gn(t,e){this._n=t,this.un=e}Mn(){this._n=NaN,this.un=NaN}xn(){return this._n}Sn(){return this.un}kn(t,e,s){this.hn||(this.hn=!0),this.en=!0,this.yn(t,e,s)}xt(){return this.sn}Yt(){return this.ln}Zt(){return this.an}yt(){return this.en}Cn(){this.en=!1,this.Tn(),this.nn=NaN,this.ln=NaN,this.an=NaN,this.tn=null,this.Mn()}Pn(t){return this.tn!==null?[this.wn,this.dn]:[]}Ut(t){return t===this.tn&&this.cn.horzLine.visible}qt(){return this.cn.vertLine.visible}Rn(t,e){this.en&&this.tn===t||this.rn.clear();const s=[];return this.tn===t&&s.push(this.Dn(this.rn,e,this.fn)),s}Qi(){return this.en?[this.bn]:[]}Ht(){return this.tn}Vn(){this.wn.bt(),this.rn.forEach(t=>t.bt()),this.bn.bt(),this.dn.bt()}On(t){return t&&!t.vn().Ni()?t.vn():null}yn(t,e,s){this.Bn(t,e,s)&&this.Vn()}Bn(t,e,s){const n=this.ln,r=this.an,o=this.nn,l=this.sn,h=this.tn,a=this.On(s);this.sn=t,this.ln=isNaN(t)?NaN:this.$i.St().It(t),this.tn=s;const c=a!==null?a.Ct():null;return a!==null&&c!==null?(this.nn=e,this.an=a.Rt(e,c)):(this.nn=NaN,this.an=NaN),n!==this.ln||r!==this.an||l!==this.sn||o!==this.nn||h!==this.tn}Tn(){const t=this.$i.wt().map(s=>s.In().An()).filter(Wh),e=t.length===0?null:Math.max(...t);this.sn=e!==null?e:NaN}Dn(t,e,s){let n=t.get(e);return n===void 0&&(n=new qh(this,e,s),t.set(e,n)),n}}function Ti(i){return i==="left"||i==="right"}class ht{constructor(t){this.zn=new Map,this.Ln=[],this.En=t}Nn(t,e){const s=function(n,r){return n===void 0?r:{Fn:Math.max(n.Fn,r.Fn),Wn:n.Wn||r.Wn}}(this.zn.get(t),e);this.zn.set(t,s)}jn(){return this.En}Hn(t){const e=this.zn.get(t);return e===void 0?{Fn:this.En}:{Fn:Math.max(this.En,e.Fn),Wn:e.Wn}}$n(){this.Un(),this.Ln=[{qn:0}]}Yn(t){this.Un(),this.Ln=[{qn:1,Vt:t}]}Zn(t){this.Xn(),this.Ln.push({qn:5,Vt:t})}Un(){this.Xn(),this.Ln.push({qn:6})}Kn(){this.Un(),this.Ln=[{qn:4}]}Gn(t){this.Un(),this.Ln.push({qn:2,Vt:t})}Jn(t){this.Un(),this.Ln.push({qn:3,Vt:t})}Qn(){return this.Ln}ts(t){for(const e of t.Ln)this.ns(e);this.En=Math.max(this.En,t.En),t.zn.forEach((e,s)=>{this.Nn(s,e)})}static ss(){return new ht(2)}static es(){return new ht(3)}ns(t){switch(t.qn){case 0:this.$n();break;case 1:this.Yn(t.Vt);break;case 2:this.Gn(t.Vt);break;case 3:this.Jn(t.Vt);break;case 4:this.Kn();break;case 5:this.Zn(t.Vt);break;case 6:this.Xn()}}Xn(){const t=this.Ln.findIndex(e=>e.qn===5);t!==-1&&this.Ln.splice(t,1)}}const Rn=".";function Wt(i,t){if(!At(i))return"n/a";if(!Re(t))throw new TypeError("invalid length");if(t<0||t>16)throw new TypeError("invalid length");return t===0?i.toString():("0000000000000000"+i.toString()).slice(-t)}class Pi{constructor(t,e){if(e||(e=1),At(t)&&Re(t)||(t=100),t<0)throw new TypeError("invalid base");this.Li=t,this.rs=e,this.hs()}format(t){const e=t<0?"−":"";return t=Math.abs(t),e+this.ls(t)}hs(){if(this.os=0,this.Li>0&&this.rs>0){let t=this.Li;for(;t>1;)t/=10,this.os++}}ls(t){const e=this.Li/this.rs;let s=Math.floor(t),n="";const r=this.os!==void 0?this.os:NaN;if(e>1){let o=+(Math.round(t*e)-s*e).toFixed(this.os);o>=e&&(o-=e,s+=1),n=Rn+Wt(+o.toFixed(this.os)*this.rs,r)}else s=Math.round(s*e)/e,r>0&&(n=Rn+Wt(0,r));return s.toFixed(0)+n}}class oo extends Pi{constructor(t=100){super(t)}format(t){return`${super.format(t)}%`}}class Jh{constructor(t){this._s=t}format(t){let e="";return t<0&&(e="-",t=-t),t<995?e+this.us(t):t<999995?e+this.us(t/1e3)+"K":t<999999995?(t=1e3*Math.round(t/1e3),e+this.us(t/1e6)+"M"):(t=1e6*Math.round(t/1e6),e+this.us(t/1e9)+"B")}us(t){let e;const s=Math.pow(10,this._s);return e=(t=Math.round(t*s)/s)>=1e-15&&t<1?t.toFixed(this._s).replace(/\.?0+$/,""):String(t),e.replace(/(\.[1-9]*)0+$/,(n,r)=>r)}}function lo(i,t,e,s,n,r,o){if(t.length===0||s.from>=t.length||s.to<=0)return;const{context:l,horizontalPixelRatio:h,verticalPixelRatio:a}=i,c=t[s.from];let u=r(i,c),f=c;if(s.to-s.from<2){const m=n/2;l.beginPath();const g={nt:c.nt-m,st:c.st},p={nt:c.nt+m,st:c.st};l.moveTo(g.nt*h,g.st*a),l.lineTo(p.nt*h,p.st*a),o(i,u,g,p)}else{const m=(p,_)=>{o(i,u,f,_),l.beginPath(),u=p,f=_};let g=f;l.beginPath(),l.moveTo(c.nt*h,c.st*a);for(let p=s.from+1;p<s.to;++p){g=t[p];const _=r(i,g);switch(e){case 0:l.lineTo(g.nt*h,g.st*a);break;case 1:l.lineTo(g.nt*h,t[p-1].st*a),_!==u&&(m(_,g),l.lineTo(g.nt*h,t[p-1].st*a)),l.lineTo(g.nt*h,g.st*a);break;case 2:{const[w,x]=Qh(t,p-1,p);l.bezierCurveTo(w.nt*h,w.st*a,x.nt*h,x.st*a,g.nt*h,g.st*a);break}}e!==1&&_!==u&&(m(_,g),l.moveTo(g.nt*h,g.st*a))}(f!==g||f===g&&e===1)&&o(i,u,f,g)}}const Vn=6;function Fi(i,t){return{nt:i.nt-t.nt,st:i.st-t.st}}function Wn(i,t){return{nt:i.nt/t,st:i.st/t}}function Qh(i,t,e){const s=Math.max(0,t-1),n=Math.min(i.length-1,e+1);var r,o;return[(r=i[t],o=Wn(Fi(i[e],i[s]),Vn),{nt:r.nt+o.nt,st:r.st+o.st}),Fi(i[e],Wn(Fi(i[n],i[t]),Vn))]}function ta(i,t,e,s,n){const{context:r,horizontalPixelRatio:o,verticalPixelRatio:l}=t;r.lineTo(n.nt*o,i*l),r.lineTo(s.nt*o,i*l),r.closePath(),r.fillStyle=e,r.fill()}class ho extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K(t){var e;if(this.G===null)return;const{it:s,tt:n,cs:r,et:o,Nt:l,ds:h}=this.G,a=(e=this.G.fs)!==null&&e!==void 0?e:this.G.vs?0:t.mediaSize.height;if(n===null)return;const c=t.context;c.lineCap="butt",c.lineJoin="round",c.lineWidth=o,se(c,l),c.lineWidth=1,lo(t,s,h,n,r,this.ps.bind(this),ta.bind(null,a))}}function Cs(i,t,e){return Math.min(Math.max(i,t),e)}function qe(i,t,e){return t-i<=e}function ao(i){const t=Math.ceil(i);return t%2==0?t-1:t}class Fs{bs(t,e){const s=this.ws,{gs:n,Ms:r,xs:o,Ss:l,ks:h,fs:a}=e;if(this.ys===void 0||s===void 0||s.gs!==n||s.Ms!==r||s.xs!==o||s.Ss!==l||s.fs!==a||s.ks!==h){const c=t.context.createLinearGradient(0,0,0,h);if(c.addColorStop(0,n),a!=null){const u=Cs(a*t.verticalPixelRatio/h,0,1);c.addColorStop(u,r),c.addColorStop(u,o)}c.addColorStop(1,l),this.ys=c,this.ws=e}return this.ys}}class ea extends ho{constructor(){super(...arguments),this.Cs=new Fs}ps(t,e){return this.Cs.bs(t,{gs:e.Ts,Ms:"",xs:"",Ss:e.Ps,ks:t.bitmapSize.height})}}function ia(i,t){const e=i.context;e.strokeStyle=t,e.stroke()}class co extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K(t){if(this.G===null)return;const{it:e,tt:s,cs:n,ds:r,et:o,Nt:l,Rs:h}=this.G;if(s===null)return;const a=t.context;a.lineCap="butt",a.lineWidth=o*t.verticalPixelRatio,se(a,l),a.lineJoin="round";const c=this.Ds.bind(this);r!==void 0&&lo(t,e,r,s,n,c,ia),h&&function(u,f,m,g,p){const{horizontalPixelRatio:_,verticalPixelRatio:w,context:x}=u;let $=null;const E=Math.max(1,Math.floor(_))%2/2,L=m*w+E;for(let F=g.to-1;F>=g.from;--F){const W=f[F];if(W){const z=p(u,W);z!==$&&(x.beginPath(),$!==null&&x.fill(),x.fillStyle=z,$=z);const R=Math.round(W.nt*_)+E,U=W.st*w;x.moveTo(R,U),x.arc(R,U,L,0,2*Math.PI)}}x.fill()}(t,e,h,s,c)}}class uo extends co{Ds(t,e){return e.lt}}function fo(i,t,e,s,n=0,r=t.length){let o=r-n;for(;0<o;){const l=o>>1,h=n+l;s(t[h],e)===i?(n=h+1,o-=l+1):o=l}return n}const Ue=fo.bind(null,!0),go=fo.bind(null,!1);function sa(i,t){return i.ot<t}function na(i,t){return t<i.ot}function mo(i,t,e){const s=t.Vs(),n=t.ui(),r=Ue(i,s,sa),o=go(i,n,na);if(!e)return{from:r,to:o};let l=r,h=o;return r>0&&r<i.length&&i[r].ot>=s&&(l=r-1),o>0&&o<i.length&&i[o-1].ot<=n&&(h=o+1),{from:l,to:h}}class Us{constructor(t,e,s){this.Os=!0,this.Bs=!0,this.As=!0,this.Is=[],this.zs=null,this.Ls=t,this.Es=e,this.Ns=s}bt(t){this.Os=!0,t==="data"&&(this.Bs=!0),t==="options"&&(this.As=!0)}gt(){return this.Ls.yt()?(this.Fs(),this.zs===null?null:this.Ws):null}js(){this.Is=this.Is.map(t=>Object.assign(Object.assign({},t),this.Ls.$s().Hs(t.ot)))}Us(){this.zs=null}Fs(){this.Bs&&(this.qs(),this.Bs=!1),this.As&&(this.js(),this.As=!1),this.Os&&(this.Ys(),this.Os=!1)}Ys(){const t=this.Ls.Dt(),e=this.Es.St();if(this.Us(),e.Ni()||t.Ni())return;const s=e.Zs();if(s===null||this.Ls.In().Xs()===0)return;const n=this.Ls.Ct();n!==null&&(this.zs=mo(this.Is,s,this.Ns),this.Ks(t,e,n.Vt),this.Gs())}}class zi extends Us{constructor(t,e){super(t,e,!0)}Ks(t,e,s){e.Js(this.Is,Ve(this.zs)),t.Qs(this.Is,s,Ve(this.zs))}te(t,e){return{ot:t,_t:e,nt:NaN,st:NaN}}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>{const s=e.Vt[3];return this.ne(e.se,s,t)})}}class ra extends zi{constructor(t,e){super(t,e),this.Ws=new Ns,this.ee=new ea,this.re=new uo,this.Ws.Z([this.ee,this.re])}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.W();this.ee.J({ds:t.lineType,it:this.Is,Nt:t.lineStyle,et:t.lineWidth,fs:null,vs:t.invertFilledArea,tt:this.zs,cs:this.Es.St().he()}),this.re.J({ds:t.lineVisible?t.lineType:void 0,it:this.Is,Nt:t.lineStyle,et:t.lineWidth,tt:this.zs,cs:this.Es.St().he(),Rs:t.pointMarkersVisible?t.pointMarkersRadius||t.lineWidth/2+2:void 0})}}class oa extends zt{constructor(){super(...arguments),this.zt=null,this.le=0,this.ae=0}J(t){this.zt=t}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.zt===null||this.zt.In.length===0||this.zt.tt===null)return;this.le=this.oe(e),this.le>=2&&Math.max(1,Math.floor(e))%2!=this.le%2&&this.le--,this.ae=this.zt._e?Math.min(this.le,Math.floor(e)):this.le;let n=null;const r=this.ae<=this.le&&this.zt.he>=Math.floor(1.5*e);for(let o=this.zt.tt.from;o<this.zt.tt.to;++o){const l=this.zt.In[o];n!==l.ue&&(t.fillStyle=l.ue,n=l.ue);const h=Math.floor(.5*this.ae),a=Math.round(l.nt*e),c=a-h,u=this.ae,f=c+u-1,m=Math.min(l.ce,l.de),g=Math.max(l.ce,l.de),p=Math.round(m*s)-h,_=Math.round(g*s)+h,w=Math.max(_-p,this.ae);t.fillRect(c,p,u,w);const x=Math.ceil(1.5*this.le);if(r){if(this.zt.fe){const F=a-x;let W=Math.max(p,Math.round(l.ve*s)-h),z=W+u-1;z>p+w-1&&(z=p+w-1,W=z-u+1),t.fillRect(F,W,c-F,z-W+1)}const $=a+x;let E=Math.max(p,Math.round(l.pe*s)-h),L=E+u-1;L>p+w-1&&(L=p+w-1,E=L-u+1),t.fillRect(f+1,E,$-f,L-E+1)}}}oe(t){const e=Math.floor(t);return Math.max(e,Math.floor(function(s,n){return Math.floor(.3*s*n)}(M(this.zt).he,t)))}}class po extends Us{constructor(t,e){super(t,e,!1)}Ks(t,e,s){e.Js(this.Is,Ve(this.zs)),t.me(this.Is,s,Ve(this.zs))}be(t,e,s){return{ot:t,we:e.Vt[0],ge:e.Vt[1],Me:e.Vt[2],xe:e.Vt[3],nt:NaN,ve:NaN,ce:NaN,de:NaN,pe:NaN}}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>this.ne(e.se,e,t))}}class la extends po{constructor(){super(...arguments),this.Ws=new oa}ne(t,e,s){return Object.assign(Object.assign({},this.be(t,e,s)),s.Hs(t))}Gs(){const t=this.Ls.W();this.Ws.J({In:this.Is,he:this.Es.St().he(),fe:t.openVisible,_e:t.thinBars,tt:this.zs})}}class ha extends ho{constructor(){super(...arguments),this.Cs=new Fs}ps(t,e){const s=this.G;return this.Cs.bs(t,{gs:e.Se,Ms:e.ke,xs:e.ye,Ss:e.Ce,ks:t.bitmapSize.height,fs:s.fs})}}class aa extends co{constructor(){super(...arguments),this.Te=new Fs}Ds(t,e){const s=this.G;return this.Te.bs(t,{gs:e.Pe,Ms:e.Pe,xs:e.Re,Ss:e.Re,ks:t.bitmapSize.height,fs:s.fs})}}class ca extends zi{constructor(t,e){super(t,e),this.Ws=new Ns,this.De=new ha,this.Ve=new aa,this.Ws.Z([this.De,this.Ve])}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.Ct();if(t===null)return;const e=this.Ls.W(),s=this.Ls.Dt().Rt(e.baseValue.price,t.Vt),n=this.Es.St().he();this.De.J({it:this.Is,et:e.lineWidth,Nt:e.lineStyle,ds:e.lineType,fs:s,vs:!1,tt:this.zs,cs:n}),this.Ve.J({it:this.Is,et:e.lineWidth,Nt:e.lineStyle,ds:e.lineVisible?e.lineType:void 0,Rs:e.pointMarkersVisible?e.pointMarkersRadius||e.lineWidth/2+2:void 0,fs:s,tt:this.zs,cs:n})}}class ua extends zt{constructor(){super(...arguments),this.zt=null,this.le=0}J(t){this.zt=t}K(t){if(this.zt===null||this.zt.In.length===0||this.zt.tt===null)return;const{horizontalPixelRatio:e}=t;this.le=function(r,o){if(r>=2.5&&r<=4)return Math.floor(3*o);const l=1-.2*Math.atan(Math.max(4,r)-4)/(.5*Math.PI),h=Math.floor(r*l*o),a=Math.floor(r*o),c=Math.min(h,a);return Math.max(Math.floor(o),c)}(this.zt.he,e),this.le>=2&&Math.floor(e)%2!=this.le%2&&this.le--;const s=this.zt.In;this.zt.Oe&&this.Be(t,s,this.zt.tt),this.zt._i&&this.Ae(t,s,this.zt.tt);const n=this.Ie(e);(!this.zt._i||this.le>2*n)&&this.ze(t,s,this.zt.tt)}Be(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="",h=Math.min(Math.floor(r),Math.floor(this.zt.he*r));h=Math.max(Math.floor(r),Math.min(h,this.le));const a=Math.floor(.5*h);let c=null;for(let u=s.from;u<s.to;u++){const f=e[u];f.Le!==l&&(n.fillStyle=f.Le,l=f.Le);const m=Math.round(Math.min(f.ve,f.pe)*o),g=Math.round(Math.max(f.ve,f.pe)*o),p=Math.round(f.ce*o),_=Math.round(f.de*o);let w=Math.round(r*f.nt)-a;const x=w+h-1;c!==null&&(w=Math.max(c+1,w),w=Math.min(w,x));const $=x-w+1;n.fillRect(w,p,$,m-p),n.fillRect(w,g+1,$,_-g),c=x}}Ie(t){let e=Math.floor(1*t);this.le<=2*e&&(e=Math.floor(.5*(this.le-1)));const s=Math.max(Math.floor(t),e);return this.le<=2*s?Math.max(Math.floor(t),Math.floor(1*t)):s}Ae(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="";const h=this.Ie(r);let a=null;for(let c=s.from;c<s.to;c++){const u=e[c];u.Ee!==l&&(n.fillStyle=u.Ee,l=u.Ee);let f=Math.round(u.nt*r)-Math.floor(.5*this.le);const m=f+this.le-1,g=Math.round(Math.min(u.ve,u.pe)*o),p=Math.round(Math.max(u.ve,u.pe)*o);if(a!==null&&(f=Math.max(a+1,f),f=Math.min(f,m)),this.zt.he*r>2*h)Kh(n,f,g,m-f+1,p-g+1,h);else{const _=m-f+1;n.fillRect(f,g,_,p-g+1)}a=m}}ze(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="";const h=this.Ie(r);for(let a=s.from;a<s.to;a++){const c=e[a];let u=Math.round(Math.min(c.ve,c.pe)*o),f=Math.round(Math.max(c.ve,c.pe)*o),m=Math.round(c.nt*r)-Math.floor(.5*this.le),g=m+this.le-1;if(c.ue!==l){const p=c.ue;n.fillStyle=p,l=p}this.zt._i&&(m+=h,u+=h,g-=h,f-=h),u>f||n.fillRect(m,u,g-m+1,f-u+1)}}}class da extends po{constructor(){super(...arguments),this.Ws=new ua}ne(t,e,s){return Object.assign(Object.assign({},this.be(t,e,s)),s.Hs(t))}Gs(){const t=this.Ls.W();this.Ws.J({In:this.Is,he:this.Es.St().he(),Oe:t.wickVisible,_i:t.borderVisible,tt:this.zs})}}class fa{constructor(t,e){this.Ne=t,this.Li=e}X(t,e,s){this.Ne.draw(t,this.Li,e,s)}}class Ui extends Us{constructor(t,e,s){super(t,e,!1),this.wn=s,this.Ws=new fa(this.wn.renderer(),n=>{const r=t.Ct();return r===null?null:t.Dt().Rt(n,r.Vt)})}Fe(t){return this.wn.priceValueBuilder(t)}We(t){return this.wn.isWhitespace(t)}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>Object.assign(Object.assign({ot:e.se,nt:NaN},t.Hs(e.se)),{je:e.He}))}Ks(t,e){e.Js(this.Is,Ve(this.zs))}Gs(){this.wn.update({bars:this.Is.map(ga),barSpacing:this.Es.St().he(),visibleRange:this.zs},this.Ls.W())}}function ga(i){return{x:i.nt,time:i.ot,originalData:i.je,barColor:i.ue}}class ma extends zt{constructor(){super(...arguments),this.zt=null,this.$e=[]}J(t){this.zt=t,this.$e=[]}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.zt===null||this.zt.it.length===0||this.zt.tt===null)return;this.$e.length||this.Ue(e);const n=Math.max(1,Math.floor(s)),r=Math.round(this.zt.qe*s)-Math.floor(n/2),o=r+n;for(let l=this.zt.tt.from;l<this.zt.tt.to;l++){const h=this.zt.it[l],a=this.$e[l-this.zt.tt.from],c=Math.round(h.st*s);let u,f;t.fillStyle=h.ue,c<=r?(u=c,f=o):(u=r,f=c-Math.floor(n/2)+n),t.fillRect(a.Vs,u,a.ui-a.Vs+1,f-u)}}Ue(t){if(this.zt===null||this.zt.it.length===0||this.zt.tt===null)return void(this.$e=[]);const e=Math.ceil(this.zt.he*t)<=1?0:Math.max(1,Math.floor(t)),s=Math.round(this.zt.he*t)-e;this.$e=new Array(this.zt.tt.to-this.zt.tt.from);for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.zt.it[r],l=Math.round(o.nt*t);let h,a;if(s%2){const c=(s-1)/2;h=l-c,a=l+c}else{const c=s/2;h=l-c,a=l+c-1}this.$e[r-this.zt.tt.from]={Vs:h,ui:a,Ye:l,Ze:o.nt*t,ot:o.ot}}for(let r=this.zt.tt.from+1;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from],l=this.$e[r-this.zt.tt.from-1];o.ot===l.ot+1&&o.Vs-l.ui!==e+1&&(l.Ye>l.Ze?l.ui=o.Vs-e-1:o.Vs=l.ui+e+1)}let n=Math.ceil(this.zt.he*t);for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from];o.ui<o.Vs&&(o.ui=o.Vs);const l=o.ui-o.Vs+1;n=Math.min(l,n)}if(e>0&&n<4)for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from];o.ui-o.Vs+1>n&&(o.Ye>o.Ze?o.ui-=1:o.Vs+=1)}}}class pa extends zi{constructor(){super(...arguments),this.Ws=new ma}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t={it:this.Is,he:this.Es.St().he(),tt:this.zs,qe:this.Ls.Dt().Rt(this.Ls.W().base,M(this.Ls.Ct()).Vt)};this.Ws.J(t)}}class va extends zi{constructor(){super(...arguments),this.Ws=new uo}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.W(),e={it:this.Is,Nt:t.lineStyle,ds:t.lineVisible?t.lineType:void 0,et:t.lineWidth,Rs:t.pointMarkersVisible?t.pointMarkersRadius||t.lineWidth/2+2:void 0,tt:this.zs,cs:this.Es.St().he()};this.Ws.J(e)}}const _a=/[2-9]/g;class We{constructor(t=50){this.Xe=0,this.Ke=1,this.Ge=1,this.Je={},this.Qe=new Map,this.tr=t}ir(){this.Xe=0,this.Qe.clear(),this.Ke=1,this.Ge=1,this.Je={}}xi(t,e,s){return this.nr(t,e,s).width}Mi(t,e,s){const n=this.nr(t,e,s);return((n.actualBoundingBoxAscent||0)-(n.actualBoundingBoxDescent||0))/2}nr(t,e,s){const n=s||_a,r=String(e).replace(n,"0");if(this.Qe.has(r))return mt(this.Qe.get(r)).sr;if(this.Xe===this.tr){const l=this.Je[this.Ge];delete this.Je[this.Ge],this.Qe.delete(l),this.Ge++,this.Xe--}t.save(),t.textBaseline="middle";const o=t.measureText(r);return t.restore(),o.width===0&&e.length||(this.Qe.set(r,{sr:o,er:this.Ke}),this.Je[this.Ke]=r,this.Xe++,this.Ke++),o}}class ba{constructor(t){this.rr=null,this.k=null,this.hr="right",this.lr=t}ar(t,e,s){this.rr=t,this.k=e,this.hr=s}X(t){this.k!==null&&this.rr!==null&&this.rr.X(t,this.k,this.lr,this.hr)}}class vo{constructor(t,e,s){this._r=t,this.lr=new We(50),this.ur=e,this.F=s,this.j=-1,this.Wt=new ba(this.lr)}gt(){const t=this.F.cr(this.ur);if(t===null)return null;const e=t.dr(this.ur)?t.vr():this.ur.Dt();if(e===null)return null;const s=t.pr(e);if(s==="overlay")return null;const n=this.F.mr();return n.P!==this.j&&(this.j=n.P,this.lr.ir()),this.Wt.ar(this._r.Ii(),n,s),this.Wt}}class wa extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}br(t,e){var s;if(!(!((s=this.zt)===null||s===void 0)&&s.yt))return null;const{st:n,et:r,wr:o}=this.zt;return e>=n-r-7&&e<=n+r+7?{gr:this.zt,wr:o}:null}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null||this.zt.yt===!1)return;const r=Math.round(this.zt.st*n);r<0||r>e.height||(t.lineCap="butt",t.strokeStyle=this.zt.V,t.lineWidth=Math.floor(this.zt.et*s),se(t,this.zt.Nt),eo(t,r,0,e.width))}}class Hs{constructor(t){this.Mr={st:0,V:"rgba(0, 0, 0, 0)",et:1,Nt:0,yt:!1},this.Sr=new wa,this.ft=!0,this.Ls=t,this.Es=t.$t(),this.Sr.J(this.Mr)}bt(){this.ft=!0}gt(){return this.Ls.yt()?(this.ft&&(this.kr(),this.ft=!1),this.Sr):null}}class ya extends Hs{constructor(t){super(t)}kr(){this.Mr.yt=!1;const t=this.Ls.Dt(),e=t.yr().yr;if(e!==2&&e!==3)return;const s=this.Ls.W();if(!s.baseLineVisible||!this.Ls.yt())return;const n=this.Ls.Ct();n!==null&&(this.Mr.yt=!0,this.Mr.st=t.Rt(n.Vt,n.Vt),this.Mr.V=s.baseLineColor,this.Mr.et=s.baseLineWidth,this.Mr.Nt=s.baseLineStyle)}}class xa extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}He(){return this.zt}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){const n=this.zt;if(n===null)return;const r=Math.max(1,Math.floor(e)),o=r%2/2,l=Math.round(n.Ze.x*e)+o,h=n.Ze.y*s;t.fillStyle=n.Cr,t.beginPath();const a=Math.max(2,1.5*n.Tr)*e;t.arc(l,h,a,0,2*Math.PI,!1),t.fill(),t.fillStyle=n.Pr,t.beginPath(),t.arc(l,h,n.ht*e,0,2*Math.PI,!1),t.fill(),t.lineWidth=r,t.strokeStyle=n.Rr,t.beginPath(),t.arc(l,h,n.ht*e+r/2,0,2*Math.PI,!1),t.stroke()}}const Sa=[{Dr:0,Vr:.25,Or:4,Br:10,Ar:.25,Ir:0,zr:.4,Lr:.8},{Dr:.25,Vr:.525,Or:10,Br:14,Ar:0,Ir:0,zr:.8,Lr:0},{Dr:.525,Vr:1,Or:14,Br:14,Ar:0,Ir:0,zr:0,Lr:0}];function Bn(i,t,e,s){return function(n,r){if(n==="transparent")return n;const o=Oe(n),l=o[3];return`rgba(${o[0]}, ${o[1]}, ${o[2]}, ${r*l})`}(i,e+(s-e)*t)}function Nn(i,t){const e=i%2600/2600;let s;for(const h of Sa)if(e>=h.Dr&&e<=h.Vr){s=h;break}qt(s!==void 0,"Last price animation internal logic error");const n=(e-s.Dr)/(s.Vr-s.Dr);return{Pr:Bn(t,n,s.Ar,s.Ir),Rr:Bn(t,n,s.zr,s.Lr),ht:(r=n,o=s.Or,l=s.Br,o+(l-o)*r)};var r,o,l}class Ma{constructor(t){this.Wt=new xa,this.ft=!0,this.Er=!0,this.Nr=performance.now(),this.Fr=this.Nr-1,this.Wr=t}jr(){this.Fr=this.Nr-1,this.bt()}Hr(){if(this.bt(),this.Wr.W().lastPriceAnimation===2){const t=performance.now(),e=this.Fr-t;if(e>0)return void(e<650&&(this.Fr+=2600));this.Nr=t,this.Fr=t+2600}}bt(){this.ft=!0}$r(){this.Er=!0}yt(){return this.Wr.W().lastPriceAnimation!==0}Ur(){switch(this.Wr.W().lastPriceAnimation){case 0:return!1;case 1:return!0;case 2:return performance.now()<=this.Fr}}gt(){return this.ft?(this.Mt(),this.ft=!1,this.Er=!1):this.Er&&(this.qr(),this.Er=!1),this.Wt}Mt(){this.Wt.J(null);const t=this.Wr.$t().St(),e=t.Zs(),s=this.Wr.Ct();if(e===null||s===null)return;const n=this.Wr.Yr(!0);if(n.Zr||!e.Xr(n.se))return;const r={x:t.It(n.se),y:this.Wr.Dt().Rt(n._t,s.Vt)},o=n.V,l=this.Wr.W().lineWidth,h=Nn(this.Kr(),o);this.Wt.J({Cr:o,Tr:l,Pr:h.Pr,Rr:h.Rr,ht:h.ht,Ze:r})}qr(){const t=this.Wt.He();if(t!==null){const e=Nn(this.Kr(),t.Cr);t.Pr=e.Pr,t.Rr=e.Rr,t.ht=e.ht}}Kr(){return this.Ur()?performance.now()-this.Nr:2599}}function ke(i,t){return ao(Math.min(Math.max(i,12),30)*t)}function Be(i,t){switch(i){case"arrowDown":case"arrowUp":return ke(t,1);case"circle":return ke(t,.8);case"square":return ke(t,.7)}}function _o(i){return function(t){const e=Math.ceil(t);return e%2!=0?e-1:e}(ke(i,1))}function jn(i){return Math.max(ke(i,.1),3)}function Fn(i,t,e){return t?i:e?Math.ceil(i/2):0}function bo(i,t,e,s,n){const r=Be("square",e),o=(r-1)/2,l=i-o,h=t-o;return s>=l&&s<=l+r&&n>=h&&n<=h+r}function Un(i,t,e,s){const n=(Be("arrowUp",s)-1)/2*e.Gr,r=(ao(s/2)-1)/2*e.Gr;t.beginPath(),i?(t.moveTo(e.nt-n,e.st),t.lineTo(e.nt,e.st-n),t.lineTo(e.nt+n,e.st),t.lineTo(e.nt+r,e.st),t.lineTo(e.nt+r,e.st+n),t.lineTo(e.nt-r,e.st+n),t.lineTo(e.nt-r,e.st)):(t.moveTo(e.nt-n,e.st),t.lineTo(e.nt,e.st+n),t.lineTo(e.nt+n,e.st),t.lineTo(e.nt+r,e.st),t.lineTo(e.nt+r,e.st-n),t.lineTo(e.nt-r,e.st-n),t.lineTo(e.nt-r,e.st)),t.fill()}function Ca(i,t,e,s,n,r){return bo(t,e,s,n,r)}class $a extends zt{constructor(){super(...arguments),this.zt=null,this.lr=new We,this.j=-1,this.H="",this.Jr=""}J(t){this.zt=t}ar(t,e){this.j===t&&this.H===e||(this.j=t,this.H=e,this.Jr=be(t,e),this.lr.ir())}br(t,e){if(this.zt===null||this.zt.tt===null)return null;for(let s=this.zt.tt.from;s<this.zt.tt.to;s++){const n=this.zt.it[s];if(ka(n,t,e))return{gr:n.Qr,wr:n.wr}}return null}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s},n,r){if(this.zt!==null&&this.zt.tt!==null){t.textBaseline="middle",t.font=this.Jr;for(let o=this.zt.tt.from;o<this.zt.tt.to;o++){const l=this.zt.it[o];l.Kt!==void 0&&(l.Kt.Hi=this.lr.xi(t,l.Kt.th),l.Kt.At=this.j,l.Kt.nt=l.nt-l.Kt.Hi/2),Ea(l,t,e,s)}}}}function Ea(i,t,e,s){t.fillStyle=i.V,i.Kt!==void 0&&function(n,r,o,l,h,a){n.save(),n.scale(h,a),n.fillText(r,o,l),n.restore()}(t,i.Kt.th,i.Kt.nt,i.Kt.st,e,s),function(n,r,o){if(n.Xs!==0){switch(n.ih){case"arrowDown":return void Un(!1,r,o,n.Xs);case"arrowUp":return void Un(!0,r,o,n.Xs);case"circle":return void function(l,h,a){const c=(Be("circle",a)-1)/2;l.beginPath(),l.arc(h.nt,h.st,c*h.Gr,0,2*Math.PI,!1),l.fill()}(r,o,n.Xs);case"square":return void function(l,h,a){const c=Be("square",a),u=(c-1)*h.Gr/2,f=h.nt-u,m=h.st-u;l.fillRect(f,m,c*h.Gr,c*h.Gr)}(r,o,n.Xs)}n.ih}}(i,t,function(n,r,o){const l=Math.max(1,Math.floor(r))%2/2;return{nt:Math.round(n.nt*r)+l,st:n.st*o,Gr:r}}(i,e,s))}function ka(i,t,e){return!(i.Kt===void 0||!function(s,n,r,o,l,h){const a=o/2;return l>=s&&l<=s+r&&h>=n-a&&h<=n+a}(i.Kt.nt,i.Kt.st,i.Kt.Hi,i.Kt.At,t,e))||function(s,n,r){if(s.Xs===0)return!1;switch(s.ih){case"arrowDown":case"arrowUp":return Ca(0,s.nt,s.st,s.Xs,n,r);case"circle":return function(o,l,h,a,c){const u=2+Be("circle",h)/2,f=o-a,m=l-c;return Math.sqrt(f*f+m*m)<=u}(s.nt,s.st,s.Xs,n,r);case"square":return bo(s.nt,s.st,s.Xs,n,r)}}(i,t,e)}function La(i,t,e,s,n,r,o,l,h){const a=At(e)?e:e.xe,c=At(e)?e:e.ge,u=At(e)?e:e.Me,f=At(t.size)?Math.max(t.size,0):1,m=_o(l.he())*f,g=m/2;switch(i.Xs=m,t.position){case"inBar":return i.st=o.Rt(a,h),void(i.Kt!==void 0&&(i.Kt.st=i.st+g+r+.6*n));case"aboveBar":return i.st=o.Rt(c,h)-g-s.nh,i.Kt!==void 0&&(i.Kt.st=i.st-g-.6*n,s.nh+=1.2*n),void(s.nh+=m+r);case"belowBar":return i.st=o.Rt(u,h)+g+s.sh,i.Kt!==void 0&&(i.Kt.st=i.st+g+r+.6*n,s.sh+=1.2*n),void(s.sh+=m+r)}t.position}class Ta{constructor(t,e){this.ft=!0,this.eh=!0,this.rh=!0,this.hh=null,this.ah=null,this.Wt=new $a,this.Wr=t,this.$i=e,this.zt={it:[],tt:null}}bt(t){this.ft=!0,this.rh=!0,t==="data"&&(this.eh=!0,this.ah=null)}gt(t){if(!this.Wr.yt())return null;this.ft&&this.oh();const e=this.$i.W().layout;return this.Wt.ar(e.fontSize,e.fontFamily),this.Wt.J(this.zt),this.Wt}_h(){if(this.rh){if(this.Wr.uh().length>0){const t=this.$i.St().he(),e=jn(t),s=1.5*_o(t)+2*e,n=this.dh();this.hh={above:Fn(s,n.aboveBar,n.inBar),below:Fn(s,n.belowBar,n.inBar)}}else this.hh=null;this.rh=!1}return this.hh}dh(){return this.ah===null&&(this.ah=this.Wr.uh().reduce((t,e)=>(t[e.position]||(t[e.position]=!0),t),{inBar:!1,aboveBar:!1,belowBar:!1})),this.ah}oh(){const t=this.Wr.Dt(),e=this.$i.St(),s=this.Wr.uh();this.eh&&(this.zt.it=s.map(c=>({ot:c.time,nt:0,st:0,Xs:0,ih:c.shape,V:c.color,Qr:c.Qr,wr:c.id,Kt:void 0})),this.eh=!1);const n=this.$i.W().layout;this.zt.tt=null;const r=e.Zs();if(r===null)return;const o=this.Wr.Ct();if(o===null||this.zt.it.length===0)return;let l=NaN;const h=jn(e.he()),a={nh:h,sh:h};this.zt.tt=mo(this.zt.it,r,!0);for(let c=this.zt.tt.from;c<this.zt.tt.to;c++){const u=s[c];u.time!==l&&(a.nh=h,a.sh=h,l=u.time);const f=this.zt.it[c];f.nt=e.It(u.time),u.text!==void 0&&u.text.length>0&&(f.Kt={th:u.text,nt:0,st:0,Hi:0,At:0});const m=this.Wr.fh(u.time);m!==null&&La(f,u,m,a,n.fontSize,h,t,e,o.Vt)}this.ft=!1}}class Pa extends Hs{constructor(t){super(t)}kr(){const t=this.Mr;t.yt=!1;const e=this.Ls.W();if(!e.priceLineVisible||!this.Ls.yt())return;const s=this.Ls.Yr(e.priceLineSource===0);s.Zr||(t.yt=!0,t.st=s.ki,t.V=this.Ls.ph(s.V),t.et=e.priceLineWidth,t.Nt=e.priceLineStyle)}}class za extends Li{constructor(t){super(),this.jt=t}zi(t,e,s){t.yt=!1,e.yt=!1;const n=this.jt;if(!n.yt())return;const r=n.W(),o=r.lastValueVisible,l=n.mh()!=="",h=r.seriesLastValueMode===0,a=n.Yr(!1);if(a.Zr)return;o&&(t.Kt=this.bh(a,o,h),t.yt=t.Kt.length!==0),(l||h)&&(e.Kt=this.wh(a,o,l,h),e.yt=e.Kt.length>0);const c=n.ph(a.V),u=Ei(c);s.t=u.t,s.ki=a.ki,e.Ot=n.$t().Bt(a.ki/n.Dt().At()),t.Ot=c,t.V=u.i,e.V=u.i}wh(t,e,s,n){let r="";const o=this.jt.mh();return s&&o.length!==0&&(r+=`${o} `),e&&n&&(r+=this.jt.Dt().gh()?t.Mh:t.xh),r.trim()}bh(t,e,s){return e?s?this.jt.Dt().gh()?t.xh:t.Mh:t.Kt:""}}function Hn(i,t,e,s){const n=Number.isFinite(t),r=Number.isFinite(e);return n&&r?i(t,e):n||r?n?t:e:s}class pt{constructor(t,e){this.Sh=t,this.kh=e}yh(t){return t!==null&&this.Sh===t.Sh&&this.kh===t.kh}Ch(){return new pt(this.Sh,this.kh)}Th(){return this.Sh}Ph(){return this.kh}Rh(){return this.kh-this.Sh}Ni(){return this.kh===this.Sh||Number.isNaN(this.kh)||Number.isNaN(this.Sh)}ts(t){return t===null?this:new pt(Hn(Math.min,this.Th(),t.Th(),-1/0),Hn(Math.max,this.Ph(),t.Ph(),1/0))}Dh(t){if(!At(t)||this.kh-this.Sh===0)return;const e=.5*(this.kh+this.Sh);let s=this.kh-e,n=this.Sh-e;s*=t,n*=t,this.kh=e+s,this.Sh=e+n}Vh(t){At(t)&&(this.kh+=t,this.Sh+=t)}Oh(){return{minValue:this.Sh,maxValue:this.kh}}static Bh(t){return t===null?null:new pt(t.minValue,t.maxValue)}}class bi{constructor(t,e){this.Ah=t,this.Ih=e||null}zh(){return this.Ah}Lh(){return this.Ih}Oh(){return this.Ah===null?null:{priceRange:this.Ah.Oh(),margins:this.Ih||void 0}}static Bh(t){return t===null?null:new bi(pt.Bh(t.priceRange),t.margins)}}class Da extends Hs{constructor(t,e){super(t),this.Eh=e}kr(){const t=this.Mr;t.yt=!1;const e=this.Eh.W();if(!this.Ls.yt()||!e.lineVisible)return;const s=this.Eh.Nh();s!==null&&(t.yt=!0,t.st=s,t.V=e.color,t.et=e.lineWidth,t.Nt=e.lineStyle,t.wr=this.Eh.W().id)}}class Aa extends Li{constructor(t,e){super(),this.Wr=t,this.Eh=e}zi(t,e,s){t.yt=!1,e.yt=!1;const n=this.Eh.W(),r=n.axisLabelVisible,o=n.title!=="",l=this.Wr;if(!r||!l.yt())return;const h=this.Eh.Nh();if(h===null)return;o&&(e.Kt=n.title,e.yt=!0),e.Ot=l.$t().Bt(h/l.Dt().At()),t.Kt=this.Fh(n.price),t.yt=!0;const a=Ei(n.axisLabelColor||n.color);s.t=a.t;const c=n.axisLabelTextColor||a.i;t.V=c,e.V=c,s.ki=h}Fh(t){const e=this.Wr.Ct();return e===null?"":this.Wr.Dt().Fi(t,e.Vt)}}class Ia{constructor(t,e){this.Wr=t,this.cn=e,this.Wh=new Da(t,this),this._r=new Aa(t,this),this.jh=new vo(this._r,t,t.$t())}Hh(t){Pt(this.cn,t),this.bt(),this.Wr.$t().$h()}W(){return this.cn}Uh(){return this.Wh}qh(){return this.jh}Yh(){return this._r}bt(){this.Wh.bt(),this._r.bt()}Nh(){const t=this.Wr,e=t.Dt();if(t.$t().St().Ni()||e.Ni())return null;const s=t.Ct();return s===null?null:e.Rt(this.cn.price,s.Vt)}}class Oa extends js{constructor(t){super(),this.$i=t}$t(){return this.$i}}const Ra={Bar:(i,t,e,s)=>{var n;const r=t.upColor,o=t.downColor,l=M(i(e,s)),h=ue(l.Vt[0])<=ue(l.Vt[3]);return{ue:(n=l.V)!==null&&n!==void 0?n:h?r:o}},Candlestick:(i,t,e,s)=>{var n,r,o;const l=t.upColor,h=t.downColor,a=t.borderUpColor,c=t.borderDownColor,u=t.wickUpColor,f=t.wickDownColor,m=M(i(e,s)),g=ue(m.Vt[0])<=ue(m.Vt[3]);return{ue:(n=m.V)!==null&&n!==void 0?n:g?l:h,Ee:(r=m.Ot)!==null&&r!==void 0?r:g?a:c,Le:(o=m.Zh)!==null&&o!==void 0?o:g?u:f}},Custom:(i,t,e,s)=>{var n;return{ue:(n=M(i(e,s)).V)!==null&&n!==void 0?n:t.color}},Area:(i,t,e,s)=>{var n,r,o,l;const h=M(i(e,s));return{ue:(n=h.lt)!==null&&n!==void 0?n:t.lineColor,lt:(r=h.lt)!==null&&r!==void 0?r:t.lineColor,Ts:(o=h.Ts)!==null&&o!==void 0?o:t.topColor,Ps:(l=h.Ps)!==null&&l!==void 0?l:t.bottomColor}},Baseline:(i,t,e,s)=>{var n,r,o,l,h,a;const c=M(i(e,s));return{ue:c.Vt[3]>=t.baseValue.price?t.topLineColor:t.bottomLineColor,Pe:(n=c.Pe)!==null&&n!==void 0?n:t.topLineColor,Re:(r=c.Re)!==null&&r!==void 0?r:t.bottomLineColor,Se:(o=c.Se)!==null&&o!==void 0?o:t.topFillColor1,ke:(l=c.ke)!==null&&l!==void 0?l:t.topFillColor2,ye:(h=c.ye)!==null&&h!==void 0?h:t.bottomFillColor1,Ce:(a=c.Ce)!==null&&a!==void 0?a:t.bottomFillColor2}},Line:(i,t,e,s)=>{var n,r;const o=M(i(e,s));return{ue:(n=o.V)!==null&&n!==void 0?n:t.color,lt:(r=o.V)!==null&&r!==void 0?r:t.color}},Histogram:(i,t,e,s)=>{var n;return{ue:(n=M(i(e,s)).V)!==null&&n!==void 0?n:t.color}}};class Va{constructor(t){this.Xh=(e,s)=>s!==void 0?s.Vt:this.Wr.In().Kh(e),this.Wr=t,this.Gh=Ra[t.Jh()]}Hs(t,e){return this.Gh(this.Xh,this.Wr.W(),t,e)}}var Xn;(function(i){i[i.NearestLeft=-1]="NearestLeft",i[i.None=0]="None",i[i.NearestRight=1]="NearestRight"})(Xn||(Xn={}));const Kt=30;class Wa{constructor(){this.Qh=[],this.tl=new Map,this.il=new Map}nl(){return this.Xs()>0?this.Qh[this.Qh.length-1]:null}sl(){return this.Xs()>0?this.el(0):null}An(){return this.Xs()>0?this.el(this.Qh.length-1):null}Xs(){return this.Qh.length}Ni(){return this.Xs()===0}Xr(t){return this.rl(t,0)!==null}Kh(t){return this.hl(t)}hl(t,e=0){const s=this.rl(t,e);return s===null?null:Object.assign(Object.assign({},this.ll(s)),{se:this.el(s)})}ie(){return this.Qh}al(t,e,s){if(this.Ni())return null;let n=null;for(const r of s)n=Ge(n,this.ol(t,e,r));return n}J(t){this.il.clear(),this.tl.clear(),this.Qh=t}el(t){return this.Qh[t].se}ll(t){return this.Qh[t]}rl(t,e){const s=this._l(t);if(s===null&&e!==0)switch(e){case-1:return this.ul(t);case 1:return this.cl(t);default:throw new TypeError("Unknown search mode")}return s}ul(t){let e=this.dl(t);return e>0&&(e-=1),e!==this.Qh.length&&this.el(e)<t?e:null}cl(t){const e=this.fl(t);return e!==this.Qh.length&&t<this.el(e)?e:null}_l(t){const e=this.dl(t);return e===this.Qh.length||t<this.Qh[e].se?null:e}dl(t){return Ue(this.Qh,t,(e,s)=>e.se<s)}fl(t){return go(this.Qh,t,(e,s)=>e.se>s)}vl(t,e,s){let n=null;for(let r=t;r<e;r++){const o=this.Qh[r].Vt[s];Number.isNaN(o)||(n===null?n={pl:o,ml:o}:(o<n.pl&&(n.pl=o),o>n.ml&&(n.ml=o)))}return n}ol(t,e,s){if(this.Ni())return null;let n=null;const r=M(this.sl()),o=M(this.An()),l=Math.max(t,r),h=Math.min(e,o),a=Math.ceil(l/Kt)*Kt,c=Math.max(a,Math.floor(h/Kt)*Kt);{const f=this.dl(l),m=this.fl(Math.min(h,a,e));n=Ge(n,this.vl(f,m,s))}let u=this.tl.get(s);u===void 0&&(u=new Map,this.tl.set(s,u));for(let f=Math.max(a+1,l);f<c;f+=Kt){const m=Math.floor(f/Kt);let g=u.get(m);if(g===void 0){const p=this.dl(m*Kt),_=this.fl((m+1)*Kt-1);g=this.vl(p,_,s),u.set(m,g)}n=Ge(n,g)}{const f=this.dl(c),m=this.fl(h);n=Ge(n,this.vl(f,m,s))}return n}}function Ge(i,t){return i===null?t:t===null?i:{pl:Math.min(i.pl,t.pl),ml:Math.max(i.ml,t.ml)}}class Ba{constructor(t){this.bl=t}X(t,e,s){this.bl.draw(t)}wl(t,e,s){var n,r;(r=(n=this.bl).drawBackground)===null||r===void 0||r.call(n,t)}}class Hi{constructor(t){this.Qe=null,this.wn=t}gt(){var t;const e=this.wn.renderer();if(e===null)return null;if(((t=this.Qe)===null||t===void 0?void 0:t.gl)===e)return this.Qe.Ml;const s=new Ba(e);return this.Qe={gl:e,Ml:s},s}xl(){var t,e,s;return(s=(e=(t=this.wn).zOrder)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:"normal"}}function wo(i){var t,e,s,n,r;return{Kt:i.text(),ki:i.coordinate(),Si:(t=i.fixedCoordinate)===null||t===void 0?void 0:t.call(i),V:i.textColor(),t:i.backColor(),yt:(s=(e=i.visible)===null||e===void 0?void 0:e.call(i))===null||s===void 0||s,hi:(r=(n=i.tickVisible)===null||n===void 0?void 0:n.call(i))===null||r===void 0||r}}class Na{constructor(t,e){this.Wt=new ro,this.Sl=t,this.kl=e}gt(){return this.Wt.J(Object.assign({Hi:this.kl.Hi()},wo(this.Sl))),this.Wt}}class ja extends Li{constructor(t,e){super(),this.Sl=t,this.Li=e}zi(t,e,s){const n=wo(this.Sl);s.t=n.t,t.V=n.V;const r=2/12*this.Li.P();s.wi=r,s.gi=r,s.ki=n.ki,s.Si=n.Si,t.Kt=n.Kt,t.yt=n.yt,t.hi=n.hi}}class Fa{constructor(t,e){this.yl=null,this.Cl=null,this.Tl=null,this.Pl=null,this.Rl=null,this.Dl=t,this.Wr=e}Vl(){return this.Dl}Vn(){var t,e;(e=(t=this.Dl).updateAllViews)===null||e===void 0||e.call(t)}Pn(){var t,e,s,n;const r=(s=(e=(t=this.Dl).paneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.yl)===null||n===void 0?void 0:n.gl)===r)return this.yl.Ml;const o=r.map(l=>new Hi(l));return this.yl={gl:r,Ml:o},o}Qi(){var t,e,s,n;const r=(s=(e=(t=this.Dl).timeAxisViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Cl)===null||n===void 0?void 0:n.gl)===r)return this.Cl.Ml;const o=this.Wr.$t().St(),l=r.map(h=>new Na(h,o));return this.Cl={gl:r,Ml:l},l}Rn(){var t,e,s,n;const r=(s=(e=(t=this.Dl).priceAxisViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Tl)===null||n===void 0?void 0:n.gl)===r)return this.Tl.Ml;const o=this.Wr.Dt(),l=r.map(h=>new ja(h,o));return this.Tl={gl:r,Ml:l},l}Ol(){var t,e,s,n;const r=(s=(e=(t=this.Dl).priceAxisPaneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Pl)===null||n===void 0?void 0:n.gl)===r)return this.Pl.Ml;const o=r.map(l=>new Hi(l));return this.Pl={gl:r,Ml:o},o}Bl(){var t,e,s,n;const r=(s=(e=(t=this.Dl).timeAxisPaneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Rl)===null||n===void 0?void 0:n.gl)===r)return this.Rl.Ml;const o=r.map(l=>new Hi(l));return this.Rl={gl:r,Ml:o},o}Al(t,e){var s,n,r;return(r=(n=(s=this.Dl).autoscaleInfo)===null||n===void 0?void 0:n.call(s,t,e))!==null&&r!==void 0?r:null}br(t,e){var s,n,r;return(r=(n=(s=this.Dl).hitTest)===null||n===void 0?void 0:n.call(s,t,e))!==null&&r!==void 0?r:null}}function Xi(i,t,e,s){i.forEach(n=>{t(n).forEach(r=>{r.xl()===e&&s.push(r)})})}function Ki(i){return i.Pn()}function Ua(i){return i.Ol()}function Ha(i){return i.Bl()}class Xs extends Oa{constructor(t,e,s,n,r){super(t),this.zt=new Wa,this.Wh=new Pa(this),this.Il=[],this.zl=new ya(this),this.Ll=null,this.El=null,this.Nl=[],this.Fl=[],this.Wl=null,this.jl=[],this.cn=e,this.Hl=s;const o=new za(this);this.rn=[o],this.jh=new vo(o,this,t),s!=="Area"&&s!=="Line"&&s!=="Baseline"||(this.Ll=new Ma(this)),this.$l(),this.Ul(r)}S(){this.Wl!==null&&clearTimeout(this.Wl)}ph(t){return this.cn.priceLineColor||t}Yr(t){const e={Zr:!0},s=this.Dt();if(this.$t().St().Ni()||s.Ni()||this.zt.Ni())return e;const n=this.$t().St().Zs(),r=this.Ct();if(n===null||r===null)return e;let o,l;if(t){const u=this.zt.nl();if(u===null)return e;o=u,l=u.se}else{const u=this.zt.hl(n.ui(),-1);if(u===null||(o=this.zt.Kh(u.se),o===null))return e;l=u.se}const h=o.Vt[3],a=this.$s().Hs(l,{Vt:o}),c=s.Rt(h,r.Vt);return{Zr:!1,_t:h,Kt:s.Fi(h,r.Vt),Mh:s.ql(h),xh:s.Yl(h,r.Vt),V:a.ue,ki:c,se:l}}$s(){return this.El!==null||(this.El=new Va(this)),this.El}W(){return this.cn}Hh(t){const e=t.priceScaleId;e!==void 0&&e!==this.cn.priceScaleId&&this.$t().Zl(this,e),Pt(this.cn,t),t.priceFormat!==void 0&&(this.$l(),this.$t().Xl()),this.$t().Kl(this),this.$t().Gl(),this.wn.bt("options")}J(t,e){this.zt.J(t),this.Jl(),this.wn.bt("data"),this.dn.bt("data"),this.Ll!==null&&(e&&e.Ql?this.Ll.Hr():t.length===0&&this.Ll.jr());const s=this.$t().cr(this);this.$t().ta(s),this.$t().Kl(this),this.$t().Gl(),this.$t().$h()}ia(t){this.Nl=t,this.Jl();const e=this.$t().cr(this);this.dn.bt("data"),this.$t().ta(e),this.$t().Kl(this),this.$t().Gl(),this.$t().$h()}na(){return this.Nl}uh(){return this.Fl}sa(t){const e=new Ia(this,t);return this.Il.push(e),this.$t().Kl(this),e}ea(t){const e=this.Il.indexOf(t);e!==-1&&this.Il.splice(e,1),this.$t().Kl(this)}Jh(){return this.Hl}Ct(){const t=this.ra();return t===null?null:{Vt:t.Vt[3],ha:t.ot}}ra(){const t=this.$t().St().Zs();if(t===null)return null;const e=t.Vs();return this.zt.hl(e,1)}In(){return this.zt}fh(t){const e=this.zt.Kh(t);return e===null?null:this.Hl==="Bar"||this.Hl==="Candlestick"||this.Hl==="Custom"?{we:e.Vt[0],ge:e.Vt[1],Me:e.Vt[2],xe:e.Vt[3]}:e.Vt[3]}la(t){const e=[];Xi(this.jl,Ki,"top",e);const s=this.Ll;return s!==null&&s.yt()&&(this.Wl===null&&s.Ur()&&(this.Wl=setTimeout(()=>{this.Wl=null,this.$t().aa()},0)),s.$r(),e.unshift(s)),e}Pn(){const t=[];this.oa()||t.push(this.zl),t.push(this.wn,this.Wh,this.dn);const e=this.Il.map(s=>s.Uh());return t.push(...e),Xi(this.jl,Ki,"normal",t),t}_a(){return this.ua(Ki,"bottom")}ca(t){return this.ua(Ua,t)}da(t){return this.ua(Ha,t)}fa(t,e){return this.jl.map(s=>s.br(t,e)).filter(s=>s!==null)}Ji(t){return[this.jh,...this.Il.map(e=>e.qh())]}Rn(t,e){if(e!==this.Yi&&!this.oa())return[];const s=[...this.rn];for(const n of this.Il)s.push(n.Yh());return this.jl.forEach(n=>{s.push(...n.Rn())}),s}Qi(){const t=[];return this.jl.forEach(e=>{t.push(...e.Qi())}),t}Al(t,e){if(this.cn.autoscaleInfoProvider!==void 0){const s=this.cn.autoscaleInfoProvider(()=>{const n=this.va(t,e);return n===null?null:n.Oh()});return bi.Bh(s)}return this.va(t,e)}pa(){return this.cn.priceFormat.minMove}ma(){return this.ba}Vn(){var t;this.wn.bt(),this.dn.bt();for(const e of this.rn)e.bt();for(const e of this.Il)e.bt();this.Wh.bt(),this.zl.bt(),(t=this.Ll)===null||t===void 0||t.bt(),this.jl.forEach(e=>e.Vn())}Dt(){return M(super.Dt())}kt(t){if(!((this.Hl==="Line"||this.Hl==="Area"||this.Hl==="Baseline")&&this.cn.crosshairMarkerVisible))return null;const e=this.zt.Kh(t);return e===null?null:{_t:e.Vt[3],ht:this.wa(),Ot:this.ga(),Pt:this.Ma(),Tt:this.xa(t)}}mh(){return this.cn.title}yt(){return this.cn.visible}Sa(t){this.jl.push(new Fa(t,this))}ka(t){this.jl=this.jl.filter(e=>e.Vl()!==t)}ya(){if(this.wn instanceof Ui)return t=>this.wn.Fe(t)}Ca(){if(this.wn instanceof Ui)return t=>this.wn.We(t)}oa(){return!Ti(this.Dt().Ta())}va(t,e){if(!Re(t)||!Re(e)||this.zt.Ni())return null;const s=this.Hl==="Line"||this.Hl==="Area"||this.Hl==="Baseline"||this.Hl==="Histogram"?[3]:[2,1],n=this.zt.al(t,e,s);let r=n!==null?new pt(n.pl,n.ml):null;if(this.Jh()==="Histogram"){const l=this.cn.base,h=new pt(l,l);r=r!==null?r.ts(h):h}let o=this.dn._h();return this.jl.forEach(l=>{const h=l.Al(t,e);if(h?.priceRange){const m=new pt(h.priceRange.minValue,h.priceRange.maxValue);r=r!==null?r.ts(m):m}var a,c,u,f;h?.margins&&(a=o,c=h.margins,o={above:Math.max((u=a?.above)!==null&&u!==void 0?u:0,c.above),below:Math.max((f=a?.below)!==null&&f!==void 0?f:0,c.below)})}),new bi(r,o)}wa(){switch(this.Hl){case"Line":case"Area":case"Baseline":return this.cn.crosshairMarkerRadius}return 0}ga(){switch(this.Hl){case"Line":case"Area":case"Baseline":{const t=this.cn.crosshairMarkerBorderColor;if(t.length!==0)return t}}return null}Ma(){switch(this.Hl){case"Line":case"Area":case"Baseline":return this.cn.crosshairMarkerBorderWidth}return 0}xa(t){switch(this.Hl){case"Line":case"Area":case"Baseline":{const e=this.cn.crosshairMarkerBackgroundColor;if(e.length!==0)return e}}return this.$s().Hs(t).ue}$l(){switch(this.cn.priceFormat.type){case"custom":this.ba={format:this.cn.priceFormat.formatter};break;case"volume":this.ba=new Jh(this.cn.priceFormat.precision);break;case"percent":this.ba=new oo(this.cn.priceFormat.precision);break;default:{const t=Math.pow(10,this.cn.priceFormat.precision);this.ba=new Pi(t,this.cn.priceFormat.minMove*t)}}this.Yi!==null&&this.Yi.Pa()}Jl(){const t=this.$t().St();if(!t.Ra()||this.zt.Ni())return void(this.Fl=[]);const e=M(this.zt.sl());this.Fl=this.Nl.map((s,n)=>{const r=M(t.Da(s.time,!0)),o=r<e?1:-1;return{time:M(this.zt.hl(r,o)).se,position:s.position,shape:s.shape,color:s.color,id:s.id,Qr:n,text:s.text,size:s.size,originalTime:s.originalTime}})}Ul(t){switch(this.dn=new Ta(this,this.$t()),this.Hl){case"Bar":this.wn=new la(this,this.$t());break;case"Candlestick":this.wn=new da(this,this.$t());break;case"Line":this.wn=new va(this,this.$t());break;case"Custom":this.wn=new Ui(this,this.$t(),mt(t));break;case"Area":this.wn=new ra(this,this.$t());break;case"Baseline":this.wn=new ca(this,this.$t());break;case"Histogram":this.wn=new pa(this,this.$t());break;default:throw Error("Unknown chart style assigned: "+this.Hl)}}ua(t,e){const s=[];return Xi(this.jl,t,e,s),s}}class Xa{constructor(t){this.cn=t}Va(t,e,s){let n=t;if(this.cn.mode===0)return n;const r=s.vn(),o=r.Ct();if(o===null)return n;const l=r.Rt(t,o),h=s.Oa().filter(c=>c instanceof Xs).reduce((c,u)=>{if(s.dr(u)||!u.yt())return c;const f=u.Dt(),m=u.In();if(f.Ni()||!m.Xr(e))return c;const g=m.Kh(e);if(g===null)return c;const p=ue(u.Ct());return c.concat([f.Rt(g.Vt[3],p.Vt)])},[]);if(h.length===0)return n;h.sort((c,u)=>Math.abs(c-l)-Math.abs(u-l));const a=h[0];return n=r.pn(a,o),n}}class Ka extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null)return;const r=Math.max(1,Math.floor(s));t.lineWidth=r,function(o,l){o.save(),o.lineWidth%2&&o.translate(.5,.5),l(),o.restore()}(t,()=>{const o=M(this.zt);if(o.Ba){t.strokeStyle=o.Aa,se(t,o.Ia),t.beginPath();for(const l of o.za){const h=Math.round(l.La*s);t.moveTo(h,-r),t.lineTo(h,e.height+r)}t.stroke()}if(o.Ea){t.strokeStyle=o.Na,se(t,o.Fa),t.beginPath();for(const l of o.Wa){const h=Math.round(l.La*n);t.moveTo(-r,h),t.lineTo(e.width+r,h)}t.stroke()}})}}class qa{constructor(t){this.Wt=new Ka,this.ft=!0,this.tn=t}bt(){this.ft=!0}gt(){if(this.ft){const t=this.tn.$t().W().grid,e={Ea:t.horzLines.visible,Ba:t.vertLines.visible,Na:t.horzLines.color,Aa:t.vertLines.color,Fa:t.horzLines.style,Ia:t.vertLines.style,Wa:this.tn.vn().ja(),za:(this.tn.$t().St().ja()||[]).map(s=>({La:s.coord}))};this.Wt.J(e),this.ft=!1}return this.Wt}}class Ga{constructor(t){this.wn=new qa(t)}Uh(){return this.wn}}const qi={Ha:4,$a:1e-4};function de(i,t){const e=100*(i-t)/t;return t<0?-e:e}function Ya(i,t){const e=de(i.Th(),t),s=de(i.Ph(),t);return new pt(e,s)}function Le(i,t){const e=100*(i-t)/t+100;return t<0?-e:e}function Za(i,t){const e=Le(i.Th(),t),s=Le(i.Ph(),t);return new pt(e,s)}function wi(i,t){const e=Math.abs(i);if(e<1e-15)return 0;const s=Math.log10(e+t.$a)+t.Ha;return i<0?-s:s}function Te(i,t){const e=Math.abs(i);if(e<1e-15)return 0;const s=Math.pow(10,e-t.Ha)-t.$a;return i<0?-s:s}function Ce(i,t){if(i===null)return null;const e=wi(i.Th(),t),s=wi(i.Ph(),t);return new pt(e,s)}function Ye(i,t){if(i===null)return null;const e=Te(i.Th(),t),s=Te(i.Ph(),t);return new pt(e,s)}function Gi(i){if(i===null)return qi;const t=Math.abs(i.Ph()-i.Th());if(t>=1||t<1e-15)return qi;const e=Math.ceil(Math.abs(Math.log10(t))),s=qi.Ha+e;return{Ha:s,$a:1/Math.pow(10,s)}}class Yi{constructor(t,e){if(this.Ua=t,this.qa=e,function(s){if(s<0)return!1;for(let n=s;n>1;n/=10)if(n%10!=0)return!1;return!0}(this.Ua))this.Ya=[2,2.5,2];else{this.Ya=[];for(let s=this.Ua;s!==1;){if(s%2==0)this.Ya.push(2),s/=2;else{if(s%5!=0)throw new Error("unexpected base");this.Ya.push(2,2.5),s/=5}if(this.Ya.length>100)throw new Error("something wrong with base")}}}Za(t,e,s){const n=this.Ua===0?0:1/this.Ua;let r=Math.pow(10,Math.max(0,Math.ceil(Math.log10(t-e)))),o=0,l=this.qa[0];for(;;){const u=qe(r,n,1e-14)&&r>n+1e-14,f=qe(r,s*l,1e-14),m=qe(r,1,1e-14);if(!(u&&f&&m))break;r/=l,l=this.qa[++o%this.qa.length]}if(r<=n+1e-14&&(r=n),r=Math.max(1,r),this.Ya.length>0&&(h=r,a=1,c=1e-14,Math.abs(h-a)<c))for(o=0,l=this.Ya[0];qe(r,s*l,1e-14)&&r>n+1e-14;)r/=l,l=this.Ya[++o%this.Ya.length];var h,a,c;return r}}class Kn{constructor(t,e,s,n){this.Xa=[],this.Li=t,this.Ua=e,this.Ka=s,this.Ga=n}Za(t,e){if(t<e)throw new Error("high < low");const s=this.Li.At(),n=(t-e)*this.Ja()/s,r=new Yi(this.Ua,[2,2.5,2]),o=new Yi(this.Ua,[2,2,2.5]),l=new Yi(this.Ua,[2.5,2,2]),h=[];return h.push(r.Za(t,e,n),o.Za(t,e,n),l.Za(t,e,n)),function(a){if(a.length<1)throw Error("array is empty");let c=a[0];for(let u=1;u<a.length;++u)a[u]<c&&(c=a[u]);return c}(h)}Qa(){const t=this.Li,e=t.Ct();if(e===null)return void(this.Xa=[]);const s=t.At(),n=this.Ka(s-1,e),r=this.Ka(0,e),o=this.Li.W().entireTextOnly?this.io()/2:0,l=o,h=s-1-o,a=Math.max(n,r),c=Math.min(n,r);if(a===c)return void(this.Xa=[]);let u=this.Za(a,c),f=a%u;f+=f<0?u:0;const m=a>=c?1:-1;let g=null,p=0;for(let _=a-f;_>c;_-=u){const w=this.Ga(_,e,!0);g!==null&&Math.abs(w-g)<this.Ja()||w<l||w>h||(p<this.Xa.length?(this.Xa[p].La=w,this.Xa[p].no=t.so(_)):this.Xa.push({La:w,no:t.so(_)}),p++,g=w,t.eo()&&(u=this.Za(_*m,c)))}this.Xa.length=p}ja(){return this.Xa}io(){return this.Li.P()}Ja(){return Math.ceil(2.5*this.io())}}function yo(i){return i.slice().sort((t,e)=>M(t.Xi())-M(e.Xi()))}var qn;(function(i){i[i.Normal=0]="Normal",i[i.Logarithmic=1]="Logarithmic",i[i.Percentage=2]="Percentage",i[i.IndexedTo100=3]="IndexedTo100"})(qn||(qn={}));const Gn=new oo,Yn=new Pi(100,1);class Ja{constructor(t,e,s,n){this.ro=0,this.ho=null,this.Ah=null,this.lo=null,this.ao={oo:!1,_o:null},this.uo=0,this.co=0,this.do=new st,this.fo=new st,this.vo=[],this.po=null,this.mo=null,this.bo=null,this.wo=null,this.ba=Yn,this.Mo=Gi(null),this.xo=t,this.cn=e,this.So=s,this.ko=n,this.yo=new Kn(this,100,this.Co.bind(this),this.To.bind(this))}Ta(){return this.xo}W(){return this.cn}Hh(t){if(Pt(this.cn,t),this.Pa(),t.mode!==void 0&&this.Po({yr:t.mode}),t.scaleMargins!==void 0){const e=mt(t.scaleMargins.top),s=mt(t.scaleMargins.bottom);if(e<0||e>1)throw new Error(`Invalid top margin - expect value between 0 and 1, given=${e}`);if(s<0||s>1)throw new Error(`Invalid bottom margin - expect value between 0 and 1, given=${s}`);if(e+s>1)throw new Error(`Invalid margins - sum of margins must be less than 1, given=${e+s}`);this.Ro(),this.mo=null}}Do(){return this.cn.autoScale}eo(){return this.cn.mode===1}gh(){return this.cn.mode===2}Vo(){return this.cn.mode===3}yr(){return{Wn:this.cn.autoScale,Oo:this.cn.invertScale,yr:this.cn.mode}}Po(t){const e=this.yr();let s=null;t.Wn!==void 0&&(this.cn.autoScale=t.Wn),t.yr!==void 0&&(this.cn.mode=t.yr,t.yr!==2&&t.yr!==3||(this.cn.autoScale=!0),this.ao.oo=!1),e.yr===1&&t.yr!==e.yr&&(function(r,o){if(r===null)return!1;const l=Te(r.Th(),o),h=Te(r.Ph(),o);return isFinite(l)&&isFinite(h)}(this.Ah,this.Mo)?(s=Ye(this.Ah,this.Mo),s!==null&&this.Bo(s)):this.cn.autoScale=!0),t.yr===1&&t.yr!==e.yr&&(s=Ce(this.Ah,this.Mo),s!==null&&this.Bo(s));const n=e.yr!==this.cn.mode;n&&(e.yr===2||this.gh())&&this.Pa(),n&&(e.yr===3||this.Vo())&&this.Pa(),t.Oo!==void 0&&e.Oo!==t.Oo&&(this.cn.invertScale=t.Oo,this.Ao()),this.fo.m(e,this.yr())}Io(){return this.fo}P(){return this.So.fontSize}At(){return this.ro}zo(t){this.ro!==t&&(this.ro=t,this.Ro(),this.mo=null)}Lo(){if(this.ho)return this.ho;const t=this.At()-this.Eo()-this.No();return this.ho=t,t}zh(){return this.Fo(),this.Ah}Bo(t,e){const s=this.Ah;(e||s===null&&t!==null||s!==null&&!s.yh(t))&&(this.mo=null,this.Ah=t)}Ni(){return this.Fo(),this.ro===0||!this.Ah||this.Ah.Ni()}Wo(t){return this.Oo()?t:this.At()-1-t}Rt(t,e){return this.gh()?t=de(t,e):this.Vo()&&(t=Le(t,e)),this.To(t,e)}Qs(t,e,s){this.Fo();const n=this.No(),r=M(this.zh()),o=r.Th(),l=r.Ph(),h=this.Lo()-1,a=this.Oo(),c=h/(l-o),u=s===void 0?0:s.from,f=s===void 0?t.length:s.to,m=this.jo();for(let g=u;g<f;g++){const p=t[g],_=p._t;if(isNaN(_))continue;let w=_;m!==null&&(w=m(p._t,e));const x=n+c*(w-o),$=a?x:this.ro-1-x;p.st=$}}me(t,e,s){this.Fo();const n=this.No(),r=M(this.zh()),o=r.Th(),l=r.Ph(),h=this.Lo()-1,a=this.Oo(),c=h/(l-o),u=s===void 0?0:s.from,f=s===void 0?t.length:s.to,m=this.jo();for(let g=u;g<f;g++){const p=t[g];let _=p.we,w=p.ge,x=p.Me,$=p.xe;m!==null&&(_=m(p.we,e),w=m(p.ge,e),x=m(p.Me,e),$=m(p.xe,e));let E=n+c*(_-o),L=a?E:this.ro-1-E;p.ve=L,E=n+c*(w-o),L=a?E:this.ro-1-E,p.ce=L,E=n+c*(x-o),L=a?E:this.ro-1-E,p.de=L,E=n+c*($-o),L=a?E:this.ro-1-E,p.pe=L}}pn(t,e){const s=this.Co(t,e);return this.Ho(s,e)}Ho(t,e){let s=t;return this.gh()?s=function(n,r){return r<0&&(n=-n),n/100*r+r}(s,e):this.Vo()&&(s=function(n,r){return n-=100,r<0&&(n=-n),n/100*r+r}(s,e)),s}Oa(){return this.vo}$o(){if(this.po)return this.po;let t=[];for(let e=0;e<this.vo.length;e++){const s=this.vo[e];s.Xi()===null&&s.Ki(e+1),t.push(s)}return t=yo(t),this.po=t,this.po}Uo(t){this.vo.indexOf(t)===-1&&(this.vo.push(t),this.Pa(),this.qo())}Yo(t){const e=this.vo.indexOf(t);if(e===-1)throw new Error("source is not attached to scale");this.vo.splice(e,1),this.vo.length===0&&(this.Po({Wn:!0}),this.Bo(null)),this.Pa(),this.qo()}Ct(){let t=null;for(const e of this.vo){const s=e.Ct();s!==null&&(t===null||s.ha<t.ha)&&(t=s)}return t===null?null:t.Vt}Oo(){return this.cn.invertScale}ja(){const t=this.Ct()===null;if(this.mo!==null&&(t||this.mo.Zo===t))return this.mo.ja;this.yo.Qa();const e=this.yo.ja();return this.mo={ja:e,Zo:t},this.do.m(),e}Xo(){return this.do}Ko(t){this.gh()||this.Vo()||this.bo===null&&this.lo===null&&(this.Ni()||(this.bo=this.ro-t,this.lo=M(this.zh()).Ch()))}Go(t){if(this.gh()||this.Vo()||this.bo===null)return;this.Po({Wn:!1}),(t=this.ro-t)<0&&(t=0);let e=(this.bo+.2*(this.ro-1))/(t+.2*(this.ro-1));const s=M(this.lo).Ch();e=Math.max(e,.1),s.Dh(e),this.Bo(s)}Jo(){this.gh()||this.Vo()||(this.bo=null,this.lo=null)}Qo(t){this.Do()||this.wo===null&&this.lo===null&&(this.Ni()||(this.wo=t,this.lo=M(this.zh()).Ch()))}t_(t){if(this.Do()||this.wo===null)return;const e=M(this.zh()).Rh()/(this.Lo()-1);let s=t-this.wo;this.Oo()&&(s*=-1);const n=s*e,r=M(this.lo).Ch();r.Vh(n),this.Bo(r,!0),this.mo=null}i_(){this.Do()||this.wo!==null&&(this.wo=null,this.lo=null)}ma(){return this.ba||this.Pa(),this.ba}Fi(t,e){switch(this.cn.mode){case 2:return this.n_(de(t,e));case 3:return this.ma().format(Le(t,e));default:return this.Fh(t)}}so(t){switch(this.cn.mode){case 2:return this.n_(t);case 3:return this.ma().format(t);default:return this.Fh(t)}}ql(t){return this.Fh(t,M(this.s_()).ma())}Yl(t,e){return t=de(t,e),this.n_(t,Gn)}e_(){return this.vo}r_(t){this.ao={_o:t,oo:!1}}Vn(){this.vo.forEach(t=>t.Vn())}Pa(){this.mo=null;const t=this.s_();let e=100;t!==null&&(e=Math.round(1/t.pa())),this.ba=Yn,this.gh()?(this.ba=Gn,e=100):this.Vo()?(this.ba=new Pi(100,1),e=100):t!==null&&(this.ba=t.ma()),this.yo=new Kn(this,e,this.Co.bind(this),this.To.bind(this)),this.yo.Qa()}qo(){this.po=null}s_(){return this.vo[0]||null}Eo(){return this.Oo()?this.cn.scaleMargins.bottom*this.At()+this.co:this.cn.scaleMargins.top*this.At()+this.uo}No(){return this.Oo()?this.cn.scaleMargins.top*this.At()+this.uo:this.cn.scaleMargins.bottom*this.At()+this.co}Fo(){this.ao.oo||(this.ao.oo=!0,this.h_())}Ro(){this.ho=null}To(t,e){if(this.Fo(),this.Ni())return 0;t=this.eo()&&t?wi(t,this.Mo):t;const s=M(this.zh()),n=this.No()+(this.Lo()-1)*(t-s.Th())/s.Rh();return this.Wo(n)}Co(t,e){if(this.Fo(),this.Ni())return 0;const s=this.Wo(t),n=M(this.zh()),r=n.Th()+n.Rh()*((s-this.No())/(this.Lo()-1));return this.eo()?Te(r,this.Mo):r}Ao(){this.mo=null,this.yo.Qa()}h_(){const t=this.ao._o;if(t===null)return;let e=null;const s=this.e_();let n=0,r=0;for(const h of s){if(!h.yt())continue;const a=h.Ct();if(a===null)continue;const c=h.Al(t.Vs(),t.ui());let u=c&&c.zh();if(u!==null){switch(this.cn.mode){case 1:u=Ce(u,this.Mo);break;case 2:u=Ya(u,a.Vt);break;case 3:u=Za(u,a.Vt)}if(e=e===null?u:e.ts(M(u)),c!==null){const f=c.Lh();f!==null&&(n=Math.max(n,f.above),r=Math.max(r,f.below))}}}if(n===this.uo&&r===this.co||(this.uo=n,this.co=r,this.mo=null,this.Ro()),e!==null){if(e.Th()===e.Ph()){const h=this.s_(),a=5*(h===null||this.gh()||this.Vo()?1:h.pa());this.eo()&&(e=Ye(e,this.Mo)),e=new pt(e.Th()-a,e.Ph()+a),this.eo()&&(e=Ce(e,this.Mo))}if(this.eo()){const h=Ye(e,this.Mo),a=Gi(h);if(o=a,l=this.Mo,o.Ha!==l.Ha||o.$a!==l.$a){const c=this.lo!==null?Ye(this.lo,this.Mo):null;this.Mo=a,e=Ce(h,a),c!==null&&(this.lo=Ce(c,a))}}this.Bo(e)}else this.Ah===null&&(this.Bo(new pt(-.5,.5)),this.Mo=Gi(null));var o,l;this.ao.oo=!0}jo(){return this.gh()?de:this.Vo()?Le:this.eo()?t=>wi(t,this.Mo):null}l_(t,e,s){return e===void 0?(s===void 0&&(s=this.ma()),s.format(t)):e(t)}Fh(t,e){return this.l_(t,this.ko.priceFormatter,e)}n_(t,e){return this.l_(t,this.ko.percentageFormatter,e)}}class Qa{constructor(t,e){this.vo=[],this.a_=new Map,this.ro=0,this.o_=0,this.__=1e3,this.po=null,this.u_=new st,this.kl=t,this.$i=e,this.c_=new Ga(this);const s=e.W();this.d_=this.f_("left",s.leftPriceScale),this.v_=this.f_("right",s.rightPriceScale),this.d_.Io().l(this.p_.bind(this,this.d_),this),this.v_.Io().l(this.p_.bind(this,this.v_),this),this.m_(s)}m_(t){if(t.leftPriceScale&&this.d_.Hh(t.leftPriceScale),t.rightPriceScale&&this.v_.Hh(t.rightPriceScale),t.localization&&(this.d_.Pa(),this.v_.Pa()),t.overlayPriceScales){const e=Array.from(this.a_.values());for(const s of e){const n=M(s[0].Dt());n.Hh(t.overlayPriceScales),t.localization&&n.Pa()}}}b_(t){switch(t){case"left":return this.d_;case"right":return this.v_}return this.a_.has(t)?mt(this.a_.get(t))[0].Dt():null}S(){this.$t().w_().p(this),this.d_.Io().p(this),this.v_.Io().p(this),this.vo.forEach(t=>{t.S&&t.S()}),this.u_.m()}g_(){return this.__}M_(t){this.__=t}$t(){return this.$i}Hi(){return this.o_}At(){return this.ro}x_(t){this.o_=t,this.S_()}zo(t){this.ro=t,this.d_.zo(t),this.v_.zo(t),this.vo.forEach(e=>{if(this.dr(e)){const s=e.Dt();s!==null&&s.zo(t)}}),this.S_()}Oa(){return this.vo}dr(t){const e=t.Dt();return e===null||this.d_!==e&&this.v_!==e}Uo(t,e,s){const n=s!==void 0?s:this.y_().k_+1;this.C_(t,e,n)}Yo(t){const e=this.vo.indexOf(t);qt(e!==-1,"removeDataSource: invalid data source"),this.vo.splice(e,1);const s=M(t.Dt()).Ta();if(this.a_.has(s)){const r=mt(this.a_.get(s)),o=r.indexOf(t);o!==-1&&(r.splice(o,1),r.length===0&&this.a_.delete(s))}const n=t.Dt();n&&n.Oa().indexOf(t)>=0&&n.Yo(t),n!==null&&(n.qo(),this.T_(n)),this.po=null}pr(t){return t===this.d_?"left":t===this.v_?"right":"overlay"}P_(){return this.d_}R_(){return this.v_}D_(t,e){t.Ko(e)}V_(t,e){t.Go(e),this.S_()}O_(t){t.Jo()}B_(t,e){t.Qo(e)}A_(t,e){t.t_(e),this.S_()}I_(t){t.i_()}S_(){this.vo.forEach(t=>{t.Vn()})}vn(){let t=null;return this.$i.W().rightPriceScale.visible&&this.v_.Oa().length!==0?t=this.v_:this.$i.W().leftPriceScale.visible&&this.d_.Oa().length!==0?t=this.d_:this.vo.length!==0&&(t=this.vo[0].Dt()),t===null&&(t=this.v_),t}vr(){let t=null;return this.$i.W().rightPriceScale.visible?t=this.v_:this.$i.W().leftPriceScale.visible&&(t=this.d_),t}T_(t){t!==null&&t.Do()&&this.z_(t)}L_(t){const e=this.kl.Zs();t.Po({Wn:!0}),e!==null&&t.r_(e),this.S_()}E_(){this.z_(this.d_),this.z_(this.v_)}N_(){this.T_(this.d_),this.T_(this.v_),this.vo.forEach(t=>{this.dr(t)&&this.T_(t.Dt())}),this.S_(),this.$i.$h()}$o(){return this.po===null&&(this.po=yo(this.vo)),this.po}F_(){return this.u_}W_(){return this.c_}z_(t){const e=t.e_();if(e&&e.length>0&&!this.kl.Ni()){const s=this.kl.Zs();s!==null&&t.r_(s)}t.Vn()}y_(){const t=this.$o();if(t.length===0)return{j_:0,k_:0};let e=0,s=0;for(let n=0;n<t.length;n++){const r=t[n].Xi();r!==null&&(r<e&&(e=r),r>s&&(s=r))}return{j_:e,k_:s}}C_(t,e,s){let n=this.b_(e);if(n===null&&(n=this.f_(e,this.$i.W().overlayPriceScales)),this.vo.push(t),!Ti(e)){const r=this.a_.get(e)||[];r.push(t),this.a_.set(e,r)}n.Uo(t),t.Gi(n),t.Ki(s),this.T_(n),this.po=null}p_(t,e,s){e.yr!==s.yr&&this.z_(t)}f_(t,e){const s=Object.assign({visible:!0,autoScale:!0},Vt(e)),n=new Ja(t,s,this.$i.W().layout,this.$i.W().localization);return n.zo(this.At()),n}}class tc{constructor(t,e,s=50){this.Xe=0,this.Ke=1,this.Ge=1,this.Qe=new Map,this.Je=new Map,this.H_=t,this.U_=e,this.tr=s}q_(t){const e=t.time,s=this.U_.cacheKey(e),n=this.Qe.get(s);if(n!==void 0)return n.Y_;if(this.Xe===this.tr){const o=this.Je.get(this.Ge);this.Je.delete(this.Ge),this.Qe.delete(mt(o)),this.Ge++,this.Xe--}const r=this.H_(t);return this.Qe.set(s,{Y_:r,er:this.Ke}),this.Je.set(this.Ke,s),this.Xe++,this.Ke++,r}}class Pe{constructor(t,e){qt(t<=e,"right should be >= left"),this.Z_=t,this.X_=e}Vs(){return this.Z_}ui(){return this.X_}K_(){return this.X_-this.Z_+1}Xr(t){return this.Z_<=t&&t<=this.X_}yh(t){return this.Z_===t.Vs()&&this.X_===t.ui()}}function Zn(i,t){return i===null||t===null?i===t:i.yh(t)}class ec{constructor(){this.G_=new Map,this.Qe=null,this.J_=!1}Q_(t){this.J_=t,this.Qe=null}tu(t,e){this.iu(e),this.Qe=null;for(let s=e;s<t.length;++s){const n=t[s];let r=this.G_.get(n.timeWeight);r===void 0&&(r=[],this.G_.set(n.timeWeight,r)),r.push({index:s,time:n.time,weight:n.timeWeight,originalTime:n.originalTime})}}nu(t,e){const s=Math.ceil(e/t);return this.Qe!==null&&this.Qe.su===s||(this.Qe={ja:this.eu(s),su:s}),this.Qe.ja}iu(t){if(t===0)return void this.G_.clear();const e=[];this.G_.forEach((s,n)=>{t<=s[0].index?e.push(n):s.splice(Ue(s,t,r=>r.index<t),1/0)});for(const s of e)this.G_.delete(s)}eu(t){let e=[];for(const s of Array.from(this.G_.keys()).sort((n,r)=>r-n)){if(!this.G_.get(s))continue;const n=e;e=[];const r=n.length;let o=0;const l=mt(this.G_.get(s)),h=l.length;let a=1/0,c=-1/0;for(let u=0;u<h;u++){const f=l[u],m=f.index;for(;o<r;){const g=n[o],p=g.index;if(!(p<m)){a=p;break}o++,e.push(g),c=p,a=1/0}if(a-m>=t&&m-c>=t)e.push(f),c=m;else if(this.J_)return n}for(;o<r;o++)e.push(n[o])}return e}}class me{constructor(t){this.ru=t}hu(){return this.ru===null?null:new Pe(Math.floor(this.ru.Vs()),Math.ceil(this.ru.ui()))}lu(){return this.ru}static au(){return new me(null)}}function ic(i,t){return i.weight>t.weight?i:t}class sc{constructor(t,e,s,n){this.o_=0,this.ou=null,this._u=[],this.wo=null,this.bo=null,this.uu=new ec,this.cu=new Map,this.du=me.au(),this.fu=!0,this.vu=new st,this.pu=new st,this.mu=new st,this.bu=null,this.wu=null,this.gu=[],this.cn=e,this.ko=s,this.Mu=e.rightOffset,this.xu=e.barSpacing,this.$i=t,this.U_=n,this.Su(),this.uu.Q_(e.uniformDistribution)}W(){return this.cn}ku(t){Pt(this.ko,t),this.yu(),this.Su()}Hh(t,e){var s;Pt(this.cn,t),this.cn.fixLeftEdge&&this.Cu(),this.cn.fixRightEdge&&this.Tu(),t.barSpacing!==void 0&&this.$i.Gn(t.barSpacing),t.rightOffset!==void 0&&this.$i.Jn(t.rightOffset),t.minBarSpacing!==void 0&&this.$i.Gn((s=t.barSpacing)!==null&&s!==void 0?s:this.xu),this.yu(),this.Su(),this.mu.m()}mn(t){var e,s;return(s=(e=this._u[t])===null||e===void 0?void 0:e.time)!==null&&s!==void 0?s:null}Ui(t){var e;return(e=this._u[t])!==null&&e!==void 0?e:null}Da(t,e){if(this._u.length<1)return null;if(this.U_.key(t)>this.U_.key(this._u[this._u.length-1].time))return e?this._u.length-1:null;const s=Ue(this._u,this.U_.key(t),(n,r)=>this.U_.key(n.time)<r);return this.U_.key(t)<this.U_.key(this._u[s].time)?e?s:null:s}Ni(){return this.o_===0||this._u.length===0||this.ou===null}Ra(){return this._u.length>0}Zs(){return this.Pu(),this.du.hu()}Ru(){return this.Pu(),this.du.lu()}Du(){const t=this.Zs();if(t===null)return null;const e={from:t.Vs(),to:t.ui()};return this.Vu(e)}Vu(t){const e=Math.round(t.from),s=Math.round(t.to),n=M(this.Ou()),r=M(this.Bu());return{from:M(this.Ui(Math.max(n,e))),to:M(this.Ui(Math.min(r,s)))}}Au(t){return{from:M(this.Da(t.from,!0)),to:M(this.Da(t.to,!0))}}Hi(){return this.o_}x_(t){if(!isFinite(t)||t<=0||this.o_===t)return;const e=this.Ru(),s=this.o_;if(this.o_=t,this.fu=!0,this.cn.lockVisibleTimeRangeOnResize&&s!==0){const n=this.xu*t/s;this.xu=n}if(this.cn.fixLeftEdge&&e!==null&&e.Vs()<=0){const n=s-t;this.Mu-=Math.round(n/this.xu)+1,this.fu=!0}this.Iu(),this.zu()}It(t){if(this.Ni()||!Re(t))return 0;const e=this.Lu()+this.Mu-t;return this.o_-(e+.5)*this.xu-1}Js(t,e){const s=this.Lu(),n=e===void 0?0:e.from,r=e===void 0?t.length:e.to;for(let o=n;o<r;o++){const l=t[o].ot,h=s+this.Mu-l,a=this.o_-(h+.5)*this.xu-1;t[o].nt=a}}Eu(t){return Math.ceil(this.Nu(t))}Jn(t){this.fu=!0,this.Mu=t,this.zu(),this.$i.Fu(),this.$i.$h()}he(){return this.xu}Gn(t){this.Wu(t),this.zu(),this.$i.Fu(),this.$i.$h()}ju(){return this.Mu}ja(){if(this.Ni())return null;if(this.wu!==null)return this.wu;const t=this.xu,e=5*(this.$i.W().layout.fontSize+4)/8*(this.cn.tickMarkMaxCharacterLength||8),s=Math.round(e/t),n=M(this.Zs()),r=Math.max(n.Vs(),n.Vs()-s),o=Math.max(n.ui(),n.ui()-s),l=this.uu.nu(t,e),h=this.Ou()+s,a=this.Bu()-s,c=this.Hu(),u=this.cn.fixLeftEdge||c,f=this.cn.fixRightEdge||c;let m=0;for(const g of l){if(!(r<=g.index&&g.index<=o))continue;let p;m<this.gu.length?(p=this.gu[m],p.coord=this.It(g.index),p.label=this.$u(g),p.weight=g.weight):(p={needAlignCoordinate:!1,coord:this.It(g.index),label:this.$u(g),weight:g.weight},this.gu.push(p)),this.xu>e/2&&!c?p.needAlignCoordinate=!1:p.needAlignCoordinate=u&&g.index<=h||f&&g.index>=a,m++}return this.gu.length=m,this.wu=this.gu,this.gu}Uu(){this.fu=!0,this.Gn(this.cn.barSpacing),this.Jn(this.cn.rightOffset)}qu(t){this.fu=!0,this.ou=t,this.zu(),this.Cu()}Yu(t,e){const s=this.Nu(t),n=this.he(),r=n+e*(n/10);this.Gn(r),this.cn.rightBarStaysOnScroll||this.Jn(this.ju()+(s-this.Nu(t)))}Ko(t){this.wo&&this.i_(),this.bo===null&&this.bu===null&&(this.Ni()||(this.bo=t,this.Zu()))}Go(t){if(this.bu===null)return;const e=Cs(this.o_-t,0,this.o_),s=Cs(this.o_-M(this.bo),0,this.o_);e!==0&&s!==0&&this.Gn(this.bu.he*e/s)}Jo(){this.bo!==null&&(this.bo=null,this.Xu())}Qo(t){this.wo===null&&this.bu===null&&(this.Ni()||(this.wo=t,this.Zu()))}t_(t){if(this.wo===null)return;const e=(this.wo-t)/this.he();this.Mu=M(this.bu).ju+e,this.fu=!0,this.zu()}i_(){this.wo!==null&&(this.wo=null,this.Xu())}Ku(){this.Gu(this.cn.rightOffset)}Gu(t,e=400){if(!isFinite(t))throw new RangeError("offset is required and must be finite number");if(!isFinite(e)||e<=0)throw new RangeError("animationDuration (optional) must be finite positive number");const s=this.Mu,n=performance.now();this.$i.Zn({Ju:r=>(r-n)/e>=1,Qu:r=>{const o=(r-n)/e;return o>=1?t:s+(t-s)*o}})}bt(t,e){this.fu=!0,this._u=t,this.uu.tu(t,e),this.zu()}tc(){return this.vu}nc(){return this.pu}sc(){return this.mu}Lu(){return this.ou||0}ec(t){const e=t.K_();this.Wu(this.o_/e),this.Mu=t.ui()-this.Lu(),this.zu(),this.fu=!0,this.$i.Fu(),this.$i.$h()}rc(){const t=this.Ou(),e=this.Bu();t!==null&&e!==null&&this.ec(new Pe(t,e+this.cn.rightOffset))}hc(t){const e=new Pe(t.from,t.to);this.ec(e)}qi(t){return this.ko.timeFormatter!==void 0?this.ko.timeFormatter(t.originalTime):this.U_.formatHorzItem(t.time)}Hu(){const{handleScroll:t,handleScale:e}=this.$i.W();return!(t.horzTouchDrag||t.mouseWheel||t.pressedMouseMove||t.vertTouchDrag||e.axisDoubleClickReset.time||e.axisPressedMouseMove.time||e.mouseWheel||e.pinch)}Ou(){return this._u.length===0?null:0}Bu(){return this._u.length===0?null:this._u.length-1}lc(t){return(this.o_-1-t)/this.xu}Nu(t){const e=this.lc(t),s=this.Lu()+this.Mu-e;return Math.round(1e6*s)/1e6}Wu(t){const e=this.xu;this.xu=t,this.Iu(),e!==this.xu&&(this.fu=!0,this.ac())}Pu(){if(!this.fu)return;if(this.fu=!1,this.Ni())return void this.oc(me.au());const t=this.Lu(),e=this.o_/this.xu,s=this.Mu+t,n=new Pe(s-e+1,s);this.oc(new me(n))}Iu(){const t=this._c();if(this.xu<t&&(this.xu=t,this.fu=!0),this.o_!==0){const e=.5*this.o_;this.xu>e&&(this.xu=e,this.fu=!0)}}_c(){return this.cn.fixLeftEdge&&this.cn.fixRightEdge&&this._u.length!==0?this.o_/this._u.length:this.cn.minBarSpacing}zu(){const t=this.uc();this.Mu>t&&(this.Mu=t,this.fu=!0);const e=this.cc();e!==null&&this.Mu<e&&(this.Mu=e,this.fu=!0)}cc(){const t=this.Ou(),e=this.ou;return t===null||e===null?null:t-e-1+(this.cn.fixLeftEdge?this.o_/this.xu:Math.min(2,this._u.length))}uc(){return this.cn.fixRightEdge?0:this.o_/this.xu-Math.min(2,this._u.length)}Zu(){this.bu={he:this.he(),ju:this.ju()}}Xu(){this.bu=null}$u(t){let e=this.cu.get(t.weight);return e===void 0&&(e=new tc(s=>this.dc(s),this.U_),this.cu.set(t.weight,e)),e.q_(t)}dc(t){return this.U_.formatTickmark(t,this.ko)}oc(t){const e=this.du;this.du=t,Zn(e.hu(),this.du.hu())||this.vu.m(),Zn(e.lu(),this.du.lu())||this.pu.m(),this.ac()}ac(){this.wu=null}yu(){this.ac(),this.cu.clear()}Su(){this.U_.updateFormatter(this.ko)}Cu(){if(!this.cn.fixLeftEdge)return;const t=this.Ou();if(t===null)return;const e=this.Zs();if(e===null)return;const s=e.Vs()-t;if(s<0){const n=this.Mu-s-1;this.Jn(n)}this.Iu()}Tu(){this.zu(),this.Iu()}}class nc{X(t,e,s){t.useMediaCoordinateSpace(n=>this.K(n,e,s))}wl(t,e,s){t.useMediaCoordinateSpace(n=>this.fc(n,e,s))}fc(t,e,s){}}class rc extends nc{constructor(t){super(),this.vc=new Map,this.zt=t}K(t){}fc(t){if(!this.zt.yt)return;const{context:e,mediaSize:s}=t;let n=0;for(const o of this.zt.mc){if(o.Kt.length===0)continue;e.font=o.R;const l=this.bc(e,o.Kt);l>s.width?o.Yu=s.width/l:o.Yu=1,n+=o.wc*o.Yu}let r=0;switch(this.zt.gc){case"top":r=0;break;case"center":r=Math.max((s.height-n)/2,0);break;case"bottom":r=Math.max(s.height-n,0)}e.fillStyle=this.zt.V;for(const o of this.zt.mc){e.save();let l=0;switch(this.zt.Mc){case"left":e.textAlign="left",l=o.wc/2;break;case"center":e.textAlign="center",l=s.width/2;break;case"right":e.textAlign="right",l=s.width-1-o.wc/2}e.translate(l,r),e.textBaseline="top",e.font=o.R,e.scale(o.Yu,o.Yu),e.fillText(o.Kt,0,o.xc),e.restore(),r+=o.wc*o.Yu}}bc(t,e){const s=this.Sc(t.font);let n=s.get(e);return n===void 0&&(n=t.measureText(e).width,s.set(e,n)),n}Sc(t){let e=this.vc.get(t);return e===void 0&&(e=new Map,this.vc.set(t,e)),e}}class oc{constructor(t){this.ft=!0,this.Ft={yt:!1,V:"",mc:[],gc:"center",Mc:"center"},this.Wt=new rc(this.Ft),this.jt=t}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt}Mt(){const t=this.jt.W(),e=this.Ft;e.yt=t.visible,e.yt&&(e.V=t.color,e.Mc=t.horzAlign,e.gc=t.vertAlign,e.mc=[{Kt:t.text,R:be(t.fontSize,t.fontFamily,t.fontStyle),wc:1.2*t.fontSize,xc:0,Yu:0}])}}class lc extends js{constructor(t,e){super(),this.cn=e,this.wn=new oc(this)}Rn(){return[]}Pn(){return[this.wn]}W(){return this.cn}Vn(){this.wn.bt()}}var Jn,Qn,$s,Es,tr;(function(i){i[i.OnTouchEnd=0]="OnTouchEnd",i[i.OnNextTap=1]="OnNextTap"})(Jn||(Jn={}));class hc{constructor(t,e,s){this.kc=[],this.yc=[],this.o_=0,this.Cc=null,this.Tc=new st,this.Pc=new st,this.Rc=null,this.Dc=t,this.cn=e,this.U_=s,this.Vc=new Bh(this),this.kl=new sc(this,e.timeScale,this.cn.localization,s),this.vt=new Zh(this,e.crosshair),this.Oc=new Xa(e.crosshair),this.Bc=new lc(this,e.watermark),this.Ac(),this.kc[0].M_(2e3),this.Ic=this.zc(0),this.Lc=this.zc(1)}Xl(){this.Ec(ht.es())}$h(){this.Ec(ht.ss())}aa(){this.Ec(new ht(1))}Kl(t){const e=this.Nc(t);this.Ec(e)}Fc(){return this.Cc}Wc(t){const e=this.Cc;this.Cc=t,e!==null&&this.Kl(e.jc),t!==null&&this.Kl(t.jc)}W(){return this.cn}Hh(t){Pt(this.cn,t),this.kc.forEach(e=>e.m_(t)),t.timeScale!==void 0&&this.kl.Hh(t.timeScale),t.localization!==void 0&&this.kl.ku(t.localization),(t.leftPriceScale||t.rightPriceScale)&&this.Tc.m(),this.Ic=this.zc(0),this.Lc=this.zc(1),this.Xl()}Hc(t,e){if(t==="left")return void this.Hh({leftPriceScale:e});if(t==="right")return void this.Hh({rightPriceScale:e});const s=this.$c(t);s!==null&&(s.Dt.Hh(e),this.Tc.m())}$c(t){for(const e of this.kc){const s=e.b_(t);if(s!==null)return{Ht:e,Dt:s}}return null}St(){return this.kl}Uc(){return this.kc}qc(){return this.Bc}Yc(){return this.vt}Zc(){return this.Pc}Xc(t,e){t.zo(e),this.Fu()}x_(t){this.o_=t,this.kl.x_(this.o_),this.kc.forEach(e=>e.x_(t)),this.Fu()}Ac(t){const e=new Qa(this.kl,this);t!==void 0?this.kc.splice(t,0,e):this.kc.push(e);const s=t===void 0?this.kc.length-1:t,n=ht.es();return n.Nn(s,{Fn:0,Wn:!0}),this.Ec(n),e}D_(t,e,s){t.D_(e,s)}V_(t,e,s){t.V_(e,s),this.Gl(),this.Ec(this.Kc(t,2))}O_(t,e){t.O_(e),this.Ec(this.Kc(t,2))}B_(t,e,s){e.Do()||t.B_(e,s)}A_(t,e,s){e.Do()||(t.A_(e,s),this.Gl(),this.Ec(this.Kc(t,2)))}I_(t,e){e.Do()||(t.I_(e),this.Ec(this.Kc(t,2)))}L_(t,e){t.L_(e),this.Ec(this.Kc(t,2))}Gc(t){this.kl.Ko(t)}Jc(t,e){const s=this.St();if(s.Ni()||e===0)return;const n=s.Hi();t=Math.max(1,Math.min(t,n)),s.Yu(t,e),this.Fu()}Qc(t){this.td(0),this.nd(t),this.sd()}ed(t){this.kl.Go(t),this.Fu()}rd(){this.kl.Jo(),this.$h()}td(t){this.kl.Qo(t)}nd(t){this.kl.t_(t),this.Fu()}sd(){this.kl.i_(),this.$h()}wt(){return this.yc}hd(t,e,s,n,r){this.vt.gn(t,e);let o=NaN,l=this.kl.Eu(t);const h=this.kl.Zs();h!==null&&(l=Math.min(Math.max(h.Vs(),l),h.ui()));const a=n.vn(),c=a.Ct();c!==null&&(o=a.pn(e,c)),o=this.Oc.Va(o,l,n),this.vt.kn(l,o,n),this.aa(),r||this.Pc.m(this.vt.xt(),{x:t,y:e},s)}ld(t,e,s){const n=s.vn(),r=n.Ct(),o=n.Rt(t,M(r)),l=this.kl.Da(e,!0),h=this.kl.It(M(l));this.hd(h,o,null,s,!0)}ad(t){this.Yc().Cn(),this.aa(),t||this.Pc.m(null,null,null)}Gl(){const t=this.vt.Ht();if(t!==null){const e=this.vt.xn(),s=this.vt.Sn();this.hd(e,s,null,t)}this.vt.Vn()}od(t,e,s){const n=this.kl.mn(0);e!==void 0&&s!==void 0&&this.kl.bt(e,s);const r=this.kl.mn(0),o=this.kl.Lu(),l=this.kl.Zs();if(l!==null&&n!==null&&r!==null){const h=l.Xr(o),a=this.U_.key(n)>this.U_.key(r),c=t!==null&&t>o&&!a,u=this.kl.W().allowShiftVisibleRangeOnWhitespaceReplacement,f=h&&(s!==void 0||u)&&this.kl.W().shiftVisibleRangeOnNewBar;if(c&&!f){const m=t-o;this.kl.Jn(this.kl.ju()-m)}}this.kl.qu(t)}ta(t){t!==null&&t.N_()}cr(t){const e=this.kc.find(s=>s.$o().includes(t));return e===void 0?null:e}Fu(){this.Bc.Vn(),this.kc.forEach(t=>t.N_()),this.Gl()}S(){this.kc.forEach(t=>t.S()),this.kc.length=0,this.cn.localization.priceFormatter=void 0,this.cn.localization.percentageFormatter=void 0,this.cn.localization.timeFormatter=void 0}_d(){return this.Vc}mr(){return this.Vc.W()}w_(){return this.Tc}ud(t,e,s){const n=this.kc[0],r=this.dd(e,t,n,s);return this.yc.push(r),this.yc.length===1?this.Xl():this.$h(),r}fd(t){const e=this.cr(t),s=this.yc.indexOf(t);qt(s!==-1,"Series not found"),this.yc.splice(s,1),M(e).Yo(t),t.S&&t.S()}Zl(t,e){const s=M(this.cr(t));s.Yo(t);const n=this.$c(e);if(n===null){const r=t.Xi();s.Uo(t,e,r)}else{const r=n.Ht===s?t.Xi():void 0;n.Ht.Uo(t,e,r)}}rc(){const t=ht.ss();t.$n(),this.Ec(t)}vd(t){const e=ht.ss();e.Yn(t),this.Ec(e)}Kn(){const t=ht.ss();t.Kn(),this.Ec(t)}Gn(t){const e=ht.ss();e.Gn(t),this.Ec(e)}Jn(t){const e=ht.ss();e.Jn(t),this.Ec(e)}Zn(t){const e=ht.ss();e.Zn(t),this.Ec(e)}Un(){const t=ht.ss();t.Un(),this.Ec(t)}pd(){return this.cn.rightPriceScale.visible?"right":"left"}md(){return this.Lc}q(){return this.Ic}Bt(t){const e=this.Lc,s=this.Ic;if(e===s)return e;if(t=Math.max(0,Math.min(100,Math.round(100*t))),this.Rc===null||this.Rc.Ts!==s||this.Rc.Ps!==e)this.Rc={Ts:s,Ps:e,bd:new Map};else{const r=this.Rc.bd.get(t);if(r!==void 0)return r}const n=function(r,o,l){const[h,a,c,u]=Oe(r),[f,m,g,p]=Oe(o),_=[xt(h+l*(f-h)),xt(a+l*(m-a)),xt(c+l*(g-c)),io(u+l*(p-u))];return`rgba(${_[0]}, ${_[1]}, ${_[2]}, ${_[3]})`}(s,e,t/100);return this.Rc.bd.set(t,n),n}Kc(t,e){const s=new ht(e);if(t!==null){const n=this.kc.indexOf(t);s.Nn(n,{Fn:e})}return s}Nc(t,e){return e===void 0&&(e=2),this.Kc(this.cr(t),e)}Ec(t){this.Dc&&this.Dc(t),this.kc.forEach(e=>e.W_().Uh().bt())}dd(t,e,s,n){const r=new Xs(this,t,e,s,n),o=t.priceScaleId!==void 0?t.priceScaleId:this.pd();return s.Uo(r,o),Ti(o)||r.Hh(t),r}zc(t){const e=this.cn.layout;return e.background.type==="gradient"?t===0?e.background.topColor:e.background.bottomColor:e.background.color}}function ks(i){return!At(i)&&!Fe(i)}function xo(i){return At(i)}(function(i){i[i.Disabled=0]="Disabled",i[i.Continuous=1]="Continuous",i[i.OnDataUpdate=2]="OnDataUpdate"})(Qn||(Qn={})),function(i){i[i.LastBar=0]="LastBar",i[i.LastVisible=1]="LastVisible"}($s||($s={})),function(i){i.Solid="solid",i.VerticalGradient="gradient"}(Es||(Es={})),function(i){i[i.Year=0]="Year",i[i.Month=1]="Month",i[i.DayOfMonth=2]="DayOfMonth",i[i.Time=3]="Time",i[i.TimeWithSeconds=4]="TimeWithSeconds"}(tr||(tr={}));const er=i=>i.getUTCFullYear();function ac(i,t,e){return t.replace(/yyyy/g,(s=>Wt(er(s),4))(i)).replace(/yy/g,(s=>Wt(er(s)%100,2))(i)).replace(/MMMM/g,((s,n)=>new Date(s.getUTCFullYear(),s.getUTCMonth(),1).toLocaleString(n,{month:"long"}))(i,e)).replace(/MMM/g,((s,n)=>new Date(s.getUTCFullYear(),s.getUTCMonth(),1).toLocaleString(n,{month:"short"}))(i,e)).replace(/MM/g,(s=>Wt((n=>n.getUTCMonth()+1)(s),2))(i)).replace(/dd/g,(s=>Wt((n=>n.getUTCDate())(s),2))(i))}class So{constructor(t="yyyy-MM-dd",e="default"){this.wd=t,this.gd=e}q_(t){return ac(t,this.wd,this.gd)}}class cc{constructor(t){this.Md=t||"%h:%m:%s"}q_(t){return this.Md.replace("%h",Wt(t.getUTCHours(),2)).replace("%m",Wt(t.getUTCMinutes(),2)).replace("%s",Wt(t.getUTCSeconds(),2))}}const uc={xd:"yyyy-MM-dd",Sd:"%h:%m:%s",kd:" ",yd:"default"};class dc{constructor(t={}){const e=Object.assign(Object.assign({},uc),t);this.Cd=new So(e.xd,e.yd),this.Td=new cc(e.Sd),this.Pd=e.kd}q_(t){return`${this.Cd.q_(t)}${this.Pd}${this.Td.q_(t)}`}}function Ze(i){return 60*i*60*1e3}function Zi(i){return 60*i*1e3}const Je=[{Rd:(ir=1,1e3*ir),Dd:10},{Rd:Zi(1),Dd:20},{Rd:Zi(5),Dd:21},{Rd:Zi(30),Dd:22},{Rd:Ze(1),Dd:30},{Rd:Ze(3),Dd:31},{Rd:Ze(6),Dd:32},{Rd:Ze(12),Dd:33}];var ir;function sr(i,t){if(i.getUTCFullYear()!==t.getUTCFullYear())return 70;if(i.getUTCMonth()!==t.getUTCMonth())return 60;if(i.getUTCDate()!==t.getUTCDate())return 50;for(let e=Je.length-1;e>=0;--e)if(Math.floor(t.getTime()/Je[e].Rd)!==Math.floor(i.getTime()/Je[e].Rd))return Je[e].Dd;return 0}function Ji(i){let t=i;if(Fe(i)&&(t=Ks(i)),!ks(t))throw new Error("time must be of type BusinessDay");const e=new Date(Date.UTC(t.year,t.month-1,t.day,0,0,0,0));return{Vd:Math.round(e.getTime()/1e3),Od:t}}function nr(i){if(!xo(i))throw new Error("time must be of type isUTCTimestamp");return{Vd:i}}function Ks(i){const t=new Date(i);if(isNaN(t.getTime()))throw new Error(`Invalid date string=${i}, expected format=yyyy-mm-dd`);return{day:t.getUTCDate(),month:t.getUTCMonth()+1,year:t.getUTCFullYear()}}function rr(i){Fe(i.time)&&(i.time=Ks(i.time))}class or{options(){return this.cn}setOptions(t){this.cn=t,this.updateFormatter(t.localization)}preprocessData(t){Array.isArray(t)?function(e){e.forEach(rr)}(t):rr(t)}createConverterToInternalObj(t){return M(function(e){return e.length===0?null:ks(e[0].time)||Fe(e[0].time)?Ji:nr}(t))}key(t){return typeof t=="object"&&"Vd"in t?t.Vd:this.key(this.convertHorzItemToInternal(t))}cacheKey(t){const e=t;return e.Od===void 0?new Date(1e3*e.Vd).getTime():new Date(Date.UTC(e.Od.year,e.Od.month-1,e.Od.day)).getTime()}convertHorzItemToInternal(t){return xo(e=t)?nr(e):ks(e)?Ji(e):Ji(Ks(e));var e}updateFormatter(t){if(!this.cn)return;const e=t.dateFormat;this.cn.timeScale.timeVisible?this.Bd=new dc({xd:e,Sd:this.cn.timeScale.secondsVisible?"%h:%m:%s":"%h:%m",kd:"   ",yd:t.locale}):this.Bd=new So(e,t.locale)}formatHorzItem(t){const e=t;return this.Bd.q_(new Date(1e3*e.Vd))}formatTickmark(t,e){const s=function(r,o,l){switch(r){case 0:case 10:return o?l?4:3:2;case 20:case 21:case 22:case 30:case 31:case 32:case 33:return o?3:2;case 50:return 2;case 60:return 1;case 70:return 0}}(t.weight,this.cn.timeScale.timeVisible,this.cn.timeScale.secondsVisible),n=this.cn.timeScale;if(n.tickMarkFormatter!==void 0){const r=n.tickMarkFormatter(t.originalTime,s,e.locale);if(r!==null)return r}return function(r,o,l){const h={};switch(o){case 0:h.year="numeric";break;case 1:h.month="short";break;case 2:h.day="numeric";break;case 3:h.hour12=!1,h.hour="2-digit",h.minute="2-digit";break;case 4:h.hour12=!1,h.hour="2-digit",h.minute="2-digit",h.second="2-digit"}const a=r.Od===void 0?new Date(1e3*r.Vd):new Date(Date.UTC(r.Od.year,r.Od.month-1,r.Od.day));return new Date(a.getUTCFullYear(),a.getUTCMonth(),a.getUTCDate(),a.getUTCHours(),a.getUTCMinutes(),a.getUTCSeconds(),a.getUTCMilliseconds()).toLocaleString(l,h)}(t.time,s,e.locale)}maxTickMarkWeight(t){let e=t.reduce(ic,t[0]).weight;return e>30&&e<50&&(e=30),e}fillWeightsForPoints(t,e){(function(s,n=0){if(s.length===0)return;let r=n===0?null:s[n-1].time.Vd,o=r!==null?new Date(1e3*r):null,l=0;for(let h=n;h<s.length;++h){const a=s[h],c=new Date(1e3*a.time.Vd);o!==null&&(a.timeWeight=sr(c,o)),l+=a.time.Vd-(r||a.time.Vd),r=a.time.Vd,o=c}if(n===0&&s.length>1){const h=Math.ceil(l/(s.length-1)),a=new Date(1e3*(s[0].time.Vd-h));s[0].timeWeight=sr(new Date(1e3*s[0].time.Vd),a)}})(t,e)}static Ad(t){return Pt({localization:{dateFormat:"dd MMM 'yy"}},t??{})}}const we=typeof window<"u";function lr(){return!!we&&window.navigator.userAgent.toLowerCase().indexOf("firefox")>-1}function Qi(){return!!we&&/iPhone|iPad|iPod/.test(window.navigator.platform)}function Ls(i){return i+i%2}function ts(i,t){return i.Id-t.Id}function es(i,t,e){const s=(i.Id-t.Id)/(i.ot-t.ot);return Math.sign(s)*Math.min(Math.abs(s),e)}class fc{constructor(t,e,s,n){this.zd=null,this.Ld=null,this.Ed=null,this.Nd=null,this.Fd=null,this.Wd=0,this.jd=0,this.Hd=t,this.$d=e,this.Ud=s,this.rs=n}qd(t,e){if(this.zd!==null){if(this.zd.ot===e)return void(this.zd.Id=t);if(Math.abs(this.zd.Id-t)<this.rs)return}this.Nd=this.Ed,this.Ed=this.Ld,this.Ld=this.zd,this.zd={ot:e,Id:t}}Dr(t,e){if(this.zd===null||this.Ld===null||e-this.zd.ot>50)return;let s=0;const n=es(this.zd,this.Ld,this.$d),r=ts(this.zd,this.Ld),o=[n],l=[r];if(s+=r,this.Ed!==null){const a=es(this.Ld,this.Ed,this.$d);if(Math.sign(a)===Math.sign(n)){const c=ts(this.Ld,this.Ed);if(o.push(a),l.push(c),s+=c,this.Nd!==null){const u=es(this.Ed,this.Nd,this.$d);if(Math.sign(u)===Math.sign(n)){const f=ts(this.Ed,this.Nd);o.push(u),l.push(f),s+=f}}}}let h=0;for(let a=0;a<o.length;++a)h+=l[a]/s*o[a];Math.abs(h)<this.Hd||(this.Fd={Id:t,ot:e},this.jd=h,this.Wd=function(a,c){const u=Math.log(c);return Math.log(1*u/-a)/u}(Math.abs(h),this.Ud))}Qu(t){const e=M(this.Fd),s=t-e.ot;return e.Id+this.jd*(Math.pow(this.Ud,s)-1)/Math.log(this.Ud)}Ju(t){return this.Fd===null||this.Yd(t)===this.Wd}Yd(t){const e=t-M(this.Fd).ot;return Math.min(e,this.Wd)}}class gc{constructor(t,e){this.Zd=void 0,this.Xd=void 0,this.Kd=void 0,this.en=!1,this.Gd=t,this.Jd=e,this.Qd()}bt(){this.Qd()}tf(){this.Zd&&this.Gd.removeChild(this.Zd),this.Xd&&this.Gd.removeChild(this.Xd),this.Zd=void 0,this.Xd=void 0}if(){return this.en!==this.nf()||this.Kd!==this.sf()}sf(){return so(Oe(this.Jd.W().layout.textColor))>160?"dark":"light"}nf(){return this.Jd.W().layout.attributionLogo}ef(){const t=new URL(location.href);return t.hostname?"&utm_source="+t.hostname+t.pathname:""}Qd(){this.if()&&(this.tf(),this.en=this.nf(),this.en&&(this.Kd=this.sf(),this.Xd=document.createElement("style"),this.Xd.innerText="a#tv-attr-logo{--fill:#131722;--stroke:#fff;position:absolute;left:10px;bottom:10px;height:19px;width:35px;margin:0;padding:0;border:0;z-index:3;}a#tv-attr-logo[data-dark]{--fill:#D1D4DC;--stroke:#131722;}",this.Zd=document.createElement("a"),this.Zd.href=`https://www.tradingview.com/?utm_medium=lwc-link&utm_campaign=lwc-chart${this.ef()}`,this.Zd.title="Charting by TradingView",this.Zd.id="tv-attr-logo",this.Zd.target="_blank",this.Zd.innerHTML='<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 35 19" width="35" height="19" fill="none"><g fill-rule="evenodd" clip-path="url(#a)" clip-rule="evenodd"><path fill="var(--stroke)" d="M2 0H0v10h6v9h21.4l.5-1.3 6-15 1-2.7H23.7l-.5 1.3-.2.6a5 5 0 0 0-7-.9V0H2Zm20 17h4l5.2-13 .8-2h-7l-1 2.5-.2.5-1.5 3.8-.3.7V17Zm-.8-10a3 3 0 0 0 .7-2.7A3 3 0 1 0 16.8 7h4.4ZM14 7V2H2v6h6v9h4V7h2Z"/><path fill="var(--fill)" d="M14 2H2v6h6v9h6V2Zm12 15h-7l6-15h7l-6 15Zm-7-9a3 3 0 1 0 0-6 3 3 0 0 0 0 6Z"/></g><defs><clipPath id="a"><path fill="var(--stroke)" d="M0 0h35v19H0z"/></clipPath></defs></svg>',this.Zd.toggleAttribute("data-dark",this.Kd==="dark"),this.Gd.appendChild(this.Xd),this.Gd.appendChild(this.Zd)))}}function ne(i,t){const e=M(i.ownerDocument).createElement("canvas");i.appendChild(e);const s=Ch(e,{type:"device-pixel-content-box",options:{allowResizeObserver:!1},transform:(n,r)=>({width:Math.max(n.width,r.width),height:Math.max(n.height,r.height)})});return s.resizeCanvasElement(t),s}function re(i){var t;i.width=1,i.height=1,(t=i.getContext("2d"))===null||t===void 0||t.clearRect(0,0,1,1)}function Ts(i,t,e,s){i.wl&&i.wl(t,e,s)}function ai(i,t,e,s){i.X(t,e,s)}function Ps(i,t,e,s){const n=i(e,s);for(const r of n){const o=r.gt();o!==null&&t(o)}}function mc(i){we&&window.chrome!==void 0&&i.addEventListener("mousedown",t=>{if(t.button===1)return t.preventDefault(),!1})}class qs{constructor(t,e,s){this.rf=0,this.hf=null,this.lf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY},this.af=0,this._f=null,this.uf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY},this.cf=null,this.df=!1,this.ff=null,this.vf=null,this.pf=!1,this.mf=!1,this.bf=!1,this.wf=null,this.gf=null,this.Mf=null,this.xf=null,this.Sf=null,this.kf=null,this.yf=null,this.Cf=0,this.Tf=!1,this.Pf=!1,this.Rf=!1,this.Df=0,this.Vf=null,this.Of=!Qi(),this.Bf=n=>{this.Af(n)},this.If=n=>{if(this.zf(n)){const r=this.Lf(n);if(++this.af,this._f&&this.af>1){const{Ef:o}=this.Nf(Dt(n),this.uf);o<30&&!this.bf&&this.Ff(r,this.jf.Wf),this.Hf()}}else{const r=this.Lf(n);if(++this.rf,this.hf&&this.rf>1){const{Ef:o}=this.Nf(Dt(n),this.lf);o<5&&!this.mf&&this.$f(r,this.jf.Uf),this.qf()}}},this.Yf=t,this.jf=e,this.cn=s,this.Zf()}S(){this.wf!==null&&(this.wf(),this.wf=null),this.gf!==null&&(this.gf(),this.gf=null),this.xf!==null&&(this.xf(),this.xf=null),this.Sf!==null&&(this.Sf(),this.Sf=null),this.kf!==null&&(this.kf(),this.kf=null),this.Mf!==null&&(this.Mf(),this.Mf=null),this.Xf(),this.qf()}Kf(t){this.xf&&this.xf();const e=this.Gf.bind(this);if(this.xf=()=>{this.Yf.removeEventListener("mousemove",e)},this.Yf.addEventListener("mousemove",e),this.zf(t))return;const s=this.Lf(t);this.$f(s,this.jf.Jf),this.Of=!0}qf(){this.hf!==null&&clearTimeout(this.hf),this.rf=0,this.hf=null,this.lf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY}}Hf(){this._f!==null&&clearTimeout(this._f),this.af=0,this._f=null,this.uf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY}}Gf(t){if(this.Rf||this.vf!==null||this.zf(t))return;const e=this.Lf(t);this.$f(e,this.jf.Qf),this.Of=!0}tv(t){const e=is(t.changedTouches,M(this.Vf));if(e===null||(this.Df=Qe(t),this.yf!==null)||this.Pf)return;this.Tf=!0;const s=this.Nf(Dt(e),M(this.vf)),{iv:n,nv:r,Ef:o}=s;if(this.pf||!(o<5)){if(!this.pf){const l=.5*n,h=r>=l&&!this.cn.sv(),a=l>r&&!this.cn.ev();h||a||(this.Pf=!0),this.pf=!0,this.bf=!0,this.Xf(),this.Hf()}if(!this.Pf){const l=this.Lf(t,e);this.Ff(l,this.jf.rv),ae(t)}}}hv(t){if(t.button!==0)return;const e=this.Nf(Dt(t),M(this.ff)),{Ef:s}=e;if(s>=5&&(this.mf=!0,this.qf()),this.mf){const n=this.Lf(t);this.$f(n,this.jf.lv)}}Nf(t,e){const s=Math.abs(e.nt-t.nt),n=Math.abs(e.st-t.st);return{iv:s,nv:n,Ef:s+n}}av(t){let e=is(t.changedTouches,M(this.Vf));if(e===null&&t.touches.length===0&&(e=t.changedTouches[0]),e===null)return;this.Vf=null,this.Df=Qe(t),this.Xf(),this.vf=null,this.kf&&(this.kf(),this.kf=null);const s=this.Lf(t,e);if(this.Ff(s,this.jf.ov),++this.af,this._f&&this.af>1){const{Ef:n}=this.Nf(Dt(e),this.uf);n<30&&!this.bf&&this.Ff(s,this.jf.Wf),this.Hf()}else this.bf||(this.Ff(s,this.jf._v),this.jf._v&&ae(t));this.af===0&&ae(t),t.touches.length===0&&this.df&&(this.df=!1,ae(t))}Af(t){if(t.button!==0)return;const e=this.Lf(t);if(this.ff=null,this.Rf=!1,this.Sf&&(this.Sf(),this.Sf=null),lr()&&this.Yf.ownerDocument.documentElement.removeEventListener("mouseleave",this.Bf),!this.zf(t))if(this.$f(e,this.jf.uv),++this.rf,this.hf&&this.rf>1){const{Ef:s}=this.Nf(Dt(t),this.lf);s<5&&!this.mf&&this.$f(e,this.jf.Uf),this.qf()}else this.mf||this.$f(e,this.jf.cv)}Xf(){this.cf!==null&&(clearTimeout(this.cf),this.cf=null)}dv(t){if(this.Vf!==null)return;const e=t.changedTouches[0];this.Vf=e.identifier,this.Df=Qe(t);const s=this.Yf.ownerDocument.documentElement;this.bf=!1,this.pf=!1,this.Pf=!1,this.vf=Dt(e),this.kf&&(this.kf(),this.kf=null);{const r=this.tv.bind(this),o=this.av.bind(this);this.kf=()=>{s.removeEventListener("touchmove",r),s.removeEventListener("touchend",o)},s.addEventListener("touchmove",r,{passive:!1}),s.addEventListener("touchend",o,{passive:!1}),this.Xf(),this.cf=setTimeout(this.fv.bind(this,t),240)}const n=this.Lf(t,e);this.Ff(n,this.jf.vv),this._f||(this.af=0,this._f=setTimeout(this.Hf.bind(this),500),this.uf=Dt(e))}pv(t){if(t.button!==0)return;const e=this.Yf.ownerDocument.documentElement;lr()&&e.addEventListener("mouseleave",this.Bf),this.mf=!1,this.ff=Dt(t),this.Sf&&(this.Sf(),this.Sf=null);{const n=this.hv.bind(this),r=this.Af.bind(this);this.Sf=()=>{e.removeEventListener("mousemove",n),e.removeEventListener("mouseup",r)},e.addEventListener("mousemove",n),e.addEventListener("mouseup",r)}if(this.Rf=!0,this.zf(t))return;const s=this.Lf(t);this.$f(s,this.jf.mv),this.hf||(this.rf=0,this.hf=setTimeout(this.qf.bind(this),500),this.lf=Dt(t))}Zf(){this.Yf.addEventListener("mouseenter",this.Kf.bind(this)),this.Yf.addEventListener("touchcancel",this.Xf.bind(this));{const t=this.Yf.ownerDocument,e=s=>{this.jf.bv&&(s.composed&&this.Yf.contains(s.composedPath()[0])||s.target&&this.Yf.contains(s.target)||this.jf.bv())};this.gf=()=>{t.removeEventListener("touchstart",e)},this.wf=()=>{t.removeEventListener("mousedown",e)},t.addEventListener("mousedown",e),t.addEventListener("touchstart",e,{passive:!0})}Qi()&&(this.Mf=()=>{this.Yf.removeEventListener("dblclick",this.If)},this.Yf.addEventListener("dblclick",this.If)),this.Yf.addEventListener("mouseleave",this.wv.bind(this)),this.Yf.addEventListener("touchstart",this.dv.bind(this),{passive:!0}),mc(this.Yf),this.Yf.addEventListener("mousedown",this.pv.bind(this)),this.gv(),this.Yf.addEventListener("touchmove",()=>{},{passive:!1})}gv(){this.jf.Mv===void 0&&this.jf.xv===void 0&&this.jf.Sv===void 0||(this.Yf.addEventListener("touchstart",t=>this.kv(t.touches),{passive:!0}),this.Yf.addEventListener("touchmove",t=>{if(t.touches.length===2&&this.yf!==null&&this.jf.xv!==void 0){const e=hr(t.touches[0],t.touches[1])/this.Cf;this.jf.xv(this.yf,e),ae(t)}},{passive:!1}),this.Yf.addEventListener("touchend",t=>{this.kv(t.touches)}))}kv(t){t.length===1&&(this.Tf=!1),t.length!==2||this.Tf||this.df?this.yv():this.Cv(t)}Cv(t){const e=this.Yf.getBoundingClientRect()||{left:0,top:0};this.yf={nt:(t[0].clientX-e.left+(t[1].clientX-e.left))/2,st:(t[0].clientY-e.top+(t[1].clientY-e.top))/2},this.Cf=hr(t[0],t[1]),this.jf.Mv!==void 0&&this.jf.Mv(),this.Xf()}yv(){this.yf!==null&&(this.yf=null,this.jf.Sv!==void 0&&this.jf.Sv())}wv(t){if(this.xf&&this.xf(),this.zf(t)||!this.Of)return;const e=this.Lf(t);this.$f(e,this.jf.Tv),this.Of=!Qi()}fv(t){const e=is(t.touches,M(this.Vf));if(e===null)return;const s=this.Lf(t,e);this.Ff(s,this.jf.Pv),this.bf=!0,this.df=!0}zf(t){return t.sourceCapabilities&&t.sourceCapabilities.firesTouchEvents!==void 0?t.sourceCapabilities.firesTouchEvents:Qe(t)<this.Df+500}Ff(t,e){e&&e.call(this.jf,t)}$f(t,e){e&&e.call(this.jf,t)}Lf(t,e){const s=e||t,n=this.Yf.getBoundingClientRect()||{left:0,top:0};return{clientX:s.clientX,clientY:s.clientY,pageX:s.pageX,pageY:s.pageY,screenX:s.screenX,screenY:s.screenY,localX:s.clientX-n.left,localY:s.clientY-n.top,ctrlKey:t.ctrlKey,altKey:t.altKey,shiftKey:t.shiftKey,metaKey:t.metaKey,Rv:!t.type.startsWith("mouse")&&t.type!=="contextmenu"&&t.type!=="click",Dv:t.type,Vv:s.target,Ov:t.view,Bv:()=>{t.type!=="touchstart"&&ae(t)}}}}function hr(i,t){const e=i.clientX-t.clientX,s=i.clientY-t.clientY;return Math.sqrt(e*e+s*s)}function ae(i){i.cancelable&&i.preventDefault()}function Dt(i){return{nt:i.pageX,st:i.pageY}}function Qe(i){return i.timeStamp||performance.now()}function is(i,t){for(let e=0;e<i.length;++e)if(i[e].identifier===t)return i[e];return null}function ti(i){return{jc:i.jc,Av:{wr:i.Iv.externalId},zv:i.Iv.cursorStyle}}function pc(i,t,e){for(const s of i){const n=s.gt();if(n!==null&&n.br){const r=n.br(t,e);if(r!==null)return{Ov:s,Av:r}}}return null}function ss(i,t){return e=>{var s,n,r,o;return((n=(s=e.Dt())===null||s===void 0?void 0:s.Ta())!==null&&n!==void 0?n:"")!==t?[]:(o=(r=e.ca)===null||r===void 0?void 0:r.call(e,i))!==null&&o!==void 0?o:[]}}function ar(i,t,e,s){if(!i.length)return;let n=0;const r=e/2,o=i[0].At(s,!0);let l=t===1?r-(i[0].Vi()-o/2):i[0].Vi()-o/2-r;l=Math.max(0,l);for(let h=1;h<i.length;h++){const a=i[h],c=i[h-1],u=c.At(s,!1),f=a.Vi(),m=c.Vi();if(t===1?f>m-u:f<m+u){const g=m-u*t;a.Oi(g);const p=g-t*u/2;if((t===1?p<0:p>e)&&l>0){const _=t===1?-1-p:p-e,w=Math.min(_,l);for(let x=n;x<i.length;x++)i[x].Oi(i[x].Vi()+t*w);l-=w}}else n=h,l=t===1?m-u-f:f-(m+u)}}class cr{constructor(t,e,s,n){this.Li=null,this.Lv=null,this.Ev=!1,this.Nv=new We(200),this.Jr=null,this.Fv=0,this.Wv=!1,this.jv=()=>{this.Wv||this.tn.Hv().$t().$h()},this.$v=()=>{this.Wv||this.tn.Hv().$t().$h()},this.tn=t,this.cn=e,this.So=e.layout,this.Vc=s,this.Uv=n==="left",this.qv=ss("normal",n),this.Yv=ss("top",n),this.Zv=ss("bottom",n),this.Xv=document.createElement("div"),this.Xv.style.height="100%",this.Xv.style.overflow="hidden",this.Xv.style.width="25px",this.Xv.style.left="0",this.Xv.style.position="relative",this.Kv=ne(this.Xv,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const r=this.Kv.canvasElement;r.style.position="absolute",r.style.zIndex="1",r.style.left="0",r.style.top="0",this.Gv=ne(this.Xv,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const o=this.Gv.canvasElement;o.style.position="absolute",o.style.zIndex="2",o.style.left="0",o.style.top="0";const l={mv:this.Jv.bind(this),vv:this.Jv.bind(this),lv:this.Qv.bind(this),rv:this.Qv.bind(this),bv:this.tp.bind(this),uv:this.ip.bind(this),ov:this.ip.bind(this),Uf:this.np.bind(this),Wf:this.np.bind(this),Jf:this.sp.bind(this),Tv:this.ep.bind(this)};this.rp=new qs(this.Gv.canvasElement,l,{sv:()=>!this.cn.handleScroll.vertTouchDrag,ev:()=>!0})}S(){this.rp.S(),this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose(),this.Li!==null&&this.Li.Xo().p(this),this.Li=null}hp(){return this.Xv}P(){return this.So.fontSize}lp(){const t=this.Vc.W();return this.Jr!==t.R&&(this.Nv.ir(),this.Jr=t.R),t}ap(){if(this.Li===null)return 0;let t=0;const e=this.lp(),s=M(this.Kv.canvasElement.getContext("2d"));s.save();const n=this.Li.ja();s.font=this.op(),n.length>0&&(t=Math.max(this.Nv.xi(s,n[0].no),this.Nv.xi(s,n[n.length-1].no)));const r=this._p();for(let h=r.length;h--;){const a=this.Nv.xi(s,r[h].Kt());a>t&&(t=a)}const o=this.Li.Ct();if(o!==null&&this.Lv!==null){const h=this.Li.pn(1,o),a=this.Li.pn(this.Lv.height-2,o);t=Math.max(t,this.Nv.xi(s,this.Li.Fi(Math.floor(Math.min(h,a))+.11111111111111,o)),this.Nv.xi(s,this.Li.Fi(Math.ceil(Math.max(h,a))-.11111111111111,o)))}s.restore();const l=t||34;return Ls(Math.ceil(e.C+e.T+e.A+e.I+5+l))}up(t){this.Lv!==null&&te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`)}cp(){return M(this.Lv).width}Gi(t){this.Li!==t&&(this.Li!==null&&this.Li.Xo().p(this),this.Li=t,t.Xo().l(this.do.bind(this),this))}Dt(){return this.Li}ir(){const t=this.tn.dp();this.tn.Hv().$t().L_(t,M(this.Dt()))}fp(t){if(this.Lv===null)return;if(t!==1){this.vp(),this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n),this.Ae(n)}),this.tn.mp(s,this.Zv),this.bp(s),this.tn.mp(s,this.qv),this.wp(s))}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.gp(e),this.tn.mp(e,this.Yv))}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}bt(){var t;(t=this.Li)===null||t===void 0||t.ja()}Jv(t){if(this.Li===null||this.Li.Ni()||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp();this.Ev=!0,e.D_(s,this.Li,t.localY)}Qv(t){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp(),n=this.Li;e.V_(s,n,t.localY)}tp(){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const t=this.tn.Hv().$t(),e=this.tn.dp(),s=this.Li;this.Ev&&(this.Ev=!1,t.O_(e,s))}ip(t){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp();this.Ev=!1,e.O_(s,this.Li)}np(t){this.cn.handleScale.axisDoubleClickReset.price&&this.ir()}sp(t){this.Li!==null&&(!this.tn.Hv().$t().W().handleScale.axisPressedMouseMove.price||this.Li.gh()||this.Li.Vo()||this.Sp(1))}ep(t){this.Sp(0)}_p(){const t=[],e=this.Li===null?void 0:this.Li;return(s=>{for(let n=0;n<s.length;++n){const r=s[n].Rn(this.tn.dp(),e);for(let o=0;o<r.length;o++)t.push(r[o])}})(this.tn.dp().$o()),t}pp({context:t,bitmapSize:e}){const{width:s,height:n}=e,r=this.tn.dp().$t(),o=r.q(),l=r.md();o===l?ki(t,0,0,s,n,o):no(t,0,0,s,n,o,l)}Ae({context:t,bitmapSize:e,horizontalPixelRatio:s}){if(this.Lv===null||this.Li===null||!this.Li.W().borderVisible)return;t.fillStyle=this.Li.W().borderColor;const n=Math.max(1,Math.floor(this.lp().C*s));let r;r=this.Uv?e.width-n:0,t.fillRect(r,0,n,e.height)}bp(t){if(this.Lv===null||this.Li===null)return;const e=this.Li.ja(),s=this.Li.W(),n=this.lp(),r=this.Uv?this.Lv.width-n.T:0;s.borderVisible&&s.ticksVisible&&t.useBitmapCoordinateSpace(({context:o,horizontalPixelRatio:l,verticalPixelRatio:h})=>{o.fillStyle=s.borderColor;const a=Math.max(1,Math.floor(h)),c=Math.floor(.5*h),u=Math.round(n.T*l);o.beginPath();for(const f of e)o.rect(Math.floor(r*l),Math.round(f.La*h)-c,u,a);o.fill()}),t.useMediaCoordinateSpace(({context:o})=>{var l;o.font=this.op(),o.fillStyle=(l=s.textColor)!==null&&l!==void 0?l:this.So.textColor,o.textAlign=this.Uv?"right":"left",o.textBaseline="middle";const h=this.Uv?Math.round(r-n.A):Math.round(r+n.T+n.A),a=e.map(c=>this.Nv.Mi(o,c.no));for(let c=e.length;c--;){const u=e[c];o.fillText(u.no,h,u.La+a[c])}})}vp(){if(this.Lv===null||this.Li===null)return;const t=[],e=this.Li.$o().slice(),s=this.tn.dp(),n=this.lp();this.Li===s.vr()&&this.tn.dp().$o().forEach(o=>{s.dr(o)&&e.push(o)});const r=this.Li;e.forEach(o=>{o.Rn(s,r).forEach(l=>{l.Oi(null),l.Bi()&&t.push(l)})}),t.forEach(o=>o.Oi(o.ki())),this.Li.W().alignLabels&&this.kp(t,n)}kp(t,e){if(this.Lv===null)return;const s=this.Lv.height/2,n=t.filter(o=>o.ki()<=s),r=t.filter(o=>o.ki()>s);n.sort((o,l)=>l.ki()-o.ki()),r.sort((o,l)=>o.ki()-l.ki());for(const o of t){const l=Math.floor(o.At(e)/2),h=o.ki();h>-l&&h<l&&o.Oi(l),h>this.Lv.height-l&&h<this.Lv.height+l&&o.Oi(this.Lv.height-l)}ar(n,1,this.Lv.height,e),ar(r,-1,this.Lv.height,e)}wp(t){if(this.Lv===null)return;const e=this._p(),s=this.lp(),n=this.Uv?"right":"left";e.forEach(r=>{r.Ai()&&r.gt(M(this.Li)).X(t,s,this.Nv,n)})}gp(t){if(this.Lv===null||this.Li===null)return;const e=this.tn.Hv().$t(),s=[],n=this.tn.dp(),r=e.Yc().Rn(n,this.Li);r.length&&s.push(r);const o=this.lp(),l=this.Uv?"right":"left";s.forEach(h=>{h.forEach(a=>{a.gt(M(this.Li)).X(t,o,this.Nv,l)})})}Sp(t){this.Xv.style.cursor=t===1?"ns-resize":"default"}do(){const t=this.ap();this.Fv<t&&this.tn.Hv().$t().Xl(),this.Fv=t}op(){return be(this.So.fontSize,this.So.fontFamily)}}function vc(i,t){var e,s;return(s=(e=i._a)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function ei(i,t){var e,s;return(s=(e=i.Pn)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function _c(i,t){var e,s;return(s=(e=i.Ji)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function bc(i,t){var e,s;return(s=(e=i.la)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}class Gs{constructor(t,e){this.Lv=J({width:0,height:0}),this.yp=null,this.Cp=null,this.Tp=null,this.Pp=null,this.Rp=!1,this.Dp=new st,this.Vp=new st,this.Op=0,this.Bp=!1,this.Ap=null,this.Ip=!1,this.zp=null,this.Lp=null,this.Wv=!1,this.jv=()=>{this.Wv||this.Ep===null||this.$i().$h()},this.$v=()=>{this.Wv||this.Ep===null||this.$i().$h()},this.Jd=t,this.Ep=e,this.Ep.F_().l(this.Np.bind(this),this,!0),this.Fp=document.createElement("td"),this.Fp.style.padding="0",this.Fp.style.position="relative";const s=document.createElement("div");s.style.width="100%",s.style.height="100%",s.style.position="relative",s.style.overflow="hidden",this.Wp=document.createElement("td"),this.Wp.style.padding="0",this.jp=document.createElement("td"),this.jp.style.padding="0",this.Fp.appendChild(s),this.Kv=ne(s,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const n=this.Kv.canvasElement;n.style.position="absolute",n.style.zIndex="1",n.style.left="0",n.style.top="0",this.Gv=ne(s,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const r=this.Gv.canvasElement;r.style.position="absolute",r.style.zIndex="2",r.style.left="0",r.style.top="0",this.Hp=document.createElement("tr"),this.Hp.appendChild(this.Wp),this.Hp.appendChild(this.Fp),this.Hp.appendChild(this.jp),this.$p(),this.rp=new qs(this.Gv.canvasElement,this,{sv:()=>this.Ap===null&&!this.Jd.W().handleScroll.vertTouchDrag,ev:()=>this.Ap===null&&!this.Jd.W().handleScroll.horzTouchDrag})}S(){this.yp!==null&&this.yp.S(),this.Cp!==null&&this.Cp.S(),this.Tp=null,this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose(),this.Ep!==null&&this.Ep.F_().p(this),this.rp.S()}dp(){return M(this.Ep)}Up(t){var e,s;this.Ep!==null&&this.Ep.F_().p(this),this.Ep=t,this.Ep!==null&&this.Ep.F_().l(Gs.prototype.Np.bind(this),this,!0),this.$p(),this.Jd.qp().indexOf(this)===this.Jd.qp().length-1?(this.Tp=(e=this.Tp)!==null&&e!==void 0?e:new gc(this.Fp,this.Jd),this.Tp.bt()):((s=this.Tp)===null||s===void 0||s.tf(),this.Tp=null)}Hv(){return this.Jd}hp(){return this.Hp}$p(){if(this.Ep!==null&&(this.Yp(),this.$i().wt().length!==0)){if(this.yp!==null){const t=this.Ep.P_();this.yp.Gi(M(t))}if(this.Cp!==null){const t=this.Ep.R_();this.Cp.Gi(M(t))}}}Zp(){this.yp!==null&&this.yp.bt(),this.Cp!==null&&this.Cp.bt()}g_(){return this.Ep!==null?this.Ep.g_():0}M_(t){this.Ep&&this.Ep.M_(t)}Jf(t){if(!this.Ep)return;this.Xp();const e=t.localX,s=t.localY;this.Kp(e,s,t)}mv(t){this.Xp(),this.Gp(),this.Kp(t.localX,t.localY,t)}Qf(t){var e;if(!this.Ep)return;this.Xp();const s=t.localX,n=t.localY;this.Kp(s,n,t);const r=this.br(s,n);this.Jd.Jp((e=r?.zv)!==null&&e!==void 0?e:null),this.$i().Wc(r&&{jc:r.jc,Av:r.Av})}cv(t){this.Ep!==null&&(this.Xp(),this.Qp(t))}Uf(t){this.Ep!==null&&this.tm(this.Vp,t)}Wf(t){this.Uf(t)}lv(t){this.Xp(),this.im(t),this.Kp(t.localX,t.localY,t)}uv(t){this.Ep!==null&&(this.Xp(),this.Bp=!1,this.nm(t))}_v(t){this.Ep!==null&&this.Qp(t)}Pv(t){if(this.Bp=!0,this.Ap===null){const e={x:t.localX,y:t.localY};this.sm(e,e,t)}}Tv(t){this.Ep!==null&&(this.Xp(),this.Ep.$t().Wc(null),this.rm())}hm(){return this.Dp}lm(){return this.Vp}Mv(){this.Op=1,this.$i().Un()}xv(t,e){if(!this.Jd.W().handleScale.pinch)return;const s=5*(e-this.Op);this.Op=e,this.$i().Jc(t.nt,s)}vv(t){this.Bp=!1,this.Ip=this.Ap!==null,this.Gp();const e=this.$i().Yc();this.Ap!==null&&e.yt()&&(this.zp={x:e.Yt(),y:e.Zt()},this.Ap={x:t.localX,y:t.localY})}rv(t){if(this.Ep===null)return;const e=t.localX,s=t.localY;if(this.Ap===null)this.im(t);else{this.Ip=!1;const n=M(this.zp),r=n.x+(e-this.Ap.x),o=n.y+(s-this.Ap.y);this.Kp(r,o,t)}}ov(t){this.Hv().W().trackingMode.exitMode===0&&(this.Ip=!0),this.am(),this.nm(t)}br(t,e){const s=this.Ep;return s===null?null:function(n,r,o){const l=n.$o(),h=function(a,c,u){var f,m;let g,p;for(const x of a){const $=(m=(f=x.fa)===null||f===void 0?void 0:f.call(x,c,u))!==null&&m!==void 0?m:[];for(const E of $)_=E.zOrder,(!(w=g?.zOrder)||_==="top"&&w!=="top"||_==="normal"&&w==="bottom")&&(g=E,p=x)}var _,w;return g&&p?{Iv:g,jc:p}:null}(l,r,o);if(h?.Iv.zOrder==="top")return ti(h);for(const a of l){if(h&&h.jc===a&&h.Iv.zOrder!=="bottom"&&!h.Iv.isBackground)return ti(h);const c=pc(a.Pn(n),r,o);if(c!==null)return{jc:a,Ov:c.Ov,Av:c.Av};if(h&&h.jc===a&&h.Iv.zOrder!=="bottom"&&h.Iv.isBackground)return ti(h)}return h?.Iv?ti(h):null}(s,t,e)}om(t,e){M(e==="left"?this.yp:this.Cp).up(J({width:t,height:this.Lv.height}))}_m(){return this.Lv}up(t){te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Fp.style.width=t.width+"px",this.Fp.style.height=t.height+"px")}um(){const t=M(this.Ep);t.T_(t.P_()),t.T_(t.R_());for(const e of t.Oa())if(t.dr(e)){const s=e.Dt();s!==null&&t.T_(s),e.Vn()}}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}fp(t){if(t===0||this.Ep===null)return;if(t>1&&this.um(),this.yp!==null&&this.yp.fp(t),this.Cp!==null&&this.Cp.fp(t),t!==1){this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n)}),this.Ep&&(this.dm(s,vc),this.fm(s),this.vm(s),this.dm(s,ei),this.dm(s,_c)))}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.pm(e),this.dm(e,bc))}bm(){return this.yp}wm(){return this.Cp}mp(t,e){this.dm(t,e)}Np(){this.Ep!==null&&this.Ep.F_().p(this),this.Ep=null}Qp(t){this.tm(this.Dp,t)}tm(t,e){const s=e.localX,n=e.localY;t.M()&&t.m(this.$i().St().Eu(s),{x:s,y:n},e)}pp({context:t,bitmapSize:e}){const{width:s,height:n}=e,r=this.$i(),o=r.q(),l=r.md();o===l?ki(t,0,0,s,n,l):no(t,0,0,s,n,o,l)}fm(t){const e=M(this.Ep).W_().Uh().gt();e!==null&&e.X(t,!1)}vm(t){const e=this.$i().qc();this.gm(t,ei,Ts,e),this.gm(t,ei,ai,e)}pm(t){this.gm(t,ei,ai,this.$i().Yc())}dm(t,e){const s=M(this.Ep).$o();for(const n of s)this.gm(t,e,Ts,n);for(const n of s)this.gm(t,e,ai,n)}gm(t,e,s,n){const r=M(this.Ep),o=r.$t().Fc(),l=o!==null&&o.jc===n,h=o!==null&&l&&o.Av!==void 0?o.Av.gr:void 0;Ps(e,a=>s(a,t,l,h),n,r)}Yp(){if(this.Ep===null)return;const t=this.Jd,e=this.Ep.P_().W().visible,s=this.Ep.R_().W().visible;e||this.yp===null||(this.Wp.removeChild(this.yp.hp()),this.yp.S(),this.yp=null),s||this.Cp===null||(this.jp.removeChild(this.Cp.hp()),this.Cp.S(),this.Cp=null);const n=t.$t()._d();e&&this.yp===null&&(this.yp=new cr(this,t.W(),n,"left"),this.Wp.appendChild(this.yp.hp())),s&&this.Cp===null&&(this.Cp=new cr(this,t.W(),n,"right"),this.jp.appendChild(this.Cp.hp()))}Mm(t){return t.Rv&&this.Bp||this.Ap!==null}xm(t){return Math.max(0,Math.min(t,this.Lv.width-1))}Sm(t){return Math.max(0,Math.min(t,this.Lv.height-1))}Kp(t,e,s){this.$i().hd(this.xm(t),this.Sm(e),s,M(this.Ep))}rm(){this.$i().ad()}am(){this.Ip&&(this.Ap=null,this.rm())}sm(t,e,s){this.Ap=t,this.Ip=!1,this.Kp(e.x,e.y,s);const n=this.$i().Yc();this.zp={x:n.Yt(),y:n.Zt()}}$i(){return this.Jd.$t()}nm(t){if(!this.Rp)return;const e=this.$i(),s=this.dp();if(e.I_(s,s.vn()),this.Pp=null,this.Rp=!1,e.sd(),this.Lp!==null){const n=performance.now(),r=e.St();this.Lp.Dr(r.ju(),n),this.Lp.Ju(n)||e.Zn(this.Lp)}}Xp(){this.Ap=null}Gp(){if(this.Ep){if(this.$i().Un(),document.activeElement!==document.body&&document.activeElement!==document.documentElement)M(document.activeElement).blur();else{const t=document.getSelection();t!==null&&t.removeAllRanges()}!this.Ep.vn().Ni()&&this.$i().St().Ni()}}im(t){if(this.Ep===null)return;const e=this.$i(),s=e.St();if(s.Ni())return;const n=this.Jd.W(),r=n.handleScroll,o=n.kineticScroll;if((!r.pressedMouseMove||t.Rv)&&(!r.horzTouchDrag&&!r.vertTouchDrag||!t.Rv))return;const l=this.Ep.vn(),h=performance.now();if(this.Pp!==null||this.Mm(t)||(this.Pp={x:t.clientX,y:t.clientY,Vd:h,km:t.localX,ym:t.localY}),this.Pp!==null&&!this.Rp&&(this.Pp.x!==t.clientX||this.Pp.y!==t.clientY)){if(t.Rv&&o.touch||!t.Rv&&o.mouse){const a=s.he();this.Lp=new fc(.2/a,7/a,.997,15/a),this.Lp.qd(s.ju(),this.Pp.Vd)}else this.Lp=null;l.Ni()||e.B_(this.Ep,l,t.localY),e.td(t.localX),this.Rp=!0}this.Rp&&(l.Ni()||e.A_(this.Ep,l,t.localY),e.nd(t.localX),this.Lp!==null&&this.Lp.qd(s.ju(),h))}}class ur{constructor(t,e,s,n,r){this.ft=!0,this.Lv=J({width:0,height:0}),this.jv=()=>this.fp(3),this.Uv=t==="left",this.Vc=s._d,this.cn=e,this.Cm=n,this.Tm=r,this.Xv=document.createElement("div"),this.Xv.style.width="25px",this.Xv.style.height="100%",this.Xv.style.overflow="hidden",this.Kv=ne(this.Xv,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv)}S(){this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose()}hp(){return this.Xv}_m(){return this.Lv}up(t){te(this.Lv,t)||(this.Lv=t,this.Kv.resizeCanvasElement(t),this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`,this.ft=!0)}fp(t){if(t<3&&!this.ft||this.Lv.width===0||this.Lv.height===0)return;this.ft=!1,this.Kv.applySuggestedBitmapSize();const e=ie(this.Kv);e!==null&&e.useBitmapCoordinateSpace(s=>{this.pp(s),this.Ae(s)})}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}Ae({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(!this.Cm())return;t.fillStyle=this.cn.timeScale.borderColor;const r=Math.floor(this.Vc.W().C*s),o=Math.floor(this.Vc.W().C*n),l=this.Uv?e.width-r:0;t.fillRect(l,0,r,o)}pp({context:t,bitmapSize:e}){ki(t,0,0,e.width,e.height,this.Tm())}}function Ys(i){return t=>{var e,s;return(s=(e=t.da)===null||e===void 0?void 0:e.call(t,i))!==null&&s!==void 0?s:[]}}const wc=Ys("normal"),yc=Ys("top"),xc=Ys("bottom");class Sc{constructor(t,e){this.Pm=null,this.Rm=null,this.k=null,this.Dm=!1,this.Lv=J({width:0,height:0}),this.Vm=new st,this.Nv=new We(5),this.Wv=!1,this.jv=()=>{this.Wv||this.Jd.$t().$h()},this.$v=()=>{this.Wv||this.Jd.$t().$h()},this.Jd=t,this.U_=e,this.cn=t.W().layout,this.Zd=document.createElement("tr"),this.Om=document.createElement("td"),this.Om.style.padding="0",this.Bm=document.createElement("td"),this.Bm.style.padding="0",this.Xv=document.createElement("td"),this.Xv.style.height="25px",this.Xv.style.padding="0",this.Am=document.createElement("div"),this.Am.style.width="100%",this.Am.style.height="100%",this.Am.style.position="relative",this.Am.style.overflow="hidden",this.Xv.appendChild(this.Am),this.Kv=ne(this.Am,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const s=this.Kv.canvasElement;s.style.position="absolute",s.style.zIndex="1",s.style.left="0",s.style.top="0",this.Gv=ne(this.Am,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const n=this.Gv.canvasElement;n.style.position="absolute",n.style.zIndex="2",n.style.left="0",n.style.top="0",this.Zd.appendChild(this.Om),this.Zd.appendChild(this.Xv),this.Zd.appendChild(this.Bm),this.Im(),this.Jd.$t().w_().l(this.Im.bind(this),this),this.rp=new qs(this.Gv.canvasElement,this,{sv:()=>!0,ev:()=>!this.Jd.W().handleScroll.horzTouchDrag})}S(){this.rp.S(),this.Pm!==null&&this.Pm.S(),this.Rm!==null&&this.Rm.S(),this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose()}hp(){return this.Zd}zm(){return this.Pm}Lm(){return this.Rm}mv(t){if(this.Dm)return;this.Dm=!0;const e=this.Jd.$t();!e.St().Ni()&&this.Jd.W().handleScale.axisPressedMouseMove.time&&e.Gc(t.localX)}vv(t){this.mv(t)}bv(){const t=this.Jd.$t();!t.St().Ni()&&this.Dm&&(this.Dm=!1,this.Jd.W().handleScale.axisPressedMouseMove.time&&t.rd())}lv(t){const e=this.Jd.$t();!e.St().Ni()&&this.Jd.W().handleScale.axisPressedMouseMove.time&&e.ed(t.localX)}rv(t){this.lv(t)}uv(){this.Dm=!1;const t=this.Jd.$t();t.St().Ni()&&!this.Jd.W().handleScale.axisPressedMouseMove.time||t.rd()}ov(){this.uv()}Uf(){this.Jd.W().handleScale.axisDoubleClickReset.time&&this.Jd.$t().Kn()}Wf(){this.Uf()}Jf(){this.Jd.$t().W().handleScale.axisPressedMouseMove.time&&this.Sp(1)}Tv(){this.Sp(0)}_m(){return this.Lv}Em(){return this.Vm}Nm(t,e,s){te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`,this.Vm.m(t)),this.Pm!==null&&this.Pm.up(J({width:e,height:t.height})),this.Rm!==null&&this.Rm.up(J({width:s,height:t.height}))}Fm(){const t=this.Wm();return Math.ceil(t.C+t.T+t.P+t.L+t.B+t.jm)}bt(){this.Jd.$t().St().ja()}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}fp(t){if(t===0)return;if(t!==1){this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n),this.Ae(n),this.Hm(s,xc)}),this.bp(s),this.Hm(s,wc)),this.Pm!==null&&this.Pm.fp(t),this.Rm!==null&&this.Rm.fp(t)}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.$m([...this.Jd.$t().wt(),this.Jd.$t().Yc()],e),this.Hm(e,yc))}Hm(t,e){const s=this.Jd.$t().wt();for(const n of s)Ps(e,r=>Ts(r,t,!1,void 0),n,void 0);for(const n of s)Ps(e,r=>ai(r,t,!1,void 0),n,void 0)}pp({context:t,bitmapSize:e}){ki(t,0,0,e.width,e.height,this.Jd.$t().md())}Ae({context:t,bitmapSize:e,verticalPixelRatio:s}){if(this.Jd.W().timeScale.borderVisible){t.fillStyle=this.Um();const n=Math.max(1,Math.floor(this.Wm().C*s));t.fillRect(0,0,e.width,n)}}bp(t){const e=this.Jd.$t().St(),s=e.ja();if(!s||s.length===0)return;const n=this.U_.maxTickMarkWeight(s),r=this.Wm(),o=e.W();o.borderVisible&&o.ticksVisible&&t.useBitmapCoordinateSpace(({context:l,horizontalPixelRatio:h,verticalPixelRatio:a})=>{l.strokeStyle=this.Um(),l.fillStyle=this.Um();const c=Math.max(1,Math.floor(h)),u=Math.floor(.5*h);l.beginPath();const f=Math.round(r.T*a);for(let m=s.length;m--;){const g=Math.round(s[m].coord*h);l.rect(g-u,0,c,f)}l.fill()}),t.useMediaCoordinateSpace(({context:l})=>{const h=r.C+r.T+r.L+r.P/2;l.textAlign="center",l.textBaseline="middle",l.fillStyle=this.$(),l.font=this.op();for(const a of s)if(a.weight<n){const c=a.needAlignCoordinate?this.qm(l,a.coord,a.label):a.coord;l.fillText(a.label,c,h)}this.Jd.W().timeScale.allowBoldLabels&&(l.font=this.Ym());for(const a of s)if(a.weight>=n){const c=a.needAlignCoordinate?this.qm(l,a.coord,a.label):a.coord;l.fillText(a.label,c,h)}})}qm(t,e,s){const n=this.Nv.xi(t,s),r=n/2,o=Math.floor(e-r)+.5;return o<0?e+=Math.abs(0-o):o+n>this.Lv.width&&(e-=Math.abs(this.Lv.width-(o+n))),e}$m(t,e){const s=this.Wm();for(const n of t)for(const r of n.Qi())r.gt().X(e,s)}Um(){return this.Jd.W().timeScale.borderColor}$(){return this.cn.textColor}j(){return this.cn.fontSize}op(){return be(this.j(),this.cn.fontFamily)}Ym(){return be(this.j(),this.cn.fontFamily,"bold")}Wm(){this.k===null&&(this.k={C:1,N:NaN,L:NaN,B:NaN,ji:NaN,T:5,P:NaN,R:"",Wi:new We,jm:0});const t=this.k,e=this.op();if(t.R!==e){const s=this.j();t.P=s,t.R=e,t.L=3*s/12,t.B=3*s/12,t.ji=9*s/12,t.N=0,t.jm=4*s/12,t.Wi.ir()}return this.k}Sp(t){this.Xv.style.cursor=t===1?"ew-resize":"default"}Im(){const t=this.Jd.$t(),e=t.W();e.leftPriceScale.visible||this.Pm===null||(this.Om.removeChild(this.Pm.hp()),this.Pm.S(),this.Pm=null),e.rightPriceScale.visible||this.Rm===null||(this.Bm.removeChild(this.Rm.hp()),this.Rm.S(),this.Rm=null);const s={_d:this.Jd.$t()._d()},n=()=>e.leftPriceScale.borderVisible&&t.St().W().borderVisible,r=()=>t.md();e.leftPriceScale.visible&&this.Pm===null&&(this.Pm=new ur("left",e,s,n,r),this.Om.appendChild(this.Pm.hp())),e.rightPriceScale.visible&&this.Rm===null&&(this.Rm=new ur("right",e,s,n,r),this.Bm.appendChild(this.Rm.hp()))}}const Mc=!!we&&!!navigator.userAgentData&&navigator.userAgentData.brands.some(i=>i.brand.includes("Chromium"))&&!!we&&(!((ns=navigator?.userAgentData)===null||ns===void 0)&&ns.platform?navigator.userAgentData.platform==="Windows":navigator.userAgent.toLowerCase().indexOf("win")>=0);var ns;class Cc{constructor(t,e,s){var n;this.Zm=[],this.Xm=0,this.ro=0,this.o_=0,this.Km=0,this.Gm=0,this.Jm=null,this.Qm=!1,this.Dp=new st,this.Vp=new st,this.Pc=new st,this.tb=null,this.ib=null,this.Gd=t,this.cn=e,this.U_=s,this.Zd=document.createElement("div"),this.Zd.classList.add("tv-lightweight-charts"),this.Zd.style.overflow="hidden",this.Zd.style.direction="ltr",this.Zd.style.width="100%",this.Zd.style.height="100%",(n=this.Zd).style.userSelect="none",n.style.webkitUserSelect="none",n.style.msUserSelect="none",n.style.MozUserSelect="none",n.style.webkitTapHighlightColor="transparent",this.nb=document.createElement("table"),this.nb.setAttribute("cellspacing","0"),this.Zd.appendChild(this.nb),this.sb=this.eb.bind(this),rs(this.cn)&&this.rb(!0),this.$i=new hc(this.Dc.bind(this),this.cn,s),this.$t().Zc().l(this.hb.bind(this),this),this.lb=new Sc(this,this.U_),this.nb.appendChild(this.lb.hp());const r=e.autoSize&&this.ab();let o=this.cn.width,l=this.cn.height;if(r||o===0||l===0){const h=t.getBoundingClientRect();o=o||h.width,l=l||h.height}this.ob(o,l),this._b(),t.appendChild(this.Zd),this.ub(),this.$i.St().sc().l(this.$i.Xl.bind(this.$i),this),this.$i.w_().l(this.$i.Xl.bind(this.$i),this)}$t(){return this.$i}W(){return this.cn}qp(){return this.Zm}cb(){return this.lb}S(){this.rb(!1),this.Xm!==0&&window.cancelAnimationFrame(this.Xm),this.$i.Zc().p(this),this.$i.St().sc().p(this),this.$i.w_().p(this),this.$i.S();for(const t of this.Zm)this.nb.removeChild(t.hp()),t.hm().p(this),t.lm().p(this),t.S();this.Zm=[],M(this.lb).S(),this.Zd.parentElement!==null&&this.Zd.parentElement.removeChild(this.Zd),this.Pc.S(),this.Dp.S(),this.Vp.S(),this.fb()}ob(t,e,s=!1){if(this.ro===e&&this.o_===t)return;const n=function(l){const h=Math.floor(l.width),a=Math.floor(l.height);return J({width:h-h%2,height:a-a%2})}(J({width:t,height:e}));this.ro=n.height,this.o_=n.width;const r=this.ro+"px",o=this.o_+"px";M(this.Zd).style.height=r,M(this.Zd).style.width=o,this.nb.style.height=r,this.nb.style.width=o,s?this.pb(ht.es(),performance.now()):this.$i.Xl()}fp(t){t===void 0&&(t=ht.es());for(let e=0;e<this.Zm.length;e++)this.Zm[e].fp(t.Hn(e).Fn);this.cn.timeScale.visible&&this.lb.fp(t.jn())}Hh(t){const e=rs(this.cn);this.$i.Hh(t);const s=rs(this.cn);s!==e&&this.rb(s),this.ub(),this.mb(t)}hm(){return this.Dp}lm(){return this.Vp}Zc(){return this.Pc}bb(){this.Jm!==null&&(this.pb(this.Jm,performance.now()),this.Jm=null);const t=this.wb(null),e=document.createElement("canvas");e.width=t.width,e.height=t.height;const s=M(e.getContext("2d"));return this.wb(s),e}gb(t){return t==="left"&&!this.Mb()||t==="right"&&!this.xb()||this.Zm.length===0?0:M(t==="left"?this.Zm[0].bm():this.Zm[0].wm()).cp()}Sb(){return this.cn.autoSize&&this.tb!==null}kb(){return this.Zd}Jp(t){this.ib=t,this.ib?this.kb().style.setProperty("cursor",t):this.kb().style.removeProperty("cursor")}yb(){return this.ib}Cb(){return mt(this.Zm[0])._m()}mb(t){(t.autoSize!==void 0||!this.tb||t.width===void 0&&t.height===void 0)&&(t.autoSize&&!this.tb&&this.ab(),t.autoSize===!1&&this.tb!==null&&this.fb(),t.autoSize||t.width===void 0&&t.height===void 0||this.ob(t.width||this.o_,t.height||this.ro))}wb(t){let e=0,s=0;const n=this.Zm[0],r=(l,h)=>{let a=0;for(let c=0;c<this.Zm.length;c++){const u=this.Zm[c],f=M(l==="left"?u.bm():u.wm()),m=f.Mp();t!==null&&f.xp(t,h,a),a+=m.height}};this.Mb()&&(r("left",0),e+=M(n.bm()).Mp().width);for(let l=0;l<this.Zm.length;l++){const h=this.Zm[l],a=h.Mp();t!==null&&h.xp(t,e,s),s+=a.height}e+=n.Mp().width,this.xb()&&(r("right",e),e+=M(n.wm()).Mp().width);const o=(l,h,a)=>{M(l==="left"?this.lb.zm():this.lb.Lm()).xp(M(t),h,a)};if(this.cn.timeScale.visible){const l=this.lb.Mp();if(t!==null){let h=0;this.Mb()&&(o("left",h,s),h=M(n.bm()).Mp().width),this.lb.xp(t,h,s),h+=l.width,this.xb()&&o("right",h,s)}s+=l.height}return J({width:e,height:s})}Tb(){let t=0,e=0,s=0;for(const g of this.Zm)this.Mb()&&(e=Math.max(e,M(g.bm()).ap(),this.cn.leftPriceScale.minimumWidth)),this.xb()&&(s=Math.max(s,M(g.wm()).ap(),this.cn.rightPriceScale.minimumWidth)),t+=g.g_();e=Ls(e),s=Ls(s);const n=this.o_,r=this.ro,o=Math.max(n-e-s,0),l=this.cn.timeScale.visible;let h=l?Math.max(this.lb.Fm(),this.cn.timeScale.minimumHeight):0;var a;h=(a=h)+a%2;const c=0+h,u=r<c?0:r-c,f=u/t;let m=0;for(let g=0;g<this.Zm.length;++g){const p=this.Zm[g];p.Up(this.$i.Uc()[g]);let _=0,w=0;w=g===this.Zm.length-1?u-m:Math.round(p.g_()*f),_=Math.max(w,2),m+=_,p.up(J({width:o,height:_})),this.Mb()&&p.om(e,"left"),this.xb()&&p.om(s,"right"),p.dp()&&this.$i.Xc(p.dp(),_)}this.lb.Nm(J({width:l?o:0,height:h}),l?e:0,l?s:0),this.$i.x_(o),this.Km!==e&&(this.Km=e),this.Gm!==s&&(this.Gm=s)}rb(t){t?this.Zd.addEventListener("wheel",this.sb,{passive:!1}):this.Zd.removeEventListener("wheel",this.sb)}Pb(t){switch(t.deltaMode){case t.DOM_DELTA_PAGE:return 120;case t.DOM_DELTA_LINE:return 32}return Mc?1/window.devicePixelRatio:1}eb(t){if(!(t.deltaX!==0&&this.cn.handleScroll.mouseWheel||t.deltaY!==0&&this.cn.handleScale.mouseWheel))return;const e=this.Pb(t),s=e*t.deltaX/100,n=-e*t.deltaY/100;if(t.cancelable&&t.preventDefault(),n!==0&&this.cn.handleScale.mouseWheel){const r=Math.sign(n)*Math.min(1,Math.abs(n)),o=t.clientX-this.Zd.getBoundingClientRect().left;this.$t().Jc(o,r)}s!==0&&this.cn.handleScroll.mouseWheel&&this.$t().Qc(-80*s)}pb(t,e){var s;const n=t.jn();n===3&&this.Rb(),n!==3&&n!==2||(this.Db(t),this.Vb(t,e),this.lb.bt(),this.Zm.forEach(r=>{r.Zp()}),((s=this.Jm)===null||s===void 0?void 0:s.jn())===3&&(this.Jm.ts(t),this.Rb(),this.Db(this.Jm),this.Vb(this.Jm,e),t=this.Jm,this.Jm=null)),this.fp(t)}Vb(t,e){for(const s of t.Qn())this.ns(s,e)}Db(t){const e=this.$i.Uc();for(let s=0;s<e.length;s++)t.Hn(s).Wn&&e[s].E_()}ns(t,e){const s=this.$i.St();switch(t.qn){case 0:s.rc();break;case 1:s.hc(t.Vt);break;case 2:s.Gn(t.Vt);break;case 3:s.Jn(t.Vt);break;case 4:s.Uu();break;case 5:t.Vt.Ju(e)||s.Jn(t.Vt.Qu(e))}}Dc(t){this.Jm!==null?this.Jm.ts(t):this.Jm=t,this.Qm||(this.Qm=!0,this.Xm=window.requestAnimationFrame(e=>{if(this.Qm=!1,this.Xm=0,this.Jm!==null){const s=this.Jm;this.Jm=null,this.pb(s,e);for(const n of s.Qn())if(n.qn===5&&!n.Vt.Ju(e)){this.$t().Zn(n.Vt);break}}}))}Rb(){this._b()}_b(){const t=this.$i.Uc(),e=t.length,s=this.Zm.length;for(let n=e;n<s;n++){const r=mt(this.Zm.pop());this.nb.removeChild(r.hp()),r.hm().p(this),r.lm().p(this),r.S()}for(let n=s;n<e;n++){const r=new Gs(this,t[n]);r.hm().l(this.Ob.bind(this),this),r.lm().l(this.Bb.bind(this),this),this.Zm.push(r),this.nb.insertBefore(r.hp(),this.lb.hp())}for(let n=0;n<e;n++){const r=t[n],o=this.Zm[n];o.dp()!==r?o.Up(r):o.$p()}this.ub(),this.Tb()}Ab(t,e,s){var n;const r=new Map;t!==null&&this.$i.wt().forEach(c=>{const u=c.In().hl(t);u!==null&&r.set(c,u)});let o;if(t!==null){const c=(n=this.$i.St().Ui(t))===null||n===void 0?void 0:n.originalTime;c!==void 0&&(o=c)}const l=this.$t().Fc(),h=l!==null&&l.jc instanceof Xs?l.jc:void 0,a=l!==null&&l.Av!==void 0?l.Av.wr:void 0;return{Ib:o,se:t??void 0,zb:e??void 0,Lb:h,Eb:r,Nb:a,Fb:s??void 0}}Ob(t,e,s){this.Dp.m(()=>this.Ab(t,e,s))}Bb(t,e,s){this.Vp.m(()=>this.Ab(t,e,s))}hb(t,e,s){this.Pc.m(()=>this.Ab(t,e,s))}ub(){const t=this.cn.timeScale.visible?"":"none";this.lb.hp().style.display=t}Mb(){return this.Zm[0].dp().P_().W().visible}xb(){return this.Zm[0].dp().R_().W().visible}ab(){return"ResizeObserver"in window&&(this.tb=new ResizeObserver(t=>{const e=t.find(s=>s.target===this.Gd);e&&this.ob(e.contentRect.width,e.contentRect.height)}),this.tb.observe(this.Gd,{box:"border-box"}),!0)}fb(){this.tb!==null&&this.tb.disconnect(),this.tb=null}}function rs(i){return!!(i.handleScroll.mouseWheel||i.handleScale.mouseWheel)}function $c(i){return function(t){return t.open!==void 0}(i)||function(t){return t.value!==void 0}(i)}function Mo(i,t){var e={};for(var s in i)Object.prototype.hasOwnProperty.call(i,s)&&t.indexOf(s)<0&&(e[s]=i[s]);if(i!=null&&typeof Object.getOwnPropertySymbols=="function"){var n=0;for(s=Object.getOwnPropertySymbols(i);n<s.length;n++)t.indexOf(s[n])<0&&Object.prototype.propertyIsEnumerable.call(i,s[n])&&(e[s[n]]=i[s[n]])}return e}function dr(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.color!==void 0&&(r.V=e.color),r}function Ec(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.lineColor!==void 0&&(r.lt=e.lineColor),e.topColor!==void 0&&(r.Ts=e.topColor),e.bottomColor!==void 0&&(r.Ps=e.bottomColor),r}function kc(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.topLineColor!==void 0&&(r.Pe=e.topLineColor),e.bottomLineColor!==void 0&&(r.Re=e.bottomLineColor),e.topFillColor1!==void 0&&(r.Se=e.topFillColor1),e.topFillColor2!==void 0&&(r.ke=e.topFillColor2),e.bottomFillColor1!==void 0&&(r.ye=e.bottomFillColor1),e.bottomFillColor2!==void 0&&(r.Ce=e.bottomFillColor2),r}function Lc(i,t,e,s){const n={se:t,ot:i,Vt:[e.open,e.high,e.low,e.close],Ib:s};return e.color!==void 0&&(n.V=e.color),n}function Tc(i,t,e,s){const n={se:t,ot:i,Vt:[e.open,e.high,e.low,e.close],Ib:s};return e.color!==void 0&&(n.V=e.color),e.borderColor!==void 0&&(n.Ot=e.borderColor),e.wickColor!==void 0&&(n.Zh=e.wickColor),n}function Pc(i,t,e,s,n){const r=mt(n)(e),o=Math.max(...r),l=Math.min(...r),h=r[r.length-1],a=[h,o,l,h],c=e,{time:u,color:f}=c;return{se:t,ot:i,Vt:a,Ib:s,He:Mo(c,["time","color"]),V:f}}function ii(i){return i.Vt!==void 0}function fr(i,t){return t.customValues!==void 0&&(i.Wb=t.customValues),i}function Jt(i){return(t,e,s,n,r,o)=>function(l,h){return h?h(l):(a=l).open===void 0&&a.value===void 0;var a}(s,o)?fr({ot:t,se:e,Ib:n},s):fr(i(t,e,s,n,r),s)}function gr(i){return{Candlestick:Jt(Tc),Bar:Jt(Lc),Area:Jt(Ec),Baseline:Jt(kc),Histogram:Jt(dr),Line:Jt(dr),Custom:Jt(Pc)}[i]}function mr(i){return{se:0,jb:new Map,ha:i}}function pr(i,t){if(i!==void 0&&i.length!==0)return{Hb:t.key(i[0].ot),$b:t.key(i[i.length-1].ot)}}function vr(i){let t;return i.forEach(e=>{t===void 0&&(t=e.Ib)}),mt(t)}class zc{constructor(t){this.Ub=new Map,this.qb=new Map,this.Yb=new Map,this.Zb=[],this.U_=t}S(){this.Ub.clear(),this.qb.clear(),this.Yb.clear(),this.Zb=[]}Xb(t,e){let s=this.Ub.size!==0,n=!1;const r=this.qb.get(t);if(r!==void 0)if(this.qb.size===1)s=!1,n=!0,this.Ub.clear();else for(const h of this.Zb)h.pointData.jb.delete(t)&&(n=!0);let o=[];if(e.length!==0){const h=e.map(m=>m.time),a=this.U_.createConverterToInternalObj(e),c=gr(t.Jh()),u=t.ya(),f=t.Ca();o=e.map((m,g)=>{const p=a(m.time),_=this.U_.key(p);let w=this.Ub.get(_);w===void 0&&(w=mr(p),this.Ub.set(_,w),n=!0);const x=c(p,w.se,m,h[g],u,f);return w.jb.set(t,x),x})}s&&this.Kb(),this.Gb(t,o);let l=-1;if(n){const h=[];this.Ub.forEach(a=>{h.push({timeWeight:0,time:a.ha,pointData:a,originalTime:vr(a.jb)})}),h.sort((a,c)=>this.U_.key(a.time)-this.U_.key(c.time)),l=this.Jb(h)}return this.Qb(t,l,function(h,a,c){const u=pr(h,c),f=pr(a,c);if(u!==void 0&&f!==void 0)return{Ql:u.$b>=f.$b&&u.Hb>=f.Hb}}(this.qb.get(t),r,this.U_))}fd(t){return this.Xb(t,[])}tw(t,e){const s=e;(function(p){p.Ib===void 0&&(p.Ib=p.time)})(s),this.U_.preprocessData(e);const n=this.U_.createConverterToInternalObj([e])(e.time),r=this.Yb.get(t);if(r!==void 0&&this.U_.key(n)<this.U_.key(r))throw new Error(`Cannot update oldest data, last time=${r}, new time=${n}`);let o=this.Ub.get(this.U_.key(n));const l=o===void 0;o===void 0&&(o=mr(n),this.Ub.set(this.U_.key(n),o));const h=gr(t.Jh()),a=t.ya(),c=t.Ca(),u=h(n,o.se,e,s.Ib,a,c);o.jb.set(t,u),this.iw(t,u);const f={Ql:ii(u)};if(!l)return this.Qb(t,-1,f);const m={timeWeight:0,time:o.ha,pointData:o,originalTime:vr(o.jb)},g=Ue(this.Zb,this.U_.key(m.time),(p,_)=>this.U_.key(p.time)<_);this.Zb.splice(g,0,m);for(let p=g;p<this.Zb.length;++p)os(this.Zb[p].pointData,p);return this.U_.fillWeightsForPoints(this.Zb,g),this.Qb(t,g,f)}iw(t,e){let s=this.qb.get(t);s===void 0&&(s=[],this.qb.set(t,s));const n=s.length!==0?s[s.length-1]:null;n===null||this.U_.key(e.ot)>this.U_.key(n.ot)?ii(e)&&s.push(e):ii(e)?s[s.length-1]=e:s.splice(-1,1),this.Yb.set(t,e.ot)}Gb(t,e){e.length!==0?(this.qb.set(t,e.filter(ii)),this.Yb.set(t,e[e.length-1].ot)):(this.qb.delete(t),this.Yb.delete(t))}Kb(){for(const t of this.Zb)t.pointData.jb.size===0&&this.Ub.delete(this.U_.key(t.time))}Jb(t){let e=-1;for(let s=0;s<this.Zb.length&&s<t.length;++s){const n=this.Zb[s],r=t[s];if(this.U_.key(n.time)!==this.U_.key(r.time)){e=s;break}r.timeWeight=n.timeWeight,os(r.pointData,s)}if(e===-1&&this.Zb.length!==t.length&&(e=Math.min(this.Zb.length,t.length)),e===-1)return-1;for(let s=e;s<t.length;++s)os(t[s].pointData,s);return this.U_.fillWeightsForPoints(t,e),this.Zb=t,e}nw(){if(this.qb.size===0)return null;let t=0;return this.qb.forEach(e=>{e.length!==0&&(t=Math.max(t,e[e.length-1].se))}),t}Qb(t,e,s){const n={sw:new Map,St:{Lu:this.nw()}};if(e!==-1)this.qb.forEach((r,o)=>{n.sw.set(o,{He:r,ew:o===t?s:void 0})}),this.qb.has(t)||n.sw.set(t,{He:[],ew:s}),n.St.rw=this.Zb,n.St.hw=e;else{const r=this.qb.get(t);n.sw.set(t,{He:r||[],ew:s})}return n}}function os(i,t){i.se=t,i.jb.forEach(e=>{e.se=t})}function Zs(i){const t={value:i.Vt[3],time:i.Ib};return i.Wb!==void 0&&(t.customValues=i.Wb),t}function _r(i){const t=Zs(i);return i.V!==void 0&&(t.color=i.V),t}function Dc(i){const t=Zs(i);return i.lt!==void 0&&(t.lineColor=i.lt),i.Ts!==void 0&&(t.topColor=i.Ts),i.Ps!==void 0&&(t.bottomColor=i.Ps),t}function Ac(i){const t=Zs(i);return i.Pe!==void 0&&(t.topLineColor=i.Pe),i.Re!==void 0&&(t.bottomLineColor=i.Re),i.Se!==void 0&&(t.topFillColor1=i.Se),i.ke!==void 0&&(t.topFillColor2=i.ke),i.ye!==void 0&&(t.bottomFillColor1=i.ye),i.Ce!==void 0&&(t.bottomFillColor2=i.Ce),t}function Co(i){const t={open:i.Vt[0],high:i.Vt[1],low:i.Vt[2],close:i.Vt[3],time:i.Ib};return i.Wb!==void 0&&(t.customValues=i.Wb),t}function Ic(i){const t=Co(i);return i.V!==void 0&&(t.color=i.V),t}function Oc(i){const t=Co(i),{V:e,Ot:s,Zh:n}=i;return e!==void 0&&(t.color=e),s!==void 0&&(t.borderColor=s),n!==void 0&&(t.wickColor=n),t}function zs(i){return{Area:Dc,Line:_r,Baseline:Ac,Histogram:_r,Bar:Ic,Candlestick:Oc,Custom:Rc}[i]}function Rc(i){const t=i.Ib;return Object.assign(Object.assign({},i.He),{time:t})}const Vc={vertLine:{color:"#9598A1",width:1,style:3,visible:!0,labelVisible:!0,labelBackgroundColor:"#131722"},horzLine:{color:"#9598A1",width:1,style:3,visible:!0,labelVisible:!0,labelBackgroundColor:"#131722"},mode:1},Wc={vertLines:{color:"#D6DCDE",style:0,visible:!0},horzLines:{color:"#D6DCDE",style:0,visible:!0}},Bc={background:{type:"solid",color:"#FFFFFF"},textColor:"#191919",fontSize:12,fontFamily:Bs,attributionLogo:!0},ls={autoScale:!0,mode:0,invertScale:!1,alignLabels:!0,borderVisible:!0,borderColor:"#2B2B43",entireTextOnly:!1,visible:!1,ticksVisible:!1,scaleMargins:{bottom:.1,top:.2},minimumWidth:0},Nc={rightOffset:0,barSpacing:6,minBarSpacing:.5,fixLeftEdge:!1,fixRightEdge:!1,lockVisibleTimeRangeOnResize:!1,rightBarStaysOnScroll:!1,borderVisible:!0,borderColor:"#2B2B43",visible:!0,timeVisible:!1,secondsVisible:!0,shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!1,ticksVisible:!1,uniformDistribution:!1,minimumHeight:0,allowBoldLabels:!0},jc={color:"rgba(0, 0, 0, 0)",visible:!1,fontSize:48,fontFamily:Bs,fontStyle:"",text:"",horzAlign:"center",vertAlign:"center"};function br(){return{width:0,height:0,autoSize:!1,layout:Bc,crosshair:Vc,grid:Wc,overlayPriceScales:Object.assign({},ls),leftPriceScale:Object.assign(Object.assign({},ls),{visible:!1}),rightPriceScale:Object.assign(Object.assign({},ls),{visible:!0}),timeScale:Nc,watermark:jc,localization:{locale:we?navigator.language:"",dateFormat:"dd MMM 'yy"},handleScroll:{mouseWheel:!0,pressedMouseMove:!0,horzTouchDrag:!0,vertTouchDrag:!0},handleScale:{axisPressedMouseMove:{time:!0,price:!0},axisDoubleClickReset:{time:!0,price:!0},mouseWheel:!0,pinch:!0},kineticScroll:{mouse:!1,touch:!0},trackingMode:{exitMode:1}}}class Fc{constructor(t,e){this.lw=t,this.aw=e}applyOptions(t){this.lw.$t().Hc(this.aw,t)}options(){return this.Li().W()}width(){return Ti(this.aw)?this.lw.gb(this.aw):0}Li(){return M(this.lw.$t().$c(this.aw)).Dt}}function wr(i,t,e){const s=Mo(i,["time","originalTime"]),n=Object.assign({time:t},s);return e!==void 0&&(n.originalTime=e),n}const Uc={color:"#FF0000",price:0,lineStyle:2,lineWidth:1,lineVisible:!0,axisLabelVisible:!0,title:"",axisLabelColor:"",axisLabelTextColor:""};class Hc{constructor(t){this.Eh=t}applyOptions(t){this.Eh.Hh(t)}options(){return this.Eh.W()}ow(){return this.Eh}}class Xc{constructor(t,e,s,n,r){this._w=new st,this.Ls=t,this.uw=e,this.cw=s,this.U_=r,this.dw=n}S(){this._w.S()}priceFormatter(){return this.Ls.ma()}priceToCoordinate(t){const e=this.Ls.Ct();return e===null?null:this.Ls.Dt().Rt(t,e.Vt)}coordinateToPrice(t){const e=this.Ls.Ct();return e===null?null:this.Ls.Dt().pn(t,e.Vt)}barsInLogicalRange(t){if(t===null)return null;const e=new me(new Pe(t.from,t.to)).hu(),s=this.Ls.In();if(s.Ni())return null;const n=s.hl(e.Vs(),1),r=s.hl(e.ui(),-1),o=M(s.sl()),l=M(s.An());if(n!==null&&r!==null&&n.se>r.se)return{barsBefore:t.from-o,barsAfter:l-t.to};const h={barsBefore:n===null||n.se===o?t.from-o:n.se-o,barsAfter:r===null||r.se===l?l-t.to:l-r.se};return n!==null&&r!==null&&(h.from=n.Ib,h.to=r.Ib),h}setData(t){this.U_,this.Ls.Jh(),this.uw.fw(this.Ls,t),this.pw("full")}update(t){this.Ls.Jh(),this.uw.mw(this.Ls,t),this.pw("update")}dataByIndex(t,e){const s=this.Ls.In().hl(t,e);return s===null?null:zs(this.seriesType())(s)}data(){const t=zs(this.seriesType());return this.Ls.In().ie().map(e=>t(e))}subscribeDataChanged(t){this._w.l(t)}unsubscribeDataChanged(t){this._w.v(t)}setMarkers(t){this.U_;const e=t.map(s=>wr(s,this.U_.convertHorzItemToInternal(s.time),s.time));this.Ls.ia(e)}markers(){return this.Ls.na().map(t=>wr(t,t.originalTime,void 0))}applyOptions(t){this.Ls.Hh(t)}options(){return Vt(this.Ls.W())}priceScale(){return this.cw.priceScale(this.Ls.Dt().Ta())}createPriceLine(t){const e=Pt(Vt(Uc),t),s=this.Ls.sa(e);return new Hc(s)}removePriceLine(t){this.Ls.ea(t.ow())}seriesType(){return this.Ls.Jh()}attachPrimitive(t){this.Ls.Sa(t),t.attached&&t.attached({chart:this.dw,series:this,requestUpdate:()=>this.Ls.$t().Xl()})}detachPrimitive(t){this.Ls.ka(t),t.detached&&t.detached()}pw(t){this._w.M()&&this._w.m(t)}}class Kc{constructor(t,e,s){this.bw=new st,this.pu=new st,this.Vm=new st,this.$i=t,this.kl=t.St(),this.lb=e,this.kl.tc().l(this.ww.bind(this)),this.kl.nc().l(this.gw.bind(this)),this.lb.Em().l(this.Mw.bind(this)),this.U_=s}S(){this.kl.tc().p(this),this.kl.nc().p(this),this.lb.Em().p(this),this.bw.S(),this.pu.S(),this.Vm.S()}scrollPosition(){return this.kl.ju()}scrollToPosition(t,e){e?this.kl.Gu(t,1e3):this.$i.Jn(t)}scrollToRealTime(){this.kl.Ku()}getVisibleRange(){const t=this.kl.Du();return t===null?null:{from:t.from.originalTime,to:t.to.originalTime}}setVisibleRange(t){const e={from:this.U_.convertHorzItemToInternal(t.from),to:this.U_.convertHorzItemToInternal(t.to)},s=this.kl.Au(e);this.$i.vd(s)}getVisibleLogicalRange(){const t=this.kl.Ru();return t===null?null:{from:t.Vs(),to:t.ui()}}setVisibleLogicalRange(t){qt(t.from<=t.to,"The from index cannot be after the to index."),this.$i.vd(t)}resetTimeScale(){this.$i.Kn()}fitContent(){this.$i.rc()}logicalToCoordinate(t){const e=this.$i.St();return e.Ni()?null:e.It(t)}coordinateToLogical(t){return this.kl.Ni()?null:this.kl.Eu(t)}timeToCoordinate(t){const e=this.U_.convertHorzItemToInternal(t),s=this.kl.Da(e,!1);return s===null?null:this.kl.It(s)}coordinateToTime(t){const e=this.$i.St(),s=e.Eu(t),n=e.Ui(s);return n===null?null:n.originalTime}width(){return this.lb._m().width}height(){return this.lb._m().height}subscribeVisibleTimeRangeChange(t){this.bw.l(t)}unsubscribeVisibleTimeRangeChange(t){this.bw.v(t)}subscribeVisibleLogicalRangeChange(t){this.pu.l(t)}unsubscribeVisibleLogicalRangeChange(t){this.pu.v(t)}subscribeSizeChange(t){this.Vm.l(t)}unsubscribeSizeChange(t){this.Vm.v(t)}applyOptions(t){this.kl.Hh(t)}options(){return Object.assign(Object.assign({},Vt(this.kl.W())),{barSpacing:this.kl.he()})}ww(){this.bw.M()&&this.bw.m(this.getVisibleRange())}gw(){this.pu.M()&&this.pu.m(this.getVisibleLogicalRange())}Mw(t){this.Vm.m(t.width,t.height)}}function qc(i){if(i===void 0||i.type==="custom")return;const t=i;t.minMove!==void 0&&t.precision===void 0&&(t.precision=function(e){if(e>=1)return 0;let s=0;for(;s<8;s++){const n=Math.round(e);if(Math.abs(n-e)<1e-8)return s;e*=10}return s}(t.minMove))}function yr(i){return function(t){if(Ke(t.handleScale)){const s=t.handleScale;t.handleScale={axisDoubleClickReset:{time:s,price:s},axisPressedMouseMove:{time:s,price:s},mouseWheel:s,pinch:s}}else if(t.handleScale!==void 0){const{axisPressedMouseMove:s,axisDoubleClickReset:n}=t.handleScale;Ke(s)&&(t.handleScale.axisPressedMouseMove={time:s,price:s}),Ke(n)&&(t.handleScale.axisDoubleClickReset={time:n,price:n})}const e=t.handleScroll;Ke(e)&&(t.handleScroll={horzTouchDrag:e,vertTouchDrag:e,mouseWheel:e,pressedMouseMove:e})}(i),i}class Gc{constructor(t,e,s){this.xw=new Map,this.Sw=new Map,this.kw=new st,this.yw=new st,this.Cw=new st,this.Tw=new zc(e);const n=s===void 0?Vt(br()):Pt(Vt(br()),yr(s));this.U_=e,this.lw=new Cc(t,n,e),this.lw.hm().l(o=>{this.kw.M()&&this.kw.m(this.Pw(o()))},this),this.lw.lm().l(o=>{this.yw.M()&&this.yw.m(this.Pw(o()))},this),this.lw.Zc().l(o=>{this.Cw.M()&&this.Cw.m(this.Pw(o()))},this);const r=this.lw.$t();this.Rw=new Kc(r,this.lw.cb(),this.U_)}remove(){this.lw.hm().p(this),this.lw.lm().p(this),this.lw.Zc().p(this),this.Rw.S(),this.lw.S(),this.xw.clear(),this.Sw.clear(),this.kw.S(),this.yw.S(),this.Cw.S(),this.Tw.S()}resize(t,e,s){this.autoSizeActive()||this.lw.ob(t,e,s)}addCustomSeries(t,e){const s=ue(t),n=Object.assign(Object.assign({},Qr),s.defaultOptions());return this.Dw("Custom",n,e,s)}addAreaSeries(t){return this.Dw("Area",zh,t)}addBaselineSeries(t){return this.Dw("Baseline",Dh,t)}addBarSeries(t){return this.Dw("Bar",Th,t)}addCandlestickSeries(t={}){return function(e){e.borderColor!==void 0&&(e.borderUpColor=e.borderColor,e.borderDownColor=e.borderColor),e.wickColor!==void 0&&(e.wickUpColor=e.wickColor,e.wickDownColor=e.wickColor)}(t),this.Dw("Candlestick",Lh,t)}addHistogramSeries(t){return this.Dw("Histogram",Ah,t)}addLineSeries(t){return this.Dw("Line",Ph,t)}removeSeries(t){const e=mt(this.xw.get(t)),s=this.Tw.fd(e);this.lw.$t().fd(e),this.Vw(s),this.xw.delete(t),this.Sw.delete(e)}fw(t,e){this.Vw(this.Tw.Xb(t,e))}mw(t,e){this.Vw(this.Tw.tw(t,e))}subscribeClick(t){this.kw.l(t)}unsubscribeClick(t){this.kw.v(t)}subscribeCrosshairMove(t){this.Cw.l(t)}unsubscribeCrosshairMove(t){this.Cw.v(t)}subscribeDblClick(t){this.yw.l(t)}unsubscribeDblClick(t){this.yw.v(t)}priceScale(t){return new Fc(this.lw,t)}timeScale(){return this.Rw}applyOptions(t){this.lw.Hh(yr(t))}options(){return this.lw.W()}takeScreenshot(){return this.lw.bb()}autoSizeActive(){return this.lw.Sb()}chartElement(){return this.lw.kb()}paneSize(){const t=this.lw.Cb();return{height:t.height,width:t.width}}setCrosshairPosition(t,e,s){const n=this.xw.get(s);if(n===void 0)return;const r=this.lw.$t().cr(n);r!==null&&this.lw.$t().ld(t,e,r)}clearCrosshairPosition(){this.lw.$t().ad(!0)}Dw(t,e,s={},n){qc(s.priceFormat);const r=Pt(Vt(to),Vt(e),s),o=this.lw.$t().ud(t,r,n),l=new Xc(o,this,this,this,this.U_);return this.xw.set(l,o),this.Sw.set(o,l),l}Vw(t){const e=this.lw.$t();e.od(t.St.Lu,t.St.rw,t.St.hw),t.sw.forEach((s,n)=>n.J(s.He,s.ew)),e.Fu()}Ow(t){return mt(this.Sw.get(t))}Pw(t){const e=new Map;t.Eb.forEach((n,r)=>{const o=r.Jh(),l=zs(o)(n);if(o!=="Custom")qt($c(l));else{const h=r.Ca();qt(!h||h(l)===!1)}e.set(this.Ow(r),l)});const s=t.Lb!==void 0&&this.Sw.has(t.Lb)?this.Ow(t.Lb):void 0;return{time:t.Ib,logical:t.se,point:t.zb,hoveredSeries:s,hoveredObjectId:t.Nb,seriesData:e,sourceEvent:t.Fb}}}function Yc(i,t,e){let s;if(Fe(i)){const r=document.getElementById(i);qt(r!==null,`Cannot find element in DOM with id=${i}`),s=r}else s=i;const n=new Gc(s,t,e);return t.setOptions(n.options()),n}function Zc(i,t){return Yc(i,new or,or.Ad(t))}const Jc=Object.assign(Object.assign({},to),Qr);function Qc(i,t){if(i>=2.5&&i<=4)return Math.floor(3*t);const o=1-.2*Math.atan(Math.max(4,i)-4)/(Math.PI*.5),l=Math.floor(i*o*t),h=Math.floor(i*t),a=Math.min(l,h);return Math.max(Math.floor(t),a)}function tu(i,t){let e=Qc(i,t);return e>=2&&Math.floor(t)%2!==e%2&&e--,e}function eu(i){return Math.max(1,Math.floor(i))}function iu(i){return eu(i)/i}function su(i){return Math.floor(i*.5)}function xr(i,t,e=1,s){const n=Math.round(t*i),r=Math.round(e*t),o=su(r);return{position:n-o,length:r}}function Sr(i,t,e){const s=Math.round(e*i),n=Math.round(e*t);return{position:Math.min(s,n),length:Math.abs(n-s)+1}}class nu{_data=null;_options=null;draw(t,e){t.useBitmapCoordinateSpace(s=>this._drawImpl(s,e))}update(t,e){this._data=t,this._options=e}_drawImpl(t,e){if(this._data===null||this._data.bars.length===0||this._data.visibleRange===null||this._options===null)return;const s=this._data.visibleRange.from,n=this._data.visibleRange.to,r=this._data.bars.slice(s,n).map(l=>{const h=l.originalData.close>=l.originalData.open,a=e(l.originalData.open)??0,c=e(l.originalData.high)??0,u=e(l.originalData.low)??0,f=e(l.originalData.close)??0;return{openY:a,highY:c,lowY:u,closeY:f,x:l.x,isUp:h}});if(this._options.priceLineColor!=="")this._options.color=this._options.priceLineColor;else{let l=this._data.bars.at(-1),h=l?l.originalData.close>=l.originalData.open:!1;this._options.color=h?this._options.upColor:this._options.downColor}const o=this._options.radius(this._data.barSpacing);this._options.wickVisible&&this._drawWicks(t,r),this._drawCandles(t,r,o)}_drawWicks(t,e){if(this._data===null||this._options===null)return;const{context:s,horizontalPixelRatio:n,verticalPixelRatio:r}=t,o=iu(n);for(const l of e){s.fillStyle=l.isUp?this._options.wickUpColor:this._options.wickDownColor;const h=Sr(l.lowY,l.highY,r),a=xr(l.x,n,o);s.fillRect(a.position,h.position,a.length,h.length)}}_drawCandles(t,e,s){if(this._data===null||this._options===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t,l=tu(this._data.barSpacing,1);for(const h of e){const a=Sr(Math.min(h.openY,h.closeY),Math.max(h.openY,h.closeY),o),c=xr(h.x,r,l);n.fillStyle=h.isUp?this._options.upColor:this._options.downColor,n.roundRect?(n.beginPath(),n.roundRect(c.position,a.position,c.length,a.length,s),n.fill()):n.fillRect(c.position,a.position,c.length,a.length)}}}const ru={...Jc,upColor:"#26a69a",downColor:"#ef5350",wickVisible:!0,wickColor:"#737375",wickUpColor:"#26a69a",wickDownColor:"#ef5350",radius:function(i){return i<4?0:i/3}};class ou{_renderer;constructor(){this._renderer=new nu}priceValueBuilder(t){return[t.high,t.low,t.close]}renderer(){return this._renderer}isWhitespace(t){return t.close===void 0}update(t,e){this._renderer.update(t,e)}defaultOptions(){return ru}}var it=(i=>(i[i.WhitespaceData=0]="WhitespaceData",i[i.SingleValueData=1]="SingleValueData",i[i.LINE=2]="LINE",i[i.AREA=3]="AREA",i[i.BASELINE=4]="BASELINE",i[i.HISTOGRAM=5]="HISTOGRAM",i[i.OHLC=6]="OHLC",i[i.BAR=7]="BAR",i[i.CANDLESTICK=8]="CANDLESTICK",i[i.ROUNDED_CANDLE=9]="ROUNDED_CANDLE",i))(it||{});const lu=new Map([[0,"Whitespace"],[1,"Single-Value"],[2,"Line"],[3,"Area"],[4,"Baseline"],[5,"Histogram"],[6,"OHLC"],[7,"Bar"],[8,"Candlestick"],[9,"Rounded-Candle"]]);class $o{_pane;_series;_id;_indicator_id;_parent_name;_name;s_type;_markers=new Map;_pricelines=new Map;primitiveIds;setPrimitiveIds;constructor(t,e,s,n,r,o){this._id=t,this._indicator_id=e,this._name=s,this._parent_name=n,this.s_type=r,this._pane=o,this._series=this._create_series(r),this._markers=new Map;const l=C([]);this.primitiveIds=l[0],this.setPrimitiveIds=l[1],this._pane.series_map.set(this._series,this)}_create_series(t){switch(t){case 2:return this._pane.chart.addLineSeries();case 3:return this._pane.chart.addAreaSeries();case 5:return this._pane.chart.addHistogramSeries();case 4:return this._pane.chart.addBaselineSeries();case 7:return this._pane.chart.addBarSeries();case 6:case 8:return this._pane.chart.addCandlestickSeries();case 9:return this._pane.chart.addCustomSeries(new ou);default:return this._pane.chart.addLineSeries()}}get id(){return this._id}get name(){let t=this._parent_name?this._parent_name+" : ":"";return t+=this._name?this._name:lu.get(this.s_type),t}reorderPrimitives(t,e){this.primitiveWrapperArray.splice(e,0,...this.primitiveWrapperArray.splice(t,1)),this.setPrimitiveIds(Array.from(this.primitives,s=>s.id))}remove(){this._pane.series_map.delete(this._series),this._pane.chart.removeSeries(this._series)}change_series_type(t,e){if(t===this.s_type)return;const s=this._pane.get_series_index(this._series),n=this._pane.chart.timeScale().getVisibleRange();this.remove(),this._series=this._create_series(t),this._series.setData(e),this.s_type=t,this._pane.series_map.set(this._series,this),this._pane.reorder_series(-1,s,!1),n!==null&&this._pane.chart.timeScale().setVisibleRange(n)}move_to_pane(t){}priceScale(){return this._series.priceScale()}applyOptions(t){this._series.applyOptions(t)}options(){return this._series.options()}data(){return this._series.data()}update(t){this._series.update(t)}setData(t){this._series.setData(t)}markers(){return Array.from(this._markers.values())}_updateMarkers(){this._series.setMarkers(this.markers())}updateMarker(t,e){this._markers.set(t,e),this._updateMarkers()}removeMarker(t){this._markers.delete(t)&&this._updateMarkers()}filterMarkers(t){t.forEach(e=>this._markers.delete(e)),this._updateMarkers()}removeAllMarkers(){this._markers=new Map,this._updateMarkers()}priceLines(){return Array.from(this._pricelines.values())}removePriceLine(t){let e=this._pricelines.get(t);e!==void 0&&(this._series.removePriceLine(e),this._pricelines.delete(t))}updatePriceLine(t,e){let s=this._pricelines.get(t);s!==void 0&&s.applyOptions(e)}removeAllPriceLines(){this._series.Ls.Il=[],this._pricelines=new Map}createPriceLine(t,e){this._pricelines.set(t,this._series.createPriceLine(e))}filterPriceLines(t){t.forEach(this.removePriceLine.bind(this))}get primitiveWrapperArray(){return this._series.Ls.jl}get primitives(){return Array.from(this.primitiveWrapperArray,t=>t.Dl)}attachPrimitive(t){this._series.attachPrimitive(t),this.setPrimitiveIds([...this.primitiveIds(),t._id])}detachPrimitive(t){this._series.detachPrimitive(t),this.setPrimitiveIds(this.primitiveIds().filter(e=>e!==t._id))}priceToCoordinate(t){return this._series.priceToCoordinate(t)}coordinateToPrice(t){return this._series.coordinateToPrice(t)}}var hu=y("<form class=style_form><div class=series_style_selector>"),au=y("<div class=style_selector_row>"),cu=y("<div class=style_selector_row><label for=invertFilledArea></label><label for=topColor></label><label for=bottomColor>"),uu=y("<div class=style_selector_row><label for=base></label><input id=base type=number><label for=color>"),du=y("<div class=style_selector_row><label for=baseValue></label><input id=baseValue type=number>"),fu=y("<div class=style_selector_row><label for=topLineColor></label><label for=topFillColor1></label><label for=topFillColor2>"),gu=y("<div class=style_selector_row><label for=bottomLineColor></label><label for=bottomFillColor1></label><label for=bottomFillColor2>"),mu=y("<div class=style_selector_row><label for=lineVisible>"),pu=y("<div class=style_selector_row><label for=thinBars></label><label for=openVisible></label><span></span> "),vu=y("<span class=tooltip><span class=tooltiptext></span><input type=checkbox>"),_u=y("<div class=style_selector_row><label for=visible></label><span class=opts-select><label>"),bu=y("<div class=style_selector_row><label>"),wu=y("<div class=style_selector_row><label for=lastValueVisible></label><input type=text id=title>"),yu=y("<div class=style_selector_row><label for=priceLineVisible>"),xu=y("<div class=style_selector_row><label for=pointMarkersVisible></label><label for=pointMarkersRadius>"),Su=y("<div class=style_selector_row><label for=crosshairMarkerVisible></label><label for=crosshairMarkerRadius></label><label for=crosshairMarkerBorderWidth>"),Mu=y("<div class=style_selector_row><label></label><span></span><label for=upColor></label><label for=downColor>"),Cu=y("<div class=style_selector_row><label for=wickVisible></label><span></span><label for=wickUpColor></label><label for=wickDownColor>"),$u=y("<div class=style_selector_row><label for=borderVisible></label><span></span><label for=borderUpColor></label><label for=borderDownColor>"),Eu=y("<input type=checkbox>"),ku=y("<input type=number step=any min=1 max=10>"),Js=y("<span class=select-span><select>"),Qs=y("<option>");function Lu(i){let t=document.createElement("form");const[e,s]=C(i.series.options());let n=i.series.s_type;const r=n===it.LINE||n===it.AREA||n===it.BASELINE;let o={priceline:C(!1),markers:r?C(!1):void 0,crosshair:r?C(!1):void 0};X(Tt(Object.values(o).map(h=>h?h[0]:void 0).filter(h=>h!==void 0),()=>s(i.series.options())));const l={submit:()=>t.requestSubmit(),...o};return(()=>{var h=hu(),a=h.firstChild;lt(h,"submit",Tu.bind(void 0,i.series));var c=t;return typeof c=="function"?q(c,h):t=h,v(a,d(Vu,{get name(){return i.name},get visible(){return e().visible},get submit(){return l.submit},signals:o}),null),v(a,d(je,{get children(){return[d(nt,{get when(){return i.series.s_type===it.LINE},get children(){return d(Pu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.AREA},get children(){return d(zu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.HISTOGRAM},get children(){return d(Du,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.BASELINE},get children(){return d(Au,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.BAR},get children(){return d(Iu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.CANDLESTICK},get children(){return d(Ou,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.ROUNDED_CANDLE},get children(){return d(Ru,A({get opts(){return e()}},l))}})]}}),null),v(a,d(Wu,{get show_price_line(){return o.priceline?.[0]()??!1},get submit(){return l.submit},get options(){return e()}}),null),h})()}function Tu(i,t){if(t.preventDefault(),t.target!==null){let e=Array.from(t.target.querySelectorAll("input, select"));e=e.filter(o=>o.id!==""),i.applyOptions(Object.fromEntries(Array.from(e,o=>{switch(o.getAttribute("type")){case"checkbox":return[o.id,o.checked];case null:return[o.id,parseInt(o.value)];case"number":return o.id==="baseValue"?[o.id,{type:"price",price:parseFloat(o.value)}]:[o.id,parseFloat(o.value)];case"color_picker":return[o.id,o.value==="#00000000"?"":o.value];default:return[o.id,o.value]}})));const s=i._pane.id.split("_"),n=s.slice(0,4).join("_"),r=s.slice(0,2).join("_");window.api.update_series_options(r,n,i._indicator_id,i.id,i.options())}}function Pu(i){return[d(Eo,{keys:["Plot Line: ","lineVisible","color","lineWidth","lineStyle","lineType"],get vis(){return i.opts.lineVisible},get color(){return i.opts.color},get width(){return i.opts.lineWidth},get style(){return i.opts.lineStyle},get type(){return i.opts.lineType},get submit(){return i.submit}}),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function zu(i){return[(()=>{var t=au();return t.innerText="Area Series",t})(),d(Eo,{keys:["Line: ","lineVisible","lineColor","lineWidth","lineStyle","lineType"],get vis(){return i.opts.lineVisible},get color(){return i.opts.lineColor},get width(){return i.opts.lineWidth},get style(){return i.opts.lineStyle},get type(){return i.opts.lineType},get submit(){return i.submit}}),(()=>{var t=cu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Invert: ",v(t,d(St,{key:"invertFilledArea",get checked(){return i.opts.invertFilledArea},get submit(){return i.submit}}),s),s.innerText="Top Color: ",v(t,d(rt,{key:"topColor",get default(){return i.opts.topColor},get submit(){return i.submit}}),n),n.innerText="Bottom Color: ",v(t,d(rt,{key:"bottomColor",get default(){return i.opts.bottomColor},get submit(){return i.submit}}),null),t})(),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function Du(i){return(()=>{var t=uu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Base Value: ",lt(s,"input",i.submit,!0),s.style.setProperty("width","auto"),n.innerText="Color: ",n.style.setProperty("margin-left","18px"),v(t,d(rt,{key:"color",get default(){return i.opts.color},get submit(){return i.submit}}),null),k(()=>s.value=i.opts.base),t})()}function Au(i){return[(()=>{var t=du(),e=t.firstChild,s=e.nextSibling;return e.innerText="Base Price: ",lt(s,"input",i.submit,!0),s.style.setProperty("width","auto"),k(()=>s.value=i.opts.baseValue.price),t})(),(()=>{var t=fu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Top Line:",e.style.setProperty("margin-right","27px"),v(t,d(rt,{key:"topLineColor",get default(){return i.opts.topLineColor},get submit(){return i.submit}}),s),s.innerText="Fill 1:",s.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"topFillColor1",get default(){return i.opts.topFillColor1},get submit(){return i.submit}}),n),n.innerText="Fill 2:",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"topFillColor2",get default(){return i.opts.topFillColor2},get submit(){return i.submit}}),null),t})(),(()=>{var t=gu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Bottom Line: ",v(t,d(rt,{key:"bottomLineColor",get default(){return i.opts.bottomLineColor},get submit(){return i.submit}}),s),s.innerText="Fill 1:",s.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"bottomFillColor1",get default(){return i.opts.bottomFillColor1},get submit(){return i.submit}}),n),n.innerText="Fill 2:",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"bottomFillColor2",get default(){return i.opts.bottomFillColor2},get submit(){return i.submit}}),null),t})(),(()=>{var t=mu(),e=t.firstChild;return e.innerText="Line: ",v(t,d(St,{key:"lineVisible",get checked(){return i.opts.lineVisible},get submit(){return i.submit}}),null),v(t,d(ye,{key:"lineWidth",get default(){return i.opts.lineWidth},get submit(){return i.submit}}),null),v(t,d(Lo,{key:"lineType",get default(){return i.opts.lineType},get submit(){return i.submit}}),null),v(t,d(nn,{key:"lineStyle",get default(){return i.opts.lineStyle},get submit(){return i.submit}}),null),t})(),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function Iu(i){return[(()=>{var t=pu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Thin Bars: ",v(t,d(St,{key:"thinBars",get checked(){return i.opts.thinBars},get submit(){return i.submit}}),s),s.innerText="Show Open:",s.style.setProperty("margin-left","12px"),v(t,d(St,{key:"openVisible",get checked(){return i.opts.openVisible},get submit(){return i.submit}}),n),t})(),d(sn,{get submit(){return i.submit},get opts(){return i.opts}})]}function Ou(i){return[d(sn,{get submit(){return i.submit},get opts(){return i.opts}}),d(ko,{get submit(){return i.submit},get opts(){return i.opts}}),d(ju,{get submit(){return i.submit},get opts(){return i.opts}})]}function Ru(i){return[d(sn,{get submit(){return i.submit},get opts(){return i.opts}}),d(ko,{get submit(){return i.submit},get opts(){return i.opts}})]}function hs(i){return d(j,{get when(){return i.signal},get children(){var t=vu(),e=t.firstChild,s=e.nextSibling;return s.$$input=n=>i.signal?.[1](n.target.checked),k(()=>e.innerText=i.tip),k(()=>s.checked=i.signal?.[0]()),t}})}function Vu(i){return(()=>{var t=_u(),e=t.firstChild,s=e.nextSibling,n=s.firstChild;return v(t,d(St,{key:"visible",get checked(){return i.visible},get submit(){return i.submit}}),s),v(s,d(hs,{get signal(){return i.signals.priceline},tip:"Price Line & Label"}),n),v(s,d(hs,{get signal(){return i.signals.crosshair},tip:"Crosshair Marker"}),n),v(s,d(hs,{get signal(){return i.signals.markers},tip:"Data Markers"}),n),n.innerText="Adv. Opts:",k(()=>e.innerText=i.name),t})()}function Wu(i){return[d(Nu,{get visible(){return i.options.priceLineVisible},get color(){return i.options.priceLineColor},get width(){return i.options.priceLineWidth},get style(){return i.options.priceLineStyle},get source(){return i.options.priceLineSource},get show_adv(){return i.show_price_line},get submit(){return i.submit}}),d(Bu,{get show_adv(){return i.show_price_line},get title(){return i.options.title},get visible(){return i.options.lastValueVisible},get submit(){return i.submit}})]}function Eo(i){return(()=>{var t=bu(),e=t.firstChild;return v(t,d(St,{get key(){return i.keys[1]},get checked(){return i.vis},get submit(){return i.submit}}),null),v(t,d(rt,{get key(){return i.keys[2]},get default(){return i.color},get submit(){return i.submit}}),null),v(t,d(ye,{get key(){return i.keys[3]},get default(){return i.width},get submit(){return i.submit}}),null),v(t,d(Lo,{get key(){return i.keys[5]},get default(){return i.type},get submit(){return i.submit}}),null),v(t,d(nn,{get key(){return i.keys[4]},get default(){return i.style},get submit(){return i.submit}}),null),k(s=>{var n=i.keys[1],r=i.keys[0];return n!==s.e&&H(e,"for",s.e=n),r!==s.t&&(e.innerText=s.t=r),s},{e:void 0,t:void 0}),t})()}function Bu(i){return d(j,{get when(){return i.show_adv},get children(){var t=wu(),e=t.firstChild,s=e.nextSibling;return e.innerText="Price Label:",v(t,d(St,{key:"lastValueVisible",get checked(){return i.visible},get submit(){return i.submit}}),s),lt(s,"input",i.submit,!0),k(()=>s.value=i.title),t}})}function Nu(i){return d(j,{get when(){return i.show_adv},get children(){var t=yu(),e=t.firstChild;return e.innerText="Price Line:",v(t,d(St,{key:"priceLineVisible",get checked(){return i.visible},get submit(){return i.submit}}),null),v(t,d(rt,{key:"priceLineColor",get default(){return i.color},get submit(){return i.submit}}),null),v(t,d(ye,{key:"priceLineWidth",get default(){return i.width},get submit(){return i.submit}}),null),v(t,d(Fu,{key:"priceLineSource",get default(){return i.source},get submit(){return i.submit}}),null),v(t,d(nn,{key:"priceLineStyle",get default(){return i.style},get submit(){return i.submit}}),null),t}})}function tn(i){return d(j,{get when(){return i.show_adv},get children(){var t=xu(),e=t.firstChild,s=e.nextSibling;return e.innerText="Data Markers:",v(t,d(St,{key:"pointMarkersVisible",get checked(){return i.options.pointMarkersVisible},get submit(){return i.submit}}),s),s.innerText="Radius:",v(t,d(ye,{key:"pointMarkersRadius",get default(){return i.options.pointMarkersRadius??2.5},get submit(){return i.submit}}),null),t}})}function en(i){return d(j,{get when(){return i.show_adv},get children(){var t=Su(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Crosshair Mark:",v(t,d(St,{key:"crosshairMarkerVisible",get checked(){return i.options.crosshairMarkerVisible},get submit(){return i.submit}}),s),s.innerText="Inner:",v(t,d(ye,{key:"crosshairMarkerRadius",get default(){return i.options.crosshairMarkerRadius},get submit(){return i.submit}}),n),v(t,d(rt,{key:"crosshairMarkerBackgroundColor",get default(){return i.options.crosshairMarkerBackgroundColor},get submit(){return i.submit}}),n),n.innerText="Outer:",v(t,d(ye,{key:"crosshairMarkerBorderWidth",get default(){return i.options.crosshairMarkerBorderWidth},get submit(){return i.submit}}),null),v(t,d(rt,{key:"crosshairMarkerBorderColor",get default(){return i.options.crosshairMarkerBorderColor},get submit(){return i.submit}}),null),t}})}function sn(i){return(()=>{var t=Mu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Body: ",s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",v(t,d(rt,{key:"upColor",get default(){return i.opts.upColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"downColor",get default(){return i.opts.downColor},get submit(){return i.submit}}),null),t})()}function ko(i){return(()=>{var t=Cu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Wick:",v(t,d(St,{key:"wickVisible",get checked(){return i.opts.wickVisible},get submit(){return i.submit}}),s),s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"wickUpColor",get default(){return i.opts.wickUpColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"wickDownColor",get default(){return i.opts.wickDownColor},get submit(){return i.submit}}),null),t})()}function ju(i){return(()=>{var t=$u(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Border:",v(t,d(St,{key:"borderVisible",get checked(){return i.opts.borderVisible},get submit(){return i.submit}}),s),s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"borderUpColor",get default(){return i.opts.borderUpColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"borderDownColor",get default(){return i.opts.borderDownColor},get submit(){return i.submit}}),null),t})()}function St(i){return(()=>{var t=Eu();return lt(t,"input",i.submit,!0),k(()=>H(t,"id",i.key)),k(()=>t.checked=i.checked),t})()}function ye(i){return(()=>{var t=ku();return lt(t,"input",i.submit,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=i.default),t})()}function nn(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries(Ms)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function Lo(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries(Ss)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function Fu(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries($s)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function rt(i){return d(Jr,{get id(){return i.key},get input_id(){return i.key},get init_color(){return i.default},class:"color_input_wrapper",get onInput(){return i.submit}})}Mt(["input"]);var Uu=y("<div class=title_box><h2>"),Hu=y("<div class=form_wrapper><form class=input_form></form><div class=footer><input type=submit value=Apply>"),Xu=y("<div class=group><h3>"),Ku=y("<div class=inline>"),qu=y("<datalist>"),Gu=y("<span class=tooltip><span class=tooltiptext>"),Yu=y("<div class=input_block><label>"),rn=y("<option>"),Zu=y("<input type=checkbox>"),Ju=y("<input type=text>"),Qu=y("<input type=datetime-local>"),td=y("<input>"),To=y("<span class=select-span><select>"),ed=y("<div class=form_wrapper><div class=footer><input type=submit value=Apply>");function id(i){const[t,e]=C({x:0,y:0}),s=()=>{e({x:window.innerWidth*.7,y:window.innerHeight*.2})},n={series:i.parent_ind.series},[r]=tt(i,["id","parent_ind","menu_struct","options","sources","container_id","frame_id","indicator_id","parent_ind"]);return d(Gt,{get id(){return i.id},get location(){return t()},setLocation:e,classList:{indicator_opts:!0},get location_ref(){return Xt.CENTER},updateLocation:s,get drag_handle(){return`#${i.id}>.title_box`},get bounding_client_id(){return`#${i.id}>.title_box`},get children(){return[(()=>{var o=Uu(),l=o.firstChild;return v(l,()=>i.parent_ind.type+" • "+i.parent_ind.name+(i.parent_ind.name!==""?" • ":"")+"Options"),v(o,d(O,{get icon(){return b.close},force_reload:!0,get onClick(){return i.close_menu}}),null),o})(),d(wh,{get overlay_id(){return i.id},style:{padding:"2px 6px",margin:"12px","margin-top":"0px","border-bottom":"2px solid var(--background-fill)"},tabs:{Inputs:()=>d(sd,r),Style:()=>d(gd,n)}})]}})}function sd(i){const[t]=tt(i,["sources","options","parent_ind","indicator_id"]);let e=document.createElement("form");const s=()=>e.requestSubmit(),n=nd.bind(void 0,i.container_id,i.frame_id,i.parent_ind);return(()=>{var r=Hu(),o=r.firstChild,l=o.nextSibling,h=l.firstChild;o.addEventListener("keypress",c=>{c.key==="Enter"&&s()}),lt(o,"submit",n);var a=e;return typeof a=="function"?q(a,o):e=o,v(o,d(N,{get each(){return Object.entries(i.menu_struct)},children:([c,[u,f]])=>d(je,{get fallback(){return d(on,A({key:c,type:u,params:f,submit:s},t))},get children(){return[d(nt,{when:u==="group",get children(){return d(rd,A({title:c,params:f,submit:s},t))}}),d(nt,{when:u==="inline",get children(){return d(Po,A({title:c,params:f,submit:s},t))}})]}})})),h.$$click=s,r})()}function nd(i,t,e,s){if(s.preventDefault(),s.target!==null){let n=Array.from(s.target.querySelectorAll("input, select"));n=n.filter(o=>o.id!=="");let r=Object.fromEntries(Array.from(n,o=>{switch(o.getAttribute("type")){case"checkbox":return[o.id,o.checked];case"number":case"range":return[o.id,parseFloat(o.value)];default:return[o.id,o.value]}}));e.applyOptions(r),window.api.set_indicator_options(i,t,e.id,r)}}function rd(i){const[t]=tt(i,["sources","options","indicator_id","submit"]);return(()=>{var e=Xu(),s=e.firstChild;return v(e,d(N,{get each(){return Object.entries(i.params)},children:([n,[r,o]])=>d(je,{get fallback(){return d(on,A({key:n,type:r,params:o},t))},get children(){return d(nt,{when:r==="inline",get children(){return d(Po,A({title:n,params:o},t))}})}})}),null),k(()=>s.innerText=i.title),e})()}function Po(i){const[t]=tt(i,["sources","options","indicator_id","submit"]);return(()=>{var e=Ku();return v(e,d(N,{get each(){return Object.entries(i.params)},children:([s,[n,r]])=>d(on,A({key:s,type:n,params:r},t))})),e})()}function on(i){const[,t]=tt(i,["type"]);return(()=>{var e=Yu(),s=e.firstChild;return v(e,d(j,{get when(){return i.params.options&&i.type!=="enum"},get children(){var n=qu();return v(n,d(N,{get each(){return i.params.options},children:r=>(()=>{var o=rn();return o.value=r,o})()})),k(()=>H(n,"id",i.key+"_datalist")),n}}),null),v(e,d(je,{get children(){return[d(nt,{get when(){return i.type==="bool"},get children(){return d(ld,t)}}),d(nt,{get when(){return i.type==="enum"},get children(){return d(ud,t)}}),d(nt,{get when(){return i.type==="source"},get children(){return d(fd,t)}}),d(nt,{get when(){return i.type==="number"},get children(){return d(cd,t)}}),d(nt,{get when(){return i.type==="string"},get children(){return d(hd,t)}}),d(nt,{get when(){return i.type==="timestamp"},get children(){return d(ad,t)}}),d(nt,{get when(){return i.type==="color"},get children(){return d(dd,t)}})]}}),null),v(e,d(j,{get when(){return i.params.tooltip},get children(){var n=Gu(),r=n.firstChild;return v(n,d(Ie,{text:"?"}),r),k(()=>r.innerHTML=i.params.tooltip),n}}),null),k(n=>{var r=i.key,o=i.params.title+(i.params.title!==""?": ":"");return r!==n.e&&H(s,"for",n.e=r),o!==n.t&&(s.innerText=n.t=o),n},{e:void 0,t:void 0}),e})()}function si(i){return String(i).padStart(2,"0")}function od(i){let t=new Date(i*1e3);return[t.getUTCFullYear(),"-",si(t.getUTCMonth()+1),"-",si(t.getUTCDate()),"T",si(t.getUTCHours()),":",si(t.getUTCMinutes())].join("")}function ld(i){return(()=>{var t=Zu();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.checked=i.options[i.key]??!1),t})()}function hd(i){return(()=>{var t=Ju();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=i.options[i.key]),t})()}function ad(i){return(()=>{var t=Qu();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=od(i.options[i.key])),t})()}function cd(i){return(()=>{var t=td();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(e=>{var s=i.key,n=i.params.slider?"range":"number",r=i.params.max,o=i.params.min,l=i.params.step,h=i.params.options?i.key+"_datalist":void 0;return s!==e.e&&H(t,"id",e.e=s),n!==e.t&&H(t,"type",e.t=n),r!==e.a&&H(t,"max",e.a=r),o!==e.o&&H(t,"min",e.o=o),l!==e.i&&H(t,"step",e.i=l),h!==e.n&&H(t,"list",e.n=h),e},{e:void 0,t:void 0,a:void 0,o:void 0,i:void 0,n:void 0}),k(()=>t.value=i.options[i.key]),t})()}function ud(i){return(()=>{var t=To(),e=t.firstChild;return lt(e,"input",i.params.autosend?i.submit:void 0,!0),v(e,d(N,{get each(){return i.params.options},children:s=>(()=>{var n=rn();return n.value=s,n.innerText=s,k(()=>n.selected=s==i.options[i.key]?!0:void 0),n})()})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),t})()}function dd(i){return d(Jr,{get id(){return i.key},get input_id(){return i.key},get init_color(){return i.options[i.key]},class:"color_input_wrapper",get onInput(){return i.params.autosend?i.submit:void 0}})}function fd(i){return(()=>{var t=To(),e=t.firstChild;return lt(e,"input",i.params.autosend?i.submit:void 0,!0),H(e,"type","source"),v(e,d(N,{get each(){return i.sources()},children:({indicator:s,function_name:n,source_type:r})=>{if(i.indicator_id!==s.id){if(r!==i.params.src_type&&r!=="any"&&i.params.src_type!=="any")return;{let o=[s.id,n].join(":");return(()=>{var l=rn();return l.value=o,k(h=>{var a=[s.type,s.name,n].join(":"),c=o==i.options[i.key]?!0:void 0;return a!==h.e&&(l.innerText=h.e=a),c!==h.t&&(l.selected=h.t=c),h},{e:void 0,t:void 0}),l})()}}}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),t})()}function gd(i){let t=document.createElement("div");const e=()=>{t.querySelectorAll("form").forEach(s=>s.requestSubmit())};return(()=>{var s=ed(),n=s.firstChild,r=n.firstChild,o=t;return typeof o=="function"?q(o,s):t=s,v(s,d(N,{get each(){return Array.from(i.series.entries())},children:([l,h],a)=>{let c=i.series.get(l);if(c!==void 0)return d(Lu,{series:c,get name(){return c._name??`Series #${a()+1}`}})}}),n),r.$$click=e,s})()}Mt(["click","input"]);function Mr(i){if(i===void 0)throw new Error("Value is undefined");return i}class md{_pane;_chart;_series;_id="";_type="null";_options;obj_tree_el;_requestUpdate;requestUpdate(){this._requestUpdate&&this._requestUpdate()}constructor(t,e,s){this._id=t,this._type=e,this._options=s}get id(){return this._id}get chart(){return Mr(this._chart)}get series(){return Mr(this._series)}options(){return structuredClone(this._options)}applyOptions(t){t!==void 0&&(this._options={...this._options,...t}),this.requestUpdate()}attached({chart:t,series:e,requestUpdate:s}){this._chart=t,this._series=e,this._options.tangible&&(this.onDataUpdate&&this._series.subscribeDataChanged(this._fireDataUpdated),this.onClick&&this._chart.subscribeClick(this._fireClick),this.onDblClick&&this._chart.subscribeDblClick(this._fireDblClick),this.onCrosshairMove&&this._chart.subscribeCrosshairMove(this._fireCrosshairMove),this.onMouseDown&&this._chart.chartElement().addEventListener("mousedown",this._fireMouseDown),this.onMouseUp&&this._chart.chartElement().addEventListener("mouseup",this._fireMouseUp)),this._requestUpdate=s,this.requestUpdate()}detached(){this.onDataUpdate&&this._series?.unsubscribeDataChanged(this._fireDataUpdated),this.onClick&&this._chart?.unsubscribeClick(this._fireClick),this.onDblClick&&this._chart?.unsubscribeDblClick(this._fireDblClick),this.onCrosshairMove&&this._chart?.unsubscribeCrosshairMove(this._fireCrosshairMove),this.onMouseDown&&this._chart?.chartElement().removeEventListener("mousedown",this._fireMouseDown),this.onMouseUp&&this._chart?.chartElement().removeEventListener("mouseup",this._fireMouseUp),this._chart=void 0,this._series=void 0,this._requestUpdate=void 0}_fireDataUpdated=t=>{this.onDataUpdate&&this.onDataUpdate(t)};_fireMouseDown=t=>{this.onMouseDown&&this._pane&&this.onMouseDown(this._pane.make_event_params(t))};_fireMouseUp=t=>{this.onMouseUp&&this._pane&&this.onMouseUp(this._pane.make_event_params(t))};_fireClick=t=>{this.onClick&&this.onClick(t)};_fireDblClick=t=>{this.onDblClick&&this.onDblClick(t)};_fireCrosshairMove=t=>{this.onCrosshairMove&&this.onCrosshairMove(t)};movePoint(t,e,s){let n=this.chart.timeScale().timeToCoordinate(t.time),r=this.series.priceToCoordinate(t.value);if(!n||!r)return null;let o=this.chart.timeScale().coordinateToLogical(n);if(!o||(n=this.chart.timeScale().logicalToCoordinate(o+e),!n))return null;let l=this.chart.timeScale().coordinateToTime(n),h=this.series.coordinateToPrice(r+s);return!l||!h?null:{time:l,value:h}}nearestBarTime(t,e=!0){let s=this._chart?.timeScale().kl._u;if(s===void 0)return null;const n=Array.from(s,o=>o.originalTime);let r=oh(n,t,(o,l)=>o-l);return r>=0?n[r]:e?n[-r]:n[Math.min(-r+1,n.length-1)]}}const pd=getComputedStyle(document.body).getPropertyValue("--layout-main-fill"),vd=getComputedStyle(document.body).getPropertyValue("--accent-color");function Cr(i,t,e=!1,s=pd,n=vd){i.beginPath(),i.ellipse(t.x,t.y,6,6,0,0,Math.PI*2),i.fillStyle=n,i.fill(),i.beginPath(),i.ellipse(t.x,t.y,e?4:5,e?4:5,0,0,Math.PI*2),i.fillStyle=s,i.fill()}const $r={visible:!0,tangible:!0,autoscale:!1,width:1,lineColor:"rgb(255, 0, 0)"};class zo extends md{_p1;_p2;_paneView;_options=$r;constructor(t,e){super(t,"TrendLine",{...$r,...e.options}),this._p1=e.p1,this._p2=e.p2,this._paneView=new _d(this)}_pointIndex(t){const e=this.chart.timeScale();return e.coordinateToLogical(e.timeToCoordinate(t.time)??-1)}updateData(t){t.p1!==null&&(this._p1=t.p1),t.p2!==null&&(this._p2=t.p2),this.applyOptions(t.options)}paneViews(){return[this._paneView]}updateAllViews(){this._paneView.update()}autoscaleInfo(t,e){if(!this._options.autoscale||!this._options.visible||this._p1===null||this._p2===null)return null;const s=this._pointIndex(this._p1),n=this._pointIndex(this._p2);return s===null||n===null||e<s||t>n?null:{priceRange:{minValue:Math.min(this._p1.value,this._p2.value),maxValue:Math.max(this._p1.value,this._p2.value)}}}hitTest(t,e){return this._paneView.hitTest(t,e)}onMouseDown(t){if(!this._options.visible||!this._options.tangible)return;const e=t.hoveredObjectId;if(!e||!e.startsWith(this.id)||!t.sourceEvent||!t.logical){this._paneView._selected=!1;return}let s;if(e===this._id)s=this.mouseMoveWholeLine.bind(this,{x:t.logical,y:t.sourceEvent.localY});else if(e===this._id+"_p1")s=this.mouseMoveEndPoint.bind(this,!0);else if(e===this._id+"_p2")s=this.mouseMoveEndPoint.bind(this,!1);else return;this._paneView._selected=!0;const n=this.chart,r=n.options().handleScroll.valueOf();let o;typeof r=="boolean"?o=r:o=r.pressedMouseMove,n.applyOptions({handleScroll:{pressedMouseMove:!1}}),s=s.bind(this),n.subscribeCrosshairMove(s),document.addEventListener("mouseup",()=>{n.unsubscribeCrosshairMove(s),n.applyOptions({handleScroll:{pressedMouseMove:o}})},{once:!0})}onClick(t){if(!(!this._options.visible||!this._options.tangible))switch(t.hoveredObjectId){case this._id+"_p1":console.log("clicked p1");break;case this._id+"_p2":console.log("clicked p2");break;case this._id:console.log("clicked line");break}}mouseMoveEndPoint(t,e){if(!e.sourceEvent)return;let s=this.chart.timeScale().coordinateToTime(e.sourceEvent.localX),n=this.series.coordinateToPrice(e.sourceEvent.localY);s&&n&&(t?this.updateData({p1:{time:s,value:n},p2:null}):this.updateData({p1:null,p2:{time:s,value:n}}))}mouseMoveWholeLine(t,e){if(!e.logical||!e.sourceEvent||!this._p1||!this._p2)return;let s=e.logical-t.x,n=e.sourceEvent.localY-t.y,r=this.movePoint(this._p1,s,n),o=this.movePoint(this._p2,s,n);!r||!o||(this.updateData({p1:r,p2:o}),t.x=e.logical,t.y=e.sourceEvent.localY)}}class _d{_p1=null;_p2=null;_source;_hovered=!1;_selected=!1;_renderer;line=null;ctx=null;constructor(t){this._source=t,this._renderer=new bd(this._source._options,this.passback.bind(this))}update(){if(this._source._p1===null||this._source._p2===null)return;const t=this._source.series,e=this._source.chart.timeScale();let s=t.priceToCoordinate(this._source._p1.value),n=t.priceToCoordinate(this._source._p2.value),r=e.timeToCoordinate(this._source._p1.time),o=e.timeToCoordinate(this._source._p2.time);if(r===null){let l=this._source.nearestBarTime(this._source._p1.time);l!==null&&(r=e.timeToCoordinate(l),this._source._p1.time=l)}if(o===null){let l=this._source.nearestBarTime(this._source._p2.time);l!==null&&(o=e.timeToCoordinate(l),this._source._p2.time=l)}if(r===null||o===null||s===null||n===null){this._p1=null,this._p2=null;return}this._p1={x:Math.round(r),y:Math.round(s)},this._p2={x:Math.round(o),y:Math.round(n)}}renderer(){return this._renderer._update(this._p1,this._p2,this._hovered,this._selected,this._source._options),this._renderer}passback(t,e){this.ctx=t,this.line=e}hitTest(t,e){return this.line===null||this.ctx===null||this._p1===null||this._p2===null||!this._source._options.tangible||!this._source._options.visible||(this._hovered=!1,!(t+10>this._p1.x&&t-10<this._p2.x||t-10<this._p1.x&&t+10>this._p2.x))||!(e+10>this._p1.y&&e-10<this._p2.y||e-10<this._p1.y&&e+10>this._p2.y)?null:Math.abs(this._p1.x-t)<10&&Math.abs(this._p1.y-e)<10?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id+"_p1",zOrder:"normal"}):Math.abs(this._p2.x-t)<10&&Math.abs(this._p2.y-e)<10?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id+"_p2",zOrder:"normal"}):(this.ctx.lineWidth=Math.max(this._source._options.width,6),this.ctx.isPointInStroke(this.line,t,e)?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id,zOrder:"normal"}):null)}}class bd{_p1=null;_p2=null;_hovered=!1;_selected=!1;_options;_passback;constructor(t,e){this._options=t,this._passback=e}draw(t){t.useMediaCoordinateSpace(e=>{const s=e.context;if(this._p1===null||this._p2===null)this._passback(s,null);else{let n=new Path2D;n.moveTo(this._p1.x,this._p1.y),n.lineTo(this._p2.x,this._p2.y),s.lineWidth=this._options.width,s.strokeStyle=this._options.lineColor,s.stroke(n),(this._hovered||this._selected)&&(Cr(s,this._p1,this._selected),Cr(s,this._p2,this._selected)),this._passback(s,n)}})}_update(t,e,s,n,r){this._p1=t,this._p2=e,this._options=r,this._hovered=s,this._selected=n}}const Do=new Map([["TrendLine",zo]]);class wd{id;type;name;pane;objVisibility;labelHtml;setLabelHtml;menu_id;menu_struct;setOptions;sources;menuVisibility;setMenuVisibility;series=new Map;visiblity=new Map;primitives=new Map;constructor(t,e,s,n,r){this.id=t,this.name=s,this.pane=r,this.type=e,this.sources=n;const o=C(!0);this.objVisibility=o,this.setVisibility.bind(this);const l=C(void 0);this.labelHtml=l[0],this.setLabelHtml=l[1],this.pane.attach_indicator_to_legend(this)}setLabel(t){this.setLabelHtml(t!==""?t:void 0)}move_to_pane(t){}delete(){this.series.forEach((t,e)=>{t.remove()}),this.primitives.forEach((t,e)=>{this.pane.whitespace_series.detachPrimitive(t)}),this.pane.detach_indicator_from_legend(this)}setVisibility(t){this.objVisibility[1](t);const e=[this.series,this.primitives];for(let s=0;s<e.length;s++)if(t)for(const[n,r]of e[s].entries())r.applyOptions({visible:this.visiblity.get(n)??!0});else for(const[n,r]of e[s].entries())this.visiblity.set(n,r.options().visible),r.applyOptions({visible:!1})}add_series(t,e,s=void 0){this.series.set(t,new $o(t,this.id,s,this.name!==""?this.name:this.type,e,this.pane))}remove_series(t){let e=this.series.get(t);e!==void 0&&(e.remove(),this.series.delete(t))}add_primitive(t,e,s){let n=Do.get(e);if(n===void 0)return;let r=new n(this.id+t,s);this.primitives.set(t,r),this.pane.whitespace_series.attachPrimitive(r)}remove_primitive(t){let e=this.primitives.get(t);e!==void 0&&(this.pane.whitespace_series.detachPrimitive(e),this.primitives.delete(t))}update_primitive(t,e){let s=this.primitives.get(t);s!==void 0&&s.updateData(e)}applyOptions(t){this.setOptions&&this.setOptions(t)}set_menu_struct(t,e){if(this.menu_id!==void 0){this.setOptions&&this.setOptions(e);return}const s=C(!1);this.menuVisibility=s[0],this.setMenuVisibility=s[1];const[n,r]=Ct(e);this.setOptions=r,this.menu_struct=t,this.menu_id=`${this.pane.id}_${this.id}_options`,gt().attachOverlay(this.menu_id,void 0,s),gt().attachOverlay(this.menu_id,id({id:this.menu_id,parent_ind:this,options:n,menu_struct:this.menu_struct,close_menu:()=>s[1](!1),sources:this.sources,container_id:this.pane.id.substring(0,6),frame_id:this.pane.id.substring(0,13),indicator_id:this.id}),s)}}var yd=y("<div>"),Di=class{x;y;width;height;constructor(i){this.x=Math.floor(i.x),this.y=Math.floor(i.y),this.width=Math.floor(i.width),this.height=Math.floor(i.height)}get rect(){return{x:this.x,y:this.y,width:this.width,height:this.height}}get left(){return this.x}get top(){return this.y}get right(){return this.x+this.width}get bottom(){return this.y+this.height}get center(){return{x:this.x+this.width*.5,y:this.y+this.height*.5}}get corners(){return{topLeft:{x:this.left,y:this.top},topRight:{x:this.right,y:this.top},bottomRight:{x:this.left,y:this.bottom},bottomLeft:{x:this.right,y:this.bottom}}}},pe=i=>{let t=new Di(i.getBoundingClientRect());const{transform:e}=getComputedStyle(i);return e&&(t=xd(t,e)),t},xd=(i,t)=>{let e,s;if(t.startsWith("matrix3d(")){const n=t.slice(9,-1).split(/, /);e=+n[12],s=+n[13]}else if(t.startsWith("matrix(")){const n=t.slice(7,-1).split(/, /);e=+n[4],s=+n[5]}else e=0,s=0;return new Di({...i,x:i.x-e,y:i.y-s})},kt=()=>({x:0,y:0}),ln=(i,t)=>i.x===t.x&&i.y===t.y,as=(i,t)=>new Di({...i,x:i.x+t.x,y:i.y+t.y}),Sd=(i,t)=>Math.sqrt(Math.pow(i.x-t.x,2)+Math.pow(i.y-t.y,2)),Md=(i,t)=>{const e=Math.max(i.top,t.top),s=Math.max(i.left,t.left),n=Math.min(i.right,t.right),r=Math.min(i.bottom,t.bottom),o=n-s,l=r-e;if(s<n&&e<r){const h=i.width*i.height,a=t.width*t.height,c=o*l;return c/(h+a-c)}return 0},cs=(i,t)=>i.x===t.x&&i.y===t.y&&i.width===t.width&&i.height===t.height,Cd=(i,t,e)=>{const s=i.transformed.center,n={distance:1/0,droppable:null};for(const r of t){const o=Sd(s,r.layout.center);o<n.distance?(n.distance=o,n.droppable=r):o===n.distance&&r.id===e.activeDroppableId&&(n.droppable=r)}return n.droppable},$d=(i,t,e)=>{const s=i.transformed,n={ratio:0,droppable:null};for(const r of t){const o=Md(s,r.layout);o>n.ratio?(n.ratio=o,n.droppable=r):o>0&&o===n.ratio&&r.id===e.activeDroppableId&&(n.droppable=r)}return n.droppable},Ao=_t(),Ed=i=>{const t=A({collisionDetector:$d},i),[e,s]=Ct({draggables:{},droppables:{},sensors:{},active:{draggableId:null,get draggable(){return e.active.draggableId!==null?e.draggables[e.active.draggableId]:null},droppableId:null,get droppable(){return e.active.droppableId!==null?e.droppables[e.active.droppableId]:null},sensorId:null,get sensor(){return e.active.sensorId!==null?e.sensors[e.active.sensorId]:null},overlay:null}}),n=(S,T,D)=>{S.substring(0,S.length-1),Y(()=>e[S][T])&&s(S,T,"transformers",D.id,D)},r=(S,T,D)=>{S.substring(0,S.length-1),Y(()=>e[S][T])&&Y(()=>e[S][T].transformers[D])&&s(S,T,"transformers",D,void 0)},o=({id:S,node:T,layout:D,data:ot})=>{const B=e.draggables[S],I={id:S,node:T,layout:D,data:ot,_pendingCleanup:!1};let G;if(!B)Object.defineProperties(I,{transformers:{enumerable:!0,configurable:!0,writable:!0,value:{}},transform:{enumerable:!0,configurable:!0,get:()=>{if(e.active.overlay)return kt();const et=Object.values(e.draggables[S].transformers);return et.sort(($t,le)=>$t.order-le.order),et.reduce(($t,le)=>le.callback($t),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>as(e.draggables[S].layout,e.draggables[S].transform)}});else if(e.active.draggableId===S&&!e.active.overlay){const et={x:B.layout.x-D.x,y:B.layout.y-D.y},$t="addDraggable-existing-offset",le=B.transformers[$t],gn=le?le.callback(et):et;G={id:$t,order:100,callback:mn=>({x:mn.x+gn.x,y:mn.y+gn.y})},at(()=>r("draggables",S,$t))}It(()=>{s("draggables",S,I),G&&n("draggables",S,G)}),e.active.draggable&&E()},l=S=>{Y(()=>e.draggables[S])&&(s("draggables",S,"_pendingCleanup",!0),queueMicrotask(()=>h(S)))},h=S=>{if(e.draggables[S]?._pendingCleanup){const T=e.active.draggableId===S;It(()=>{T&&s("active","draggableId",null),s("draggables",S,void 0)})}},a=({id:S,node:T,layout:D,data:ot})=>{const B=e.droppables[S],I={id:S,node:T,layout:D,data:ot,_pendingCleanup:!1};B||Object.defineProperties(I,{transformers:{enumerable:!0,configurable:!0,writable:!0,value:{}},transform:{enumerable:!0,configurable:!0,get:()=>{const G=Object.values(e.droppables[S].transformers);return G.sort((et,$t)=>et.order-$t.order),G.reduce((et,$t)=>$t.callback(et),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>as(e.droppables[S].layout,e.droppables[S].transform)}}),s("droppables",S,I),e.active.draggable&&E()},c=S=>{Y(()=>e.droppables[S])&&(s("droppables",S,"_pendingCleanup",!0),queueMicrotask(()=>u(S)))},u=S=>{if(e.droppables[S]?._pendingCleanup){const T=e.active.droppableId===S;It(()=>{T&&s("active","droppableId",null),s("droppables",S,void 0)})}},f=({id:S,activators:T})=>{s("sensors",S,{id:S,activators:T,coordinates:{origin:{x:0,y:0},current:{x:0,y:0},get delta(){return{x:e.sensors[S].coordinates.current.x-e.sensors[S].coordinates.origin.x,y:e.sensors[S].coordinates.current.y-e.sensors[S].coordinates.origin.y}}}})},m=S=>{if(!Y(()=>e.sensors[S]))return;const T=e.active.sensorId===S;It(()=>{T&&s("active","sensorId",null),s("sensors",S,void 0)})},g=({node:S,layout:T})=>{const D=e.active.overlay,ot={node:S,layout:T};D||Object.defineProperties(ot,{id:{enumerable:!0,configurable:!0,get:()=>e.active.draggable?.id},data:{enumerable:!0,configurable:!0,get:()=>e.active.draggable?.data},transformers:{enumerable:!0,configurable:!0,get:()=>Object.fromEntries(Object.entries(e.active.draggable?e.active.draggable.transformers:{}).filter(([B])=>B!=="addDraggable-existing-offset"))},transform:{enumerable:!0,configurable:!0,get:()=>{const B=Object.values(e.active.overlay?e.active.overlay.transformers:[]);return B.sort((I,G)=>I.order-G.order),B.reduce((I,G)=>G.callback(I),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>e.active.overlay?as(e.active.overlay.layout,e.active.overlay.transform):new Di({x:0,y:0,width:0,height:0})}}),s("active","overlay",ot)},p=()=>s("active","overlay",null),_=(S,T)=>{It(()=>{s("sensors",S,"coordinates",{origin:{...T},current:{...T}}),s("active","sensorId",S)})},w=S=>{const T=e.active.sensorId;T&&s("sensors",T,"coordinates","current",{...S})},x=()=>s("active","sensorId",null),$=(S,T)=>{const D={};for(const B of Object.values(e.sensors))if(B)for(const[I,G]of Object.entries(B.activators))D[I]??=[],D[I].push({sensor:B,activator:G});const ot={};for(const B in D){let I=B;T&&(I=`on${B}`),ot[I]=G=>{for(const{activator:et}of D[B]){if(e.active.sensor)break;et(G,S)}}}return ot},E=()=>{let S=!1;const T=Object.values(e.draggables),D=Object.values(e.droppables),ot=e.active.overlay;return It(()=>{const B=new WeakMap;for(const I of T)if(I){const G=I.layout;B.has(I.node)||B.set(I.node,pe(I.node));const et=B.get(I.node);cs(G,et)||(s("draggables",I.id,"layout",et),S=!0)}for(const I of D)if(I){const G=I.layout;B.has(I.node)||B.set(I.node,pe(I.node));const et=B.get(I.node);cs(G,et)||(s("droppables",I.id,"layout",et),S=!0)}if(ot){const I=ot.layout,G=pe(ot.node);cs(I,G)||(s("active","overlay","layout",G),S=!0)}}),S},L=()=>{const S=e.active.overlay??e.active.draggable;if(S){const T=t.collisionDetector(S,Object.values(e.droppables),{activeDroppableId:e.active.droppableId}),D=T?T.id:null;e.active.droppableId!==D&&s("active","droppableId",D)}},F=S=>{const T={id:"sensorMove",order:0,callback:D=>e.active.sensor?{x:D.x+e.active.sensor.coordinates.delta.x,y:D.y+e.active.sensor.coordinates.delta.y}:D};E(),It(()=>{s("active","draggableId",S),n("draggables",S,T)}),L()},W=()=>{const S=Y(()=>e.active.draggableId);It(()=>{S!==null&&r("draggables",S,"sensorMove"),s("active",["draggableId","droppableId"],null)}),E()},z=S=>{X(()=>{const T=e.active.draggable;T&&Y(()=>S({draggable:T}))})},R=S=>{X(()=>{const T=e.active.draggable;if(T){const D=Y(()=>e.active.overlay);Object.values(D?D.transform:T.transform),Y(()=>S({draggable:T,overlay:D}))}})},U=S=>{X(()=>{const T=e.active.draggable,D=e.active.droppable;T&&Y(()=>S({draggable:T,droppable:D,overlay:e.active.overlay}))})},at=S=>{X(({previousDraggable:T,previousDroppable:D,previousOverlay:ot})=>{const B=e.active.draggable,I=B?e.active.droppable:null,G=B?e.active.overlay:null;return!B&&T&&Y(()=>S({draggable:T,droppable:D,overlay:ot})),{previousDraggable:B,previousDroppable:I,previousOverlay:G}},{previousDraggable:null,previousDroppable:null,previousOverlay:null})};R(()=>L()),t.onDragStart&&z(t.onDragStart),t.onDragMove&&R(t.onDragMove),t.onDragOver&&U(t.onDragOver),t.onDragEnd&&at(t.onDragEnd);const Zt=[e,{addTransformer:n,removeTransformer:r,addDraggable:o,removeDraggable:l,addDroppable:a,removeDroppable:c,addSensor:f,removeSensor:m,setOverlay:g,clearOverlay:p,recomputeLayouts:E,detectCollisions:L,draggableActivators:$,sensorStart:_,sensorMove:w,sensorEnd:x,dragStart:F,dragEnd:W,onDragStart:z,onDragMove:R,onDragOver:U,onDragEnd:at}];return d(Ao.Provider,{value:Zt,get children(){return t.children}})},Yt=()=>Ut(Ao)||null,kd=(i="pointer-sensor")=>{const[t,{addSensor:e,removeSensor:s,sensorStart:n,sensorMove:r,sensorEnd:o,dragStart:l,dragEnd:h}]=Yt(),a=250,c=10;ft(()=>{e({id:i,activators:{pointerdown:p}})}),vt(()=>{s(i)});const u=()=>t.active.sensorId===i,f={x:0,y:0};let m=null,g=null;const p=(L,F)=>{L.button===0&&(document.addEventListener("pointermove",x),document.addEventListener("pointerup",$),g=F,f.x=L.clientX,f.y=L.clientY,m=window.setTimeout(w,a))},_=()=>{m&&(clearTimeout(m),m=null),document.removeEventListener("pointermove",x),document.removeEventListener("pointerup",$),document.removeEventListener("selectionchange",E)},w=()=>{t.active.sensor?u()||_():(n(i,f),l(g),E(),document.addEventListener("selectionchange",E))},x=L=>{const F={x:L.clientX,y:L.clientY};if(!t.active.sensor){const W={x:F.x-f.x,y:F.y-f.y};Math.sqrt(W.x**2+W.y**2)>c&&w()}u()&&(L.preventDefault(),r(F))},$=L=>{_(),u()&&(L.preventDefault(),h(),o())},E=()=>{window.getSelection()?.removeAllRanges()}},Ld=i=>(kd(),dt(()=>i.children)),Ai=i=>({transform:`translate3d(${i.x}px, ${i.y}px, 0)`}),Td=(i,t={})=>{const[e,{addDraggable:s,removeDraggable:n,draggableActivators:r}]=Yt(),[o,l]=C(null);ft(()=>{const u=o();u&&s({id:i,node:u,layout:pe(u),data:t})}),vt(()=>n(i));const h=()=>e.active.draggableId===i,a=()=>e.draggables[i]?.transform||kt();return Object.defineProperties((u,f)=>{const m=f?f():{};X(()=>{const g=o(),p=r(i);if(g)for(const _ in p)g.addEventListener(_,p[_]);vt(()=>{if(g)for(const _ in p)g.removeEventListener(_,p[_])})}),l(u),m.skipTransform||X(()=>{const g=a();if(ln(g,kt()))u.style.removeProperty("transform");else{const p=Ai(a());u.style.setProperty("transform",p.transform??null)}})},{ref:{enumerable:!0,value:l},isActiveDraggable:{enumerable:!0,get:h},dragActivators:{enumerable:!0,get:()=>r(i,!0)},transform:{enumerable:!0,get:a}})},Pd=(i,t={})=>{const[e,{addDroppable:s,removeDroppable:n}]=Yt(),[r,o]=C(null);ft(()=>{const c=r();c&&s({id:i,node:c,layout:pe(c),data:t})}),vt(()=>n(i));const l=()=>e.active.droppableId===i,h=()=>e.droppables[i]?.transform||kt();return Object.defineProperties((c,u)=>{const f=u?u():{};o(c),f.skipTransform||X(()=>{const m=h();if(ln(m,kt()))c.style.removeProperty("transform");else{const g=Ai(h());c.style.setProperty("transform",g.transform??null)}})},{ref:{enumerable:!0,value:o},isActiveDroppable:{enumerable:!0,get:l},transform:{enumerable:!0,get:h}})},zd=i=>{const[t,{onDragStart:e,onDragEnd:s,setOverlay:n,clearOverlay:r}]=Yt();let o;e(({draggable:h})=>{n({node:h.node,layout:h.layout}),queueMicrotask(()=>{if(o){const a=pe(o),c={x:(h.layout.width-a.width)/2,y:(h.layout.height-a.height)/2};a.x+=c.x,a.y+=c.y,n({node:o,layout:a})}})}),s(()=>queueMicrotask(r));const l=()=>{const h=t.active.overlay,a=t.active.draggable;return!h||!a?{}:{position:"fixed",transition:"transform 0s",top:`${h.layout.top}px`,left:`${h.layout.left}px`,"min-width":`${a.layout.width}px`,"min-height":`${a.layout.height}px`,...Ai(h.transform),...i.style}};return d(ml,{get mount(){return document.body},get children(){return d(j,{get when(){return t.active.draggable},get children(){var h=yd(),a=o;return typeof a=="function"?q(a,h):o=h,v(h,(()=>{var c=dt(()=>typeof i.children=="function");return()=>c()?i.children(t.active.draggable):i.children})()),k(c=>{var u=i.class,f=l();return u!==c.e&&$i(h,c.e=u),c.t=Ht(h,f,c.t),c},{e:void 0,t:void 0}),h}})}})},Dd=(i,t,e)=>{const s=i.slice();return s.splice(e,0,...s.splice(t,1)),s},Io=_t(),Ad=i=>{const[t]=Yt(),[e,s]=Ct({initialIds:[],sortedIds:[]}),n=l=>l>=0&&l<e.initialIds.length;X(()=>{s("initialIds",[...i.ids]),s("sortedIds",[...i.ids])}),X(()=>{t.active.draggableId&&t.active.droppableId?Y(()=>{const l=e.sortedIds.indexOf(t.active.draggableId),h=e.initialIds.indexOf(t.active.droppableId);if(!n(l)||!n(h))s("sortedIds",[...i.ids]);else if(l!==h){const a=Dd(e.sortedIds,l,h);s("sortedIds",a)}}):s("sortedIds",[...i.ids])});const o=[e,{}];return d(Io.Provider,{value:o,get children(){return i.children}})},Id=()=>Ut(Io)||null,Od=(i,t)=>e=>{i(e),t(e)},Rd=(i,t={})=>{const[e,{addTransformer:s,removeTransformer:n}]=Yt(),[r]=Id(),o=Td(i,t),l=Pd(i,t),h=Od(o.ref,l.ref),a=()=>r.initialIds.indexOf(i),c=()=>r.sortedIds.indexOf(i),u=_=>e.droppables[_]?.layout||null,f=()=>{const _=kt(),w=a(),x=c();if(x!==w){const $=u(i),E=u(r.initialIds[x]);$&&E&&(_.x=E.x-$.x,_.y=E.y-$.y)}return _},m={id:"sortableOffset",order:100,callback:_=>{const w=f();return{x:_.x+w.x,y:_.y+w.y}}};ft(()=>s("droppables",i,m)),vt(()=>n("droppables",i,m.id));const g=()=>(i===e.active.draggableId&&!e.active.overlay?e.draggables[i]?.transform:e.droppables[i]?.transform)||kt();return Object.defineProperties(_=>{o(_,()=>({skipTransform:!0})),l(_,()=>({skipTransform:!0})),X(()=>{const w=g();if(ln(w,kt()))_.style.removeProperty("transform");else{const x=Ai(g());_.style.setProperty("transform",x.transform??null)}})},{ref:{enumerable:!0,value:h},transform:{enumerable:!0,get:g},isActiveDraggable:{enumerable:!0,get:()=>o.isActiveDraggable},dragActivators:{enumerable:!0,get:()=>o.dragActivators},isActiveDroppable:{enumerable:!0,get:()=>l.isActiveDroppable}})},Vd=y("<div>"),Wd=y("<div class=drag_tag><span></span><div class=drag_tag_bottom_border>"),Bd=y("<div class=drag_tag_overlay><span></span><div class=drag_tag_bottom_border>");function hn(i){const[,t]=tt(i,["ids","children","overlay_child","reorder_function"]);t.classList?t.classList.drag_tag_column=!0:t.classList={drag_tag_column:!0};const[e,s]=C("");return d(Ed,{onDragStart:({draggable:o})=>{s(o.id)},onDragEnd:({draggable:o,droppable:l})=>{if(o&&l){const h=i.ids?.()??[],a=h.indexOf(o.id),c=h.indexOf(l.id);a!==c&&i.reorder_function(a,c)}},collisionDetector:Cd,get children(){return[d(Ld,{}),d(Nd,{}),(()=>{var o=Vd();return yt(o,t,!1,!0),v(o,d(Ad,{get ids(){return i.ids?.()??[]},get children(){return i.children}})),o})(),d(j,{get when(){return e()},keyed:!0,get children(){return d(zd,{get children(){return i.overlay_child?.({id:e()})??void 0}})}})]}})}function Nd(){const i=Yt()?.[1];if(i===void 0)return;const{onDragStart:t,onDragEnd:e,addTransformer:s,removeTransformer:n}=i,r={id:"constrain-x-axis",order:100,callback:o=>({...o,x:0})};return t(({draggable:o})=>{s("draggables",o.id,r)}),e(({draggable:o})=>{n("draggables",o.id,r.id)}),[]}function an(i){const t=Rd(i.tag_id()),e=Yt()?.[0],[,s]=tt(i,["tag_id","tag_name"]);return(()=>{var n=Wd(),r=n.firstChild,o=r.nextSibling;return q(t,n,()=>!0),yt(n,A(s,{get style(){return{opacity:t.isActiveDraggable?"25%":void 0,transition:e?.active.draggable?"transform .15s ease-in-out":void 0}}}),!1,!0),v(n,()=>i.children,o),k(l=>{var h=i.tag_name(),a="id: "+i.tag_id();return h!==l.e&&(r.innerText=l.e=h),a!==l.t&&(o.innerText=l.t=a),l},{e:void 0,t:void 0}),n})()}function cn(i){const[,t]=tt(i,["tag_id","tag_name"]);return(()=>{var e=Bd(),s=e.firstChild,n=s.nextSibling;return yt(e,t,!1,!0),v(e,()=>i.children,n),k(r=>{var o=i.tag_name(),l="id: "+i.tag_id();return o!==r.e&&(s.innerText=r.e=o),l!==r.t&&(n.innerText=r.t=l),r},{e:void 0,t:void 0}),e})()}var jd=y("<div class=widget_panel_title>Series Object Tree"),Fd=y("<div class=obj_tree_resize_handle>"),Ud=y("<div class=widget_panel_title>Primitive Object Tree");const Hd=250,Xd={ids:()=>[],setIds:()=>{},serieses:[],setSerieses:()=>{},seriesReorderFunc:()=>()=>{},setSeriesReorderFunc:()=>{},selectedSeries:()=>{},setSelectedSeries:()=>{}};let Ds=_t(Xd);function Et(){return Ut(Ds)}function Kd(i){const[t,e]=C([]),[s,n]=Ct([]),[r,o]=C(),[l,h]=C(()=>{}),a={ids:t,setIds:e,serieses:s,setSerieses:n,seriesReorderFunc:l,setSeriesReorderFunc:h,selectedSeries:r,setSelectedSeries:o};return Ds=_t(a),d(Ds.Provider,{value:a,get children(){return i.children}})}const Er=50;function qd(){const i=C(),t=C();let e=-1,s=-1,n=.5;const r=u=>Math.ceil(u?.getBoundingClientRect().height??0),o=C({height:`${s}px`}),l=C({height:`${s}px`}),h=u=>{let f=e-r(i[0]())-r(t[0]());s=Math.min(Math.max(Er,s+u.movementY),f-Er),o[1]({height:`${s}px`}),l[1]({height:`${f-s}px`}),n=s/f},a=()=>{document.addEventListener("mousemove",h),document.addEventListener("mouseup",()=>document.removeEventListener("mousemove",h),{once:!0})},c=u=>{e=u.height;let f=e-r(i[0]())-r(t[0]());Et().selectedSeries()?(s=Math.floor(f*n),o[1]({height:`${s}px`}),l[1]({height:`${f-s}px`})):(o[1]({height:`${f}px`}),s=f)};return ft(()=>{oe().setWidgetPanelWidth(Hd),oe().setWidgetPanelResizeFunc(()=>c)}),[(()=>{var u=jd(),f=t[1];return typeof f=="function"?q(f,u):t[1]=u,u})(),d(Gd,{get style(){return o[0]()}}),d(j,{get when(){return Et().selectedSeries()!==void 0},keyed:!0,get children(){return[(()=>{var u=Fd();return u.$$mousedown=a,u})(),(()=>{var u=Ud(),f=i[1];return typeof f=="function"?q(f,u):i[1]=u,u})(),d(Yd,{get style(){return l[0]()}})]}})]}function Gd(i){const t=Et().ids,e=Et().serieses,s=Et().seriesReorderFunc,n=Et().selectedSeries,r=Et().setSelectedSeries;return X(Tt(t,()=>{let o=n()?._id;o!==void 0&&t().find(l=>l===o)===void 0&&r(void 0)})),d(j,{get when(){return t()},keyed:!0,get children(){return d(hn,{ids:t,ref(o){var l=i.ref;typeof l=="function"?l(o):i.ref=o},get style(){return i.style},classList:{obj_tree:!0},overlay_child:({id:o})=>cn({tag_id:()=>o,tag_name:()=>e.find(l=>l.id===o)?.name??""}),get reorder_function(){return s()},get children(){return d(N,{get each(){return t()},children:o=>{const l=e.find(h=>h.id===o);if(l!==void 0)return d(an,{onClick:()=>{n()!==l?r(l):r(void 0)},get"attr:target"(){return n()===l?"":void 0},tag_id:()=>o,tag_name:()=>e.find(h=>h.id===o)?.name??""})}})}})}})}function Yd(i){const t=Et().selectedSeries;return d(j,{get when(){return t()},keyed:!0,get children(){return d(hn,{get ids(){return t().primitiveIds},classList:{obj_tree:!0},get style(){return i.style},overlay_child:({id:e})=>cn({tag_id:()=>e,tag_name:()=>t().primitives.find(s=>s._id===e)?._type??""}),get reorder_function(){return t().reorderPrimitives.bind(t())},get children(){return d(N,{get each(){return t().primitiveIds()},children:e=>{const s=t().primitives.find(n=>n._id===e);if(s!==void 0)return d(an,{tag_id:()=>e,tag_name:()=>s._type,get children(){return s.obj_tree_el}})}})}})}})}Mt(["mousedown"]);const Zd={Ib:"time",se:"logical",zb:"point",Eb:"seriesData",Lb:"hoveredSeries",Nb:"hoveredObjectId",Fb:"sourceEvent"};class Jd{static _special_id_="main";id="";element;div;active;setActive;chart;primitives=new Map;primitive_serieses=[];whitespace_series;chart_div;leftScaleMode;leftScaleInvert;rightScaleMode;rightScaleInvert;series_map=new Map;setObjTreeIds;setObjTreeItems;setObjTreeReorderFunc;indicators;setIndicators;constructor(t){this.id=t;const[e,s]=C(!1);this.active=e,this.setActive=s;const[n,r]=C(document.createElement("div"));this.div=n;let o=document.createElement("div");const l=Qd();this.chart=Zc(o,l),this.chart_div=this.chart.chartElement();const h=C([]);this.indicators=h[0],this.setIndicators=h[1],this.rightScaleMode=C(l.rightPriceScale?.mode??0),this.rightScaleInvert=C(l.rightPriceScale?.invertScale??!1),this.leftScaleMode=C(l.leftPriceScale?.mode??0),this.leftScaleInvert=C(l.leftPriceScale?.invertScale??!1),X(Tt([this.rightScaleMode[0],this.rightScaleInvert[0],this.leftScaleMode[0],this.leftScaleInvert[0]],()=>{this.update_opts({})}));const a={parent_pane:this,indicators_list:this.indicators};this.element=sh({ref:r,chart_el:this.chart_div,legend_props:a,rightScaleMode:this.rightScaleMode,rightScaleInvert:this.rightScaleInvert,leftScaleMode:this.leftScaleMode,leftScaleInvert:this.leftScaleInvert}),this.whitespace_series=this.chart.addLineSeries(),this.add_primitive_group(),this.setObjTreeIds=Et().setIds,this.setObjTreeItems=Et().setSerieses,this.setObjTreeReorderFunc=Et().setSeriesReorderFunc,this.reorder_series=this.reorder_series.bind(this),this.chart_div.addEventListener("mousedown",()=>{this.chart.timeScale().applyOptions({shiftVisibleRangeOnNewBar:!1,allowShiftVisibleRangeOnWhitespaceReplacement:!1,rightBarStaysOnScroll:!1})}),window.document.addEventListener("mouseup",()=>{this.chart.timeScale().applyOptions({shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!0,rightBarStaysOnScroll:!0})})}get serieses(){return this.chart.lw.$i.kc[0].vo}get vis_serieses(){return this.chart.lw.$i.kc[0].vo.filter((t,e)=>e!==0)}get seriesAPIs(){return Array.from(this.vis_serieses,t=>this.chart.Sw.get(t))}get_series_index(t){return this.serieses.findIndex(e=>this.chart.Sw.get(e)===t)}make_event_params(t){let e=this.chart.timeScale().coordinateToLogical(t.offsetX),s={clientX:t.clientX,clientY:t.clientY,pageX:t.pageX,pageY:t.pageY,screenX:t.screenX,screenY:t.screenY,localX:t.offsetX,localY:t.offsetY,ctrlKey:t.ctrlKey,altKey:t.altKey,shiftKey:t.shiftKey,metaKey:t.metaKey};const n=this.chart.chartElement().getBoundingClientRect();let r=n&&t.clientX-n.left<n.width&&t.clientY-n.top<n.height?{x:t.clientX-n.left,y:t.clientY-n.top}:null,o={};return Object.entries(this.chart.lw.Ab(e,r,s)).forEach(([l,h])=>o[Zd[l]]=h),o}reorder_series(t,e,s=!0){t<0&&(t=this.serieses.length+t),e<0&&(e=this.serieses.length+e),s&&(t+=1,e+=1),this.serieses.splice(e,0,...this.serieses.splice(t,1)),this.serieses.forEach((n,r)=>n.Zi=r),this.chart.lw.$i.kc[0].po=null,this.chart.lw.$i.$h(),this.setObjTreeIds(Array.from(this.seriesAPIs,n=>this.series_map.get(n)?._id??""))}assign_active_pane(){if(window.active_pane===this)return;window.active_pane&&window.active_pane.setActive(!1),window.active_pane=this,this.setActive(!0);const t=Array.from(this.seriesAPIs,e=>this.series_map.get(e));this.setObjTreeItems(t),this.setObjTreeReorderFunc(()=>this.reorder_series),this.setObjTreeIds(Array.from(t,e=>e.id))}set_whitespace_data(t,e){this.whitespace_series.setData(t),this.primitive_serieses.forEach(s=>s.setData([e]))}update_whitespace_data(t,e){this.whitespace_series.update(t),this.primitive_serieses.forEach(s=>s.setData([e]))}attach_indicator_to_legend(t){this.indicators().includes(t)||this.setIndicators([...this.indicators(),t])}detach_indicator_from_legend(t){this.setIndicators(this.indicators().filter(e=>e!==t))}add_primitive_group(){const t=new $o("primitives","","Primitives",void 0,it.LINE,this);t.applyOptions({visible:!1}),this.primitive_serieses.push(t)}add_primitive(t,e,s){let n=Do.get(e);if(n===void 0)return;let r=new n(t,s);r._pane=this,this.primitives.set(t,r),this.whitespace_series.attachPrimitive(r)}update_primitive(t,e){let s=this.primitives.get(t);s!==void 0&&s.updateData(e)}attach_primitive(t){const e=Object.keys(this.primitives),s=_i(e,"p_");t._id=s,t._pane=this,this.primitives.set(s,t),this.primitive_serieses[0].attachPrimitive(t)}remove_primitive(t){let e=this.primitives.get(t);e!==void 0&&(this.whitespace_series.detachPrimitive(e),this.primitives.delete(t))}update_opts(t){ni(t,"leftPriceScale","mode",this.leftScaleMode),ni(t,"leftPriceScale","invertScale",this.leftScaleInvert),ni(t,"rightPriceScale","mode",this.rightScaleMode),ni(t,"rightPriceScale","invertScale",this.rightScaleInvert),this.chart.applyOptions(t)}resize(){this.chart.resize(Math.max(this.div().clientWidth-2,0),Math.max(this.div().clientHeight-2,0),!1)}fitcontent(){this.chart.timeScale().fitContent()}autoscale_time_axis(){this.chart.timeScale().resetTimeScale()}update_timescale_opts(t){this.chart.timeScale().applyOptions(t)}}function ni(i,t,e,s){i[t]!==void 0?i[t][e]===void 0?i[t][e]=s[0]():s[1](i[t][e]):i[t]={[e]:s[0]()}}function Qd(){const i=getComputedStyle(document.documentElement);return{layout:{background:{type:Es.VerticalGradient,topColor:i.getPropertyValue("--chart-bg-color-top"),bottomColor:i.getPropertyValue("--chart-bg-color-bottom")},textColor:i.getPropertyValue("--chart-text-color"),attributionLogo:i.getPropertyValue("--chart-tv-logo")==="true"},grid:{vertLines:{color:i.getPropertyValue("--chart-grid")},horzLines:{color:i.getPropertyValue("--chart-grid")}},leftPriceScale:{mode:parseInt(i.getPropertyValue("--chart-scale-mode-left"))},rightPriceScale:{mode:parseInt(i.getPropertyValue("--chart-scale-mode-right"))},crosshair:{mode:parseInt(i.getPropertyValue("--chart-xhair-mode"))},kineticScroll:{touch:!0},timeScale:{shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!0,rightBarStaysOnScroll:!0,rightOffset:parseInt(i.getPropertyValue("--chart-right-offset"))}}}const tf="charting_frame";class ef extends nh{type=tf;div;element;timeframe;symbol;series_type;indicators=new Map;sources;setSources;style_sel;layout;setStyle;setDisplays;panes=[];flex_panes=[];constructor(t,e){super(t,e);const[s,n]=C(""),[r,o]=C([]),[l,h]=C(document.createElement("div"));this.div=l,this.setStyle=n,this.setDisplays=o,this.style_sel=t.substring(7)+"_pane",this.element=ih({ref:h,innerStyle:s,displays:r,style_sel:this.style_sel});const a=C([]);this.sources=a[0],this.setSources=a[1],this.symbol={ticker:"LWPC"},this.timeframe=new bt(1,"D"),this.series_type=it.CANDLESTICK}onActivation(){this.update_tab(this.symbol.ticker),window.topbar.setSeries(this.series_type),window.topbar.setTimeframe(this.timeframe),window.topbar.setTicker(this.symbol.ticker),(window.active_pane===void 0||!this.panes.includes(window.active_pane))&&this.panes[0].assign_active_pane()}onDeactivation(){window.active_pane&&this.panes.includes(window.active_pane)&&(window.active_pane.setActive(!1),window.active_pane=void 0)}set_whitespace_data(t,e){e===void 0&&(e={time:"1970-01-01",value:0}),this.panes.forEach(s=>{s.set_whitespace_data(t,e)})}update_whitespace_data(t,e){this.panes.forEach(s=>{s.update_whitespace_data(t,e)})}set_symbol(t){this.symbol=t,this.update_tab(this.symbol.ticker),this==window.active_frame&&window.topbar.setTicker(this.symbol.ticker)}set_timeframe(t){this.timeframe=bt.from_str(t),this==window.active_frame&&window.topbar.setTimeframe(this.timeframe);let e={timeVisible:!1,secondsVisible:!1};this.timeframe.period==="s"?(e.timeVisible=!0,e.secondsVisible=!0):(this.timeframe.period==="m"||this.timeframe.period==="h")&&(e.timeVisible=!0),this.panes.forEach(s=>{s.update_timescale_opts(e)})}set_series_type(t){this.series_type=t,this==window.active_frame&&window.topbar.setSeries(this.series_type)}add_pane(t){let e=new Jd(t);return this.panes.push(e),this.layout===void 0&&this.set_layout(Q.SINGLE),e}create_indicator(t,e,s,n,r){let o=new wd(t,s,n,this.sources,r);this.indicators.set(t,o);let l=[];for(const[h,a]of Object.entries(e))l.push({indicator:o,function_name:h,source_type:a});this.setSources([...this.sources(),...l])}delete_indicator(t){let e=this.indicators.get(t);e!==void 0&&(e.delete(),this.indicators.delete(t),this.setSources(this.sources().filter(s=>s.indicator!==e)))}set_layout(t){this.flex_panes=qr(t,()=>this.div().getBoundingClientRect(),this.resize.bind(this));let e=[],s=0;this.flex_panes.forEach(n=>{if(n.orientation===_e.null){if(s<this.panes.length){let r=this.panes[s];e.push({orientation:n.orientation,mouseDown:r.assign_active_pane.bind(r),element:r.element,el_active:r.active,el_target:()=>!1})}else throw new Error("Not Enough Panes to change to the desired layout");s+=1}else e.push({orientation:n.orientation,mouseDown:n.mouseDown,element:void 0,el_active:()=>!1,el_target:()=>!1})}),this.layout=t,this.setDisplays(e),this.resize()}resize(){Kr(()=>this.div().getBoundingClientRect(),this.flex_panes);let t="";this.flex_panes.forEach((e,s)=>{t+=`
+ */const Lh={upColor:"#26a69a",downColor:"#ef5350",wickVisible:!0,borderVisible:!0,borderColor:"#378658",borderUpColor:"#26a69a",borderDownColor:"#ef5350",wickColor:"#737375",wickUpColor:"#26a69a",wickDownColor:"#ef5350"},Th={upColor:"#26a69a",downColor:"#ef5350",openVisible:!0,thinBars:!0},Ph={color:"#2196f3",lineStyle:0,lineWidth:3,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},zh={topColor:"rgba( 46, 220, 135, 0.4)",bottomColor:"rgba( 40, 221, 100, 0)",invertFilledArea:!1,lineColor:"#33D778",lineStyle:0,lineWidth:3,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},Dh={baseValue:{type:"price",price:0},topFillColor1:"rgba(38, 166, 154, 0.28)",topFillColor2:"rgba(38, 166, 154, 0.05)",topLineColor:"rgba(38, 166, 154, 1)",bottomFillColor1:"rgba(239, 83, 80, 0.05)",bottomFillColor2:"rgba(239, 83, 80, 0.28)",bottomLineColor:"rgba(239, 83, 80, 1)",lineWidth:3,lineStyle:0,lineType:0,lineVisible:!0,crosshairMarkerVisible:!0,crosshairMarkerRadius:4,crosshairMarkerBorderColor:"",crosshairMarkerBorderWidth:2,crosshairMarkerBackgroundColor:"",lastPriceAnimation:0,pointMarkersVisible:!1},Ah={color:"#26a69a",base:0},Qr={color:"#2196f3"},to={title:"",visible:!0,lastValueVisible:!0,priceLineVisible:!0,priceLineSource:0,priceLineWidth:1,priceLineColor:"",priceLineStyle:2,baseLineVisible:!0,baseLineWidth:1,baseLineColor:"#B2B5BE",baseLineStyle:0,priceFormat:{type:"price",precision:2,minMove:.01}};var Ss,Ms;function se(i,t){const e={0:[],1:[i.lineWidth,i.lineWidth],2:[2*i.lineWidth,2*i.lineWidth],3:[6*i.lineWidth,6*i.lineWidth],4:[i.lineWidth,4*i.lineWidth]}[t];i.setLineDash(e)}function eo(i,t,e,s){i.beginPath();const n=i.lineWidth%2?.5:0;i.moveTo(e,t+n),i.lineTo(s,t+n),i.stroke()}function qt(i,t){if(!i)throw new Error("Assertion failed"+(t?": "+t:""))}function mt(i){if(i===void 0)throw new Error("Value is undefined");return i}function M(i){if(i===null)throw new Error("Value is null");return i}function ue(i){return M(mt(i))}(function(i){i[i.Simple=0]="Simple",i[i.WithSteps=1]="WithSteps",i[i.Curved=2]="Curved"})(Ss||(Ss={})),function(i){i[i.Solid=0]="Solid",i[i.Dotted=1]="Dotted",i[i.Dashed=2]="Dashed",i[i.LargeDashed=3]="LargeDashed",i[i.SparseDotted=4]="SparseDotted"}(Ms||(Ms={}));const zn={khaki:"#f0e68c",azure:"#f0ffff",aliceblue:"#f0f8ff",ghostwhite:"#f8f8ff",gold:"#ffd700",goldenrod:"#daa520",gainsboro:"#dcdcdc",gray:"#808080",green:"#008000",honeydew:"#f0fff0",floralwhite:"#fffaf0",lightblue:"#add8e6",lightcoral:"#f08080",lemonchiffon:"#fffacd",hotpink:"#ff69b4",lightyellow:"#ffffe0",greenyellow:"#adff2f",lightgoldenrodyellow:"#fafad2",limegreen:"#32cd32",linen:"#faf0e6",lightcyan:"#e0ffff",magenta:"#f0f",maroon:"#800000",olive:"#808000",orange:"#ffa500",oldlace:"#fdf5e6",mediumblue:"#0000cd",transparent:"#0000",lime:"#0f0",lightpink:"#ffb6c1",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",midnightblue:"#191970",orchid:"#da70d6",mediumorchid:"#ba55d3",mediumturquoise:"#48d1cc",orangered:"#ff4500",royalblue:"#4169e1",powderblue:"#b0e0e6",red:"#f00",coral:"#ff7f50",turquoise:"#40e0d0",white:"#fff",whitesmoke:"#f5f5f5",wheat:"#f5deb3",teal:"#008080",steelblue:"#4682b4",bisque:"#ffe4c4",aquamarine:"#7fffd4",aqua:"#0ff",sienna:"#a0522d",silver:"#c0c0c0",springgreen:"#00ff7f",antiquewhite:"#faebd7",burlywood:"#deb887",brown:"#a52a2a",beige:"#f5f5dc",chocolate:"#d2691e",chartreuse:"#7fff00",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cadetblue:"#5f9ea0",tomato:"#ff6347",fuchsia:"#f0f",blue:"#00f",salmon:"#fa8072",blanchedalmond:"#ffebcd",slateblue:"#6a5acd",slategray:"#708090",thistle:"#d8bfd8",tan:"#d2b48c",cyan:"#0ff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",blueviolet:"#8a2be2",black:"#000",darkmagenta:"#8b008b",darkslateblue:"#483d8b",darkkhaki:"#bdb76b",darkorchid:"#9932cc",darkorange:"#ff8c00",darkgreen:"#006400",darkred:"#8b0000",dodgerblue:"#1e90ff",darkslategray:"#2f4f4f",dimgray:"#696969",deepskyblue:"#00bfff",firebrick:"#b22222",forestgreen:"#228b22",indigo:"#4b0082",ivory:"#fffff0",lavenderblush:"#fff0f5",feldspar:"#d19275",indianred:"#cd5c5c",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightskyblue:"#87cefa",lightslategray:"#789",lightslateblue:"#8470ff",snow:"#fffafa",lightseagreen:"#20b2aa",lightsalmon:"#ffa07a",darksalmon:"#e9967a",darkviolet:"#9400d3",mediumpurple:"#9370d8",mediumaquamarine:"#66cdaa",skyblue:"#87ceeb",lavender:"#e6e6fa",lightsteelblue:"#b0c4de",mediumvioletred:"#c71585",mintcream:"#f5fffa",navajowhite:"#ffdead",navy:"#000080",olivedrab:"#6b8e23",palevioletred:"#d87093",violetred:"#d02090",yellow:"#ff0",yellowgreen:"#9acd32",lawngreen:"#7cfc00",pink:"#ffc0cb",paleturquoise:"#afeeee",palegoldenrod:"#eee8aa",darkolivegreen:"#556b2f",darkseagreen:"#8fbc8f",darkturquoise:"#00ced1",peachpuff:"#ffdab9",deeppink:"#ff1493",violet:"#ee82ee",palegreen:"#98fb98",mediumseagreen:"#3cb371",peru:"#cd853f",saddlebrown:"#8b4513",sandybrown:"#f4a460",rosybrown:"#bc8f8f",purple:"#800080",seagreen:"#2e8b57",seashell:"#fff5ee",papayawhip:"#ffefd5",mediumslateblue:"#7b68ee",plum:"#dda0dd",mediumspringgreen:"#00fa9a"};function xt(i){return i<0?0:i>255?255:Math.round(i)||0}function io(i){return i<=0||i>1?Math.min(Math.max(i,0),1):Math.round(1e4*i)/1e4}const Ih=/^#([0-9a-f])([0-9a-f])([0-9a-f])([0-9a-f])?$/i,Oh=/^#([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})?$/i,Rh=/^rgb\(\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*\)$/,Vh=/^rgba\(\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d{1,10})\s*,\s*(-?\d*\.?\d+)\s*\)$/;function Oe(i){(i=i.toLowerCase())in zn&&(i=zn[i]);{const t=Vh.exec(i)||Rh.exec(i);if(t)return[xt(parseInt(t[1],10)),xt(parseInt(t[2],10)),xt(parseInt(t[3],10)),io(t.length<5?1:parseFloat(t[4]))]}{const t=Oh.exec(i);if(t)return[xt(parseInt(t[1],16)),xt(parseInt(t[2],16)),xt(parseInt(t[3],16)),1]}{const t=Ih.exec(i);if(t)return[xt(17*parseInt(t[1],16)),xt(17*parseInt(t[2],16)),xt(17*parseInt(t[3],16)),1]}throw new Error(`Cannot parse color: ${i}`)}function so(i){return .199*i[0]+.687*i[1]+.114*i[2]}function Ei(i){const t=Oe(i);return{t:`rgb(${t[0]}, ${t[1]}, ${t[2]})`,i:so(t)>160?"black":"white"}}class st{constructor(){this.h=[]}l(t,e,s){const n={o:t,_:e,u:s===!0};this.h.push(n)}v(t){const e=this.h.findIndex(s=>t===s.o);e>-1&&this.h.splice(e,1)}p(t){this.h=this.h.filter(e=>e._!==t)}m(t,e,s){const n=[...this.h];this.h=this.h.filter(r=>!r.u),n.forEach(r=>r.o(t,e,s))}M(){return this.h.length>0}S(){this.h=[]}}function Pt(i,...t){for(const e of t)for(const s in e)e[s]!==void 0&&(typeof e[s]!="object"||i[s]===void 0||Array.isArray(e[s])?i[s]=e[s]:Pt(i[s],e[s]));return i}function At(i){return typeof i=="number"&&isFinite(i)}function Re(i){return typeof i=="number"&&i%1==0}function Fe(i){return typeof i=="string"}function Ke(i){return typeof i=="boolean"}function Vt(i){const t=i;if(!t||typeof t!="object")return t;let e,s,n;for(s in e=Array.isArray(t)?[]:{},t)t.hasOwnProperty(s)&&(n=t[s],e[s]=n&&typeof n=="object"?Vt(n):n);return e}function Wh(i){return i!==null}function Ve(i){return i===null?void 0:i}const Bs="-apple-system, BlinkMacSystemFont, 'Trebuchet MS', Roboto, Ubuntu, sans-serif";function be(i,t,e){return t===void 0&&(t=Bs),`${e=e!==void 0?`${e} `:""}${i}px ${t}`}class Bh{constructor(t){this.k={C:1,T:5,P:NaN,R:"",D:"",V:"",O:"",B:0,A:0,I:0,L:0,N:0},this.F=t}W(){const t=this.k,e=this.j(),s=this.H();return t.P===e&&t.D===s||(t.P=e,t.D=s,t.R=be(e,s),t.L=2.5/12*e,t.B=t.L,t.A=e/12*t.T,t.I=e/12*t.T,t.N=0),t.V=this.$(),t.O=this.U(),this.k}$(){return this.F.W().layout.textColor}U(){return this.F.q()}j(){return this.F.W().layout.fontSize}H(){return this.F.W().layout.fontFamily}}class Ns{constructor(){this.Y=[]}Z(t){this.Y=t}X(t,e,s){this.Y.forEach(n=>{n.X(t,e,s)})}}class zt{X(t,e,s){t.useBitmapCoordinateSpace(n=>this.K(n,e,s))}}class Nh extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.G===null||this.G.tt===null)return;const n=this.G.tt,r=this.G,o=Math.max(1,Math.floor(e))%2/2,l=h=>{t.beginPath();for(let a=n.to-1;a>=n.from;--a){const c=r.it[a],u=Math.round(c.nt*e)+o,f=c.st*s,m=h*s+o;t.moveTo(u,f),t.arc(u,f,m,0,2*Math.PI)}t.fill()};r.et>0&&(t.fillStyle=r.rt,l(r.ht+r.et)),t.fillStyle=r.lt,l(r.ht)}}function jh(){return{it:[{nt:0,st:0,ot:0,_t:0}],lt:"",rt:"",ht:0,et:0,tt:null}}const Fh={from:0,to:1};class Uh{constructor(t,e){this.ut=new Ns,this.ct=[],this.dt=[],this.ft=!0,this.F=t,this.vt=e,this.ut.Z(this.ct)}bt(t){const e=this.F.wt();e.length!==this.ct.length&&(this.dt=e.map(jh),this.ct=this.dt.map(s=>{const n=new Nh;return n.J(s),n}),this.ut.Z(this.ct)),this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.ut}Mt(){const t=this.vt.W().mode===2,e=this.F.wt(),s=this.vt.xt(),n=this.F.St();e.forEach((r,o)=>{var l;const h=this.dt[o],a=r.kt(s);if(t||a===null||!r.yt())return void(h.tt=null);const c=M(r.Ct());h.lt=a.Tt,h.ht=a.ht,h.et=a.Pt,h.it[0]._t=a._t,h.it[0].st=r.Dt().Rt(a._t,c.Vt),h.rt=(l=a.Ot)!==null&&l!==void 0?l:this.F.Bt(h.it[0].st/r.Dt().At()),h.it[0].ot=s,h.it[0].nt=n.It(s),h.tt=Fh})}}class Hh extends zt{constructor(t){super(),this.zt=t}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null)return;const r=this.zt.Lt.yt,o=this.zt.Et.yt;if(!r&&!o)return;const l=Math.round(this.zt.nt*s),h=Math.round(this.zt.st*n);t.lineCap="butt",r&&l>=0&&(t.lineWidth=Math.floor(this.zt.Lt.et*s),t.strokeStyle=this.zt.Lt.V,t.fillStyle=this.zt.Lt.V,se(t,this.zt.Lt.Nt),function(a,c,u,f){a.beginPath();const m=a.lineWidth%2?.5:0;a.moveTo(c+m,u),a.lineTo(c+m,f),a.stroke()}(t,l,0,e.height)),o&&h>=0&&(t.lineWidth=Math.floor(this.zt.Et.et*n),t.strokeStyle=this.zt.Et.V,t.fillStyle=this.zt.Et.V,se(t,this.zt.Et.Nt),eo(t,h,0,e.width))}}class Xh{constructor(t){this.ft=!0,this.Ft={Lt:{et:1,Nt:0,V:"",yt:!1},Et:{et:1,Nt:0,V:"",yt:!1},nt:0,st:0},this.Wt=new Hh(this.Ft),this.jt=t}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt}Mt(){const t=this.jt.yt(),e=M(this.jt.Ht()),s=e.$t().W().crosshair,n=this.Ft;if(s.mode===2)return n.Et.yt=!1,void(n.Lt.yt=!1);n.Et.yt=t&&this.jt.Ut(e),n.Lt.yt=t&&this.jt.qt(),n.Et.et=s.horzLine.width,n.Et.Nt=s.horzLine.style,n.Et.V=s.horzLine.color,n.Lt.et=s.vertLine.width,n.Lt.Nt=s.vertLine.style,n.Lt.V=s.vertLine.color,n.nt=this.jt.Yt(),n.st=this.jt.Zt()}}function Kh(i,t,e,s,n,r){i.fillRect(t+r,e,s-2*r,r),i.fillRect(t+r,e+n-r,s-2*r,r),i.fillRect(t,e,r,n),i.fillRect(t+s-r,e,r,n)}function ki(i,t,e,s,n,r){i.save(),i.globalCompositeOperation="copy",i.fillStyle=r,i.fillRect(t,e,s,n),i.restore()}function Dn(i,t,e,s,n,r){i.beginPath(),i.roundRect?i.roundRect(t,e,s,n,r):(i.lineTo(t+s-r[1],e),r[1]!==0&&i.arcTo(t+s,e,t+s,e+r[1],r[1]),i.lineTo(t+s,e+n-r[2]),r[2]!==0&&i.arcTo(t+s,e+n,t+s-r[2],e+n,r[2]),i.lineTo(t+r[3],e+n),r[3]!==0&&i.arcTo(t,e+n,t,e+n-r[3],r[3]),i.lineTo(t,e+r[0]),r[0]!==0&&i.arcTo(t,e,t+r[0],e,r[0]))}function An(i,t,e,s,n,r,o=0,l=[0,0,0,0],h=""){if(i.save(),!o||!h||h===r)return Dn(i,t,e,s,n,l),i.fillStyle=r,i.fill(),void i.restore();const a=o/2;var c;Dn(i,t+a,e+a,s-o,n-o,(c=-a,l.map(u=>u===0?u:u+c))),r!=="transparent"&&(i.fillStyle=r,i.fill()),h!=="transparent"&&(i.lineWidth=o,i.strokeStyle=h,i.closePath(),i.stroke()),i.restore()}function no(i,t,e,s,n,r,o){i.save(),i.globalCompositeOperation="copy";const l=i.createLinearGradient(0,0,0,n);l.addColorStop(0,r),l.addColorStop(1,o),i.fillStyle=l,i.fillRect(t,e,s,n),i.restore()}class In{constructor(t,e){this.J(t,e)}J(t,e){this.zt=t,this.Xt=e}At(t,e){return this.zt.yt?t.P+t.L+t.B:0}X(t,e,s,n){if(!this.zt.yt||this.zt.Kt.length===0)return;const r=this.zt.V,o=this.Xt.t,l=t.useBitmapCoordinateSpace(h=>{const a=h.context;a.font=e.R;const c=this.Gt(h,e,s,n),u=c.Jt,f=(m,g)=>{c.Qt?An(a,u.ti,u.ii,u.ni,u.si,m,u.ei,[u.ht,0,0,u.ht],g):An(a,u.ri,u.ii,u.ni,u.si,m,u.ei,[0,u.ht,u.ht,0],g)};return f(o,"transparent"),this.zt.hi&&(a.fillStyle=r,a.fillRect(u.ri,u.li,u.ai-u.ri,u.oi)),f("transparent",o),this.zt._i&&(a.fillStyle=e.O,a.fillRect(c.Qt?u.ui-u.ei:0,u.ii,u.ei,u.ci-u.ii)),c});t.useMediaCoordinateSpace(({context:h})=>{const a=l.di;h.font=e.R,h.textAlign=l.Qt?"right":"left",h.textBaseline="middle",h.fillStyle=r,h.fillText(this.zt.Kt,a.fi,(a.ii+a.ci)/2+a.pi)})}Gt(t,e,s,n){var r;const{context:o,bitmapSize:l,mediaSize:h,horizontalPixelRatio:a,verticalPixelRatio:c}=t,u=this.zt.hi||!this.zt.mi?e.T:0,f=this.zt.bi?e.C:0,m=e.L+this.Xt.wi,g=e.B+this.Xt.gi,p=e.A,_=e.I,w=this.zt.Kt,x=e.P,$=s.Mi(o,w),E=Math.ceil(s.xi(o,w)),L=x+m+g,F=e.C+p+_+E+u,W=Math.max(1,Math.floor(c));let z=Math.round(L*c);z%2!=W%2&&(z+=1);const R=f>0?Math.max(1,Math.floor(f*a)):0,U=Math.round(F*a),at=Math.round(u*a),Me=(r=this.Xt.Si)!==null&&r!==void 0?r:this.Xt.ki,Zt=Math.round(Me*c)-Math.floor(.5*c),S=Math.floor(Zt+W/2-z/2),T=S+z,D=n==="right",ot=D?h.width-f:f,B=D?l.width-R:R;let I,G,et;return D?(I=B-U,G=B-at,et=ot-u-p-f):(I=B+U,G=B+at,et=ot+u+p),{Qt:D,Jt:{ii:S,li:Zt,ci:T,ni:U,si:z,ht:2*a,ei:R,ti:I,ri:B,ai:G,oi:W,ui:l.width},di:{ii:S/c,ci:T/c,fi:et,pi:$}}}}class Li{constructor(t){this.yi={ki:0,t:"#000",gi:0,wi:0},this.Ci={Kt:"",yt:!1,hi:!0,mi:!1,Ot:"",V:"#FFF",_i:!1,bi:!1},this.Ti={Kt:"",yt:!1,hi:!1,mi:!0,Ot:"",V:"#FFF",_i:!0,bi:!0},this.ft=!0,this.Pi=new(t||In)(this.Ci,this.yi),this.Ri=new(t||In)(this.Ti,this.yi)}Kt(){return this.Di(),this.Ci.Kt}ki(){return this.Di(),this.yi.ki}bt(){this.ft=!0}At(t,e=!1){return Math.max(this.Pi.At(t,e),this.Ri.At(t,e))}Vi(){return this.yi.Si||0}Oi(t){this.yi.Si=t}Bi(){return this.Di(),this.Ci.yt||this.Ti.yt}Ai(){return this.Di(),this.Ci.yt}gt(t){return this.Di(),this.Ci.hi=this.Ci.hi&&t.W().ticksVisible,this.Ti.hi=this.Ti.hi&&t.W().ticksVisible,this.Pi.J(this.Ci,this.yi),this.Ri.J(this.Ti,this.yi),this.Pi}Ii(){return this.Di(),this.Pi.J(this.Ci,this.yi),this.Ri.J(this.Ti,this.yi),this.Ri}Di(){this.ft&&(this.Ci.hi=!0,this.Ti.hi=!1,this.zi(this.Ci,this.Ti,this.yi))}}class qh extends Li{constructor(t,e,s){super(),this.jt=t,this.Li=e,this.Ei=s}zi(t,e,s){if(t.yt=!1,this.jt.W().mode===2)return;const n=this.jt.W().horzLine;if(!n.labelVisible)return;const r=this.Li.Ct();if(!this.jt.yt()||this.Li.Ni()||r===null)return;const o=Ei(n.labelBackgroundColor);s.t=o.t,t.V=o.i;const l=2/12*this.Li.P();s.wi=l,s.gi=l;const h=this.Ei(this.Li);s.ki=h.ki,t.Kt=this.Li.Fi(h._t,r),t.yt=!0}}const Gh=/[1-9]/g;class ro{constructor(){this.zt=null}J(t){this.zt=t}X(t,e){if(this.zt===null||this.zt.yt===!1||this.zt.Kt.length===0)return;const s=t.useMediaCoordinateSpace(({context:f})=>(f.font=e.R,Math.round(e.Wi.xi(f,M(this.zt).Kt,Gh))));if(s<=0)return;const n=e.ji,r=s+2*n,o=r/2,l=this.zt.Hi;let h=this.zt.ki,a=Math.floor(h-o)+.5;a<0?(h+=Math.abs(0-a),a=Math.floor(h-o)+.5):a+r>l&&(h-=Math.abs(l-(a+r)),a=Math.floor(h-o)+.5);const c=a+r,u=Math.ceil(0+e.C+e.T+e.L+e.P+e.B);t.useBitmapCoordinateSpace(({context:f,horizontalPixelRatio:m,verticalPixelRatio:g})=>{const p=M(this.zt);f.fillStyle=p.t;const _=Math.round(a*m),w=Math.round(0*g),x=Math.round(c*m),$=Math.round(u*g),E=Math.round(2*m);if(f.beginPath(),f.moveTo(_,w),f.lineTo(_,$-E),f.arcTo(_,$,_+E,$,E),f.lineTo(x-E,$),f.arcTo(x,$,x,$-E,E),f.lineTo(x,w),f.fill(),p.hi){const L=Math.round(p.ki*m),F=w,W=Math.round((F+e.T)*g);f.fillStyle=p.V;const z=Math.max(1,Math.floor(m)),R=Math.floor(.5*m);f.fillRect(L-R,F,z,W-F)}}),t.useMediaCoordinateSpace(({context:f})=>{const m=M(this.zt),g=0+e.C+e.T+e.L+e.P/2;f.font=e.R,f.textAlign="left",f.textBaseline="middle",f.fillStyle=m.V;const p=e.Wi.Mi(f,"Apr0");f.translate(a+n,g+p),f.fillText(m.Kt,0,0)})}}class Yh{constructor(t,e,s){this.ft=!0,this.Wt=new ro,this.Ft={yt:!1,t:"#4c525e",V:"white",Kt:"",Hi:0,ki:NaN,hi:!0},this.vt=t,this.$i=e,this.Ei=s}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt.J(this.Ft),this.Wt}Mt(){const t=this.Ft;if(t.yt=!1,this.vt.W().mode===2)return;const e=this.vt.W().vertLine;if(!e.labelVisible)return;const s=this.$i.St();if(s.Ni())return;t.Hi=s.Hi();const n=this.Ei();if(n===null)return;t.ki=n.ki;const r=s.Ui(this.vt.xt());t.Kt=s.qi(M(r)),t.yt=!0;const o=Ei(e.labelBackgroundColor);t.t=o.t,t.V=o.i,t.hi=s.W().ticksVisible}}class js{constructor(){this.Yi=null,this.Zi=0}Xi(){return this.Zi}Ki(t){this.Zi=t}Dt(){return this.Yi}Gi(t){this.Yi=t}Ji(t){return[]}Qi(){return[]}yt(){return!0}}var On;(function(i){i[i.Normal=0]="Normal",i[i.Magnet=1]="Magnet",i[i.Hidden=2]="Hidden"})(On||(On={}));class Zh extends js{constructor(t,e){super(),this.tn=null,this.nn=NaN,this.sn=0,this.en=!0,this.rn=new Map,this.hn=!1,this.ln=NaN,this.an=NaN,this._n=NaN,this.un=NaN,this.$i=t,this.cn=e,this.dn=new Uh(t,this),this.fn=((n,r)=>o=>{const l=r(),h=n();if(o===M(this.tn).vn())return{_t:h,ki:l};{const a=M(o.Ct());return{_t:o.pn(l,a),ki:l}}})(()=>this.nn,()=>this.an);const s=((n,r)=>()=>{const o=this.$i.St().mn(n()),l=r();return o&&Number.isFinite(l)?{ot:o,ki:l}:null})(()=>this.sn,()=>this.Yt());this.bn=new Yh(this,t,s),this.wn=new Xh(this)}W(){return this.cn}gn(t,e){this._n=t,this.un=e}Mn(){this._n=NaN,this.un=NaN}xn(){return this._n}Sn(){return this.un}kn(t,e,s){this.hn||(this.hn=!0),this.en=!0,this.yn(t,e,s)}xt(){return this.sn}Yt(){return this.ln}Zt(){return this.an}yt(){return this.en}Cn(){this.en=!1,this.Tn(),this.nn=NaN,this.ln=NaN,this.an=NaN,this.tn=null,this.Mn()}Pn(t){return this.tn!==null?[this.wn,this.dn]:[]}Ut(t){return t===this.tn&&this.cn.horzLine.visible}qt(){return this.cn.vertLine.visible}Rn(t,e){this.en&&this.tn===t||this.rn.clear();const s=[];return this.tn===t&&s.push(this.Dn(this.rn,e,this.fn)),s}Qi(){return this.en?[this.bn]:[]}Ht(){return this.tn}Vn(){this.wn.bt(),this.rn.forEach(t=>t.bt()),this.bn.bt(),this.dn.bt()}On(t){return t&&!t.vn().Ni()?t.vn():null}yn(t,e,s){this.Bn(t,e,s)&&this.Vn()}Bn(t,e,s){const n=this.ln,r=this.an,o=this.nn,l=this.sn,h=this.tn,a=this.On(s);this.sn=t,this.ln=isNaN(t)?NaN:this.$i.St().It(t),this.tn=s;const c=a!==null?a.Ct():null;return a!==null&&c!==null?(this.nn=e,this.an=a.Rt(e,c)):(this.nn=NaN,this.an=NaN),n!==this.ln||r!==this.an||l!==this.sn||o!==this.nn||h!==this.tn}Tn(){const t=this.$i.wt().map(s=>s.In().An()).filter(Wh),e=t.length===0?null:Math.max(...t);this.sn=e!==null?e:NaN}Dn(t,e,s){let n=t.get(e);return n===void 0&&(n=new qh(this,e,s),t.set(e,n)),n}}function Ti(i){return i==="left"||i==="right"}class ht{constructor(t){this.zn=new Map,this.Ln=[],this.En=t}Nn(t,e){const s=function(n,r){return n===void 0?r:{Fn:Math.max(n.Fn,r.Fn),Wn:n.Wn||r.Wn}}(this.zn.get(t),e);this.zn.set(t,s)}jn(){return this.En}Hn(t){const e=this.zn.get(t);return e===void 0?{Fn:this.En}:{Fn:Math.max(this.En,e.Fn),Wn:e.Wn}}$n(){this.Un(),this.Ln=[{qn:0}]}Yn(t){this.Un(),this.Ln=[{qn:1,Vt:t}]}Zn(t){this.Xn(),this.Ln.push({qn:5,Vt:t})}Un(){this.Xn(),this.Ln.push({qn:6})}Kn(){this.Un(),this.Ln=[{qn:4}]}Gn(t){this.Un(),this.Ln.push({qn:2,Vt:t})}Jn(t){this.Un(),this.Ln.push({qn:3,Vt:t})}Qn(){return this.Ln}ts(t){for(const e of t.Ln)this.ns(e);this.En=Math.max(this.En,t.En),t.zn.forEach((e,s)=>{this.Nn(s,e)})}static ss(){return new ht(2)}static es(){return new ht(3)}ns(t){switch(t.qn){case 0:this.$n();break;case 1:this.Yn(t.Vt);break;case 2:this.Gn(t.Vt);break;case 3:this.Jn(t.Vt);break;case 4:this.Kn();break;case 5:this.Zn(t.Vt);break;case 6:this.Xn()}}Xn(){const t=this.Ln.findIndex(e=>e.qn===5);t!==-1&&this.Ln.splice(t,1)}}const Rn=".";function Wt(i,t){if(!At(i))return"n/a";if(!Re(t))throw new TypeError("invalid length");if(t<0||t>16)throw new TypeError("invalid length");return t===0?i.toString():("0000000000000000"+i.toString()).slice(-t)}class Pi{constructor(t,e){if(e||(e=1),At(t)&&Re(t)||(t=100),t<0)throw new TypeError("invalid base");this.Li=t,this.rs=e,this.hs()}format(t){const e=t<0?"−":"";return t=Math.abs(t),e+this.ls(t)}hs(){if(this.os=0,this.Li>0&&this.rs>0){let t=this.Li;for(;t>1;)t/=10,this.os++}}ls(t){const e=this.Li/this.rs;let s=Math.floor(t),n="";const r=this.os!==void 0?this.os:NaN;if(e>1){let o=+(Math.round(t*e)-s*e).toFixed(this.os);o>=e&&(o-=e,s+=1),n=Rn+Wt(+o.toFixed(this.os)*this.rs,r)}else s=Math.round(s*e)/e,r>0&&(n=Rn+Wt(0,r));return s.toFixed(0)+n}}class oo extends Pi{constructor(t=100){super(t)}format(t){return`${super.format(t)}%`}}class Jh{constructor(t){this._s=t}format(t){let e="";return t<0&&(e="-",t=-t),t<995?e+this.us(t):t<999995?e+this.us(t/1e3)+"K":t<999999995?(t=1e3*Math.round(t/1e3),e+this.us(t/1e6)+"M"):(t=1e6*Math.round(t/1e6),e+this.us(t/1e9)+"B")}us(t){let e;const s=Math.pow(10,this._s);return e=(t=Math.round(t*s)/s)>=1e-15&&t<1?t.toFixed(this._s).replace(/\.?0+$/,""):String(t),e.replace(/(\.[1-9]*)0+$/,(n,r)=>r)}}function lo(i,t,e,s,n,r,o){if(t.length===0||s.from>=t.length||s.to<=0)return;const{context:l,horizontalPixelRatio:h,verticalPixelRatio:a}=i,c=t[s.from];let u=r(i,c),f=c;if(s.to-s.from<2){const m=n/2;l.beginPath();const g={nt:c.nt-m,st:c.st},p={nt:c.nt+m,st:c.st};l.moveTo(g.nt*h,g.st*a),l.lineTo(p.nt*h,p.st*a),o(i,u,g,p)}else{const m=(p,_)=>{o(i,u,f,_),l.beginPath(),u=p,f=_};let g=f;l.beginPath(),l.moveTo(c.nt*h,c.st*a);for(let p=s.from+1;p<s.to;++p){g=t[p];const _=r(i,g);switch(e){case 0:l.lineTo(g.nt*h,g.st*a);break;case 1:l.lineTo(g.nt*h,t[p-1].st*a),_!==u&&(m(_,g),l.lineTo(g.nt*h,t[p-1].st*a)),l.lineTo(g.nt*h,g.st*a);break;case 2:{const[w,x]=Qh(t,p-1,p);l.bezierCurveTo(w.nt*h,w.st*a,x.nt*h,x.st*a,g.nt*h,g.st*a);break}}e!==1&&_!==u&&(m(_,g),l.moveTo(g.nt*h,g.st*a))}(f!==g||f===g&&e===1)&&o(i,u,f,g)}}const Vn=6;function Fi(i,t){return{nt:i.nt-t.nt,st:i.st-t.st}}function Wn(i,t){return{nt:i.nt/t,st:i.st/t}}function Qh(i,t,e){const s=Math.max(0,t-1),n=Math.min(i.length-1,e+1);var r,o;return[(r=i[t],o=Wn(Fi(i[e],i[s]),Vn),{nt:r.nt+o.nt,st:r.st+o.st}),Fi(i[e],Wn(Fi(i[n],i[t]),Vn))]}function ta(i,t,e,s,n){const{context:r,horizontalPixelRatio:o,verticalPixelRatio:l}=t;r.lineTo(n.nt*o,i*l),r.lineTo(s.nt*o,i*l),r.closePath(),r.fillStyle=e,r.fill()}class ho extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K(t){var e;if(this.G===null)return;const{it:s,tt:n,cs:r,et:o,Nt:l,ds:h}=this.G,a=(e=this.G.fs)!==null&&e!==void 0?e:this.G.vs?0:t.mediaSize.height;if(n===null)return;const c=t.context;c.lineCap="butt",c.lineJoin="round",c.lineWidth=o,se(c,l),c.lineWidth=1,lo(t,s,h,n,r,this.ps.bind(this),ta.bind(null,a))}}function Cs(i,t,e){return Math.min(Math.max(i,t),e)}function qe(i,t,e){return t-i<=e}function ao(i){const t=Math.ceil(i);return t%2==0?t-1:t}class Fs{bs(t,e){const s=this.ws,{gs:n,Ms:r,xs:o,Ss:l,ks:h,fs:a}=e;if(this.ys===void 0||s===void 0||s.gs!==n||s.Ms!==r||s.xs!==o||s.Ss!==l||s.fs!==a||s.ks!==h){const c=t.context.createLinearGradient(0,0,0,h);if(c.addColorStop(0,n),a!=null){const u=Cs(a*t.verticalPixelRatio/h,0,1);c.addColorStop(u,r),c.addColorStop(u,o)}c.addColorStop(1,l),this.ys=c,this.ws=e}return this.ys}}class ea extends ho{constructor(){super(...arguments),this.Cs=new Fs}ps(t,e){return this.Cs.bs(t,{gs:e.Ts,Ms:"",xs:"",Ss:e.Ps,ks:t.bitmapSize.height})}}function ia(i,t){const e=i.context;e.strokeStyle=t,e.stroke()}class co extends zt{constructor(){super(...arguments),this.G=null}J(t){this.G=t}K(t){if(this.G===null)return;const{it:e,tt:s,cs:n,ds:r,et:o,Nt:l,Rs:h}=this.G;if(s===null)return;const a=t.context;a.lineCap="butt",a.lineWidth=o*t.verticalPixelRatio,se(a,l),a.lineJoin="round";const c=this.Ds.bind(this);r!==void 0&&lo(t,e,r,s,n,c,ia),h&&function(u,f,m,g,p){const{horizontalPixelRatio:_,verticalPixelRatio:w,context:x}=u;let $=null;const E=Math.max(1,Math.floor(_))%2/2,L=m*w+E;for(let F=g.to-1;F>=g.from;--F){const W=f[F];if(W){const z=p(u,W);z!==$&&(x.beginPath(),$!==null&&x.fill(),x.fillStyle=z,$=z);const R=Math.round(W.nt*_)+E,U=W.st*w;x.moveTo(R,U),x.arc(R,U,L,0,2*Math.PI)}}x.fill()}(t,e,h,s,c)}}class uo extends co{Ds(t,e){return e.lt}}function fo(i,t,e,s,n=0,r=t.length){let o=r-n;for(;0<o;){const l=o>>1,h=n+l;s(t[h],e)===i?(n=h+1,o-=l+1):o=l}return n}const Ue=fo.bind(null,!0),go=fo.bind(null,!1);function sa(i,t){return i.ot<t}function na(i,t){return t<i.ot}function mo(i,t,e){const s=t.Vs(),n=t.ui(),r=Ue(i,s,sa),o=go(i,n,na);if(!e)return{from:r,to:o};let l=r,h=o;return r>0&&r<i.length&&i[r].ot>=s&&(l=r-1),o>0&&o<i.length&&i[o-1].ot<=n&&(h=o+1),{from:l,to:h}}class Us{constructor(t,e,s){this.Os=!0,this.Bs=!0,this.As=!0,this.Is=[],this.zs=null,this.Ls=t,this.Es=e,this.Ns=s}bt(t){this.Os=!0,t==="data"&&(this.Bs=!0),t==="options"&&(this.As=!0)}gt(){return this.Ls.yt()?(this.Fs(),this.zs===null?null:this.Ws):null}js(){this.Is=this.Is.map(t=>Object.assign(Object.assign({},t),this.Ls.$s().Hs(t.ot)))}Us(){this.zs=null}Fs(){this.Bs&&(this.qs(),this.Bs=!1),this.As&&(this.js(),this.As=!1),this.Os&&(this.Ys(),this.Os=!1)}Ys(){const t=this.Ls.Dt(),e=this.Es.St();if(this.Us(),e.Ni()||t.Ni())return;const s=e.Zs();if(s===null||this.Ls.In().Xs()===0)return;const n=this.Ls.Ct();n!==null&&(this.zs=mo(this.Is,s,this.Ns),this.Ks(t,e,n.Vt),this.Gs())}}class zi extends Us{constructor(t,e){super(t,e,!0)}Ks(t,e,s){e.Js(this.Is,Ve(this.zs)),t.Qs(this.Is,s,Ve(this.zs))}te(t,e){return{ot:t,_t:e,nt:NaN,st:NaN}}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>{const s=e.Vt[3];return this.ne(e.se,s,t)})}}class ra extends zi{constructor(t,e){super(t,e),this.Ws=new Ns,this.ee=new ea,this.re=new uo,this.Ws.Z([this.ee,this.re])}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.W();this.ee.J({ds:t.lineType,it:this.Is,Nt:t.lineStyle,et:t.lineWidth,fs:null,vs:t.invertFilledArea,tt:this.zs,cs:this.Es.St().he()}),this.re.J({ds:t.lineVisible?t.lineType:void 0,it:this.Is,Nt:t.lineStyle,et:t.lineWidth,tt:this.zs,cs:this.Es.St().he(),Rs:t.pointMarkersVisible?t.pointMarkersRadius||t.lineWidth/2+2:void 0})}}class oa extends zt{constructor(){super(...arguments),this.zt=null,this.le=0,this.ae=0}J(t){this.zt=t}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.zt===null||this.zt.In.length===0||this.zt.tt===null)return;this.le=this.oe(e),this.le>=2&&Math.max(1,Math.floor(e))%2!=this.le%2&&this.le--,this.ae=this.zt._e?Math.min(this.le,Math.floor(e)):this.le;let n=null;const r=this.ae<=this.le&&this.zt.he>=Math.floor(1.5*e);for(let o=this.zt.tt.from;o<this.zt.tt.to;++o){const l=this.zt.In[o];n!==l.ue&&(t.fillStyle=l.ue,n=l.ue);const h=Math.floor(.5*this.ae),a=Math.round(l.nt*e),c=a-h,u=this.ae,f=c+u-1,m=Math.min(l.ce,l.de),g=Math.max(l.ce,l.de),p=Math.round(m*s)-h,_=Math.round(g*s)+h,w=Math.max(_-p,this.ae);t.fillRect(c,p,u,w);const x=Math.ceil(1.5*this.le);if(r){if(this.zt.fe){const F=a-x;let W=Math.max(p,Math.round(l.ve*s)-h),z=W+u-1;z>p+w-1&&(z=p+w-1,W=z-u+1),t.fillRect(F,W,c-F,z-W+1)}const $=a+x;let E=Math.max(p,Math.round(l.pe*s)-h),L=E+u-1;L>p+w-1&&(L=p+w-1,E=L-u+1),t.fillRect(f+1,E,$-f,L-E+1)}}}oe(t){const e=Math.floor(t);return Math.max(e,Math.floor(function(s,n){return Math.floor(.3*s*n)}(M(this.zt).he,t)))}}class po extends Us{constructor(t,e){super(t,e,!1)}Ks(t,e,s){e.Js(this.Is,Ve(this.zs)),t.me(this.Is,s,Ve(this.zs))}be(t,e,s){return{ot:t,we:e.Vt[0],ge:e.Vt[1],Me:e.Vt[2],xe:e.Vt[3],nt:NaN,ve:NaN,ce:NaN,de:NaN,pe:NaN}}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>this.ne(e.se,e,t))}}class la extends po{constructor(){super(...arguments),this.Ws=new oa}ne(t,e,s){return Object.assign(Object.assign({},this.be(t,e,s)),s.Hs(t))}Gs(){const t=this.Ls.W();this.Ws.J({In:this.Is,he:this.Es.St().he(),fe:t.openVisible,_e:t.thinBars,tt:this.zs})}}class ha extends ho{constructor(){super(...arguments),this.Cs=new Fs}ps(t,e){const s=this.G;return this.Cs.bs(t,{gs:e.Se,Ms:e.ke,xs:e.ye,Ss:e.Ce,ks:t.bitmapSize.height,fs:s.fs})}}class aa extends co{constructor(){super(...arguments),this.Te=new Fs}Ds(t,e){const s=this.G;return this.Te.bs(t,{gs:e.Pe,Ms:e.Pe,xs:e.Re,Ss:e.Re,ks:t.bitmapSize.height,fs:s.fs})}}class ca extends zi{constructor(t,e){super(t,e),this.Ws=new Ns,this.De=new ha,this.Ve=new aa,this.Ws.Z([this.De,this.Ve])}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.Ct();if(t===null)return;const e=this.Ls.W(),s=this.Ls.Dt().Rt(e.baseValue.price,t.Vt),n=this.Es.St().he();this.De.J({it:this.Is,et:e.lineWidth,Nt:e.lineStyle,ds:e.lineType,fs:s,vs:!1,tt:this.zs,cs:n}),this.Ve.J({it:this.Is,et:e.lineWidth,Nt:e.lineStyle,ds:e.lineVisible?e.lineType:void 0,Rs:e.pointMarkersVisible?e.pointMarkersRadius||e.lineWidth/2+2:void 0,fs:s,tt:this.zs,cs:n})}}class ua extends zt{constructor(){super(...arguments),this.zt=null,this.le=0}J(t){this.zt=t}K(t){if(this.zt===null||this.zt.In.length===0||this.zt.tt===null)return;const{horizontalPixelRatio:e}=t;this.le=function(r,o){if(r>=2.5&&r<=4)return Math.floor(3*o);const l=1-.2*Math.atan(Math.max(4,r)-4)/(.5*Math.PI),h=Math.floor(r*l*o),a=Math.floor(r*o),c=Math.min(h,a);return Math.max(Math.floor(o),c)}(this.zt.he,e),this.le>=2&&Math.floor(e)%2!=this.le%2&&this.le--;const s=this.zt.In;this.zt.Oe&&this.Be(t,s,this.zt.tt),this.zt._i&&this.Ae(t,s,this.zt.tt);const n=this.Ie(e);(!this.zt._i||this.le>2*n)&&this.ze(t,s,this.zt.tt)}Be(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="",h=Math.min(Math.floor(r),Math.floor(this.zt.he*r));h=Math.max(Math.floor(r),Math.min(h,this.le));const a=Math.floor(.5*h);let c=null;for(let u=s.from;u<s.to;u++){const f=e[u];f.Le!==l&&(n.fillStyle=f.Le,l=f.Le);const m=Math.round(Math.min(f.ve,f.pe)*o),g=Math.round(Math.max(f.ve,f.pe)*o),p=Math.round(f.ce*o),_=Math.round(f.de*o);let w=Math.round(r*f.nt)-a;const x=w+h-1;c!==null&&(w=Math.max(c+1,w),w=Math.min(w,x));const $=x-w+1;n.fillRect(w,p,$,m-p),n.fillRect(w,g+1,$,_-g),c=x}}Ie(t){let e=Math.floor(1*t);this.le<=2*e&&(e=Math.floor(.5*(this.le-1)));const s=Math.max(Math.floor(t),e);return this.le<=2*s?Math.max(Math.floor(t),Math.floor(1*t)):s}Ae(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="";const h=this.Ie(r);let a=null;for(let c=s.from;c<s.to;c++){const u=e[c];u.Ee!==l&&(n.fillStyle=u.Ee,l=u.Ee);let f=Math.round(u.nt*r)-Math.floor(.5*this.le);const m=f+this.le-1,g=Math.round(Math.min(u.ve,u.pe)*o),p=Math.round(Math.max(u.ve,u.pe)*o);if(a!==null&&(f=Math.max(a+1,f),f=Math.min(f,m)),this.zt.he*r>2*h)Kh(n,f,g,m-f+1,p-g+1,h);else{const _=m-f+1;n.fillRect(f,g,_,p-g+1)}a=m}}ze(t,e,s){if(this.zt===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t;let l="";const h=this.Ie(r);for(let a=s.from;a<s.to;a++){const c=e[a];let u=Math.round(Math.min(c.ve,c.pe)*o),f=Math.round(Math.max(c.ve,c.pe)*o),m=Math.round(c.nt*r)-Math.floor(.5*this.le),g=m+this.le-1;if(c.ue!==l){const p=c.ue;n.fillStyle=p,l=p}this.zt._i&&(m+=h,u+=h,g-=h,f-=h),u>f||n.fillRect(m,u,g-m+1,f-u+1)}}}class da extends po{constructor(){super(...arguments),this.Ws=new ua}ne(t,e,s){return Object.assign(Object.assign({},this.be(t,e,s)),s.Hs(t))}Gs(){const t=this.Ls.W();this.Ws.J({In:this.Is,he:this.Es.St().he(),Oe:t.wickVisible,_i:t.borderVisible,tt:this.zs})}}class fa{constructor(t,e){this.Ne=t,this.Li=e}X(t,e,s){this.Ne.draw(t,this.Li,e,s)}}class Ui extends Us{constructor(t,e,s){super(t,e,!1),this.wn=s,this.Ws=new fa(this.wn.renderer(),n=>{const r=t.Ct();return r===null?null:t.Dt().Rt(n,r.Vt)})}Fe(t){return this.wn.priceValueBuilder(t)}We(t){return this.wn.isWhitespace(t)}qs(){const t=this.Ls.$s();this.Is=this.Ls.In().ie().map(e=>Object.assign(Object.assign({ot:e.se,nt:NaN},t.Hs(e.se)),{je:e.He}))}Ks(t,e){e.Js(this.Is,Ve(this.zs))}Gs(){this.wn.update({bars:this.Is.map(ga),barSpacing:this.Es.St().he(),visibleRange:this.zs},this.Ls.W())}}function ga(i){return{x:i.nt,time:i.ot,originalData:i.je,barColor:i.ue}}class ma extends zt{constructor(){super(...arguments),this.zt=null,this.$e=[]}J(t){this.zt=t,this.$e=[]}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){if(this.zt===null||this.zt.it.length===0||this.zt.tt===null)return;this.$e.length||this.Ue(e);const n=Math.max(1,Math.floor(s)),r=Math.round(this.zt.qe*s)-Math.floor(n/2),o=r+n;for(let l=this.zt.tt.from;l<this.zt.tt.to;l++){const h=this.zt.it[l],a=this.$e[l-this.zt.tt.from],c=Math.round(h.st*s);let u,f;t.fillStyle=h.ue,c<=r?(u=c,f=o):(u=r,f=c-Math.floor(n/2)+n),t.fillRect(a.Vs,u,a.ui-a.Vs+1,f-u)}}Ue(t){if(this.zt===null||this.zt.it.length===0||this.zt.tt===null)return void(this.$e=[]);const e=Math.ceil(this.zt.he*t)<=1?0:Math.max(1,Math.floor(t)),s=Math.round(this.zt.he*t)-e;this.$e=new Array(this.zt.tt.to-this.zt.tt.from);for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.zt.it[r],l=Math.round(o.nt*t);let h,a;if(s%2){const c=(s-1)/2;h=l-c,a=l+c}else{const c=s/2;h=l-c,a=l+c-1}this.$e[r-this.zt.tt.from]={Vs:h,ui:a,Ye:l,Ze:o.nt*t,ot:o.ot}}for(let r=this.zt.tt.from+1;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from],l=this.$e[r-this.zt.tt.from-1];o.ot===l.ot+1&&o.Vs-l.ui!==e+1&&(l.Ye>l.Ze?l.ui=o.Vs-e-1:o.Vs=l.ui+e+1)}let n=Math.ceil(this.zt.he*t);for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from];o.ui<o.Vs&&(o.ui=o.Vs);const l=o.ui-o.Vs+1;n=Math.min(l,n)}if(e>0&&n<4)for(let r=this.zt.tt.from;r<this.zt.tt.to;r++){const o=this.$e[r-this.zt.tt.from];o.ui-o.Vs+1>n&&(o.Ye>o.Ze?o.ui-=1:o.Vs+=1)}}}class pa extends zi{constructor(){super(...arguments),this.Ws=new ma}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t={it:this.Is,he:this.Es.St().he(),tt:this.zs,qe:this.Ls.Dt().Rt(this.Ls.W().base,M(this.Ls.Ct()).Vt)};this.Ws.J(t)}}class va extends zi{constructor(){super(...arguments),this.Ws=new uo}ne(t,e,s){return Object.assign(Object.assign({},this.te(t,e)),s.Hs(t))}Gs(){const t=this.Ls.W(),e={it:this.Is,Nt:t.lineStyle,ds:t.lineVisible?t.lineType:void 0,et:t.lineWidth,Rs:t.pointMarkersVisible?t.pointMarkersRadius||t.lineWidth/2+2:void 0,tt:this.zs,cs:this.Es.St().he()};this.Ws.J(e)}}const _a=/[2-9]/g;class We{constructor(t=50){this.Xe=0,this.Ke=1,this.Ge=1,this.Je={},this.Qe=new Map,this.tr=t}ir(){this.Xe=0,this.Qe.clear(),this.Ke=1,this.Ge=1,this.Je={}}xi(t,e,s){return this.nr(t,e,s).width}Mi(t,e,s){const n=this.nr(t,e,s);return((n.actualBoundingBoxAscent||0)-(n.actualBoundingBoxDescent||0))/2}nr(t,e,s){const n=s||_a,r=String(e).replace(n,"0");if(this.Qe.has(r))return mt(this.Qe.get(r)).sr;if(this.Xe===this.tr){const l=this.Je[this.Ge];delete this.Je[this.Ge],this.Qe.delete(l),this.Ge++,this.Xe--}t.save(),t.textBaseline="middle";const o=t.measureText(r);return t.restore(),o.width===0&&e.length||(this.Qe.set(r,{sr:o,er:this.Ke}),this.Je[this.Ke]=r,this.Xe++,this.Ke++),o}}class ba{constructor(t){this.rr=null,this.k=null,this.hr="right",this.lr=t}ar(t,e,s){this.rr=t,this.k=e,this.hr=s}X(t){this.k!==null&&this.rr!==null&&this.rr.X(t,this.k,this.lr,this.hr)}}class vo{constructor(t,e,s){this._r=t,this.lr=new We(50),this.ur=e,this.F=s,this.j=-1,this.Wt=new ba(this.lr)}gt(){const t=this.F.cr(this.ur);if(t===null)return null;const e=t.dr(this.ur)?t.vr():this.ur.Dt();if(e===null)return null;const s=t.pr(e);if(s==="overlay")return null;const n=this.F.mr();return n.P!==this.j&&(this.j=n.P,this.lr.ir()),this.Wt.ar(this._r.Ii(),n,s),this.Wt}}class wa extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}br(t,e){var s;if(!(!((s=this.zt)===null||s===void 0)&&s.yt))return null;const{st:n,et:r,wr:o}=this.zt;return e>=n-r-7&&e<=n+r+7?{gr:this.zt,wr:o}:null}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null||this.zt.yt===!1)return;const r=Math.round(this.zt.st*n);r<0||r>e.height||(t.lineCap="butt",t.strokeStyle=this.zt.V,t.lineWidth=Math.floor(this.zt.et*s),se(t,this.zt.Nt),eo(t,r,0,e.width))}}class Hs{constructor(t){this.Mr={st:0,V:"rgba(0, 0, 0, 0)",et:1,Nt:0,yt:!1},this.Sr=new wa,this.ft=!0,this.Ls=t,this.Es=t.$t(),this.Sr.J(this.Mr)}bt(){this.ft=!0}gt(){return this.Ls.yt()?(this.ft&&(this.kr(),this.ft=!1),this.Sr):null}}class ya extends Hs{constructor(t){super(t)}kr(){this.Mr.yt=!1;const t=this.Ls.Dt(),e=t.yr().yr;if(e!==2&&e!==3)return;const s=this.Ls.W();if(!s.baseLineVisible||!this.Ls.yt())return;const n=this.Ls.Ct();n!==null&&(this.Mr.yt=!0,this.Mr.st=t.Rt(n.Vt,n.Vt),this.Mr.V=s.baseLineColor,this.Mr.et=s.baseLineWidth,this.Mr.Nt=s.baseLineStyle)}}class xa extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}He(){return this.zt}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s}){const n=this.zt;if(n===null)return;const r=Math.max(1,Math.floor(e)),o=r%2/2,l=Math.round(n.Ze.x*e)+o,h=n.Ze.y*s;t.fillStyle=n.Cr,t.beginPath();const a=Math.max(2,1.5*n.Tr)*e;t.arc(l,h,a,0,2*Math.PI,!1),t.fill(),t.fillStyle=n.Pr,t.beginPath(),t.arc(l,h,n.ht*e,0,2*Math.PI,!1),t.fill(),t.lineWidth=r,t.strokeStyle=n.Rr,t.beginPath(),t.arc(l,h,n.ht*e+r/2,0,2*Math.PI,!1),t.stroke()}}const Sa=[{Dr:0,Vr:.25,Or:4,Br:10,Ar:.25,Ir:0,zr:.4,Lr:.8},{Dr:.25,Vr:.525,Or:10,Br:14,Ar:0,Ir:0,zr:.8,Lr:0},{Dr:.525,Vr:1,Or:14,Br:14,Ar:0,Ir:0,zr:0,Lr:0}];function Bn(i,t,e,s){return function(n,r){if(n==="transparent")return n;const o=Oe(n),l=o[3];return`rgba(${o[0]}, ${o[1]}, ${o[2]}, ${r*l})`}(i,e+(s-e)*t)}function Nn(i,t){const e=i%2600/2600;let s;for(const h of Sa)if(e>=h.Dr&&e<=h.Vr){s=h;break}qt(s!==void 0,"Last price animation internal logic error");const n=(e-s.Dr)/(s.Vr-s.Dr);return{Pr:Bn(t,n,s.Ar,s.Ir),Rr:Bn(t,n,s.zr,s.Lr),ht:(r=n,o=s.Or,l=s.Br,o+(l-o)*r)};var r,o,l}class Ma{constructor(t){this.Wt=new xa,this.ft=!0,this.Er=!0,this.Nr=performance.now(),this.Fr=this.Nr-1,this.Wr=t}jr(){this.Fr=this.Nr-1,this.bt()}Hr(){if(this.bt(),this.Wr.W().lastPriceAnimation===2){const t=performance.now(),e=this.Fr-t;if(e>0)return void(e<650&&(this.Fr+=2600));this.Nr=t,this.Fr=t+2600}}bt(){this.ft=!0}$r(){this.Er=!0}yt(){return this.Wr.W().lastPriceAnimation!==0}Ur(){switch(this.Wr.W().lastPriceAnimation){case 0:return!1;case 1:return!0;case 2:return performance.now()<=this.Fr}}gt(){return this.ft?(this.Mt(),this.ft=!1,this.Er=!1):this.Er&&(this.qr(),this.Er=!1),this.Wt}Mt(){this.Wt.J(null);const t=this.Wr.$t().St(),e=t.Zs(),s=this.Wr.Ct();if(e===null||s===null)return;const n=this.Wr.Yr(!0);if(n.Zr||!e.Xr(n.se))return;const r={x:t.It(n.se),y:this.Wr.Dt().Rt(n._t,s.Vt)},o=n.V,l=this.Wr.W().lineWidth,h=Nn(this.Kr(),o);this.Wt.J({Cr:o,Tr:l,Pr:h.Pr,Rr:h.Rr,ht:h.ht,Ze:r})}qr(){const t=this.Wt.He();if(t!==null){const e=Nn(this.Kr(),t.Cr);t.Pr=e.Pr,t.Rr=e.Rr,t.ht=e.ht}}Kr(){return this.Ur()?performance.now()-this.Nr:2599}}function ke(i,t){return ao(Math.min(Math.max(i,12),30)*t)}function Be(i,t){switch(i){case"arrowDown":case"arrowUp":return ke(t,1);case"circle":return ke(t,.8);case"square":return ke(t,.7)}}function _o(i){return function(t){const e=Math.ceil(t);return e%2!=0?e-1:e}(ke(i,1))}function jn(i){return Math.max(ke(i,.1),3)}function Fn(i,t,e){return t?i:e?Math.ceil(i/2):0}function bo(i,t,e,s,n){const r=Be("square",e),o=(r-1)/2,l=i-o,h=t-o;return s>=l&&s<=l+r&&n>=h&&n<=h+r}function Un(i,t,e,s){const n=(Be("arrowUp",s)-1)/2*e.Gr,r=(ao(s/2)-1)/2*e.Gr;t.beginPath(),i?(t.moveTo(e.nt-n,e.st),t.lineTo(e.nt,e.st-n),t.lineTo(e.nt+n,e.st),t.lineTo(e.nt+r,e.st),t.lineTo(e.nt+r,e.st+n),t.lineTo(e.nt-r,e.st+n),t.lineTo(e.nt-r,e.st)):(t.moveTo(e.nt-n,e.st),t.lineTo(e.nt,e.st+n),t.lineTo(e.nt+n,e.st),t.lineTo(e.nt+r,e.st),t.lineTo(e.nt+r,e.st-n),t.lineTo(e.nt-r,e.st-n),t.lineTo(e.nt-r,e.st)),t.fill()}function Ca(i,t,e,s,n,r){return bo(t,e,s,n,r)}class $a extends zt{constructor(){super(...arguments),this.zt=null,this.lr=new We,this.j=-1,this.H="",this.Jr=""}J(t){this.zt=t}ar(t,e){this.j===t&&this.H===e||(this.j=t,this.H=e,this.Jr=be(t,e),this.lr.ir())}br(t,e){if(this.zt===null||this.zt.tt===null)return null;for(let s=this.zt.tt.from;s<this.zt.tt.to;s++){const n=this.zt.it[s];if(ka(n,t,e))return{gr:n.Qr,wr:n.wr}}return null}K({context:t,horizontalPixelRatio:e,verticalPixelRatio:s},n,r){if(this.zt!==null&&this.zt.tt!==null){t.textBaseline="middle",t.font=this.Jr;for(let o=this.zt.tt.from;o<this.zt.tt.to;o++){const l=this.zt.it[o];l.Kt!==void 0&&(l.Kt.Hi=this.lr.xi(t,l.Kt.th),l.Kt.At=this.j,l.Kt.nt=l.nt-l.Kt.Hi/2),Ea(l,t,e,s)}}}}function Ea(i,t,e,s){t.fillStyle=i.V,i.Kt!==void 0&&function(n,r,o,l,h,a){n.save(),n.scale(h,a),n.fillText(r,o,l),n.restore()}(t,i.Kt.th,i.Kt.nt,i.Kt.st,e,s),function(n,r,o){if(n.Xs!==0){switch(n.ih){case"arrowDown":return void Un(!1,r,o,n.Xs);case"arrowUp":return void Un(!0,r,o,n.Xs);case"circle":return void function(l,h,a){const c=(Be("circle",a)-1)/2;l.beginPath(),l.arc(h.nt,h.st,c*h.Gr,0,2*Math.PI,!1),l.fill()}(r,o,n.Xs);case"square":return void function(l,h,a){const c=Be("square",a),u=(c-1)*h.Gr/2,f=h.nt-u,m=h.st-u;l.fillRect(f,m,c*h.Gr,c*h.Gr)}(r,o,n.Xs)}n.ih}}(i,t,function(n,r,o){const l=Math.max(1,Math.floor(r))%2/2;return{nt:Math.round(n.nt*r)+l,st:n.st*o,Gr:r}}(i,e,s))}function ka(i,t,e){return!(i.Kt===void 0||!function(s,n,r,o,l,h){const a=o/2;return l>=s&&l<=s+r&&h>=n-a&&h<=n+a}(i.Kt.nt,i.Kt.st,i.Kt.Hi,i.Kt.At,t,e))||function(s,n,r){if(s.Xs===0)return!1;switch(s.ih){case"arrowDown":case"arrowUp":return Ca(0,s.nt,s.st,s.Xs,n,r);case"circle":return function(o,l,h,a,c){const u=2+Be("circle",h)/2,f=o-a,m=l-c;return Math.sqrt(f*f+m*m)<=u}(s.nt,s.st,s.Xs,n,r);case"square":return bo(s.nt,s.st,s.Xs,n,r)}}(i,t,e)}function La(i,t,e,s,n,r,o,l,h){const a=At(e)?e:e.xe,c=At(e)?e:e.ge,u=At(e)?e:e.Me,f=At(t.size)?Math.max(t.size,0):1,m=_o(l.he())*f,g=m/2;switch(i.Xs=m,t.position){case"inBar":return i.st=o.Rt(a,h),void(i.Kt!==void 0&&(i.Kt.st=i.st+g+r+.6*n));case"aboveBar":return i.st=o.Rt(c,h)-g-s.nh,i.Kt!==void 0&&(i.Kt.st=i.st-g-.6*n,s.nh+=1.2*n),void(s.nh+=m+r);case"belowBar":return i.st=o.Rt(u,h)+g+s.sh,i.Kt!==void 0&&(i.Kt.st=i.st+g+r+.6*n,s.sh+=1.2*n),void(s.sh+=m+r)}t.position}class Ta{constructor(t,e){this.ft=!0,this.eh=!0,this.rh=!0,this.hh=null,this.ah=null,this.Wt=new $a,this.Wr=t,this.$i=e,this.zt={it:[],tt:null}}bt(t){this.ft=!0,this.rh=!0,t==="data"&&(this.eh=!0,this.ah=null)}gt(t){if(!this.Wr.yt())return null;this.ft&&this.oh();const e=this.$i.W().layout;return this.Wt.ar(e.fontSize,e.fontFamily),this.Wt.J(this.zt),this.Wt}_h(){if(this.rh){if(this.Wr.uh().length>0){const t=this.$i.St().he(),e=jn(t),s=1.5*_o(t)+2*e,n=this.dh();this.hh={above:Fn(s,n.aboveBar,n.inBar),below:Fn(s,n.belowBar,n.inBar)}}else this.hh=null;this.rh=!1}return this.hh}dh(){return this.ah===null&&(this.ah=this.Wr.uh().reduce((t,e)=>(t[e.position]||(t[e.position]=!0),t),{inBar:!1,aboveBar:!1,belowBar:!1})),this.ah}oh(){const t=this.Wr.Dt(),e=this.$i.St(),s=this.Wr.uh();this.eh&&(this.zt.it=s.map(c=>({ot:c.time,nt:0,st:0,Xs:0,ih:c.shape,V:c.color,Qr:c.Qr,wr:c.id,Kt:void 0})),this.eh=!1);const n=this.$i.W().layout;this.zt.tt=null;const r=e.Zs();if(r===null)return;const o=this.Wr.Ct();if(o===null||this.zt.it.length===0)return;let l=NaN;const h=jn(e.he()),a={nh:h,sh:h};this.zt.tt=mo(this.zt.it,r,!0);for(let c=this.zt.tt.from;c<this.zt.tt.to;c++){const u=s[c];u.time!==l&&(a.nh=h,a.sh=h,l=u.time);const f=this.zt.it[c];f.nt=e.It(u.time),u.text!==void 0&&u.text.length>0&&(f.Kt={th:u.text,nt:0,st:0,Hi:0,At:0});const m=this.Wr.fh(u.time);m!==null&&La(f,u,m,a,n.fontSize,h,t,e,o.Vt)}this.ft=!1}}class Pa extends Hs{constructor(t){super(t)}kr(){const t=this.Mr;t.yt=!1;const e=this.Ls.W();if(!e.priceLineVisible||!this.Ls.yt())return;const s=this.Ls.Yr(e.priceLineSource===0);s.Zr||(t.yt=!0,t.st=s.ki,t.V=this.Ls.ph(s.V),t.et=e.priceLineWidth,t.Nt=e.priceLineStyle)}}class za extends Li{constructor(t){super(),this.jt=t}zi(t,e,s){t.yt=!1,e.yt=!1;const n=this.jt;if(!n.yt())return;const r=n.W(),o=r.lastValueVisible,l=n.mh()!=="",h=r.seriesLastValueMode===0,a=n.Yr(!1);if(a.Zr)return;o&&(t.Kt=this.bh(a,o,h),t.yt=t.Kt.length!==0),(l||h)&&(e.Kt=this.wh(a,o,l,h),e.yt=e.Kt.length>0);const c=n.ph(a.V),u=Ei(c);s.t=u.t,s.ki=a.ki,e.Ot=n.$t().Bt(a.ki/n.Dt().At()),t.Ot=c,t.V=u.i,e.V=u.i}wh(t,e,s,n){let r="";const o=this.jt.mh();return s&&o.length!==0&&(r+=`${o} `),e&&n&&(r+=this.jt.Dt().gh()?t.Mh:t.xh),r.trim()}bh(t,e,s){return e?s?this.jt.Dt().gh()?t.xh:t.Mh:t.Kt:""}}function Hn(i,t,e,s){const n=Number.isFinite(t),r=Number.isFinite(e);return n&&r?i(t,e):n||r?n?t:e:s}class pt{constructor(t,e){this.Sh=t,this.kh=e}yh(t){return t!==null&&this.Sh===t.Sh&&this.kh===t.kh}Ch(){return new pt(this.Sh,this.kh)}Th(){return this.Sh}Ph(){return this.kh}Rh(){return this.kh-this.Sh}Ni(){return this.kh===this.Sh||Number.isNaN(this.kh)||Number.isNaN(this.Sh)}ts(t){return t===null?this:new pt(Hn(Math.min,this.Th(),t.Th(),-1/0),Hn(Math.max,this.Ph(),t.Ph(),1/0))}Dh(t){if(!At(t)||this.kh-this.Sh===0)return;const e=.5*(this.kh+this.Sh);let s=this.kh-e,n=this.Sh-e;s*=t,n*=t,this.kh=e+s,this.Sh=e+n}Vh(t){At(t)&&(this.kh+=t,this.Sh+=t)}Oh(){return{minValue:this.Sh,maxValue:this.kh}}static Bh(t){return t===null?null:new pt(t.minValue,t.maxValue)}}class bi{constructor(t,e){this.Ah=t,this.Ih=e||null}zh(){return this.Ah}Lh(){return this.Ih}Oh(){return this.Ah===null?null:{priceRange:this.Ah.Oh(),margins:this.Ih||void 0}}static Bh(t){return t===null?null:new bi(pt.Bh(t.priceRange),t.margins)}}class Da extends Hs{constructor(t,e){super(t),this.Eh=e}kr(){const t=this.Mr;t.yt=!1;const e=this.Eh.W();if(!this.Ls.yt()||!e.lineVisible)return;const s=this.Eh.Nh();s!==null&&(t.yt=!0,t.st=s,t.V=e.color,t.et=e.lineWidth,t.Nt=e.lineStyle,t.wr=this.Eh.W().id)}}class Aa extends Li{constructor(t,e){super(),this.Wr=t,this.Eh=e}zi(t,e,s){t.yt=!1,e.yt=!1;const n=this.Eh.W(),r=n.axisLabelVisible,o=n.title!=="",l=this.Wr;if(!r||!l.yt())return;const h=this.Eh.Nh();if(h===null)return;o&&(e.Kt=n.title,e.yt=!0),e.Ot=l.$t().Bt(h/l.Dt().At()),t.Kt=this.Fh(n.price),t.yt=!0;const a=Ei(n.axisLabelColor||n.color);s.t=a.t;const c=n.axisLabelTextColor||a.i;t.V=c,e.V=c,s.ki=h}Fh(t){const e=this.Wr.Ct();return e===null?"":this.Wr.Dt().Fi(t,e.Vt)}}class Ia{constructor(t,e){this.Wr=t,this.cn=e,this.Wh=new Da(t,this),this._r=new Aa(t,this),this.jh=new vo(this._r,t,t.$t())}Hh(t){Pt(this.cn,t),this.bt(),this.Wr.$t().$h()}W(){return this.cn}Uh(){return this.Wh}qh(){return this.jh}Yh(){return this._r}bt(){this.Wh.bt(),this._r.bt()}Nh(){const t=this.Wr,e=t.Dt();if(t.$t().St().Ni()||e.Ni())return null;const s=t.Ct();return s===null?null:e.Rt(this.cn.price,s.Vt)}}class Oa extends js{constructor(t){super(),this.$i=t}$t(){return this.$i}}const Ra={Bar:(i,t,e,s)=>{var n;const r=t.upColor,o=t.downColor,l=M(i(e,s)),h=ue(l.Vt[0])<=ue(l.Vt[3]);return{ue:(n=l.V)!==null&&n!==void 0?n:h?r:o}},Candlestick:(i,t,e,s)=>{var n,r,o;const l=t.upColor,h=t.downColor,a=t.borderUpColor,c=t.borderDownColor,u=t.wickUpColor,f=t.wickDownColor,m=M(i(e,s)),g=ue(m.Vt[0])<=ue(m.Vt[3]);return{ue:(n=m.V)!==null&&n!==void 0?n:g?l:h,Ee:(r=m.Ot)!==null&&r!==void 0?r:g?a:c,Le:(o=m.Zh)!==null&&o!==void 0?o:g?u:f}},Custom:(i,t,e,s)=>{var n;return{ue:(n=M(i(e,s)).V)!==null&&n!==void 0?n:t.color}},Area:(i,t,e,s)=>{var n,r,o,l;const h=M(i(e,s));return{ue:(n=h.lt)!==null&&n!==void 0?n:t.lineColor,lt:(r=h.lt)!==null&&r!==void 0?r:t.lineColor,Ts:(o=h.Ts)!==null&&o!==void 0?o:t.topColor,Ps:(l=h.Ps)!==null&&l!==void 0?l:t.bottomColor}},Baseline:(i,t,e,s)=>{var n,r,o,l,h,a;const c=M(i(e,s));return{ue:c.Vt[3]>=t.baseValue.price?t.topLineColor:t.bottomLineColor,Pe:(n=c.Pe)!==null&&n!==void 0?n:t.topLineColor,Re:(r=c.Re)!==null&&r!==void 0?r:t.bottomLineColor,Se:(o=c.Se)!==null&&o!==void 0?o:t.topFillColor1,ke:(l=c.ke)!==null&&l!==void 0?l:t.topFillColor2,ye:(h=c.ye)!==null&&h!==void 0?h:t.bottomFillColor1,Ce:(a=c.Ce)!==null&&a!==void 0?a:t.bottomFillColor2}},Line:(i,t,e,s)=>{var n,r;const o=M(i(e,s));return{ue:(n=o.V)!==null&&n!==void 0?n:t.color,lt:(r=o.V)!==null&&r!==void 0?r:t.color}},Histogram:(i,t,e,s)=>{var n;return{ue:(n=M(i(e,s)).V)!==null&&n!==void 0?n:t.color}}};class Va{constructor(t){this.Xh=(e,s)=>s!==void 0?s.Vt:this.Wr.In().Kh(e),this.Wr=t,this.Gh=Ra[t.Jh()]}Hs(t,e){return this.Gh(this.Xh,this.Wr.W(),t,e)}}var Xn;(function(i){i[i.NearestLeft=-1]="NearestLeft",i[i.None=0]="None",i[i.NearestRight=1]="NearestRight"})(Xn||(Xn={}));const Kt=30;class Wa{constructor(){this.Qh=[],this.tl=new Map,this.il=new Map}nl(){return this.Xs()>0?this.Qh[this.Qh.length-1]:null}sl(){return this.Xs()>0?this.el(0):null}An(){return this.Xs()>0?this.el(this.Qh.length-1):null}Xs(){return this.Qh.length}Ni(){return this.Xs()===0}Xr(t){return this.rl(t,0)!==null}Kh(t){return this.hl(t)}hl(t,e=0){const s=this.rl(t,e);return s===null?null:Object.assign(Object.assign({},this.ll(s)),{se:this.el(s)})}ie(){return this.Qh}al(t,e,s){if(this.Ni())return null;let n=null;for(const r of s)n=Ge(n,this.ol(t,e,r));return n}J(t){this.il.clear(),this.tl.clear(),this.Qh=t}el(t){return this.Qh[t].se}ll(t){return this.Qh[t]}rl(t,e){const s=this._l(t);if(s===null&&e!==0)switch(e){case-1:return this.ul(t);case 1:return this.cl(t);default:throw new TypeError("Unknown search mode")}return s}ul(t){let e=this.dl(t);return e>0&&(e-=1),e!==this.Qh.length&&this.el(e)<t?e:null}cl(t){const e=this.fl(t);return e!==this.Qh.length&&t<this.el(e)?e:null}_l(t){const e=this.dl(t);return e===this.Qh.length||t<this.Qh[e].se?null:e}dl(t){return Ue(this.Qh,t,(e,s)=>e.se<s)}fl(t){return go(this.Qh,t,(e,s)=>e.se>s)}vl(t,e,s){let n=null;for(let r=t;r<e;r++){const o=this.Qh[r].Vt[s];Number.isNaN(o)||(n===null?n={pl:o,ml:o}:(o<n.pl&&(n.pl=o),o>n.ml&&(n.ml=o)))}return n}ol(t,e,s){if(this.Ni())return null;let n=null;const r=M(this.sl()),o=M(this.An()),l=Math.max(t,r),h=Math.min(e,o),a=Math.ceil(l/Kt)*Kt,c=Math.max(a,Math.floor(h/Kt)*Kt);{const f=this.dl(l),m=this.fl(Math.min(h,a,e));n=Ge(n,this.vl(f,m,s))}let u=this.tl.get(s);u===void 0&&(u=new Map,this.tl.set(s,u));for(let f=Math.max(a+1,l);f<c;f+=Kt){const m=Math.floor(f/Kt);let g=u.get(m);if(g===void 0){const p=this.dl(m*Kt),_=this.fl((m+1)*Kt-1);g=this.vl(p,_,s),u.set(m,g)}n=Ge(n,g)}{const f=this.dl(c),m=this.fl(h);n=Ge(n,this.vl(f,m,s))}return n}}function Ge(i,t){return i===null?t:t===null?i:{pl:Math.min(i.pl,t.pl),ml:Math.max(i.ml,t.ml)}}class Ba{constructor(t){this.bl=t}X(t,e,s){this.bl.draw(t)}wl(t,e,s){var n,r;(r=(n=this.bl).drawBackground)===null||r===void 0||r.call(n,t)}}class Hi{constructor(t){this.Qe=null,this.wn=t}gt(){var t;const e=this.wn.renderer();if(e===null)return null;if(((t=this.Qe)===null||t===void 0?void 0:t.gl)===e)return this.Qe.Ml;const s=new Ba(e);return this.Qe={gl:e,Ml:s},s}xl(){var t,e,s;return(s=(e=(t=this.wn).zOrder)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:"normal"}}function wo(i){var t,e,s,n,r;return{Kt:i.text(),ki:i.coordinate(),Si:(t=i.fixedCoordinate)===null||t===void 0?void 0:t.call(i),V:i.textColor(),t:i.backColor(),yt:(s=(e=i.visible)===null||e===void 0?void 0:e.call(i))===null||s===void 0||s,hi:(r=(n=i.tickVisible)===null||n===void 0?void 0:n.call(i))===null||r===void 0||r}}class Na{constructor(t,e){this.Wt=new ro,this.Sl=t,this.kl=e}gt(){return this.Wt.J(Object.assign({Hi:this.kl.Hi()},wo(this.Sl))),this.Wt}}class ja extends Li{constructor(t,e){super(),this.Sl=t,this.Li=e}zi(t,e,s){const n=wo(this.Sl);s.t=n.t,t.V=n.V;const r=2/12*this.Li.P();s.wi=r,s.gi=r,s.ki=n.ki,s.Si=n.Si,t.Kt=n.Kt,t.yt=n.yt,t.hi=n.hi}}class Fa{constructor(t,e){this.yl=null,this.Cl=null,this.Tl=null,this.Pl=null,this.Rl=null,this.Dl=t,this.Wr=e}Vl(){return this.Dl}Vn(){var t,e;(e=(t=this.Dl).updateAllViews)===null||e===void 0||e.call(t)}Pn(){var t,e,s,n;const r=(s=(e=(t=this.Dl).paneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.yl)===null||n===void 0?void 0:n.gl)===r)return this.yl.Ml;const o=r.map(l=>new Hi(l));return this.yl={gl:r,Ml:o},o}Qi(){var t,e,s,n;const r=(s=(e=(t=this.Dl).timeAxisViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Cl)===null||n===void 0?void 0:n.gl)===r)return this.Cl.Ml;const o=this.Wr.$t().St(),l=r.map(h=>new Na(h,o));return this.Cl={gl:r,Ml:l},l}Rn(){var t,e,s,n;const r=(s=(e=(t=this.Dl).priceAxisViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Tl)===null||n===void 0?void 0:n.gl)===r)return this.Tl.Ml;const o=this.Wr.Dt(),l=r.map(h=>new ja(h,o));return this.Tl={gl:r,Ml:l},l}Ol(){var t,e,s,n;const r=(s=(e=(t=this.Dl).priceAxisPaneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Pl)===null||n===void 0?void 0:n.gl)===r)return this.Pl.Ml;const o=r.map(l=>new Hi(l));return this.Pl={gl:r,Ml:o},o}Bl(){var t,e,s,n;const r=(s=(e=(t=this.Dl).timeAxisPaneViews)===null||e===void 0?void 0:e.call(t))!==null&&s!==void 0?s:[];if(((n=this.Rl)===null||n===void 0?void 0:n.gl)===r)return this.Rl.Ml;const o=r.map(l=>new Hi(l));return this.Rl={gl:r,Ml:o},o}Al(t,e){var s,n,r;return(r=(n=(s=this.Dl).autoscaleInfo)===null||n===void 0?void 0:n.call(s,t,e))!==null&&r!==void 0?r:null}br(t,e){var s,n,r;return(r=(n=(s=this.Dl).hitTest)===null||n===void 0?void 0:n.call(s,t,e))!==null&&r!==void 0?r:null}}function Xi(i,t,e,s){i.forEach(n=>{t(n).forEach(r=>{r.xl()===e&&s.push(r)})})}function Ki(i){return i.Pn()}function Ua(i){return i.Ol()}function Ha(i){return i.Bl()}class Xs extends Oa{constructor(t,e,s,n,r){super(t),this.zt=new Wa,this.Wh=new Pa(this),this.Il=[],this.zl=new ya(this),this.Ll=null,this.El=null,this.Nl=[],this.Fl=[],this.Wl=null,this.jl=[],this.cn=e,this.Hl=s;const o=new za(this);this.rn=[o],this.jh=new vo(o,this,t),s!=="Area"&&s!=="Line"&&s!=="Baseline"||(this.Ll=new Ma(this)),this.$l(),this.Ul(r)}S(){this.Wl!==null&&clearTimeout(this.Wl)}ph(t){return this.cn.priceLineColor||t}Yr(t){const e={Zr:!0},s=this.Dt();if(this.$t().St().Ni()||s.Ni()||this.zt.Ni())return e;const n=this.$t().St().Zs(),r=this.Ct();if(n===null||r===null)return e;let o,l;if(t){const u=this.zt.nl();if(u===null)return e;o=u,l=u.se}else{const u=this.zt.hl(n.ui(),-1);if(u===null||(o=this.zt.Kh(u.se),o===null))return e;l=u.se}const h=o.Vt[3],a=this.$s().Hs(l,{Vt:o}),c=s.Rt(h,r.Vt);return{Zr:!1,_t:h,Kt:s.Fi(h,r.Vt),Mh:s.ql(h),xh:s.Yl(h,r.Vt),V:a.ue,ki:c,se:l}}$s(){return this.El!==null||(this.El=new Va(this)),this.El}W(){return this.cn}Hh(t){const e=t.priceScaleId;e!==void 0&&e!==this.cn.priceScaleId&&this.$t().Zl(this,e),Pt(this.cn,t),t.priceFormat!==void 0&&(this.$l(),this.$t().Xl()),this.$t().Kl(this),this.$t().Gl(),this.wn.bt("options")}J(t,e){this.zt.J(t),this.Jl(),this.wn.bt("data"),this.dn.bt("data"),this.Ll!==null&&(e&&e.Ql?this.Ll.Hr():t.length===0&&this.Ll.jr());const s=this.$t().cr(this);this.$t().ta(s),this.$t().Kl(this),this.$t().Gl(),this.$t().$h()}ia(t){this.Nl=t,this.Jl();const e=this.$t().cr(this);this.dn.bt("data"),this.$t().ta(e),this.$t().Kl(this),this.$t().Gl(),this.$t().$h()}na(){return this.Nl}uh(){return this.Fl}sa(t){const e=new Ia(this,t);return this.Il.push(e),this.$t().Kl(this),e}ea(t){const e=this.Il.indexOf(t);e!==-1&&this.Il.splice(e,1),this.$t().Kl(this)}Jh(){return this.Hl}Ct(){const t=this.ra();return t===null?null:{Vt:t.Vt[3],ha:t.ot}}ra(){const t=this.$t().St().Zs();if(t===null)return null;const e=t.Vs();return this.zt.hl(e,1)}In(){return this.zt}fh(t){const e=this.zt.Kh(t);return e===null?null:this.Hl==="Bar"||this.Hl==="Candlestick"||this.Hl==="Custom"?{we:e.Vt[0],ge:e.Vt[1],Me:e.Vt[2],xe:e.Vt[3]}:e.Vt[3]}la(t){const e=[];Xi(this.jl,Ki,"top",e);const s=this.Ll;return s!==null&&s.yt()&&(this.Wl===null&&s.Ur()&&(this.Wl=setTimeout(()=>{this.Wl=null,this.$t().aa()},0)),s.$r(),e.unshift(s)),e}Pn(){const t=[];this.oa()||t.push(this.zl),t.push(this.wn,this.Wh,this.dn);const e=this.Il.map(s=>s.Uh());return t.push(...e),Xi(this.jl,Ki,"normal",t),t}_a(){return this.ua(Ki,"bottom")}ca(t){return this.ua(Ua,t)}da(t){return this.ua(Ha,t)}fa(t,e){return this.jl.map(s=>s.br(t,e)).filter(s=>s!==null)}Ji(t){return[this.jh,...this.Il.map(e=>e.qh())]}Rn(t,e){if(e!==this.Yi&&!this.oa())return[];const s=[...this.rn];for(const n of this.Il)s.push(n.Yh());return this.jl.forEach(n=>{s.push(...n.Rn())}),s}Qi(){const t=[];return this.jl.forEach(e=>{t.push(...e.Qi())}),t}Al(t,e){if(this.cn.autoscaleInfoProvider!==void 0){const s=this.cn.autoscaleInfoProvider(()=>{const n=this.va(t,e);return n===null?null:n.Oh()});return bi.Bh(s)}return this.va(t,e)}pa(){return this.cn.priceFormat.minMove}ma(){return this.ba}Vn(){var t;this.wn.bt(),this.dn.bt();for(const e of this.rn)e.bt();for(const e of this.Il)e.bt();this.Wh.bt(),this.zl.bt(),(t=this.Ll)===null||t===void 0||t.bt(),this.jl.forEach(e=>e.Vn())}Dt(){return M(super.Dt())}kt(t){if(!((this.Hl==="Line"||this.Hl==="Area"||this.Hl==="Baseline")&&this.cn.crosshairMarkerVisible))return null;const e=this.zt.Kh(t);return e===null?null:{_t:e.Vt[3],ht:this.wa(),Ot:this.ga(),Pt:this.Ma(),Tt:this.xa(t)}}mh(){return this.cn.title}yt(){return this.cn.visible}Sa(t){this.jl.push(new Fa(t,this))}ka(t){this.jl=this.jl.filter(e=>e.Vl()!==t)}ya(){if(this.wn instanceof Ui)return t=>this.wn.Fe(t)}Ca(){if(this.wn instanceof Ui)return t=>this.wn.We(t)}oa(){return!Ti(this.Dt().Ta())}va(t,e){if(!Re(t)||!Re(e)||this.zt.Ni())return null;const s=this.Hl==="Line"||this.Hl==="Area"||this.Hl==="Baseline"||this.Hl==="Histogram"?[3]:[2,1],n=this.zt.al(t,e,s);let r=n!==null?new pt(n.pl,n.ml):null;if(this.Jh()==="Histogram"){const l=this.cn.base,h=new pt(l,l);r=r!==null?r.ts(h):h}let o=this.dn._h();return this.jl.forEach(l=>{const h=l.Al(t,e);if(h?.priceRange){const m=new pt(h.priceRange.minValue,h.priceRange.maxValue);r=r!==null?r.ts(m):m}var a,c,u,f;h?.margins&&(a=o,c=h.margins,o={above:Math.max((u=a?.above)!==null&&u!==void 0?u:0,c.above),below:Math.max((f=a?.below)!==null&&f!==void 0?f:0,c.below)})}),new bi(r,o)}wa(){switch(this.Hl){case"Line":case"Area":case"Baseline":return this.cn.crosshairMarkerRadius}return 0}ga(){switch(this.Hl){case"Line":case"Area":case"Baseline":{const t=this.cn.crosshairMarkerBorderColor;if(t.length!==0)return t}}return null}Ma(){switch(this.Hl){case"Line":case"Area":case"Baseline":return this.cn.crosshairMarkerBorderWidth}return 0}xa(t){switch(this.Hl){case"Line":case"Area":case"Baseline":{const e=this.cn.crosshairMarkerBackgroundColor;if(e.length!==0)return e}}return this.$s().Hs(t).ue}$l(){switch(this.cn.priceFormat.type){case"custom":this.ba={format:this.cn.priceFormat.formatter};break;case"volume":this.ba=new Jh(this.cn.priceFormat.precision);break;case"percent":this.ba=new oo(this.cn.priceFormat.precision);break;default:{const t=Math.pow(10,this.cn.priceFormat.precision);this.ba=new Pi(t,this.cn.priceFormat.minMove*t)}}this.Yi!==null&&this.Yi.Pa()}Jl(){const t=this.$t().St();if(!t.Ra()||this.zt.Ni())return void(this.Fl=[]);const e=M(this.zt.sl());this.Fl=this.Nl.map((s,n)=>{const r=M(t.Da(s.time,!0)),o=r<e?1:-1;return{time:M(this.zt.hl(r,o)).se,position:s.position,shape:s.shape,color:s.color,id:s.id,Qr:n,text:s.text,size:s.size,originalTime:s.originalTime}})}Ul(t){switch(this.dn=new Ta(this,this.$t()),this.Hl){case"Bar":this.wn=new la(this,this.$t());break;case"Candlestick":this.wn=new da(this,this.$t());break;case"Line":this.wn=new va(this,this.$t());break;case"Custom":this.wn=new Ui(this,this.$t(),mt(t));break;case"Area":this.wn=new ra(this,this.$t());break;case"Baseline":this.wn=new ca(this,this.$t());break;case"Histogram":this.wn=new pa(this,this.$t());break;default:throw Error("Unknown chart style assigned: "+this.Hl)}}ua(t,e){const s=[];return Xi(this.jl,t,e,s),s}}class Xa{constructor(t){this.cn=t}Va(t,e,s){let n=t;if(this.cn.mode===0)return n;const r=s.vn(),o=r.Ct();if(o===null)return n;const l=r.Rt(t,o),h=s.Oa().filter(c=>c instanceof Xs).reduce((c,u)=>{if(s.dr(u)||!u.yt())return c;const f=u.Dt(),m=u.In();if(f.Ni()||!m.Xr(e))return c;const g=m.Kh(e);if(g===null)return c;const p=ue(u.Ct());return c.concat([f.Rt(g.Vt[3],p.Vt)])},[]);if(h.length===0)return n;h.sort((c,u)=>Math.abs(c-l)-Math.abs(u-l));const a=h[0];return n=r.pn(a,o),n}}class Ka extends zt{constructor(){super(...arguments),this.zt=null}J(t){this.zt=t}K({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(this.zt===null)return;const r=Math.max(1,Math.floor(s));t.lineWidth=r,function(o,l){o.save(),o.lineWidth%2&&o.translate(.5,.5),l(),o.restore()}(t,()=>{const o=M(this.zt);if(o.Ba){t.strokeStyle=o.Aa,se(t,o.Ia),t.beginPath();for(const l of o.za){const h=Math.round(l.La*s);t.moveTo(h,-r),t.lineTo(h,e.height+r)}t.stroke()}if(o.Ea){t.strokeStyle=o.Na,se(t,o.Fa),t.beginPath();for(const l of o.Wa){const h=Math.round(l.La*n);t.moveTo(-r,h),t.lineTo(e.width+r,h)}t.stroke()}})}}class qa{constructor(t){this.Wt=new Ka,this.ft=!0,this.tn=t}bt(){this.ft=!0}gt(){if(this.ft){const t=this.tn.$t().W().grid,e={Ea:t.horzLines.visible,Ba:t.vertLines.visible,Na:t.horzLines.color,Aa:t.vertLines.color,Fa:t.horzLines.style,Ia:t.vertLines.style,Wa:this.tn.vn().ja(),za:(this.tn.$t().St().ja()||[]).map(s=>({La:s.coord}))};this.Wt.J(e),this.ft=!1}return this.Wt}}class Ga{constructor(t){this.wn=new qa(t)}Uh(){return this.wn}}const qi={Ha:4,$a:1e-4};function de(i,t){const e=100*(i-t)/t;return t<0?-e:e}function Ya(i,t){const e=de(i.Th(),t),s=de(i.Ph(),t);return new pt(e,s)}function Le(i,t){const e=100*(i-t)/t+100;return t<0?-e:e}function Za(i,t){const e=Le(i.Th(),t),s=Le(i.Ph(),t);return new pt(e,s)}function wi(i,t){const e=Math.abs(i);if(e<1e-15)return 0;const s=Math.log10(e+t.$a)+t.Ha;return i<0?-s:s}function Te(i,t){const e=Math.abs(i);if(e<1e-15)return 0;const s=Math.pow(10,e-t.Ha)-t.$a;return i<0?-s:s}function Ce(i,t){if(i===null)return null;const e=wi(i.Th(),t),s=wi(i.Ph(),t);return new pt(e,s)}function Ye(i,t){if(i===null)return null;const e=Te(i.Th(),t),s=Te(i.Ph(),t);return new pt(e,s)}function Gi(i){if(i===null)return qi;const t=Math.abs(i.Ph()-i.Th());if(t>=1||t<1e-15)return qi;const e=Math.ceil(Math.abs(Math.log10(t))),s=qi.Ha+e;return{Ha:s,$a:1/Math.pow(10,s)}}class Yi{constructor(t,e){if(this.Ua=t,this.qa=e,function(s){if(s<0)return!1;for(let n=s;n>1;n/=10)if(n%10!=0)return!1;return!0}(this.Ua))this.Ya=[2,2.5,2];else{this.Ya=[];for(let s=this.Ua;s!==1;){if(s%2==0)this.Ya.push(2),s/=2;else{if(s%5!=0)throw new Error("unexpected base");this.Ya.push(2,2.5),s/=5}if(this.Ya.length>100)throw new Error("something wrong with base")}}}Za(t,e,s){const n=this.Ua===0?0:1/this.Ua;let r=Math.pow(10,Math.max(0,Math.ceil(Math.log10(t-e)))),o=0,l=this.qa[0];for(;;){const u=qe(r,n,1e-14)&&r>n+1e-14,f=qe(r,s*l,1e-14),m=qe(r,1,1e-14);if(!(u&&f&&m))break;r/=l,l=this.qa[++o%this.qa.length]}if(r<=n+1e-14&&(r=n),r=Math.max(1,r),this.Ya.length>0&&(h=r,a=1,c=1e-14,Math.abs(h-a)<c))for(o=0,l=this.Ya[0];qe(r,s*l,1e-14)&&r>n+1e-14;)r/=l,l=this.Ya[++o%this.Ya.length];var h,a,c;return r}}class Kn{constructor(t,e,s,n){this.Xa=[],this.Li=t,this.Ua=e,this.Ka=s,this.Ga=n}Za(t,e){if(t<e)throw new Error("high < low");const s=this.Li.At(),n=(t-e)*this.Ja()/s,r=new Yi(this.Ua,[2,2.5,2]),o=new Yi(this.Ua,[2,2,2.5]),l=new Yi(this.Ua,[2.5,2,2]),h=[];return h.push(r.Za(t,e,n),o.Za(t,e,n),l.Za(t,e,n)),function(a){if(a.length<1)throw Error("array is empty");let c=a[0];for(let u=1;u<a.length;++u)a[u]<c&&(c=a[u]);return c}(h)}Qa(){const t=this.Li,e=t.Ct();if(e===null)return void(this.Xa=[]);const s=t.At(),n=this.Ka(s-1,e),r=this.Ka(0,e),o=this.Li.W().entireTextOnly?this.io()/2:0,l=o,h=s-1-o,a=Math.max(n,r),c=Math.min(n,r);if(a===c)return void(this.Xa=[]);let u=this.Za(a,c),f=a%u;f+=f<0?u:0;const m=a>=c?1:-1;let g=null,p=0;for(let _=a-f;_>c;_-=u){const w=this.Ga(_,e,!0);g!==null&&Math.abs(w-g)<this.Ja()||w<l||w>h||(p<this.Xa.length?(this.Xa[p].La=w,this.Xa[p].no=t.so(_)):this.Xa.push({La:w,no:t.so(_)}),p++,g=w,t.eo()&&(u=this.Za(_*m,c)))}this.Xa.length=p}ja(){return this.Xa}io(){return this.Li.P()}Ja(){return Math.ceil(2.5*this.io())}}function yo(i){return i.slice().sort((t,e)=>M(t.Xi())-M(e.Xi()))}var qn;(function(i){i[i.Normal=0]="Normal",i[i.Logarithmic=1]="Logarithmic",i[i.Percentage=2]="Percentage",i[i.IndexedTo100=3]="IndexedTo100"})(qn||(qn={}));const Gn=new oo,Yn=new Pi(100,1);class Ja{constructor(t,e,s,n){this.ro=0,this.ho=null,this.Ah=null,this.lo=null,this.ao={oo:!1,_o:null},this.uo=0,this.co=0,this.do=new st,this.fo=new st,this.vo=[],this.po=null,this.mo=null,this.bo=null,this.wo=null,this.ba=Yn,this.Mo=Gi(null),this.xo=t,this.cn=e,this.So=s,this.ko=n,this.yo=new Kn(this,100,this.Co.bind(this),this.To.bind(this))}Ta(){return this.xo}W(){return this.cn}Hh(t){if(Pt(this.cn,t),this.Pa(),t.mode!==void 0&&this.Po({yr:t.mode}),t.scaleMargins!==void 0){const e=mt(t.scaleMargins.top),s=mt(t.scaleMargins.bottom);if(e<0||e>1)throw new Error(`Invalid top margin - expect value between 0 and 1, given=${e}`);if(s<0||s>1)throw new Error(`Invalid bottom margin - expect value between 0 and 1, given=${s}`);if(e+s>1)throw new Error(`Invalid margins - sum of margins must be less than 1, given=${e+s}`);this.Ro(),this.mo=null}}Do(){return this.cn.autoScale}eo(){return this.cn.mode===1}gh(){return this.cn.mode===2}Vo(){return this.cn.mode===3}yr(){return{Wn:this.cn.autoScale,Oo:this.cn.invertScale,yr:this.cn.mode}}Po(t){const e=this.yr();let s=null;t.Wn!==void 0&&(this.cn.autoScale=t.Wn),t.yr!==void 0&&(this.cn.mode=t.yr,t.yr!==2&&t.yr!==3||(this.cn.autoScale=!0),this.ao.oo=!1),e.yr===1&&t.yr!==e.yr&&(function(r,o){if(r===null)return!1;const l=Te(r.Th(),o),h=Te(r.Ph(),o);return isFinite(l)&&isFinite(h)}(this.Ah,this.Mo)?(s=Ye(this.Ah,this.Mo),s!==null&&this.Bo(s)):this.cn.autoScale=!0),t.yr===1&&t.yr!==e.yr&&(s=Ce(this.Ah,this.Mo),s!==null&&this.Bo(s));const n=e.yr!==this.cn.mode;n&&(e.yr===2||this.gh())&&this.Pa(),n&&(e.yr===3||this.Vo())&&this.Pa(),t.Oo!==void 0&&e.Oo!==t.Oo&&(this.cn.invertScale=t.Oo,this.Ao()),this.fo.m(e,this.yr())}Io(){return this.fo}P(){return this.So.fontSize}At(){return this.ro}zo(t){this.ro!==t&&(this.ro=t,this.Ro(),this.mo=null)}Lo(){if(this.ho)return this.ho;const t=this.At()-this.Eo()-this.No();return this.ho=t,t}zh(){return this.Fo(),this.Ah}Bo(t,e){const s=this.Ah;(e||s===null&&t!==null||s!==null&&!s.yh(t))&&(this.mo=null,this.Ah=t)}Ni(){return this.Fo(),this.ro===0||!this.Ah||this.Ah.Ni()}Wo(t){return this.Oo()?t:this.At()-1-t}Rt(t,e){return this.gh()?t=de(t,e):this.Vo()&&(t=Le(t,e)),this.To(t,e)}Qs(t,e,s){this.Fo();const n=this.No(),r=M(this.zh()),o=r.Th(),l=r.Ph(),h=this.Lo()-1,a=this.Oo(),c=h/(l-o),u=s===void 0?0:s.from,f=s===void 0?t.length:s.to,m=this.jo();for(let g=u;g<f;g++){const p=t[g],_=p._t;if(isNaN(_))continue;let w=_;m!==null&&(w=m(p._t,e));const x=n+c*(w-o),$=a?x:this.ro-1-x;p.st=$}}me(t,e,s){this.Fo();const n=this.No(),r=M(this.zh()),o=r.Th(),l=r.Ph(),h=this.Lo()-1,a=this.Oo(),c=h/(l-o),u=s===void 0?0:s.from,f=s===void 0?t.length:s.to,m=this.jo();for(let g=u;g<f;g++){const p=t[g];let _=p.we,w=p.ge,x=p.Me,$=p.xe;m!==null&&(_=m(p.we,e),w=m(p.ge,e),x=m(p.Me,e),$=m(p.xe,e));let E=n+c*(_-o),L=a?E:this.ro-1-E;p.ve=L,E=n+c*(w-o),L=a?E:this.ro-1-E,p.ce=L,E=n+c*(x-o),L=a?E:this.ro-1-E,p.de=L,E=n+c*($-o),L=a?E:this.ro-1-E,p.pe=L}}pn(t,e){const s=this.Co(t,e);return this.Ho(s,e)}Ho(t,e){let s=t;return this.gh()?s=function(n,r){return r<0&&(n=-n),n/100*r+r}(s,e):this.Vo()&&(s=function(n,r){return n-=100,r<0&&(n=-n),n/100*r+r}(s,e)),s}Oa(){return this.vo}$o(){if(this.po)return this.po;let t=[];for(let e=0;e<this.vo.length;e++){const s=this.vo[e];s.Xi()===null&&s.Ki(e+1),t.push(s)}return t=yo(t),this.po=t,this.po}Uo(t){this.vo.indexOf(t)===-1&&(this.vo.push(t),this.Pa(),this.qo())}Yo(t){const e=this.vo.indexOf(t);if(e===-1)throw new Error("source is not attached to scale");this.vo.splice(e,1),this.vo.length===0&&(this.Po({Wn:!0}),this.Bo(null)),this.Pa(),this.qo()}Ct(){let t=null;for(const e of this.vo){const s=e.Ct();s!==null&&(t===null||s.ha<t.ha)&&(t=s)}return t===null?null:t.Vt}Oo(){return this.cn.invertScale}ja(){const t=this.Ct()===null;if(this.mo!==null&&(t||this.mo.Zo===t))return this.mo.ja;this.yo.Qa();const e=this.yo.ja();return this.mo={ja:e,Zo:t},this.do.m(),e}Xo(){return this.do}Ko(t){this.gh()||this.Vo()||this.bo===null&&this.lo===null&&(this.Ni()||(this.bo=this.ro-t,this.lo=M(this.zh()).Ch()))}Go(t){if(this.gh()||this.Vo()||this.bo===null)return;this.Po({Wn:!1}),(t=this.ro-t)<0&&(t=0);let e=(this.bo+.2*(this.ro-1))/(t+.2*(this.ro-1));const s=M(this.lo).Ch();e=Math.max(e,.1),s.Dh(e),this.Bo(s)}Jo(){this.gh()||this.Vo()||(this.bo=null,this.lo=null)}Qo(t){this.Do()||this.wo===null&&this.lo===null&&(this.Ni()||(this.wo=t,this.lo=M(this.zh()).Ch()))}t_(t){if(this.Do()||this.wo===null)return;const e=M(this.zh()).Rh()/(this.Lo()-1);let s=t-this.wo;this.Oo()&&(s*=-1);const n=s*e,r=M(this.lo).Ch();r.Vh(n),this.Bo(r,!0),this.mo=null}i_(){this.Do()||this.wo!==null&&(this.wo=null,this.lo=null)}ma(){return this.ba||this.Pa(),this.ba}Fi(t,e){switch(this.cn.mode){case 2:return this.n_(de(t,e));case 3:return this.ma().format(Le(t,e));default:return this.Fh(t)}}so(t){switch(this.cn.mode){case 2:return this.n_(t);case 3:return this.ma().format(t);default:return this.Fh(t)}}ql(t){return this.Fh(t,M(this.s_()).ma())}Yl(t,e){return t=de(t,e),this.n_(t,Gn)}e_(){return this.vo}r_(t){this.ao={_o:t,oo:!1}}Vn(){this.vo.forEach(t=>t.Vn())}Pa(){this.mo=null;const t=this.s_();let e=100;t!==null&&(e=Math.round(1/t.pa())),this.ba=Yn,this.gh()?(this.ba=Gn,e=100):this.Vo()?(this.ba=new Pi(100,1),e=100):t!==null&&(this.ba=t.ma()),this.yo=new Kn(this,e,this.Co.bind(this),this.To.bind(this)),this.yo.Qa()}qo(){this.po=null}s_(){return this.vo[0]||null}Eo(){return this.Oo()?this.cn.scaleMargins.bottom*this.At()+this.co:this.cn.scaleMargins.top*this.At()+this.uo}No(){return this.Oo()?this.cn.scaleMargins.top*this.At()+this.uo:this.cn.scaleMargins.bottom*this.At()+this.co}Fo(){this.ao.oo||(this.ao.oo=!0,this.h_())}Ro(){this.ho=null}To(t,e){if(this.Fo(),this.Ni())return 0;t=this.eo()&&t?wi(t,this.Mo):t;const s=M(this.zh()),n=this.No()+(this.Lo()-1)*(t-s.Th())/s.Rh();return this.Wo(n)}Co(t,e){if(this.Fo(),this.Ni())return 0;const s=this.Wo(t),n=M(this.zh()),r=n.Th()+n.Rh()*((s-this.No())/(this.Lo()-1));return this.eo()?Te(r,this.Mo):r}Ao(){this.mo=null,this.yo.Qa()}h_(){const t=this.ao._o;if(t===null)return;let e=null;const s=this.e_();let n=0,r=0;for(const h of s){if(!h.yt())continue;const a=h.Ct();if(a===null)continue;const c=h.Al(t.Vs(),t.ui());let u=c&&c.zh();if(u!==null){switch(this.cn.mode){case 1:u=Ce(u,this.Mo);break;case 2:u=Ya(u,a.Vt);break;case 3:u=Za(u,a.Vt)}if(e=e===null?u:e.ts(M(u)),c!==null){const f=c.Lh();f!==null&&(n=Math.max(n,f.above),r=Math.max(r,f.below))}}}if(n===this.uo&&r===this.co||(this.uo=n,this.co=r,this.mo=null,this.Ro()),e!==null){if(e.Th()===e.Ph()){const h=this.s_(),a=5*(h===null||this.gh()||this.Vo()?1:h.pa());this.eo()&&(e=Ye(e,this.Mo)),e=new pt(e.Th()-a,e.Ph()+a),this.eo()&&(e=Ce(e,this.Mo))}if(this.eo()){const h=Ye(e,this.Mo),a=Gi(h);if(o=a,l=this.Mo,o.Ha!==l.Ha||o.$a!==l.$a){const c=this.lo!==null?Ye(this.lo,this.Mo):null;this.Mo=a,e=Ce(h,a),c!==null&&(this.lo=Ce(c,a))}}this.Bo(e)}else this.Ah===null&&(this.Bo(new pt(-.5,.5)),this.Mo=Gi(null));var o,l;this.ao.oo=!0}jo(){return this.gh()?de:this.Vo()?Le:this.eo()?t=>wi(t,this.Mo):null}l_(t,e,s){return e===void 0?(s===void 0&&(s=this.ma()),s.format(t)):e(t)}Fh(t,e){return this.l_(t,this.ko.priceFormatter,e)}n_(t,e){return this.l_(t,this.ko.percentageFormatter,e)}}class Qa{constructor(t,e){this.vo=[],this.a_=new Map,this.ro=0,this.o_=0,this.__=1e3,this.po=null,this.u_=new st,this.kl=t,this.$i=e,this.c_=new Ga(this);const s=e.W();this.d_=this.f_("left",s.leftPriceScale),this.v_=this.f_("right",s.rightPriceScale),this.d_.Io().l(this.p_.bind(this,this.d_),this),this.v_.Io().l(this.p_.bind(this,this.v_),this),this.m_(s)}m_(t){if(t.leftPriceScale&&this.d_.Hh(t.leftPriceScale),t.rightPriceScale&&this.v_.Hh(t.rightPriceScale),t.localization&&(this.d_.Pa(),this.v_.Pa()),t.overlayPriceScales){const e=Array.from(this.a_.values());for(const s of e){const n=M(s[0].Dt());n.Hh(t.overlayPriceScales),t.localization&&n.Pa()}}}b_(t){switch(t){case"left":return this.d_;case"right":return this.v_}return this.a_.has(t)?mt(this.a_.get(t))[0].Dt():null}S(){this.$t().w_().p(this),this.d_.Io().p(this),this.v_.Io().p(this),this.vo.forEach(t=>{t.S&&t.S()}),this.u_.m()}g_(){return this.__}M_(t){this.__=t}$t(){return this.$i}Hi(){return this.o_}At(){return this.ro}x_(t){this.o_=t,this.S_()}zo(t){this.ro=t,this.d_.zo(t),this.v_.zo(t),this.vo.forEach(e=>{if(this.dr(e)){const s=e.Dt();s!==null&&s.zo(t)}}),this.S_()}Oa(){return this.vo}dr(t){const e=t.Dt();return e===null||this.d_!==e&&this.v_!==e}Uo(t,e,s){const n=s!==void 0?s:this.y_().k_+1;this.C_(t,e,n)}Yo(t){const e=this.vo.indexOf(t);qt(e!==-1,"removeDataSource: invalid data source"),this.vo.splice(e,1);const s=M(t.Dt()).Ta();if(this.a_.has(s)){const r=mt(this.a_.get(s)),o=r.indexOf(t);o!==-1&&(r.splice(o,1),r.length===0&&this.a_.delete(s))}const n=t.Dt();n&&n.Oa().indexOf(t)>=0&&n.Yo(t),n!==null&&(n.qo(),this.T_(n)),this.po=null}pr(t){return t===this.d_?"left":t===this.v_?"right":"overlay"}P_(){return this.d_}R_(){return this.v_}D_(t,e){t.Ko(e)}V_(t,e){t.Go(e),this.S_()}O_(t){t.Jo()}B_(t,e){t.Qo(e)}A_(t,e){t.t_(e),this.S_()}I_(t){t.i_()}S_(){this.vo.forEach(t=>{t.Vn()})}vn(){let t=null;return this.$i.W().rightPriceScale.visible&&this.v_.Oa().length!==0?t=this.v_:this.$i.W().leftPriceScale.visible&&this.d_.Oa().length!==0?t=this.d_:this.vo.length!==0&&(t=this.vo[0].Dt()),t===null&&(t=this.v_),t}vr(){let t=null;return this.$i.W().rightPriceScale.visible?t=this.v_:this.$i.W().leftPriceScale.visible&&(t=this.d_),t}T_(t){t!==null&&t.Do()&&this.z_(t)}L_(t){const e=this.kl.Zs();t.Po({Wn:!0}),e!==null&&t.r_(e),this.S_()}E_(){this.z_(this.d_),this.z_(this.v_)}N_(){this.T_(this.d_),this.T_(this.v_),this.vo.forEach(t=>{this.dr(t)&&this.T_(t.Dt())}),this.S_(),this.$i.$h()}$o(){return this.po===null&&(this.po=yo(this.vo)),this.po}F_(){return this.u_}W_(){return this.c_}z_(t){const e=t.e_();if(e&&e.length>0&&!this.kl.Ni()){const s=this.kl.Zs();s!==null&&t.r_(s)}t.Vn()}y_(){const t=this.$o();if(t.length===0)return{j_:0,k_:0};let e=0,s=0;for(let n=0;n<t.length;n++){const r=t[n].Xi();r!==null&&(r<e&&(e=r),r>s&&(s=r))}return{j_:e,k_:s}}C_(t,e,s){let n=this.b_(e);if(n===null&&(n=this.f_(e,this.$i.W().overlayPriceScales)),this.vo.push(t),!Ti(e)){const r=this.a_.get(e)||[];r.push(t),this.a_.set(e,r)}n.Uo(t),t.Gi(n),t.Ki(s),this.T_(n),this.po=null}p_(t,e,s){e.yr!==s.yr&&this.z_(t)}f_(t,e){const s=Object.assign({visible:!0,autoScale:!0},Vt(e)),n=new Ja(t,s,this.$i.W().layout,this.$i.W().localization);return n.zo(this.At()),n}}class tc{constructor(t,e,s=50){this.Xe=0,this.Ke=1,this.Ge=1,this.Qe=new Map,this.Je=new Map,this.H_=t,this.U_=e,this.tr=s}q_(t){const e=t.time,s=this.U_.cacheKey(e),n=this.Qe.get(s);if(n!==void 0)return n.Y_;if(this.Xe===this.tr){const o=this.Je.get(this.Ge);this.Je.delete(this.Ge),this.Qe.delete(mt(o)),this.Ge++,this.Xe--}const r=this.H_(t);return this.Qe.set(s,{Y_:r,er:this.Ke}),this.Je.set(this.Ke,s),this.Xe++,this.Ke++,r}}class Pe{constructor(t,e){qt(t<=e,"right should be >= left"),this.Z_=t,this.X_=e}Vs(){return this.Z_}ui(){return this.X_}K_(){return this.X_-this.Z_+1}Xr(t){return this.Z_<=t&&t<=this.X_}yh(t){return this.Z_===t.Vs()&&this.X_===t.ui()}}function Zn(i,t){return i===null||t===null?i===t:i.yh(t)}class ec{constructor(){this.G_=new Map,this.Qe=null,this.J_=!1}Q_(t){this.J_=t,this.Qe=null}tu(t,e){this.iu(e),this.Qe=null;for(let s=e;s<t.length;++s){const n=t[s];let r=this.G_.get(n.timeWeight);r===void 0&&(r=[],this.G_.set(n.timeWeight,r)),r.push({index:s,time:n.time,weight:n.timeWeight,originalTime:n.originalTime})}}nu(t,e){const s=Math.ceil(e/t);return this.Qe!==null&&this.Qe.su===s||(this.Qe={ja:this.eu(s),su:s}),this.Qe.ja}iu(t){if(t===0)return void this.G_.clear();const e=[];this.G_.forEach((s,n)=>{t<=s[0].index?e.push(n):s.splice(Ue(s,t,r=>r.index<t),1/0)});for(const s of e)this.G_.delete(s)}eu(t){let e=[];for(const s of Array.from(this.G_.keys()).sort((n,r)=>r-n)){if(!this.G_.get(s))continue;const n=e;e=[];const r=n.length;let o=0;const l=mt(this.G_.get(s)),h=l.length;let a=1/0,c=-1/0;for(let u=0;u<h;u++){const f=l[u],m=f.index;for(;o<r;){const g=n[o],p=g.index;if(!(p<m)){a=p;break}o++,e.push(g),c=p,a=1/0}if(a-m>=t&&m-c>=t)e.push(f),c=m;else if(this.J_)return n}for(;o<r;o++)e.push(n[o])}return e}}class me{constructor(t){this.ru=t}hu(){return this.ru===null?null:new Pe(Math.floor(this.ru.Vs()),Math.ceil(this.ru.ui()))}lu(){return this.ru}static au(){return new me(null)}}function ic(i,t){return i.weight>t.weight?i:t}class sc{constructor(t,e,s,n){this.o_=0,this.ou=null,this._u=[],this.wo=null,this.bo=null,this.uu=new ec,this.cu=new Map,this.du=me.au(),this.fu=!0,this.vu=new st,this.pu=new st,this.mu=new st,this.bu=null,this.wu=null,this.gu=[],this.cn=e,this.ko=s,this.Mu=e.rightOffset,this.xu=e.barSpacing,this.$i=t,this.U_=n,this.Su(),this.uu.Q_(e.uniformDistribution)}W(){return this.cn}ku(t){Pt(this.ko,t),this.yu(),this.Su()}Hh(t,e){var s;Pt(this.cn,t),this.cn.fixLeftEdge&&this.Cu(),this.cn.fixRightEdge&&this.Tu(),t.barSpacing!==void 0&&this.$i.Gn(t.barSpacing),t.rightOffset!==void 0&&this.$i.Jn(t.rightOffset),t.minBarSpacing!==void 0&&this.$i.Gn((s=t.barSpacing)!==null&&s!==void 0?s:this.xu),this.yu(),this.Su(),this.mu.m()}mn(t){var e,s;return(s=(e=this._u[t])===null||e===void 0?void 0:e.time)!==null&&s!==void 0?s:null}Ui(t){var e;return(e=this._u[t])!==null&&e!==void 0?e:null}Da(t,e){if(this._u.length<1)return null;if(this.U_.key(t)>this.U_.key(this._u[this._u.length-1].time))return e?this._u.length-1:null;const s=Ue(this._u,this.U_.key(t),(n,r)=>this.U_.key(n.time)<r);return this.U_.key(t)<this.U_.key(this._u[s].time)?e?s:null:s}Ni(){return this.o_===0||this._u.length===0||this.ou===null}Ra(){return this._u.length>0}Zs(){return this.Pu(),this.du.hu()}Ru(){return this.Pu(),this.du.lu()}Du(){const t=this.Zs();if(t===null)return null;const e={from:t.Vs(),to:t.ui()};return this.Vu(e)}Vu(t){const e=Math.round(t.from),s=Math.round(t.to),n=M(this.Ou()),r=M(this.Bu());return{from:M(this.Ui(Math.max(n,e))),to:M(this.Ui(Math.min(r,s)))}}Au(t){return{from:M(this.Da(t.from,!0)),to:M(this.Da(t.to,!0))}}Hi(){return this.o_}x_(t){if(!isFinite(t)||t<=0||this.o_===t)return;const e=this.Ru(),s=this.o_;if(this.o_=t,this.fu=!0,this.cn.lockVisibleTimeRangeOnResize&&s!==0){const n=this.xu*t/s;this.xu=n}if(this.cn.fixLeftEdge&&e!==null&&e.Vs()<=0){const n=s-t;this.Mu-=Math.round(n/this.xu)+1,this.fu=!0}this.Iu(),this.zu()}It(t){if(this.Ni()||!Re(t))return 0;const e=this.Lu()+this.Mu-t;return this.o_-(e+.5)*this.xu-1}Js(t,e){const s=this.Lu(),n=e===void 0?0:e.from,r=e===void 0?t.length:e.to;for(let o=n;o<r;o++){const l=t[o].ot,h=s+this.Mu-l,a=this.o_-(h+.5)*this.xu-1;t[o].nt=a}}Eu(t){return Math.ceil(this.Nu(t))}Jn(t){this.fu=!0,this.Mu=t,this.zu(),this.$i.Fu(),this.$i.$h()}he(){return this.xu}Gn(t){this.Wu(t),this.zu(),this.$i.Fu(),this.$i.$h()}ju(){return this.Mu}ja(){if(this.Ni())return null;if(this.wu!==null)return this.wu;const t=this.xu,e=5*(this.$i.W().layout.fontSize+4)/8*(this.cn.tickMarkMaxCharacterLength||8),s=Math.round(e/t),n=M(this.Zs()),r=Math.max(n.Vs(),n.Vs()-s),o=Math.max(n.ui(),n.ui()-s),l=this.uu.nu(t,e),h=this.Ou()+s,a=this.Bu()-s,c=this.Hu(),u=this.cn.fixLeftEdge||c,f=this.cn.fixRightEdge||c;let m=0;for(const g of l){if(!(r<=g.index&&g.index<=o))continue;let p;m<this.gu.length?(p=this.gu[m],p.coord=this.It(g.index),p.label=this.$u(g),p.weight=g.weight):(p={needAlignCoordinate:!1,coord:this.It(g.index),label:this.$u(g),weight:g.weight},this.gu.push(p)),this.xu>e/2&&!c?p.needAlignCoordinate=!1:p.needAlignCoordinate=u&&g.index<=h||f&&g.index>=a,m++}return this.gu.length=m,this.wu=this.gu,this.gu}Uu(){this.fu=!0,this.Gn(this.cn.barSpacing),this.Jn(this.cn.rightOffset)}qu(t){this.fu=!0,this.ou=t,this.zu(),this.Cu()}Yu(t,e){const s=this.Nu(t),n=this.he(),r=n+e*(n/10);this.Gn(r),this.cn.rightBarStaysOnScroll||this.Jn(this.ju()+(s-this.Nu(t)))}Ko(t){this.wo&&this.i_(),this.bo===null&&this.bu===null&&(this.Ni()||(this.bo=t,this.Zu()))}Go(t){if(this.bu===null)return;const e=Cs(this.o_-t,0,this.o_),s=Cs(this.o_-M(this.bo),0,this.o_);e!==0&&s!==0&&this.Gn(this.bu.he*e/s)}Jo(){this.bo!==null&&(this.bo=null,this.Xu())}Qo(t){this.wo===null&&this.bu===null&&(this.Ni()||(this.wo=t,this.Zu()))}t_(t){if(this.wo===null)return;const e=(this.wo-t)/this.he();this.Mu=M(this.bu).ju+e,this.fu=!0,this.zu()}i_(){this.wo!==null&&(this.wo=null,this.Xu())}Ku(){this.Gu(this.cn.rightOffset)}Gu(t,e=400){if(!isFinite(t))throw new RangeError("offset is required and must be finite number");if(!isFinite(e)||e<=0)throw new RangeError("animationDuration (optional) must be finite positive number");const s=this.Mu,n=performance.now();this.$i.Zn({Ju:r=>(r-n)/e>=1,Qu:r=>{const o=(r-n)/e;return o>=1?t:s+(t-s)*o}})}bt(t,e){this.fu=!0,this._u=t,this.uu.tu(t,e),this.zu()}tc(){return this.vu}nc(){return this.pu}sc(){return this.mu}Lu(){return this.ou||0}ec(t){const e=t.K_();this.Wu(this.o_/e),this.Mu=t.ui()-this.Lu(),this.zu(),this.fu=!0,this.$i.Fu(),this.$i.$h()}rc(){const t=this.Ou(),e=this.Bu();t!==null&&e!==null&&this.ec(new Pe(t,e+this.cn.rightOffset))}hc(t){const e=new Pe(t.from,t.to);this.ec(e)}qi(t){return this.ko.timeFormatter!==void 0?this.ko.timeFormatter(t.originalTime):this.U_.formatHorzItem(t.time)}Hu(){const{handleScroll:t,handleScale:e}=this.$i.W();return!(t.horzTouchDrag||t.mouseWheel||t.pressedMouseMove||t.vertTouchDrag||e.axisDoubleClickReset.time||e.axisPressedMouseMove.time||e.mouseWheel||e.pinch)}Ou(){return this._u.length===0?null:0}Bu(){return this._u.length===0?null:this._u.length-1}lc(t){return(this.o_-1-t)/this.xu}Nu(t){const e=this.lc(t),s=this.Lu()+this.Mu-e;return Math.round(1e6*s)/1e6}Wu(t){const e=this.xu;this.xu=t,this.Iu(),e!==this.xu&&(this.fu=!0,this.ac())}Pu(){if(!this.fu)return;if(this.fu=!1,this.Ni())return void this.oc(me.au());const t=this.Lu(),e=this.o_/this.xu,s=this.Mu+t,n=new Pe(s-e+1,s);this.oc(new me(n))}Iu(){const t=this._c();if(this.xu<t&&(this.xu=t,this.fu=!0),this.o_!==0){const e=.5*this.o_;this.xu>e&&(this.xu=e,this.fu=!0)}}_c(){return this.cn.fixLeftEdge&&this.cn.fixRightEdge&&this._u.length!==0?this.o_/this._u.length:this.cn.minBarSpacing}zu(){const t=this.uc();this.Mu>t&&(this.Mu=t,this.fu=!0);const e=this.cc();e!==null&&this.Mu<e&&(this.Mu=e,this.fu=!0)}cc(){const t=this.Ou(),e=this.ou;return t===null||e===null?null:t-e-1+(this.cn.fixLeftEdge?this.o_/this.xu:Math.min(2,this._u.length))}uc(){return this.cn.fixRightEdge?0:this.o_/this.xu-Math.min(2,this._u.length)}Zu(){this.bu={he:this.he(),ju:this.ju()}}Xu(){this.bu=null}$u(t){let e=this.cu.get(t.weight);return e===void 0&&(e=new tc(s=>this.dc(s),this.U_),this.cu.set(t.weight,e)),e.q_(t)}dc(t){return this.U_.formatTickmark(t,this.ko)}oc(t){const e=this.du;this.du=t,Zn(e.hu(),this.du.hu())||this.vu.m(),Zn(e.lu(),this.du.lu())||this.pu.m(),this.ac()}ac(){this.wu=null}yu(){this.ac(),this.cu.clear()}Su(){this.U_.updateFormatter(this.ko)}Cu(){if(!this.cn.fixLeftEdge)return;const t=this.Ou();if(t===null)return;const e=this.Zs();if(e===null)return;const s=e.Vs()-t;if(s<0){const n=this.Mu-s-1;this.Jn(n)}this.Iu()}Tu(){this.zu(),this.Iu()}}class nc{X(t,e,s){t.useMediaCoordinateSpace(n=>this.K(n,e,s))}wl(t,e,s){t.useMediaCoordinateSpace(n=>this.fc(n,e,s))}fc(t,e,s){}}class rc extends nc{constructor(t){super(),this.vc=new Map,this.zt=t}K(t){}fc(t){if(!this.zt.yt)return;const{context:e,mediaSize:s}=t;let n=0;for(const o of this.zt.mc){if(o.Kt.length===0)continue;e.font=o.R;const l=this.bc(e,o.Kt);l>s.width?o.Yu=s.width/l:o.Yu=1,n+=o.wc*o.Yu}let r=0;switch(this.zt.gc){case"top":r=0;break;case"center":r=Math.max((s.height-n)/2,0);break;case"bottom":r=Math.max(s.height-n,0)}e.fillStyle=this.zt.V;for(const o of this.zt.mc){e.save();let l=0;switch(this.zt.Mc){case"left":e.textAlign="left",l=o.wc/2;break;case"center":e.textAlign="center",l=s.width/2;break;case"right":e.textAlign="right",l=s.width-1-o.wc/2}e.translate(l,r),e.textBaseline="top",e.font=o.R,e.scale(o.Yu,o.Yu),e.fillText(o.Kt,0,o.xc),e.restore(),r+=o.wc*o.Yu}}bc(t,e){const s=this.Sc(t.font);let n=s.get(e);return n===void 0&&(n=t.measureText(e).width,s.set(e,n)),n}Sc(t){let e=this.vc.get(t);return e===void 0&&(e=new Map,this.vc.set(t,e)),e}}class oc{constructor(t){this.ft=!0,this.Ft={yt:!1,V:"",mc:[],gc:"center",Mc:"center"},this.Wt=new rc(this.Ft),this.jt=t}bt(){this.ft=!0}gt(){return this.ft&&(this.Mt(),this.ft=!1),this.Wt}Mt(){const t=this.jt.W(),e=this.Ft;e.yt=t.visible,e.yt&&(e.V=t.color,e.Mc=t.horzAlign,e.gc=t.vertAlign,e.mc=[{Kt:t.text,R:be(t.fontSize,t.fontFamily,t.fontStyle),wc:1.2*t.fontSize,xc:0,Yu:0}])}}class lc extends js{constructor(t,e){super(),this.cn=e,this.wn=new oc(this)}Rn(){return[]}Pn(){return[this.wn]}W(){return this.cn}Vn(){this.wn.bt()}}var Jn,Qn,$s,Es,tr;(function(i){i[i.OnTouchEnd=0]="OnTouchEnd",i[i.OnNextTap=1]="OnNextTap"})(Jn||(Jn={}));class hc{constructor(t,e,s){this.kc=[],this.yc=[],this.o_=0,this.Cc=null,this.Tc=new st,this.Pc=new st,this.Rc=null,this.Dc=t,this.cn=e,this.U_=s,this.Vc=new Bh(this),this.kl=new sc(this,e.timeScale,this.cn.localization,s),this.vt=new Zh(this,e.crosshair),this.Oc=new Xa(e.crosshair),this.Bc=new lc(this,e.watermark),this.Ac(),this.kc[0].M_(2e3),this.Ic=this.zc(0),this.Lc=this.zc(1)}Xl(){this.Ec(ht.es())}$h(){this.Ec(ht.ss())}aa(){this.Ec(new ht(1))}Kl(t){const e=this.Nc(t);this.Ec(e)}Fc(){return this.Cc}Wc(t){const e=this.Cc;this.Cc=t,e!==null&&this.Kl(e.jc),t!==null&&this.Kl(t.jc)}W(){return this.cn}Hh(t){Pt(this.cn,t),this.kc.forEach(e=>e.m_(t)),t.timeScale!==void 0&&this.kl.Hh(t.timeScale),t.localization!==void 0&&this.kl.ku(t.localization),(t.leftPriceScale||t.rightPriceScale)&&this.Tc.m(),this.Ic=this.zc(0),this.Lc=this.zc(1),this.Xl()}Hc(t,e){if(t==="left")return void this.Hh({leftPriceScale:e});if(t==="right")return void this.Hh({rightPriceScale:e});const s=this.$c(t);s!==null&&(s.Dt.Hh(e),this.Tc.m())}$c(t){for(const e of this.kc){const s=e.b_(t);if(s!==null)return{Ht:e,Dt:s}}return null}St(){return this.kl}Uc(){return this.kc}qc(){return this.Bc}Yc(){return this.vt}Zc(){return this.Pc}Xc(t,e){t.zo(e),this.Fu()}x_(t){this.o_=t,this.kl.x_(this.o_),this.kc.forEach(e=>e.x_(t)),this.Fu()}Ac(t){const e=new Qa(this.kl,this);t!==void 0?this.kc.splice(t,0,e):this.kc.push(e);const s=t===void 0?this.kc.length-1:t,n=ht.es();return n.Nn(s,{Fn:0,Wn:!0}),this.Ec(n),e}D_(t,e,s){t.D_(e,s)}V_(t,e,s){t.V_(e,s),this.Gl(),this.Ec(this.Kc(t,2))}O_(t,e){t.O_(e),this.Ec(this.Kc(t,2))}B_(t,e,s){e.Do()||t.B_(e,s)}A_(t,e,s){e.Do()||(t.A_(e,s),this.Gl(),this.Ec(this.Kc(t,2)))}I_(t,e){e.Do()||(t.I_(e),this.Ec(this.Kc(t,2)))}L_(t,e){t.L_(e),this.Ec(this.Kc(t,2))}Gc(t){this.kl.Ko(t)}Jc(t,e){const s=this.St();if(s.Ni()||e===0)return;const n=s.Hi();t=Math.max(1,Math.min(t,n)),s.Yu(t,e),this.Fu()}Qc(t){this.td(0),this.nd(t),this.sd()}ed(t){this.kl.Go(t),this.Fu()}rd(){this.kl.Jo(),this.$h()}td(t){this.kl.Qo(t)}nd(t){this.kl.t_(t),this.Fu()}sd(){this.kl.i_(),this.$h()}wt(){return this.yc}hd(t,e,s,n,r){this.vt.gn(t,e);let o=NaN,l=this.kl.Eu(t);const h=this.kl.Zs();h!==null&&(l=Math.min(Math.max(h.Vs(),l),h.ui()));const a=n.vn(),c=a.Ct();c!==null&&(o=a.pn(e,c)),o=this.Oc.Va(o,l,n),this.vt.kn(l,o,n),this.aa(),r||this.Pc.m(this.vt.xt(),{x:t,y:e},s)}ld(t,e,s){const n=s.vn(),r=n.Ct(),o=n.Rt(t,M(r)),l=this.kl.Da(e,!0),h=this.kl.It(M(l));this.hd(h,o,null,s,!0)}ad(t){this.Yc().Cn(),this.aa(),t||this.Pc.m(null,null,null)}Gl(){const t=this.vt.Ht();if(t!==null){const e=this.vt.xn(),s=this.vt.Sn();this.hd(e,s,null,t)}this.vt.Vn()}od(t,e,s){const n=this.kl.mn(0);e!==void 0&&s!==void 0&&this.kl.bt(e,s);const r=this.kl.mn(0),o=this.kl.Lu(),l=this.kl.Zs();if(l!==null&&n!==null&&r!==null){const h=l.Xr(o),a=this.U_.key(n)>this.U_.key(r),c=t!==null&&t>o&&!a,u=this.kl.W().allowShiftVisibleRangeOnWhitespaceReplacement,f=h&&(s!==void 0||u)&&this.kl.W().shiftVisibleRangeOnNewBar;if(c&&!f){const m=t-o;this.kl.Jn(this.kl.ju()-m)}}this.kl.qu(t)}ta(t){t!==null&&t.N_()}cr(t){const e=this.kc.find(s=>s.$o().includes(t));return e===void 0?null:e}Fu(){this.Bc.Vn(),this.kc.forEach(t=>t.N_()),this.Gl()}S(){this.kc.forEach(t=>t.S()),this.kc.length=0,this.cn.localization.priceFormatter=void 0,this.cn.localization.percentageFormatter=void 0,this.cn.localization.timeFormatter=void 0}_d(){return this.Vc}mr(){return this.Vc.W()}w_(){return this.Tc}ud(t,e,s){const n=this.kc[0],r=this.dd(e,t,n,s);return this.yc.push(r),this.yc.length===1?this.Xl():this.$h(),r}fd(t){const e=this.cr(t),s=this.yc.indexOf(t);qt(s!==-1,"Series not found"),this.yc.splice(s,1),M(e).Yo(t),t.S&&t.S()}Zl(t,e){const s=M(this.cr(t));s.Yo(t);const n=this.$c(e);if(n===null){const r=t.Xi();s.Uo(t,e,r)}else{const r=n.Ht===s?t.Xi():void 0;n.Ht.Uo(t,e,r)}}rc(){const t=ht.ss();t.$n(),this.Ec(t)}vd(t){const e=ht.ss();e.Yn(t),this.Ec(e)}Kn(){const t=ht.ss();t.Kn(),this.Ec(t)}Gn(t){const e=ht.ss();e.Gn(t),this.Ec(e)}Jn(t){const e=ht.ss();e.Jn(t),this.Ec(e)}Zn(t){const e=ht.ss();e.Zn(t),this.Ec(e)}Un(){const t=ht.ss();t.Un(),this.Ec(t)}pd(){return this.cn.rightPriceScale.visible?"right":"left"}md(){return this.Lc}q(){return this.Ic}Bt(t){const e=this.Lc,s=this.Ic;if(e===s)return e;if(t=Math.max(0,Math.min(100,Math.round(100*t))),this.Rc===null||this.Rc.Ts!==s||this.Rc.Ps!==e)this.Rc={Ts:s,Ps:e,bd:new Map};else{const r=this.Rc.bd.get(t);if(r!==void 0)return r}const n=function(r,o,l){const[h,a,c,u]=Oe(r),[f,m,g,p]=Oe(o),_=[xt(h+l*(f-h)),xt(a+l*(m-a)),xt(c+l*(g-c)),io(u+l*(p-u))];return`rgba(${_[0]}, ${_[1]}, ${_[2]}, ${_[3]})`}(s,e,t/100);return this.Rc.bd.set(t,n),n}Kc(t,e){const s=new ht(e);if(t!==null){const n=this.kc.indexOf(t);s.Nn(n,{Fn:e})}return s}Nc(t,e){return e===void 0&&(e=2),this.Kc(this.cr(t),e)}Ec(t){this.Dc&&this.Dc(t),this.kc.forEach(e=>e.W_().Uh().bt())}dd(t,e,s,n){const r=new Xs(this,t,e,s,n),o=t.priceScaleId!==void 0?t.priceScaleId:this.pd();return s.Uo(r,o),Ti(o)||r.Hh(t),r}zc(t){const e=this.cn.layout;return e.background.type==="gradient"?t===0?e.background.topColor:e.background.bottomColor:e.background.color}}function ks(i){return!At(i)&&!Fe(i)}function xo(i){return At(i)}(function(i){i[i.Disabled=0]="Disabled",i[i.Continuous=1]="Continuous",i[i.OnDataUpdate=2]="OnDataUpdate"})(Qn||(Qn={})),function(i){i[i.LastBar=0]="LastBar",i[i.LastVisible=1]="LastVisible"}($s||($s={})),function(i){i.Solid="solid",i.VerticalGradient="gradient"}(Es||(Es={})),function(i){i[i.Year=0]="Year",i[i.Month=1]="Month",i[i.DayOfMonth=2]="DayOfMonth",i[i.Time=3]="Time",i[i.TimeWithSeconds=4]="TimeWithSeconds"}(tr||(tr={}));const er=i=>i.getUTCFullYear();function ac(i,t,e){return t.replace(/yyyy/g,(s=>Wt(er(s),4))(i)).replace(/yy/g,(s=>Wt(er(s)%100,2))(i)).replace(/MMMM/g,((s,n)=>new Date(s.getUTCFullYear(),s.getUTCMonth(),1).toLocaleString(n,{month:"long"}))(i,e)).replace(/MMM/g,((s,n)=>new Date(s.getUTCFullYear(),s.getUTCMonth(),1).toLocaleString(n,{month:"short"}))(i,e)).replace(/MM/g,(s=>Wt((n=>n.getUTCMonth()+1)(s),2))(i)).replace(/dd/g,(s=>Wt((n=>n.getUTCDate())(s),2))(i))}class So{constructor(t="yyyy-MM-dd",e="default"){this.wd=t,this.gd=e}q_(t){return ac(t,this.wd,this.gd)}}class cc{constructor(t){this.Md=t||"%h:%m:%s"}q_(t){return this.Md.replace("%h",Wt(t.getUTCHours(),2)).replace("%m",Wt(t.getUTCMinutes(),2)).replace("%s",Wt(t.getUTCSeconds(),2))}}const uc={xd:"yyyy-MM-dd",Sd:"%h:%m:%s",kd:" ",yd:"default"};class dc{constructor(t={}){const e=Object.assign(Object.assign({},uc),t);this.Cd=new So(e.xd,e.yd),this.Td=new cc(e.Sd),this.Pd=e.kd}q_(t){return`${this.Cd.q_(t)}${this.Pd}${this.Td.q_(t)}`}}function Ze(i){return 60*i*60*1e3}function Zi(i){return 60*i*1e3}const Je=[{Rd:(ir=1,1e3*ir),Dd:10},{Rd:Zi(1),Dd:20},{Rd:Zi(5),Dd:21},{Rd:Zi(30),Dd:22},{Rd:Ze(1),Dd:30},{Rd:Ze(3),Dd:31},{Rd:Ze(6),Dd:32},{Rd:Ze(12),Dd:33}];var ir;function sr(i,t){if(i.getUTCFullYear()!==t.getUTCFullYear())return 70;if(i.getUTCMonth()!==t.getUTCMonth())return 60;if(i.getUTCDate()!==t.getUTCDate())return 50;for(let e=Je.length-1;e>=0;--e)if(Math.floor(t.getTime()/Je[e].Rd)!==Math.floor(i.getTime()/Je[e].Rd))return Je[e].Dd;return 0}function Ji(i){let t=i;if(Fe(i)&&(t=Ks(i)),!ks(t))throw new Error("time must be of type BusinessDay");const e=new Date(Date.UTC(t.year,t.month-1,t.day,0,0,0,0));return{Vd:Math.round(e.getTime()/1e3),Od:t}}function nr(i){if(!xo(i))throw new Error("time must be of type isUTCTimestamp");return{Vd:i}}function Ks(i){const t=new Date(i);if(isNaN(t.getTime()))throw new Error(`Invalid date string=${i}, expected format=yyyy-mm-dd`);return{day:t.getUTCDate(),month:t.getUTCMonth()+1,year:t.getUTCFullYear()}}function rr(i){Fe(i.time)&&(i.time=Ks(i.time))}class or{options(){return this.cn}setOptions(t){this.cn=t,this.updateFormatter(t.localization)}preprocessData(t){Array.isArray(t)?function(e){e.forEach(rr)}(t):rr(t)}createConverterToInternalObj(t){return M(function(e){return e.length===0?null:ks(e[0].time)||Fe(e[0].time)?Ji:nr}(t))}key(t){return typeof t=="object"&&"Vd"in t?t.Vd:this.key(this.convertHorzItemToInternal(t))}cacheKey(t){const e=t;return e.Od===void 0?new Date(1e3*e.Vd).getTime():new Date(Date.UTC(e.Od.year,e.Od.month-1,e.Od.day)).getTime()}convertHorzItemToInternal(t){return xo(e=t)?nr(e):ks(e)?Ji(e):Ji(Ks(e));var e}updateFormatter(t){if(!this.cn)return;const e=t.dateFormat;this.cn.timeScale.timeVisible?this.Bd=new dc({xd:e,Sd:this.cn.timeScale.secondsVisible?"%h:%m:%s":"%h:%m",kd:"   ",yd:t.locale}):this.Bd=new So(e,t.locale)}formatHorzItem(t){const e=t;return this.Bd.q_(new Date(1e3*e.Vd))}formatTickmark(t,e){const s=function(r,o,l){switch(r){case 0:case 10:return o?l?4:3:2;case 20:case 21:case 22:case 30:case 31:case 32:case 33:return o?3:2;case 50:return 2;case 60:return 1;case 70:return 0}}(t.weight,this.cn.timeScale.timeVisible,this.cn.timeScale.secondsVisible),n=this.cn.timeScale;if(n.tickMarkFormatter!==void 0){const r=n.tickMarkFormatter(t.originalTime,s,e.locale);if(r!==null)return r}return function(r,o,l){const h={};switch(o){case 0:h.year="numeric";break;case 1:h.month="short";break;case 2:h.day="numeric";break;case 3:h.hour12=!1,h.hour="2-digit",h.minute="2-digit";break;case 4:h.hour12=!1,h.hour="2-digit",h.minute="2-digit",h.second="2-digit"}const a=r.Od===void 0?new Date(1e3*r.Vd):new Date(Date.UTC(r.Od.year,r.Od.month-1,r.Od.day));return new Date(a.getUTCFullYear(),a.getUTCMonth(),a.getUTCDate(),a.getUTCHours(),a.getUTCMinutes(),a.getUTCSeconds(),a.getUTCMilliseconds()).toLocaleString(l,h)}(t.time,s,e.locale)}maxTickMarkWeight(t){let e=t.reduce(ic,t[0]).weight;return e>30&&e<50&&(e=30),e}fillWeightsForPoints(t,e){(function(s,n=0){if(s.length===0)return;let r=n===0?null:s[n-1].time.Vd,o=r!==null?new Date(1e3*r):null,l=0;for(let h=n;h<s.length;++h){const a=s[h],c=new Date(1e3*a.time.Vd);o!==null&&(a.timeWeight=sr(c,o)),l+=a.time.Vd-(r||a.time.Vd),r=a.time.Vd,o=c}if(n===0&&s.length>1){const h=Math.ceil(l/(s.length-1)),a=new Date(1e3*(s[0].time.Vd-h));s[0].timeWeight=sr(new Date(1e3*s[0].time.Vd),a)}})(t,e)}static Ad(t){return Pt({localization:{dateFormat:"dd MMM 'yy"}},t??{})}}const we=typeof window<"u";function lr(){return!!we&&window.navigator.userAgent.toLowerCase().indexOf("firefox")>-1}function Qi(){return!!we&&/iPhone|iPad|iPod/.test(window.navigator.platform)}function Ls(i){return i+i%2}function ts(i,t){return i.Id-t.Id}function es(i,t,e){const s=(i.Id-t.Id)/(i.ot-t.ot);return Math.sign(s)*Math.min(Math.abs(s),e)}class fc{constructor(t,e,s,n){this.zd=null,this.Ld=null,this.Ed=null,this.Nd=null,this.Fd=null,this.Wd=0,this.jd=0,this.Hd=t,this.$d=e,this.Ud=s,this.rs=n}qd(t,e){if(this.zd!==null){if(this.zd.ot===e)return void(this.zd.Id=t);if(Math.abs(this.zd.Id-t)<this.rs)return}this.Nd=this.Ed,this.Ed=this.Ld,this.Ld=this.zd,this.zd={ot:e,Id:t}}Dr(t,e){if(this.zd===null||this.Ld===null||e-this.zd.ot>50)return;let s=0;const n=es(this.zd,this.Ld,this.$d),r=ts(this.zd,this.Ld),o=[n],l=[r];if(s+=r,this.Ed!==null){const a=es(this.Ld,this.Ed,this.$d);if(Math.sign(a)===Math.sign(n)){const c=ts(this.Ld,this.Ed);if(o.push(a),l.push(c),s+=c,this.Nd!==null){const u=es(this.Ed,this.Nd,this.$d);if(Math.sign(u)===Math.sign(n)){const f=ts(this.Ed,this.Nd);o.push(u),l.push(f),s+=f}}}}let h=0;for(let a=0;a<o.length;++a)h+=l[a]/s*o[a];Math.abs(h)<this.Hd||(this.Fd={Id:t,ot:e},this.jd=h,this.Wd=function(a,c){const u=Math.log(c);return Math.log(1*u/-a)/u}(Math.abs(h),this.Ud))}Qu(t){const e=M(this.Fd),s=t-e.ot;return e.Id+this.jd*(Math.pow(this.Ud,s)-1)/Math.log(this.Ud)}Ju(t){return this.Fd===null||this.Yd(t)===this.Wd}Yd(t){const e=t-M(this.Fd).ot;return Math.min(e,this.Wd)}}class gc{constructor(t,e){this.Zd=void 0,this.Xd=void 0,this.Kd=void 0,this.en=!1,this.Gd=t,this.Jd=e,this.Qd()}bt(){this.Qd()}tf(){this.Zd&&this.Gd.removeChild(this.Zd),this.Xd&&this.Gd.removeChild(this.Xd),this.Zd=void 0,this.Xd=void 0}if(){return this.en!==this.nf()||this.Kd!==this.sf()}sf(){return so(Oe(this.Jd.W().layout.textColor))>160?"dark":"light"}nf(){return this.Jd.W().layout.attributionLogo}ef(){const t=new URL(location.href);return t.hostname?"&utm_source="+t.hostname+t.pathname:""}Qd(){this.if()&&(this.tf(),this.en=this.nf(),this.en&&(this.Kd=this.sf(),this.Xd=document.createElement("style"),this.Xd.innerText="a#tv-attr-logo{--fill:#131722;--stroke:#fff;position:absolute;left:10px;bottom:10px;height:19px;width:35px;margin:0;padding:0;border:0;z-index:3;}a#tv-attr-logo[data-dark]{--fill:#D1D4DC;--stroke:#131722;}",this.Zd=document.createElement("a"),this.Zd.href=`https://www.tradingview.com/?utm_medium=lwc-link&utm_campaign=lwc-chart${this.ef()}`,this.Zd.title="Charting by TradingView",this.Zd.id="tv-attr-logo",this.Zd.target="_blank",this.Zd.innerHTML='<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 35 19" width="35" height="19" fill="none"><g fill-rule="evenodd" clip-path="url(#a)" clip-rule="evenodd"><path fill="var(--stroke)" d="M2 0H0v10h6v9h21.4l.5-1.3 6-15 1-2.7H23.7l-.5 1.3-.2.6a5 5 0 0 0-7-.9V0H2Zm20 17h4l5.2-13 .8-2h-7l-1 2.5-.2.5-1.5 3.8-.3.7V17Zm-.8-10a3 3 0 0 0 .7-2.7A3 3 0 1 0 16.8 7h4.4ZM14 7V2H2v6h6v9h4V7h2Z"/><path fill="var(--fill)" d="M14 2H2v6h6v9h6V2Zm12 15h-7l6-15h7l-6 15Zm-7-9a3 3 0 1 0 0-6 3 3 0 0 0 0 6Z"/></g><defs><clipPath id="a"><path fill="var(--stroke)" d="M0 0h35v19H0z"/></clipPath></defs></svg>',this.Zd.toggleAttribute("data-dark",this.Kd==="dark"),this.Gd.appendChild(this.Xd),this.Gd.appendChild(this.Zd)))}}function ne(i,t){const e=M(i.ownerDocument).createElement("canvas");i.appendChild(e);const s=Ch(e,{type:"device-pixel-content-box",options:{allowResizeObserver:!1},transform:(n,r)=>({width:Math.max(n.width,r.width),height:Math.max(n.height,r.height)})});return s.resizeCanvasElement(t),s}function re(i){var t;i.width=1,i.height=1,(t=i.getContext("2d"))===null||t===void 0||t.clearRect(0,0,1,1)}function Ts(i,t,e,s){i.wl&&i.wl(t,e,s)}function ai(i,t,e,s){i.X(t,e,s)}function Ps(i,t,e,s){const n=i(e,s);for(const r of n){const o=r.gt();o!==null&&t(o)}}function mc(i){we&&window.chrome!==void 0&&i.addEventListener("mousedown",t=>{if(t.button===1)return t.preventDefault(),!1})}class qs{constructor(t,e,s){this.rf=0,this.hf=null,this.lf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY},this.af=0,this._f=null,this.uf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY},this.cf=null,this.df=!1,this.ff=null,this.vf=null,this.pf=!1,this.mf=!1,this.bf=!1,this.wf=null,this.gf=null,this.Mf=null,this.xf=null,this.Sf=null,this.kf=null,this.yf=null,this.Cf=0,this.Tf=!1,this.Pf=!1,this.Rf=!1,this.Df=0,this.Vf=null,this.Of=!Qi(),this.Bf=n=>{this.Af(n)},this.If=n=>{if(this.zf(n)){const r=this.Lf(n);if(++this.af,this._f&&this.af>1){const{Ef:o}=this.Nf(Dt(n),this.uf);o<30&&!this.bf&&this.Ff(r,this.jf.Wf),this.Hf()}}else{const r=this.Lf(n);if(++this.rf,this.hf&&this.rf>1){const{Ef:o}=this.Nf(Dt(n),this.lf);o<5&&!this.mf&&this.$f(r,this.jf.Uf),this.qf()}}},this.Yf=t,this.jf=e,this.cn=s,this.Zf()}S(){this.wf!==null&&(this.wf(),this.wf=null),this.gf!==null&&(this.gf(),this.gf=null),this.xf!==null&&(this.xf(),this.xf=null),this.Sf!==null&&(this.Sf(),this.Sf=null),this.kf!==null&&(this.kf(),this.kf=null),this.Mf!==null&&(this.Mf(),this.Mf=null),this.Xf(),this.qf()}Kf(t){this.xf&&this.xf();const e=this.Gf.bind(this);if(this.xf=()=>{this.Yf.removeEventListener("mousemove",e)},this.Yf.addEventListener("mousemove",e),this.zf(t))return;const s=this.Lf(t);this.$f(s,this.jf.Jf),this.Of=!0}qf(){this.hf!==null&&clearTimeout(this.hf),this.rf=0,this.hf=null,this.lf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY}}Hf(){this._f!==null&&clearTimeout(this._f),this.af=0,this._f=null,this.uf={nt:Number.NEGATIVE_INFINITY,st:Number.POSITIVE_INFINITY}}Gf(t){if(this.Rf||this.vf!==null||this.zf(t))return;const e=this.Lf(t);this.$f(e,this.jf.Qf),this.Of=!0}tv(t){const e=is(t.changedTouches,M(this.Vf));if(e===null||(this.Df=Qe(t),this.yf!==null)||this.Pf)return;this.Tf=!0;const s=this.Nf(Dt(e),M(this.vf)),{iv:n,nv:r,Ef:o}=s;if(this.pf||!(o<5)){if(!this.pf){const l=.5*n,h=r>=l&&!this.cn.sv(),a=l>r&&!this.cn.ev();h||a||(this.Pf=!0),this.pf=!0,this.bf=!0,this.Xf(),this.Hf()}if(!this.Pf){const l=this.Lf(t,e);this.Ff(l,this.jf.rv),ae(t)}}}hv(t){if(t.button!==0)return;const e=this.Nf(Dt(t),M(this.ff)),{Ef:s}=e;if(s>=5&&(this.mf=!0,this.qf()),this.mf){const n=this.Lf(t);this.$f(n,this.jf.lv)}}Nf(t,e){const s=Math.abs(e.nt-t.nt),n=Math.abs(e.st-t.st);return{iv:s,nv:n,Ef:s+n}}av(t){let e=is(t.changedTouches,M(this.Vf));if(e===null&&t.touches.length===0&&(e=t.changedTouches[0]),e===null)return;this.Vf=null,this.Df=Qe(t),this.Xf(),this.vf=null,this.kf&&(this.kf(),this.kf=null);const s=this.Lf(t,e);if(this.Ff(s,this.jf.ov),++this.af,this._f&&this.af>1){const{Ef:n}=this.Nf(Dt(e),this.uf);n<30&&!this.bf&&this.Ff(s,this.jf.Wf),this.Hf()}else this.bf||(this.Ff(s,this.jf._v),this.jf._v&&ae(t));this.af===0&&ae(t),t.touches.length===0&&this.df&&(this.df=!1,ae(t))}Af(t){if(t.button!==0)return;const e=this.Lf(t);if(this.ff=null,this.Rf=!1,this.Sf&&(this.Sf(),this.Sf=null),lr()&&this.Yf.ownerDocument.documentElement.removeEventListener("mouseleave",this.Bf),!this.zf(t))if(this.$f(e,this.jf.uv),++this.rf,this.hf&&this.rf>1){const{Ef:s}=this.Nf(Dt(t),this.lf);s<5&&!this.mf&&this.$f(e,this.jf.Uf),this.qf()}else this.mf||this.$f(e,this.jf.cv)}Xf(){this.cf!==null&&(clearTimeout(this.cf),this.cf=null)}dv(t){if(this.Vf!==null)return;const e=t.changedTouches[0];this.Vf=e.identifier,this.Df=Qe(t);const s=this.Yf.ownerDocument.documentElement;this.bf=!1,this.pf=!1,this.Pf=!1,this.vf=Dt(e),this.kf&&(this.kf(),this.kf=null);{const r=this.tv.bind(this),o=this.av.bind(this);this.kf=()=>{s.removeEventListener("touchmove",r),s.removeEventListener("touchend",o)},s.addEventListener("touchmove",r,{passive:!1}),s.addEventListener("touchend",o,{passive:!1}),this.Xf(),this.cf=setTimeout(this.fv.bind(this,t),240)}const n=this.Lf(t,e);this.Ff(n,this.jf.vv),this._f||(this.af=0,this._f=setTimeout(this.Hf.bind(this),500),this.uf=Dt(e))}pv(t){if(t.button!==0)return;const e=this.Yf.ownerDocument.documentElement;lr()&&e.addEventListener("mouseleave",this.Bf),this.mf=!1,this.ff=Dt(t),this.Sf&&(this.Sf(),this.Sf=null);{const n=this.hv.bind(this),r=this.Af.bind(this);this.Sf=()=>{e.removeEventListener("mousemove",n),e.removeEventListener("mouseup",r)},e.addEventListener("mousemove",n),e.addEventListener("mouseup",r)}if(this.Rf=!0,this.zf(t))return;const s=this.Lf(t);this.$f(s,this.jf.mv),this.hf||(this.rf=0,this.hf=setTimeout(this.qf.bind(this),500),this.lf=Dt(t))}Zf(){this.Yf.addEventListener("mouseenter",this.Kf.bind(this)),this.Yf.addEventListener("touchcancel",this.Xf.bind(this));{const t=this.Yf.ownerDocument,e=s=>{this.jf.bv&&(s.composed&&this.Yf.contains(s.composedPath()[0])||s.target&&this.Yf.contains(s.target)||this.jf.bv())};this.gf=()=>{t.removeEventListener("touchstart",e)},this.wf=()=>{t.removeEventListener("mousedown",e)},t.addEventListener("mousedown",e),t.addEventListener("touchstart",e,{passive:!0})}Qi()&&(this.Mf=()=>{this.Yf.removeEventListener("dblclick",this.If)},this.Yf.addEventListener("dblclick",this.If)),this.Yf.addEventListener("mouseleave",this.wv.bind(this)),this.Yf.addEventListener("touchstart",this.dv.bind(this),{passive:!0}),mc(this.Yf),this.Yf.addEventListener("mousedown",this.pv.bind(this)),this.gv(),this.Yf.addEventListener("touchmove",()=>{},{passive:!1})}gv(){this.jf.Mv===void 0&&this.jf.xv===void 0&&this.jf.Sv===void 0||(this.Yf.addEventListener("touchstart",t=>this.kv(t.touches),{passive:!0}),this.Yf.addEventListener("touchmove",t=>{if(t.touches.length===2&&this.yf!==null&&this.jf.xv!==void 0){const e=hr(t.touches[0],t.touches[1])/this.Cf;this.jf.xv(this.yf,e),ae(t)}},{passive:!1}),this.Yf.addEventListener("touchend",t=>{this.kv(t.touches)}))}kv(t){t.length===1&&(this.Tf=!1),t.length!==2||this.Tf||this.df?this.yv():this.Cv(t)}Cv(t){const e=this.Yf.getBoundingClientRect()||{left:0,top:0};this.yf={nt:(t[0].clientX-e.left+(t[1].clientX-e.left))/2,st:(t[0].clientY-e.top+(t[1].clientY-e.top))/2},this.Cf=hr(t[0],t[1]),this.jf.Mv!==void 0&&this.jf.Mv(),this.Xf()}yv(){this.yf!==null&&(this.yf=null,this.jf.Sv!==void 0&&this.jf.Sv())}wv(t){if(this.xf&&this.xf(),this.zf(t)||!this.Of)return;const e=this.Lf(t);this.$f(e,this.jf.Tv),this.Of=!Qi()}fv(t){const e=is(t.touches,M(this.Vf));if(e===null)return;const s=this.Lf(t,e);this.Ff(s,this.jf.Pv),this.bf=!0,this.df=!0}zf(t){return t.sourceCapabilities&&t.sourceCapabilities.firesTouchEvents!==void 0?t.sourceCapabilities.firesTouchEvents:Qe(t)<this.Df+500}Ff(t,e){e&&e.call(this.jf,t)}$f(t,e){e&&e.call(this.jf,t)}Lf(t,e){const s=e||t,n=this.Yf.getBoundingClientRect()||{left:0,top:0};return{clientX:s.clientX,clientY:s.clientY,pageX:s.pageX,pageY:s.pageY,screenX:s.screenX,screenY:s.screenY,localX:s.clientX-n.left,localY:s.clientY-n.top,ctrlKey:t.ctrlKey,altKey:t.altKey,shiftKey:t.shiftKey,metaKey:t.metaKey,Rv:!t.type.startsWith("mouse")&&t.type!=="contextmenu"&&t.type!=="click",Dv:t.type,Vv:s.target,Ov:t.view,Bv:()=>{t.type!=="touchstart"&&ae(t)}}}}function hr(i,t){const e=i.clientX-t.clientX,s=i.clientY-t.clientY;return Math.sqrt(e*e+s*s)}function ae(i){i.cancelable&&i.preventDefault()}function Dt(i){return{nt:i.pageX,st:i.pageY}}function Qe(i){return i.timeStamp||performance.now()}function is(i,t){for(let e=0;e<i.length;++e)if(i[e].identifier===t)return i[e];return null}function ti(i){return{jc:i.jc,Av:{wr:i.Iv.externalId},zv:i.Iv.cursorStyle}}function pc(i,t,e){for(const s of i){const n=s.gt();if(n!==null&&n.br){const r=n.br(t,e);if(r!==null)return{Ov:s,Av:r}}}return null}function ss(i,t){return e=>{var s,n,r,o;return((n=(s=e.Dt())===null||s===void 0?void 0:s.Ta())!==null&&n!==void 0?n:"")!==t?[]:(o=(r=e.ca)===null||r===void 0?void 0:r.call(e,i))!==null&&o!==void 0?o:[]}}function ar(i,t,e,s){if(!i.length)return;let n=0;const r=e/2,o=i[0].At(s,!0);let l=t===1?r-(i[0].Vi()-o/2):i[0].Vi()-o/2-r;l=Math.max(0,l);for(let h=1;h<i.length;h++){const a=i[h],c=i[h-1],u=c.At(s,!1),f=a.Vi(),m=c.Vi();if(t===1?f>m-u:f<m+u){const g=m-u*t;a.Oi(g);const p=g-t*u/2;if((t===1?p<0:p>e)&&l>0){const _=t===1?-1-p:p-e,w=Math.min(_,l);for(let x=n;x<i.length;x++)i[x].Oi(i[x].Vi()+t*w);l-=w}}else n=h,l=t===1?m-u-f:f-(m+u)}}class cr{constructor(t,e,s,n){this.Li=null,this.Lv=null,this.Ev=!1,this.Nv=new We(200),this.Jr=null,this.Fv=0,this.Wv=!1,this.jv=()=>{this.Wv||this.tn.Hv().$t().$h()},this.$v=()=>{this.Wv||this.tn.Hv().$t().$h()},this.tn=t,this.cn=e,this.So=e.layout,this.Vc=s,this.Uv=n==="left",this.qv=ss("normal",n),this.Yv=ss("top",n),this.Zv=ss("bottom",n),this.Xv=document.createElement("div"),this.Xv.style.height="100%",this.Xv.style.overflow="hidden",this.Xv.style.width="25px",this.Xv.style.left="0",this.Xv.style.position="relative",this.Kv=ne(this.Xv,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const r=this.Kv.canvasElement;r.style.position="absolute",r.style.zIndex="1",r.style.left="0",r.style.top="0",this.Gv=ne(this.Xv,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const o=this.Gv.canvasElement;o.style.position="absolute",o.style.zIndex="2",o.style.left="0",o.style.top="0";const l={mv:this.Jv.bind(this),vv:this.Jv.bind(this),lv:this.Qv.bind(this),rv:this.Qv.bind(this),bv:this.tp.bind(this),uv:this.ip.bind(this),ov:this.ip.bind(this),Uf:this.np.bind(this),Wf:this.np.bind(this),Jf:this.sp.bind(this),Tv:this.ep.bind(this)};this.rp=new qs(this.Gv.canvasElement,l,{sv:()=>!this.cn.handleScroll.vertTouchDrag,ev:()=>!0})}S(){this.rp.S(),this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose(),this.Li!==null&&this.Li.Xo().p(this),this.Li=null}hp(){return this.Xv}P(){return this.So.fontSize}lp(){const t=this.Vc.W();return this.Jr!==t.R&&(this.Nv.ir(),this.Jr=t.R),t}ap(){if(this.Li===null)return 0;let t=0;const e=this.lp(),s=M(this.Kv.canvasElement.getContext("2d"));s.save();const n=this.Li.ja();s.font=this.op(),n.length>0&&(t=Math.max(this.Nv.xi(s,n[0].no),this.Nv.xi(s,n[n.length-1].no)));const r=this._p();for(let h=r.length;h--;){const a=this.Nv.xi(s,r[h].Kt());a>t&&(t=a)}const o=this.Li.Ct();if(o!==null&&this.Lv!==null){const h=this.Li.pn(1,o),a=this.Li.pn(this.Lv.height-2,o);t=Math.max(t,this.Nv.xi(s,this.Li.Fi(Math.floor(Math.min(h,a))+.11111111111111,o)),this.Nv.xi(s,this.Li.Fi(Math.ceil(Math.max(h,a))-.11111111111111,o)))}s.restore();const l=t||34;return Ls(Math.ceil(e.C+e.T+e.A+e.I+5+l))}up(t){this.Lv!==null&&te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`)}cp(){return M(this.Lv).width}Gi(t){this.Li!==t&&(this.Li!==null&&this.Li.Xo().p(this),this.Li=t,t.Xo().l(this.do.bind(this),this))}Dt(){return this.Li}ir(){const t=this.tn.dp();this.tn.Hv().$t().L_(t,M(this.Dt()))}fp(t){if(this.Lv===null)return;if(t!==1){this.vp(),this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n),this.Ae(n)}),this.tn.mp(s,this.Zv),this.bp(s),this.tn.mp(s,this.qv),this.wp(s))}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.gp(e),this.tn.mp(e,this.Yv))}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}bt(){var t;(t=this.Li)===null||t===void 0||t.ja()}Jv(t){if(this.Li===null||this.Li.Ni()||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp();this.Ev=!0,e.D_(s,this.Li,t.localY)}Qv(t){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp(),n=this.Li;e.V_(s,n,t.localY)}tp(){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const t=this.tn.Hv().$t(),e=this.tn.dp(),s=this.Li;this.Ev&&(this.Ev=!1,t.O_(e,s))}ip(t){if(this.Li===null||!this.cn.handleScale.axisPressedMouseMove.price)return;const e=this.tn.Hv().$t(),s=this.tn.dp();this.Ev=!1,e.O_(s,this.Li)}np(t){this.cn.handleScale.axisDoubleClickReset.price&&this.ir()}sp(t){this.Li!==null&&(!this.tn.Hv().$t().W().handleScale.axisPressedMouseMove.price||this.Li.gh()||this.Li.Vo()||this.Sp(1))}ep(t){this.Sp(0)}_p(){const t=[],e=this.Li===null?void 0:this.Li;return(s=>{for(let n=0;n<s.length;++n){const r=s[n].Rn(this.tn.dp(),e);for(let o=0;o<r.length;o++)t.push(r[o])}})(this.tn.dp().$o()),t}pp({context:t,bitmapSize:e}){const{width:s,height:n}=e,r=this.tn.dp().$t(),o=r.q(),l=r.md();o===l?ki(t,0,0,s,n,o):no(t,0,0,s,n,o,l)}Ae({context:t,bitmapSize:e,horizontalPixelRatio:s}){if(this.Lv===null||this.Li===null||!this.Li.W().borderVisible)return;t.fillStyle=this.Li.W().borderColor;const n=Math.max(1,Math.floor(this.lp().C*s));let r;r=this.Uv?e.width-n:0,t.fillRect(r,0,n,e.height)}bp(t){if(this.Lv===null||this.Li===null)return;const e=this.Li.ja(),s=this.Li.W(),n=this.lp(),r=this.Uv?this.Lv.width-n.T:0;s.borderVisible&&s.ticksVisible&&t.useBitmapCoordinateSpace(({context:o,horizontalPixelRatio:l,verticalPixelRatio:h})=>{o.fillStyle=s.borderColor;const a=Math.max(1,Math.floor(h)),c=Math.floor(.5*h),u=Math.round(n.T*l);o.beginPath();for(const f of e)o.rect(Math.floor(r*l),Math.round(f.La*h)-c,u,a);o.fill()}),t.useMediaCoordinateSpace(({context:o})=>{var l;o.font=this.op(),o.fillStyle=(l=s.textColor)!==null&&l!==void 0?l:this.So.textColor,o.textAlign=this.Uv?"right":"left",o.textBaseline="middle";const h=this.Uv?Math.round(r-n.A):Math.round(r+n.T+n.A),a=e.map(c=>this.Nv.Mi(o,c.no));for(let c=e.length;c--;){const u=e[c];o.fillText(u.no,h,u.La+a[c])}})}vp(){if(this.Lv===null||this.Li===null)return;const t=[],e=this.Li.$o().slice(),s=this.tn.dp(),n=this.lp();this.Li===s.vr()&&this.tn.dp().$o().forEach(o=>{s.dr(o)&&e.push(o)});const r=this.Li;e.forEach(o=>{o.Rn(s,r).forEach(l=>{l.Oi(null),l.Bi()&&t.push(l)})}),t.forEach(o=>o.Oi(o.ki())),this.Li.W().alignLabels&&this.kp(t,n)}kp(t,e){if(this.Lv===null)return;const s=this.Lv.height/2,n=t.filter(o=>o.ki()<=s),r=t.filter(o=>o.ki()>s);n.sort((o,l)=>l.ki()-o.ki()),r.sort((o,l)=>o.ki()-l.ki());for(const o of t){const l=Math.floor(o.At(e)/2),h=o.ki();h>-l&&h<l&&o.Oi(l),h>this.Lv.height-l&&h<this.Lv.height+l&&o.Oi(this.Lv.height-l)}ar(n,1,this.Lv.height,e),ar(r,-1,this.Lv.height,e)}wp(t){if(this.Lv===null)return;const e=this._p(),s=this.lp(),n=this.Uv?"right":"left";e.forEach(r=>{r.Ai()&&r.gt(M(this.Li)).X(t,s,this.Nv,n)})}gp(t){if(this.Lv===null||this.Li===null)return;const e=this.tn.Hv().$t(),s=[],n=this.tn.dp(),r=e.Yc().Rn(n,this.Li);r.length&&s.push(r);const o=this.lp(),l=this.Uv?"right":"left";s.forEach(h=>{h.forEach(a=>{a.gt(M(this.Li)).X(t,o,this.Nv,l)})})}Sp(t){this.Xv.style.cursor=t===1?"ns-resize":"default"}do(){const t=this.ap();this.Fv<t&&this.tn.Hv().$t().Xl(),this.Fv=t}op(){return be(this.So.fontSize,this.So.fontFamily)}}function vc(i,t){var e,s;return(s=(e=i._a)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function ei(i,t){var e,s;return(s=(e=i.Pn)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function _c(i,t){var e,s;return(s=(e=i.Ji)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}function bc(i,t){var e,s;return(s=(e=i.la)===null||e===void 0?void 0:e.call(i,t))!==null&&s!==void 0?s:[]}class Gs{constructor(t,e){this.Lv=J({width:0,height:0}),this.yp=null,this.Cp=null,this.Tp=null,this.Pp=null,this.Rp=!1,this.Dp=new st,this.Vp=new st,this.Op=0,this.Bp=!1,this.Ap=null,this.Ip=!1,this.zp=null,this.Lp=null,this.Wv=!1,this.jv=()=>{this.Wv||this.Ep===null||this.$i().$h()},this.$v=()=>{this.Wv||this.Ep===null||this.$i().$h()},this.Jd=t,this.Ep=e,this.Ep.F_().l(this.Np.bind(this),this,!0),this.Fp=document.createElement("td"),this.Fp.style.padding="0",this.Fp.style.position="relative";const s=document.createElement("div");s.style.width="100%",s.style.height="100%",s.style.position="relative",s.style.overflow="hidden",this.Wp=document.createElement("td"),this.Wp.style.padding="0",this.jp=document.createElement("td"),this.jp.style.padding="0",this.Fp.appendChild(s),this.Kv=ne(s,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const n=this.Kv.canvasElement;n.style.position="absolute",n.style.zIndex="1",n.style.left="0",n.style.top="0",this.Gv=ne(s,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const r=this.Gv.canvasElement;r.style.position="absolute",r.style.zIndex="2",r.style.left="0",r.style.top="0",this.Hp=document.createElement("tr"),this.Hp.appendChild(this.Wp),this.Hp.appendChild(this.Fp),this.Hp.appendChild(this.jp),this.$p(),this.rp=new qs(this.Gv.canvasElement,this,{sv:()=>this.Ap===null&&!this.Jd.W().handleScroll.vertTouchDrag,ev:()=>this.Ap===null&&!this.Jd.W().handleScroll.horzTouchDrag})}S(){this.yp!==null&&this.yp.S(),this.Cp!==null&&this.Cp.S(),this.Tp=null,this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose(),this.Ep!==null&&this.Ep.F_().p(this),this.rp.S()}dp(){return M(this.Ep)}Up(t){var e,s;this.Ep!==null&&this.Ep.F_().p(this),this.Ep=t,this.Ep!==null&&this.Ep.F_().l(Gs.prototype.Np.bind(this),this,!0),this.$p(),this.Jd.qp().indexOf(this)===this.Jd.qp().length-1?(this.Tp=(e=this.Tp)!==null&&e!==void 0?e:new gc(this.Fp,this.Jd),this.Tp.bt()):((s=this.Tp)===null||s===void 0||s.tf(),this.Tp=null)}Hv(){return this.Jd}hp(){return this.Hp}$p(){if(this.Ep!==null&&(this.Yp(),this.$i().wt().length!==0)){if(this.yp!==null){const t=this.Ep.P_();this.yp.Gi(M(t))}if(this.Cp!==null){const t=this.Ep.R_();this.Cp.Gi(M(t))}}}Zp(){this.yp!==null&&this.yp.bt(),this.Cp!==null&&this.Cp.bt()}g_(){return this.Ep!==null?this.Ep.g_():0}M_(t){this.Ep&&this.Ep.M_(t)}Jf(t){if(!this.Ep)return;this.Xp();const e=t.localX,s=t.localY;this.Kp(e,s,t)}mv(t){this.Xp(),this.Gp(),this.Kp(t.localX,t.localY,t)}Qf(t){var e;if(!this.Ep)return;this.Xp();const s=t.localX,n=t.localY;this.Kp(s,n,t);const r=this.br(s,n);this.Jd.Jp((e=r?.zv)!==null&&e!==void 0?e:null),this.$i().Wc(r&&{jc:r.jc,Av:r.Av})}cv(t){this.Ep!==null&&(this.Xp(),this.Qp(t))}Uf(t){this.Ep!==null&&this.tm(this.Vp,t)}Wf(t){this.Uf(t)}lv(t){this.Xp(),this.im(t),this.Kp(t.localX,t.localY,t)}uv(t){this.Ep!==null&&(this.Xp(),this.Bp=!1,this.nm(t))}_v(t){this.Ep!==null&&this.Qp(t)}Pv(t){if(this.Bp=!0,this.Ap===null){const e={x:t.localX,y:t.localY};this.sm(e,e,t)}}Tv(t){this.Ep!==null&&(this.Xp(),this.Ep.$t().Wc(null),this.rm())}hm(){return this.Dp}lm(){return this.Vp}Mv(){this.Op=1,this.$i().Un()}xv(t,e){if(!this.Jd.W().handleScale.pinch)return;const s=5*(e-this.Op);this.Op=e,this.$i().Jc(t.nt,s)}vv(t){this.Bp=!1,this.Ip=this.Ap!==null,this.Gp();const e=this.$i().Yc();this.Ap!==null&&e.yt()&&(this.zp={x:e.Yt(),y:e.Zt()},this.Ap={x:t.localX,y:t.localY})}rv(t){if(this.Ep===null)return;const e=t.localX,s=t.localY;if(this.Ap===null)this.im(t);else{this.Ip=!1;const n=M(this.zp),r=n.x+(e-this.Ap.x),o=n.y+(s-this.Ap.y);this.Kp(r,o,t)}}ov(t){this.Hv().W().trackingMode.exitMode===0&&(this.Ip=!0),this.am(),this.nm(t)}br(t,e){const s=this.Ep;return s===null?null:function(n,r,o){const l=n.$o(),h=function(a,c,u){var f,m;let g,p;for(const x of a){const $=(m=(f=x.fa)===null||f===void 0?void 0:f.call(x,c,u))!==null&&m!==void 0?m:[];for(const E of $)_=E.zOrder,(!(w=g?.zOrder)||_==="top"&&w!=="top"||_==="normal"&&w==="bottom")&&(g=E,p=x)}var _,w;return g&&p?{Iv:g,jc:p}:null}(l,r,o);if(h?.Iv.zOrder==="top")return ti(h);for(const a of l){if(h&&h.jc===a&&h.Iv.zOrder!=="bottom"&&!h.Iv.isBackground)return ti(h);const c=pc(a.Pn(n),r,o);if(c!==null)return{jc:a,Ov:c.Ov,Av:c.Av};if(h&&h.jc===a&&h.Iv.zOrder!=="bottom"&&h.Iv.isBackground)return ti(h)}return h?.Iv?ti(h):null}(s,t,e)}om(t,e){M(e==="left"?this.yp:this.Cp).up(J({width:t,height:this.Lv.height}))}_m(){return this.Lv}up(t){te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Fp.style.width=t.width+"px",this.Fp.style.height=t.height+"px")}um(){const t=M(this.Ep);t.T_(t.P_()),t.T_(t.R_());for(const e of t.Oa())if(t.dr(e)){const s=e.Dt();s!==null&&t.T_(s),e.Vn()}}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}fp(t){if(t===0||this.Ep===null)return;if(t>1&&this.um(),this.yp!==null&&this.yp.fp(t),this.Cp!==null&&this.Cp.fp(t),t!==1){this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n)}),this.Ep&&(this.dm(s,vc),this.fm(s),this.vm(s),this.dm(s,ei),this.dm(s,_c)))}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.pm(e),this.dm(e,bc))}bm(){return this.yp}wm(){return this.Cp}mp(t,e){this.dm(t,e)}Np(){this.Ep!==null&&this.Ep.F_().p(this),this.Ep=null}Qp(t){this.tm(this.Dp,t)}tm(t,e){const s=e.localX,n=e.localY;t.M()&&t.m(this.$i().St().Eu(s),{x:s,y:n},e)}pp({context:t,bitmapSize:e}){const{width:s,height:n}=e,r=this.$i(),o=r.q(),l=r.md();o===l?ki(t,0,0,s,n,l):no(t,0,0,s,n,o,l)}fm(t){const e=M(this.Ep).W_().Uh().gt();e!==null&&e.X(t,!1)}vm(t){const e=this.$i().qc();this.gm(t,ei,Ts,e),this.gm(t,ei,ai,e)}pm(t){this.gm(t,ei,ai,this.$i().Yc())}dm(t,e){const s=M(this.Ep).$o();for(const n of s)this.gm(t,e,Ts,n);for(const n of s)this.gm(t,e,ai,n)}gm(t,e,s,n){const r=M(this.Ep),o=r.$t().Fc(),l=o!==null&&o.jc===n,h=o!==null&&l&&o.Av!==void 0?o.Av.gr:void 0;Ps(e,a=>s(a,t,l,h),n,r)}Yp(){if(this.Ep===null)return;const t=this.Jd,e=this.Ep.P_().W().visible,s=this.Ep.R_().W().visible;e||this.yp===null||(this.Wp.removeChild(this.yp.hp()),this.yp.S(),this.yp=null),s||this.Cp===null||(this.jp.removeChild(this.Cp.hp()),this.Cp.S(),this.Cp=null);const n=t.$t()._d();e&&this.yp===null&&(this.yp=new cr(this,t.W(),n,"left"),this.Wp.appendChild(this.yp.hp())),s&&this.Cp===null&&(this.Cp=new cr(this,t.W(),n,"right"),this.jp.appendChild(this.Cp.hp()))}Mm(t){return t.Rv&&this.Bp||this.Ap!==null}xm(t){return Math.max(0,Math.min(t,this.Lv.width-1))}Sm(t){return Math.max(0,Math.min(t,this.Lv.height-1))}Kp(t,e,s){this.$i().hd(this.xm(t),this.Sm(e),s,M(this.Ep))}rm(){this.$i().ad()}am(){this.Ip&&(this.Ap=null,this.rm())}sm(t,e,s){this.Ap=t,this.Ip=!1,this.Kp(e.x,e.y,s);const n=this.$i().Yc();this.zp={x:n.Yt(),y:n.Zt()}}$i(){return this.Jd.$t()}nm(t){if(!this.Rp)return;const e=this.$i(),s=this.dp();if(e.I_(s,s.vn()),this.Pp=null,this.Rp=!1,e.sd(),this.Lp!==null){const n=performance.now(),r=e.St();this.Lp.Dr(r.ju(),n),this.Lp.Ju(n)||e.Zn(this.Lp)}}Xp(){this.Ap=null}Gp(){if(this.Ep){if(this.$i().Un(),document.activeElement!==document.body&&document.activeElement!==document.documentElement)M(document.activeElement).blur();else{const t=document.getSelection();t!==null&&t.removeAllRanges()}!this.Ep.vn().Ni()&&this.$i().St().Ni()}}im(t){if(this.Ep===null)return;const e=this.$i(),s=e.St();if(s.Ni())return;const n=this.Jd.W(),r=n.handleScroll,o=n.kineticScroll;if((!r.pressedMouseMove||t.Rv)&&(!r.horzTouchDrag&&!r.vertTouchDrag||!t.Rv))return;const l=this.Ep.vn(),h=performance.now();if(this.Pp!==null||this.Mm(t)||(this.Pp={x:t.clientX,y:t.clientY,Vd:h,km:t.localX,ym:t.localY}),this.Pp!==null&&!this.Rp&&(this.Pp.x!==t.clientX||this.Pp.y!==t.clientY)){if(t.Rv&&o.touch||!t.Rv&&o.mouse){const a=s.he();this.Lp=new fc(.2/a,7/a,.997,15/a),this.Lp.qd(s.ju(),this.Pp.Vd)}else this.Lp=null;l.Ni()||e.B_(this.Ep,l,t.localY),e.td(t.localX),this.Rp=!0}this.Rp&&(l.Ni()||e.A_(this.Ep,l,t.localY),e.nd(t.localX),this.Lp!==null&&this.Lp.qd(s.ju(),h))}}class ur{constructor(t,e,s,n,r){this.ft=!0,this.Lv=J({width:0,height:0}),this.jv=()=>this.fp(3),this.Uv=t==="left",this.Vc=s._d,this.cn=e,this.Cm=n,this.Tm=r,this.Xv=document.createElement("div"),this.Xv.style.width="25px",this.Xv.style.height="100%",this.Xv.style.overflow="hidden",this.Kv=ne(this.Xv,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv)}S(){this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose()}hp(){return this.Xv}_m(){return this.Lv}up(t){te(this.Lv,t)||(this.Lv=t,this.Kv.resizeCanvasElement(t),this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`,this.ft=!0)}fp(t){if(t<3&&!this.ft||this.Lv.width===0||this.Lv.height===0)return;this.ft=!1,this.Kv.applySuggestedBitmapSize();const e=ie(this.Kv);e!==null&&e.useBitmapCoordinateSpace(s=>{this.pp(s),this.Ae(s)})}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}Ae({context:t,bitmapSize:e,horizontalPixelRatio:s,verticalPixelRatio:n}){if(!this.Cm())return;t.fillStyle=this.cn.timeScale.borderColor;const r=Math.floor(this.Vc.W().C*s),o=Math.floor(this.Vc.W().C*n),l=this.Uv?e.width-r:0;t.fillRect(l,0,r,o)}pp({context:t,bitmapSize:e}){ki(t,0,0,e.width,e.height,this.Tm())}}function Ys(i){return t=>{var e,s;return(s=(e=t.da)===null||e===void 0?void 0:e.call(t,i))!==null&&s!==void 0?s:[]}}const wc=Ys("normal"),yc=Ys("top"),xc=Ys("bottom");class Sc{constructor(t,e){this.Pm=null,this.Rm=null,this.k=null,this.Dm=!1,this.Lv=J({width:0,height:0}),this.Vm=new st,this.Nv=new We(5),this.Wv=!1,this.jv=()=>{this.Wv||this.Jd.$t().$h()},this.$v=()=>{this.Wv||this.Jd.$t().$h()},this.Jd=t,this.U_=e,this.cn=t.W().layout,this.Zd=document.createElement("tr"),this.Om=document.createElement("td"),this.Om.style.padding="0",this.Bm=document.createElement("td"),this.Bm.style.padding="0",this.Xv=document.createElement("td"),this.Xv.style.height="25px",this.Xv.style.padding="0",this.Am=document.createElement("div"),this.Am.style.width="100%",this.Am.style.height="100%",this.Am.style.position="relative",this.Am.style.overflow="hidden",this.Xv.appendChild(this.Am),this.Kv=ne(this.Am,J({width:16,height:16})),this.Kv.subscribeSuggestedBitmapSizeChanged(this.jv);const s=this.Kv.canvasElement;s.style.position="absolute",s.style.zIndex="1",s.style.left="0",s.style.top="0",this.Gv=ne(this.Am,J({width:16,height:16})),this.Gv.subscribeSuggestedBitmapSizeChanged(this.$v);const n=this.Gv.canvasElement;n.style.position="absolute",n.style.zIndex="2",n.style.left="0",n.style.top="0",this.Zd.appendChild(this.Om),this.Zd.appendChild(this.Xv),this.Zd.appendChild(this.Bm),this.Im(),this.Jd.$t().w_().l(this.Im.bind(this),this),this.rp=new qs(this.Gv.canvasElement,this,{sv:()=>!0,ev:()=>!this.Jd.W().handleScroll.horzTouchDrag})}S(){this.rp.S(),this.Pm!==null&&this.Pm.S(),this.Rm!==null&&this.Rm.S(),this.Gv.unsubscribeSuggestedBitmapSizeChanged(this.$v),re(this.Gv.canvasElement),this.Gv.dispose(),this.Kv.unsubscribeSuggestedBitmapSizeChanged(this.jv),re(this.Kv.canvasElement),this.Kv.dispose()}hp(){return this.Zd}zm(){return this.Pm}Lm(){return this.Rm}mv(t){if(this.Dm)return;this.Dm=!0;const e=this.Jd.$t();!e.St().Ni()&&this.Jd.W().handleScale.axisPressedMouseMove.time&&e.Gc(t.localX)}vv(t){this.mv(t)}bv(){const t=this.Jd.$t();!t.St().Ni()&&this.Dm&&(this.Dm=!1,this.Jd.W().handleScale.axisPressedMouseMove.time&&t.rd())}lv(t){const e=this.Jd.$t();!e.St().Ni()&&this.Jd.W().handleScale.axisPressedMouseMove.time&&e.ed(t.localX)}rv(t){this.lv(t)}uv(){this.Dm=!1;const t=this.Jd.$t();t.St().Ni()&&!this.Jd.W().handleScale.axisPressedMouseMove.time||t.rd()}ov(){this.uv()}Uf(){this.Jd.W().handleScale.axisDoubleClickReset.time&&this.Jd.$t().Kn()}Wf(){this.Uf()}Jf(){this.Jd.$t().W().handleScale.axisPressedMouseMove.time&&this.Sp(1)}Tv(){this.Sp(0)}_m(){return this.Lv}Em(){return this.Vm}Nm(t,e,s){te(this.Lv,t)||(this.Lv=t,this.Wv=!0,this.Kv.resizeCanvasElement(t),this.Gv.resizeCanvasElement(t),this.Wv=!1,this.Xv.style.width=`${t.width}px`,this.Xv.style.height=`${t.height}px`,this.Vm.m(t)),this.Pm!==null&&this.Pm.up(J({width:e,height:t.height})),this.Rm!==null&&this.Rm.up(J({width:s,height:t.height}))}Fm(){const t=this.Wm();return Math.ceil(t.C+t.T+t.P+t.L+t.B+t.jm)}bt(){this.Jd.$t().St().ja()}Mp(){return this.Kv.bitmapSize}xp(t,e,s){const n=this.Mp();n.width>0&&n.height>0&&t.drawImage(this.Kv.canvasElement,e,s)}fp(t){if(t===0)return;if(t!==1){this.Kv.applySuggestedBitmapSize();const s=ie(this.Kv);s!==null&&(s.useBitmapCoordinateSpace(n=>{this.pp(n),this.Ae(n),this.Hm(s,xc)}),this.bp(s),this.Hm(s,wc)),this.Pm!==null&&this.Pm.fp(t),this.Rm!==null&&this.Rm.fp(t)}this.Gv.applySuggestedBitmapSize();const e=ie(this.Gv);e!==null&&(e.useBitmapCoordinateSpace(({context:s,bitmapSize:n})=>{s.clearRect(0,0,n.width,n.height)}),this.$m([...this.Jd.$t().wt(),this.Jd.$t().Yc()],e),this.Hm(e,yc))}Hm(t,e){const s=this.Jd.$t().wt();for(const n of s)Ps(e,r=>Ts(r,t,!1,void 0),n,void 0);for(const n of s)Ps(e,r=>ai(r,t,!1,void 0),n,void 0)}pp({context:t,bitmapSize:e}){ki(t,0,0,e.width,e.height,this.Jd.$t().md())}Ae({context:t,bitmapSize:e,verticalPixelRatio:s}){if(this.Jd.W().timeScale.borderVisible){t.fillStyle=this.Um();const n=Math.max(1,Math.floor(this.Wm().C*s));t.fillRect(0,0,e.width,n)}}bp(t){const e=this.Jd.$t().St(),s=e.ja();if(!s||s.length===0)return;const n=this.U_.maxTickMarkWeight(s),r=this.Wm(),o=e.W();o.borderVisible&&o.ticksVisible&&t.useBitmapCoordinateSpace(({context:l,horizontalPixelRatio:h,verticalPixelRatio:a})=>{l.strokeStyle=this.Um(),l.fillStyle=this.Um();const c=Math.max(1,Math.floor(h)),u=Math.floor(.5*h);l.beginPath();const f=Math.round(r.T*a);for(let m=s.length;m--;){const g=Math.round(s[m].coord*h);l.rect(g-u,0,c,f)}l.fill()}),t.useMediaCoordinateSpace(({context:l})=>{const h=r.C+r.T+r.L+r.P/2;l.textAlign="center",l.textBaseline="middle",l.fillStyle=this.$(),l.font=this.op();for(const a of s)if(a.weight<n){const c=a.needAlignCoordinate?this.qm(l,a.coord,a.label):a.coord;l.fillText(a.label,c,h)}this.Jd.W().timeScale.allowBoldLabels&&(l.font=this.Ym());for(const a of s)if(a.weight>=n){const c=a.needAlignCoordinate?this.qm(l,a.coord,a.label):a.coord;l.fillText(a.label,c,h)}})}qm(t,e,s){const n=this.Nv.xi(t,s),r=n/2,o=Math.floor(e-r)+.5;return o<0?e+=Math.abs(0-o):o+n>this.Lv.width&&(e-=Math.abs(this.Lv.width-(o+n))),e}$m(t,e){const s=this.Wm();for(const n of t)for(const r of n.Qi())r.gt().X(e,s)}Um(){return this.Jd.W().timeScale.borderColor}$(){return this.cn.textColor}j(){return this.cn.fontSize}op(){return be(this.j(),this.cn.fontFamily)}Ym(){return be(this.j(),this.cn.fontFamily,"bold")}Wm(){this.k===null&&(this.k={C:1,N:NaN,L:NaN,B:NaN,ji:NaN,T:5,P:NaN,R:"",Wi:new We,jm:0});const t=this.k,e=this.op();if(t.R!==e){const s=this.j();t.P=s,t.R=e,t.L=3*s/12,t.B=3*s/12,t.ji=9*s/12,t.N=0,t.jm=4*s/12,t.Wi.ir()}return this.k}Sp(t){this.Xv.style.cursor=t===1?"ew-resize":"default"}Im(){const t=this.Jd.$t(),e=t.W();e.leftPriceScale.visible||this.Pm===null||(this.Om.removeChild(this.Pm.hp()),this.Pm.S(),this.Pm=null),e.rightPriceScale.visible||this.Rm===null||(this.Bm.removeChild(this.Rm.hp()),this.Rm.S(),this.Rm=null);const s={_d:this.Jd.$t()._d()},n=()=>e.leftPriceScale.borderVisible&&t.St().W().borderVisible,r=()=>t.md();e.leftPriceScale.visible&&this.Pm===null&&(this.Pm=new ur("left",e,s,n,r),this.Om.appendChild(this.Pm.hp())),e.rightPriceScale.visible&&this.Rm===null&&(this.Rm=new ur("right",e,s,n,r),this.Bm.appendChild(this.Rm.hp()))}}const Mc=!!we&&!!navigator.userAgentData&&navigator.userAgentData.brands.some(i=>i.brand.includes("Chromium"))&&!!we&&(!((ns=navigator?.userAgentData)===null||ns===void 0)&&ns.platform?navigator.userAgentData.platform==="Windows":navigator.userAgent.toLowerCase().indexOf("win")>=0);var ns;class Cc{constructor(t,e,s){var n;this.Zm=[],this.Xm=0,this.ro=0,this.o_=0,this.Km=0,this.Gm=0,this.Jm=null,this.Qm=!1,this.Dp=new st,this.Vp=new st,this.Pc=new st,this.tb=null,this.ib=null,this.Gd=t,this.cn=e,this.U_=s,this.Zd=document.createElement("div"),this.Zd.classList.add("tv-lightweight-charts"),this.Zd.style.overflow="hidden",this.Zd.style.direction="ltr",this.Zd.style.width="100%",this.Zd.style.height="100%",(n=this.Zd).style.userSelect="none",n.style.webkitUserSelect="none",n.style.msUserSelect="none",n.style.MozUserSelect="none",n.style.webkitTapHighlightColor="transparent",this.nb=document.createElement("table"),this.nb.setAttribute("cellspacing","0"),this.Zd.appendChild(this.nb),this.sb=this.eb.bind(this),rs(this.cn)&&this.rb(!0),this.$i=new hc(this.Dc.bind(this),this.cn,s),this.$t().Zc().l(this.hb.bind(this),this),this.lb=new Sc(this,this.U_),this.nb.appendChild(this.lb.hp());const r=e.autoSize&&this.ab();let o=this.cn.width,l=this.cn.height;if(r||o===0||l===0){const h=t.getBoundingClientRect();o=o||h.width,l=l||h.height}this.ob(o,l),this._b(),t.appendChild(this.Zd),this.ub(),this.$i.St().sc().l(this.$i.Xl.bind(this.$i),this),this.$i.w_().l(this.$i.Xl.bind(this.$i),this)}$t(){return this.$i}W(){return this.cn}qp(){return this.Zm}cb(){return this.lb}S(){this.rb(!1),this.Xm!==0&&window.cancelAnimationFrame(this.Xm),this.$i.Zc().p(this),this.$i.St().sc().p(this),this.$i.w_().p(this),this.$i.S();for(const t of this.Zm)this.nb.removeChild(t.hp()),t.hm().p(this),t.lm().p(this),t.S();this.Zm=[],M(this.lb).S(),this.Zd.parentElement!==null&&this.Zd.parentElement.removeChild(this.Zd),this.Pc.S(),this.Dp.S(),this.Vp.S(),this.fb()}ob(t,e,s=!1){if(this.ro===e&&this.o_===t)return;const n=function(l){const h=Math.floor(l.width),a=Math.floor(l.height);return J({width:h-h%2,height:a-a%2})}(J({width:t,height:e}));this.ro=n.height,this.o_=n.width;const r=this.ro+"px",o=this.o_+"px";M(this.Zd).style.height=r,M(this.Zd).style.width=o,this.nb.style.height=r,this.nb.style.width=o,s?this.pb(ht.es(),performance.now()):this.$i.Xl()}fp(t){t===void 0&&(t=ht.es());for(let e=0;e<this.Zm.length;e++)this.Zm[e].fp(t.Hn(e).Fn);this.cn.timeScale.visible&&this.lb.fp(t.jn())}Hh(t){const e=rs(this.cn);this.$i.Hh(t);const s=rs(this.cn);s!==e&&this.rb(s),this.ub(),this.mb(t)}hm(){return this.Dp}lm(){return this.Vp}Zc(){return this.Pc}bb(){this.Jm!==null&&(this.pb(this.Jm,performance.now()),this.Jm=null);const t=this.wb(null),e=document.createElement("canvas");e.width=t.width,e.height=t.height;const s=M(e.getContext("2d"));return this.wb(s),e}gb(t){return t==="left"&&!this.Mb()||t==="right"&&!this.xb()||this.Zm.length===0?0:M(t==="left"?this.Zm[0].bm():this.Zm[0].wm()).cp()}Sb(){return this.cn.autoSize&&this.tb!==null}kb(){return this.Zd}Jp(t){this.ib=t,this.ib?this.kb().style.setProperty("cursor",t):this.kb().style.removeProperty("cursor")}yb(){return this.ib}Cb(){return mt(this.Zm[0])._m()}mb(t){(t.autoSize!==void 0||!this.tb||t.width===void 0&&t.height===void 0)&&(t.autoSize&&!this.tb&&this.ab(),t.autoSize===!1&&this.tb!==null&&this.fb(),t.autoSize||t.width===void 0&&t.height===void 0||this.ob(t.width||this.o_,t.height||this.ro))}wb(t){let e=0,s=0;const n=this.Zm[0],r=(l,h)=>{let a=0;for(let c=0;c<this.Zm.length;c++){const u=this.Zm[c],f=M(l==="left"?u.bm():u.wm()),m=f.Mp();t!==null&&f.xp(t,h,a),a+=m.height}};this.Mb()&&(r("left",0),e+=M(n.bm()).Mp().width);for(let l=0;l<this.Zm.length;l++){const h=this.Zm[l],a=h.Mp();t!==null&&h.xp(t,e,s),s+=a.height}e+=n.Mp().width,this.xb()&&(r("right",e),e+=M(n.wm()).Mp().width);const o=(l,h,a)=>{M(l==="left"?this.lb.zm():this.lb.Lm()).xp(M(t),h,a)};if(this.cn.timeScale.visible){const l=this.lb.Mp();if(t!==null){let h=0;this.Mb()&&(o("left",h,s),h=M(n.bm()).Mp().width),this.lb.xp(t,h,s),h+=l.width,this.xb()&&o("right",h,s)}s+=l.height}return J({width:e,height:s})}Tb(){let t=0,e=0,s=0;for(const g of this.Zm)this.Mb()&&(e=Math.max(e,M(g.bm()).ap(),this.cn.leftPriceScale.minimumWidth)),this.xb()&&(s=Math.max(s,M(g.wm()).ap(),this.cn.rightPriceScale.minimumWidth)),t+=g.g_();e=Ls(e),s=Ls(s);const n=this.o_,r=this.ro,o=Math.max(n-e-s,0),l=this.cn.timeScale.visible;let h=l?Math.max(this.lb.Fm(),this.cn.timeScale.minimumHeight):0;var a;h=(a=h)+a%2;const c=0+h,u=r<c?0:r-c,f=u/t;let m=0;for(let g=0;g<this.Zm.length;++g){const p=this.Zm[g];p.Up(this.$i.Uc()[g]);let _=0,w=0;w=g===this.Zm.length-1?u-m:Math.round(p.g_()*f),_=Math.max(w,2),m+=_,p.up(J({width:o,height:_})),this.Mb()&&p.om(e,"left"),this.xb()&&p.om(s,"right"),p.dp()&&this.$i.Xc(p.dp(),_)}this.lb.Nm(J({width:l?o:0,height:h}),l?e:0,l?s:0),this.$i.x_(o),this.Km!==e&&(this.Km=e),this.Gm!==s&&(this.Gm=s)}rb(t){t?this.Zd.addEventListener("wheel",this.sb,{passive:!1}):this.Zd.removeEventListener("wheel",this.sb)}Pb(t){switch(t.deltaMode){case t.DOM_DELTA_PAGE:return 120;case t.DOM_DELTA_LINE:return 32}return Mc?1/window.devicePixelRatio:1}eb(t){if(!(t.deltaX!==0&&this.cn.handleScroll.mouseWheel||t.deltaY!==0&&this.cn.handleScale.mouseWheel))return;const e=this.Pb(t),s=e*t.deltaX/100,n=-e*t.deltaY/100;if(t.cancelable&&t.preventDefault(),n!==0&&this.cn.handleScale.mouseWheel){const r=Math.sign(n)*Math.min(1,Math.abs(n)),o=t.clientX-this.Zd.getBoundingClientRect().left;this.$t().Jc(o,r)}s!==0&&this.cn.handleScroll.mouseWheel&&this.$t().Qc(-80*s)}pb(t,e){var s;const n=t.jn();n===3&&this.Rb(),n!==3&&n!==2||(this.Db(t),this.Vb(t,e),this.lb.bt(),this.Zm.forEach(r=>{r.Zp()}),((s=this.Jm)===null||s===void 0?void 0:s.jn())===3&&(this.Jm.ts(t),this.Rb(),this.Db(this.Jm),this.Vb(this.Jm,e),t=this.Jm,this.Jm=null)),this.fp(t)}Vb(t,e){for(const s of t.Qn())this.ns(s,e)}Db(t){const e=this.$i.Uc();for(let s=0;s<e.length;s++)t.Hn(s).Wn&&e[s].E_()}ns(t,e){const s=this.$i.St();switch(t.qn){case 0:s.rc();break;case 1:s.hc(t.Vt);break;case 2:s.Gn(t.Vt);break;case 3:s.Jn(t.Vt);break;case 4:s.Uu();break;case 5:t.Vt.Ju(e)||s.Jn(t.Vt.Qu(e))}}Dc(t){this.Jm!==null?this.Jm.ts(t):this.Jm=t,this.Qm||(this.Qm=!0,this.Xm=window.requestAnimationFrame(e=>{if(this.Qm=!1,this.Xm=0,this.Jm!==null){const s=this.Jm;this.Jm=null,this.pb(s,e);for(const n of s.Qn())if(n.qn===5&&!n.Vt.Ju(e)){this.$t().Zn(n.Vt);break}}}))}Rb(){this._b()}_b(){const t=this.$i.Uc(),e=t.length,s=this.Zm.length;for(let n=e;n<s;n++){const r=mt(this.Zm.pop());this.nb.removeChild(r.hp()),r.hm().p(this),r.lm().p(this),r.S()}for(let n=s;n<e;n++){const r=new Gs(this,t[n]);r.hm().l(this.Ob.bind(this),this),r.lm().l(this.Bb.bind(this),this),this.Zm.push(r),this.nb.insertBefore(r.hp(),this.lb.hp())}for(let n=0;n<e;n++){const r=t[n],o=this.Zm[n];o.dp()!==r?o.Up(r):o.$p()}this.ub(),this.Tb()}Ab(t,e,s){var n;const r=new Map;t!==null&&this.$i.wt().forEach(c=>{const u=c.In().hl(t);u!==null&&r.set(c,u)});let o;if(t!==null){const c=(n=this.$i.St().Ui(t))===null||n===void 0?void 0:n.originalTime;c!==void 0&&(o=c)}const l=this.$t().Fc(),h=l!==null&&l.jc instanceof Xs?l.jc:void 0,a=l!==null&&l.Av!==void 0?l.Av.wr:void 0;return{Ib:o,se:t??void 0,zb:e??void 0,Lb:h,Eb:r,Nb:a,Fb:s??void 0}}Ob(t,e,s){this.Dp.m(()=>this.Ab(t,e,s))}Bb(t,e,s){this.Vp.m(()=>this.Ab(t,e,s))}hb(t,e,s){this.Pc.m(()=>this.Ab(t,e,s))}ub(){const t=this.cn.timeScale.visible?"":"none";this.lb.hp().style.display=t}Mb(){return this.Zm[0].dp().P_().W().visible}xb(){return this.Zm[0].dp().R_().W().visible}ab(){return"ResizeObserver"in window&&(this.tb=new ResizeObserver(t=>{const e=t.find(s=>s.target===this.Gd);e&&this.ob(e.contentRect.width,e.contentRect.height)}),this.tb.observe(this.Gd,{box:"border-box"}),!0)}fb(){this.tb!==null&&this.tb.disconnect(),this.tb=null}}function rs(i){return!!(i.handleScroll.mouseWheel||i.handleScale.mouseWheel)}function $c(i){return function(t){return t.open!==void 0}(i)||function(t){return t.value!==void 0}(i)}function Mo(i,t){var e={};for(var s in i)Object.prototype.hasOwnProperty.call(i,s)&&t.indexOf(s)<0&&(e[s]=i[s]);if(i!=null&&typeof Object.getOwnPropertySymbols=="function"){var n=0;for(s=Object.getOwnPropertySymbols(i);n<s.length;n++)t.indexOf(s[n])<0&&Object.prototype.propertyIsEnumerable.call(i,s[n])&&(e[s[n]]=i[s[n]])}return e}function dr(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.color!==void 0&&(r.V=e.color),r}function Ec(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.lineColor!==void 0&&(r.lt=e.lineColor),e.topColor!==void 0&&(r.Ts=e.topColor),e.bottomColor!==void 0&&(r.Ps=e.bottomColor),r}function kc(i,t,e,s){const n=e.value,r={se:t,ot:i,Vt:[n,n,n,n],Ib:s};return e.topLineColor!==void 0&&(r.Pe=e.topLineColor),e.bottomLineColor!==void 0&&(r.Re=e.bottomLineColor),e.topFillColor1!==void 0&&(r.Se=e.topFillColor1),e.topFillColor2!==void 0&&(r.ke=e.topFillColor2),e.bottomFillColor1!==void 0&&(r.ye=e.bottomFillColor1),e.bottomFillColor2!==void 0&&(r.Ce=e.bottomFillColor2),r}function Lc(i,t,e,s){const n={se:t,ot:i,Vt:[e.open,e.high,e.low,e.close],Ib:s};return e.color!==void 0&&(n.V=e.color),n}function Tc(i,t,e,s){const n={se:t,ot:i,Vt:[e.open,e.high,e.low,e.close],Ib:s};return e.color!==void 0&&(n.V=e.color),e.borderColor!==void 0&&(n.Ot=e.borderColor),e.wickColor!==void 0&&(n.Zh=e.wickColor),n}function Pc(i,t,e,s,n){const r=mt(n)(e),o=Math.max(...r),l=Math.min(...r),h=r[r.length-1],a=[h,o,l,h],c=e,{time:u,color:f}=c;return{se:t,ot:i,Vt:a,Ib:s,He:Mo(c,["time","color"]),V:f}}function ii(i){return i.Vt!==void 0}function fr(i,t){return t.customValues!==void 0&&(i.Wb=t.customValues),i}function Jt(i){return(t,e,s,n,r,o)=>function(l,h){return h?h(l):(a=l).open===void 0&&a.value===void 0;var a}(s,o)?fr({ot:t,se:e,Ib:n},s):fr(i(t,e,s,n,r),s)}function gr(i){return{Candlestick:Jt(Tc),Bar:Jt(Lc),Area:Jt(Ec),Baseline:Jt(kc),Histogram:Jt(dr),Line:Jt(dr),Custom:Jt(Pc)}[i]}function mr(i){return{se:0,jb:new Map,ha:i}}function pr(i,t){if(i!==void 0&&i.length!==0)return{Hb:t.key(i[0].ot),$b:t.key(i[i.length-1].ot)}}function vr(i){let t;return i.forEach(e=>{t===void 0&&(t=e.Ib)}),mt(t)}class zc{constructor(t){this.Ub=new Map,this.qb=new Map,this.Yb=new Map,this.Zb=[],this.U_=t}S(){this.Ub.clear(),this.qb.clear(),this.Yb.clear(),this.Zb=[]}Xb(t,e){let s=this.Ub.size!==0,n=!1;const r=this.qb.get(t);if(r!==void 0)if(this.qb.size===1)s=!1,n=!0,this.Ub.clear();else for(const h of this.Zb)h.pointData.jb.delete(t)&&(n=!0);let o=[];if(e.length!==0){const h=e.map(m=>m.time),a=this.U_.createConverterToInternalObj(e),c=gr(t.Jh()),u=t.ya(),f=t.Ca();o=e.map((m,g)=>{const p=a(m.time),_=this.U_.key(p);let w=this.Ub.get(_);w===void 0&&(w=mr(p),this.Ub.set(_,w),n=!0);const x=c(p,w.se,m,h[g],u,f);return w.jb.set(t,x),x})}s&&this.Kb(),this.Gb(t,o);let l=-1;if(n){const h=[];this.Ub.forEach(a=>{h.push({timeWeight:0,time:a.ha,pointData:a,originalTime:vr(a.jb)})}),h.sort((a,c)=>this.U_.key(a.time)-this.U_.key(c.time)),l=this.Jb(h)}return this.Qb(t,l,function(h,a,c){const u=pr(h,c),f=pr(a,c);if(u!==void 0&&f!==void 0)return{Ql:u.$b>=f.$b&&u.Hb>=f.Hb}}(this.qb.get(t),r,this.U_))}fd(t){return this.Xb(t,[])}tw(t,e){const s=e;(function(p){p.Ib===void 0&&(p.Ib=p.time)})(s),this.U_.preprocessData(e);const n=this.U_.createConverterToInternalObj([e])(e.time),r=this.Yb.get(t);if(r!==void 0&&this.U_.key(n)<this.U_.key(r))throw new Error(`Cannot update oldest data, last time=${r}, new time=${n}`);let o=this.Ub.get(this.U_.key(n));const l=o===void 0;o===void 0&&(o=mr(n),this.Ub.set(this.U_.key(n),o));const h=gr(t.Jh()),a=t.ya(),c=t.Ca(),u=h(n,o.se,e,s.Ib,a,c);o.jb.set(t,u),this.iw(t,u);const f={Ql:ii(u)};if(!l)return this.Qb(t,-1,f);const m={timeWeight:0,time:o.ha,pointData:o,originalTime:vr(o.jb)},g=Ue(this.Zb,this.U_.key(m.time),(p,_)=>this.U_.key(p.time)<_);this.Zb.splice(g,0,m);for(let p=g;p<this.Zb.length;++p)os(this.Zb[p].pointData,p);return this.U_.fillWeightsForPoints(this.Zb,g),this.Qb(t,g,f)}iw(t,e){let s=this.qb.get(t);s===void 0&&(s=[],this.qb.set(t,s));const n=s.length!==0?s[s.length-1]:null;n===null||this.U_.key(e.ot)>this.U_.key(n.ot)?ii(e)&&s.push(e):ii(e)?s[s.length-1]=e:s.splice(-1,1),this.Yb.set(t,e.ot)}Gb(t,e){e.length!==0?(this.qb.set(t,e.filter(ii)),this.Yb.set(t,e[e.length-1].ot)):(this.qb.delete(t),this.Yb.delete(t))}Kb(){for(const t of this.Zb)t.pointData.jb.size===0&&this.Ub.delete(this.U_.key(t.time))}Jb(t){let e=-1;for(let s=0;s<this.Zb.length&&s<t.length;++s){const n=this.Zb[s],r=t[s];if(this.U_.key(n.time)!==this.U_.key(r.time)){e=s;break}r.timeWeight=n.timeWeight,os(r.pointData,s)}if(e===-1&&this.Zb.length!==t.length&&(e=Math.min(this.Zb.length,t.length)),e===-1)return-1;for(let s=e;s<t.length;++s)os(t[s].pointData,s);return this.U_.fillWeightsForPoints(t,e),this.Zb=t,e}nw(){if(this.qb.size===0)return null;let t=0;return this.qb.forEach(e=>{e.length!==0&&(t=Math.max(t,e[e.length-1].se))}),t}Qb(t,e,s){const n={sw:new Map,St:{Lu:this.nw()}};if(e!==-1)this.qb.forEach((r,o)=>{n.sw.set(o,{He:r,ew:o===t?s:void 0})}),this.qb.has(t)||n.sw.set(t,{He:[],ew:s}),n.St.rw=this.Zb,n.St.hw=e;else{const r=this.qb.get(t);n.sw.set(t,{He:r||[],ew:s})}return n}}function os(i,t){i.se=t,i.jb.forEach(e=>{e.se=t})}function Zs(i){const t={value:i.Vt[3],time:i.Ib};return i.Wb!==void 0&&(t.customValues=i.Wb),t}function _r(i){const t=Zs(i);return i.V!==void 0&&(t.color=i.V),t}function Dc(i){const t=Zs(i);return i.lt!==void 0&&(t.lineColor=i.lt),i.Ts!==void 0&&(t.topColor=i.Ts),i.Ps!==void 0&&(t.bottomColor=i.Ps),t}function Ac(i){const t=Zs(i);return i.Pe!==void 0&&(t.topLineColor=i.Pe),i.Re!==void 0&&(t.bottomLineColor=i.Re),i.Se!==void 0&&(t.topFillColor1=i.Se),i.ke!==void 0&&(t.topFillColor2=i.ke),i.ye!==void 0&&(t.bottomFillColor1=i.ye),i.Ce!==void 0&&(t.bottomFillColor2=i.Ce),t}function Co(i){const t={open:i.Vt[0],high:i.Vt[1],low:i.Vt[2],close:i.Vt[3],time:i.Ib};return i.Wb!==void 0&&(t.customValues=i.Wb),t}function Ic(i){const t=Co(i);return i.V!==void 0&&(t.color=i.V),t}function Oc(i){const t=Co(i),{V:e,Ot:s,Zh:n}=i;return e!==void 0&&(t.color=e),s!==void 0&&(t.borderColor=s),n!==void 0&&(t.wickColor=n),t}function zs(i){return{Area:Dc,Line:_r,Baseline:Ac,Histogram:_r,Bar:Ic,Candlestick:Oc,Custom:Rc}[i]}function Rc(i){const t=i.Ib;return Object.assign(Object.assign({},i.He),{time:t})}const Vc={vertLine:{color:"#9598A1",width:1,style:3,visible:!0,labelVisible:!0,labelBackgroundColor:"#131722"},horzLine:{color:"#9598A1",width:1,style:3,visible:!0,labelVisible:!0,labelBackgroundColor:"#131722"},mode:1},Wc={vertLines:{color:"#D6DCDE",style:0,visible:!0},horzLines:{color:"#D6DCDE",style:0,visible:!0}},Bc={background:{type:"solid",color:"#FFFFFF"},textColor:"#191919",fontSize:12,fontFamily:Bs,attributionLogo:!0},ls={autoScale:!0,mode:0,invertScale:!1,alignLabels:!0,borderVisible:!0,borderColor:"#2B2B43",entireTextOnly:!1,visible:!1,ticksVisible:!1,scaleMargins:{bottom:.1,top:.2},minimumWidth:0},Nc={rightOffset:0,barSpacing:6,minBarSpacing:.5,fixLeftEdge:!1,fixRightEdge:!1,lockVisibleTimeRangeOnResize:!1,rightBarStaysOnScroll:!1,borderVisible:!0,borderColor:"#2B2B43",visible:!0,timeVisible:!1,secondsVisible:!0,shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!1,ticksVisible:!1,uniformDistribution:!1,minimumHeight:0,allowBoldLabels:!0},jc={color:"rgba(0, 0, 0, 0)",visible:!1,fontSize:48,fontFamily:Bs,fontStyle:"",text:"",horzAlign:"center",vertAlign:"center"};function br(){return{width:0,height:0,autoSize:!1,layout:Bc,crosshair:Vc,grid:Wc,overlayPriceScales:Object.assign({},ls),leftPriceScale:Object.assign(Object.assign({},ls),{visible:!1}),rightPriceScale:Object.assign(Object.assign({},ls),{visible:!0}),timeScale:Nc,watermark:jc,localization:{locale:we?navigator.language:"",dateFormat:"dd MMM 'yy"},handleScroll:{mouseWheel:!0,pressedMouseMove:!0,horzTouchDrag:!0,vertTouchDrag:!0},handleScale:{axisPressedMouseMove:{time:!0,price:!0},axisDoubleClickReset:{time:!0,price:!0},mouseWheel:!0,pinch:!0},kineticScroll:{mouse:!1,touch:!0},trackingMode:{exitMode:1}}}class Fc{constructor(t,e){this.lw=t,this.aw=e}applyOptions(t){this.lw.$t().Hc(this.aw,t)}options(){return this.Li().W()}width(){return Ti(this.aw)?this.lw.gb(this.aw):0}Li(){return M(this.lw.$t().$c(this.aw)).Dt}}function wr(i,t,e){const s=Mo(i,["time","originalTime"]),n=Object.assign({time:t},s);return e!==void 0&&(n.originalTime=e),n}const Uc={color:"#FF0000",price:0,lineStyle:2,lineWidth:1,lineVisible:!0,axisLabelVisible:!0,title:"",axisLabelColor:"",axisLabelTextColor:""};class Hc{constructor(t){this.Eh=t}applyOptions(t){this.Eh.Hh(t)}options(){return this.Eh.W()}ow(){return this.Eh}}class Xc{constructor(t,e,s,n,r){this._w=new st,this.Ls=t,this.uw=e,this.cw=s,this.U_=r,this.dw=n}S(){this._w.S()}priceFormatter(){return this.Ls.ma()}priceToCoordinate(t){const e=this.Ls.Ct();return e===null?null:this.Ls.Dt().Rt(t,e.Vt)}coordinateToPrice(t){const e=this.Ls.Ct();return e===null?null:this.Ls.Dt().pn(t,e.Vt)}barsInLogicalRange(t){if(t===null)return null;const e=new me(new Pe(t.from,t.to)).hu(),s=this.Ls.In();if(s.Ni())return null;const n=s.hl(e.Vs(),1),r=s.hl(e.ui(),-1),o=M(s.sl()),l=M(s.An());if(n!==null&&r!==null&&n.se>r.se)return{barsBefore:t.from-o,barsAfter:l-t.to};const h={barsBefore:n===null||n.se===o?t.from-o:n.se-o,barsAfter:r===null||r.se===l?l-t.to:l-r.se};return n!==null&&r!==null&&(h.from=n.Ib,h.to=r.Ib),h}setData(t){this.U_,this.Ls.Jh(),this.uw.fw(this.Ls,t),this.pw("full")}update(t){this.Ls.Jh(),this.uw.mw(this.Ls,t),this.pw("update")}dataByIndex(t,e){const s=this.Ls.In().hl(t,e);return s===null?null:zs(this.seriesType())(s)}data(){const t=zs(this.seriesType());return this.Ls.In().ie().map(e=>t(e))}subscribeDataChanged(t){this._w.l(t)}unsubscribeDataChanged(t){this._w.v(t)}setMarkers(t){this.U_;const e=t.map(s=>wr(s,this.U_.convertHorzItemToInternal(s.time),s.time));this.Ls.ia(e)}markers(){return this.Ls.na().map(t=>wr(t,t.originalTime,void 0))}applyOptions(t){this.Ls.Hh(t)}options(){return Vt(this.Ls.W())}priceScale(){return this.cw.priceScale(this.Ls.Dt().Ta())}createPriceLine(t){const e=Pt(Vt(Uc),t),s=this.Ls.sa(e);return new Hc(s)}removePriceLine(t){this.Ls.ea(t.ow())}seriesType(){return this.Ls.Jh()}attachPrimitive(t){this.Ls.Sa(t),t.attached&&t.attached({chart:this.dw,series:this,requestUpdate:()=>this.Ls.$t().Xl()})}detachPrimitive(t){this.Ls.ka(t),t.detached&&t.detached()}pw(t){this._w.M()&&this._w.m(t)}}class Kc{constructor(t,e,s){this.bw=new st,this.pu=new st,this.Vm=new st,this.$i=t,this.kl=t.St(),this.lb=e,this.kl.tc().l(this.ww.bind(this)),this.kl.nc().l(this.gw.bind(this)),this.lb.Em().l(this.Mw.bind(this)),this.U_=s}S(){this.kl.tc().p(this),this.kl.nc().p(this),this.lb.Em().p(this),this.bw.S(),this.pu.S(),this.Vm.S()}scrollPosition(){return this.kl.ju()}scrollToPosition(t,e){e?this.kl.Gu(t,1e3):this.$i.Jn(t)}scrollToRealTime(){this.kl.Ku()}getVisibleRange(){const t=this.kl.Du();return t===null?null:{from:t.from.originalTime,to:t.to.originalTime}}setVisibleRange(t){const e={from:this.U_.convertHorzItemToInternal(t.from),to:this.U_.convertHorzItemToInternal(t.to)},s=this.kl.Au(e);this.$i.vd(s)}getVisibleLogicalRange(){const t=this.kl.Ru();return t===null?null:{from:t.Vs(),to:t.ui()}}setVisibleLogicalRange(t){qt(t.from<=t.to,"The from index cannot be after the to index."),this.$i.vd(t)}resetTimeScale(){this.$i.Kn()}fitContent(){this.$i.rc()}logicalToCoordinate(t){const e=this.$i.St();return e.Ni()?null:e.It(t)}coordinateToLogical(t){return this.kl.Ni()?null:this.kl.Eu(t)}timeToCoordinate(t){const e=this.U_.convertHorzItemToInternal(t),s=this.kl.Da(e,!1);return s===null?null:this.kl.It(s)}coordinateToTime(t){const e=this.$i.St(),s=e.Eu(t),n=e.Ui(s);return n===null?null:n.originalTime}width(){return this.lb._m().width}height(){return this.lb._m().height}subscribeVisibleTimeRangeChange(t){this.bw.l(t)}unsubscribeVisibleTimeRangeChange(t){this.bw.v(t)}subscribeVisibleLogicalRangeChange(t){this.pu.l(t)}unsubscribeVisibleLogicalRangeChange(t){this.pu.v(t)}subscribeSizeChange(t){this.Vm.l(t)}unsubscribeSizeChange(t){this.Vm.v(t)}applyOptions(t){this.kl.Hh(t)}options(){return Object.assign(Object.assign({},Vt(this.kl.W())),{barSpacing:this.kl.he()})}ww(){this.bw.M()&&this.bw.m(this.getVisibleRange())}gw(){this.pu.M()&&this.pu.m(this.getVisibleLogicalRange())}Mw(t){this.Vm.m(t.width,t.height)}}function qc(i){if(i===void 0||i.type==="custom")return;const t=i;t.minMove!==void 0&&t.precision===void 0&&(t.precision=function(e){if(e>=1)return 0;let s=0;for(;s<8;s++){const n=Math.round(e);if(Math.abs(n-e)<1e-8)return s;e*=10}return s}(t.minMove))}function yr(i){return function(t){if(Ke(t.handleScale)){const s=t.handleScale;t.handleScale={axisDoubleClickReset:{time:s,price:s},axisPressedMouseMove:{time:s,price:s},mouseWheel:s,pinch:s}}else if(t.handleScale!==void 0){const{axisPressedMouseMove:s,axisDoubleClickReset:n}=t.handleScale;Ke(s)&&(t.handleScale.axisPressedMouseMove={time:s,price:s}),Ke(n)&&(t.handleScale.axisDoubleClickReset={time:n,price:n})}const e=t.handleScroll;Ke(e)&&(t.handleScroll={horzTouchDrag:e,vertTouchDrag:e,mouseWheel:e,pressedMouseMove:e})}(i),i}class Gc{constructor(t,e,s){this.xw=new Map,this.Sw=new Map,this.kw=new st,this.yw=new st,this.Cw=new st,this.Tw=new zc(e);const n=s===void 0?Vt(br()):Pt(Vt(br()),yr(s));this.U_=e,this.lw=new Cc(t,n,e),this.lw.hm().l(o=>{this.kw.M()&&this.kw.m(this.Pw(o()))},this),this.lw.lm().l(o=>{this.yw.M()&&this.yw.m(this.Pw(o()))},this),this.lw.Zc().l(o=>{this.Cw.M()&&this.Cw.m(this.Pw(o()))},this);const r=this.lw.$t();this.Rw=new Kc(r,this.lw.cb(),this.U_)}remove(){this.lw.hm().p(this),this.lw.lm().p(this),this.lw.Zc().p(this),this.Rw.S(),this.lw.S(),this.xw.clear(),this.Sw.clear(),this.kw.S(),this.yw.S(),this.Cw.S(),this.Tw.S()}resize(t,e,s){this.autoSizeActive()||this.lw.ob(t,e,s)}addCustomSeries(t,e){const s=ue(t),n=Object.assign(Object.assign({},Qr),s.defaultOptions());return this.Dw("Custom",n,e,s)}addAreaSeries(t){return this.Dw("Area",zh,t)}addBaselineSeries(t){return this.Dw("Baseline",Dh,t)}addBarSeries(t){return this.Dw("Bar",Th,t)}addCandlestickSeries(t={}){return function(e){e.borderColor!==void 0&&(e.borderUpColor=e.borderColor,e.borderDownColor=e.borderColor),e.wickColor!==void 0&&(e.wickUpColor=e.wickColor,e.wickDownColor=e.wickColor)}(t),this.Dw("Candlestick",Lh,t)}addHistogramSeries(t){return this.Dw("Histogram",Ah,t)}addLineSeries(t){return this.Dw("Line",Ph,t)}removeSeries(t){const e=mt(this.xw.get(t)),s=this.Tw.fd(e);this.lw.$t().fd(e),this.Vw(s),this.xw.delete(t),this.Sw.delete(e)}fw(t,e){this.Vw(this.Tw.Xb(t,e))}mw(t,e){this.Vw(this.Tw.tw(t,e))}subscribeClick(t){this.kw.l(t)}unsubscribeClick(t){this.kw.v(t)}subscribeCrosshairMove(t){this.Cw.l(t)}unsubscribeCrosshairMove(t){this.Cw.v(t)}subscribeDblClick(t){this.yw.l(t)}unsubscribeDblClick(t){this.yw.v(t)}priceScale(t){return new Fc(this.lw,t)}timeScale(){return this.Rw}applyOptions(t){this.lw.Hh(yr(t))}options(){return this.lw.W()}takeScreenshot(){return this.lw.bb()}autoSizeActive(){return this.lw.Sb()}chartElement(){return this.lw.kb()}paneSize(){const t=this.lw.Cb();return{height:t.height,width:t.width}}setCrosshairPosition(t,e,s){const n=this.xw.get(s);if(n===void 0)return;const r=this.lw.$t().cr(n);r!==null&&this.lw.$t().ld(t,e,r)}clearCrosshairPosition(){this.lw.$t().ad(!0)}Dw(t,e,s={},n){qc(s.priceFormat);const r=Pt(Vt(to),Vt(e),s),o=this.lw.$t().ud(t,r,n),l=new Xc(o,this,this,this,this.U_);return this.xw.set(l,o),this.Sw.set(o,l),l}Vw(t){const e=this.lw.$t();e.od(t.St.Lu,t.St.rw,t.St.hw),t.sw.forEach((s,n)=>n.J(s.He,s.ew)),e.Fu()}Ow(t){return mt(this.Sw.get(t))}Pw(t){const e=new Map;t.Eb.forEach((n,r)=>{const o=r.Jh(),l=zs(o)(n);if(o!=="Custom")qt($c(l));else{const h=r.Ca();qt(!h||h(l)===!1)}e.set(this.Ow(r),l)});const s=t.Lb!==void 0&&this.Sw.has(t.Lb)?this.Ow(t.Lb):void 0;return{time:t.Ib,logical:t.se,point:t.zb,hoveredSeries:s,hoveredObjectId:t.Nb,seriesData:e,sourceEvent:t.Fb}}}function Yc(i,t,e){let s;if(Fe(i)){const r=document.getElementById(i);qt(r!==null,`Cannot find element in DOM with id=${i}`),s=r}else s=i;const n=new Gc(s,t,e);return t.setOptions(n.options()),n}function Zc(i,t){return Yc(i,new or,or.Ad(t))}const Jc=Object.assign(Object.assign({},to),Qr);function Qc(i,t){if(i>=2.5&&i<=4)return Math.floor(3*t);const o=1-.2*Math.atan(Math.max(4,i)-4)/(Math.PI*.5),l=Math.floor(i*o*t),h=Math.floor(i*t),a=Math.min(l,h);return Math.max(Math.floor(t),a)}function tu(i,t){let e=Qc(i,t);return e>=2&&Math.floor(t)%2!==e%2&&e--,e}function eu(i){return Math.max(1,Math.floor(i))}function iu(i){return eu(i)/i}function su(i){return Math.floor(i*.5)}function xr(i,t,e=1,s){const n=Math.round(t*i),r=Math.round(e*t),o=su(r);return{position:n-o,length:r}}function Sr(i,t,e){const s=Math.round(e*i),n=Math.round(e*t);return{position:Math.min(s,n),length:Math.abs(n-s)+1}}class nu{_data=null;_options=null;draw(t,e){t.useBitmapCoordinateSpace(s=>this._drawImpl(s,e))}update(t,e){this._data=t,this._options=e}_drawImpl(t,e){if(this._data===null||this._data.bars.length===0||this._data.visibleRange===null||this._options===null)return;const s=this._data.visibleRange.from,n=this._data.visibleRange.to,r=this._data.bars.slice(s,n).map(l=>{const h=l.originalData.close>=l.originalData.open,a=e(l.originalData.open)??0,c=e(l.originalData.high)??0,u=e(l.originalData.low)??0,f=e(l.originalData.close)??0;return{openY:a,highY:c,lowY:u,closeY:f,x:l.x,isUp:h}});if(this._options.priceLineColor!=="")this._options.color=this._options.priceLineColor;else{let l=this._data.bars.at(-1),h=l?l.originalData.close>=l.originalData.open:!1;this._options.color=h?this._options.upColor:this._options.downColor}const o=this._options.radius(this._data.barSpacing);this._options.wickVisible&&this._drawWicks(t,r),this._drawCandles(t,r,o)}_drawWicks(t,e){if(this._data===null||this._options===null)return;const{context:s,horizontalPixelRatio:n,verticalPixelRatio:r}=t,o=iu(n);for(const l of e){s.fillStyle=l.isUp?this._options.wickUpColor:this._options.wickDownColor;const h=Sr(l.lowY,l.highY,r),a=xr(l.x,n,o);s.fillRect(a.position,h.position,a.length,h.length)}}_drawCandles(t,e,s){if(this._data===null||this._options===null)return;const{context:n,horizontalPixelRatio:r,verticalPixelRatio:o}=t,l=tu(this._data.barSpacing,1);for(const h of e){const a=Sr(Math.min(h.openY,h.closeY),Math.max(h.openY,h.closeY),o),c=xr(h.x,r,l);n.fillStyle=h.isUp?this._options.upColor:this._options.downColor,n.roundRect?(n.beginPath(),n.roundRect(c.position,a.position,c.length,a.length,s),n.fill()):n.fillRect(c.position,a.position,c.length,a.length)}}}const ru={...Jc,upColor:"#26a69a",downColor:"#ef5350",wickVisible:!0,wickColor:"#737375",wickUpColor:"#26a69a",wickDownColor:"#ef5350",radius:function(i){return i<4?0:i/3}};class ou{_renderer;constructor(){this._renderer=new nu}priceValueBuilder(t){return[t.high,t.low,t.close]}renderer(){return this._renderer}isWhitespace(t){return t.close===void 0}update(t,e){this._renderer.update(t,e)}defaultOptions(){return ru}}var it=(i=>(i[i.WhitespaceData=0]="WhitespaceData",i[i.SingleValueData=1]="SingleValueData",i[i.LINE=2]="LINE",i[i.AREA=3]="AREA",i[i.BASELINE=4]="BASELINE",i[i.HISTOGRAM=5]="HISTOGRAM",i[i.OHLC=6]="OHLC",i[i.BAR=7]="BAR",i[i.CANDLESTICK=8]="CANDLESTICK",i[i.ROUNDED_CANDLE=9]="ROUNDED_CANDLE",i))(it||{});const lu=new Map([[0,"Whitespace"],[1,"Single-Value"],[2,"Line"],[3,"Area"],[4,"Baseline"],[5,"Histogram"],[6,"OHLC"],[7,"Bar"],[8,"Candlestick"],[9,"Rounded-Candle"]]);class $o{_pane;_series;_id;_indicator_id;_parent_name;_name;s_type;_markers=new Map;_pricelines=new Map;primitiveIds;setPrimitiveIds;constructor(t,e,s,n,r,o){this._id=t,this._indicator_id=e,this._name=s,this._parent_name=n,this.s_type=r,this._pane=o,this._series=this._create_series(r),this._markers=new Map;const l=C([]);this.primitiveIds=l[0],this.setPrimitiveIds=l[1],this._pane.series_map.set(this._series,this)}_create_series(t){switch(t){case 2:return this._pane.chart.addLineSeries();case 3:return this._pane.chart.addAreaSeries();case 5:return this._pane.chart.addHistogramSeries();case 4:return this._pane.chart.addBaselineSeries();case 7:return this._pane.chart.addBarSeries();case 6:case 8:return this._pane.chart.addCandlestickSeries();case 9:return this._pane.chart.addCustomSeries(new ou);default:return this._pane.chart.addLineSeries()}}get id(){return this._id}get name(){let t=this._parent_name?this._parent_name+" : ":"";return t+=this._name?this._name:lu.get(this.s_type),t}reorderPrimitives(t,e){this.primitiveWrapperArray.splice(e,0,...this.primitiveWrapperArray.splice(t,1)),this.setPrimitiveIds(Array.from(this.primitives,s=>s.id))}remove(){this._pane.series_map.delete(this._series),this._pane.chart.removeSeries(this._series)}change_series_type(t,e){if(t===this.s_type)return;const s=this._pane.get_series_index(this._series),n=this._pane.chart.timeScale().getVisibleRange();this.remove(),this._series=this._create_series(t),this._series.setData(e),this.s_type=t,this._pane.series_map.set(this._series,this),this._pane.reorder_series(-1,s,!1),n!==null&&this._pane.chart.timeScale().setVisibleRange(n)}move_to_pane(t){}priceScale(){return this._series.priceScale()}applyOptions(t){this._series.applyOptions(t)}options(){return this._series.options()}data(){return this._series.data()}update(t){this._series.update(t)}setData(t){this._series.setData(t)}prependData(t){const e=this._pane.chart.timeScale().getVisibleRange();this._series.setData([...t,...this._series.data()]),e!==null&&this._pane.chart.timeScale().setVisibleRange(e)}markers(){return Array.from(this._markers.values())}_updateMarkers(){this._series.setMarkers(this.markers())}updateMarker(t,e){this._markers.set(t,e),this._updateMarkers()}removeMarker(t){this._markers.delete(t)&&this._updateMarkers()}filterMarkers(t){t.forEach(e=>this._markers.delete(e)),this._updateMarkers()}removeAllMarkers(){this._markers=new Map,this._updateMarkers()}priceLines(){return Array.from(this._pricelines.values())}removePriceLine(t){let e=this._pricelines.get(t);e!==void 0&&(this._series.removePriceLine(e),this._pricelines.delete(t))}updatePriceLine(t,e){let s=this._pricelines.get(t);s!==void 0&&s.applyOptions(e)}removeAllPriceLines(){this._series.Ls.Il=[],this._pricelines=new Map}createPriceLine(t,e){this._pricelines.set(t,this._series.createPriceLine(e))}filterPriceLines(t){t.forEach(this.removePriceLine.bind(this))}get primitiveWrapperArray(){return this._series.Ls.jl}get primitives(){return Array.from(this.primitiveWrapperArray,t=>t.Dl)}attachPrimitive(t){this._series.attachPrimitive(t),this.setPrimitiveIds([...this.primitiveIds(),t._id])}detachPrimitive(t){this._series.detachPrimitive(t),this.setPrimitiveIds(this.primitiveIds().filter(e=>e!==t._id))}priceToCoordinate(t){return this._series.priceToCoordinate(t)}coordinateToPrice(t){return this._series.coordinateToPrice(t)}}var hu=y("<form class=style_form><div class=series_style_selector>"),au=y("<div class=style_selector_row>"),cu=y("<div class=style_selector_row><label for=invertFilledArea></label><label for=topColor></label><label for=bottomColor>"),uu=y("<div class=style_selector_row><label for=base></label><input id=base type=number><label for=color>"),du=y("<div class=style_selector_row><label for=baseValue></label><input id=baseValue type=number>"),fu=y("<div class=style_selector_row><label for=topLineColor></label><label for=topFillColor1></label><label for=topFillColor2>"),gu=y("<div class=style_selector_row><label for=bottomLineColor></label><label for=bottomFillColor1></label><label for=bottomFillColor2>"),mu=y("<div class=style_selector_row><label for=lineVisible>"),pu=y("<div class=style_selector_row><label for=thinBars></label><label for=openVisible></label><span></span> "),vu=y("<span class=tooltip><span class=tooltiptext></span><input type=checkbox>"),_u=y("<div class=style_selector_row><label for=visible></label><span class=opts-select><label>"),bu=y("<div class=style_selector_row><label>"),wu=y("<div class=style_selector_row><label for=lastValueVisible></label><input type=text id=title>"),yu=y("<div class=style_selector_row><label for=priceLineVisible>"),xu=y("<div class=style_selector_row><label for=pointMarkersVisible></label><label for=pointMarkersRadius>"),Su=y("<div class=style_selector_row><label for=crosshairMarkerVisible></label><label for=crosshairMarkerRadius></label><label for=crosshairMarkerBorderWidth>"),Mu=y("<div class=style_selector_row><label></label><span></span><label for=upColor></label><label for=downColor>"),Cu=y("<div class=style_selector_row><label for=wickVisible></label><span></span><label for=wickUpColor></label><label for=wickDownColor>"),$u=y("<div class=style_selector_row><label for=borderVisible></label><span></span><label for=borderUpColor></label><label for=borderDownColor>"),Eu=y("<input type=checkbox>"),ku=y("<input type=number step=any min=1 max=10>"),Js=y("<span class=select-span><select>"),Qs=y("<option>");function Lu(i){let t=document.createElement("form");const[e,s]=C(i.series.options());let n=i.series.s_type;const r=n===it.LINE||n===it.AREA||n===it.BASELINE;let o={priceline:C(!1),markers:r?C(!1):void 0,crosshair:r?C(!1):void 0};X(Tt(Object.values(o).map(h=>h?h[0]:void 0).filter(h=>h!==void 0),()=>s(i.series.options())));const l={submit:()=>t.requestSubmit(),...o};return(()=>{var h=hu(),a=h.firstChild;lt(h,"submit",Tu.bind(void 0,i.series));var c=t;return typeof c=="function"?q(c,h):t=h,v(a,d(Vu,{get name(){return i.name},get visible(){return e().visible},get submit(){return l.submit},signals:o}),null),v(a,d(je,{get children(){return[d(nt,{get when(){return i.series.s_type===it.LINE},get children(){return d(Pu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.AREA},get children(){return d(zu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.HISTOGRAM},get children(){return d(Du,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.BASELINE},get children(){return d(Au,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.BAR},get children(){return d(Iu,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.CANDLESTICK},get children(){return d(Ou,A({get opts(){return e()}},l))}}),d(nt,{get when(){return i.series.s_type===it.ROUNDED_CANDLE},get children(){return d(Ru,A({get opts(){return e()}},l))}})]}}),null),v(a,d(Wu,{get show_price_line(){return o.priceline?.[0]()??!1},get submit(){return l.submit},get options(){return e()}}),null),h})()}function Tu(i,t){if(t.preventDefault(),t.target!==null){let e=Array.from(t.target.querySelectorAll("input, select"));e=e.filter(o=>o.id!==""),i.applyOptions(Object.fromEntries(Array.from(e,o=>{switch(o.getAttribute("type")){case"checkbox":return[o.id,o.checked];case null:return[o.id,parseInt(o.value)];case"number":return o.id==="baseValue"?[o.id,{type:"price",price:parseFloat(o.value)}]:[o.id,parseFloat(o.value)];case"color_picker":return[o.id,o.value==="#00000000"?"":o.value];default:return[o.id,o.value]}})));const s=i._pane.id.split("_"),n=s.slice(0,4).join("_"),r=s.slice(0,2).join("_");window.api.update_series_options(r,n,i._indicator_id,i.id,i.options())}}function Pu(i){return[d(Eo,{keys:["Plot Line: ","lineVisible","color","lineWidth","lineStyle","lineType"],get vis(){return i.opts.lineVisible},get color(){return i.opts.color},get width(){return i.opts.lineWidth},get style(){return i.opts.lineStyle},get type(){return i.opts.lineType},get submit(){return i.submit}}),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function zu(i){return[(()=>{var t=au();return t.innerText="Area Series",t})(),d(Eo,{keys:["Line: ","lineVisible","lineColor","lineWidth","lineStyle","lineType"],get vis(){return i.opts.lineVisible},get color(){return i.opts.lineColor},get width(){return i.opts.lineWidth},get style(){return i.opts.lineStyle},get type(){return i.opts.lineType},get submit(){return i.submit}}),(()=>{var t=cu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Invert: ",v(t,d(St,{key:"invertFilledArea",get checked(){return i.opts.invertFilledArea},get submit(){return i.submit}}),s),s.innerText="Top Color: ",v(t,d(rt,{key:"topColor",get default(){return i.opts.topColor},get submit(){return i.submit}}),n),n.innerText="Bottom Color: ",v(t,d(rt,{key:"bottomColor",get default(){return i.opts.bottomColor},get submit(){return i.submit}}),null),t})(),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function Du(i){return(()=>{var t=uu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Base Value: ",lt(s,"input",i.submit,!0),s.style.setProperty("width","auto"),n.innerText="Color: ",n.style.setProperty("margin-left","18px"),v(t,d(rt,{key:"color",get default(){return i.opts.color},get submit(){return i.submit}}),null),k(()=>s.value=i.opts.base),t})()}function Au(i){return[(()=>{var t=du(),e=t.firstChild,s=e.nextSibling;return e.innerText="Base Price: ",lt(s,"input",i.submit,!0),s.style.setProperty("width","auto"),k(()=>s.value=i.opts.baseValue.price),t})(),(()=>{var t=fu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Top Line:",e.style.setProperty("margin-right","27px"),v(t,d(rt,{key:"topLineColor",get default(){return i.opts.topLineColor},get submit(){return i.submit}}),s),s.innerText="Fill 1:",s.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"topFillColor1",get default(){return i.opts.topFillColor1},get submit(){return i.submit}}),n),n.innerText="Fill 2:",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"topFillColor2",get default(){return i.opts.topFillColor2},get submit(){return i.submit}}),null),t})(),(()=>{var t=gu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Bottom Line: ",v(t,d(rt,{key:"bottomLineColor",get default(){return i.opts.bottomLineColor},get submit(){return i.submit}}),s),s.innerText="Fill 1:",s.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"bottomFillColor1",get default(){return i.opts.bottomFillColor1},get submit(){return i.submit}}),n),n.innerText="Fill 2:",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"bottomFillColor2",get default(){return i.opts.bottomFillColor2},get submit(){return i.submit}}),null),t})(),(()=>{var t=mu(),e=t.firstChild;return e.innerText="Line: ",v(t,d(St,{key:"lineVisible",get checked(){return i.opts.lineVisible},get submit(){return i.submit}}),null),v(t,d(ye,{key:"lineWidth",get default(){return i.opts.lineWidth},get submit(){return i.submit}}),null),v(t,d(Lo,{key:"lineType",get default(){return i.opts.lineType},get submit(){return i.submit}}),null),v(t,d(nn,{key:"lineStyle",get default(){return i.opts.lineStyle},get submit(){return i.submit}}),null),t})(),d(tn,{get show_adv(){return i.markers?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}}),d(en,{get show_adv(){return i.crosshair?.[0]()??!1},get submit(){return i.submit},get options(){return i.opts}})]}function Iu(i){return[(()=>{var t=pu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Thin Bars: ",v(t,d(St,{key:"thinBars",get checked(){return i.opts.thinBars},get submit(){return i.submit}}),s),s.innerText="Show Open:",s.style.setProperty("margin-left","12px"),v(t,d(St,{key:"openVisible",get checked(){return i.opts.openVisible},get submit(){return i.submit}}),n),t})(),d(sn,{get submit(){return i.submit},get opts(){return i.opts}})]}function Ou(i){return[d(sn,{get submit(){return i.submit},get opts(){return i.opts}}),d(ko,{get submit(){return i.submit},get opts(){return i.opts}}),d(ju,{get submit(){return i.submit},get opts(){return i.opts}})]}function Ru(i){return[d(sn,{get submit(){return i.submit},get opts(){return i.opts}}),d(ko,{get submit(){return i.submit},get opts(){return i.opts}})]}function hs(i){return d(j,{get when(){return i.signal},get children(){var t=vu(),e=t.firstChild,s=e.nextSibling;return s.$$input=n=>i.signal?.[1](n.target.checked),k(()=>e.innerText=i.tip),k(()=>s.checked=i.signal?.[0]()),t}})}function Vu(i){return(()=>{var t=_u(),e=t.firstChild,s=e.nextSibling,n=s.firstChild;return v(t,d(St,{key:"visible",get checked(){return i.visible},get submit(){return i.submit}}),s),v(s,d(hs,{get signal(){return i.signals.priceline},tip:"Price Line & Label"}),n),v(s,d(hs,{get signal(){return i.signals.crosshair},tip:"Crosshair Marker"}),n),v(s,d(hs,{get signal(){return i.signals.markers},tip:"Data Markers"}),n),n.innerText="Adv. Opts:",k(()=>e.innerText=i.name),t})()}function Wu(i){return[d(Nu,{get visible(){return i.options.priceLineVisible},get color(){return i.options.priceLineColor},get width(){return i.options.priceLineWidth},get style(){return i.options.priceLineStyle},get source(){return i.options.priceLineSource},get show_adv(){return i.show_price_line},get submit(){return i.submit}}),d(Bu,{get show_adv(){return i.show_price_line},get title(){return i.options.title},get visible(){return i.options.lastValueVisible},get submit(){return i.submit}})]}function Eo(i){return(()=>{var t=bu(),e=t.firstChild;return v(t,d(St,{get key(){return i.keys[1]},get checked(){return i.vis},get submit(){return i.submit}}),null),v(t,d(rt,{get key(){return i.keys[2]},get default(){return i.color},get submit(){return i.submit}}),null),v(t,d(ye,{get key(){return i.keys[3]},get default(){return i.width},get submit(){return i.submit}}),null),v(t,d(Lo,{get key(){return i.keys[5]},get default(){return i.type},get submit(){return i.submit}}),null),v(t,d(nn,{get key(){return i.keys[4]},get default(){return i.style},get submit(){return i.submit}}),null),k(s=>{var n=i.keys[1],r=i.keys[0];return n!==s.e&&H(e,"for",s.e=n),r!==s.t&&(e.innerText=s.t=r),s},{e:void 0,t:void 0}),t})()}function Bu(i){return d(j,{get when(){return i.show_adv},get children(){var t=wu(),e=t.firstChild,s=e.nextSibling;return e.innerText="Price Label:",v(t,d(St,{key:"lastValueVisible",get checked(){return i.visible},get submit(){return i.submit}}),s),lt(s,"input",i.submit,!0),k(()=>s.value=i.title),t}})}function Nu(i){return d(j,{get when(){return i.show_adv},get children(){var t=yu(),e=t.firstChild;return e.innerText="Price Line:",v(t,d(St,{key:"priceLineVisible",get checked(){return i.visible},get submit(){return i.submit}}),null),v(t,d(rt,{key:"priceLineColor",get default(){return i.color},get submit(){return i.submit}}),null),v(t,d(ye,{key:"priceLineWidth",get default(){return i.width},get submit(){return i.submit}}),null),v(t,d(Fu,{key:"priceLineSource",get default(){return i.source},get submit(){return i.submit}}),null),v(t,d(nn,{key:"priceLineStyle",get default(){return i.style},get submit(){return i.submit}}),null),t}})}function tn(i){return d(j,{get when(){return i.show_adv},get children(){var t=xu(),e=t.firstChild,s=e.nextSibling;return e.innerText="Data Markers:",v(t,d(St,{key:"pointMarkersVisible",get checked(){return i.options.pointMarkersVisible},get submit(){return i.submit}}),s),s.innerText="Radius:",v(t,d(ye,{key:"pointMarkersRadius",get default(){return i.options.pointMarkersRadius??2.5},get submit(){return i.submit}}),null),t}})}function en(i){return d(j,{get when(){return i.show_adv},get children(){var t=Su(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling;return e.innerText="Crosshair Mark:",v(t,d(St,{key:"crosshairMarkerVisible",get checked(){return i.options.crosshairMarkerVisible},get submit(){return i.submit}}),s),s.innerText="Inner:",v(t,d(ye,{key:"crosshairMarkerRadius",get default(){return i.options.crosshairMarkerRadius},get submit(){return i.submit}}),n),v(t,d(rt,{key:"crosshairMarkerBackgroundColor",get default(){return i.options.crosshairMarkerBackgroundColor},get submit(){return i.submit}}),n),n.innerText="Outer:",v(t,d(ye,{key:"crosshairMarkerBorderWidth",get default(){return i.options.crosshairMarkerBorderWidth},get submit(){return i.submit}}),null),v(t,d(rt,{key:"crosshairMarkerBorderColor",get default(){return i.options.crosshairMarkerBorderColor},get submit(){return i.submit}}),null),t}})}function sn(i){return(()=>{var t=Mu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Body: ",s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",v(t,d(rt,{key:"upColor",get default(){return i.opts.upColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"downColor",get default(){return i.opts.downColor},get submit(){return i.submit}}),null),t})()}function ko(i){return(()=>{var t=Cu(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Wick:",v(t,d(St,{key:"wickVisible",get checked(){return i.opts.wickVisible},get submit(){return i.submit}}),s),s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"wickUpColor",get default(){return i.opts.wickUpColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"wickDownColor",get default(){return i.opts.wickDownColor},get submit(){return i.submit}}),null),t})()}function ju(i){return(()=>{var t=$u(),e=t.firstChild,s=e.nextSibling,n=s.nextSibling,r=n.nextSibling;return e.innerText="Border:",v(t,d(St,{key:"borderVisible",get checked(){return i.opts.borderVisible},get submit(){return i.submit}}),s),s.style.setProperty("flex-grow","1"),n.innerText="Up Color: ",n.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"borderUpColor",get default(){return i.opts.borderUpColor},get submit(){return i.submit}}),r),r.innerText="Down Color:",r.style.setProperty("margin-left","12px"),v(t,d(rt,{key:"borderDownColor",get default(){return i.opts.borderDownColor},get submit(){return i.submit}}),null),t})()}function St(i){return(()=>{var t=Eu();return lt(t,"input",i.submit,!0),k(()=>H(t,"id",i.key)),k(()=>t.checked=i.checked),t})()}function ye(i){return(()=>{var t=ku();return lt(t,"input",i.submit,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=i.default),t})()}function nn(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries(Ms)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function Lo(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries(Ss)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function Fu(i){return(()=>{var t=Js(),e=t.firstChild;return lt(e,"input",i.submit,!0),v(e,d(N,{get each(){return Object.entries($s)},children:([s,n])=>{if(typeof n=="number")return(()=>{var r=Qs();return r.value=n,r.innerText=s,k(()=>r.selected=i.default===n?!0:void 0),r})()}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),k(()=>e.value=i.default),t})()}function rt(i){return d(Jr,{get id(){return i.key},get input_id(){return i.key},get init_color(){return i.default},class:"color_input_wrapper",get onInput(){return i.submit}})}Mt(["input"]);var Uu=y("<div class=title_box><h2>"),Hu=y("<div class=form_wrapper><form class=input_form></form><div class=footer><input type=submit value=Apply>"),Xu=y("<div class=group><h3>"),Ku=y("<div class=inline>"),qu=y("<datalist>"),Gu=y("<span class=tooltip><span class=tooltiptext>"),Yu=y("<div class=input_block><label>"),rn=y("<option>"),Zu=y("<input type=checkbox>"),Ju=y("<input type=text>"),Qu=y("<input type=datetime-local>"),td=y("<input>"),To=y("<span class=select-span><select>"),ed=y("<div class=form_wrapper><div class=footer><input type=submit value=Apply>");function id(i){const[t,e]=C({x:0,y:0}),s=()=>{e({x:window.innerWidth*.7,y:window.innerHeight*.2})},n={series:i.parent_ind.series},[r]=tt(i,["id","parent_ind","menu_struct","options","sources","container_id","frame_id","indicator_id","parent_ind"]);return d(Gt,{get id(){return i.id},get location(){return t()},setLocation:e,classList:{indicator_opts:!0},get location_ref(){return Xt.CENTER},updateLocation:s,get drag_handle(){return`#${i.id}>.title_box`},get bounding_client_id(){return`#${i.id}>.title_box`},get children(){return[(()=>{var o=Uu(),l=o.firstChild;return v(l,()=>i.parent_ind.type+" • "+i.parent_ind.name+(i.parent_ind.name!==""?" • ":"")+"Options"),v(o,d(O,{get icon(){return b.close},force_reload:!0,get onClick(){return i.close_menu}}),null),o})(),d(wh,{get overlay_id(){return i.id},style:{padding:"2px 6px",margin:"12px","margin-top":"0px","border-bottom":"2px solid var(--background-fill)"},tabs:{Inputs:()=>d(sd,r),Style:()=>d(gd,n)}})]}})}function sd(i){const[t]=tt(i,["sources","options","parent_ind","indicator_id"]);let e=document.createElement("form");const s=()=>e.requestSubmit(),n=nd.bind(void 0,i.container_id,i.frame_id,i.parent_ind);return(()=>{var r=Hu(),o=r.firstChild,l=o.nextSibling,h=l.firstChild;o.addEventListener("keypress",c=>{c.key==="Enter"&&s()}),lt(o,"submit",n);var a=e;return typeof a=="function"?q(a,o):e=o,v(o,d(N,{get each(){return Object.entries(i.menu_struct)},children:([c,[u,f]])=>d(je,{get fallback(){return d(on,A({key:c,type:u,params:f,submit:s},t))},get children(){return[d(nt,{when:u==="group",get children(){return d(rd,A({title:c,params:f,submit:s},t))}}),d(nt,{when:u==="inline",get children(){return d(Po,A({title:c,params:f,submit:s},t))}})]}})})),h.$$click=s,r})()}function nd(i,t,e,s){if(s.preventDefault(),s.target!==null){let n=Array.from(s.target.querySelectorAll("input, select"));n=n.filter(o=>o.id!=="");let r=Object.fromEntries(Array.from(n,o=>{switch(o.getAttribute("type")){case"checkbox":return[o.id,o.checked];case"number":case"range":return[o.id,parseFloat(o.value)];default:return[o.id,o.value]}}));e.applyOptions(r),window.api.set_indicator_options(i,t,e.id,r)}}function rd(i){const[t]=tt(i,["sources","options","indicator_id","submit"]);return(()=>{var e=Xu(),s=e.firstChild;return v(e,d(N,{get each(){return Object.entries(i.params)},children:([n,[r,o]])=>d(je,{get fallback(){return d(on,A({key:n,type:r,params:o},t))},get children(){return d(nt,{when:r==="inline",get children(){return d(Po,A({title:n,params:o},t))}})}})}),null),k(()=>s.innerText=i.title),e})()}function Po(i){const[t]=tt(i,["sources","options","indicator_id","submit"]);return(()=>{var e=Ku();return v(e,d(N,{get each(){return Object.entries(i.params)},children:([s,[n,r]])=>d(on,A({key:s,type:n,params:r},t))})),e})()}function on(i){const[,t]=tt(i,["type"]);return(()=>{var e=Yu(),s=e.firstChild;return v(e,d(j,{get when(){return i.params.options&&i.type!=="enum"},get children(){var n=qu();return v(n,d(N,{get each(){return i.params.options},children:r=>(()=>{var o=rn();return o.value=r,o})()})),k(()=>H(n,"id",i.key+"_datalist")),n}}),null),v(e,d(je,{get children(){return[d(nt,{get when(){return i.type==="bool"},get children(){return d(ld,t)}}),d(nt,{get when(){return i.type==="enum"},get children(){return d(ud,t)}}),d(nt,{get when(){return i.type==="source"},get children(){return d(fd,t)}}),d(nt,{get when(){return i.type==="number"},get children(){return d(cd,t)}}),d(nt,{get when(){return i.type==="string"},get children(){return d(hd,t)}}),d(nt,{get when(){return i.type==="timestamp"},get children(){return d(ad,t)}}),d(nt,{get when(){return i.type==="color"},get children(){return d(dd,t)}})]}}),null),v(e,d(j,{get when(){return i.params.tooltip},get children(){var n=Gu(),r=n.firstChild;return v(n,d(Ie,{text:"?"}),r),k(()=>r.innerHTML=i.params.tooltip),n}}),null),k(n=>{var r=i.key,o=i.params.title+(i.params.title!==""?": ":"");return r!==n.e&&H(s,"for",n.e=r),o!==n.t&&(s.innerText=n.t=o),n},{e:void 0,t:void 0}),e})()}function si(i){return String(i).padStart(2,"0")}function od(i){let t=new Date(i*1e3);return[t.getUTCFullYear(),"-",si(t.getUTCMonth()+1),"-",si(t.getUTCDate()),"T",si(t.getUTCHours()),":",si(t.getUTCMinutes())].join("")}function ld(i){return(()=>{var t=Zu();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.checked=i.options[i.key]??!1),t})()}function hd(i){return(()=>{var t=Ju();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=i.options[i.key]),t})()}function ad(i){return(()=>{var t=Qu();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(()=>H(t,"id",i.key)),k(()=>t.value=od(i.options[i.key])),t})()}function cd(i){return(()=>{var t=td();return lt(t,"input",i.params.autosend?i.submit:void 0,!0),k(e=>{var s=i.key,n=i.params.slider?"range":"number",r=i.params.max,o=i.params.min,l=i.params.step,h=i.params.options?i.key+"_datalist":void 0;return s!==e.e&&H(t,"id",e.e=s),n!==e.t&&H(t,"type",e.t=n),r!==e.a&&H(t,"max",e.a=r),o!==e.o&&H(t,"min",e.o=o),l!==e.i&&H(t,"step",e.i=l),h!==e.n&&H(t,"list",e.n=h),e},{e:void 0,t:void 0,a:void 0,o:void 0,i:void 0,n:void 0}),k(()=>t.value=i.options[i.key]),t})()}function ud(i){return(()=>{var t=To(),e=t.firstChild;return lt(e,"input",i.params.autosend?i.submit:void 0,!0),v(e,d(N,{get each(){return i.params.options},children:s=>(()=>{var n=rn();return n.value=s,n.innerText=s,k(()=>n.selected=s==i.options[i.key]?!0:void 0),n})()})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),t})()}function dd(i){return d(Jr,{get id(){return i.key},get input_id(){return i.key},get init_color(){return i.options[i.key]},class:"color_input_wrapper",get onInput(){return i.params.autosend?i.submit:void 0}})}function fd(i){return(()=>{var t=To(),e=t.firstChild;return lt(e,"input",i.params.autosend?i.submit:void 0,!0),H(e,"type","source"),v(e,d(N,{get each(){return i.sources()},children:({indicator:s,function_name:n,source_type:r})=>{if(i.indicator_id!==s.id){if(r!==i.params.src_type&&r!=="any"&&i.params.src_type!=="any")return;{let o=[s.id,n].join(":");return(()=>{var l=rn();return l.value=o,k(h=>{var a=[s.type,s.name,n].join(":"),c=o==i.options[i.key]?!0:void 0;return a!==h.e&&(l.innerText=h.e=a),c!==h.t&&(l.selected=h.t=c),h},{e:void 0,t:void 0}),l})()}}}})),v(t,d(O,{get icon(){return b.menu_arrow_ns}}),null),k(()=>H(e,"id",i.key)),t})()}function gd(i){let t=document.createElement("div");const e=()=>{t.querySelectorAll("form").forEach(s=>s.requestSubmit())};return(()=>{var s=ed(),n=s.firstChild,r=n.firstChild,o=t;return typeof o=="function"?q(o,s):t=s,v(s,d(N,{get each(){return Array.from(i.series.entries())},children:([l,h],a)=>{let c=i.series.get(l);if(c!==void 0)return d(Lu,{series:c,get name(){return c._name??`Series #${a()+1}`}})}}),n),r.$$click=e,s})()}Mt(["click","input"]);function Mr(i){if(i===void 0)throw new Error("Value is undefined");return i}class md{_pane;_chart;_series;_id="";_type="null";_options;obj_tree_el;_requestUpdate;requestUpdate(){this._requestUpdate&&this._requestUpdate()}constructor(t,e,s){this._id=t,this._type=e,this._options=s}get id(){return this._id}get chart(){return Mr(this._chart)}get series(){return Mr(this._series)}options(){return structuredClone(this._options)}applyOptions(t){t!==void 0&&(this._options={...this._options,...t}),this.requestUpdate()}attached({chart:t,series:e,requestUpdate:s}){this._chart=t,this._series=e,this._options.tangible&&(this.onDataUpdate&&this._series.subscribeDataChanged(this._fireDataUpdated),this.onClick&&this._chart.subscribeClick(this._fireClick),this.onDblClick&&this._chart.subscribeDblClick(this._fireDblClick),this.onCrosshairMove&&this._chart.subscribeCrosshairMove(this._fireCrosshairMove),this.onMouseDown&&this._chart.chartElement().addEventListener("mousedown",this._fireMouseDown),this.onMouseUp&&this._chart.chartElement().addEventListener("mouseup",this._fireMouseUp)),this._requestUpdate=s,this.requestUpdate()}detached(){this.onDataUpdate&&this._series?.unsubscribeDataChanged(this._fireDataUpdated),this.onClick&&this._chart?.unsubscribeClick(this._fireClick),this.onDblClick&&this._chart?.unsubscribeDblClick(this._fireDblClick),this.onCrosshairMove&&this._chart?.unsubscribeCrosshairMove(this._fireCrosshairMove),this.onMouseDown&&this._chart?.chartElement().removeEventListener("mousedown",this._fireMouseDown),this.onMouseUp&&this._chart?.chartElement().removeEventListener("mouseup",this._fireMouseUp),this._chart=void 0,this._series=void 0,this._requestUpdate=void 0}_fireDataUpdated=t=>{this.onDataUpdate&&this.onDataUpdate(t)};_fireMouseDown=t=>{this.onMouseDown&&this._pane&&this.onMouseDown(this._pane.make_event_params(t))};_fireMouseUp=t=>{this.onMouseUp&&this._pane&&this.onMouseUp(this._pane.make_event_params(t))};_fireClick=t=>{this.onClick&&this.onClick(t)};_fireDblClick=t=>{this.onDblClick&&this.onDblClick(t)};_fireCrosshairMove=t=>{this.onCrosshairMove&&this.onCrosshairMove(t)};movePoint(t,e,s){let n=this.chart.timeScale().timeToCoordinate(t.time),r=this.series.priceToCoordinate(t.value);if(!n||!r)return null;let o=this.chart.timeScale().coordinateToLogical(n);if(!o||(n=this.chart.timeScale().logicalToCoordinate(o+e),!n))return null;let l=this.chart.timeScale().coordinateToTime(n),h=this.series.coordinateToPrice(r+s);return!l||!h?null:{time:l,value:h}}nearestBarTime(t,e=!0){let s=this._chart?.timeScale().kl._u;if(s===void 0)return null;const n=Array.from(s,o=>o.originalTime);let r=oh(n,t,(o,l)=>o-l);return r>=0?n[r]:e?n[-r]:n[Math.min(-r+1,n.length-1)]}}const pd=getComputedStyle(document.body).getPropertyValue("--layout-main-fill"),vd=getComputedStyle(document.body).getPropertyValue("--accent-color");function Cr(i,t,e=!1,s=pd,n=vd){i.beginPath(),i.ellipse(t.x,t.y,6,6,0,0,Math.PI*2),i.fillStyle=n,i.fill(),i.beginPath(),i.ellipse(t.x,t.y,e?4:5,e?4:5,0,0,Math.PI*2),i.fillStyle=s,i.fill()}const $r={visible:!0,tangible:!0,autoscale:!1,width:1,lineColor:"rgb(255, 0, 0)"};class zo extends md{_p1;_p2;_paneView;_options=$r;constructor(t,e){super(t,"TrendLine",{...$r,...e.options}),this._p1=e.p1,this._p2=e.p2,this._paneView=new _d(this)}_pointIndex(t){const e=this.chart.timeScale();return e.coordinateToLogical(e.timeToCoordinate(t.time)??-1)}updateData(t){t.p1!==null&&(this._p1=t.p1),t.p2!==null&&(this._p2=t.p2),this.applyOptions(t.options)}paneViews(){return[this._paneView]}updateAllViews(){this._paneView.update()}autoscaleInfo(t,e){if(!this._options.autoscale||!this._options.visible||this._p1===null||this._p2===null)return null;const s=this._pointIndex(this._p1),n=this._pointIndex(this._p2);return s===null||n===null||e<s||t>n?null:{priceRange:{minValue:Math.min(this._p1.value,this._p2.value),maxValue:Math.max(this._p1.value,this._p2.value)}}}hitTest(t,e){return this._paneView.hitTest(t,e)}onMouseDown(t){if(!this._options.visible||!this._options.tangible)return;const e=t.hoveredObjectId;if(!e||!e.startsWith(this.id)||!t.sourceEvent||!t.logical){this._paneView._selected=!1;return}let s;if(e===this._id)s=this.mouseMoveWholeLine.bind(this,{x:t.logical,y:t.sourceEvent.localY});else if(e===this._id+"_p1")s=this.mouseMoveEndPoint.bind(this,!0);else if(e===this._id+"_p2")s=this.mouseMoveEndPoint.bind(this,!1);else return;this._paneView._selected=!0;const n=this.chart,r=n.options().handleScroll.valueOf();let o;typeof r=="boolean"?o=r:o=r.pressedMouseMove,n.applyOptions({handleScroll:{pressedMouseMove:!1}}),s=s.bind(this),n.subscribeCrosshairMove(s),document.addEventListener("mouseup",()=>{n.unsubscribeCrosshairMove(s),n.applyOptions({handleScroll:{pressedMouseMove:o}})},{once:!0})}onClick(t){if(!(!this._options.visible||!this._options.tangible))switch(t.hoveredObjectId){case this._id+"_p1":console.log("clicked p1");break;case this._id+"_p2":console.log("clicked p2");break;case this._id:console.log("clicked line");break}}mouseMoveEndPoint(t,e){if(!e.sourceEvent)return;let s=this.chart.timeScale().coordinateToTime(e.sourceEvent.localX),n=this.series.coordinateToPrice(e.sourceEvent.localY);s&&n&&(t?this.updateData({p1:{time:s,value:n},p2:null}):this.updateData({p1:null,p2:{time:s,value:n}}))}mouseMoveWholeLine(t,e){if(!e.logical||!e.sourceEvent||!this._p1||!this._p2)return;let s=e.logical-t.x,n=e.sourceEvent.localY-t.y,r=this.movePoint(this._p1,s,n),o=this.movePoint(this._p2,s,n);!r||!o||(this.updateData({p1:r,p2:o}),t.x=e.logical,t.y=e.sourceEvent.localY)}}class _d{_p1=null;_p2=null;_source;_hovered=!1;_selected=!1;_renderer;line=null;ctx=null;constructor(t){this._source=t,this._renderer=new bd(this._source._options,this.passback.bind(this))}update(){if(this._source._p1===null||this._source._p2===null)return;const t=this._source.series,e=this._source.chart.timeScale();let s=t.priceToCoordinate(this._source._p1.value),n=t.priceToCoordinate(this._source._p2.value),r=e.timeToCoordinate(this._source._p1.time),o=e.timeToCoordinate(this._source._p2.time);if(r===null){let l=this._source.nearestBarTime(this._source._p1.time);l!==null&&(r=e.timeToCoordinate(l),this._source._p1.time=l)}if(o===null){let l=this._source.nearestBarTime(this._source._p2.time);l!==null&&(o=e.timeToCoordinate(l),this._source._p2.time=l)}if(r===null||o===null||s===null||n===null){this._p1=null,this._p2=null;return}this._p1={x:Math.round(r),y:Math.round(s)},this._p2={x:Math.round(o),y:Math.round(n)}}renderer(){return this._renderer._update(this._p1,this._p2,this._hovered,this._selected,this._source._options),this._renderer}passback(t,e){this.ctx=t,this.line=e}hitTest(t,e){return this.line===null||this.ctx===null||this._p1===null||this._p2===null||!this._source._options.tangible||!this._source._options.visible||(this._hovered=!1,!(t+10>this._p1.x&&t-10<this._p2.x||t-10<this._p1.x&&t+10>this._p2.x))||!(e+10>this._p1.y&&e-10<this._p2.y||e-10<this._p1.y&&e+10>this._p2.y)?null:Math.abs(this._p1.x-t)<10&&Math.abs(this._p1.y-e)<10?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id+"_p1",zOrder:"normal"}):Math.abs(this._p2.x-t)<10&&Math.abs(this._p2.y-e)<10?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id+"_p2",zOrder:"normal"}):(this.ctx.lineWidth=Math.max(this._source._options.width,6),this.ctx.isPointInStroke(this.line,t,e)?(this._hovered=!0,{cursorStyle:"grab",externalId:this._source._id,zOrder:"normal"}):null)}}class bd{_p1=null;_p2=null;_hovered=!1;_selected=!1;_options;_passback;constructor(t,e){this._options=t,this._passback=e}draw(t){t.useMediaCoordinateSpace(e=>{const s=e.context;if(this._p1===null||this._p2===null)this._passback(s,null);else{let n=new Path2D;n.moveTo(this._p1.x,this._p1.y),n.lineTo(this._p2.x,this._p2.y),s.lineWidth=this._options.width,s.strokeStyle=this._options.lineColor,s.stroke(n),(this._hovered||this._selected)&&(Cr(s,this._p1,this._selected),Cr(s,this._p2,this._selected)),this._passback(s,n)}})}_update(t,e,s,n,r){this._p1=t,this._p2=e,this._options=r,this._hovered=s,this._selected=n}}const Do=new Map([["TrendLine",zo]]);class wd{id;type;name;pane;objVisibility;labelHtml;setLabelHtml;menu_id;menu_struct;setOptions;sources;menuVisibility;setMenuVisibility;series=new Map;visiblity=new Map;primitives=new Map;constructor(t,e,s,n,r){this.id=t,this.name=s,this.pane=r,this.type=e,this.sources=n;const o=C(!0);this.objVisibility=o,this.setVisibility.bind(this);const l=C(void 0);this.labelHtml=l[0],this.setLabelHtml=l[1],this.pane.attach_indicator_to_legend(this)}setLabel(t){this.setLabelHtml(t!==""?t:void 0)}move_to_pane(t){}delete(){this.series.forEach((t,e)=>{t.remove()}),this.primitives.forEach((t,e)=>{this.pane.whitespace_series.detachPrimitive(t)}),this.pane.detach_indicator_from_legend(this)}setVisibility(t){this.objVisibility[1](t);const e=[this.series,this.primitives];for(let s=0;s<e.length;s++)if(t)for(const[n,r]of e[s].entries())r.applyOptions({visible:this.visiblity.get(n)??!0});else for(const[n,r]of e[s].entries())this.visiblity.set(n,r.options().visible),r.applyOptions({visible:!1})}add_series(t,e,s=void 0){this.series.set(t,new $o(t,this.id,s,this.name!==""?this.name:this.type,e,this.pane))}remove_series(t){let e=this.series.get(t);e!==void 0&&(e.remove(),this.series.delete(t))}add_primitive(t,e,s){let n=Do.get(e);if(n===void 0)return;let r=new n(this.id+t,s);this.primitives.set(t,r),this.pane.whitespace_series.attachPrimitive(r)}remove_primitive(t){let e=this.primitives.get(t);e!==void 0&&(this.pane.whitespace_series.detachPrimitive(e),this.primitives.delete(t))}update_primitive(t,e){let s=this.primitives.get(t);s!==void 0&&s.updateData(e)}applyOptions(t){this.setOptions&&this.setOptions(t)}set_menu_struct(t,e){if(this.menu_id!==void 0){this.setOptions&&this.setOptions(e);return}const s=C(!1);this.menuVisibility=s[0],this.setMenuVisibility=s[1];const[n,r]=Ct(e);this.setOptions=r,this.menu_struct=t,this.menu_id=`${this.pane.id}_${this.id}_options`,gt().attachOverlay(this.menu_id,void 0,s),gt().attachOverlay(this.menu_id,id({id:this.menu_id,parent_ind:this,options:n,menu_struct:this.menu_struct,close_menu:()=>s[1](!1),sources:this.sources,container_id:this.pane.id.substring(0,6),frame_id:this.pane.id.substring(0,13),indicator_id:this.id}),s)}}var yd=y("<div>"),Di=class{x;y;width;height;constructor(i){this.x=Math.floor(i.x),this.y=Math.floor(i.y),this.width=Math.floor(i.width),this.height=Math.floor(i.height)}get rect(){return{x:this.x,y:this.y,width:this.width,height:this.height}}get left(){return this.x}get top(){return this.y}get right(){return this.x+this.width}get bottom(){return this.y+this.height}get center(){return{x:this.x+this.width*.5,y:this.y+this.height*.5}}get corners(){return{topLeft:{x:this.left,y:this.top},topRight:{x:this.right,y:this.top},bottomRight:{x:this.left,y:this.bottom},bottomLeft:{x:this.right,y:this.bottom}}}},pe=i=>{let t=new Di(i.getBoundingClientRect());const{transform:e}=getComputedStyle(i);return e&&(t=xd(t,e)),t},xd=(i,t)=>{let e,s;if(t.startsWith("matrix3d(")){const n=t.slice(9,-1).split(/, /);e=+n[12],s=+n[13]}else if(t.startsWith("matrix(")){const n=t.slice(7,-1).split(/, /);e=+n[4],s=+n[5]}else e=0,s=0;return new Di({...i,x:i.x-e,y:i.y-s})},kt=()=>({x:0,y:0}),ln=(i,t)=>i.x===t.x&&i.y===t.y,as=(i,t)=>new Di({...i,x:i.x+t.x,y:i.y+t.y}),Sd=(i,t)=>Math.sqrt(Math.pow(i.x-t.x,2)+Math.pow(i.y-t.y,2)),Md=(i,t)=>{const e=Math.max(i.top,t.top),s=Math.max(i.left,t.left),n=Math.min(i.right,t.right),r=Math.min(i.bottom,t.bottom),o=n-s,l=r-e;if(s<n&&e<r){const h=i.width*i.height,a=t.width*t.height,c=o*l;return c/(h+a-c)}return 0},cs=(i,t)=>i.x===t.x&&i.y===t.y&&i.width===t.width&&i.height===t.height,Cd=(i,t,e)=>{const s=i.transformed.center,n={distance:1/0,droppable:null};for(const r of t){const o=Sd(s,r.layout.center);o<n.distance?(n.distance=o,n.droppable=r):o===n.distance&&r.id===e.activeDroppableId&&(n.droppable=r)}return n.droppable},$d=(i,t,e)=>{const s=i.transformed,n={ratio:0,droppable:null};for(const r of t){const o=Md(s,r.layout);o>n.ratio?(n.ratio=o,n.droppable=r):o>0&&o===n.ratio&&r.id===e.activeDroppableId&&(n.droppable=r)}return n.droppable},Ao=_t(),Ed=i=>{const t=A({collisionDetector:$d},i),[e,s]=Ct({draggables:{},droppables:{},sensors:{},active:{draggableId:null,get draggable(){return e.active.draggableId!==null?e.draggables[e.active.draggableId]:null},droppableId:null,get droppable(){return e.active.droppableId!==null?e.droppables[e.active.droppableId]:null},sensorId:null,get sensor(){return e.active.sensorId!==null?e.sensors[e.active.sensorId]:null},overlay:null}}),n=(S,T,D)=>{S.substring(0,S.length-1),Y(()=>e[S][T])&&s(S,T,"transformers",D.id,D)},r=(S,T,D)=>{S.substring(0,S.length-1),Y(()=>e[S][T])&&Y(()=>e[S][T].transformers[D])&&s(S,T,"transformers",D,void 0)},o=({id:S,node:T,layout:D,data:ot})=>{const B=e.draggables[S],I={id:S,node:T,layout:D,data:ot,_pendingCleanup:!1};let G;if(!B)Object.defineProperties(I,{transformers:{enumerable:!0,configurable:!0,writable:!0,value:{}},transform:{enumerable:!0,configurable:!0,get:()=>{if(e.active.overlay)return kt();const et=Object.values(e.draggables[S].transformers);return et.sort(($t,le)=>$t.order-le.order),et.reduce(($t,le)=>le.callback($t),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>as(e.draggables[S].layout,e.draggables[S].transform)}});else if(e.active.draggableId===S&&!e.active.overlay){const et={x:B.layout.x-D.x,y:B.layout.y-D.y},$t="addDraggable-existing-offset",le=B.transformers[$t],gn=le?le.callback(et):et;G={id:$t,order:100,callback:mn=>({x:mn.x+gn.x,y:mn.y+gn.y})},at(()=>r("draggables",S,$t))}It(()=>{s("draggables",S,I),G&&n("draggables",S,G)}),e.active.draggable&&E()},l=S=>{Y(()=>e.draggables[S])&&(s("draggables",S,"_pendingCleanup",!0),queueMicrotask(()=>h(S)))},h=S=>{if(e.draggables[S]?._pendingCleanup){const T=e.active.draggableId===S;It(()=>{T&&s("active","draggableId",null),s("draggables",S,void 0)})}},a=({id:S,node:T,layout:D,data:ot})=>{const B=e.droppables[S],I={id:S,node:T,layout:D,data:ot,_pendingCleanup:!1};B||Object.defineProperties(I,{transformers:{enumerable:!0,configurable:!0,writable:!0,value:{}},transform:{enumerable:!0,configurable:!0,get:()=>{const G=Object.values(e.droppables[S].transformers);return G.sort((et,$t)=>et.order-$t.order),G.reduce((et,$t)=>$t.callback(et),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>as(e.droppables[S].layout,e.droppables[S].transform)}}),s("droppables",S,I),e.active.draggable&&E()},c=S=>{Y(()=>e.droppables[S])&&(s("droppables",S,"_pendingCleanup",!0),queueMicrotask(()=>u(S)))},u=S=>{if(e.droppables[S]?._pendingCleanup){const T=e.active.droppableId===S;It(()=>{T&&s("active","droppableId",null),s("droppables",S,void 0)})}},f=({id:S,activators:T})=>{s("sensors",S,{id:S,activators:T,coordinates:{origin:{x:0,y:0},current:{x:0,y:0},get delta(){return{x:e.sensors[S].coordinates.current.x-e.sensors[S].coordinates.origin.x,y:e.sensors[S].coordinates.current.y-e.sensors[S].coordinates.origin.y}}}})},m=S=>{if(!Y(()=>e.sensors[S]))return;const T=e.active.sensorId===S;It(()=>{T&&s("active","sensorId",null),s("sensors",S,void 0)})},g=({node:S,layout:T})=>{const D=e.active.overlay,ot={node:S,layout:T};D||Object.defineProperties(ot,{id:{enumerable:!0,configurable:!0,get:()=>e.active.draggable?.id},data:{enumerable:!0,configurable:!0,get:()=>e.active.draggable?.data},transformers:{enumerable:!0,configurable:!0,get:()=>Object.fromEntries(Object.entries(e.active.draggable?e.active.draggable.transformers:{}).filter(([B])=>B!=="addDraggable-existing-offset"))},transform:{enumerable:!0,configurable:!0,get:()=>{const B=Object.values(e.active.overlay?e.active.overlay.transformers:[]);return B.sort((I,G)=>I.order-G.order),B.reduce((I,G)=>G.callback(I),kt())}},transformed:{enumerable:!0,configurable:!0,get:()=>e.active.overlay?as(e.active.overlay.layout,e.active.overlay.transform):new Di({x:0,y:0,width:0,height:0})}}),s("active","overlay",ot)},p=()=>s("active","overlay",null),_=(S,T)=>{It(()=>{s("sensors",S,"coordinates",{origin:{...T},current:{...T}}),s("active","sensorId",S)})},w=S=>{const T=e.active.sensorId;T&&s("sensors",T,"coordinates","current",{...S})},x=()=>s("active","sensorId",null),$=(S,T)=>{const D={};for(const B of Object.values(e.sensors))if(B)for(const[I,G]of Object.entries(B.activators))D[I]??=[],D[I].push({sensor:B,activator:G});const ot={};for(const B in D){let I=B;T&&(I=`on${B}`),ot[I]=G=>{for(const{activator:et}of D[B]){if(e.active.sensor)break;et(G,S)}}}return ot},E=()=>{let S=!1;const T=Object.values(e.draggables),D=Object.values(e.droppables),ot=e.active.overlay;return It(()=>{const B=new WeakMap;for(const I of T)if(I){const G=I.layout;B.has(I.node)||B.set(I.node,pe(I.node));const et=B.get(I.node);cs(G,et)||(s("draggables",I.id,"layout",et),S=!0)}for(const I of D)if(I){const G=I.layout;B.has(I.node)||B.set(I.node,pe(I.node));const et=B.get(I.node);cs(G,et)||(s("droppables",I.id,"layout",et),S=!0)}if(ot){const I=ot.layout,G=pe(ot.node);cs(I,G)||(s("active","overlay","layout",G),S=!0)}}),S},L=()=>{const S=e.active.overlay??e.active.draggable;if(S){const T=t.collisionDetector(S,Object.values(e.droppables),{activeDroppableId:e.active.droppableId}),D=T?T.id:null;e.active.droppableId!==D&&s("active","droppableId",D)}},F=S=>{const T={id:"sensorMove",order:0,callback:D=>e.active.sensor?{x:D.x+e.active.sensor.coordinates.delta.x,y:D.y+e.active.sensor.coordinates.delta.y}:D};E(),It(()=>{s("active","draggableId",S),n("draggables",S,T)}),L()},W=()=>{const S=Y(()=>e.active.draggableId);It(()=>{S!==null&&r("draggables",S,"sensorMove"),s("active",["draggableId","droppableId"],null)}),E()},z=S=>{X(()=>{const T=e.active.draggable;T&&Y(()=>S({draggable:T}))})},R=S=>{X(()=>{const T=e.active.draggable;if(T){const D=Y(()=>e.active.overlay);Object.values(D?D.transform:T.transform),Y(()=>S({draggable:T,overlay:D}))}})},U=S=>{X(()=>{const T=e.active.draggable,D=e.active.droppable;T&&Y(()=>S({draggable:T,droppable:D,overlay:e.active.overlay}))})},at=S=>{X(({previousDraggable:T,previousDroppable:D,previousOverlay:ot})=>{const B=e.active.draggable,I=B?e.active.droppable:null,G=B?e.active.overlay:null;return!B&&T&&Y(()=>S({draggable:T,droppable:D,overlay:ot})),{previousDraggable:B,previousDroppable:I,previousOverlay:G}},{previousDraggable:null,previousDroppable:null,previousOverlay:null})};R(()=>L()),t.onDragStart&&z(t.onDragStart),t.onDragMove&&R(t.onDragMove),t.onDragOver&&U(t.onDragOver),t.onDragEnd&&at(t.onDragEnd);const Zt=[e,{addTransformer:n,removeTransformer:r,addDraggable:o,removeDraggable:l,addDroppable:a,removeDroppable:c,addSensor:f,removeSensor:m,setOverlay:g,clearOverlay:p,recomputeLayouts:E,detectCollisions:L,draggableActivators:$,sensorStart:_,sensorMove:w,sensorEnd:x,dragStart:F,dragEnd:W,onDragStart:z,onDragMove:R,onDragOver:U,onDragEnd:at}];return d(Ao.Provider,{value:Zt,get children(){return t.children}})},Yt=()=>Ut(Ao)||null,kd=(i="pointer-sensor")=>{const[t,{addSensor:e,removeSensor:s,sensorStart:n,sensorMove:r,sensorEnd:o,dragStart:l,dragEnd:h}]=Yt(),a=250,c=10;ft(()=>{e({id:i,activators:{pointerdown:p}})}),vt(()=>{s(i)});const u=()=>t.active.sensorId===i,f={x:0,y:0};let m=null,g=null;const p=(L,F)=>{L.button===0&&(document.addEventListener("pointermove",x),document.addEventListener("pointerup",$),g=F,f.x=L.clientX,f.y=L.clientY,m=window.setTimeout(w,a))},_=()=>{m&&(clearTimeout(m),m=null),document.removeEventListener("pointermove",x),document.removeEventListener("pointerup",$),document.removeEventListener("selectionchange",E)},w=()=>{t.active.sensor?u()||_():(n(i,f),l(g),E(),document.addEventListener("selectionchange",E))},x=L=>{const F={x:L.clientX,y:L.clientY};if(!t.active.sensor){const W={x:F.x-f.x,y:F.y-f.y};Math.sqrt(W.x**2+W.y**2)>c&&w()}u()&&(L.preventDefault(),r(F))},$=L=>{_(),u()&&(L.preventDefault(),h(),o())},E=()=>{window.getSelection()?.removeAllRanges()}},Ld=i=>(kd(),dt(()=>i.children)),Ai=i=>({transform:`translate3d(${i.x}px, ${i.y}px, 0)`}),Td=(i,t={})=>{const[e,{addDraggable:s,removeDraggable:n,draggableActivators:r}]=Yt(),[o,l]=C(null);ft(()=>{const u=o();u&&s({id:i,node:u,layout:pe(u),data:t})}),vt(()=>n(i));const h=()=>e.active.draggableId===i,a=()=>e.draggables[i]?.transform||kt();return Object.defineProperties((u,f)=>{const m=f?f():{};X(()=>{const g=o(),p=r(i);if(g)for(const _ in p)g.addEventListener(_,p[_]);vt(()=>{if(g)for(const _ in p)g.removeEventListener(_,p[_])})}),l(u),m.skipTransform||X(()=>{const g=a();if(ln(g,kt()))u.style.removeProperty("transform");else{const p=Ai(a());u.style.setProperty("transform",p.transform??null)}})},{ref:{enumerable:!0,value:l},isActiveDraggable:{enumerable:!0,get:h},dragActivators:{enumerable:!0,get:()=>r(i,!0)},transform:{enumerable:!0,get:a}})},Pd=(i,t={})=>{const[e,{addDroppable:s,removeDroppable:n}]=Yt(),[r,o]=C(null);ft(()=>{const c=r();c&&s({id:i,node:c,layout:pe(c),data:t})}),vt(()=>n(i));const l=()=>e.active.droppableId===i,h=()=>e.droppables[i]?.transform||kt();return Object.defineProperties((c,u)=>{const f=u?u():{};o(c),f.skipTransform||X(()=>{const m=h();if(ln(m,kt()))c.style.removeProperty("transform");else{const g=Ai(h());c.style.setProperty("transform",g.transform??null)}})},{ref:{enumerable:!0,value:o},isActiveDroppable:{enumerable:!0,get:l},transform:{enumerable:!0,get:h}})},zd=i=>{const[t,{onDragStart:e,onDragEnd:s,setOverlay:n,clearOverlay:r}]=Yt();let o;e(({draggable:h})=>{n({node:h.node,layout:h.layout}),queueMicrotask(()=>{if(o){const a=pe(o),c={x:(h.layout.width-a.width)/2,y:(h.layout.height-a.height)/2};a.x+=c.x,a.y+=c.y,n({node:o,layout:a})}})}),s(()=>queueMicrotask(r));const l=()=>{const h=t.active.overlay,a=t.active.draggable;return!h||!a?{}:{position:"fixed",transition:"transform 0s",top:`${h.layout.top}px`,left:`${h.layout.left}px`,"min-width":`${a.layout.width}px`,"min-height":`${a.layout.height}px`,...Ai(h.transform),...i.style}};return d(ml,{get mount(){return document.body},get children(){return d(j,{get when(){return t.active.draggable},get children(){var h=yd(),a=o;return typeof a=="function"?q(a,h):o=h,v(h,(()=>{var c=dt(()=>typeof i.children=="function");return()=>c()?i.children(t.active.draggable):i.children})()),k(c=>{var u=i.class,f=l();return u!==c.e&&$i(h,c.e=u),c.t=Ht(h,f,c.t),c},{e:void 0,t:void 0}),h}})}})},Dd=(i,t,e)=>{const s=i.slice();return s.splice(e,0,...s.splice(t,1)),s},Io=_t(),Ad=i=>{const[t]=Yt(),[e,s]=Ct({initialIds:[],sortedIds:[]}),n=l=>l>=0&&l<e.initialIds.length;X(()=>{s("initialIds",[...i.ids]),s("sortedIds",[...i.ids])}),X(()=>{t.active.draggableId&&t.active.droppableId?Y(()=>{const l=e.sortedIds.indexOf(t.active.draggableId),h=e.initialIds.indexOf(t.active.droppableId);if(!n(l)||!n(h))s("sortedIds",[...i.ids]);else if(l!==h){const a=Dd(e.sortedIds,l,h);s("sortedIds",a)}}):s("sortedIds",[...i.ids])});const o=[e,{}];return d(Io.Provider,{value:o,get children(){return i.children}})},Id=()=>Ut(Io)||null,Od=(i,t)=>e=>{i(e),t(e)},Rd=(i,t={})=>{const[e,{addTransformer:s,removeTransformer:n}]=Yt(),[r]=Id(),o=Td(i,t),l=Pd(i,t),h=Od(o.ref,l.ref),a=()=>r.initialIds.indexOf(i),c=()=>r.sortedIds.indexOf(i),u=_=>e.droppables[_]?.layout||null,f=()=>{const _=kt(),w=a(),x=c();if(x!==w){const $=u(i),E=u(r.initialIds[x]);$&&E&&(_.x=E.x-$.x,_.y=E.y-$.y)}return _},m={id:"sortableOffset",order:100,callback:_=>{const w=f();return{x:_.x+w.x,y:_.y+w.y}}};ft(()=>s("droppables",i,m)),vt(()=>n("droppables",i,m.id));const g=()=>(i===e.active.draggableId&&!e.active.overlay?e.draggables[i]?.transform:e.droppables[i]?.transform)||kt();return Object.defineProperties(_=>{o(_,()=>({skipTransform:!0})),l(_,()=>({skipTransform:!0})),X(()=>{const w=g();if(ln(w,kt()))_.style.removeProperty("transform");else{const x=Ai(g());_.style.setProperty("transform",x.transform??null)}})},{ref:{enumerable:!0,value:h},transform:{enumerable:!0,get:g},isActiveDraggable:{enumerable:!0,get:()=>o.isActiveDraggable},dragActivators:{enumerable:!0,get:()=>o.dragActivators},isActiveDroppable:{enumerable:!0,get:()=>l.isActiveDroppable}})},Vd=y("<div>"),Wd=y("<div class=drag_tag><span></span><div class=drag_tag_bottom_border>"),Bd=y("<div class=drag_tag_overlay><span></span><div class=drag_tag_bottom_border>");function hn(i){const[,t]=tt(i,["ids","children","overlay_child","reorder_function"]);t.classList?t.classList.drag_tag_column=!0:t.classList={drag_tag_column:!0};const[e,s]=C("");return d(Ed,{onDragStart:({draggable:o})=>{s(o.id)},onDragEnd:({draggable:o,droppable:l})=>{if(o&&l){const h=i.ids?.()??[],a=h.indexOf(o.id),c=h.indexOf(l.id);a!==c&&i.reorder_function(a,c)}},collisionDetector:Cd,get children(){return[d(Ld,{}),d(Nd,{}),(()=>{var o=Vd();return yt(o,t,!1,!0),v(o,d(Ad,{get ids(){return i.ids?.()??[]},get children(){return i.children}})),o})(),d(j,{get when(){return e()},keyed:!0,get children(){return d(zd,{get children(){return i.overlay_child?.({id:e()})??void 0}})}})]}})}function Nd(){const i=Yt()?.[1];if(i===void 0)return;const{onDragStart:t,onDragEnd:e,addTransformer:s,removeTransformer:n}=i,r={id:"constrain-x-axis",order:100,callback:o=>({...o,x:0})};return t(({draggable:o})=>{s("draggables",o.id,r)}),e(({draggable:o})=>{n("draggables",o.id,r.id)}),[]}function an(i){const t=Rd(i.tag_id()),e=Yt()?.[0],[,s]=tt(i,["tag_id","tag_name"]);return(()=>{var n=Wd(),r=n.firstChild,o=r.nextSibling;return q(t,n,()=>!0),yt(n,A(s,{get style(){return{opacity:t.isActiveDraggable?"25%":void 0,transition:e?.active.draggable?"transform .15s ease-in-out":void 0}}}),!1,!0),v(n,()=>i.children,o),k(l=>{var h=i.tag_name(),a="id: "+i.tag_id();return h!==l.e&&(r.innerText=l.e=h),a!==l.t&&(o.innerText=l.t=a),l},{e:void 0,t:void 0}),n})()}function cn(i){const[,t]=tt(i,["tag_id","tag_name"]);return(()=>{var e=Bd(),s=e.firstChild,n=s.nextSibling;return yt(e,t,!1,!0),v(e,()=>i.children,n),k(r=>{var o=i.tag_name(),l="id: "+i.tag_id();return o!==r.e&&(s.innerText=r.e=o),l!==r.t&&(n.innerText=r.t=l),r},{e:void 0,t:void 0}),e})()}var jd=y("<div class=widget_panel_title>Series Object Tree"),Fd=y("<div class=obj_tree_resize_handle>"),Ud=y("<div class=widget_panel_title>Primitive Object Tree");const Hd=250,Xd={ids:()=>[],setIds:()=>{},serieses:[],setSerieses:()=>{},seriesReorderFunc:()=>()=>{},setSeriesReorderFunc:()=>{},selectedSeries:()=>{},setSelectedSeries:()=>{}};let Ds=_t(Xd);function Et(){return Ut(Ds)}function Kd(i){const[t,e]=C([]),[s,n]=Ct([]),[r,o]=C(),[l,h]=C(()=>{}),a={ids:t,setIds:e,serieses:s,setSerieses:n,seriesReorderFunc:l,setSeriesReorderFunc:h,selectedSeries:r,setSelectedSeries:o};return Ds=_t(a),d(Ds.Provider,{value:a,get children(){return i.children}})}const Er=50;function qd(){const i=C(),t=C();let e=-1,s=-1,n=.5;const r=u=>Math.ceil(u?.getBoundingClientRect().height??0),o=C({height:`${s}px`}),l=C({height:`${s}px`}),h=u=>{let f=e-r(i[0]())-r(t[0]());s=Math.min(Math.max(Er,s+u.movementY),f-Er),o[1]({height:`${s}px`}),l[1]({height:`${f-s}px`}),n=s/f},a=()=>{document.addEventListener("mousemove",h),document.addEventListener("mouseup",()=>document.removeEventListener("mousemove",h),{once:!0})},c=u=>{e=u.height;let f=e-r(i[0]())-r(t[0]());Et().selectedSeries()?(s=Math.floor(f*n),o[1]({height:`${s}px`}),l[1]({height:`${f-s}px`})):(o[1]({height:`${f}px`}),s=f)};return ft(()=>{oe().setWidgetPanelWidth(Hd),oe().setWidgetPanelResizeFunc(()=>c)}),[(()=>{var u=jd(),f=t[1];return typeof f=="function"?q(f,u):t[1]=u,u})(),d(Gd,{get style(){return o[0]()}}),d(j,{get when(){return Et().selectedSeries()!==void 0},keyed:!0,get children(){return[(()=>{var u=Fd();return u.$$mousedown=a,u})(),(()=>{var u=Ud(),f=i[1];return typeof f=="function"?q(f,u):i[1]=u,u})(),d(Yd,{get style(){return l[0]()}})]}})]}function Gd(i){const t=Et().ids,e=Et().serieses,s=Et().seriesReorderFunc,n=Et().selectedSeries,r=Et().setSelectedSeries;return X(Tt(t,()=>{let o=n()?._id;o!==void 0&&t().find(l=>l===o)===void 0&&r(void 0)})),d(j,{get when(){return t()},keyed:!0,get children(){return d(hn,{ids:t,ref(o){var l=i.ref;typeof l=="function"?l(o):i.ref=o},get style(){return i.style},classList:{obj_tree:!0},overlay_child:({id:o})=>cn({tag_id:()=>o,tag_name:()=>e.find(l=>l.id===o)?.name??""}),get reorder_function(){return s()},get children(){return d(N,{get each(){return t()},children:o=>{const l=e.find(h=>h.id===o);if(l!==void 0)return d(an,{onClick:()=>{n()!==l?r(l):r(void 0)},get"attr:target"(){return n()===l?"":void 0},tag_id:()=>o,tag_name:()=>e.find(h=>h.id===o)?.name??""})}})}})}})}function Yd(i){const t=Et().selectedSeries;return d(j,{get when(){return t()},keyed:!0,get children(){return d(hn,{get ids(){return t().primitiveIds},classList:{obj_tree:!0},get style(){return i.style},overlay_child:({id:e})=>cn({tag_id:()=>e,tag_name:()=>t().primitives.find(s=>s._id===e)?._type??""}),get reorder_function(){return t().reorderPrimitives.bind(t())},get children(){return d(N,{get each(){return t().primitiveIds()},children:e=>{const s=t().primitives.find(n=>n._id===e);if(s!==void 0)return d(an,{tag_id:()=>e,tag_name:()=>s._type,get children(){return s.obj_tree_el}})}})}})}})}Mt(["mousedown"]);const Zd={Ib:"time",se:"logical",zb:"point",Eb:"seriesData",Lb:"hoveredSeries",Nb:"hoveredObjectId",Fb:"sourceEvent"};class Jd{static _special_id_="main";id="";element;div;active;setActive;chart;primitives=new Map;primitive_serieses=[];whitespace_series;chart_div;leftScaleMode;leftScaleInvert;rightScaleMode;rightScaleInvert;series_map=new Map;setObjTreeIds;setObjTreeItems;setObjTreeReorderFunc;indicators;setIndicators;constructor(t){this.id=t;const[e,s]=C(!1);this.active=e,this.setActive=s;const[n,r]=C(document.createElement("div"));this.div=n;let o=document.createElement("div");const l=Qd();this.chart=Zc(o,l),this.chart_div=this.chart.chartElement();const h=C([]);this.indicators=h[0],this.setIndicators=h[1],this.rightScaleMode=C(l.rightPriceScale?.mode??0),this.rightScaleInvert=C(l.rightPriceScale?.invertScale??!1),this.leftScaleMode=C(l.leftPriceScale?.mode??0),this.leftScaleInvert=C(l.leftPriceScale?.invertScale??!1),X(Tt([this.rightScaleMode[0],this.rightScaleInvert[0],this.leftScaleMode[0],this.leftScaleInvert[0]],()=>{this.update_opts({})}));const a={parent_pane:this,indicators_list:this.indicators};this.element=sh({ref:r,chart_el:this.chart_div,legend_props:a,rightScaleMode:this.rightScaleMode,rightScaleInvert:this.rightScaleInvert,leftScaleMode:this.leftScaleMode,leftScaleInvert:this.leftScaleInvert}),this.whitespace_series=this.chart.addLineSeries(),this.add_primitive_group(),this.setObjTreeIds=Et().setIds,this.setObjTreeItems=Et().setSerieses,this.setObjTreeReorderFunc=Et().setSeriesReorderFunc,this.reorder_series=this.reorder_series.bind(this),this.chart_div.addEventListener("mousedown",()=>{this.chart.timeScale().applyOptions({shiftVisibleRangeOnNewBar:!1,allowShiftVisibleRangeOnWhitespaceReplacement:!1,rightBarStaysOnScroll:!1})}),window.document.addEventListener("mouseup",()=>{this.chart.timeScale().applyOptions({shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!0,rightBarStaysOnScroll:!0})})}get serieses(){return this.chart.lw.$i.kc[0].vo}get vis_serieses(){return this.chart.lw.$i.kc[0].vo.filter((t,e)=>e!==0)}get seriesAPIs(){return Array.from(this.vis_serieses,t=>this.chart.Sw.get(t))}get_series_index(t){return this.serieses.findIndex(e=>this.chart.Sw.get(e)===t)}make_event_params(t){let e=this.chart.timeScale().coordinateToLogical(t.offsetX),s={clientX:t.clientX,clientY:t.clientY,pageX:t.pageX,pageY:t.pageY,screenX:t.screenX,screenY:t.screenY,localX:t.offsetX,localY:t.offsetY,ctrlKey:t.ctrlKey,altKey:t.altKey,shiftKey:t.shiftKey,metaKey:t.metaKey};const n=this.chart.chartElement().getBoundingClientRect();let r=n&&t.clientX-n.left<n.width&&t.clientY-n.top<n.height?{x:t.clientX-n.left,y:t.clientY-n.top}:null,o={};return Object.entries(this.chart.lw.Ab(e,r,s)).forEach(([l,h])=>o[Zd[l]]=h),o}reorder_series(t,e,s=!0){t<0&&(t=this.serieses.length+t),e<0&&(e=this.serieses.length+e),s&&(t+=1,e+=1),this.serieses.splice(e,0,...this.serieses.splice(t,1)),this.serieses.forEach((n,r)=>n.Zi=r),this.chart.lw.$i.kc[0].po=null,this.chart.lw.$i.$h(),this.setObjTreeIds(Array.from(this.seriesAPIs,n=>this.series_map.get(n)?._id??""))}assign_active_pane(){if(window.active_pane===this)return;window.active_pane&&window.active_pane.setActive(!1),window.active_pane=this,this.setActive(!0);const t=Array.from(this.seriesAPIs,e=>this.series_map.get(e));this.setObjTreeItems(t),this.setObjTreeReorderFunc(()=>this.reorder_series),this.setObjTreeIds(Array.from(t,e=>e.id))}set_whitespace_data(t,e){this.whitespace_series.setData(t),this.primitive_serieses.forEach(s=>s.setData([e]))}update_whitespace_data(t,e){this.whitespace_series.update(t),this.primitive_serieses.forEach(s=>s.setData([e]))}attach_indicator_to_legend(t){this.indicators().includes(t)||this.setIndicators([...this.indicators(),t])}detach_indicator_from_legend(t){this.setIndicators(this.indicators().filter(e=>e!==t))}add_primitive_group(){const t=new $o("primitives","","Primitives",void 0,it.LINE,this);t.applyOptions({visible:!1}),this.primitive_serieses.push(t)}add_primitive(t,e,s){let n=Do.get(e);if(n===void 0)return;let r=new n(t,s);r._pane=this,this.primitives.set(t,r),this.whitespace_series.attachPrimitive(r)}update_primitive(t,e){let s=this.primitives.get(t);s!==void 0&&s.updateData(e)}attach_primitive(t){const e=Object.keys(this.primitives),s=_i(e,"p_");t._id=s,t._pane=this,this.primitives.set(s,t),this.primitive_serieses[0].attachPrimitive(t)}remove_primitive(t){let e=this.primitives.get(t);e!==void 0&&(this.whitespace_series.detachPrimitive(e),this.primitives.delete(t))}update_opts(t){ni(t,"leftPriceScale","mode",this.leftScaleMode),ni(t,"leftPriceScale","invertScale",this.leftScaleInvert),ni(t,"rightPriceScale","mode",this.rightScaleMode),ni(t,"rightPriceScale","invertScale",this.rightScaleInvert),this.chart.applyOptions(t)}resize(){this.chart.resize(Math.max(this.div().clientWidth-2,0),Math.max(this.div().clientHeight-2,0),!1)}fitcontent(){this.chart.timeScale().fitContent()}autoscale_time_axis(){this.chart.timeScale().resetTimeScale()}update_timescale_opts(t){this.chart.timeScale().applyOptions(t)}}function ni(i,t,e,s){i[t]!==void 0?i[t][e]===void 0?i[t][e]=s[0]():s[1](i[t][e]):i[t]={[e]:s[0]()}}function Qd(){const i=getComputedStyle(document.documentElement);return{layout:{background:{type:Es.VerticalGradient,topColor:i.getPropertyValue("--chart-bg-color-top"),bottomColor:i.getPropertyValue("--chart-bg-color-bottom")},textColor:i.getPropertyValue("--chart-text-color"),attributionLogo:i.getPropertyValue("--chart-tv-logo")==="true"},grid:{vertLines:{color:i.getPropertyValue("--chart-grid")},horzLines:{color:i.getPropertyValue("--chart-grid")}},leftPriceScale:{mode:parseInt(i.getPropertyValue("--chart-scale-mode-left"))},rightPriceScale:{mode:parseInt(i.getPropertyValue("--chart-scale-mode-right"))},crosshair:{mode:parseInt(i.getPropertyValue("--chart-xhair-mode"))},kineticScroll:{touch:!0},timeScale:{shiftVisibleRangeOnNewBar:!0,allowShiftVisibleRangeOnWhitespaceReplacement:!0,rightBarStaysOnScroll:!0,rightOffset:parseInt(i.getPropertyValue("--chart-right-offset"))}}}const tf="charting_frame",aj=250;class ef extends nh{type=tf;div;element;timeframe;symbol;series_type;indicators=new Map;sources;setSources;style_sel;layout;setStyle;setDisplays;panes=[];flex_panes=[];last_range_report=0;range_report_timer=void 0;held_range=null;constructor(t,e){super(t,e);const[s,n]=C(""),[r,o]=C([]),[l,h]=C(document.createElement("div"));this.div=l,this.setStyle=n,this.setDisplays=o,this.style_sel=t.substring(7)+"_pane",this.element=ih({ref:h,innerStyle:s,displays:r,style_sel:this.style_sel});const a=C([]);this.sources=a[0],this.setSources=a[1],this.symbol={ticker:"LWPC"},this.timeframe=new bt(1,"D"),this.series_type=it.CANDLESTICK}onActivation(){this.update_tab(this.symbol.ticker),window.topbar.setSeries(this.series_type),window.topbar.setTimeframe(this.timeframe),window.topbar.setTicker(this.symbol.ticker),(window.active_pane===void 0||!this.panes.includes(window.active_pane))&&this.panes[0].assign_active_pane()}onDeactivation(){window.active_pane&&this.panes.includes(window.active_pane)&&(window.active_pane.setActive(!1),window.active_pane=void 0)}set_whitespace_data(t,e){e===void 0&&(e={time:"1970-01-01",value:0}),this.panes.forEach(s=>{s.set_whitespace_data(t,e)})}update_whitespace_data(t,e){this.panes.forEach(s=>{s.update_whitespace_data(t,e)})}set_symbol(t){this.symbol=t,this.update_tab(this.symbol.ticker),this==window.active_frame&&window.topbar.setTicker(this.symbol.ticker)}set_timeframe(t){this.timeframe=bt.from_str(t),this==window.active_frame&&window.topbar.setTimeframe(this.timeframe);let e={timeVisible:!1,secondsVisible:!1};this.timeframe.period==="s"?(e.timeVisible=!0,e.secondsVisible=!0):(this.timeframe.period==="m"||this.timeframe.period==="h")&&(e.timeVisible=!0),this.panes.forEach(s=>{s.update_timescale_opts(e)})}set_series_type(t){this.series_type=t,this==window.active_frame&&window.topbar.setSeries(this.series_type)}add_pane(t){let e=new Jd(t);return this.panes.push(e),this.panes.length===1&&e.chart.timeScale().subscribeVisibleLogicalRangeChange(this.on_visible_range_change.bind(this)),this.layout===void 0&&this.set_layout(Q.SINGLE),e}create_indicator(t,e,s,n,r){let o=new wd(t,s,n,this.sources,r);this.indicators.set(t,o);let l=[];for(const[h,a]of Object.entries(e))l.push({indicator:o,function_name:h,source_type:a});this.setSources([...this.sources(),...l])}delete_indicator(t){let e=this.indicators.get(t);e!==void 0&&(e.delete(),this.indicators.delete(t),this.setSources(this.sources().filter(s=>s.indicator!==e)))}on_visible_range_change(t){if(t===null)return;clearTimeout(this.range_report_timer);const e=this.last_range_report+aj-Date.now();if(e>0){this.range_report_timer=window.setTimeout(()=>this.on_visible_range_change(t),e);return}this.last_range_report=Date.now();const s=this.panes[0].chart.timeScale().width();for(const[n,r]of window.container_manager.containers)if(r.frames.includes(this)){window.api.visible_range_change(n,this.id,t.from,t.to,s);return}}hold_visible_range(){this.held_range=this.panes[0]?.chart.timeScale().getVisibleRange()??null}restore_visible_range(){if(this.held_range===null)return;const t=this.held_range;this.panes.forEach(e=>{e.chart.timeScale().setVisibleRange(t)}),this.held_range=null}set_layout(t){this.flex_panes=qr(t,()=>this.div().getBoundingClientRect(),this.resize.bind(this));let e=[],s=0;this.flex_panes.forEach(n=>{if(n.orientation===_e.null){if(s<this.panes.length){let r=this.panes[s];e.push({orientation:n.orientation,mouseDown:r.assign_active_pane.bind(r),element:r.element,el_active:r.active,el_target:()=>!1})}else throw new Error("Not Enough Panes to change to the desired layout");s+=1}else e.push({orientation:n.orientation,mouseDown:n.mouseDown,element:void 0,el_active:()=>!1,el_target:()=>!1})}),this.layout=t,this.setDisplays(e),this.resize()}resize(){Kr(()=>this.div().getBoundingClientRect(),this.flex_panes);let t="";this.flex_panes.forEach((e,s)=>{t+=`
             div.${this.style_sel}:nth-child(${s+2})${e.style}`}),this.setStyle(t);for(let e=0;e<ge(this.layout);e++)this.panes[e].resize()}fitcontent(){this.panes[0]?.fitcontent(),this.panes.forEach(t=>{t.fitcontent()})}autoscale_content(){this.panes.forEach(t=>{t.autoscale_time_axis()})}}const sf={2:ef};class nf{id;layout;frames=[];display=[];flex_frames=[];divRect;setStyle;setDisplay;update_tab;constructor(t,e){this.id=t,this.update_tab=e,this.divRect=hi().getSize,this.setStyle=hi().setStyle,this.setDisplay=hi().setDisplay}onShow(){this.setDisplay(this.display),this.layout!==void 0&&window.topbar.setLayout(this.layout);for(let t=0;t<ge(this.layout);t++)this.frames[t].onShow()}onHide(){for(let t=0;t<ge(this.layout);t++)this.frames[t].onHide()}remove(){}resize(t){Kr(t?()=>t:this.divRect,this.flex_frames);let e="";this.flex_frames.forEach((s,n)=>{e+=`
             div.frame:nth-child(${n+2})${s.style}`}),this.setStyle(e),this.resize_frames()}resize_frames(){setTimeout(()=>{for(let t=0;t<ge(this.layout);t++)this.frames[t].resize()},1)}add_frame(t,e){e==1&&console.error("Cannot Create an instance of an Abstract Frame");let s=new sf[e](t,this.update_tab);return this.frames.push(s),s}remove_frame(t){let e=this.frames.findIndex(s=>s.id===t);e!==-1&&(this.reorder_frames(e,this.frames.length-1),this.frames[this.frames.length-1]=void 0,this.frames.length=this.frames.length-1,this.setDisplay([]),this.setDisplay(this.display))}set_layout(t){this.flex_frames=qr(t,this.divRect,this.resize.bind(this));let e=[],s=0;this.flex_frames.forEach(n=>{if(n.orientation===_e.null){if(s<this.frames.length){let r=this.frames[s];n.mouseDown=r.assign_active_frame.bind(r),e.push({orientation:n.orientation,mouseDown:n.mouseDown,element:r.element,el_active:r.active,el_target:r.target})}else throw new Error("Not Enough Frames to change to the desired layout");s+=1}else e.push({orientation:n.orientation,mouseDown:n.mouseDown,element:void 0,el_active:()=>!1,el_target:()=>!1})}),this.layout=t,this.setDisplay(e),this.display=e,this.resize(),window.topbar.setLayout(t)}reorder_frames(t,e){this.frames.splice(e,0,...this.frames.splice(t,1));for(let s=Math.min(t,e);s*2<this.display.length;s++){let n=this.frames[s];this.display[s*2]={orientation:_e.null,mouseDown:n.assign_active_frame.bind(n),element:n.element,el_active:n.active,el_target:n.target}}this.setDisplay([]),this.setDisplay(this.display),this.resize_frames()}}const rf=Pl,us={title:"LWPC",favicon:null};let of=class{containers=new Map;tab_els=new Map;constructor(t){this.tab_manager.init(t)}add_container(t){const e=this.tab_manager.addTab(t),s=new nf(t,this.tab_manager.updateTab.bind(void 0,e));return this.tab_els.set(t,e),this.containers.set(t,s),this.set_active_container(t),s}remove_container(t){const e=this.tab_els.get(t),s=this.containers.get(t);s&&s.remove(),e&&this.tab_manager.removeTab(e),this.tab_els.delete(t),this.containers.delete(t)}set_active_container(t){const e=this.containers.get(t);if(e===void 0||e===window.active_container)return;const s=this.tab_els.get(t);s&&this.tab_manager.setCurrentTab(s),window.active_container&&window.active_container.onHide(),window.active_container=e,e.onShow(),e.resize()}tab_manager=new class{el;styleEl;isDragging;draggabillies;draggabillyDragging=null;constructor(){this.draggabillies=[],this.isDragging=!1,this.el=document.createElement("div"),this.styleEl=document.createElement("style")}init(t){this.el=t,this.el.style.setProperty("--tab-content-margin",`${ce}px`),this.el.appendChild(this.styleEl),window.addEventListener("resize",()=>{this.cleanUpPreviouslyDraggedTabs(),this.layoutTabs()}),this.el.addEventListener("dblclick",e=>{(e.target===this.el||e.target===this.tabContentEl)&&window.api.add_container()}),this.layoutTabs(),this.setupDraggabilly()}get activeTabEl(){return this.el.querySelector(".tab[active]")}get tabContentEl(){return this.el.querySelector(".tabs-content")}get tabEls(){return Array.prototype.slice.call(this.el.querySelectorAll(".tab"))}get tabContentWidths(){const t=this.tabEls.length,e=this.tabContentEl.clientWidth,s=(t-1)*kr,n=(e-2*ce+s)/t,r=Math.floor(Math.max(cf,Math.min(Lr,n))),o=r*t+2*ce-s,l=e-o,h=[];let a=l;for(let c=0;c<t;c+=1){const u=r<Lr&&a>0?1:0;h.push(r+u),a>0&&(a-=1)}return h}get tabContentPositions(){const t=[],e=this.tabContentWidths;let s=ce;return e.forEach((n,r)=>{const o=r*kr;t.push(s-o),s+=n}),t}get tabPositions(){const t=[];return this.tabContentPositions.forEach(e=>{t.push(e-ce)}),t}layoutTabs(){const t=this.tabContentWidths;this.tabEls.forEach((s,n)=>{const r=t[n],o=r+2*ce;s.style.width=o+"px",s.removeAttribute("is-mini"),s.removeAttribute("is-small"),s.removeAttribute("is-smaller"),r<lf&&s.setAttribute("is-mini",""),r<hf&&s.setAttribute("is-small",""),r<af&&s.setAttribute("is-smaller","")});let e="";this.tabPositions.forEach((s,n)=>{e+=`.tabs .tab:nth-child(${n+1}) {transform: translate3d(${s}px, 0, 0)} `}),this.styleEl.innerHTML=e}createNewTabEl(){const t=document.createElement("div");return t.innerHTML=df,t.firstElementChild}addTab(t,{animate:e=!0,background:s=!1}={}){const n=this.createNewTabEl();return n.setAttribute("data-id",t),e&&(n.classList.add("tab-was-just-added"),setTimeout(()=>n.classList.remove("tab-was-just-added"),500)),this.tabContentEl.appendChild(n),this.updateTab(n,us.title,us.price,us.favicon),s||this.setCurrentTab(n),this.cleanUpPreviouslyDraggedTabs(),this.layoutTabs(),this.setupDraggabilly(),n.querySelector(".tab-close").addEventListener("click",()=>{window.api.remove_container(t)}),n}hasActiveTab(){return!!this.activeTabEl}setCurrentTab(t){const e=this.activeTabEl;e!==t&&(e&&e.removeAttribute("active"),t.setAttribute("active",""))}removeTab(t){t===this.activeTabEl&&(t.nextElementSibling?window.container_manager.set_active_container(t.nextElementSibling.getAttribute("data-id")):t.previousElementSibling&&window.container_manager.set_active_container(t.previousElementSibling.getAttribute("data-id"))),t.remove(),this.cleanUpPreviouslyDraggedTabs(),this.layoutTabs(),this.setupDraggabilly()}updateTab(t,e,s,n){const r=t.querySelector(".tab-title"),o=t.querySelector(".tab-price");r.textContent=e??"",s?(o.textContent=s,o.removeAttribute("empty")):o.setAttribute("empty","");const l=t.querySelector(".tab-favicon");n?(l.style.backgroundImage=`url('${n}')`,l.removeAttribute("hidden")):(l.setAttribute("hidden",""),l.removeAttribute("style"))}cleanUpPreviouslyDraggedTabs(){this.tabEls.forEach(t=>t.classList.remove("tab-was-just-dragged"))}setupDraggabilly(){const t=this.tabEls,e=this.tabPositions;this.isDragging&&(this.isDragging=!1,this.el.classList.remove("tabs-is-sorting"),this.draggabillyDragging.element.classList.remove("tab-is-dragging"),this.draggabillyDragging.element.style.transform="",this.draggabillyDragging.dragEnd(),this.draggabillyDragging.isDragging=!1,this.draggabillyDragging.positionDrag=()=>{},this.draggabillyDragging.destroy(),this.draggabillyDragging=null),this.draggabillies.forEach(s=>s.destroy()),t.forEach((s,n)=>{const r=e[n],o=new rf(s,{axis:"x",handle:".tab-drag-handle",containment:this.tabContentEl});this.draggabillies.push(o),o.on("pointerDown",()=>{window.container_manager.set_active_container(s.getAttribute("data-id"))}),o.on("dragStart",()=>{this.isDragging=!0,this.draggabillyDragging=o,s.classList.add("tab-is-dragging"),this.el.classList.add("tabs-is-sorting")}),o.on("dragEnd",()=>{this.isDragging=!1;const l=parseFloat(s.style.left);s.style.transform="translate3d(0, 0, 0)",requestAnimationFrame(()=>{s.style.left="0",s.style.transform=`translate3d(${l}px, 0, 0)`,requestAnimationFrame(()=>{s.classList.remove("tab-is-dragging"),this.el.classList.remove("tabs-is-sorting"),s.classList.add("tab-was-just-dragged"),requestAnimationFrame(()=>{s.style.transform="",this.layoutTabs(),this.setupDraggabilly()})})})}),o.on("dragMove",(l,h,a)=>{const c=this.tabEls,u=c.indexOf(s),f=r+a.x,m=uf(f,e),g=Math.max(0,Math.min(c.length,m));u!==g&&this.animateTabMove(s,u,g)})})}animateTabMove(t,e,s){s<e?t.parentNode&&t.parentNode.insertBefore(t,this.tabEls[s]):t.parentNode&&t.parentNode.insertBefore(t,this.tabEls[s+1]),window.api.reorder_containers(e,s),this.layoutTabs()}}};const lf=28,hf=110,af=54,ce=9,kr=1,cf=24,Lr=180;function uf(i,t){let e=1/0,s=-1;return t.forEach((n,r)=>{Math.abs(i-n)<e&&(e=Math.abs(i-n),s=r)}),s}const df=`
     <div class="tab">
@@ -40,4 +40,4 @@
             <div class="tab-close"></div>
         </div>
     </div>
-`;var ff=y("<div class=titlebar_separator>"),gf=y('<div class="layout_title layout_flex"><div class="titlebar titlebar_grab tabs frameless-drag-region"><div class=tabs-content></div></div><div class="titlebar titlebar_btns frameless-drag-region"><div class=titlebar_separator>');function mf(i){let t;const[e,s]=C(!1),[n,r]=C(!1);return window.api.setFrameless=s,ft(()=>{t&&(window.container_manager=new of(t))}),(()=>{var o=gf(),l=o.firstChild,h=l.nextSibling,a=h.firstChild,c=t;return typeof c=="function"?q(c,l):t=l,v(h,d(O,{get icon(){return b.window_add},classList:{window_btn:!0},style:{padding:"1px 3px"},onClick:()=>{window.api.add_container()}}),a),v(h,d(ri,{get icon(){return b.panel_left},classList:{layout_btn:!0},activated:!0,onAct:()=>{i.show_section(Ot.TOOL_BAR)},onDeact:()=>{i.hide_section(Ot.TOOL_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_right},classList:{layout_btn:!0},onAct:()=>{i.show_section(Ot.WIDGET_BAR)},onDeact:()=>{i.hide_section(Ot.WIDGET_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_top},classList:{layout_btn:!0},activated:!0,onAct:()=>{i.show_section(Ot.TOP_BAR)},onDeact:()=>{i.hide_section(Ot.TOP_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_bottom},classList:{layout_btn:!0},onAct:()=>{i.show_section(Ot.UTIL_BAR)},onDeact:()=>{i.hide_section(Ot.UTIL_BAR)}}),null),v(h,d(j,{get when(){return e()},get children(){return[ff(),d(O,{get icon(){return b.minimize},classList:{window_btn:!0},style:{padding:"3px"},width:16,height:16,onClick:()=>{window.api.minimize()}}),d(j,{get when(){return n()},get children(){return[d(O,{get icon(){return b.restore},classList:{window_btn:!0},onClick:()=>{r(!1),window.api.restore()}})," "]}}),d(j,{get when(){return!n()},get children(){return[" ",d(O,{get icon(){return b.maximize},classList:{window_btn:!0},style:{padding:"2px"},onClick:()=>{r(!0),window.api.maximize()}})," "]}}),d(O,{get icon(){return b.close},classList:{window_btn:!0},style:{padding:"3px"},width:16,height:16,onClick:()=>{window.api.close()}})]}}),null),k(u=>Ht(o,i.style,u)),o})()}const pf={icon:"",activated:!1,onAct:()=>{console.log("Button Activated!")},onDeact:()=>{console.log("Button Deactivated!")}};function ri(i){const t=A(pf,i),[e,s]=C(t.activated),[,n]=tt(t,["onAct","onDeact"]);return n.onClick=()=>{s(!e()),e()&&t.onAct?t.onAct():!e()&&t.onDeact&&t.onDeact()},e()&&t.onAct?t.onAct():!e()&&t.onDeact&&t.onDeact(),d(O,A(n,{get activated(){return e()}}))}const xe=(()=>{for(const i of Array.from(document.styleSheets))if(i.href!==null){for(const t of Array.from(i.cssRules))if(t.selectorText===".tv-lightweight-charts")return t}})();function vf(){xe&&(xe.style.cursor="crosshair")}function _f(){xe&&(xe.style.cursor="")}const bf=`url('data:image/svg+xml,<svg width="12px" height="12px" style="fill:white" viewBox="-4 -4 8.00 8.00" xmlns="http://www.w3.org/2000/svg"><path d="M -2.2 0 C -2.201.711 -0.37 2.769 1.097 1.922 C 1.777 1.529 2.197 0.803 2.197 0.017 C 2.197 -1.677 0.363 -2.735 -1.103 -1.888 C -1.784 -1.495 -2.203 -0.769 -2.203 0.017 Z"/></svg>') 6 6, auto`;function wf(){xe&&(xe.style.cursor=bf)}const Qt=C(!1);let yi=new AbortController,ci=new AbortController;X(()=>{Qt[0]()||(yi.abort(),ci.abort(),yi=new AbortController)});function yf(){Mf(Qt,yi,xf)}function xf(i){if(active_pane===void 0){Qt[1](!1);return}yi.abort();const t=new zo("",{p1:null,p2:null});active_pane.attach_primitive(t);let e=t.series.coordinateToPrice(i.offsetY),s=t.chart.timeScale().coordinateToTime(i.offsetX);if(s===null||e===null){console.error("Failed to create TrendLine, Price or Time invalid"),t._pane?.remove_primitive(t._id),Qt[1](!1);return}t.updateData({p1:{time:s,value:e},p2:{time:s,value:e}});const n=t.chart.timeScale(),r=Sf.bind(t,n);t.chart.subscribeCrosshairMove(r),ci=new AbortController,document.addEventListener("keydown",o=>{o.key==="Escape"&&(t.chart.unsubscribeCrosshairMove(r),t._pane?.remove_primitive(t._id),Qt[1](!1))},{signal:ci.signal}),setTimeout(()=>{t.chart.chartElement().addEventListener("click",o=>{o.button===0&&(t.chart.unsubscribeCrosshairMove(r),Qt[1](!1))},{signal:ci.signal})},100)}function Sf(i,t){if(!t.point)return;let e=i.coordinateToTime(t.point.x),s=this.series.coordinateToPrice(t.point.y);e&&s&&this.updateData({p1:null,p2:{time:e,value:s}})}function Mf(i,t,e){if(!(window.active_container===void 0||i[0]())){for(const[,s]of dn.entries())s!==i&&s[0]()&&s[1](!1);window.active_container.frames.forEach(s=>{s.hasOwnProperty("panes")&&s.panes.forEach(n=>{n.chart.chartElement().addEventListener("click",e,{signal:t.signal}),i[1](!0)})}),i[0]()&&document.addEventListener("keydown",s=>{s.key==="Escape"&&i[1](!1)},{signal:t.signal})}}const un=new Map([[b.cursor_dot,wf],[b.cursor_arrow,_f],[b.cursor_cross,vf],[b.trend_line,yf]]),dn=new Map([[b.trend_line,Qt]]);var Cf=y("<div>"),$f=y('<div class=menu_section_titlebox><span class="menu_section_text text">'),Ef=y("<div class=menu_section>"),kf=y("<span class=menu_text>"),Lf=y("<div><span class=menu_selectable>");function Ii(i){let t=document.createElement("div");const[,e]=tt(i,["id","style","icon_act","icon_deact"]),s=gt().getDisplayAccessor(i.id),n=gt().getDisplaySetter(i.id);return ft(()=>{t.addEventListener("mousedown",r=>{r.button===0&&(n(!s()),r.stopPropagation())})}),(()=>{var r=Cf(),o=t;return typeof o=="function"?q(o,r):t=r,yt(r,e,!1,!0),v(r,d(O,{get icon(){return s()?i.icon_act:i.icon_deact}})),r})()}function Oo(i){const[t,e]=C(i.showByDefault);return[(()=>{var s=$f(),n=s.firstChild;return s.$$click=()=>e(!t()),v(n,()=>i.label.toUpperCase()),v(s,d(O,{get icon(){return t()?b.menu_arrow_sn:b.menu_arrow_ns}}),null),s})(),d(j,{get when(){return t()},get children(){var s=Ef();return v(s,()=>i.children),k(n=>Ht(s,i.style,n)),s}})]}const Tf=["label","icon","data","onSel","expand","star","starAct","starDeact","starStyle"];function Oi(i){const[t,e]=C(!1);i.classList=A(i.classList,{menu_item:!0}),i.expand===void 0&&(i.expand=!1);const[s,n]=tt(i,Tf);return(()=>{var r=Lf(),o=r.firstChild;return yt(r,A(n,{onmouseenter:()=>e(!0),onMouseLeave:()=>e(!1)}),!1,!0),o.$$click=l=>{l.button===0&&i.onSel&&i.onSel()},v(o,d(j,{get when(){return s.icon},get children(){return d(O,{get icon(){return s.icon??""}})}}),null),v(o,d(j,{get when(){return s.label},get children(){var l=kf();return v(l,()=>s.label),l}}),null),v(r,d(j,{get when(){return s.star!==void 0},get children(){return d(Pf,{get visible(){return t()},get selected(){return s.star??!1},get starAct(){return s.starAct},get starDeact(){return s.starDeact},get style(){return i.starStyle??{}}})}}),null),k(l=>(l=s.expand?"-webkit-fill-available":void 0)!=null?o.style.setProperty("width",l):o.style.removeProperty("width")),r})()}function Pf(i){const[t,e]=C(i.selected);function s(){e(!t()),t()&&i.starAct?i.starAct():i.starDeact&&i.starDeact()}return d(O,{class:"menu_item_star",onClick:n=>{n.button===0&&s()},get icon(){return t()?b.star_filled:b.star},get style(){return{color:t()?"var(--second-accent-color)":i.visible?void 0:"#0000",...i.style}}})}Mt(["click"]);var zf=y("<div class=toolbar_container>"),Df=y("<div class=menu_section_titlebox>");function oi(i){let t=document.createElement("div");const[e,s]=C({x:0,y:0}),[n,r]=C(b.blank),[o,l]=C(i.default_icon),h=()=>{s({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().top})};return gt().attachOverlay(i.id,d(Af,{get id(){return i.id},get location(){return e()},updateLocation:h,get tools(){return i.tools},setIcon:l})),(()=>{var a=zf();a.addEventListener("mouseleave",()=>r(b.blank)),a.addEventListener("mouseenter",()=>r(b.menu_arrow_ew));var c=t;return typeof c=="function"?q(c,a):t=a,v(a,d(O,{get icon(){return o()},get"attr:active"(){return dn.get(o())?.[0]()?"":void 0},get onClick(){return un.get(o())},classList:{toolbar_icon_btn:!0}}),null),v(a,d(Ii,{get id(){return i.id},classList:{toolbar_menu_button:!0},get icon_act(){return b.menu_arrow_we},get icon_deact(){return n()}}),null),a})()}function Af(i){let t;const e=ee().tools,s=ee().setTools,[,n]=tt(i,["tools","setIcon"]);function r(h){e().includes(h)||s([...e(),h])}function o(h){e().includes(h)&&s(e().filter(a=>a!=h))}function l(h){i.setIcon(h);const a=un.get(h);a?a():console.log("invalid tool"),t(!1)}return ft(()=>{t=gt().getDisplaySetter(i.id)}),d(Gt,A(n,{get location_ref(){return Xt.TOP_LEFT},get children(){return d(N,{get each(){return i.tools},children:h=>[Df(),d(N,{each:h,children:a=>d(Oi,{expand:!0,icon:a,get label(){return If.get(a)??""},onSel:()=>l(a),get star(){return e().includes(a)},starAct:()=>r(a),starDeact:()=>o(a),starStyle:{width:"20px",height:"20px"}})})]})}}))}const If=new Map([[b.cursor_cross,"Cross"],[b.cursor_dot,"Dot"],[b.cursor_arrow,"Arrow"],[b.cursor_erase,"Erase"],[b.trend_line,"Trend Line"],[b.horiz_ray,"Horiz. Ray"],[b.horiz_line,"Horiz. Line"],[b.vert_line,"Vert. Line"],[b.polyline,"Polyline"],[b.channel_parallel,"Parallel Channel"],[b.channel_disjoint,"Disjoint Channel"],[b.fib_retrace,"Fib. Retrace"],[b.fib_extend,"Fib. Extention"],[b.range_price,"Price Range"],[b.range_date,"Date Range"],[b.range_price_date,"Price & Date Range"]]);var Of=y('<div class="layout_main layout_flex flex_col"><div class=toolbar><div class=toolbar_separator></div></div><div class=toolbar><div class=toolbar_separator>'),Rf=y("<div class=toolbox_btn_wrap>");function Vf(i){return(()=>{var t=Of(),e=t.firstChild,s=e.firstChild,n=e.nextSibling;return n.firstChild,yt(t,i,!1,!0),e.style.setProperty("justify-content","flex-start"),v(e,d(oi,Ff),s),v(e,d(oi,Uf),s),v(e,d(oi,Hf),s),v(e,d(oi,Xf),s),n.style.setProperty("justify-content","flex-end"),v(n,d(Wf,{}),null),t})()}function Wf(){const i="toolbox",t=C(!1),e=t[0],s=t[1],n=ee().location,r=ee().setLocation;return gt().attachOverlay(i,d(jf,{id:i}),t,null),X(Tt(e,()=>{if(e()&&n().x===-1&&n().y===-1){let o=document.querySelector(".toolbox_btn_wrap")?.getBoundingClientRect();if(o===void 0)return;r({x:o.right+20,y:o.top+2})}})),(()=>{var o=Rf();return o.$$mousedown=()=>s(!e()),v(o,d(O,{get icon(){return e()?b.star_filled:b.star},width:26,height:26,classList:{toolbox_btn:!0}})),o})()}const Bf={tools:()=>[],setTools:()=>{},location:()=>({x:0,y:0}),setLocation:()=>{}};let As=_t(Bf);function ee(){return Ut(As)}function Nf(i){const[t,e]=C([]),[s,n]=C({x:-1,y:-1}),r={tools:t,setTools:e,location:s,setLocation:n};return As=_t(r),d(As.Provider,{value:r,get children(){return i.children}})}function jf(i){const t=ee().tools,e=ee().location,s=ee().setLocation;return d(Gt,{get id(){return i.id},get location(){return e()},setLocation:s,get location_ref(){return Xt.TOP_LEFT},get drag_handle(){return`#${i.id}>#menu_dragable`},get bounding_client_id(){return`#${i.id}>#menu_dragable`},get children(){return[d(O,{hover:!1,get icon(){return b.menu_dragable}}),d(N,{get each(){return t()},children:n=>d(O,{icon:n,get onClick(){return un.get(n)},get"attr:active"(){return dn.get(n)?.[0]()?"":void 0}})})]}})}const Ff={id:"crosshair_menu",default_icon:b.cursor_cross,tools:[[b.cursor_cross,b.cursor_dot,b.cursor_arrow]]},Uf={id:"trend_menu",default_icon:b.trend_line,tools:[[b.trend_line,b.horiz_line,b.vert_line,b.horiz_ray],[b.polyline],[b.channel_parallel,b.channel_disjoint]]},Hf={id:"fibonacci_menu",default_icon:b.fib_retrace,tools:[[b.fib_retrace,b.fib_extend]]},Xf={id:"measure_menu",default_icon:b.range_price,tools:[[b.range_price,b.range_date,b.range_price_date]]};Mt(["mousedown"]);var Kf=y('<div class=topbar_container><div class="menu_selectable indicator_topbar_btn"><div class=text>Indicators'),qf=y("<div class=indicator_title_bar><h1 class=text>Indicators</h1><div id=indicator_menu_drag>"),Gf=y("<div class=indicator_title_separator>"),Yf=y("<div id=indicator_pkg_description>"),Zf=y("<div id=indicator_info_container><div id=indicator_packages_list><table><tbody></tbody></table></div><div class=indicator_vert_separator></div><div id=indicator_details_list><table><tbody>"),Ro=y("<div class=version>"),Jf=y("<div class=pkg_card><span>"),Qf=y("<div class=description>"),tg=y("<div class=ind_card><span>");function eg(){const i="indicator_menu";let t=document.createElement("div");const e=C(!1),[s,n]=C({x:0,y:0}),r=()=>{n({x:window.innerWidth/2,y:window.innerHeight*.2})};function o(a){e[1](!e[0]()),a.stopPropagation()}ft(()=>{t.addEventListener("mousedown",a=>o(a)),window.addEventListener("resize",r)}),vt(()=>{window.removeEventListener("resize",r)});const[l,h]=Ct({});return window.api.populate_indicator_pkgs=h,gt().attachOverlay(i,d(ig,{id:i,packages:l,get setDisplay(){return e[1]},get location(){return s()},setLocation:n,updateLocation:r}),e),X(()=>console.log(l)),(()=>{var a=Kf(),c=a.firstChild,u=c.firstChild,f=t;return typeof f=="function"?q(f,c):t=c,v(c,d(O,{get icon(){return b.indicator}}),u),u.style.setProperty("padding","0px 2px"),a})()}function ig(i){const[,t]=tt(i,["setDisplay","packages"]),e=C(void 0);return d(Gt,A(t,{classList:{indicator_menu:!0},get location_ref(){return Xt.CENTER},drag_handle:"#indicator_menu_drag",get bounding_client_id(){return`#${i.id}>.indicator_title_bar`},get children(){return[(()=>{var s=qf(),n=s.firstChild;return n.nextSibling,v(s,d(O,{get icon(){return b.indicator_on_stratagy},width:28,height:28,classList:{icon:!1,symbol_search_icon:!0}}),n),n.style.setProperty("margin","8px 10px"),v(s,d(O,{get icon(){return b.close},style:{"margin-right":"15px",padding:"5px"},onClick:()=>i.setDisplay(!1)}),null),s})(),Gf(),(()=>{var s=Zf(),n=s.firstChild,r=n.firstChild,o=r.firstChild,l=n.nextSibling,h=l.nextSibling,a=h.firstChild,c=a.firstChild;return v(o,d(N,{get each(){return Object.values(i.packages)},children:u=>d(sg,A({activePkgSig:e},u))})),v(c,d(N,{get each(){return Object.values(e[0]()?.indicators??{})},children:u=>d(ng,A(u,{get activePkgKey(){return e[0]()?.pkg_key??""},get setDisplay(){return i.setDisplay}}))})),v(h,d(j,{get when(){return e[0]()?.description},get children(){var u=Yf();return k(()=>u.innerHTML=e[0]()?.description),u}}),null),s})()]}}))}function sg(i){const[,t]=tt(i,["activePkgSig"]);return(()=>{var e=Jf(),s=e.firstChild;return e.$$click=()=>i.activePkgSig[1](t),v(e,d(j,{get when(){return i.pkg_version},get children(){var n=Ro();return k(()=>n.innerText=i.pkg_version??""),n}}),null),k(n=>{var r=i.activePkgSig[0]()?.pkg_key==i.pkg_key?"":void 0,o=i.pkg_name;return r!==n.e&&H(e,"active",n.e=r),o!==n.t&&(s.innerText=n.t=o),n},{e:void 0,t:void 0}),e})()}function ng(i){if(!i.unlisted)return(()=>{var t=tg(),e=t.firstChild;return t.$$click=()=>{rg(i.activePkgKey,i.ind_key),i.setDisplay(!1)},v(t,d(j,{get when(){return i.description&&i.description!=""},get children(){var s=Qf();return k(()=>s.innerHTML=i.description??""),s}}),null),v(t,d(j,{get when(){return i.ind_version&&i.ind_version!=""},get children(){var s=Ro();return k(()=>s.innerText=i.ind_version??""),s}}),null),k(()=>e.innerText=i.ind_name),t})()}function rg(i,t){window.active_container==null||window.active_frame==null||window.api.indicator_request(window.active_container.id,window.active_frame.id,i,t)}Mt(["click"]);var og=y("<div class=topbar_container>");const lg={menu_listings:{simple:[Q.SINGLE,Q.DOUBLE_HORIZ,Q.DOUBLE_VERT],triple:[Q.TRIPLE_VERT,Q.TRIPLE_HORIZ,Q.TRIPLE_VERT_LEFT,Q.TRIPLE_VERT_RIGHT,Q.TRIPLE_HORIZ_TOP,Q.TRIPLE_HORIZ_BOTTOM],quadruple:[Q.QUAD_SQ_V,Q.QUAD_SQ_H,Q.QUAD_VERT,Q.QUAD_HORIZ,Q.QUAD_LEFT,Q.QUAD_RIGHT,Q.QUAD_TOP,Q.QUAD_BOTTOM]},favorites:[Q.SINGLE,Q.DOUBLE_HORIZ,Q.DOUBLE_VERT]};function hg(){const i="layout_selector";let t=document.createElement("div");const[e,s]=C(Q.SINGLE),[n,r]=C({x:0,y:0}),[o,l]=Ct(lg),h=()=>Array.from(o.favorites).sort((u,f)=>u-f),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setLayout=s,window.api.update_layout_topbar_opts=l;function c(u){window.api.layout_change(window.active_container?.id??"",u)}return gt().attachOverlay(i,d(cg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=og(),f=t;return typeof f=="function"?q(f,u):t=u,u.style.setProperty("margin-right","4px"),v(u,d(j,{get when(){return!o.favorites.includes(e())},get children(){return d(O,{get icon(){return Is[e()]},classList:{topbar_icon_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(O,{get icon(){return Is[m]},classList:{topbar_icon_btn:!0},get activated(){return e()===m},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Is={0:b.layout_single,1:b.layout_double_vert,2:b.layout_double_horiz,3:b.layout_triple_vert,4:b.layout_triple_left,5:b.layout_triple_right,6:b.layout_triple_horiz,7:b.layout_triple_top,8:b.layout_triple_bottom,9:b.layout_quad_sq_v,10:b.layout_quad_sq_h,11:b.layout_quad_vert,12:b.layout_quad_horiz,13:b.layout_quad_left,14:b.layout_quad_right,15:b.layout_quad_top,16:b.layout_quad_bottom},ag=new Map([["simple",!0],["triple",!1],["quadruple",!1]]);function cg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>d(Oo,{get label(){return r.toLocaleUpperCase()},get showByDefault(){return ag.get(r)??!1},style:{display:"flex","flex-direction":"row"},get children(){return d(N,{get each(){return e(r)},children:o=>d(Oi,{expand:!1,get icon(){return Is[o]},onSel:()=>i.onSel(o),get star(){return i.opts.favorites.includes(o)},starAct:()=>s(o),starDeact:()=>n(o)})})}})})}}))}var ug=y("<div class=topbar_container>"),dg=y("<div class=menu_section_titlebox>");const fg={menu_listings:{ohlc:[it.CANDLESTICK,it.BAR,it.ROUNDED_CANDLE],line:[it.LINE],area:[it.AREA,it.BASELINE],hist:[it.HISTOGRAM]},favorites:[it.ROUNDED_CANDLE]};function gg(){const i="series_selector";let t=document.createElement("div");const[e,s]=C(),[n,r]=C({x:0,y:0}),[o,l]=Ct(fg),h=()=>Array.from(o.favorites).sort((u,f)=>u-f),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setSeries=s,window.api.update_series_topbar_opts=l;function c(u){window.active_container===void 0||window.active_frame===void 0||window.api.series_change(window.active_container.id,window.active_frame.id,u)}return gt().attachOverlay(i,d(pg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=ug(),f=t;return typeof f=="function"?q(f,u):t=u,v(u,d(j,{get when(){return dt(()=>!!e())()&&!o.favorites.includes(e())},get children(){return d(O,{get icon(){return Os[e()]},classList:{topbar_icon_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(O,{get icon(){return Os[m]},classList:{topbar_icon_btn:!0},get activated(){return e()===m},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Os={0:b.close,1:b.close,2:b.series_line,3:b.series_area,4:b.series_baseline,5:b.series_histogram,6:b.close,7:b.candle_bar,8:b.candle_regular,9:b.candle_rounded},mg={0:"Whitespace Data",1:"Single Value Data",2:"Line",3:"Area",4:"Baseline",5:"Histogram",6:"OHLC Data",7:"Bar",8:"Candlestick",9:"Rounded Candlestick"};function pg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>[dg(),d(N,{get each(){return e(r)},children:o=>d(Oi,{expand:!0,get icon(){return Os[o]},get label(){return mg[o]},onSel:()=>i.onSel(o),get star(){return i.opts.favorites.includes(o)},starAct:()=>s(o),starDeact:()=>n(o)})})]})}}))}var vg=y('<div class=topbar_container><div id=symbol_box class=sel_highlight><div id=search_text class="topbar_containers text"></div></div><div>'),_g=y("<div class=symbol_title_bar><h1 class=text>Symbol Search</h1><div id=symbol_search_drag>"),bg=y('<div class=symbol_input><input class="search_input text"type=text><input class="search_submit text"type=submit value=Submit>'),wg=y('<div class=symbol_list><table id=symbols_table><thead><tr class="symbol_list_item text"><th>Symbol</th><th>Name</th><th>Exchange</th><th>Type</th><th>Data Broker</th></tr></thead><tbody>'),yg=y('<tr class="symbol_list_item text"><td></td><td></td><td></td><td></td><td>'),xg=y('<div class="symbol_select_filter text"><div id=any class=bubble_item>Any'),Sg=y("<div class=bubble_item>");const Mg={exchange:["NYSE","NASDAQ"],data_broker:["Local","Alpaca"],security_type:["Crypto","Equity"]};function Cg(){const i="symbol_search";let t=document.createElement("div"),e=document.createElement("div");const s=C(!1),n=s[0],r=s[1],[o,l]=C("LWPC"),[h,a]=C(!0),[c,u]=C({x:0,y:0});window.topbar.setTicker=l;function f(x,$){a($),r(!n()),x.stopPropagation()}const m=()=>{u({x:window.innerWidth/2,y:window.innerHeight*.2})};ft(()=>{t.addEventListener("mousedown",x=>f(x,!0)),e.addEventListener("mousedown",x=>f(x,!1)),window.addEventListener("resize",m)}),vt(()=>{window.removeEventListener("resize",m)});const[g,p]=C([]),[_,w]=Ct(Mg);return window.api.set_search_filters=w,window.api.populate_search_symbols=p,gt().attachOverlay(i,d(Eg,{id:i,get symbols(){return g()},setDisplay:r,filters:_,setFilters:w,get replace(){return h()},setReplace:a,get location(){return c()},setLocation:u,updateLocation:m}),s),(()=>{var x=vg(),$=x.firstChild,E=$.firstChild,L=$.nextSibling,F=t;typeof F=="function"?q(F,$):t=$,v($,d(O,{get icon(){return b.menu_search},style:{margin:"5px"},width:20,height:20}),E),v(E,o);var W=e;return typeof W=="function"?q(W,L):e=L,L.style.setProperty("display","flex"),L.style.setProperty("align-items","center"),v(L,d(O,{get icon(){return b.menu_add}})),x})()}const $g=new Map([["exchange","Exchange:"],["data_broker","Data Broker:"],["security_type","Security Type:"]]);function Eg(i){const[,t]=tt(i,["replace","setReplace","symbols","filters","setFilters","setDisplay"]);function e(o){window.active_frame?.timeframe&&window.api.data_request(window.active_container?.id,window.active_frame?.id,o,window.active_frame?.timeframe.toString()),i.setDisplay(!1)}function s(o){const l=document.querySelector(`#${i.id}`);if(!l)return;const h=l.querySelector("input.search_input").value,a=Array.from(l.querySelectorAll("#exchange > .bubble_item[active]"),f=>f?.textContent??""),c=Array.from(l.querySelectorAll("#data_broker > .bubble_item[active]"),f=>f?.textContent??""),u=Array.from(l.querySelectorAll("#security_type > .bubble_item[active]"),f=>f?.textContent??"");window.api.symbol_search(h,u,c,a,o)}function n(o){let l=o.target;l.hasAttribute("active")?(l.removeAttribute("active"),l.parentElement?.querySelectorAll(".bubble_item[active]").length===0&&l.parentElement.querySelector("#any")?.setAttribute("active","")):(l.parentElement?.querySelectorAll("#any[active]").length===1&&l.parentElement.querySelector("#any")?.removeAttribute("active"),l.setAttribute("active","")),s(!1)}function r(o){let l=o.target,h=l.parentElement?.querySelectorAll(".bubble_item[active]");for(let a=0;a<h?.length;a++)h[a].removeAttribute("active");l.setAttribute("active",""),s(!1)}return d(Gt,A(t,{classList:{symbol_menu:!0},get location_ref(){return Xt.CENTER},drag_handle:"#symbol_search_drag",get bounding_client_id(){return`#${i.id}>.symbol_title_bar`},get children(){return[(()=>{var o=_g(),l=o.firstChild;return l.nextSibling,v(o,d(O,{get icon(){return b.menu_search},width:28,height:28,classList:{icon:!1,symbol_search_icon:!0}}),l),l.style.setProperty("margin","8px 10px"),v(o,d(O,{get icon(){return b.close},style:{"margin-right":"15px",padding:"5px"},onClick:()=>i.setDisplay(!1)}),null),o})(),(()=>{var o=bg(),l=o.firstChild,h=l.nextSibling;return l.addEventListener("keypress",a=>{a.key==="Enter"&&s(!0)}),l.$$input=()=>s(!1),h.$$click=()=>s(!0),o})(),(()=>{var o=wg(),l=o.firstChild,h=l.firstChild,a=h.nextSibling;return v(a,d(N,{get each(){return i.symbols},children:c=>(()=>{var u=yg(),f=u.firstChild,m=f.nextSibling,g=m.nextSibling,p=g.nextSibling,_=p.nextSibling;return u.$$click=()=>e(c),v(f,()=>c.ticker),v(m,()=>c.name??"-"),v(g,()=>c.exchange??"-"),v(p,()=>c.sec_type??"-"),v(_,()=>c.broker??"-"),u})()})),o})(),d(N,{get each(){return Object.keys(i.filters)},children:o=>(()=>{var l=xg(),h=l.firstChild;return H(l,"id",o),v(l,()=>$g.get(o),h),h.$$mousedown=r,H(h,"active",""),v(l,d(N,{get each(){return i.filters[o]},children:a=>(()=>{var c=Sg();return c.$$mousedown=n,v(c,a),c})()}),null),l})()})]}}))}Mt(["input","click","mousedown"]);var kg=y("<div class=topbar_container>");const Lg={menu_listings:{s:[1,2,5,15,30],m:[1,2,5,15,30],h:[1,2,4],D:[1],W:[1]},favorites:["1D"]};function Tg(){const i="timeframe_selector";let t=document.createElement("div");const[e,s]=C(new bt(1,"E")),[n,r]=C({x:0,y:0}),[o,l]=Ct(Lg),h=()=>Array.from(o.favorites,u=>bt.from_str(u)).sort((u,f)=>u.toValue()-f.toValue()),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setTimeframe=s,window.api.update_timeframe_topbar_opts=l;function c(u){window.active_frame?.symbol!==void 0&&window.api.data_request(window.active_container?.id??"",window.active_frame?.id??"",window.active_frame?.symbol??"",u.toString())}return gt().attachOverlay(i,d(zg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=kg(),f=t;return typeof f=="function"?q(f,u):t=u,v(u,d(j,{get when(){return dt(()=>!bt.is_equal(e(),new bt(1,"E")))()&&!o.favorites.includes(e().toString())},get children(){return d(Ie,{get text(){return e().toString(e().toValue()>=86400)},classList:{timeframe_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(Ie,{get text(){return m.toString(m.toValue()>=86400)},classList:{timeframe_btn:!0},get activated(){return bt.is_equal(e(),m)},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Pg=new Map([["s",!1],["m",!0],["h",!0],["D",!0],["W",!1],["M",!1],["Y",!1]]);function zg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>d(Oo,{get label(){return Yr[r]+"s"},get showByDefault(){return Pg.get(r)??!1},get children(){return d(N,{get each(){return e(r)},children:o=>{const l=new bt(o,r),h=l.toString();return d(Oi,{expand:!0,get label(){return l.toLabel()},onSel:()=>i.onSel(l),get star(){return i.opts.favorites.includes(h)},starAct:()=>s(h),starDeact:()=>n(h)})}})}})})}}))}var Dg=y('<div class="layout_main layout_flex"><div class=topbar><div class=topbar_separator></div><div class=topbar_separator></div><div class=topbar_separator></div><div class=topbar_separator></div></div><div class=topbar><div class=topbar_separator>');function Ag(i){return(()=>{var t=Dg(),e=t.firstChild,s=e.firstChild,n=s.nextSibling,r=n.nextSibling,o=r.nextSibling,l=e.nextSibling;return l.firstChild,yt(t,i,!1,!0),e.style.setProperty("justify-content","flex-start"),v(e,d(Cg,{}),s),v(e,d(Tg,{}),n),v(e,d(gg,{}),r),v(e,d(eg,{}),o),l.style.setProperty("justify-content","flex-end"),v(l,d(hg,{}),null),t})()}var Ig=y("<div class=widget_panel_title>Frame Viewer");const Og=200;function Rg(){const i=hi().displays,[t,e]=C(Array.from(active_container.frames,n=>n.id));X(Tt(i,()=>e(Array.from(active_container.frames,n=>n.id))));const s=n=>Vg.get(active_container.frames.find(r=>r.id===n)?.type??"")??"";return ft(()=>oe().setWidgetPanelWidth(Og)),[Ig(),d(j,{get when(){return i()},keyed:!0,get children(){return d(hn,{ids:t,overlay_child:({id:n})=>cn({tag_id:()=>n,tag_name:()=>s(n)}),get reorder_function(){return active_container.reorder_frames.bind(active_container)},get children(){return d(N,{get each(){return t()},children:n=>{let r=active_container.frames.find(o=>o.id===n);return d(an,{tag_id:()=>n,tag_name:()=>s(n),onClick:()=>r?.assign_active_frame(),get children(){return d(Wg,{id:n})}})}})}})}})]}const Vg=new Map([["abstract","Abstract Frame"],["charting_frame","Charting Frame"]]);function Wg(i){if(!(active_container.frames.length<=ge(active_container.layout)))return d(O,{get icon(){return b.close},onClick:()=>window.api.remove_frame(active_container.id,i.id)})}var Bg=y('<div class="layout_main layout_flex flex_col">'),Ng=y('<div class="layout_main widget_panel">');const[Ne,jg]=C();function Fg(i){return X(()=>{i.panelDisplay.display==="flex"&&Ne()?i.showWidgetPanel():i.hideWidgetPanel()}),(()=>{var t=Bg();return v(t,d(Tr,{get icon(){return b.frame_editor}}),null),v(t,d(Tr,{get icon(){return b.object_tree}}),null),k(e=>Ht(t,i.style,e)),t})()}function Tr(i){return d(O,A({width:34,height:34,classList:{icon:!1,widget_bar_icon:!0},style:{margin:"4px",padding:"2px"},onClick:()=>jg(Ne()!==i.icon?i.icon:void 0),get"attr:active"(){return Ne()===i.icon?"":void 0}},i))}function Ug(i){const t=oe().setWidgetPanelWidth,e=n=>{t(window.innerWidth-(n.clientX+xi+fn))},s=n=>{n.offsetX>6||(document.addEventListener("mousemove",e),document.addEventListener("mouseup",()=>document.removeEventListener("mousemove",e),{once:!0}))};return(()=>{var n=Ng();return yt(n,A(i,{onMouseDown:s}),!1,!0),v(n,d(je,{get children(){return[d(nt,{get when(){return Ne()===b.frame_editor},get children(){return d(Rg,{})}}),d(nt,{get when(){return Ne()===b.object_tree},get children(){return d(qd,{})}})]}})),n})()}var Hg=y("<div id=layout_wrapper class=wrapper><div class=layout_main>");const ct=5,Bt=38,wt=38,Xg=156,Kg=468,xi=52,fn=2,ve=46,Vo=38,qg={center:{width:"-1px",height:"-1px",top:`${wt+Bt+ct}px`,left:`${ve+ct}px`},titlebar:{width:"100vw",height:"38px",top:"0px",left:"0px"},topbar:{display:"flex",width:"100vw",height:"38px",top:`${wt}px`,left:"0px"},toolbar:{display:"flex",width:`${ve}px`,height:"-1px",top:`${wt+Bt+ct}px`,left:"0px"},widgetbar:{display:"flex",width:`${xi}px`,height:"-1px",top:`${wt+Bt+ct}px`,right:"0px"},widgetpanel:{display:"none",width:"-1px",height:"-1px",top:`${wt+Bt+ct}px`,right:`${xi+fn}px`},utilbar:{display:"flex",width:"-1px",height:`${Vo}px`,bottom:"0px",left:`${ve+ct}px`}};var Ot=(i=>(i[i.TITLE_BAR=0]="TITLE_BAR",i[i.TOP_BAR=1]="TOP_BAR",i[i.TOOL_BAR=2]="TOOL_BAR",i[i.WIDGET_BAR=3]="WIDGET_BAR",i[i.WIDGET_PANEL=4]="WIDGET_PANEL",i[i.UTIL_BAR=5]="UTIL_BAR",i[i.CENTER=6]="CENTER",i))(Ot||{});function Gg(){const[i,t]=Ct(qg),e=oe().widgetPanelWidth;ft(()=>{window.addEventListener("resize",()=>li(window.innerWidth,window.innerHeight,i,t)),li(window.innerWidth,window.innerHeight,i,t)}),X(()=>{li(window.innerWidth,window.innerHeight,i,t)}),X(Tt(e,()=>{li(window.innerWidth,window.innerHeight,i,t)}));const s={show_section:Pr.bind(void 0,t),hide_section:zr.bind(void 0,t)},n={panelDisplay:i.widgetbar,showWidgetPanel:Pr.bind(void 0,t,4),hideWidgetPanel:zr.bind(void 0,t,4)};return d(Yg,{get children(){var r=Hg(),o=r.firstChild;return v(r,d(Wl,{get style(){return i.center}}),o),v(r,d(mf,A({get style(){return i.titlebar}},s)),o),v(r,d(Ag,{get style(){return i.topbar}}),o),v(r,d(Vf,{get style(){return i.toolbar}}),o),v(r,d(Fg,A({get style(){return i.widgetbar}},n)),o),v(r,d(Ug,{get style(){return i.widgetpanel}}),o),k(l=>Ht(o,i.utilbar,l)),r}})}function Yg(i){return d(gh,{get children(){return d(Nf,{get children(){return d(Kd,{get children(){return d(Jg,{get children(){return d(Sl,{get children(){return i.children}})}})}})}})}})}function li(i,t,e,s){const n=oe().widgetPanelWidth();let r=t-wt,o=t-wt,l=i;e.topbar.display==="flex"&&(r-=Bt+ct,o-=Bt+ct),e.toolbar.display==="flex"&&(l-=ve+ct),e.widgetbar.display==="flex"&&(l-=xi+ct),e.widgetpanel.display==="flex"&&(l-=n+fn),e.utilbar.display==="flex"&&(o-=Vo+ct),s("toolbar","height",`${r}px`),s("widgetbar","height",`${r}px`),s("widgetpanel","height",`${r}px`),s("widgetpanel","width",`${n}px`),s("center","height",`${o}px`),s("center","width",`${l}px`),s("utilbar","width",`${l}px`),window.active_container&&window.active_container.resize(new DOMRect(0,0,l,o));let h=oe().widgetPanelResizeFunc();h!==void 0&&h(new DOMRect(0,0,n,o))}function Pr(i,t){switch(t){case 2:i("center","left",`${ve+ct}px`),i("utilbar","left",`${ve+ct}px`),i("toolbar","display","flex");break;case 3:i("widgetbar","display","flex");break;case 4:i("widgetpanel","display","flex");break;case 1:i("toolbar","top",`${wt+Bt+ct}px`),i("widgetbar","top",`${wt+Bt+ct}px`),i("center","top",`${wt+Bt+ct}px`),i("topbar","display","flex");break;case 5:i("utilbar","display","flex")}window.active_container&&window.active_container.resize()}function zr(i,t){switch(t){case 2:i("center","left","0px"),i("utilbar","left","0px"),i("toolbar","display","none");break;case 3:i("widgetbar","display","none"),i("widgetpanel","display","none");break;case 4:i("widgetpanel","display","none");break;case 1:i("toolbar","top",`${wt}px`),i("widgetbar","top",`${wt}px`),i("center","top",`${wt}px`),i("topbar","display","none");break;case 5:i("utilbar","display","none")}window.active_container&&window.active_container.resize()}const Zg={widgetPanelWidth:()=>0,setWidgetPanelWidth:()=>{},widgetPanelResizeFunc:()=>()=>{},setWidgetPanelResizeFunc:()=>{}};let Rs=_t(Zg);function oe(){return Ut(Rs)}function Jg(i){const t=C(208),e=C(n=>{}),s={widgetPanelWidth:t[0],setWidgetPanelWidth:n=>{t[1](Math.max(Math.min(n,Kg),Xg))},widgetPanelResizeFunc:e[0],setWidgetPanelResizeFunc:e[1]};return Rs=_t(s),d(Rs.Provider,{value:s,get children(){return i.children}})}class Qg{close;maximize;minimize;restore;add_container=()=>window.container_manager.add_container(_i(Array.from(container_manager.containers.keys()),"c_"));remove_container=t=>window.container_manager.remove_container(t);remove_frame=(t,e)=>active_container.remove_frame(e);reorder_containers=(t,e)=>{console.log(`reorder containers from: ${t} to: ${e} `)};layout_change=(t,e)=>{console.log(`Layout Change: ${t},${e}`);const s=window.container_manager.containers.get(t);if(s!==void 0){for(let n=s.frames.length;n<ge(s.layout);n++)s.add_frame(_i(Array.from(s.frames,r=>r.id),`${t}_f_`));s.set_layout(e)}};series_change=(t,e,s)=>{console.log(`Series Change: ${t},${e},${s}`)};data_request=(t,e,s,n)=>{console.log(`Data Request: ${t},${e},${s},${n}`)};symbol_search=(t,e,s,n,r)=>{console.log(`Search Request: ${t},${e},${s},${n},${r}`)};set_indicator_options=(t,e,s,n)=>{console.log(`Set Indicator Options: ${t},${e},${s}`,n)};indicator_request=(t,e,s,n)=>{console.log(`Request Indicator: ${t},${e},${s},${n}`)};update_series_options=(t,e,s,n,r)=>{console.log(`Set Series Options: ${t},${e},${s},${n}`,r)};setFrameless=t=>{};populate_search_symbols=t=>{};set_search_filters=(t,e)=>{};populate_indicator_pkgs=t=>{};update_series_topbar_opts=t=>console.log("Series opts:",t);update_layout_topbar_opts=t=>console.log("Layout opts:",t);update_timeframe_topbar_opts=t=>console.log("Timeframe opts:",t);set_user_colors=t=>{}}window.api=new Qg;window.Container_Layouts=Q;window.topbar={setSeries:i=>{},setTimeframe:i=>{},setLayout:i=>{},setTicker:i=>{}};ll(Gg,document.body);
+`;var ff=y("<div class=titlebar_separator>"),gf=y('<div class="layout_title layout_flex"><div class="titlebar titlebar_grab tabs frameless-drag-region"><div class=tabs-content></div></div><div class="titlebar titlebar_btns frameless-drag-region"><div class=titlebar_separator>');function mf(i){let t;const[e,s]=C(!1),[n,r]=C(!1);return window.api.setFrameless=s,ft(()=>{t&&(window.container_manager=new of(t))}),(()=>{var o=gf(),l=o.firstChild,h=l.nextSibling,a=h.firstChild,c=t;return typeof c=="function"?q(c,l):t=l,v(h,d(O,{get icon(){return b.window_add},classList:{window_btn:!0},style:{padding:"1px 3px"},onClick:()=>{window.api.add_container()}}),a),v(h,d(ri,{get icon(){return b.panel_left},classList:{layout_btn:!0},activated:!0,onAct:()=>{i.show_section(Ot.TOOL_BAR)},onDeact:()=>{i.hide_section(Ot.TOOL_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_right},classList:{layout_btn:!0},onAct:()=>{i.show_section(Ot.WIDGET_BAR)},onDeact:()=>{i.hide_section(Ot.WIDGET_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_top},classList:{layout_btn:!0},activated:!0,onAct:()=>{i.show_section(Ot.TOP_BAR)},onDeact:()=>{i.hide_section(Ot.TOP_BAR)}}),null),v(h,d(ri,{get icon(){return b.panel_bottom},classList:{layout_btn:!0},onAct:()=>{i.show_section(Ot.UTIL_BAR)},onDeact:()=>{i.hide_section(Ot.UTIL_BAR)}}),null),v(h,d(j,{get when(){return e()},get children(){return[ff(),d(O,{get icon(){return b.minimize},classList:{window_btn:!0},style:{padding:"3px"},width:16,height:16,onClick:()=>{window.api.minimize()}}),d(j,{get when(){return n()},get children(){return[d(O,{get icon(){return b.restore},classList:{window_btn:!0},onClick:()=>{r(!1),window.api.restore()}})," "]}}),d(j,{get when(){return!n()},get children(){return[" ",d(O,{get icon(){return b.maximize},classList:{window_btn:!0},style:{padding:"2px"},onClick:()=>{r(!0),window.api.maximize()}})," "]}}),d(O,{get icon(){return b.close},classList:{window_btn:!0},style:{padding:"3px"},width:16,height:16,onClick:()=>{window.api.close()}})]}}),null),k(u=>Ht(o,i.style,u)),o})()}const pf={icon:"",activated:!1,onAct:()=>{console.log("Button Activated!")},onDeact:()=>{console.log("Button Deactivated!")}};function ri(i){const t=A(pf,i),[e,s]=C(t.activated),[,n]=tt(t,["onAct","onDeact"]);return n.onClick=()=>{s(!e()),e()&&t.onAct?t.onAct():!e()&&t.onDeact&&t.onDeact()},e()&&t.onAct?t.onAct():!e()&&t.onDeact&&t.onDeact(),d(O,A(n,{get activated(){return e()}}))}const xe=(()=>{for(const i of Array.from(document.styleSheets))if(i.href!==null){for(const t of Array.from(i.cssRules))if(t.selectorText===".tv-lightweight-charts")return t}})();function vf(){xe&&(xe.style.cursor="crosshair")}function _f(){xe&&(xe.style.cursor="")}const bf=`url('data:image/svg+xml,<svg width="12px" height="12px" style="fill:white" viewBox="-4 -4 8.00 8.00" xmlns="http://www.w3.org/2000/svg"><path d="M -2.2 0 C -2.201.711 -0.37 2.769 1.097 1.922 C 1.777 1.529 2.197 0.803 2.197 0.017 C 2.197 -1.677 0.363 -2.735 -1.103 -1.888 C -1.784 -1.495 -2.203 -0.769 -2.203 0.017 Z"/></svg>') 6 6, auto`;function wf(){xe&&(xe.style.cursor=bf)}const Qt=C(!1);let yi=new AbortController,ci=new AbortController;X(()=>{Qt[0]()||(yi.abort(),ci.abort(),yi=new AbortController)});function yf(){Mf(Qt,yi,xf)}function xf(i){if(active_pane===void 0){Qt[1](!1);return}yi.abort();const t=new zo("",{p1:null,p2:null});active_pane.attach_primitive(t);let e=t.series.coordinateToPrice(i.offsetY),s=t.chart.timeScale().coordinateToTime(i.offsetX);if(s===null||e===null){console.error("Failed to create TrendLine, Price or Time invalid"),t._pane?.remove_primitive(t._id),Qt[1](!1);return}t.updateData({p1:{time:s,value:e},p2:{time:s,value:e}});const n=t.chart.timeScale(),r=Sf.bind(t,n);t.chart.subscribeCrosshairMove(r),ci=new AbortController,document.addEventListener("keydown",o=>{o.key==="Escape"&&(t.chart.unsubscribeCrosshairMove(r),t._pane?.remove_primitive(t._id),Qt[1](!1))},{signal:ci.signal}),setTimeout(()=>{t.chart.chartElement().addEventListener("click",o=>{o.button===0&&(t.chart.unsubscribeCrosshairMove(r),Qt[1](!1))},{signal:ci.signal})},100)}function Sf(i,t){if(!t.point)return;let e=i.coordinateToTime(t.point.x),s=this.series.coordinateToPrice(t.point.y);e&&s&&this.updateData({p1:null,p2:{time:e,value:s}})}function Mf(i,t,e){if(!(window.active_container===void 0||i[0]())){for(const[,s]of dn.entries())s!==i&&s[0]()&&s[1](!1);window.active_container.frames.forEach(s=>{s.hasOwnProperty("panes")&&s.panes.forEach(n=>{n.chart.chartElement().addEventListener("click",e,{signal:t.signal}),i[1](!0)})}),i[0]()&&document.addEventListener("keydown",s=>{s.key==="Escape"&&i[1](!1)},{signal:t.signal})}}const un=new Map([[b.cursor_dot,wf],[b.cursor_arrow,_f],[b.cursor_cross,vf],[b.trend_line,yf]]),dn=new Map([[b.trend_line,Qt]]);var Cf=y("<div>"),$f=y('<div class=menu_section_titlebox><span class="menu_section_text text">'),Ef=y("<div class=menu_section>"),kf=y("<span class=menu_text>"),Lf=y("<div><span class=menu_selectable>");function Ii(i){let t=document.createElement("div");const[,e]=tt(i,["id","style","icon_act","icon_deact"]),s=gt().getDisplayAccessor(i.id),n=gt().getDisplaySetter(i.id);return ft(()=>{t.addEventListener("mousedown",r=>{r.button===0&&(n(!s()),r.stopPropagation())})}),(()=>{var r=Cf(),o=t;return typeof o=="function"?q(o,r):t=r,yt(r,e,!1,!0),v(r,d(O,{get icon(){return s()?i.icon_act:i.icon_deact}})),r})()}function Oo(i){const[t,e]=C(i.showByDefault);return[(()=>{var s=$f(),n=s.firstChild;return s.$$click=()=>e(!t()),v(n,()=>i.label.toUpperCase()),v(s,d(O,{get icon(){return t()?b.menu_arrow_sn:b.menu_arrow_ns}}),null),s})(),d(j,{get when(){return t()},get children(){var s=Ef();return v(s,()=>i.children),k(n=>Ht(s,i.style,n)),s}})]}const Tf=["label","icon","data","onSel","expand","star","starAct","starDeact","starStyle"];function Oi(i){const[t,e]=C(!1);i.classList=A(i.classList,{menu_item:!0}),i.expand===void 0&&(i.expand=!1);const[s,n]=tt(i,Tf);return(()=>{var r=Lf(),o=r.firstChild;return yt(r,A(n,{onmouseenter:()=>e(!0),onMouseLeave:()=>e(!1)}),!1,!0),o.$$click=l=>{l.button===0&&i.onSel&&i.onSel()},v(o,d(j,{get when(){return s.icon},get children(){return d(O,{get icon(){return s.icon??""}})}}),null),v(o,d(j,{get when(){return s.label},get children(){var l=kf();return v(l,()=>s.label),l}}),null),v(r,d(j,{get when(){return s.star!==void 0},get children(){return d(Pf,{get visible(){return t()},get selected(){return s.star??!1},get starAct(){return s.starAct},get starDeact(){return s.starDeact},get style(){return i.starStyle??{}}})}}),null),k(l=>(l=s.expand?"-webkit-fill-available":void 0)!=null?o.style.setProperty("width",l):o.style.removeProperty("width")),r})()}function Pf(i){const[t,e]=C(i.selected);function s(){e(!t()),t()&&i.starAct?i.starAct():i.starDeact&&i.starDeact()}return d(O,{class:"menu_item_star",onClick:n=>{n.button===0&&s()},get icon(){return t()?b.star_filled:b.star},get style(){return{color:t()?"var(--second-accent-color)":i.visible?void 0:"#0000",...i.style}}})}Mt(["click"]);var zf=y("<div class=toolbar_container>"),Df=y("<div class=menu_section_titlebox>");function oi(i){let t=document.createElement("div");const[e,s]=C({x:0,y:0}),[n,r]=C(b.blank),[o,l]=C(i.default_icon),h=()=>{s({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().top})};return gt().attachOverlay(i.id,d(Af,{get id(){return i.id},get location(){return e()},updateLocation:h,get tools(){return i.tools},setIcon:l})),(()=>{var a=zf();a.addEventListener("mouseleave",()=>r(b.blank)),a.addEventListener("mouseenter",()=>r(b.menu_arrow_ew));var c=t;return typeof c=="function"?q(c,a):t=a,v(a,d(O,{get icon(){return o()},get"attr:active"(){return dn.get(o())?.[0]()?"":void 0},get onClick(){return un.get(o())},classList:{toolbar_icon_btn:!0}}),null),v(a,d(Ii,{get id(){return i.id},classList:{toolbar_menu_button:!0},get icon_act(){return b.menu_arrow_we},get icon_deact(){return n()}}),null),a})()}function Af(i){let t;const e=ee().tools,s=ee().setTools,[,n]=tt(i,["tools","setIcon"]);function r(h){e().includes(h)||s([...e(),h])}function o(h){e().includes(h)&&s(e().filter(a=>a!=h))}function l(h){i.setIcon(h);const a=un.get(h);a?a():console.log("invalid tool"),t(!1)}return ft(()=>{t=gt().getDisplaySetter(i.id)}),d(Gt,A(n,{get location_ref(){return Xt.TOP_LEFT},get children(){return d(N,{get each(){return i.tools},children:h=>[Df(),d(N,{each:h,children:a=>d(Oi,{expand:!0,icon:a,get label(){return If.get(a)??""},onSel:()=>l(a),get star(){return e().includes(a)},starAct:()=>r(a),starDeact:()=>o(a),starStyle:{width:"20px",height:"20px"}})})]})}}))}const If=new Map([[b.cursor_cross,"Cross"],[b.cursor_dot,"Dot"],[b.cursor_arrow,"Arrow"],[b.cursor_erase,"Erase"],[b.trend_line,"Trend Line"],[b.horiz_ray,"Horiz. Ray"],[b.horiz_line,"Horiz. Line"],[b.vert_line,"Vert. Line"],[b.polyline,"Polyline"],[b.channel_parallel,"Parallel Channel"],[b.channel_disjoint,"Disjoint Channel"],[b.fib_retrace,"Fib. Retrace"],[b.fib_extend,"Fib. Extention"],[b.range_price,"Price Range"],[b.range_date,"Date Range"],[b.range_price_date,"Price & Date Range"]]);var Of=y('<div class="layout_main layout_flex flex_col"><div class=toolbar><div class=toolbar_separator></div></div><div class=toolbar><div class=toolbar_separator>'),Rf=y("<div class=toolbox_btn_wrap>");function Vf(i){return(()=>{var t=Of(),e=t.firstChild,s=e.firstChild,n=e.nextSibling;return n.firstChild,yt(t,i,!1,!0),e.style.setProperty("justify-content","flex-start"),v(e,d(oi,Ff),s),v(e,d(oi,Uf),s),v(e,d(oi,Hf),s),v(e,d(oi,Xf),s),n.style.setProperty("justify-content","flex-end"),v(n,d(Wf,{}),null),t})()}function Wf(){const i="toolbox",t=C(!1),e=t[0],s=t[1],n=ee().location,r=ee().setLocation;return gt().attachOverlay(i,d(jf,{id:i}),t,null),X(Tt(e,()=>{if(e()&&n().x===-1&&n().y===-1){let o=document.querySelector(".toolbox_btn_wrap")?.getBoundingClientRect();if(o===void 0)return;r({x:o.right+20,y:o.top+2})}})),(()=>{var o=Rf();return o.$$mousedown=()=>s(!e()),v(o,d(O,{get icon(){return e()?b.star_filled:b.star},width:26,height:26,classList:{toolbox_btn:!0}})),o})()}const Bf={tools:()=>[],setTools:()=>{},location:()=>({x:0,y:0}),setLocation:()=>{}};let As=_t(Bf);function ee(){return Ut(As)}function Nf(i){const[t,e]=C([]),[s,n]=C({x:-1,y:-1}),r={tools:t,setTools:e,location:s,setLocation:n};return As=_t(r),d(As.Provider,{value:r,get children(){return i.children}})}function jf(i){const t=ee().tools,e=ee().location,s=ee().setLocation;return d(Gt,{get id(){return i.id},get location(){return e()},setLocation:s,get location_ref(){return Xt.TOP_LEFT},get drag_handle(){return`#${i.id}>#menu_dragable`},get bounding_client_id(){return`#${i.id}>#menu_dragable`},get children(){return[d(O,{hover:!1,get icon(){return b.menu_dragable}}),d(N,{get each(){return t()},children:n=>d(O,{icon:n,get onClick(){return un.get(n)},get"attr:active"(){return dn.get(n)?.[0]()?"":void 0}})})]}})}const Ff={id:"crosshair_menu",default_icon:b.cursor_cross,tools:[[b.cursor_cross,b.cursor_dot,b.cursor_arrow]]},Uf={id:"trend_menu",default_icon:b.trend_line,tools:[[b.trend_line,b.horiz_line,b.vert_line,b.horiz_ray],[b.polyline],[b.channel_parallel,b.channel_disjoint]]},Hf={id:"fibonacci_menu",default_icon:b.fib_retrace,tools:[[b.fib_retrace,b.fib_extend]]},Xf={id:"measure_menu",default_icon:b.range_price,tools:[[b.range_price,b.range_date,b.range_price_date]]};Mt(["mousedown"]);var Kf=y('<div class=topbar_container><div class="menu_selectable indicator_topbar_btn"><div class=text>Indicators'),qf=y("<div class=indicator_title_bar><h1 class=text>Indicators</h1><div id=indicator_menu_drag>"),Gf=y("<div class=indicator_title_separator>"),Yf=y("<div id=indicator_pkg_description>"),Zf=y("<div id=indicator_info_container><div id=indicator_packages_list><table><tbody></tbody></table></div><div class=indicator_vert_separator></div><div id=indicator_details_list><table><tbody>"),Ro=y("<div class=version>"),Jf=y("<div class=pkg_card><span>"),Qf=y("<div class=description>"),tg=y("<div class=ind_card><span>");function eg(){const i="indicator_menu";let t=document.createElement("div");const e=C(!1),[s,n]=C({x:0,y:0}),r=()=>{n({x:window.innerWidth/2,y:window.innerHeight*.2})};function o(a){e[1](!e[0]()),a.stopPropagation()}ft(()=>{t.addEventListener("mousedown",a=>o(a)),window.addEventListener("resize",r)}),vt(()=>{window.removeEventListener("resize",r)});const[l,h]=Ct({});return window.api.populate_indicator_pkgs=h,gt().attachOverlay(i,d(ig,{id:i,packages:l,get setDisplay(){return e[1]},get location(){return s()},setLocation:n,updateLocation:r}),e),X(()=>console.log(l)),(()=>{var a=Kf(),c=a.firstChild,u=c.firstChild,f=t;return typeof f=="function"?q(f,c):t=c,v(c,d(O,{get icon(){return b.indicator}}),u),u.style.setProperty("padding","0px 2px"),a})()}function ig(i){const[,t]=tt(i,["setDisplay","packages"]),e=C(void 0);return d(Gt,A(t,{classList:{indicator_menu:!0},get location_ref(){return Xt.CENTER},drag_handle:"#indicator_menu_drag",get bounding_client_id(){return`#${i.id}>.indicator_title_bar`},get children(){return[(()=>{var s=qf(),n=s.firstChild;return n.nextSibling,v(s,d(O,{get icon(){return b.indicator_on_stratagy},width:28,height:28,classList:{icon:!1,symbol_search_icon:!0}}),n),n.style.setProperty("margin","8px 10px"),v(s,d(O,{get icon(){return b.close},style:{"margin-right":"15px",padding:"5px"},onClick:()=>i.setDisplay(!1)}),null),s})(),Gf(),(()=>{var s=Zf(),n=s.firstChild,r=n.firstChild,o=r.firstChild,l=n.nextSibling,h=l.nextSibling,a=h.firstChild,c=a.firstChild;return v(o,d(N,{get each(){return Object.values(i.packages)},children:u=>d(sg,A({activePkgSig:e},u))})),v(c,d(N,{get each(){return Object.values(e[0]()?.indicators??{})},children:u=>d(ng,A(u,{get activePkgKey(){return e[0]()?.pkg_key??""},get setDisplay(){return i.setDisplay}}))})),v(h,d(j,{get when(){return e[0]()?.description},get children(){var u=Yf();return k(()=>u.innerHTML=e[0]()?.description),u}}),null),s})()]}}))}function sg(i){const[,t]=tt(i,["activePkgSig"]);return(()=>{var e=Jf(),s=e.firstChild;return e.$$click=()=>i.activePkgSig[1](t),v(e,d(j,{get when(){return i.pkg_version},get children(){var n=Ro();return k(()=>n.innerText=i.pkg_version??""),n}}),null),k(n=>{var r=i.activePkgSig[0]()?.pkg_key==i.pkg_key?"":void 0,o=i.pkg_name;return r!==n.e&&H(e,"active",n.e=r),o!==n.t&&(s.innerText=n.t=o),n},{e:void 0,t:void 0}),e})()}function ng(i){if(!i.unlisted)return(()=>{var t=tg(),e=t.firstChild;return t.$$click=()=>{rg(i.activePkgKey,i.ind_key),i.setDisplay(!1)},v(t,d(j,{get when(){return i.description&&i.description!=""},get children(){var s=Qf();return k(()=>s.innerHTML=i.description??""),s}}),null),v(t,d(j,{get when(){return i.ind_version&&i.ind_version!=""},get children(){var s=Ro();return k(()=>s.innerText=i.ind_version??""),s}}),null),k(()=>e.innerText=i.ind_name),t})()}function rg(i,t){window.active_container==null||window.active_frame==null||window.api.indicator_request(window.active_container.id,window.active_frame.id,i,t)}Mt(["click"]);var og=y("<div class=topbar_container>");const lg={menu_listings:{simple:[Q.SINGLE,Q.DOUBLE_HORIZ,Q.DOUBLE_VERT],triple:[Q.TRIPLE_VERT,Q.TRIPLE_HORIZ,Q.TRIPLE_VERT_LEFT,Q.TRIPLE_VERT_RIGHT,Q.TRIPLE_HORIZ_TOP,Q.TRIPLE_HORIZ_BOTTOM],quadruple:[Q.QUAD_SQ_V,Q.QUAD_SQ_H,Q.QUAD_VERT,Q.QUAD_HORIZ,Q.QUAD_LEFT,Q.QUAD_RIGHT,Q.QUAD_TOP,Q.QUAD_BOTTOM]},favorites:[Q.SINGLE,Q.DOUBLE_HORIZ,Q.DOUBLE_VERT]};function hg(){const i="layout_selector";let t=document.createElement("div");const[e,s]=C(Q.SINGLE),[n,r]=C({x:0,y:0}),[o,l]=Ct(lg),h=()=>Array.from(o.favorites).sort((u,f)=>u-f),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setLayout=s,window.api.update_layout_topbar_opts=l;function c(u){window.api.layout_change(window.active_container?.id??"",u)}return gt().attachOverlay(i,d(cg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=og(),f=t;return typeof f=="function"?q(f,u):t=u,u.style.setProperty("margin-right","4px"),v(u,d(j,{get when(){return!o.favorites.includes(e())},get children(){return d(O,{get icon(){return Is[e()]},classList:{topbar_icon_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(O,{get icon(){return Is[m]},classList:{topbar_icon_btn:!0},get activated(){return e()===m},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Is={0:b.layout_single,1:b.layout_double_vert,2:b.layout_double_horiz,3:b.layout_triple_vert,4:b.layout_triple_left,5:b.layout_triple_right,6:b.layout_triple_horiz,7:b.layout_triple_top,8:b.layout_triple_bottom,9:b.layout_quad_sq_v,10:b.layout_quad_sq_h,11:b.layout_quad_vert,12:b.layout_quad_horiz,13:b.layout_quad_left,14:b.layout_quad_right,15:b.layout_quad_top,16:b.layout_quad_bottom},ag=new Map([["simple",!0],["triple",!1],["quadruple",!1]]);function cg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>d(Oo,{get label(){return r.toLocaleUpperCase()},get showByDefault(){return ag.get(r)??!1},style:{display:"flex","flex-direction":"row"},get children(){return d(N,{get each(){return e(r)},children:o=>d(Oi,{expand:!1,get icon(){return Is[o]},onSel:()=>i.onSel(o),get star(){return i.opts.favorites.includes(o)},starAct:()=>s(o),starDeact:()=>n(o)})})}})})}}))}var ug=y("<div class=topbar_container>"),dg=y("<div class=menu_section_titlebox>");const fg={menu_listings:{ohlc:[it.CANDLESTICK,it.BAR,it.ROUNDED_CANDLE],line:[it.LINE],area:[it.AREA,it.BASELINE],hist:[it.HISTOGRAM]},favorites:[it.ROUNDED_CANDLE]};function gg(){const i="series_selector";let t=document.createElement("div");const[e,s]=C(),[n,r]=C({x:0,y:0}),[o,l]=Ct(fg),h=()=>Array.from(o.favorites).sort((u,f)=>u-f),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setSeries=s,window.api.update_series_topbar_opts=l;function c(u){window.active_container===void 0||window.active_frame===void 0||window.api.series_change(window.active_container.id,window.active_frame.id,u)}return gt().attachOverlay(i,d(pg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=ug(),f=t;return typeof f=="function"?q(f,u):t=u,v(u,d(j,{get when(){return dt(()=>!!e())()&&!o.favorites.includes(e())},get children(){return d(O,{get icon(){return Os[e()]},classList:{topbar_icon_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(O,{get icon(){return Os[m]},classList:{topbar_icon_btn:!0},get activated(){return e()===m},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Os={0:b.close,1:b.close,2:b.series_line,3:b.series_area,4:b.series_baseline,5:b.series_histogram,6:b.close,7:b.candle_bar,8:b.candle_regular,9:b.candle_rounded},mg={0:"Whitespace Data",1:"Single Value Data",2:"Line",3:"Area",4:"Baseline",5:"Histogram",6:"OHLC Data",7:"Bar",8:"Candlestick",9:"Rounded Candlestick"};function pg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>[dg(),d(N,{get each(){return e(r)},children:o=>d(Oi,{expand:!0,get icon(){return Os[o]},get label(){return mg[o]},onSel:()=>i.onSel(o),get star(){return i.opts.favorites.includes(o)},starAct:()=>s(o),starDeact:()=>n(o)})})]})}}))}var vg=y('<div class=topbar_container><div id=symbol_box class=sel_highlight><div id=search_text class="topbar_containers text"></div></div><div>'),_g=y("<div class=symbol_title_bar><h1 class=text>Symbol Search</h1><div id=symbol_search_drag>"),bg=y('<div class=symbol_input><input class="search_input text"type=text><input class="search_submit text"type=submit value=Submit>'),wg=y('<div class=symbol_list><table id=symbols_table><thead><tr class="symbol_list_item text"><th>Symbol</th><th>Name</th><th>Exchange</th><th>Type</th><th>Data Broker</th></tr></thead><tbody>'),yg=y('<tr class="symbol_list_item text"><td></td><td></td><td></td><td></td><td>'),xg=y('<div class="symbol_select_filter text"><div id=any class=bubble_item>Any'),Sg=y("<div class=bubble_item>");const Mg={exchange:["NYSE","NASDAQ"],data_broker:["Local","Alpaca"],security_type:["Crypto","Equity"]};function Cg(){const i="symbol_search";let t=document.createElement("div"),e=document.createElement("div");const s=C(!1),n=s[0],r=s[1],[o,l]=C("LWPC"),[h,a]=C(!0),[c,u]=C({x:0,y:0});window.topbar.setTicker=l;function f(x,$){a($),r(!n()),x.stopPropagation()}const m=()=>{u({x:window.innerWidth/2,y:window.innerHeight*.2})};ft(()=>{t.addEventListener("mousedown",x=>f(x,!0)),e.addEventListener("mousedown",x=>f(x,!1)),window.addEventListener("resize",m)}),vt(()=>{window.removeEventListener("resize",m)});const[g,p]=C([]),[_,w]=Ct(Mg);return window.api.set_search_filters=w,window.api.populate_search_symbols=p,gt().attachOverlay(i,d(Eg,{id:i,get symbols(){return g()},setDisplay:r,filters:_,setFilters:w,get replace(){return h()},setReplace:a,get location(){return c()},setLocation:u,updateLocation:m}),s),(()=>{var x=vg(),$=x.firstChild,E=$.firstChild,L=$.nextSibling,F=t;typeof F=="function"?q(F,$):t=$,v($,d(O,{get icon(){return b.menu_search},style:{margin:"5px"},width:20,height:20}),E),v(E,o);var W=e;return typeof W=="function"?q(W,L):e=L,L.style.setProperty("display","flex"),L.style.setProperty("align-items","center"),v(L,d(O,{get icon(){return b.menu_add}})),x})()}const $g=new Map([["exchange","Exchange:"],["data_broker","Data Broker:"],["security_type","Security Type:"]]);function Eg(i){const[,t]=tt(i,["replace","setReplace","symbols","filters","setFilters","setDisplay"]);function e(o){window.active_frame?.timeframe&&window.api.data_request(window.active_container?.id,window.active_frame?.id,o,window.active_frame?.timeframe.toString()),i.setDisplay(!1)}function s(o){const l=document.querySelector(`#${i.id}`);if(!l)return;const h=l.querySelector("input.search_input").value,a=Array.from(l.querySelectorAll("#exchange > .bubble_item[active]"),f=>f?.textContent??""),c=Array.from(l.querySelectorAll("#data_broker > .bubble_item[active]"),f=>f?.textContent??""),u=Array.from(l.querySelectorAll("#security_type > .bubble_item[active]"),f=>f?.textContent??"");window.api.symbol_search(h,u,c,a,o)}function n(o){let l=o.target;l.hasAttribute("active")?(l.removeAttribute("active"),l.parentElement?.querySelectorAll(".bubble_item[active]").length===0&&l.parentElement.querySelector("#any")?.setAttribute("active","")):(l.parentElement?.querySelectorAll("#any[active]").length===1&&l.parentElement.querySelector("#any")?.removeAttribute("active"),l.setAttribute("active","")),s(!1)}function r(o){let l=o.target,h=l.parentElement?.querySelectorAll(".bubble_item[active]");for(let a=0;a<h?.length;a++)h[a].removeAttribute("active");l.setAttribute("active",""),s(!1)}return d(Gt,A(t,{classList:{symbol_menu:!0},get location_ref(){return Xt.CENTER},drag_handle:"#symbol_search_drag",get bounding_client_id(){return`#${i.id}>.symbol_title_bar`},get children(){return[(()=>{var o=_g(),l=o.firstChild;return l.nextSibling,v(o,d(O,{get icon(){return b.menu_search},width:28,height:28,classList:{icon:!1,symbol_search_icon:!0}}),l),l.style.setProperty("margin","8px 10px"),v(o,d(O,{get icon(){return b.close},style:{"margin-right":"15px",padding:"5px"},onClick:()=>i.setDisplay(!1)}),null),o})(),(()=>{var o=bg(),l=o.firstChild,h=l.nextSibling;return l.addEventListener("keypress",a=>{a.key==="Enter"&&s(!0)}),l.$$input=()=>s(!1),h.$$click=()=>s(!0),o})(),(()=>{var o=wg(),l=o.firstChild,h=l.firstChild,a=h.nextSibling;return v(a,d(N,{get each(){return i.symbols},children:c=>(()=>{var u=yg(),f=u.firstChild,m=f.nextSibling,g=m.nextSibling,p=g.nextSibling,_=p.nextSibling;return u.$$click=()=>e(c),v(f,()=>c.ticker),v(m,()=>c.name??"-"),v(g,()=>c.exchange??"-"),v(p,()=>c.sec_type??"-"),v(_,()=>c.broker??"-"),u})()})),o})(),d(N,{get each(){return Object.keys(i.filters)},children:o=>(()=>{var l=xg(),h=l.firstChild;return H(l,"id",o),v(l,()=>$g.get(o),h),h.$$mousedown=r,H(h,"active",""),v(l,d(N,{get each(){return i.filters[o]},children:a=>(()=>{var c=Sg();return c.$$mousedown=n,v(c,a),c})()}),null),l})()})]}}))}Mt(["input","click","mousedown"]);var kg=y("<div class=topbar_container>");const Lg={menu_listings:{s:[1,2,5,15,30],m:[1,2,5,15,30],h:[1,2,4],D:[1],W:[1]},favorites:["1D"]};function Tg(){const i="timeframe_selector";let t=document.createElement("div");const[e,s]=C(new bt(1,"E")),[n,r]=C({x:0,y:0}),[o,l]=Ct(Lg),h=()=>Array.from(o.favorites,u=>bt.from_str(u)).sort((u,f)=>u.toValue()-f.toValue()),a=()=>{r({x:t.getBoundingClientRect().right,y:t.getBoundingClientRect().bottom})};window.topbar.setTimeframe=s,window.api.update_timeframe_topbar_opts=l;function c(u){window.active_frame?.symbol!==void 0&&window.api.data_request(window.active_container?.id??"",window.active_frame?.id??"",window.active_frame?.symbol??"",u.toString())}return gt().attachOverlay(i,d(zg,{id:i,onSel:c,opts:o,setOpts:l,get location(){return n()},updateLocation:a})),(()=>{var u=kg(),f=t;return typeof f=="function"?q(f,u):t=u,v(u,d(j,{get when(){return dt(()=>!bt.is_equal(e(),new bt(1,"E")))()&&!o.favorites.includes(e().toString())},get children(){return d(Ie,{get text(){return e().toString(e().toValue()>=86400)},classList:{timeframe_btn:!0},activated:!0})}}),null),v(u,d(N,{get each(){return h()},children:m=>d(Ie,{get text(){return m.toString(m.toValue()>=86400)},classList:{timeframe_btn:!0},get activated(){return bt.is_equal(e(),m)},onClick:()=>c(m)})}),null),v(u,d(Ii,{id:i,class:"topbar_menu_button",get icon_act(){return b.menu_arrow_sn},get icon_deact(){return b.menu_arrow_ns}}),null),u})()}const Pg=new Map([["s",!1],["m",!0],["h",!0],["D",!0],["W",!1],["M",!1],["Y",!1]]);function zg(i){const[,t]=tt(i,["opts","setOpts"]),e=r=>i.opts.menu_listings[r];function s(r){i.opts.favorites.includes(r)||i.setOpts("favorites",[...i.opts.favorites,r])}function n(r){i.opts.favorites.includes(r)&&i.setOpts("favorites",i.opts.favorites.filter(o=>o!=r))}return d(Gt,A(t,{get location_ref(){return Xt.TOP_RIGHT},get children(){return d(N,{get each(){return Object.keys(i.opts.menu_listings)},children:r=>d(Oo,{get label(){return Yr[r]+"s"},get showByDefault(){return Pg.get(r)??!1},get children(){return d(N,{get each(){return e(r)},children:o=>{const l=new bt(o,r),h=l.toString();return d(Oi,{expand:!0,get label(){return l.toLabel()},onSel:()=>i.onSel(l),get star(){return i.opts.favorites.includes(h)},starAct:()=>s(h),starDeact:()=>n(h)})}})}})})}}))}var Dg=y('<div class="layout_main layout_flex"><div class=topbar><div class=topbar_separator></div><div class=topbar_separator></div><div class=topbar_separator></div><div class=topbar_separator></div></div><div class=topbar><div class=topbar_separator>');function Ag(i){return(()=>{var t=Dg(),e=t.firstChild,s=e.firstChild,n=s.nextSibling,r=n.nextSibling,o=r.nextSibling,l=e.nextSibling;return l.firstChild,yt(t,i,!1,!0),e.style.setProperty("justify-content","flex-start"),v(e,d(Cg,{}),s),v(e,d(Tg,{}),n),v(e,d(gg,{}),r),v(e,d(eg,{}),o),l.style.setProperty("justify-content","flex-end"),v(l,d(hg,{}),null),t})()}var Ig=y("<div class=widget_panel_title>Frame Viewer");const Og=200;function Rg(){const i=hi().displays,[t,e]=C(Array.from(active_container.frames,n=>n.id));X(Tt(i,()=>e(Array.from(active_container.frames,n=>n.id))));const s=n=>Vg.get(active_container.frames.find(r=>r.id===n)?.type??"")??"";return ft(()=>oe().setWidgetPanelWidth(Og)),[Ig(),d(j,{get when(){return i()},keyed:!0,get children(){return d(hn,{ids:t,overlay_child:({id:n})=>cn({tag_id:()=>n,tag_name:()=>s(n)}),get reorder_function(){return active_container.reorder_frames.bind(active_container)},get children(){return d(N,{get each(){return t()},children:n=>{let r=active_container.frames.find(o=>o.id===n);return d(an,{tag_id:()=>n,tag_name:()=>s(n),onClick:()=>r?.assign_active_frame(),get children(){return d(Wg,{id:n})}})}})}})}})]}const Vg=new Map([["abstract","Abstract Frame"],["charting_frame","Charting Frame"]]);function Wg(i){if(!(active_container.frames.length<=ge(active_container.layout)))return d(O,{get icon(){return b.close},onClick:()=>window.api.remove_frame(active_container.id,i.id)})}var Bg=y('<div class="layout_main layout_flex flex_col">'),Ng=y('<div class="layout_main widget_panel">');const[Ne,jg]=C();function Fg(i){return X(()=>{i.panelDisplay.display==="flex"&&Ne()?i.showWidgetPanel():i.hideWidgetPanel()}),(()=>{var t=Bg();return v(t,d(Tr,{get icon(){return b.frame_editor}}),null),v(t,d(Tr,{get icon(){return b.object_tree}}),null),k(e=>Ht(t,i.style,e)),t})()}function Tr(i){return d(O,A({width:34,height:34,classList:{icon:!1,widget_bar_icon:!0},style:{margin:"4px",padding:"2px"},onClick:()=>jg(Ne()!==i.icon?i.icon:void 0),get"attr:active"(){return Ne()===i.icon?"":void 0}},i))}function Ug(i){const t=oe().setWidgetPanelWidth,e=n=>{t(window.innerWidth-(n.clientX+xi+fn))},s=n=>{n.offsetX>6||(document.addEventListener("mousemove",e),document.addEventListener("mouseup",()=>document.removeEventListener("mousemove",e),{once:!0}))};return(()=>{var n=Ng();return yt(n,A(i,{onMouseDown:s}),!1,!0),v(n,d(je,{get children(){return[d(nt,{get when(){return Ne()===b.frame_editor},get children(){return d(Rg,{})}}),d(nt,{get when(){return Ne()===b.object_tree},get children(){return d(qd,{})}})]}})),n})()}var Hg=y("<div id=layout_wrapper class=wrapper><div class=layout_main>");const ct=5,Bt=38,wt=38,Xg=156,Kg=468,xi=52,fn=2,ve=46,Vo=38,qg={center:{width:"-1px",height:"-1px",top:`${wt+Bt+ct}px`,left:`${ve+ct}px`},titlebar:{width:"100vw",height:"38px",top:"0px",left:"0px"},topbar:{display:"flex",width:"100vw",height:"38px",top:`${wt}px`,left:"0px"},toolbar:{display:"flex",width:`${ve}px`,height:"-1px",top:`${wt+Bt+ct}px`,left:"0px"},widgetbar:{display:"flex",width:`${xi}px`,height:"-1px",top:`${wt+Bt+ct}px`,right:"0px"},widgetpanel:{display:"none",width:"-1px",height:"-1px",top:`${wt+Bt+ct}px`,right:`${xi+fn}px`},utilbar:{display:"flex",width:"-1px",height:`${Vo}px`,bottom:"0px",left:`${ve+ct}px`}};var Ot=(i=>(i[i.TITLE_BAR=0]="TITLE_BAR",i[i.TOP_BAR=1]="TOP_BAR",i[i.TOOL_BAR=2]="TOOL_BAR",i[i.WIDGET_BAR=3]="WIDGET_BAR",i[i.WIDGET_PANEL=4]="WIDGET_PANEL",i[i.UTIL_BAR=5]="UTIL_BAR",i[i.CENTER=6]="CENTER",i))(Ot||{});function Gg(){const[i,t]=Ct(qg),e=oe().widgetPanelWidth;ft(()=>{window.addEventListener("resize",()=>li(window.innerWidth,window.innerHeight,i,t)),li(window.innerWidth,window.innerHeight,i,t)}),X(()=>{li(window.innerWidth,window.innerHeight,i,t)}),X(Tt(e,()=>{li(window.innerWidth,window.innerHeight,i,t)}));const s={show_section:Pr.bind(void 0,t),hide_section:zr.bind(void 0,t)},n={panelDisplay:i.widgetbar,showWidgetPanel:Pr.bind(void 0,t,4),hideWidgetPanel:zr.bind(void 0,t,4)};return d(Yg,{get children(){var r=Hg(),o=r.firstChild;return v(r,d(Wl,{get style(){return i.center}}),o),v(r,d(mf,A({get style(){return i.titlebar}},s)),o),v(r,d(Ag,{get style(){return i.topbar}}),o),v(r,d(Vf,{get style(){return i.toolbar}}),o),v(r,d(Fg,A({get style(){return i.widgetbar}},n)),o),v(r,d(Ug,{get style(){return i.widgetpanel}}),o),k(l=>Ht(o,i.utilbar,l)),r}})}function Yg(i){return d(gh,{get children(){return d(Nf,{get children(){return d(Kd,{get children(){return d(Jg,{get children(){return d(Sl,{get children(){return i.children}})}})}})}})}})}function li(i,t,e,s){const n=oe().widgetPanelWidth();let r=t-wt,o=t-wt,l=i;e.topbar.display==="flex"&&(r-=Bt+ct,o-=Bt+ct),e.toolbar.display==="flex"&&(l-=ve+ct),e.widgetbar.display==="flex"&&(l-=xi+ct),e.widgetpanel.display==="flex"&&(l-=n+fn),e.utilbar.display==="flex"&&(o-=Vo+ct),s("toolbar","height",`${r}px`),s("widgetbar","height",`${r}px`),s("widgetpanel","height",`${r}px`),s("widgetpanel","width",`${n}px`),s("center","height",`${o}px`),s("center","width",`${l}px`),s("utilbar","width",`${l}px`),window.active_container&&window.active_container.resize(new DOMRect(0,0,l,o));let h=oe().widgetPanelResizeFunc();h!==void 0&&h(new DOMRect(0,0,n,o))}function Pr(i,t){switch(t){case 2:i("center","left",`${ve+ct}px`),i("utilbar","left",`${ve+ct}px`),i("toolbar","display","flex");break;case 3:i("widgetbar","display","flex");break;case 4:i("widgetpanel","display","flex");break;case 1:i("toolbar","top",`${wt+Bt+ct}px`),i("widgetbar","top",`${wt+Bt+ct}px`),i("center","top",`${wt+Bt+ct}px`),i("topbar","display","flex");break;case 5:i("utilbar","display","flex")}window.active_container&&window.active_container.resize()}function zr(i,t){switch(t){case 2:i("center","left","0px"),i("utilbar","left","0px"),i("toolbar","display","none");break;case 3:i("widgetbar","display","none"),i("widgetpanel","display","none");break;case 4:i("widgetpanel","display","none");break;case 1:i("toolbar","top",`${wt}px`),i("widgetbar","top",`${wt}px`),i("center","top",`${wt}px`),i("topbar","display","none");break;case 5:i("utilbar","display","none")}window.active_container&&window.active_container.resize()}const Zg={widgetPanelWidth:()=>0,setWidgetPanelWidth:()=>{},widgetPanelResizeFunc:()=>()=>{},setWidgetPanelResizeFunc:()=>{}};let Rs=_t(Zg);function oe(){return Ut(Rs)}function Jg(i){const t=C(208),e=C(n=>{}),s={widgetPanelWidth:t[0],setWidgetPanelWidth:n=>{t[1](Math.max(Math.min(n,Kg),Xg))},widgetPanelResizeFunc:e[0],setWidgetPanelResizeFunc:e[1]};return Rs=_t(s),d(Rs.Provider,{value:s,get children(){return i.children}})}class Qg{close;maximize;minimize;restore;add_container=()=>window.container_manager.add_container(_i(Array.from(container_manager.containers.keys()),"c_"));remove_container=t=>window.container_manager.remove_container(t);remove_frame=(t,e)=>active_container.remove_frame(e);reorder_containers=(t,e)=>{console.log(`reorder containers from: ${t} to: ${e} `)};layout_change=(t,e)=>{console.log(`Layout Change: ${t},${e}`);const s=window.container_manager.containers.get(t);if(s!==void 0){for(let n=s.frames.length;n<ge(s.layout);n++)s.add_frame(_i(Array.from(s.frames,r=>r.id),`${t}_f_`));s.set_layout(e)}};series_change=(t,e,s)=>{console.log(`Series Change: ${t},${e},${s}`)};data_request=(t,e,s,n)=>{console.log(`Data Request: ${t},${e},${s},${n}`)};symbol_search=(t,e,s,n,r)=>{console.log(`Search Request: ${t},${e},${s},${n},${r}`)};set_indicator_options=(t,e,s,n)=>{console.log(`Set Indicator Options: ${t},${e},${s}`,n)};indicator_request=(t,e,s,n)=>{console.log(`Request Indicator: ${t},${e},${s},${n}`)};update_series_options=(t,e,s,n,r)=>{console.log(`Set Series Options: ${t},${e},${s},${n}`,r)};visible_range_change=(t,e,s,n,r)=>{console.log(`Visible Range Change: ${t},${e},${s},${n},${r}`)};setFrameless=t=>{};populate_search_symbols=t=>{};set_search_filters=(t,e)=>{};populate_indicator_pkgs=t=>{};update_series_topbar_opts=t=>console.log("Series opts:",t);update_layout_topbar_opts=t=>console.log("Layout opts:",t);update_timeframe_topbar_opts=t=>console.log("Timeframe opts:",t);set_user_colors=t=>{}}function cm(i){const t=atob(i),e=new Uint8Array(t.length);for(let s=0;s<t.length;s++)e[s]=t.charCodeAt(s);return new Float64Array(e.buffer)}function Cm(i){const t=Object.entries(i.f64).map(([r,o])=>[r,cm(o)]),e=Object.entries(i.json),s=new Array(i.length);for(let n=0;n<i.length;n++){const r={};for(const[o,a]of t){const l=a[n];Number.isNaN(l)||(r[o]=l)}for(const[o,a]of e){const l=a[n];l!=null&&(r[o]=l)}s[n]=r}return s}window.api=new Qg;window.Container_Layouts=Q;window.decode_columnar=Cm;window.topbar={setSeries:i=>{},setTimeframe:i=>{},setLayout:i=>{},setTicker:i=>{}};ll(Gg,document.body);
@@ -1,11 +1,17 @@
 """Classes and functions that handle implementation of chart indicators"""
 
 from __future__ import annotations
-from dataclasses import field
+import asyncio
+from collections import deque
+from copy import copy
+from dataclasses import dataclass, field, replace
 from importlib import import_module
 from logging import getLogger
+from math import nan
 from abc import abstractmethod
 from inspect import signature, _empty, currentframe
+from concurrent.futures import Executor
+from time import perf_counter
 from multiprocessing import Queue
 from typing import (
     ClassVar,
@@ -29,7 +35,7 @@ from fracta.orm.types import Color
 from . import window as win
 from . import primative as pr
 from . import series_common as sc
-from .util import ID_Dict, is_dunder
+from .util import CapturingQueue, ID_Dict, is_dunder
 from .js_cmd import JS_CMD
 
 log = getLogger("fracta_log")
@@ -184,6 +190,19 @@ class IndicatorOptions(metaclass=OptionsMeta):
 # region --------------------------- Indicator & Watcher Classes --------------------------- #
 
 
+def _scalar_getter(func: SeriesData) -> Callable[[], float]:
+    "Wrap a linked pd.Series output so only its most recent value is fetched"
+    src, output = getattr(func, "__self__", None), func.__name__
+
+    def _get() -> float:
+        if src is not None and (value := src.__last_value__(output)) is not None:
+            return value
+        series = func()
+        return nan if len(series) == 0 else float(series.iloc[-1])
+
+    return _get
+
+
 class Watcher:
     """
     An Indicator instance object that links one indicator to another, monitoring for data updates.
@@ -196,12 +215,9 @@ class Watcher:
     def __init__(self, parent: "Indicator"):
         self._parent = weakref.ref(parent)
 
-        # set & updated ensure all indicators only set/update once they are ready to. Set, being
-        # more of a latch, is likely bug free. However, doing this for updated **may** lead to an
-        # edge case bug where an indicator may never (or only intermittently) update if it depends
-        # on two or more Series Indicators that receive data updates at different rates.
+        # set ensures all indicators only set once all of their sources are set. Updates don't need
+        # an equivalent since the IndicatorGraph evaluates them in dependency order.
         self.set = False
-        self.updated = False
 
         self.observables: dict[str, Callable] = {}
         self.set_args: dict[str, Callable] = {}
@@ -209,35 +225,33 @@ class Watcher:
         self.update_args: dict[str, Callable] = {}
         self.update_notifiers: list[Indicator] = []
 
-    def reset_updated_state(self):
-        "Reset the Updated state and tell all observers to reset as well, an update is coming"
-        self.updated = False
-        if (parent := self._parent()) is not None:
-            for watcher in parent._observers:
-                watcher.reset_updated_state()
-
-    def notify_set(self):
-        "Notify the Watcher that an update occured in the given Indicator"
+    def notify_set(self) -> bool:
+        "Preform the parent's historical calculation once all sources are set. Returns True if it ran"
         if self.set or (parent := self._parent()) is None:
-            return
+            return False
 
         if all([ind._watcher.set for ind in self.set_notifiers]):
             # All indicator srcs Ready, Preform historical set_data calc.
             # Will Fire on Notifier = None, intentional so Watcher can self-fire on init
             parent.set_data(**dict([(name, func()) for name, func in self.set_args.items()]))
+            if parent.__bar_update__ and len(parent.__bar_vars__) > 0:
+                # set_data() leaves the __bar_vars__ as of the close of the second to last bar. Commit
+                # them then apply the last bar as a revision so it can be rolled back if still open.
+                args = dict([(name, func()) for name, func in self.update_args.items()])
+                args["bar_state"] = replace(args["bar_state"], is_new=False)
+                parent.__commit_bar__()
+                parent.__update_data__(args)
             self.set = True
-            parent._notify_observers_set()
+            return True
+        return False
 
-    def notify_update(self):
-        "Notify the Watcher that an update occured in the given Indicator"
-        if self.updated or (parent := self._parent()) is None:
-            return
+    def notify_update(self) -> bool:
+        "Preform the parent's incremental update. Returns True if it ran"
+        if not self.set or (parent := self._parent()) is None:
+            return False
 
-        if all([ind._watcher.updated for ind in self.update_notifiers]):
-            # Ready to Update, Fire Update then set updated Readiness State
-            parent.update_data(**dict([(name, func()) for name, func in self.update_args.items()]))
-            self.updated = True
-            parent._notify_observers_update()
+        parent.__update_data__(dict([(name, func()) for name, func in self.update_args.items()]))
+        return True
 
     def notify_clear(self):
         "Notify the Watcher that the source it calculated from is no longer valid and should clear"
@@ -245,7 +259,6 @@ class Watcher:
             return
 
         self.set = False
-        self.updated = False
         parent.clear_data()
         parent._notify_observers_clear()
 
@@ -285,9 +298,9 @@ class Watcher:
 
             bound_cls_inst = args[name].__self__  # Get the Indicator Instance bound to the desired output
 
-            if bound_cls_inst._watcher in parent._observers:
-                # Check that there isn't a Circular Dependence between Indicators
-                log.critical(  # ATM this only protects against direct circular dependencies
+            if parent.parent_frame.indicator_graph.creates_cycle(bound_cls_inst, parent):
+                # Check that there isn't a Circular Dependence, direct or indirect, between Indicators
+                log.critical(
                     "Circular Indicator dependency between %s & %s",
                     bound_cls_inst.cls_name,
                     parent.cls_name,
@@ -297,10 +310,18 @@ class Watcher:
                 args[name] = arg_type  # === lambda: arg_type()
                 args[name].__self__ = None
 
-            elif self not in bound_cls_inst._observers:
+            else:
                 # If no circular dependace, place this watcher into that indicator's _observers list
                 # signifying this watcher is observing that indicator instance for updates
-                bound_cls_inst._observers.append(self)
+                if self not in bound_cls_inst._observers:
+                    bound_cls_inst._observers.append(self)
+                # The edge is held by the graph of the source's Frame, which may not be the parent's Frame
+                bound_cls_inst.parent_frame.indicator_graph.link(
+                    bound_cls_inst,
+                    parent,
+                    on_set=name in parent_cls.__set_args__,
+                    on_update=name in parent_cls.__update_args__,
+                )
 
             # --------- Create Dicts of {*arg_name*: function to call for *arg_name* data} ---------
 
@@ -308,7 +329,10 @@ class Watcher:
                 self.set_args[name] = args[name]
                 self.set_notifiers.append(bound_cls_inst)
             if name in parent_cls.__update_args__:
-                self.update_args[name] = args[name]
+                if name in parent_cls.__scalar_args__:
+                    self.update_args[name] = _scalar_getter(args[name])
+                else:
+                    self.update_args[name] = args[name]
                 self.update_notifiers.append(bound_cls_inst)
 
             # self.observables === Union(self.set_args & self.update_args)
@@ -321,11 +345,16 @@ class Watcher:
         # Clear this indicator and all dependant indicators
         self.notify_clear()
 
+        sources = set(func.__self__ for func in self.observables.values()) - {None}
+        if (parent := self._parent()) is not None:
+            # Edges into the parent are held by the graphs of its sources' Frames
+            graphs = {src.parent_frame.indicator_graph for src in sources}
+            for graph in graphs | {parent.parent_frame.indicator_graph}:
+                graph.unlink(parent)
+
         # Remove self from all of the '_observers' lists that it's appended to
-        bound_arg_funcs = self.observables.values()
-        for bound_func_cls in set([func.__self__ for func in bound_arg_funcs]):
-            if bound_func_cls is not None:
-                bound_func_cls._observers.remove(self)
+        for bound_func_cls in sources:
+            bound_func_cls._observers.remove(self)
 
         # Clear Watcher after unbinding
         self.set_args = {}
@@ -372,10 +401,18 @@ class Indicator(metaclass=IndicatorMeta):
     __update_args__: dict[str, tuple[type, Any]]
     __default_output__: Optional[SeriesData]
     __exposed_outputs__: dict[str, str]
+    __bar_update__: bool
+    __scalar_args__: frozenset[str]
+
+    # Optional Names of instance attributes that are rolled back on intra-bar updates; set by User
+    __bar_vars__: tuple[str, ...] = ()
+    # When False, set_data() is never run on a worker thread alongside other indicators; set by User
+    __concurrent__: bool = True
 
     # Dunder Cls Param referenced by all Sub-Classes of Indicator
     __loaded_indicators__: dict[str, "type[Indicator]"] = {}
     __registered_indicators__: dict[str, IndicatorPackage] = {}
+    __indicator_base__: "type[Indicator]"
 
     def __init__(
         self,
@@ -427,6 +464,8 @@ class Indicator(metaclass=IndicatorMeta):
 
         # Setup Indicator Observer Structures
         self._watcher = Watcher(self)
+        self._bar_snapshot: Optional[dict[str, Any]] = None
+        self.parent_frame.indicator_graph.add(self)
         self._observers: list[Watcher] = []
 
         self.events = self.parent_frame._window.events
@@ -472,13 +511,11 @@ class Indicator(metaclass=IndicatorMeta):
 
     def _notify_observers_set(self):
         "Notify All observers to preform a bulk historical calculation"
-        for watcher in self._observers:
-            watcher.notify_set()
+        self.parent_frame.indicator_graph.propagate_set(self)
 
     def _notify_observers_update(self):
         "Notify All observers there is an update to be made"
-        for watcher in self._observers:
-            watcher.notify_update()
+        self.parent_frame.indicator_graph.propagate_update(self)
 
     def _notify_observers_clear(self):
         "Notify All observers they should clear their state"
@@ -487,7 +524,7 @@ class Indicator(metaclass=IndicatorMeta):
 
     def recalculate(self):
         "Manually force a full recalculation of this indicator and all dependent indicators"
-        self._watcher.notify_set()
+        self.parent_frame.indicator_graph.recalculate(self)
 
     def __update_options__(self, args: dict) -> Optional[IndicatorOptions]:
         "Parse a dictionary into an instance of self.__options__ and call self.update_options"
@@ -500,6 +537,57 @@ class Indicator(metaclass=IndicatorMeta):
         if recalculate:
             self.recalculate()
 
+    def __update_data__(self, args: dict[str, Any]):
+        """
+        Forward an incremental update to update_data() or, when defined, update_bar().
+
+        update_bar() must take a 'bar_state' argument. Float arguments of update_bar() are linked like
+        a pd.Series but are given only the Series' most recent value. The Watcher fetches it through
+        __last_value__() so, when the source supports it, no Series is built on each update.
+        The attributes named by __bar_vars__ are committed on the first update of each new bar and
+        rolled back to that commit before each revision of the current bar. This means update_bar()
+        can always treat the update as the first, and only, update of the current bar.
+        """
+        if not self.__bar_update__:
+            self.update_data(**args)
+            return
+
+        if len(self.__bar_vars__) > 0:
+            if args["bar_state"].is_new:
+                self.__commit_bar__()
+            else:
+                self.__rollback_bar__()
+
+        self.update_bar(**args)
+
+    def __last_value__(self, output: str) -> Optional[float]:  # pylint: disable=unused-argument
+        """
+        Most recent value of the named pd.Series output_property, or None when it can only be read
+        from the Series. Indicators that store their outputs can override this to feed update_bar()
+        float arguments without building a Series on each update.
+        """
+        return None
+
+    def __commit_bar__(self):
+        "Snapshot the __bar_vars__ as the state at the close of the previous bar"
+        self._bar_snapshot = {name: copy(getattr(self, name)) for name in self.__bar_vars__}
+
+    def __rollback_bar__(self):
+        "Restore the __bar_vars__ to their last commit"
+        if self._bar_snapshot is not None:
+            for name, value in self._bar_snapshot.items():
+                setattr(self, name, copy(value))
+
+    def __display_range_change__(self, prev_start: Optional[pd.Timestamp] = None):
+        "Update the data of all series objects so they reflect the parent Frame's displayed range"
+        for series in self._series.values():
+            series.__display_range_change__(prev_start)
+
+    def __decimation_change__(self):
+        "Update the data of all series objects so they reflect the parent Frame's decimation span"
+        for series in self._series.values():
+            series.__decimation_change__()
+
     def delete(self):
         "Remove the indicator and all of it's instance objects"
         self._watcher._unlink_all_args()
@@ -510,6 +598,7 @@ class Indicator(metaclass=IndicatorMeta):
             primative.delete()
 
         self.clear_data()  # Clear data after deleting sub-objects to limit redundant actions
+        self.parent_frame.indicator_graph.remove(self)
         self.parent_frame.indicators.pop(self._js_id)
         self._fwd_queue.put((JS_CMD.DELETE_INDICATOR, *self._ids))
 
@@ -539,16 +628,26 @@ class Indicator(metaclass=IndicatorMeta):
         invoke the set_data() / update_data() methods manually.
         """
 
-    @abstractmethod
     def update_data(self, *_, **__):
         """
         Update the output of the indicator given an incremental update. This method will typically
-        require bar_state:BarState as an argument.
+        require bar_state:BarState as an argument. Every Indicator must define either this method
+        or update_bar().
 
         bar_state is a default argument that will automatically link when present in the signature
         of a set_data()/update_data() method. The automatic link will connect to the base source of
         series data on the Frame this indicator is attached too. This connection can be overwritten
         by manually passing the desired connection to link_args().
+
+        Alternatively, an indicator can define update_bar() in place of this method. update_bar()
+        receives the most recent values of its Series sources as floats and has it's __bar_vars__
+        rolled back between revisions of the same bar. See __update_data__().
+        """
+
+    def update_bar(self, *_, **__):
+        """
+        Optional incremental update method that can be defined in place of update_data(). It is only
+        called when overridden by a subclass. See __update_data__() for the contract it follows.
         """
 
     def clear_data(self):
@@ -559,6 +658,7 @@ class Indicator(metaclass=IndicatorMeta):
         If this function is extended by a subclass, that indicator should call super().clear_data()
         since this function clears all series and primitive data.
         """
+        self._bar_snapshot = None
         for series in self._series.values():
             series.clear_data()
         for primitive in self._primitives.values():
@@ -700,6 +800,280 @@ IndParent_T: TypeAlias = "win.ChartingFrame | Indicator"
 
 # endregion
 
+# region --------------------------- Indicator Dependency Graph --------------------------- #
+
+
+@dataclass(slots=True)
+class NodeStats:
+    "Cumulative execution time, in seconds, of an Indicator within an IndicatorGraph"
+
+    set_calls: int = 0
+    set_time: float = 0
+    update_calls: int = 0
+    update_time: float = 0
+    last_update_time: float = 0
+
+    @property
+    def mean_update_time(self) -> float:
+        "Average time of an update_data() / update_bar() call"
+        return self.update_time / self.update_calls if self.update_calls > 0 else 0
+
+
+class IndicatorGraph:
+    """
+    Dependency Graph of all the Indicators on a ChartingFrame.
+
+    Edges point from a source Indicator to the Indicators that link to its outputs. A topological
+    order of the graph is computed, once after any number of link changes, when it is next needed.
+    A set or an update then only has to walk the Indicators that come after the source in that
+    order. Every Indicator downstream of the source is marked dirty and evaluated exactly once,
+    after all of its dirty sources.
+
+    The time spent in each Indicator is recorded in 'stats' so the bottleneck of a Frame can be found.
+
+    Edges are held by the graph of the source's Frame. An Indicator that links to a source on another
+    Frame is a leaf of that Frame's graph. When it's reached, the Indicator is evaluated by, and
+    propagates through, the graph of its own Frame.
+
+    When given an executor, and a CapturingQueue as the fwd_queue, the set_data() calls of Indicators
+    that don't depend on one another are run concurrently. The event loop awaits each group rather
+    than blocking on it. Commands they put on the fwd_queue are captured and forwarded in
+    topological order once each group of Indicators completes.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, fwd_queue: Any = None):
+        self._executor = executor if isinstance(fwd_queue, CapturingQueue) else None
+        self._fwd_queue = fwd_queue
+        # Last concurrent set propagation scheduled on the event loop
+        self._set_task: Optional[asyncio.Task] = None
+        # {Source: {Dependent: None}}, Dicts are used as insertion ordered sets so order is deterministic
+        self._set_deps: dict[Indicator, dict[Indicator, None]] = {}
+        self._update_deps: dict[Indicator, dict[Indicator, None]] = {}
+        self._order: list[Indicator] = []
+        self._rank: dict[Indicator, int] = {}
+        # Set when the edges change. The order is only re-sorted when next read.
+        self._dirty = False
+        self.stats: dict[str, NodeStats] = {}
+
+    @property
+    def order(self) -> list[Indicator]:
+        "Topological order of the Indicators in the graph"
+        self._ensure_sorted()
+        return self._order.copy()
+
+    def add(self, node: Indicator):
+        "Add an Indicator to the graph"
+        self._set_deps.setdefault(node, {})
+        self._update_deps.setdefault(node, {})
+        self.stats[node.js_id] = NodeStats()
+        self._dirty = True
+
+    def remove(self, node: Indicator):
+        "Remove an Indicator, and all the edges to & from it, from the graph"
+        self._set_deps.pop(node, None)
+        self._update_deps.pop(node, None)
+        self.stats.pop(node.js_id, None)
+        self.unlink(node)
+
+    def link(self, source: Indicator, dependent: Indicator, on_set: bool = True, on_update: bool = True):
+        "Add an edge from source to dependent. Call creates_cycle() before linking."
+        if on_set:
+            self._set_deps.setdefault(source, {})[dependent] = None
+        if on_update:
+            self._update_deps.setdefault(source, {})[dependent] = None
+        self._dirty = True
+
+    def unlink(self, dependent: Indicator):
+        "Remove all edges that lead into the given Indicator"
+        for deps in (*self._set_deps.values(), *self._update_deps.values()):
+            deps.pop(dependent, None)
+        self._dirty = True
+
+    def dependents(self, node: Indicator) -> list[Indicator]:
+        "Indicators that directly depend on the given Indicator"
+        return list((self._set_deps.get(node, {}) | self._update_deps.get(node, {})).keys())
+
+    def creates_cycle(self, source: Indicator, dependent: Indicator) -> bool:
+        "True if an edge from source to dependent would create a direct or indirect circular dependency"
+        stack, visited = [dependent], set()
+        while len(stack) > 0:
+            node = stack.pop()
+            if node is source:
+                return True
+            if node not in visited:
+                visited.add(node)
+                stack.extend(node.parent_frame.indicator_graph.dependents(node))
+        return False
+
+    def _owns(self, node: Indicator) -> bool:
+        "True if the Indicator is on this graph's Frame, False if it's a dependent on another Frame"
+        return node.parent_frame.indicator_graph is self
+
+    def _ensure_sorted(self):
+        if self._dirty:
+            self._sort()
+            self._dirty = False
+
+    def _sort(self):
+        "Kahn's Algorithm. Ties are broken by the order Indicators were added to the graph"
+        nodes = dict.fromkeys((*self._set_deps, *self._update_deps))
+        for deps in (*self._set_deps.values(), *self._update_deps.values()):
+            nodes.update(deps)
+
+        in_degree = dict.fromkeys(nodes, 0)
+        for node in nodes:
+            for dep in self.dependents(node):
+                in_degree[dep] += 1
+
+        ready = deque(node for node, degree in in_degree.items() if degree == 0)
+        order = []
+        while len(ready) > 0:
+            node = ready.popleft()
+            order.append(node)
+            for dep in self.dependents(node):
+                in_degree[dep] -= 1
+                if in_degree[dep] == 0:
+                    ready.append(dep)
+
+        if len(order) != len(in_degree):
+            log.error("Indicator Graph contains a cycle. Some Indicators will not be evaluated.")
+        self._order = order
+        self._rank = {node: i for i, node in enumerate(order)}
+
+    def _reachable(self, source: Indicator, deps: dict[Indicator, dict[Indicator, None]]) -> list[Indicator]:
+        "Indicators that can be reached from the source through the given edges, in topological order"
+        stack, visited = list(deps.get(source, {})), set()
+        while len(stack) > 0:
+            node = stack.pop()
+            if node not in visited:
+                visited.add(node)
+                stack.extend(deps.get(node, {}))
+        return [node for node in self._downstream(source) if node in visited]
+
+    def _downstream(self, source: Indicator) -> list[Indicator]:
+        "Indicators after the source in the topological order"
+        self._ensure_sorted()
+        return self._order[self._rank[source] + 1 :] if source in self._rank else []
+
+    def _run_set(self, node: Indicator) -> bool:
+        start = perf_counter()
+        ran = node._watcher.notify_set()
+        if ran and (stats := self.stats.get(node.js_id)) is not None:
+            stats.set_calls += 1
+            stats.set_time += perf_counter() - start
+        return ran
+
+    def _run_update(self, node: Indicator) -> bool:
+        start = perf_counter()
+        ran = node._watcher.notify_update()
+        if ran and (stats := self.stats.get(node.js_id)) is not None:
+            stats.last_update_time = perf_counter() - start
+            stats.update_calls += 1
+            stats.update_time += stats.last_update_time
+        return ran
+
+    def recalculate(self, node: Indicator):
+        "Preform the historical calculation of the given Indicator and then all Indicators dependent on it"
+        if self._run_set(node):
+            self.propagate_set(node)
+
+    def update(self, node: Indicator):
+        "Update the given Indicator and then all Indicators dependent on it"
+        if self._run_update(node):
+            self.propagate_update(node)
+
+    def propagate_set(self, source: Indicator):
+        "Preform the historical calculation of all Indicators dependent on the given source"
+        if self._executor is not None:
+            self._propagate_set_concurrent(source)
+            return
+
+        dirty = set(self._set_deps.get(source, {}))
+        for node in self._downstream(source):
+            if node not in dirty:
+                continue
+            if not self._owns(node):
+                node.parent_frame.indicator_graph.recalculate(node)
+            elif self._run_set(node):
+                dirty.update(self._set_deps[node])
+
+    def _propagate_set_concurrent(self, source: Indicator):
+        """
+        Schedule the concurrent propagation on the running event loop so it doesn't block while the
+        executor works. Propagations run one at a time, in the order scheduled. Without a running
+        event loop the propagation is run to completion before returning.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._propagate_set_async(source))
+            return
+        self._set_task = loop.create_task(self._propagate_set_async(source, self._set_task))
+
+    async def _propagate_set_async(self, source: Indicator, prev_task: Optional[asyncio.Task] = None):
+        "Same as propagate_set(), but every group of Indicators with all of their sources set runs at once"
+        if prev_task is not None and not prev_task.done():
+            await asyncio.wait([prev_task])
+
+        # Every Indicator that could be set, in topological order, and the sources each has among them
+        reachable = self._reachable(source, self._set_deps)
+        sources = {node: [src for src in reachable if node in self._set_deps.get(src, {})] for node in reachable}
+
+        dirty = set(self._set_deps.get(source, {}))
+        finished: set[Indicator] = set()
+        while len(reachable) > 0:
+            group = [node for node in reachable if all(src in finished for src in sources[node])]
+            reachable = [node for node in reachable if node not in group]
+            for node in await self._run_set_group([node for node in group if node in dirty and self._owns(node)]):
+                dirty.update(self._set_deps[node])
+            for node in group:
+                if node in dirty and not self._owns(node):
+                    node.parent_frame.indicator_graph.recalculate(node)
+            finished.update(group)
+
+    async def _run_set_group(self, nodes: list[Indicator]) -> list[Indicator]:
+        "Run the set of independent nodes concurrently. Returns the nodes that ran in the order given"
+        if len(nodes) <= 1:
+            return [node for node in nodes if self._run_set(node)]
+
+        futures = {}
+        for node in nodes:
+            if node.__concurrent__:
+                futures[node] = asyncio.wrap_future(self._executor.submit(self._captured_set, node))  # type: ignore
+
+        ran = []
+        for node in nodes:  # Join in order so the captured commands are forwarded deterministically
+            try:
+                did_run, msgs = await futures[node] if node in futures else self._captured_set(node)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log.exception("%s.set_data() failed: %s", node.cls_name, e)
+                continue
+            for msg in msgs:
+                self._fwd_queue.queue.put(msg)
+            if did_run:
+                ran.append(node)
+        return ran
+
+    def _captured_set(self, node: Indicator) -> tuple[bool, list]:
+        with self._fwd_queue.capture() as msgs:
+            return self._run_set(node), msgs
+
+    def propagate_update(self, source: Indicator):
+        "Update each Indicator dependent on the given source exactly once, in dependency order"
+        dirty = set(self._update_deps.get(source, {}))
+        if len(dirty) == 0:
+            return
+        for node in self._downstream(source):
+            if node not in dirty:
+                continue
+            if not self._owns(node):
+                node.parent_frame.indicator_graph.update(node)
+            elif self._run_update(node):
+                dirty.update(self._update_deps[node])
+
+
+# endregion
+
 
 def retrieve_indicator_cls(pkg_key: str, ind_key: str) -> type[Indicator] | None:
     "Return an Indicator Subclass from a given package and indicator key Lazy Loading as needed."
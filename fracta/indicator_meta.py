@@ -62,7 +62,7 @@ class IndicatorMeta(ABCMeta):
         # Allow ABCMeta to create the class
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
-        if name != "Indicator":
+        if any(isinstance(base, IndicatorMeta) for base in bases):
             analyse_indicator_subclass(cls, name, namespace)
             return cls
 
@@ -79,6 +79,7 @@ class IndicatorMeta(ABCMeta):
         }
         setattr(cls, "__registered_indicators__", pkg_details)
         setattr(cls, "__loaded_indicators__", {})
+        setattr(cls, "__indicator_base__", cls)
 
         return cls
 
@@ -137,6 +138,12 @@ def parse_indicator_pkgs() -> dict[str, IndicatorPackage]:
 # --------------- Indicator Subclass parsing functions ---------------
 
 
+def _overridden(cls: type, method: str) -> bool:
+    "True when the given method is defined by a subclass of Indicator rather than Indicator itself"
+    owner = next(base for base in cls.__mro__ if method in vars(base))
+    return owner is not getattr(cls, "__indicator_base__")
+
+
 def analyse_indicator_subclass(cls: type, name: str, namespace: dict):
     "Construct Various Dunder Attributes used by the Indicator Class"
     # Place the Signatures of these functions into Class Attributes. These Attributes
@@ -147,11 +154,28 @@ def analyse_indicator_subclass(cls: type, name: str, namespace: dict):
     set_args = parse_input_args(set_sig)
     setattr(cls, "__set_args__", set_args)
 
-    update_sig = signature(getattr(cls, "update_data", lambda: None))
+    # Indicators may define update_bar() in place of update_data(). See Indicator.__update_data__()
+    bar_update = _overridden(cls, "update_bar")
+    if not bar_update and not _overridden(cls, "update_data"):
+        raise TypeError(f"{name} must define update_data() or update_bar()")
+    update_name = "update_bar" if bar_update else "update_data"
+    update_sig = signature(getattr(cls, update_name, lambda: None))
     if len(update_sig.parameters) <= 1:
-        raise TypeError(f"{name}.update_data() must take at least 1 argument")
+        raise TypeError(f"{name}.{update_name}() must take at least 1 argument")
     update_args = parse_input_args(update_sig)
+
+    scalar_args = set()
+    if bar_update:
+        if "bar_state" not in update_args:
+            raise TypeError(f"{name}.update_bar() must take a 'bar_state' argument")
+        # Float args of update_bar() link to a Series output and are given it's most recent value
+        scalar_args = {arg for arg, (arg_type, _) in update_args.items() if arg_type is float}
+        for arg in scalar_args:
+            update_args[arg] = (pd.Series, update_args[arg][1])
+
     setattr(cls, "__update_args__", update_args)
+    setattr(cls, "__bar_update__", bar_update)
+    setattr(cls, "__scalar_args__", frozenset(scalar_args))
 
     for _param in set(set_args.keys()).intersection(update_args.keys()):
         if set_args[_param][0] != update_args[_param][0]:
@@ -1,9 +1,13 @@
 """Series Indicator that receives raw Timeseries Data and filters it"""
 
+import asyncio
+from copy import copy
+from functools import partial
 from logging import getLogger
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Dict,
     Optional,
     Any,
@@ -24,7 +28,8 @@ from fracta import (
     SingleValueData,
 )
 from fracta import series_common as sc
-from fracta.dataframe_ext import LTF_DF, Series_DF, Whitespace_DF
+from fracta.dataframe_ext import HTF_DF, LTF_DF, Series_DF, Whitespace_DF
+from fracta.events import CancelToken
 from fracta.indicator import (
     Indicator,
     IndicatorOptions,
@@ -150,8 +155,18 @@ class Series(Indicator):
         self.vol_up_color = Color.from_color(opts.up_color, a=opts.vol_opacity / 100)
         self.vol_down_color = Color.from_color(opts.down_color, a=opts.vol_opacity / 100)
 
+        # The most recent request for data & its debounce timer. Superseded requests are cancelled.
+        self._request_token: Optional[CancelToken] = None
+        self._request_timer: Optional[asyncio.TimerHandle] = None
+        # Token of the request whose socket is opened once its main data has been set
+        self._socket_token: Optional[CancelToken] = None
+
         self.main_data: Optional[Series_DF] = None
         self.ltf_data: Dict[TF, LTF_DF] = {}
+        self._ltf_refs: Dict[TF, int] = {}  # Number of outstanding request_ltf() calls per timeframe
+        self._ltf_callbacks: Dict[TF, list[Callable[[LTF_DF], Any]]] = {}
+        # Set when main_data is resampled from, and follows, a finer timeframe of the same symbol
+        self.htf_data: Optional[HTF_DF] = None
         self.whitespace_data: Optional[Whitespace_DF] = None
 
         self.display_series = sc.SeriesCommon(self, opts.series_type, name="Display-Series")
@@ -167,6 +182,14 @@ class Series(Indicator):
 
     def request_timeseries(self, symbol: Optional[Symbol], timeframe: Optional[TF] = None):
         "Request that this Series change it's symbol and/or timeframe to the one given."
+        if (series_cache := self.parent_frame.window.series_cache) is not None and self.main_data is not None:
+            # Keep the prepared data around in case this symbol & timeframe is requested again
+            if self.htf_data is not None:
+                series_cache.put(self.symbol, self.htf_data.base.timeframe, self.htf_data.base)
+            for ltf_data in self.ltf_data.values():
+                series_cache.put(self.symbol, ltf_data.timeframe, ltf_data.minor)
+            series_cache.put(self.symbol, self.main_data.timeframe, self.main_data)
+        self.ltf_data.clear()
         self.clear_data()
 
         if symbol is not None:
@@ -179,13 +202,114 @@ class Series(Indicator):
             if self.__frame_primary_src__:
                 self.parent_frame.__set_displayed_timeframe__(timeframe)
 
-        if self.symbol is not None and self.timeframe is not None:
-            self.events.data_request(
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-                rsp_kwargs={"series": self},
-            )
-            self.events.open_socket(symbol=self.symbol, series=self)
+        # Any request still in flight is now stale. Cancel it so it's data is never applied.
+        self.cancel_requests()
+        if self.symbol is None or self.timeframe is None:
+            return
+
+        token = self._request_token = CancelToken()
+        debounce = self.parent_frame.window.request_debounce
+        if debounce <= 0:
+            self._emit_requests(token)
+            return
+        try:
+            # Wait for rapid symbol / timeframe changes to settle before fetching anything.
+            self._request_timer = asyncio.get_running_loop().call_later(debounce, self._emit_requests, token)
+        except RuntimeError:
+            self._emit_requests(token)  # No running loop to schedule on
+
+    def _emit_requests(self, token: CancelToken):
+        self._request_timer = None
+        if token.cancelled:
+            return
+        self._socket_token = token
+        self._request_main_data(token)
+        for timeframe in self._ltf_refs:
+            self._request_ltf_data(timeframe, token)
+
+    def _request_main_data(self, token: CancelToken):
+        if (series_cache := self.parent_frame.window.series_cache) is not None:
+            if (prepared := series_cache.take(self.symbol, self.timeframe)) is not None:
+                # Display the cached bars now, then fetch & merge the bars they're missing.
+                self.set_data(prepared)
+                self._request_delta(prepared, token, on_response=self.__main_data_ready__)
+                return
+            if (base := series_cache.take_base(self.symbol, self.timeframe)) is not None:
+                # Derive this timeframe from a finer one once the base has been brought up to date.
+                # Socket updates are then applied to the base.
+                self._request_delta(base, token, on_response=self.__main_data_ready__, htf=self.timeframe)
+                return
+
+        rsp_kwargs: dict[str, Any] = {"series": self}
+        opt_kwargs: dict[str, Any] = {}
+        if (cache := self.parent_frame.window.bar_cache) is not None:
+            rsp_kwargs["cache_merge"] = partial(cache.merge, self.symbol, self.timeframe)
+            cached = cache.load(self.symbol, self.timeframe)
+            if cached is not None:
+                # Display the cached bars now, then only fetch from the last cached bar onward.
+                # The last bar is re-fetched since it may not have been complete when cached.
+                self.set_data(cached)
+                if self.main_data is not None:
+                    opt_kwargs["start"] = self.main_data.curr_bar_open_time
+
+        self._socket_token = token
+        self.events.data_request(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            rsp_kwargs=rsp_kwargs,
+            token=token,
+            on_response=self.__main_data_ready__,
+            opt_kwargs=opt_kwargs,
+        )
+
+    def __main_data_ready__(self):
+        """
+        Open the socket of the pending request now that the main data it updates has been set. The
+        data_request Emitter calls this once its responder returns, so a socket can never deliver
+        an update before the data it applies to.
+        """
+        token, self._socket_token = self._socket_token, None
+        if token is not None and not token.cancelled and self.main_data is not None:
+            self.events.open_socket(symbol=self.symbol, series=self, token=token)
+
+    def _request_delta(
+        self, cached: Series_DF, token: CancelToken, on_response: Optional[Callable[[], Any]] = None, **rsp_kwargs
+    ):
+        "Fetch the bars from the last bar of a cached Series_DF onward so they can be merged into it"
+        rsp_kwargs.update(series=self, delta_base=cached)
+        # The last bar is re-fetched since it may not have been complete when cached.
+        self.events.data_request(
+            symbol=self.symbol,
+            timeframe=cached.timeframe,
+            rsp_kwargs=rsp_kwargs,
+            token=token,
+            on_response=on_response,
+            opt_kwargs={"start": cached.curr_bar_open_time},
+        )
+
+    def _request_ltf_data(self, timeframe: TF, token: CancelToken):
+        if timeframe in self.ltf_data:
+            return
+        series_cache = self.parent_frame.window.series_cache
+        if series_cache is not None and (prepared := series_cache.take(self.symbol, timeframe)) is not None:
+            self.set_ltf_data(timeframe, prepared)
+            self._request_delta(prepared, token, ltf=timeframe)
+            return
+        self.events.data_request(
+            symbol=self.symbol,
+            timeframe=timeframe,
+            rsp_kwargs={"series": self, "ltf": timeframe},
+            token=token,
+        )
+
+    def cancel_requests(self):
+        "Cancel any pending data request or open socket so its data is never applied to this Series"
+        if self._request_timer is not None:
+            self._request_timer.cancel()
+            self._request_timer = None
+        if self._request_token is not None:
+            self._request_token.cancel()
+            self._request_token = None
 
     # region ------------------ Abstract Method Implementations ------------------
 
@@ -232,11 +356,11 @@ class Series(Indicator):
 
     def set_data(
         self,
-        data: pd.DataFrame | list[dict[str, Any]],
+        data: pd.DataFrame | list[dict[str, Any]] | Series_DF,
         *_,
         **__,
     ):
-        "Sets the main source of data for this Frame"
+        "Sets the main source of data for this Frame. A Series_DF is used as is, w/o preprocessing"
         if self.main_data is not None:
             # Ensure Data is clear. Most of the time it already will be.
             self.clear_data()
@@ -245,9 +369,12 @@ class Series(Indicator):
             self.parent_frame.__set_displayed_symbol__(self.symbol)
 
         # ---------------- Initialize Series DataFrame ----------------
-        if not isinstance(data, pd.DataFrame):
-            data = pd.DataFrame(data)
-        self.main_data = Series_DF(data, self.symbol.exchange)
+        if isinstance(data, Series_DF):
+            self.main_data = data
+        else:
+            if not isinstance(data, pd.DataFrame):
+                data = pd.DataFrame(data)
+            self.main_data = Series_DF(data, self.symbol.exchange)
 
         # ---------------- Clear & Return on Bad Data ----------------
         if self.main_data.timeframe.period == "E" or self.main_data.data_type == SeriesType.WhitespaceData:
@@ -256,8 +383,11 @@ class Series(Indicator):
         # Ensure timeframe matches data timeframe in case the data given doesn't match
         # the timeframe that this was set to somehow
         self.timeframe = self.main_data.timeframe
+        self._bind_ltf_data()
 
         # ---------------- Update Displayed Series Objects with Data ----------------
+        if self.__frame_primary_src__:
+            self.parent_frame.__reset_bars_back__()
         self._init_bar_state()
         self.display_series.set_data(self.main_data)
         self._set_vol_series()
@@ -294,33 +424,29 @@ class Series(Indicator):
         if self.main_data is None or data_update.time < self.main_data.curr_bar_open_time:  # type: ignore
             return
 
+        # Lower Timeframes are updated first. The update is copied since its time may be adjusted.
+        for ltf_data in self.ltf_data.values():
+            ltf_data.update(copy(data_update), accumulate=accumulate)
+
         # ------------------ Determine if Data Should be Aggregated or Appended ------------------
-        new_bar = False
-        if data_update.time < self.main_data.next_bar_time:  # type: ignore
-            # Update the last bar (Aggregate)
-            display_data = self.main_data.update_curr_bar(data_update, accumulate=accumulate)
+        curr_bar_time = self.main_data.curr_bar_open_time
+        if self.htf_data is not None:
+            # Update the finer base data, then re-aggregate the derived bar from it
+            display_data, new_bar = self.htf_data.update(data_update, accumulate=accumulate)
         else:
-            # Create new Bar (Append)
-            if data_update.time != self.main_data.next_bar_time:
-                # Update given is a new bar, but not the expected time
-                # Ensure it fits the data's time interval e.g. 12:00:0071 -> 12:00:00
-                # TODO: Update the time calc. This will error for HTF when timedelta is invalid
-                time_delta = data_update.time - self.main_data.next_bar_time  # type: ignore
-                data_update.time -= time_delta % self.main_data.timedelta  # type: ignore
-
-            curr_bar_time = self.main_data.curr_bar_open_time
-            display_data = self.main_data.append_new_bar(data_update)
-            new_bar = True
+            display_data, new_bar = self.main_data.update(data_update, accumulate=accumulate)
 
+        if new_bar:
             # --------------------- Manage Whitespace Series ---------------------
+            new_bar_time = self.main_data.curr_bar_open_time
             if self.__frame_primary_src__ and self.whitespace_data is not None:
-                if data_update.time != (expected_time := self.whitespace_data.next_timestamp(curr_bar_time)):
+                if new_bar_time != (expected_time := self.whitespace_data.next_timestamp(curr_bar_time)):
                     # New Data Jumped more than expected, Replace Whitespace Data So
                     # There are no unnecessary gaps.
                     logger.info(
                         "Whitespace_DF Predicted incorrectly. Expected_time: %s, Recieved_time: %s",
                         expected_time,
-                        data_update.time,
+                        new_bar_time,
                     )
                     self.whitespace_data = Whitespace_DF(self.main_data)
                     self.parent_frame.__set_whitespace__(
@@ -340,14 +466,18 @@ class Series(Indicator):
         self._update_vol_series()
 
         # --------------------- Propogate the Data Update to other Indicators ---------------------
-        self._watcher.reset_updated_state()
-        self._watcher.updated = True
         self._notify_observers_update()
 
+    def delete(self):
+        self.cancel_requests()
+        super().delete()
+
     def clear_data(self):
         "Clears the data in memory and on the screen, Closes out An open Socket if one exists"
         self.main_data = None
+        self.htf_data = None
         self._bar_state = None
+        self._bind_ltf_data()
 
         if self.__frame_primary_src__:
             self.whitespace_data = None
@@ -368,22 +498,22 @@ class Series(Indicator):
         if self.main_data is None:
             return
 
-        df = self.main_data.df
-        col_names = self.main_data.df.columns
+        store = self.main_data.store
+        col_names = self.main_data.columns
 
         self._bar_state = BarState(
-            index=len(self.main_data.df) - 1,
+            index=len(self.main_data) - 1,
             time=self.main_data.curr_bar_open_time,
             timestamp=self.main_data.curr_bar_open_time,
             time_close=self.main_data.curr_bar_close_time,
             time_length=self.main_data.timedelta,
-            open=(df.iloc[-1]["open"] if "open" in col_names else nan),
-            high=(df.iloc[-1]["high"] if "high" in col_names else nan),
-            low=(df.iloc[-1]["low"] if "low" in col_names else nan),
-            close=(df.iloc[-1]["close"] if "close" in col_names else nan),
-            value=(df.iloc[-1]["value"] if "value" in col_names else nan),
-            volume=(df.iloc[-1]["volume"] if "volume" in col_names else nan),
-            ticks=(df.iloc[-1]["ticks"] if "ticks" in col_names else nan),
+            open=store.last("open", nan),
+            high=store.last("high", nan),
+            low=store.last("low", nan),
+            close=store.last("close", nan),
+            value=store.last("value", nan),
+            volume=store.last("volume", nan),
+            ticks=store.last("ticks", nan),
             # is_ext=self.main_data.ext, # TODO: Implement time check
             is_new=True,
             is_single_value="value" in col_names,
@@ -394,21 +524,20 @@ class Series(Indicator):
         if self.main_data is None or self._bar_state is None:
             return
 
-        df = self.main_data.df
-        col_names = self.main_data.df.columns
+        store = self.main_data.store
 
-        self._bar_state.index = len(self.main_data.df) - 1
+        self._bar_state.index = len(self.main_data) - 1
         self._bar_state.time = self.main_data.curr_bar_open_time
         self._bar_state.timestamp = current_timestamp
         self._bar_state.time_close = self.main_data.curr_bar_close_time
         self._bar_state.time_length = self.main_data.timedelta
-        self._bar_state.open = float(df.iloc[-1]["open"] if "open" in col_names else nan)
-        self._bar_state.high = float(df.iloc[-1]["high"] if "high" in col_names else nan)
-        self._bar_state.low = float(df.iloc[-1]["low"] if "low" in col_names else nan)
-        self._bar_state.close = float(df.iloc[-1]["close"] if "close" in col_names else nan)
-        self._bar_state.value = float(df.iloc[-1]["value"] if "value" in col_names else nan)
-        self._bar_state.volume = float(df.iloc[-1]["volume"] if "volume" in col_names else nan)
-        self._bar_state.ticks = float(df.iloc[-1]["ticks"] if "ticks" in col_names else nan)
+        self._bar_state.open = float(store.last("open", nan))
+        self._bar_state.high = float(store.last("high", nan))
+        self._bar_state.low = float(store.last("low", nan))
+        self._bar_state.close = float(store.last("close", nan))
+        self._bar_state.value = float(store.last("value", nan))
+        self._bar_state.volume = float(store.last("volume", nan))
+        self._bar_state.ticks = float(store.last("ticks", nan))
         # self._bar_state.is_ext=self.main_data.ext, TODO: Implement Time check
         self._bar_state.is_new = is_new
         # self._bar_state.is_single_value ## Constant
@@ -419,11 +548,11 @@ class Series(Indicator):
             if self.opts.color_vol and set(["open", "close"]).issubset(self.main_data.columns):
                 # Generate a Color Series for the Volume Histogram if we can
                 vol_color = self.main_data.df["close"] >= self.main_data.df["open"]
-                self.main_data.df["vol_color"] = vol_color.replace(
-                    {True: self.vol_up_color, False: self.vol_down_color}
+                self.main_data.set_column(
+                    "vol_color", vol_color.replace({True: self.vol_up_color, False: self.vol_down_color})
                 )
             elif "vol_color" in self.main_data.columns:
-                self.main_data.df.drop(columns="vol_color", inplace=True)
+                self.main_data.drop_column("vol_color")
 
             # Color Doesn't Need to exist to update the Series
             self.vol_series.set_data(self.main_data)
@@ -445,13 +574,60 @@ class Series(Indicator):
 
     # region ------------------ Lower-Timeframe Support ------------------
 
-    def request_ltf(self, timeframe: TF):
-        "Request that a Lower Timeframe of data be retrieved for calculation"
-        raise NotImplementedError
-
-    def release_ltf(self, timeframe: TF):
+    def request_ltf(
+        self, timeframe: TF, on_ready: Optional[Callable[[LTF_DF], Any]] = None
+    ) -> Optional[LTF_DF]:
+        """
+        Request that a Lower Timeframe of data be retrieved for calculation. Each call must be paired
+        with a call to release_ltf(). Returns the LTF_DF if it's already available. 'on_ready' is
+        called with the LTF_DF each time it's retrieved while the main data is set, e.g. after the
+        symbol changes. Until release_ltf() is called with the same callback it's kept alive.
+        """
+        self._ltf_refs[timeframe] = self._ltf_refs.get(timeframe, 0) + 1
+        if on_ready is not None:
+            self._ltf_callbacks.setdefault(timeframe, []).append(on_ready)
+        if self._ltf_refs[timeframe] == 1 and self._request_token is not None:
+            self._request_ltf_data(timeframe, self._request_token)
+        return self.ltf_data.get(timeframe)
+
+    def release_ltf(self, timeframe: TF, on_ready: Optional[Callable[[LTF_DF], Any]] = None):
         "Relinquish the need for this series to track a specific lower timeframe"
-        raise NotImplementedError
+        if timeframe not in self._ltf_refs:
+            return
+        if on_ready is not None and on_ready in (callbacks := self._ltf_callbacks.get(timeframe, [])):
+            callbacks.remove(on_ready)
+        self._ltf_refs[timeframe] -= 1
+        if self._ltf_refs[timeframe] > 0:
+            return
+
+        # No longer needed. Free the memory unless it fits in the Window's cache.
+        del self._ltf_refs[timeframe]
+        self._ltf_callbacks.pop(timeframe, None)
+        ltf_data = self.ltf_data.pop(timeframe, None)
+        if ltf_data is not None and (series_cache := self.parent_frame.window.series_cache) is not None:
+            series_cache.put(self.symbol, timeframe, ltf_data.minor)
+
+    def set_ltf_data(self, timeframe: TF, data: pd.DataFrame | list[dict[str, Any]] | Series_DF):
+        "Set the data of a requested Lower Timeframe & notify its requesters. A Series_DF is used as is"
+        if timeframe not in self._ltf_refs:
+            return  # Released while the data was being retrieved
+        if not isinstance(data, Series_DF):
+            data = Series_DF(data if isinstance(data, pd.DataFrame) else pd.DataFrame(data), self.symbol.exchange)
+        if data.data_type == SeriesType.WhitespaceData:
+            return
+
+        self.ltf_data[timeframe] = LTF_DF(data)
+        self._bind_ltf_data()
+        if self.main_data is None:
+            return  # Requesters read the LTF_DF when the main data is set & they're recalculated
+        for on_ready in list(self._ltf_callbacks.get(timeframe, [])):
+            on_ready(self.ltf_data[timeframe])
+
+    def _bind_ltf_data(self):
+        "Bind each lower timeframe to the main data, provided it is still a lower timeframe"
+        for ltf_data in self.ltf_data.values():
+            valid = self.main_data is not None and ltf_data.timeframe < self.main_data.timeframe
+            ltf_data.bind(self.main_data if valid else None)
 
     # endregion
 
@@ -498,26 +674,25 @@ class Series(Indicator):
 
         if self.whitespace_data is not None:
             # Find index given main dataset and Whitespace Projection
-            total_len = len(self.main_data.df) + len(self.whitespace_data.df)
+            total_len = len(self.main_data) + len(self.whitespace_data)
             if index > total_len - 1:
                 logger.warning("Requested Bar-Time beyond 500 Bars in the Future.")
-                return self.whitespace_data.df.index[-1]
-            elif index < -(len(self.main_data.df) - 1):
+                return self.whitespace_data.time_at(-1)
+            elif index < -(len(self.main_data) - 1):
                 # i.e. Less than the max possible negative index
                 logger.warning("Requested Bar-Time prior to start of the dataset.")
                 return self.main_data.df.index[0]
             else:
-                if index < len(self.main_data.df):
+                if index < len(self.main_data):
                     return self.main_data.df.index[index]
                 else:
-                    # Whitespace df grows as data is added hence funky iloc index.
-                    return self.whitespace_data.df["time"].iloc[(index - len(self.main_data.df)) - 500]
+                    return self.whitespace_data.time_at(index - len(self.main_data))
         else:
             # Series has no Whitespace projection
-            if index > len(self.main_data.df) - 1:
+            if index > len(self.main_data) - 1:
                 logger.warning("Requested Bar-Time beyond the dataset.")
                 return self.main_data.df.index[-1]
-            elif index < -(len(self.main_data.df) - 1):
+            elif index < -(len(self.main_data) - 1):
                 logger.warning("Requested Bar-Time prior to start of the dataset.")
                 return self.main_data.df.index[0]
             else:
@@ -525,6 +700,12 @@ class Series(Indicator):
 
     # region ------------------------ Output Properties ------------------------
 
+    def __last_value__(self, output: str) -> Optional[float]:
+        if output in ("open", "high", "low", "close", "volume") and self.main_data is not None:
+            value = self.main_data.store.last(output)
+            return nan if value is None else float(value)
+        return None
+
     @output_property
     def last_bar_index(self) -> int:
         "Last Bar Index of the dataset. Returns -1 if there is no valid data"
@@ -552,45 +733,74 @@ class Series(Indicator):
     @default_output_property
     def close(self) -> pd.Series:
         "A Series' Bar closing value"
-        if self.main_data is not None and "close" in self.main_data.df.columns:
+        if self.main_data is not None and "close" in self.main_data.columns:
             return self.main_data.df["close"]
         return pd.Series({})
 
     @output_property
     def open(self) -> pd.Series:
         "A Series' Bar open value"
-        if self.main_data is not None and "open" in self.main_data.df.columns:
+        if self.main_data is not None and "open" in self.main_data.columns:
             return self.main_data.df["open"]
         return pd.Series({})
 
     @output_property
     def high(self) -> pd.Series:
         "A Series' Bar high value"
-        if self.main_data is not None and "high" in self.main_data.df.columns:
+        if self.main_data is not None and "high" in self.main_data.columns:
             return self.main_data.df["high"]
         return pd.Series({})
 
     @output_property
     def low(self) -> pd.Series:
         "A Series' Bar low value"
-        if self.main_data is not None and "low" in self.main_data.df.columns:
+        if self.main_data is not None and "low" in self.main_data.columns:
             return self.main_data.df["low"]
         return pd.Series({})
 
     @output_property
     def volume(self) -> pd.Series:
         "A Series' Bar low value"
-        if self.main_data is not None and "volume" in self.main_data.df.columns:
+        if self.main_data is not None and "volume" in self.main_data.columns:
             return self.main_data.df["volume"]
         return pd.Series({})
 
     # endregion
 
 
-def _timeseries_request_responder(data: pd.DataFrame | list[dict[str, Any]] | None, series: Series, **_):
+def _timeseries_request_responder(
+    data: pd.DataFrame | list[dict[str, Any]] | None,
+    series: Series,
+    cache_merge: Optional[Callable] = None,
+    delta_base: Optional[Series_DF] = None,
+    htf: Optional[TF] = None,
+    ltf: Optional[TF] = None,
+    **_,
+):
     "Function that responds to the data returned by an Event.data_request being emitted"
-    if data is not None:
-        series.set_data(data)
+    if delta_base is not None:
+        # Bars fetched from the last bar of a cached Series_DF onward
+        if data is not None:
+            delta_base.merge(data)
+        elif htf is None:
+            return  # The cached bars are already displayed
+        data = delta_base
+    if data is None:
+        return
+    if htf is not None:
+        # The merged bars are a finer base that the series' timeframe is derived from
+        htf_data = HTF_DF(data, htf)
+        series.set_data(htf_data.data)
+        series.htf_data = htf_data
+        return
+    if ltf is not None:
+        series.set_ltf_data(ltf, data)
+        return
+    if cache_merge is not None:
+        data, changed = cache_merge(data)
+        if not changed and series.main_data is not None:
+            return  # The cached bars that are already displayed are up to date
+    series.set_data(data)
 
 
 # endregion
@@ -1,5 +1,6 @@
 from enum import Enum, auto
 from dataclasses import dataclass
+from math import nan
 from typing import Optional
 
 import pandas as pd
@@ -14,6 +15,9 @@ from fracta.indicator import (
 )
 from fracta import Color, SingleValueData
 from fracta import series_common as sc
+from fracta.indicators import BarState
+from fracta import rolling
+from fracta.dataframe_ext import BarStore
 
 
 class Method(Enum):
@@ -24,6 +28,14 @@ class Method(Enum):
     RMA = auto()
 
 
+# Streaming Statistic used to calculate each Method
+METHOD_STATS: dict[Method, type[rolling.StreamingStat]] = {
+    Method.SMA: rolling.RollingMean,
+    Method.EMA: rolling.EMA,
+    Method.RMA: rolling.RMA,
+}
+
+
 @dataclass
 class SMAOptions(IndicatorOptions):
     "Dataclass of Options for the SMA Indicator"
@@ -54,7 +66,9 @@ class SMA(Indicator):
 
         self.src = None
         self.period = 0
-        self._data = pd.Series()
+        self.method = None
+        self._stat: Optional[rolling.StreamingStat] = None
+        self._data: Optional[BarStore] = None
         self.line_series = sc.LineSeries(self, name="My SMA")
         self.line_series.apply_options(sc.LineStyleOptions(lineStyle=sc.LineStyle.SparseDotted))
 
@@ -69,6 +83,10 @@ class SMA(Indicator):
             self.period = opts.period
             recalc = True
 
+        if self.method != opts.method:
+            self.method = opts.method
+            recalc = True
+
         if opts.src is None:
             opts.src = self.default_parent_src
 
@@ -80,14 +98,35 @@ class SMA(Indicator):
         return "recalc" in locals()
 
     def set_data(self, data: pd.Series, *_, **__):
-        self._data = data.rolling(window=self.period).mean()
-        self.line_series.set_data(self._data)
-
-    def update_data(self, time: pd.Timestamp, data: pd.Series, *_, **__):
-        self._data[time] = data.tail(self.period).mean()
-        self.line_series.update_data(SingleValueData(time, self._data.iloc[-1]))
+        self._stat = METHOD_STATS[self.method](self.period)
+        average = self._stat.seed(data)
+        self._data = BarStore(average.to_frame("average")) if isinstance(average.index, pd.DatetimeIndex) else None
+        # Display the live output so older bars sent later include the bars added by update_data()
+        self.line_series.set_data(self.average if self._data is not None else average)
+
+    def __last_value__(self, output: str) -> Optional[float]:
+        if output == "average" and self._data is not None:
+            return float(self._data.last("average", nan))
+        return None
+
+    def update_bar(self, bar_state: BarState, data: float, *_, **__):
+        if self._stat is None or self._data is None:
+            return
+        # The streaming stat handles intra-bar revisions itself so no __bar_vars__ are needed.
+        new_bar = bar_state.is_new and (len(self._data) == 0 or bar_state.time > self._data.last_time)
+        value = self._stat.update(data, new_bar)
+        if new_bar:
+            self._data.append(bar_state.time, {"average": value})
+        else:
+            self._data.update_last({"average": value})
+        self.line_series.update_data(SingleValueData(bar_state.time, value))
+
+    def clear_data(self):
+        self._stat = None
+        self._data = None
+        super().clear_data()
 
     @default_output_property
     def average(self) -> pd.Series:
-        "The resulting SMA"
-        return self._data
+        "The resulting Moving Average"
+        return pd.Series() if self._data is None else self._data.df["average"]
@@ -2,6 +2,8 @@
 
 import logging
 from os.path import dirname, abspath
+from queue import Empty
+from time import perf_counter
 from inspect import getmembers, ismethod
 import multiprocessing as mp
 from multiprocessing.synchronize import Event as mp_EventClass
@@ -15,7 +17,7 @@ from webview.errors import JavascriptException
 from fracta.util import is_dunder
 
 from . import orm, SeriesType
-from .js_cmd import JS_CMD, VIEW_CMD_ROLODEX
+from .js_cmd import JS_CMD, DataTransport, cmd_rolodex
 from .py_cmd import PY_CMD
 
 file_dir = dirname(abspath(__file__))
@@ -119,15 +121,27 @@ class js_api:
     def update_series_options(self, c_id: str, f_id: str, i_id: str, s_id: str, opts: dict):
         self.rtn_queue.put((PY_CMD.UPDATE_SERIES_OPTS, c_id, f_id, i_id, s_id, opts))
 
+    def visible_range_change(self, c_id: str, f_id: str, _from: float, _to: float, width: Optional[float] = None):
+        self.rtn_queue.put((PY_CMD.VISIBLE_RANGE_CHANGE, c_id, f_id, _from, _to, width))
+
 
 ##### --------------------------------- Helper Classes --------------------------------- #####
 
 
+class CmdQueue(Protocol):
+    "Queue interface shared by mp.Queue and ShmQueue"
+
+    def put(self, obj, /): ...
+    def get(self, block: bool = True, timeout: Optional[float] = None): ...
+    def empty(self) -> bool: ...
+
+
 @dataclass
 class MpHooks:
     "All Multiprocessor Hooks required for the javascript Sub-Process interface"
 
-    fwd_queue: mp.Queue = field(default_factory=mp.Queue)
+    # A ShmQueue can be given in place of an mp.Queue to pass large payloads through shared memory
+    fwd_queue: CmdQueue = field(default_factory=mp.Queue)
     rtn_queue: mp.Queue = field(default_factory=mp.Queue)
     js_loaded_event: mp_EventClass = field(default_factory=mp.Event)
     stop_event: mp_EventClass = field(default_factory=mp.Event)
@@ -157,15 +171,31 @@ class View(ABC):
         run_script():       Callable function that takes a string representation of javascript that
                             will be evaluated in the window
         rolodex:            A Dict Mapping JS_CMDs to Instance Functions for easy access
+        cmd_rolodex:        A Dict Mapping JS_CMDs to Javascript formatting Functions. Bulk data
+                            commands are formatted according to the View's data_transport.
+        flush_interval:     Minimum time, in seconds, between executions of batched commands.
+        cmds_received:      Count of commands received through the fwd_queue
+        cmds_executed:      Count of commands executed after redundant updates were coalesced
 
     """
 
+    # Maximum number of commands executed in a single script
+    MAX_BATCH_SIZE = 100
+    # Updates that only need to be executed once per (Object IDs, Bar Time) within a batch.
+    COALESCED_CMDS = {JS_CMD.UPDATE_SERIES_DATA: 3, JS_CMD.UPDATE_WHITESPACE_DATA: 1}  # {CMD: Num_IDs}
+
     def __init__(
         self,
         hooks: MpHooks,
         run_script: _scriptProtocol,
+        data_transport: DataTransport = "json",
+        flush_interval: float = 1 / 60,
     ):
         self.run_script = run_script
+        self.cmd_rolodex = cmd_rolodex(data_transport)
+        self.flush_interval = flush_interval
+        self.cmds_received = 0
+        self.cmds_executed = 0
         self.fwd_queue = hooks.fwd_queue
         self.rtn_queue = hooks.rtn_queue
         self.js_loaded_event = hooks.js_loaded_event
@@ -200,18 +230,68 @@ class View(ABC):
 
     def _manage_queue(self):
         "Infinite loop to manage Process Queue since it is launched in an isolated process"
-        batch_cmd, batch_size = "", 0
+        # Pending commands, and the index of the last coalescable update for each (CMD, *IDs)
+        batch: list[tuple[JS_CMD, tuple]] = []
+        coalesce_map: dict[tuple, int] = {}
+        next_flush = 0.0
+
         while not self.stop_event.is_set():
-            # get() doesn't need a timeout. the waiting will get interupted by the os
+            # get() doesn't need a timeout when idle. the waiting will get interupted by the os
             # to go manage the thread that the webview is running in. Bit wasteful i think.
             # Would be nice to have pywebview run in an asyncio Thread
-            msg = self.fwd_queue.get()
-            cmd, *args = msg
-            logger.debug("Received CMD: %s, args: %s", cmd.name, args)
+            timeout = None if len(batch) == 0 else max(0, next_flush - perf_counter())
+            try:
+                cmd, *args = self.fwd_queue.get(timeout=timeout)
+            except Empty:
+                cmd = None
+
+            if cmd is not None:
+                logger.debug("Received CMD: %s, args: %s", cmd.name, args)
+                self.cmds_received += 1
+
+                if (n_ids := self.COALESCED_CMDS.get(cmd)) is not None:
+                    # Only the last update for a given bar of a given object matters. An earlier
+                    # update is only replaced if nothing else was queued for that object since.
+                    key = (cmd, *args[:n_ids])
+                    prev = coalesce_map.get(key)
+                    time = _bar_time(args[n_ids])
+                    if prev is not None and time is not None and _bar_time(batch[prev][1][n_ids]) == time:
+                        batch[prev] = (cmd, tuple(args))
+                    else:
+                        coalesce_map[key] = len(batch)
+                        batch.append((cmd, tuple(args)))
+                elif cmd in self.rolodex:
+                    self.rolodex[cmd](*args)  # Given a PyWv Command, execute Immediately
+                    self.cmds_executed += 1
+                else:
+                    # Every other command is a barrier. Updates queued before it can't be coalesced
+                    # with updates queued after it.
+                    coalesce_map.clear()
+                    batch.append((cmd, tuple(args)))
 
+            # Batching is critical. Batching is atleast 3x faster than running individual cmds
+            # If not done then the queue can easily pileup too. The Batch Size Limit exists to
+            # limit how much the viewport appears to lockup while being flooded w/ cmds
+            if len(batch) >= self.MAX_BATCH_SIZE or (
+                len(batch) > 0 and self.fwd_queue.empty() and perf_counter() >= next_flush
+            ):
+                self._run_batch(batch)
+                batch, coalesce_map = [], {}
+                next_flush = perf_counter() + self.flush_interval
+
+        logger.info("View Commands Received: %s, Executed: %s", self.cmds_received, self.cmds_executed)
+
+    def _run_batch(self, batch: list[tuple[JS_CMD, tuple]]):
+        "Format and then execute a batch of commands as a single script"
+        batch_cmd = ""
+        acks = []
+        for cmd, args in batch:
+            if cmd == JS_CMD.ACK:
+                acks.append(args[0])
+                continue
             try:
                 # Lookup JS Command
-                cmd_str = VIEW_CMD_ROLODEX[cmd](*args)
+                cmd_str = self.cmd_rolodex[cmd](*args)
             except TypeError as e:
                 arg_list = [type(arg) for arg in args]
                 logger.error(
@@ -221,20 +301,19 @@ class View(ABC):
                     e,
                 )
                 continue  # Skip to next Command
-
-            if cmd_str is None:
-                self.rolodex[cmd](*args)  # Given a PyWv Command, execute Immediately
-            else:
-                batch_size += 1
+            if cmd_str is not None:
                 batch_cmd += cmd_str
+                self.cmds_executed += 1
+
+        self.run_script(batch_cmd)
+        # The script has executed so everything queued before each ACK has been displayed
+        for token in acks:
+            self.rtn_queue.put((PY_CMD.DATA_ACK, token))
 
-            # Batching is critical. Batching is atleast 3x faster than running individual cmds
-            # If not done then the queue can easily pileup too. The Batch Size Limit exists to
-            # limit how much the viewport appears to lockup while being flooded w/ cmds
-            if self.fwd_queue.empty() or batch_size >= 100:
-                self.run_script(batch_cmd)
-                batch_cmd = ""
-                batch_size = 0
+
+def _bar_time(data: object) -> object:
+    "Time of an update's data point, None if it cannot be determined."
+    return getattr(data, "time", None)
 
 
 class PyWv(View):
@@ -247,6 +326,11 @@ class PyWv(View):
         Param: api
             Optional instance of js_api, can be an extended subclass. If it is extended
             Any additional class methods will behave as javascript api callbacks
+        Param: data_transport
+            Format of bulk series data. "json" sends a list of records, "columnar" sends
+            Base64 encoded Float64 column arrays that are reconstituted by the Javascript Window.
+        Param: flush_interval
+            Minimum time, in seconds, between script executions. Default caps updates at 60fps.
         param: **kwargs
             key-word args that are passed directly to the pywebview window.
             See https://pywebview.flowrl.com/guide/api.html for docs on available kwargs.
@@ -259,10 +343,17 @@ class PyWv(View):
         debug: bool = False,
         log_level: Optional[str | int] = None,
         api: Optional[js_api] = None,
+        data_transport: DataTransport = "json",
+        flush_interval: float = 1 / 60,
         **kwargs,
     ):
         # Pass Hooks and run_script to super
-        super().__init__(mp_hooks, run_script=self._handle_eval_js)
+        super().__init__(
+            mp_hooks,
+            run_script=self._handle_eval_js,
+            data_transport=data_transport,
+            flush_interval=flush_interval,
+        )
 
         if log_level is not None:
             logger.setLevel(log_level)
@@ -3,47 +3,147 @@ Implementations of Command Functions that return formatted Javascript ready for
 All Functions wave been rolled-up into VIEW_CMD_ROLODEX that Maps {JS_CMD: Function}
 """
 
-from math import floor
+from base64 import b64encode
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cache
+import logging
+from threading import Lock
 from enum import Enum, IntEnum, auto
-from typing import Callable, Any, Optional
-from json import JSONEncoder, dumps
-from dataclasses import is_dataclass, asdict
+from typing import Callable, Any, Literal, Optional
+from json import dumps
+from dataclasses import fields, is_dataclass
 
+import numpy as np
 from pandas import DataFrame, Timestamp, notnull
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_bool_dtype
 
 from .orm.types import Color, j_func, TF
+from .orm.series_data import WhitespaceData
+
+try:
+    import orjson  # Optional, compiled, JSON backend
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("fracta_log")
 
 # @pylint: disable=invalid-name, line-too-long, missing-function-docstring
 
 
-class ORM_JSONEncoder(JSONEncoder):
-    "Enhanced JSON Encoder that encodes various pycharts/pandas objects in JSON"
-
-    def default(self, o):  # Order most Common to least commonly dumped
-        if isinstance(o, Timestamp):
-            return floor(o.timestamp())
-        if is_dataclass(o):
-            return asdict(  # Drop Nones
-                o, dict_factory=lambda x: {k: v for (k, v) in x if v is not None}  # type: ignore
-            )
-        if isinstance(o, DataFrame):
-            return [  # Drop NaNs & Nones (.to_json() leaves NaNs & Nones)
-                {k: v for k, v in m.items() if notnull(v)} for m in o.to_dict(orient="records")
-            ]
-        if isinstance(o, Color):
-            return repr(o)
-        if isinstance(o, bool):
-            return "true" if o else "false"
-        if isinstance(o, Enum):
-            return o.value
-        if isinstance(o, j_func):
-            return o.func
-        return super().default(o)
+# region ------------------------ JSON Encoding ------------------------ #
+
+# dump() converts every ORM object within what it's given to native JSON types in a single pass, then
+# hands the result to a JSON backend. The compiled orjson backend is used when it's installed.
+# N.B. orjson writes NaNs as 'null' where the standard library writes 'NaN'.
+
+JsonBackend = Literal["auto", "orjson", "json"]
+
+_NATIVE_TYPES = (str, int, float, bool, type(None))
+
+
+@cache
+def _dataclass_fields(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def to_native(o: Any) -> Any:
+    "Convert an object, and everything it contains, into types that are natively JSON serializable"
+    cls = type(o)
+    if cls in _NATIVE_TYPES:
+        return o
+    if cls is dict:
+        return {k: to_native(v) for k, v in o.items()}
+    if cls is list or cls is tuple:
+        return [to_native(v) for v in o]
+    if isinstance(o, Timestamp):
+        return o.value // 1_000_000_000  # Epoch Seconds
+    if isinstance(o, WhitespaceData):
+        # Drop NaNs, like a DataFrame, so a NaN value is displayed as whitespace
+        return {k: to_native(v) for k, v in o.as_dict.items() if v == v}
+    if is_dataclass(o) and not isinstance(o, type):
+        return {k: to_native(v) for k in _dataclass_fields(cls) if (v := getattr(o, k)) is not None}
+    if isinstance(o, DataFrame):
+        return _native_records(o)
+    if isinstance(o, Color):
+        return repr(o)
+    if isinstance(o, Enum):
+        return to_native(o.value)
+    if isinstance(o, j_func):
+        return o.func
+    if isinstance(o, np.generic):
+        return o.item()
+    if isinstance(o, _NATIVE_TYPES):
+        return o  # Subclass of a native type
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def _native_records(df: DataFrame) -> list[dict]:
+    "The rows of a DataFrame as dicts of native types. NaNs & Nones are dropped (.to_json() leaves them)"
+    names, columns = list(df.columns), []
+    for _, col in df.items():
+        values = col.tolist()
+        if not (isinstance(col.dtype, np.dtype) and col.dtype.kind in "biuf"):
+            values = [to_native(v) if notnull(v) else None for v in values]
+        columns.append(values)
+    return [{k: v for k, v in zip(names, row) if v is not None and v == v} for row in zip(*columns)]
+
+
+def _json_dumps(obj: Any) -> str:
+    return dumps(obj, separators=(",", ":"))
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()  # type: ignore # pylint: disable=no-member
+
+
+_dumps: Callable[[Any], str] = _json_dumps if orjson is None else _orjson_dumps
+
+
+def set_json_backend(backend: JsonBackend | Callable[[Any], str] = "auto"):
+    """
+    Set the serializer used by dump() in this process. 'auto' uses orjson when it's installed and
+    the standard library otherwise. A callable is only given native JSON types and must return a str.
+    """
+    global _dumps  # pylint: disable=global-statement
+    if callable(backend):
+        _dumps = backend
+    elif backend == "orjson" or (backend == "auto" and orjson is not None):
+        if orjson is None:
+            raise ModuleNotFoundError("The 'orjson' JSON backend requires orjson to be installed.")
+        _dumps = _orjson_dumps
+    else:
+        _dumps = _json_dumps
 
 
 def dump(obj: Any) -> str:
     "Enchanced JSON.dumps() to serialize all ORM Objects"
-    return dumps(obj, cls=ORM_JSONEncoder, separators=(",", ":"))
+    return _dumps(to_native(obj))
+
+
+# endregion
+
+
+DataTransport = Literal["json", "columnar"]
+
+
+def columnar(df: DataFrame) -> dict:
+    """
+    Encode a DataFrame as a set of Base64 encoded, little-endian, Float64 column arrays.
+    Datetime columns are converted to Unix Epoch seconds. Non-numeric columns are sent as
+    plain JSON lists. Reconstituted into a list of records by decode_columnar() in columnar.ts
+    """
+    f64, lists = {}, {}
+    for name, col in df.items():
+        if is_datetime64_any_dtype(col):
+            arr = col.dt.as_unit("s").astype("int64").to_numpy(dtype="<f8")
+        elif is_numeric_dtype(col) and not is_bool_dtype(col):
+            arr = col.to_numpy(dtype="<f8", na_value=np.nan)
+        else:
+            lists[name] = [v if notnull(v) else None for v in col.tolist()]
+            continue
+        f64[name] = b64encode(arr.tobytes()).decode("ascii")
+    return {"length": len(df), "f64": f64, "json": lists}
 
 
 class JS_CMD(IntEnum):
@@ -51,6 +151,7 @@ class JS_CMD(IntEnum):
 
     # Window Commands
     JS_CODE = auto()
+    ACK = auto()  # Answered by the View w/ PY_CMD.DATA_ACK once every command before it has executed
     LOAD_CSS = auto()
     ADD_CONTAINER = auto()
     REMOVE_CONTAINER = auto()
@@ -70,6 +171,8 @@ class JS_CMD(IntEnum):
     # Frame Commands
     ADD_PANE = auto()
     AUTOSCALE_TIME_AXIS = auto()
+    HOLD_VISIBLE_RANGE = auto()
+    RESTORE_VISIBLE_RANGE = auto()
     SET_WHITESPACE_DATA = auto()
     CLEAR_WHITESPACE_DATA = auto()
     UPDATE_WHITESPACE_DATA = auto()
@@ -99,6 +202,7 @@ class JS_CMD(IntEnum):
 
     # Series Commands
     SET_SERIES_DATA = auto()
+    PREPEND_SERIES_DATA = auto()
     CLEAR_SERIES_DATA = auto()
     UPDATE_SERIES_DATA = auto()
     CHANGE_SERIES_TYPE = auto()
@@ -223,6 +327,10 @@ def set_whitespace_data(frame_id: str, data: DataFrame, curr_time: object) -> st
     return f"{frame_id}.set_whitespace_data({data.to_json(orient="records",date_unit='s')}, {dump(curr_time)});"
 
 
+def set_whitespace_data_columnar(frame_id: str, data: DataFrame, curr_time: object) -> str:
+    return f"{frame_id}.set_whitespace_data(decode_columnar({dump(columnar(data))}), {dump(curr_time)});"
+
+
 def clear_whitespace_data(frame_id: str) -> str:
     return f"{frame_id}.set_whitespace_data([]);"
 
@@ -235,6 +343,14 @@ def autoscale_time_axis(frame_id: str):
     return f"{frame_id}.autoscale_content();"
 
 
+def hold_visible_range(frame_id: str):
+    return f"{frame_id}.hold_visible_range();"
+
+
+def restore_visible_range(frame_id: str):
+    return f"{frame_id}.restore_visible_range();"
+
+
 # endregion
 
 # region ------------------------ Pane ------------------------ #
@@ -313,6 +429,10 @@ def set_series_data(frame_id: str, indicator_id: str, series_id: str, data: Data
     return series_preamble(frame_id, indicator_id, series_id) + f"_ser.setData({dump(data)});"
 
 
+def prepend_series_data(frame_id: str, indicator_id: str, series_id: str, data: DataFrame) -> str:
+    return series_preamble(frame_id, indicator_id, series_id) + f"_ser.prependData({dump(data)});"
+
+
 def clear_series_data(frame_id: str, indicator_id: str, series_id: str) -> str:
     return series_preamble(frame_id, indicator_id, series_id) + "_ser.setData([]);"
 
@@ -331,6 +451,33 @@ def change_series_type(
     return series_preamble(frame_id, indicator_id, series_id) + f"_ser.change_series_type({series_type}, {dump(data)});"
 
 
+def set_series_data_columnar(frame_id: str, indicator_id: str, series_id: str, data: DataFrame) -> str:
+    return (
+        series_preamble(frame_id, indicator_id, series_id)
+        + f"_ser.setData(decode_columnar({dump(columnar(data))}));"
+    )
+
+
+def prepend_series_data_columnar(frame_id: str, indicator_id: str, series_id: str, data: DataFrame) -> str:
+    return (
+        series_preamble(frame_id, indicator_id, series_id)
+        + f"_ser.prependData(decode_columnar({dump(columnar(data))}));"
+    )
+
+
+def change_series_type_columnar(
+    frame_id: str,
+    indicator_id: str,
+    series_id: str,
+    series_type: Enum,
+    data: DataFrame,
+) -> str:
+    return (
+        series_preamble(frame_id, indicator_id, series_id)
+        + f"_ser.change_series_type({series_type}, decode_columnar({dump(columnar(data))}));"
+    )
+
+
 def update_series_opts(frame_id: str, indicator_id: str, series_id: str, opts: object) -> str:
     return j_func.format(series_preamble(frame_id, indicator_id, series_id) + f"_ser.applyOptions({dump(opts)});")
 
@@ -451,6 +598,8 @@ VIEW_CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     # ---- Frame Commands ----
     JS_CMD.ADD_PANE: add_pane,
     JS_CMD.AUTOSCALE_TIME_AXIS: autoscale_time_axis,
+    JS_CMD.HOLD_VISIBLE_RANGE: hold_visible_range,
+    JS_CMD.RESTORE_VISIBLE_RANGE: restore_visible_range,
     JS_CMD.SET_WHITESPACE_DATA: set_whitespace_data,
     JS_CMD.CLEAR_WHITESPACE_DATA: clear_whitespace_data,
     JS_CMD.UPDATE_WHITESPACE_DATA: update_whitespace_data,
@@ -467,6 +616,7 @@ VIEW_CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     JS_CMD.ADD_SERIES: add_series,
     JS_CMD.REMOVE_SERIES: remove_series,
     JS_CMD.SET_SERIES_DATA: set_series_data,
+    JS_CMD.PREPEND_SERIES_DATA: prepend_series_data,
     JS_CMD.SET_LEGEND_LABEL: set_legend_label,
     JS_CMD.ADD_IND_PRIMITIVE: add_ind_primitive,
     JS_CMD.REMOVE_IND_PRIMITIVE: remove_ind_primitive,
@@ -500,3 +650,96 @@ VIEW_CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     JS_CMD.MINIMIZE: lambda_none,
     JS_CMD.LOAD_CSS: lambda_none,
 }
+
+# Bulk data commands that are replaced when a View uses the 'columnar' data transport
+COLUMNAR_CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
+    JS_CMD.SET_WHITESPACE_DATA: set_whitespace_data_columnar,
+    JS_CMD.SET_SERIES_DATA: set_series_data_columnar,
+    JS_CMD.PREPEND_SERIES_DATA: prepend_series_data_columnar,
+    JS_CMD.CHANGE_SERIES_TYPE: change_series_type_columnar,
+}
+
+
+def cmd_rolodex(transport: DataTransport = "json") -> dict[JS_CMD, Callable[..., str | None]]:
+    "Returns the VIEW_CMD_ROLODEX with bulk data commands formatted for the given transport"
+    if transport == "columnar":
+        return VIEW_CMD_ROLODEX | COLUMNAR_CMD_ROLODEX
+    return VIEW_CMD_ROLODEX
+
+
+# region ------------------------ Producer Side Encoding ------------------------ #
+
+# Commands that carry bulk data and are worth formatting outside of the View Process
+ENCODED_CMDS = {
+    JS_CMD.SET_SERIES_DATA,
+    JS_CMD.PREPEND_SERIES_DATA,
+    JS_CMD.CHANGE_SERIES_TYPE,
+    JS_CMD.SET_WHITESPACE_DATA,
+}
+
+
+def encode_cmd(msg: tuple, transport: DataTransport = "json") -> tuple:
+    "Format a Queue Message into a JS_CODE Message that only contains the javascript to evaluate"
+    cmd, *args = msg
+    return (JS_CMD.JS_CODE, cmd_rolodex(transport)[cmd](*args))
+
+
+class CmdEncoder:
+    """
+    Wraps the fwd_queue so that bulk data commands are formatted into javascript in the producing
+    process rather than in the View Process that also has to service the GUI.
+
+    When workers > 0, formatting is done by a process pool so multiple charts can be encoded in
+    parallel. Messages are always forwarded in the order they were given; any message put while an
+    earlier one is still being encoded waits behind it.
+    """
+
+    def __init__(self, queue: Any, transport: DataTransport = "json", workers: int = 0):
+        self.queue = queue
+        self._transport = transport
+        self._pool = ProcessPoolExecutor(workers) if workers > 0 else None
+        self._pending: deque[Future | tuple] = deque()
+        self._lock = Lock()
+
+    def put(self, msg: tuple):
+        "Queue a message, formatting it first if it contains bulk data."
+        if msg[0] in ENCODED_CMDS:
+            if self._pool is None:
+                msg = encode_cmd(msg, self._transport)
+            else:
+                future = self._pool.submit(encode_cmd, msg, self._transport)
+                with self._lock:
+                    self._pending.append(future)
+                future.add_done_callback(self._flush)
+                return
+
+        with self._lock:
+            if len(self._pending) > 0:
+                self._pending.append(msg)  # Can't overtake a message that is being encoded
+            else:
+                self.queue.put(msg)
+
+    def _flush(self, *_):
+        "Forward all messages at the front of the line that are ready to be sent."
+        with self._lock:
+            while len(self._pending) > 0:
+                item = self._pending[0]
+                if isinstance(item, Future):
+                    if not item.done():
+                        return
+                    try:
+                        item = item.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error("Failed to encode command: %s", e)
+                        self._pending.popleft()
+                        continue
+                self._pending.popleft()
+                self.queue.put(item)
+
+    def close(self):
+        "Shutdown the encoding pool"
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# endregion
@@ -6,9 +6,10 @@ Docs: https://tradingview.github.io/lightweight-charts/docs/api/interfaces/ISeri
 """
 
 from __future__ import annotations
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
+from datetime import timezone
 from enum import IntEnum, auto
-from inspect import signature
+from functools import cache
 import logging
 from typing import Any, Dict, Literal, Optional, Self, TypeAlias
 
@@ -122,11 +123,34 @@ class SeriesType(IntEnum):
     @property
     def params(self) -> set:
         "A set of the Parameters that compose this Series Type"
-        return set(signature(self.cls).parameters.keys())
+        return set(_field_names(self.cls))
 
 
 AnyBasicSeriesType = Literal[SeriesType.WhitespaceData, SeriesType.SingleValueData, SeriesType.OHLC_Data]
 
+# region ---------------------------------- Dataclass Codecs ---------------------------------- #
+
+# from_dict() & as_dict() are called several times per realtime update. Instead of inspecting the
+# dataclass on every call, the field names of each class are resolved once and then cached.
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    "Names of the init parameters of a dataclass in definition order"
+    return tuple(f.name for f in fields(cls) if f.init)
+
+
+@cache
+def _field_set(cls: type) -> frozenset[str]:
+    return frozenset(_field_names(cls))
+
+
+def _drop_nones(items) -> dict:
+    return {k: v for (k, v) in items if v is not None}
+
+
+# endregion
+
 
 # region ---------------------------------- Series Data Types ---------------------------------- #
 
@@ -148,6 +172,8 @@ class WhitespaceData:
     # a TS/JS LWC Plugin through the series.data() call
 
     def __post_init__(self):  # Ensure Consistent Time Format (UTC, TZ Aware).
+        if type(self.time) is pd.Timestamp and self.time.tzinfo is timezone.utc:
+            return  # Already formatted, e.g. a bar copied from another dataclass
         self.time = pd.Timestamp(self.time)
         if self.time.tzinfo is not None:
             self.time = self.time.tz_convert("UTC")
@@ -157,12 +183,14 @@ class WhitespaceData:
     @property
     def as_dict(self) -> dict:
         "The Object in dictionary form with 'Nones' Dropped."
-        return asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})  # Drop Nones
+        if self.custom_values is not None:
+            return asdict(self, dict_factory=_drop_nones)  # Deep copies the custom values
+        return {k: v for k in _field_names(type(self)) if (v := getattr(self, k)) is not None}
 
     @classmethod
     def from_dict(cls, obj: dict) -> Self:
         "Create an instance from a dict ignoring extraneous params"
-        params = signature(cls).parameters
+        params = _field_set(cls)
         return cls(**{k: v for k, v in obj.items() if k in params})
 
 
@@ -318,10 +346,7 @@ class ArgMap:
     @property
     def as_dict(self) -> Dict[str, str]:
         "Object as a dict with Nones and equivalent kv pairs (e.g. 'value' == 'value') dropped"
-        return asdict(
-            self,
-            dict_factory=lambda x: {k: v for (k, v) in x if v is not None and k != v},
-        )
+        return {k: v for k in _field_names(type(self)) if (v := getattr(self, k)) is not None and k != v}
 
 
 class BarArgMap(ArgMap):
@@ -363,6 +363,9 @@ class TF:
     def __eq__(self, other: Self):
         return self.unix_len == other.unix_len
 
+    def __hash__(self) -> int:
+        return hash(self.unix_len)
+
     def __neq__(self, other: Self):
         return self.unix_len != other.unix_len
 
@@ -27,12 +27,13 @@ class PY_CMD(IntEnum):
 
     TIMESERIES_REQUEST = auto()
     INDICATOR_REQUEST = auto()
-    # RANGE_CHANGE = auto() # Maybe?
+    VISIBLE_RANGE_CHANGE = auto()
     SERIES_CHANGE = auto()
     LAYOUT_CHANGE = auto()
     ADD_INDICATOR = auto()
     SET_INDICATOR_OPTS = auto()
     UPDATE_SERIES_OPTS = auto()
+    DATA_ACK = auto()
 
 
 # region --------------------- Return Queue CMD Rolodex --------------------- #
@@ -86,6 +87,16 @@ def update_series_opts(window: "win.Window", c_id, f_id, i_id, s_id, opts):
         frame.indicators[i_id]._series[s_id].__sync_options__(opts)
 
 
+def visible_range_change(window: "win.Window", c_id, f_id, _from, _to, width=None):
+    frame = window.get_container(c_id).frames[f_id]
+    if isinstance(frame, win.ChartingFrame):
+        frame.__visible_range_change__(_from, _to, width)
+
+
+def data_ack(window: "win.Window", token):
+    window.__data_ack__(token)
+
+
 def add_container(window: "win.Window"):
     window.new_tab()
 
@@ -108,10 +119,12 @@ WIN_CMD_ROLODEX = {
     PY_CMD.SYMBOL_SEARCH: symbol_search,
     PY_CMD.TIMESERIES_REQUEST: request_timeseries,
     PY_CMD.INDICATOR_REQUEST: request_indicator,
+    PY_CMD.VISIBLE_RANGE_CHANGE: visible_range_change,
     PY_CMD.LAYOUT_CHANGE: layout_change,
     PY_CMD.SERIES_CHANGE: series_change,
     PY_CMD.SET_INDICATOR_OPTS: set_indicator_opts,
     PY_CMD.UPDATE_SERIES_OPTS: update_series_opts,
+    PY_CMD.DATA_ACK: data_ack,
     PY_CMD.ADD_CONTAINER: add_container,
     PY_CMD.REMOVE_CONTAINER: remove_container,
     PY_CMD.REMOVE_FRAME: remove_frame,
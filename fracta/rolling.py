@@ -0,0 +1,321 @@
+"""
+Streaming Statistics that can be held as Indicator state.
+
+Each statistic is seeded from the vectorized history in an Indicator's set_data() and then updated
+in O(1) on each call to update_data(). Updates can either revise the most recent value, e.g. an
+intra-bar tick, or append a new value when a new bar opens.
+
+NaN inputs are handled like pandas: Window statistics return NaN while a NaN is within the window
+and the exponential averages hold their previous value.
+"""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import deque
+from math import isnan, nan, sqrt
+
+import numpy as np
+import pandas as pd
+
+
+class StreamingStat(ABC):
+    "Abstract Base Class for a statistic that is calculated one value at a time."
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"{self.__class__.__name__} period must be >= 1. Given {period}")
+        self.period = period
+        self.value = nan
+
+    @abstractmethod
+    def seed(self, data: pd.Series) -> pd.Series:
+        "Calculate the statistic over the history, vectorized, and load the state needed to continue it"
+
+    @abstractmethod
+    def update(self, x: float, new_bar: bool = True) -> float:
+        "Append a new value, or revise the last one when new_bar is False. Returns the new statistic."
+
+
+# region --------------------------- Window Statistics --------------------------- #
+
+
+class _RollingWindow(StreamingStat, ABC):
+    "Abstract Base for statistics over the last 'period' values. Holds the raw window & its NaN count."
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._window: deque[float] = deque()
+        self._nans = 0
+
+    @abstractmethod
+    def seed(self, data: pd.Series) -> pd.Series:
+        "See StreamingStat.seed()"
+
+    @abstractmethod
+    def update(self, x: float, new_bar: bool = True) -> float:
+        "See StreamingStat.update()"
+
+    def _push(self, x: float, new_bar: bool) -> float:
+        "Place x into the window. Returns the value that was removed from the window, or NaN if none"
+        removed = nan
+        if new_bar or len(self._window) == 0:
+            self._window.append(x)
+            self._nans += isnan(x)
+            if len(self._window) > self.period:
+                removed = self._window.popleft()
+                self._nans -= isnan(removed)
+        else:
+            removed = self._window[-1]
+            self._window[-1] = x
+            self._nans += isnan(x) - isnan(removed)
+        return removed
+
+    @property
+    def ready(self) -> bool:
+        "True when the window is full and contains no NaNs"
+        return len(self._window) == self.period and self._nans == 0
+
+    def _load(self, data: pd.Series):
+        self._window = deque(data.iloc[-self.period :].to_numpy(dtype="float64").tolist())
+        self._nans = sum(isnan(x) for x in self._window)
+
+
+class RollingSum(_RollingWindow):
+    """
+    Sum of the last 'period' values. Returns NaN until the window is full.
+
+    The running sum is re-calculated from the window every RESUM updates so floating point
+    error can't accumulate.
+    """
+
+    RESUM = 4096
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._sum = 0.0
+        self._count = 0
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        self._load(data)
+        self._resum()
+        rtn = data.rolling(window=self.period).sum()
+        self.value = self._output()
+        return rtn
+
+    def update(self, x: float, new_bar: bool = True) -> float:
+        removed = self._push(x, new_bar)
+        self._count += 1
+        if self._count >= self.RESUM or self._nans > 0:
+            self._resum()
+        else:
+            self._sum += (0.0 if isnan(x) else x) - (0.0 if isnan(removed) else removed)
+        self.value = self._output()
+        return self.value
+
+    def _resum(self):
+        self._sum = float(np.nansum(np.fromiter(self._window, dtype="float64", count=len(self._window))))
+        self._count = 0
+
+    def _output(self) -> float:
+        return self._sum if self.ready else nan
+
+
+class RollingMean(RollingSum):
+    "Simple Moving Average of the last 'period' values. Returns NaN until the window is full."
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        super().seed(data)
+        return data.rolling(window=self.period).mean()
+
+    def _output(self) -> float:
+        return self._sum / self.period if self.ready else nan
+
+
+class RollingStd(_RollingWindow):
+    """
+    Standard Deviation of the last 'period' values from a running sum & sum of squares.
+    ddof=0 is the population deviation, matching TradingView's ta.stdev(), ddof=1 matches pandas.
+    """
+
+    def __init__(self, period: int, ddof: int = 0):
+        super().__init__(period)
+        if period - ddof < 1:
+            raise ValueError(f"RollingStd period must be greater than ddof. Given {period} & {ddof}")
+        self.ddof = ddof
+        self._sum = RollingSum(period)
+        self._sq_sum = RollingSum(period)
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        self._load(data)
+        self._sum.seed(data)
+        self._sq_sum.seed(data * data)
+        self.value = self._output()
+        return data.rolling(window=self.period).std(ddof=self.ddof)
+
+    def update(self, x: float, new_bar: bool = True) -> float:
+        self._push(x, new_bar)
+        self._sum.update(x, new_bar)
+        self._sq_sum.update(x * x, new_bar)
+        self.value = self._output()
+        return self.value
+
+    def _output(self) -> float:
+        if not self.ready:
+            return nan
+        n = self.period
+        var = (self._sq_sum.value - self._sum.value * self._sum.value / n) / (n - self.ddof)
+        return sqrt(var) if var > 0 else 0.0
+
+
+class RollingMax(_RollingWindow):
+    """
+    Maximum of the last 'period' values using a monotonic deque of (index, value) pairs.
+
+    Appending is amortized O(1). Revising the last value restores the entries that its previous
+    value evicted, so the cost of a revision is proportional to that number of entries.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._mono: deque[tuple[int, float]] = deque()
+        self._evicted: list[tuple[int, float]] = []
+        self._index = -1
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new >= old
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        self._mono.clear()
+        self._evicted = []
+        self._index = -1
+        self._window.clear()
+        self._nans = 0
+        for x in data.iloc[-self.period :].to_numpy(dtype="float64").tolist():
+            self.update(x)
+        return self._seed(data.rolling(window=self.period))
+
+    def _seed(self, rolling) -> pd.Series:
+        return rolling.max()
+
+    def update(self, x: float, new_bar: bool = True) -> float:
+        if new_bar or self._index < 0:
+            self._index += 1
+            self._evicted = []
+        else:
+            # Undo the previous value of this bar before inserting the revision
+            if len(self._mono) > 0 and self._mono[-1][0] == self._index:
+                self._mono.pop()
+            self._mono.extend(self._evicted)
+            self._evicted = []
+        self._push(x, new_bar)
+
+        # Expire the front of the deque. Independent of x so this never needs to be undone.
+        while len(self._mono) > 0 and self._mono[0][0] <= self._index - self.period:
+            self._mono.popleft()
+
+        if not isnan(x):
+            evicted = []
+            while len(self._mono) > 0 and self._dominates(x, self._mono[-1][1]):
+                evicted.append(self._mono.pop())
+            evicted.reverse()
+            self._evicted = evicted
+            self._mono.append((self._index, x))
+
+        self.value = self._mono[0][1] if self.ready else nan
+        return self.value
+
+
+class RollingMin(RollingMax):
+    "Minimum of the last 'period' values using a monotonic deque of (index, value) pairs."
+
+    def _dominates(self, new: float, old: float) -> bool:
+        return new <= old
+
+    def _seed(self, rolling) -> pd.Series:
+        return rolling.min()
+
+
+# endregion
+
+# region --------------------------- Exponential Averages --------------------------- #
+
+
+class EMA(StreamingStat):
+    """
+    Exponential Moving Average with a smoothing factor of 2 / (period + 1).
+    Matches TradingView's ta.ema(). The first value of the series seeds the average.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.alpha = self._alpha(period)
+        self._prev = nan  # Value of the average before the most recent input was applied
+
+    @staticmethod
+    def _alpha(period: int) -> float:
+        return 2 / (period + 1)
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        rtn = data.ewm(alpha=self.alpha, adjust=False, ignore_na=True).mean()
+        self.value = float(rtn.iloc[-1]) if len(rtn) > 0 else nan
+        self._prev = float(rtn.iloc[-2]) if len(rtn) > 1 else nan
+        return rtn
+
+    def update(self, x: float, new_bar: bool = True) -> float:
+        if new_bar:
+            self._prev = self.value
+        if isnan(x):
+            self.value = self._prev
+        elif isnan(self._prev):
+            self.value = x
+        else:
+            self.value = self.alpha * x + (1 - self.alpha) * self._prev
+        return self.value
+
+
+class RMA(EMA):
+    """
+    Wilder's Moving Average with a smoothing factor of 1 / period. Matches TradingView's ta.rma().
+    The average is seeded by the Simple Moving Average of the first 'period' values.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._warmup = RollingMean(period)
+        self._count = 0
+
+    @staticmethod
+    def _alpha(period: int) -> float:
+        return 1 / period
+
+    def seed(self, data: pd.Series) -> pd.Series:
+        values = data.to_numpy(dtype="float64", copy=True)
+        self._count = len(values)
+        if self._count < self.period:
+            self._warmup.seed(data)
+            self.value = self._prev = nan
+            return pd.Series(nan, index=data.index)
+
+        values[self.period - 1] = np.mean(values[: self.period])
+        values[: self.period - 1] = nan
+        rtn = super().seed(pd.Series(values, index=data.index))
+        if self._count == self.period:
+            self._warmup.seed(data)  # The seed bar may still be revised
+        return rtn
+
+    def update(self, x: float, new_bar: bool = True) -> float:
+        if new_bar:
+            self._count += 1
+        if self._count < self.period:
+            self._warmup.update(x, new_bar)
+            self.value = self._prev = nan
+        elif self._count == self.period:
+            # The bar that completes the warm-up window seeds the average with its SMA
+            self.value = self._warmup.update(x, new_bar)
+            self._prev = nan
+        else:
+            super().update(x, new_bar)
+        return self.value
+
+
+# endregion
@@ -7,10 +7,13 @@ Docs: https://tradingview.github.io/lightweight-charts/docs/api/interfaces/ISeri
 
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
-from weakref import ref
-from typing import Any, Literal, Optional, TYPE_CHECKING
+from inspect import ismethod
+from weakref import ref, WeakMethod
+from typing import Any, Callable, Iterator, Literal, Optional, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype
 
@@ -19,6 +22,7 @@ from .util import ID_Dict
 
 from .js_cmd import JS_CMD
 from . import dataframe_ext as df_ext
+from . import decimation
 from .orm import series_data as sd
 
 # pylint: disable = unused-import
@@ -48,6 +52,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("fracta_log")
 
+# Data that can be displayed by a Series, or a Callable that returns the current copy of that data
+DisplayData = df_ext.Series_DF | pd.DataFrame | pd.Series
+DataSource = DisplayData | Callable[[], DisplayData]
+
 
 # region --------------------------- Marker and Priceline Objs --------------------------- #
 # pylint: disable = invalid-name
@@ -152,6 +160,110 @@ class PriceLine:
 # pylint: enable = invalid-name
 # endregion
 
+# region --------------------------- Transfer Projection --------------------------- #
+
+
+@lru_cache(maxsize=256)
+def _transfer_projection(
+    series_type: sd.SeriesType, value_map: tuple[tuple[str, str], ...], columns: tuple
+) -> tuple[tuple[str, Any], ...]:
+    """
+    The (transferred name, source column) pairs that a series type displays from a set of source
+    columns. Source columns that are renamed onto an existing column take the place of that column.
+    """
+    valid_keys = series_type.params.difference({"volume", "time"})
+    v_map = dict(value_map)
+    rename_dict = dict(
+        [
+            (v_map[key], key)
+            for key in valid_keys.intersection(v_map.keys())
+            if key != v_map[key] and v_map[key] in columns
+        ]
+    )
+    conflict_keys = set(rename_dict.values()).intersection(columns)
+    return tuple(
+        (rename_dict.get(col, col), col)
+        for col in columns
+        if col not in conflict_keys and rename_dict.get(col, col) in valid_keys
+    )
+
+
+def _time_slice(data: pd.DataFrame, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """
+    Returns the rows of the data with a time in the range [start, end). A bound of None is unlimited.
+    Data that cannot be sliced by time is returned in full.
+    """
+    if start is None and end is None:
+        return data
+    if "time" in data.columns:
+        if not is_datetime64_any_dtype(data["time"]):
+            return data
+        times = pd.to_datetime(data["time"], utc=True)
+    elif is_datetime64_any_dtype(data.index):
+        times = pd.to_datetime(data.index, utc=True)
+    else:
+        return data
+
+    keep = np.full(len(data), True)
+    if start is not None:
+        keep &= np.asarray(times >= start)
+    if end is not None:
+        keep &= np.asarray(times < end)
+    return data[keep]
+
+
+def _epoch_seconds(times: pd.Series | pd.DatetimeIndex) -> np.ndarray:
+    "Unix Epoch seconds of the given times (confirmed working w/ pre Jan 1, 1970 dates)"
+    return pd.DatetimeIndex(times).as_unit("ns").asi8 / 10**9
+
+
+def transfer_dataframe(
+    data: DisplayData,
+    series_type: sd.SeriesType,
+    value_map: Optional[dict[str, str]] = None,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Creates the formatted Dataframe that a series of the given type displays from a
+    Series/Series_DF/DataFrame object. This formatted dataframe:
+
+    - Renames the columns to OHLC / value as needed, through the value_map.
+    - Drops all unnecessary columns and rows, including those outside of the range [start, end)
+    - Formats the timestamp as a Unix Epoch Integer (in seconds)
+
+    This is the smallest form factor dataset that is optimized for transfer over a
+    multiprocessor Queue. The source data is not copied, every column other than 'time' is a
+    view of the source data, and a Series_DF's 'time' column is shared by all of its Series.
+    """
+    # Format 'data' to a dataframe called '_df' (A reference) and the Epoch times of its rows
+    if isinstance(data, df_ext.Series_DF):
+        _df = data.df
+        first = 0 if start is None else int(_df.index.searchsorted(start))
+        last = len(_df) if end is None else int(_df.index.searchsorted(end))
+        _df, epoch = _df.iloc[first:last], data.epoch_seconds[first:last]
+    else:
+        if isinstance(data, pd.Series):
+            if not is_datetime64_any_dtype(data.index):
+                raise AttributeError("Pandas Series must have a datetimeindex to be displayed.")
+            data = pd.DataFrame({"value": data.to_numpy()}, index=data.index, copy=False)
+        _df = _time_slice(data, start, end)
+        if "time" in _df.columns:
+            epoch = _epoch_seconds(_df["time"])
+        elif is_datetime64_any_dtype(_df.index):
+            epoch = _epoch_seconds(_df.index)
+        else:
+            raise AttributeError("Cannot Display Series_Common Data. Need a 'time' index or column")
+
+    # Rename the Columns based on the display type and the rename map
+    value_items = tuple(value_map.items()) if value_map is not None else ()
+    projection = _transfer_projection(series_type, value_items, tuple(_df.columns))
+    columns = {key: _df[col].to_numpy() for key, col in projection}
+    return pd.DataFrame({"time": epoch, **columns}, copy=False)
+
+
+# endregion
+
 
 class SeriesCommon:
     """
@@ -159,7 +271,8 @@ class SeriesCommon:
     direct access to a lightweight-charts ISeriesAPI Object. This Object is mutable between
     all of the series types.
 
-    This object does not store a copy of the dataset given.
+    This object does not store a copy of the dataset given. It keeps a reference to the last data
+    source given so that older bars can be sent when the displayed range of its parent Frame grows.
 
     Docs: https://tradingview.github.io/lightweight-charts/docs/api/interfaces/ISeriesApi
     """
@@ -211,8 +324,17 @@ class SeriesCommon:
 
         # Make _series reference a Weakref since this is a child obj.
         self._parent_series = ref(indicator._series)
+        self._parent_frame = ref(indicator.parent_frame)
         self._fwd_queue = indicator._fwd_queue
 
+        # Reference to the last data source given so it can be re-read as more bars are displayed.
+        # Bound methods are held by a WeakMethod so the series doesn't keep its indicator alive.
+        self._data_src: Optional[DataSource | WeakMethod] = None
+        # Token of the Window stream that is prepending older bars to the last dataset sent
+        self._stream: Optional[int] = None
+        # Last bucket of the dataset sent when the parent frame is decimating bars, see decimation.py
+        self._last_bucket: Optional[decimation.LastBucket] = None
+
         self._fwd_queue.put((JS_CMD.ADD_SERIES, *self._ids, self._series_type, name))
         self.apply_options(self._options)
 
@@ -223,6 +345,7 @@ class SeriesCommon:
         "Remove the Object from the screen"
         if (parent_dict := self._parent_series()) is not None:
             parent_dict.pop(self._js_id)  # Ensure all references are gone
+        self._cancel_stream_()
         self._fwd_queue.put((JS_CMD.REMOVE_SERIES, *self._ids))
 
     @property
@@ -261,79 +384,150 @@ class SeriesCommon:
 
     def _to_transfer_dataframe_(
         self,
-        data: df_ext.Series_DF | pd.DataFrame | pd.Series,
+        data: DisplayData,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
     ) -> pd.DataFrame:
-        """
-        Creates a formatted Dataframe from a Series/Series_DF/DataFrame object.
-        This formatted dataframe:
-
-        - Renames the columns to OHLC / value as needed.
-        - Drops all unnecessary columns and rows
-        - Formats the timestamp as a Unix Epoch Integer (in seconds)
-
-        This is the smallest form factor dataset that is optimized for transfer over a
-        multiprocessor Queue.
-        """
-        # Format 'data' to a dataframe called '_df' (A reference)
-        if isinstance(data, df_ext.Series_DF):
-            _df = data.df
-        elif isinstance(data, pd.DataFrame):
-            _df = data
-        else:
-            if not is_datetime64_any_dtype(data.index):
-                raise AttributeError("Pandas Series must have a datetimeindex to be displayed.")
-            _df = data.rename("value")
-            _df.index.set_names("time", inplace=True)
-            _df = _df.reset_index()
-
-        # Rename the Columns based on the display type and the rename map
-        valid_keys = self._series_type.params.difference({"volume"})
-        rename_keys = valid_keys.intersection(self._value_map.keys())
-        rename_dict = dict(
-            [
-                (self._value_map[key], key)
-                for key in rename_keys
-                if key != self._value_map[key] and self._value_map[key] in _df.columns
-            ]
-        )
-        conflict_keys = list(set(rename_dict.values()).intersection(_df.columns))
-
-        # Turn (Reference) _df into new instance tmp_df with columns renamed as needed.
-        tmp_df = _df.drop(columns=conflict_keys).rename(columns=rename_dict)
-
-        # Drop Unused Data
-        unused_cols = list(set(tmp_df.columns).difference(valid_keys))
-        tmp_df.drop(columns=unused_cols, inplace=True)
+        "The transfer_dataframe() of the given data, with rows in the range [start, end), as this series displays it"
+        xfer_df = transfer_dataframe(data, self._series_type, self._value_map, start, end)
 
         # Need at least one of the following to display anything on the screen
-        if len(set(tmp_df.columns).intersection({"value", "close"})) == 0:
+        if "value" not in xfer_df.columns and "close" not in xfer_df.columns:
             logger.warning(
                 "Series %s of type %s doesn't know what to display!",
                 self._ids,
                 self._series_type,
             )
+        return xfer_df
+
+    def _display_start_(self) -> Optional[pd.Timestamp]:
+        "Time of the first bar within the displayed range of the parent frame, if it's limited"
+        frame = self._parent_frame()
+        return frame.display_start if frame is not None else None
+
+    def _decimate_(self, xfer_df: pd.DataFrame) -> pd.DataFrame:
+        "Merge the rows of a transfer dataframe into the decimation buckets of the parent frame, if any"
+        frame = self._parent_frame()
+        span = frame.decimation_span if frame is not None else None
+        self._last_bucket = None
+        if span is None or len(xfer_df) == 0:
+            return xfer_df
+
+        if self._series_ohlc_derived:
+            mode = "ohlc"
+        elif self._value_map.get("value") in decimation.SUMMED_COLUMNS:
+            mode = "sum"
+        else:
+            mode = "extremes"
+
+        if mode != "extremes":
+            self._last_bucket = decimation.LastBucket(xfer_df, span, mode)
+        return decimation.decimate(xfer_df, span, mode)
+
+    def _decimating_(self) -> bool:
+        "Check if the parent frame is merging displayed bars into decimation buckets"
+        frame = self._parent_frame()
+        return frame is not None and frame.decimation_span is not None
+
+    def _hold_source_(self, data: DataSource) -> DisplayData:
+        "Keep a reference to the given data source and return its current dataset"
+        self._data_src = WeakMethod(data) if ismethod(data) else data
+        return data() if callable(data) else data
+
+    def _current_data_(self) -> Optional[DisplayData]:
+        "The current dataset of the last data source given"
+        src = self._data_src
+        if isinstance(src, WeakMethod) and (src := src()) is None:
+            return None
+        return src() if callable(src) else src
+
+    def _cancel_stream_(self):
+        "Stop prepending the older bars of the last dataset sent"
+        if self._stream is not None and (frame := self._parent_frame()) is not None:
+            frame.window.__cancel_stream__(self._stream)
+        self._stream = None
+
+    def _streaming_(self) -> bool:
+        "Check if the older bars of the last dataset sent are still being prepended"
+        frame = self._parent_frame()
+        return self._stream is not None and frame is not None and frame.window.__streaming__(self._stream)
+
+    def _send_transfer_(self, cmd: JS_CMD, xfer_df: pd.DataFrame, *args):
+        """
+        Forward a dataset to the screen. When the Window sets a series_chunk_size and the dataset is
+        larger than it, only the most recent chunk is sent immediately. The older bars are streamed
+        after it, newest first, so the latest bars are drawn without waiting on the whole dataset.
+        """
+        self._cancel_stream_()
+        frame = self._parent_frame()
+        chunk_size = frame.window.series_chunk_size if frame is not None else None
+        if chunk_size is None or len(xfer_df) <= chunk_size:
+            self._fwd_queue.put((cmd, *self._ids, *args, xfer_df))
+            return
 
-        # Ensure 'Time' is a column
-        if "time" not in tmp_df.columns:
-            if is_datetime64_any_dtype(tmp_df.index):
-                tmp_df.index.set_names("time", inplace=True)
-                tmp_df.reset_index(inplace=True)
-            else:
-                raise AttributeError("Cannot Display Series_Common Data. Need a 'time' index or column")
-
-        # Convert pd.Timestamp to Unix Epoch time (confirmed working w/ pre Jan 1, 1970 dates)
-        tmp_df["time"] = tmp_df["time"].astype("int64") / 10**9
+        split = len(xfer_df) - chunk_size
+        self._fwd_queue.put((cmd, *self._ids, *args, xfer_df.iloc[split:]))
+        self._stream = frame.window.__stream__(self._prepend_chunks_(xfer_df.iloc[:split], chunk_size))
 
-        return tmp_df
+    def _prepend_chunks_(self, xfer_df: pd.DataFrame, chunk_size: int) -> Iterator[tuple]:
+        """
+        PREPEND_SERIES_DATA messages of the given bars, newest first. The View places each chunk in
+        front of the displayed data as it arrives, which re-sets the whole series on screen. Chunks
+        double in size so the work of all of those re-sets stays proportional to the dataset's length.
+        """
+        end, size = len(xfer_df), chunk_size
+        while end > 0:
+            size *= 2
+            start = max(0, end - size)
+            yield (JS_CMD.PREPEND_SERIES_DATA, *self._ids, xfer_df.iloc[start:end])
+            end = start
+
+    def set_data(self, data: DataSource):
+        """
+        Sets the Data of the Series to the given data set. All irrlevant data is ignored.
 
-    def set_data(self, data: df_ext.Series_DF | pd.DataFrame | pd.Series):
-        "Sets the Data of the Series to the given data set. All irrlevant data is ignored"
+        When given a Callable it is called again each time the parent Frame's displayed range
+        changes so that the older bars that are sent include any updates made since it was set.
+        """
+        data = self._hold_source_(data)
         # Set display type so data.json() only passes relevant information
-        xfer_df = self._to_transfer_dataframe_(data)
-        self._fwd_queue.put((JS_CMD.SET_SERIES_DATA, *self._ids, xfer_df))
+        xfer_df = self._decimate_(self._to_transfer_dataframe_(data, self._display_start_()))
+        self._send_transfer_(JS_CMD.SET_SERIES_DATA, xfer_df)
+
+    def __display_range_change__(self, prev_start: Optional[pd.Timestamp] = None):
+        """
+        Update the displayed data to reflect the parent Frame's displayed range. prev_start is the
+        first displayed time before the change, None if all bars were displayed. When the range only
+        grew to include older bars, only those bars are sent and placed in front of the current data.
+        """
+        if (data := self._current_data_()) is None:
+            return
+        start = self._display_start_()
+        if start == prev_start:
+            return
+
+        grew = prev_start is not None and (start is None or start < prev_start)
+        if grew and not self._streaming_() and not self._decimating_():
+            xfer_df = self._to_transfer_dataframe_(data, start, prev_start)
+            if len(xfer_df) > 0:
+                self._fwd_queue.put((JS_CMD.PREPEND_SERIES_DATA, *self._ids, xfer_df))
+        else:
+            # The displayed range shrunk, older bars are still being streamed to the screen in front
+            # of the displayed data, or the displayed bars are decimated. Everything must be re-sent.
+            xfer_df = self._decimate_(self._to_transfer_dataframe_(data, start))
+            self._send_transfer_(JS_CMD.SET_SERIES_DATA, xfer_df)
+
+    def __decimation_change__(self):
+        "Re-send the displayed data so it reflects the parent Frame's decimation span"
+        if (data := self._current_data_()) is not None:
+            xfer_df = self._decimate_(self._to_transfer_dataframe_(data, self._display_start_()))
+            self._send_transfer_(JS_CMD.SET_SERIES_DATA, xfer_df)
 
     def clear_data(self):
         "Remove All displayed Data. This does not remove/delete the Series Object."
+        self._data_src = None
+        self._last_bucket = None
+        self._cancel_stream_()
         self._fwd_queue.put((JS_CMD.CLEAR_SERIES_DATA, *self._ids))
         self.remove_all_markers()
         self.remove_all_pricelines()
@@ -350,6 +544,8 @@ class SeriesCommon:
             elif "close" in data_dict:
                 data_dict["value"] = data_dict["close"]
             data = self._series_data_cls.from_dict(data_dict)
+        if self._last_bucket is not None:
+            data = self._last_bucket.merge(data)
 
         self._fwd_queue.put((JS_CMD.UPDATE_SERIES_DATA, *self._ids, data))
 
@@ -379,22 +575,17 @@ class SeriesCommon:
     def change_series_type(
         self,
         series_type: sd.SeriesType,
-        data: df_ext.Series_DF | pd.DataFrame | pd.Series,
+        data: DataSource,
     ):
         "Change the type of Series object that is displayed on the screen."
         # Set display type so data.json() only passes relevant information
         self._series_type = self._series_type_check_(series_type)
         self._series_data_cls = self._series_type.cls
         self._series_ohlc_derived = sd.SeriesType.OHLC_Derived(self._series_type)
+        data = self._hold_source_(data)
 
-        self._fwd_queue.put(
-            (
-                JS_CMD.CHANGE_SERIES_TYPE,
-                *self._ids,
-                series_type,
-                self._to_transfer_dataframe_(data),
-            )
-        )
+        xfer_df = self._decimate_(self._to_transfer_dataframe_(data, self._display_start_()))
+        self._send_transfer_(JS_CMD.CHANGE_SERIES_TYPE, xfer_df, series_type)
 
     # TODO: Multi-pane implementation
     # def change_pane(self, new_pane: str): ...
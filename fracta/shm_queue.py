@@ -0,0 +1,190 @@
+"""
+Shared Memory, Single-Producer / Single-Consumer, Command Queue.
+
+A drop-in replacement for the mp.Queue that forwards JS_CMDs to the View Process. Small command
+headers are still sent through a pipe, but large payloads (DataFrames and long strings) are written
+as raw buffers into a shared memory ring so they are never pickled.
+"""
+
+from __future__ import annotations
+import logging
+import multiprocessing as mp
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("fracta_log")
+
+# Indices of the ring's int64 counters at the start of the shared memory block
+_HEAD = 0  # Total bytes ever reserved by the producer. Only written by the producer.
+_TAIL = 1  # Total bytes ever released by the consumer. Only written by the consumer.
+_DATA = 64  # Byte offset of the data region. Counters are padded to their own cache line.
+_ALIGN = 8
+
+
+@dataclass(slots=True)
+class _RingRef:
+    "Header placeholder for a payload that was written into the shared memory ring."
+
+    start: int  # Absolute (un-wrapped) position of the payload within the ring
+    end: int  # Absolute position of the end of the payload within the ring
+    kind: str  # "df" or "str"
+    meta: Any  # DataFrame: (index_start, length, list[(column, dtype_str, offset, nbytes, tz)]), str: nbytes
+
+
+class ShmQueue:
+    """
+    A lock-free, single-producer / single-consumer, ring buffer in shared memory that implements
+    the subset of the mp.Queue interface used by the fwd_queue: put(), get(), and empty().
+
+    Each message is a tuple. Any DataFrame with a unit step RangeIndex (including slices of one) &
+    numeric / datetime columns, or string longer than 'threshold' bytes, within the tuple is
+    written into the ring. The remainder of the tuple, the header, is sent through an mp.Queue.
+    Since the header is sent after the payload is written, the consumer is guaranteed to see the
+    complete payload when the header arrives.
+
+    The producer only writes the 'head' counter and the consumer only writes the 'tail' counter, so
+    no lock is needed. If a payload cannot currently fit in the ring it is sent through the pipe.
+    """
+
+    def __init__(self, size: int = 64 * 2**20, threshold: int = 16 * 2**10):
+        self._shm = SharedMemory(create=True, size=_DATA + size)
+        self._owner = True
+        self._size = size
+        self._threshold = threshold
+        self._headers: mp.Queue = mp.Queue()
+        self._bind()
+        self._counters[:] = 0
+
+    def __getstate__(self):
+        # Only sent to the consumer process when it is spawned.
+        return {
+            "name": self._shm.name,
+            "size": self._size,
+            "threshold": self._threshold,
+            "headers": self._headers,
+        }
+
+    def __setstate__(self, state):
+        self._shm = SharedMemory(name=state["name"])
+        # The Producer owns the block. Don't let this process' resource tracker unlink it on exit.
+        try:
+            resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore
+        except (AttributeError, KeyError):
+            pass
+        self._owner = False
+        self._size = state["size"]
+        self._threshold = state["threshold"]
+        self._headers = state["headers"]
+        self._bind()
+
+    def _bind(self):
+        buf = self._shm.buf
+        self._counters = np.ndarray((2,), dtype=np.int64, buffer=buf[:16])  # type: ignore
+        self._data = np.ndarray((self._size,), dtype=np.uint8, buffer=buf[_DATA:])  # type: ignore
+
+    @property
+    def closed(self) -> bool:
+        "True once close() has been called. Messages put afterwards are sent through the pipe."
+        return self._data is None
+
+    def close(self):
+        "Release the shared memory. The block is destroyed when closed by the producer."
+        if self.closed:
+            return
+        self._counters = self._data = None  # type: ignore # Release buffer exports before closing
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    # region --------- Producer --------- #
+
+    def put(self, msg: tuple):
+        "Queue a message. Large payloads within the message are written into shared memory."
+        self._headers.put(tuple(self._encode(arg) for arg in msg))
+
+    def _encode(self, arg: Any) -> Any:
+        if self.closed:
+            return arg
+        if isinstance(arg, pd.DataFrame) and isinstance(arg.index, pd.RangeIndex) and arg.index.step == 1:
+            return self._encode_df(arg)
+        if isinstance(arg, str) and len(arg) > self._threshold:
+            data = np.frombuffer(arg.encode("utf-8"), dtype=np.uint8)
+            if (ref := self._reserve(len(data))) is not None:
+                self._data[ref[0] : ref[0] + len(data)] = data
+                return _RingRef(ref[1], ref[2], "str", len(data))
+        return arg
+
+    def _encode_df(self, df: pd.DataFrame) -> Any:
+        columns, arrays, offset = [], [], 0
+        for name, col in df.items():
+            tz = None
+            if isinstance(col.dtype, pd.DatetimeTZDtype):
+                tz = str(col.dtype.tz)
+                arr = col.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+            elif isinstance(col.dtype, np.dtype) and col.dtype.kind in "biufmM":
+                arr = col.to_numpy()
+            else:
+                return df  # Object / Extension columns can't be written as raw buffers.
+            arr = np.ascontiguousarray(arr)
+            columns.append((name, arr.dtype.str, offset, arr.nbytes, tz))
+            arrays.append(arr)
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+
+        if offset < self._threshold or (ref := self._reserve(offset)) is None:
+            return df
+
+        pos = ref[0]
+        for (_, _, col_offset, nbytes, _), arr in zip(columns, arrays):
+            self._data[pos + col_offset : pos + col_offset + nbytes] = arr.view(np.uint8)
+        return _RingRef(ref[1], ref[2], "df", (df.index.start, len(df), columns))
+
+    def _reserve(self, nbytes: int) -> Optional[tuple[int, int, int]]:
+        "Reserve a contiguous region of the ring. Returns (buffer_pos, abs_start, abs_end) or None"
+        nbytes = -(-nbytes // _ALIGN) * _ALIGN
+        if nbytes > self._size:
+            return None
+        head, tail = int(self._counters[_HEAD]), int(self._counters[_TAIL])
+        pos = head % self._size
+        if pos + nbytes > self._size:
+            head += self._size - pos  # Payloads never wrap. Skip to the start of the buffer.
+            pos = 0
+        if head + nbytes - tail > self._size:
+            logger.debug("ShmQueue is full. Sending %s bytes through the pipe.", nbytes)
+            return None  # Consumer hasn't released enough of the ring yet
+        self._counters[_HEAD] = head + nbytes
+        return pos, head, head + nbytes
+
+    # endregion
+
+    # region --------- Consumer --------- #
+
+    def empty(self) -> bool:
+        "Return True if there are no messages waiting in the queue"
+        return self._headers.empty()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> tuple:
+        "Retrieve the next message. Raises queue.Empty on timeout just like mp.Queue"
+        header = self._headers.get(block, timeout)
+        return tuple(self._decode(arg) if isinstance(arg, _RingRef) else arg for arg in header)
+
+    def _decode(self, ref: _RingRef) -> Any:
+        pos = ref.start % self._size
+        if ref.kind == "str":
+            rtn = self._data[pos : pos + ref.meta].tobytes().decode("utf-8")
+        else:
+            start, length, columns = ref.meta
+            data = {}
+            for name, dtype, offset, nbytes, tz in columns:
+                arr = self._data[pos + offset : pos + offset + nbytes].view(np.dtype(dtype)).copy()
+                data[name] = arr if tz is None else pd.DatetimeIndex(arr).tz_localize("UTC").tz_convert(tz)
+            rtn = pd.DataFrame(data, index=pd.RangeIndex(start, start + length), copy=False)
+        # The payload has been copied out. Release it back to the producer.
+        self._counters[_TAIL] = ref.end
+        return rtn
+
+    # endregion
@@ -1,8 +1,12 @@
 """Utility functions and objects that are used across the library"""
 
 import sys
+import asyncio
+from contextlib import contextmanager
+from queue import Empty
+from threading import Thread, local
 from types import ModuleType
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from importlib import import_module
 
 from itertools import islice
@@ -154,3 +158,75 @@ class LazyModule(ModuleType):
             )
         )
         return result
+
+
+async def consume_queue(queue: Any, stop_event: Any, handler: Callable[[list], None], poll: float = 0.1):
+    """
+    Hand every message placed on a multiprocessing Queue to handler() on the running event loop.
+
+    A daemon thread blocks on the queue so messages are dispatched the moment they arrive rather
+    than on the next poll of queue.empty(). All messages waiting in the queue are drained and
+    given to handler() as a single list so a burst only wakes the event loop once. Returns once
+    stop_event is set. 'poll' is only how often the thread checks the stop_event.
+    """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+
+    def _dispatch(msgs: list):
+        if not exited.done():
+            handler(msgs)
+
+    def _finish():
+        if not exited.done():
+            exited.set_result(None)
+
+    def _read():
+        try:
+            while not stop_event.is_set():
+                try:
+                    msgs = [queue.get(timeout=poll)]
+                except Empty:
+                    continue
+                while True:
+                    try:
+                        msgs.append(queue.get_nowait())
+                    except Empty:
+                        break
+                loop.call_soon_threadsafe(_dispatch, msgs)
+            loop.call_soon_threadsafe(_finish)
+        except (RuntimeError, EOFError, OSError):
+            pass  # Event Loop or Queue was closed out from under the thread
+
+    Thread(target=_read, name="fracta_queue_reader", daemon=True).start()
+    await exited
+
+
+class CapturingQueue:
+    """
+    Proxy of a Queue that forwards put() calls to the wrapped queue unless the calling thread is
+    within a capture() context. Captured messages are collected so they can be forwarded later.
+
+    Allows work to be run concurrently while still forwarding the resulting messages in a
+    deterministic order.
+    """
+
+    def __init__(self, queue: Any):
+        self.queue = queue
+        self._local = local()
+
+    def put(self, msg: Any):
+        "Queue a message, or capture it if the current thread is capturing."
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            self.queue.put(msg)
+        else:
+            buffer.append(msg)
+
+    @contextmanager
+    def capture(self) -> Iterator[list]:
+        "Capture all messages put by the current thread, within the context, into the yielded list."
+        buffer = self._local.buffer = []
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
@@ -6,19 +6,23 @@ from enum import Enum, auto
 import logging
 import asyncio
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from dataclasses import asdict
-from typing import Callable, Literal, Optional, Protocol
+from itertools import count
+from typing import Callable, Iterator, Literal, Optional, Protocol
 
-from fracta.dataframe_ext import enable_market_calendars
+from fracta.dataframe_ext import SeriesCache, enable_market_calendars
 
 from . import orm
 from . import util
+from .bar_cache import BarCache
 
 from .events import Events
-from .js_cmd import JS_CMD
+from .js_cmd import JS_CMD, CmdEncoder, DataTransport
 from .py_cmd import WIN_CMD_ROLODEX
 from .js_api import PyWv, MpHooks, PyWebViewOptions
+from .shm_queue import ShmQueue
 
 log = logging.getLogger("fracta_log")
 APIs = Literal["alpaca"]
@@ -51,6 +55,16 @@ class Window:
         broker_api: Optional[APIs | BrokerAPI] = None,
         log_level: Optional[logging._Level] = None,
         options: Optional[PyWebViewOptions] = None,
+        data_transport: DataTransport = "json",
+        lazy_load_bars: Optional[int] = None,
+        shared_memory: bool = False,
+        encode_workers: Optional[int] = None,
+        indicator_workers: Optional[int] = None,
+        request_debounce: float = 0,
+        bar_cache: Optional[BarCache | str] = None,
+        series_cache: Optional[SeriesCache | int] = None,
+        series_chunk_size: Optional[int] = None,
+        decimation_spacing: Optional[float] = None,
         **kwargs,
     ) -> None:
         # -------- Setup and start the Pywebview subprocess  -------- #
@@ -58,6 +72,9 @@ class Window:
             # PyWebviewOptions Given, overwrite anything in kwargs.
             kwargs = asdict(options)
 
+        # 'columnar' transfers bulk series data as typed arrays rather than a list of JSON records
+        kwargs["data_transport"] = data_transport
+
         if log_level is not None:
             log.setLevel(log_level)
             kwargs["log_level"] = log_level
@@ -65,12 +82,25 @@ class Window:
             log.setLevel(logging.DEBUG)
 
         # create and then unpack the hooks directly into class variables
-        mp_hooks = MpHooks()
+        # shared_memory=True passes DataFrames to the View through a shared memory ring, not a pipe.
+        mp_hooks = MpHooks(fwd_queue=ShmQueue()) if shared_memory else MpHooks()
         self._fwd_queue = mp_hooks.fwd_queue
         self._rtn_queue = mp_hooks.rtn_queue
         self._stop_event = mp_hooks.stop_event
         self._js_loaded_event = mp_hooks.js_loaded_event
 
+        # When set, bulk data commands are formatted by this process (0) or a pool of N processes
+        # instead of the View process. This keeps large history loads from stalling the GUI.
+        if encode_workers is not None:
+            self._fwd_queue = CmdEncoder(self._fwd_queue, data_transport, encode_workers)
+
+        # When set, independent Indicator set_data() calls are run concurrently by a thread pool.
+        # Their commands are captured and forwarded in the order they would have run serially.
+        self.indicator_pool: Optional[ThreadPoolExecutor] = None
+        if indicator_workers is not None:
+            self.indicator_pool = ThreadPoolExecutor(indicator_workers, thread_name_prefix="fracta_indicator")
+            self._fwd_queue = util.CapturingQueue(self._fwd_queue)
+
         kwargs["mp_hooks"] = mp_hooks  # Pass the hooks along to PyWv
         self._view_process = mp.Process(target=PyWv, kwargs=kwargs, daemon=daemon)
         self._view_process.start()
@@ -85,13 +115,33 @@ class Window:
         if not self._js_loaded_event.wait(timeout=10):
             raise TimeoutError("Failed to load PyWebView in a reasonable amount of time.")
 
-        # Begin Listening for any responses from PyWV Process
-        self._queue_manager = asyncio.create_task(self._manage_queue())
+        # When set, Charting Frames only send this many of the most recent bars to the screen.
+        # Older bars are paged in, this many at a time, as the chart is scrolled back in time.
+        self.lazy_load_bars = lazy_load_bars
+        # Seconds a Series waits for its symbol / timeframe to stop changing before requesting data.
+        self.request_debounce = request_debounce
+        # When set, fetched bars are cached on disk. Cached bars are displayed immediately and only
+        # the bars after them are requested. A str is the directory of a BarCache w/ default limits.
+        self.bar_cache = BarCache(bar_cache) if isinstance(bar_cache, str) else bar_cache
+        # When set, the prepared data of recently viewed symbols & timeframes is held in memory so
+        # flipping back to one is instant. An int is the memory budget, in bytes, of a SeriesCache.
+        self.series_cache = SeriesCache(series_cache) if isinstance(series_cache, int) else series_cache
+        # When set, Series with more bars than this send only the most recent chunk in their first
+        # message. The older bars are then prepended, in growing chunks, as the View acks each one.
+        self.series_chunk_size = series_chunk_size
+        self._streams: dict[int, Iterator[tuple]] = {}
+        # When set, zoomed out Charting Frames merge bars so displayed bars are at least this many
+        # pixels apart. See decimation.py. Full resolution bars are re-sent once zoomed back in.
+        self.decimation_spacing = decimation_spacing
+        self._stream_ids = count()
 
         # -------- Create Subobjects  -------- #
         self.events = Events() if events is None else events
         self.events.symbol_search.responder = partial(_symbol_search_rsp, fwd_queue=self._fwd_queue)
 
+        # Begin Listening for any responses from PyWV Process
+        self._queue_manager = asyncio.create_task(self._manage_queue())
+
         # Using ID_List over ID_Dict so element order is mutable for PY_CMD.REORDER_CONTAINERS
         self._container_ids = util.ID_List("c")
         self.containers: list[Container] = []
@@ -114,17 +164,65 @@ class Window:
 
     async def _manage_queue(self):
         log.debug("Entered Async Queue Manager")
-        while not self._stop_event.is_set():
-            if self._rtn_queue.empty():
-                # Sleep Time is to prioritize other Event Loop Calls.
-                # Can be set to 0 if the Rtn_Queue becomes more active.
-                await asyncio.sleep(0.05)
-            else:
-                cmd, *args = self._rtn_queue.get()
-                WIN_CMD_ROLODEX[cmd](self, *args)
-                log.debug("PY_CMD: %s: %s", cmd.name, str(args))
+        # Commands are dispatched as soon as they arrive instead of polling the rtn_queue.
+        await util.consume_queue(self._rtn_queue, self._stop_event, self._execute_cmds)
         log.debug("Exited Async Queue Manager")
 
+        self.events.shutdown()
+        if self.indicator_pool is not None:
+            self.indicator_pool.shutdown(wait=False, cancel_futures=True)
+
+        fwd_queue = self._fwd_queue
+        if isinstance(fwd_queue, util.CapturingQueue):
+            fwd_queue = fwd_queue.queue
+        if isinstance(fwd_queue, CmdEncoder):
+            fwd_queue.close()
+            fwd_queue = fwd_queue.queue
+        if isinstance(fwd_queue, ShmQueue):
+            fwd_queue.close()
+
+    def _execute_cmds(self, msgs: list[tuple]):
+        for cmd, *args in msgs:
+            try:
+                WIN_CMD_ROLODEX[cmd](self, *args)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log.exception("Failed to execute PY_CMD %s: %s", cmd.name, e)
+            log.debug("PY_CMD: %s: %s", cmd.name, str(args))
+
+    # region ------------------------ Acknowledged Streams  ------------------------ #
+
+    def __stream__(self, msgs: Iterator[tuple]) -> int:
+        """
+        Forward the given JS_CMD messages one at a time. The next message is only sent once the
+        View has executed the previous one, so other commands are never stuck behind the stream.
+        Returns a token that can be used to cancel the stream.
+        """
+        token = next(self._stream_ids)
+        self._streams[token] = msgs
+        self.__data_ack__(token)
+        return token
+
+    def __cancel_stream__(self, token: Optional[int]):
+        "Stop forwarding the messages of a stream. Messages already in the View are still executed"
+        if token is not None:
+            self._streams.pop(token, None)
+
+    def __streaming__(self, token: Optional[int]) -> bool:
+        "Check if a stream has messages that haven't been executed by the View yet"
+        return token is not None and token in self._streams
+
+    def __data_ack__(self, token: int):
+        "Forward the next message of a stream once the View has acknowledged the previous one"
+        if (msgs := self._streams.get(token)) is None:
+            return  # Cancelled
+        if (msg := next(msgs, None)) is None:
+            del self._streams[token]
+            return
+        self._fwd_queue.put(msg)
+        self._fwd_queue.put((JS_CMD.ACK, token))
+
+    # endregion
+
     # region ------------------------ Public Window Methods  ------------------------ #
 
     def show(self):
@@ -347,6 +445,11 @@ class Frame(ABC):
         "Immutable Copy of the Object's Javascript_ID"
         return self._js_id
 
+    @property
+    def window(self) -> "Window":
+        "The Window this Frame is displayed in"
+        return self._window
+
     @abstractmethod
     def all_ids(self) -> list[str]:
         "Returns a List of all JS Ids this obj (and Sub-objs) placed into the JS Global namespace"
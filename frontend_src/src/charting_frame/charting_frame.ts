@@ -1,4 +1,4 @@
-import { SingleValueData, WhitespaceData } from "lightweight-charts";
+import { LogicalRange, Range, SingleValueData, Time, WhitespaceData } from "lightweight-charts";
 import { Accessor, createSignal, JSX, Setter } from "solid-js";
 import { ChartFrame } from "../../components/charting_frame/chart_elements";
 import { layout_display } from "../../components/layout/layouts";
@@ -18,6 +18,9 @@ export interface data_src {
 }
 
 const TYPE_STR = 'charting_frame'
+//Minimum time (ms) between visible range reports to python. Python pages in older bars and
+//adjusts the decimation of the displayed bars as needed.
+const RANGE_REPORT_INTERVAL = 250
 export const isChartingFrame = (frame: frame): frame is chart_frame => frame.type === TYPE_STR
 
 export class chart_frame extends frame {
@@ -42,6 +45,9 @@ export class chart_frame extends frame {
 
     panes: pane[] = []
     private flex_panes: flex_frame[] = []
+    private last_range_report: number = 0
+    private range_report_timer: number | undefined = undefined
+    private held_range: Range<Time> | null = null
 
     constructor(id: string, tab_update_func: update_tab_func) {
         super(id, tab_update_func)
@@ -138,6 +144,9 @@ export class chart_frame extends frame {
     protected add_pane(id: string): pane {
         let new_pane = new pane(id)
         this.panes.push(new_pane)
+        //The first pane drives the visible range of the frame.
+        if (this.panes.length === 1)
+            new_pane.chart.timeScale().subscribeVisibleLogicalRangeChange(this.on_visible_range_change.bind(this))
         if (this.layout === undefined) this.set_layout(Container_Layouts.SINGLE)
         return new_pane
     }
@@ -177,6 +186,41 @@ export class chart_frame extends frame {
 
     // #endregion
 
+    /**
+     * Inform Python of the visible range and the width of the chart so older bars can be sent and the
+     * displayed bars re-decimated. Reports are throttled, the last change is always reported.
+     */
+    private on_visible_range_change(range: LogicalRange | null) {
+        if (range === null) return
+        clearTimeout(this.range_report_timer)
+        const wait = this.last_range_report + RANGE_REPORT_INTERVAL - Date.now()
+        if (wait > 0) {
+            this.range_report_timer = window.setTimeout(() => this.on_visible_range_change(range), wait)
+            return
+        }
+        this.last_range_report = Date.now()
+        const width = this.panes[0].chart.timeScale().width()
+
+        //@ts-ignore : Frames don't hold a reference to their container, so search for it.
+        for (const [c_id, container] of window.container_manager.containers)
+            if (container.frames.includes(this)) {
+                window.api.visible_range_change(c_id, this.id, range.from, range.to, width)
+                return
+            }
+    }
+
+    /** Save the visible time range so it can be restored once the displayed data has been replaced */
+    hold_visible_range() {
+        this.held_range = this.panes[0]?.chart.timeScale().getVisibleRange() ?? null
+    }
+
+    restore_visible_range() {
+        if (this.held_range === null) return
+        const range = this.held_range
+        this.panes.forEach(pane => { pane.chart.timeScale().setVisibleRange(range) })
+        this.held_range = null
+    }
+
 
     // #region -------------- Layout Control and Resize Functions ------------------ //
 
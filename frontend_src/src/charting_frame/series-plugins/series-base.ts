@@ -235,6 +235,16 @@ export class SeriesBase<T extends Exclude<keyof SeriesOptionsMap_EXT, 'Custom'>>
     update(bar: SeriesDataTypeMap_EXT[T]) {this._series.update(bar)}
     setData(data: SeriesDataTypeMap_EXT[T][]) {this._series.setData(data)}
 
+    /* Places older data in front of the current data. Data must end before the first current bar */
+    prependData(data: SeriesDataTypeMap_EXT[T][]) {
+        const current_range = this._pane.chart.timeScale().getVisibleRange()
+        this._series.setData([...data, ...this._series.data()])
+
+        //Setting Data Changes Visible Range, set it back.
+        if (current_range !== null)
+            this._pane.chart.timeScale().setVisibleRange(current_range)
+    }
+
     markers(): lwc.SeriesMarker<lwc.Time>[] {return Array.from(this._markers.values())}
     // setMarkers() OBE by inclusion of Markers Map.
     // setMarkers(data: lwc.SeriesMarker<lwc.Time>[]){this._series.setMarkers(data)}
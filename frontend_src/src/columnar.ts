@@ -0,0 +1,41 @@
+/**
+ * Columnar Data Transport. Bulk series data can be sent from python as a set of Base64 encoded,
+ * little-endian, Float64 column arrays instead of a list of JSON records. (See js_cmd.columnar())
+ */
+export interface columnar_data {
+    length: number
+    f64: { [column: string]: string }
+    json: { [column: string]: any[] }
+}
+
+/* Decode a Base64 string into a Float64Array */
+function decode_f64(b64: string): Float64Array {
+    const bin = atob(b64)
+    const bytes = new Uint8Array(bin.length)
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i)
+    return new Float64Array(bytes.buffer)
+}
+
+/**
+ * Reconstitute a list of records from columnar data. NaN & Null values are dropped from each
+ * record to match the behavior of the JSON Record Encoder.
+ */
+export function decode_columnar(data: columnar_data): any[] {
+    const f64_cols = Object.entries(data.f64).map(([k, v]) => [k, decode_f64(v)] as [string, Float64Array])
+    const json_cols = Object.entries(data.json)
+
+    const records = new Array(data.length)
+    for (let i = 0; i < data.length; i++) {
+        const record: any = {}
+        for (const [k, arr] of f64_cols) {
+            const v = arr[i]
+            if (!Number.isNaN(v)) record[k] = v
+        }
+        for (const [k, arr] of json_cols) {
+            const v = arr[i]
+            if (v !== null && v !== undefined) record[k] = v
+        }
+        records[i] = record
+    }
+    return records
+}
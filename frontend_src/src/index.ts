@@ -1,6 +1,7 @@
 import { render } from 'solid-js/web';
 import { Wrapper } from "../components/layout/wrapper";
 import { pane } from "./charting_frame/pane";
+import { decode_columnar } from './columnar';
 import { Series_Type } from './charting_frame/series-plugins/series-base';
 import { container } from "./container";
 import { container_manager } from './container_manager';
@@ -31,6 +32,7 @@ declare global {
     // Beyond delaying some garbage collection, I don't think the dead references are 
     // an issue so the behavior will stay for now.
     var Container_Layouts: any
+    var decode_columnar: (data: any) => any[]
 }
 
 //declare global Attributes for JSX objects
@@ -48,6 +50,8 @@ declare module "solid-js" {
 window.api = new py_api();
 //Enums that will be used by Python need to be placed into the Global Scope
 window.Container_Layouts = Container_Layouts
+//Decoder for bulk series data sent using the 'columnar' data transport
+window.decode_columnar = decode_columnar
 //Allow Global Control over the Topbar Display. Functions will be overwritten as window is rendered
 window.topbar = {
     setSeries : (_:Series_Type) => {},
@@ -63,6 +63,10 @@ export class py_api {
     update_series_options = (container_id: string, frame_id: string, ind_id:string, ser_id:string, opts:any) => {
         console.log(`Set Series Options: ${container_id},${frame_id},${ind_id},${ser_id}`, opts)
     }
+
+    visible_range_change = (container_id: string, frame_id: string, from: number, to: number, width: number) => {
+        console.log(`Visible Range Change: ${container_id},${frame_id},${from},${to},${width}`)
+    }
     
     /* ---------------- Python >>> Javascript ---------------- */
     // The following functions are called by Python. They are set by JS as the window is rendered
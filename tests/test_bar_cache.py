@@ -0,0 +1,85 @@
+"""Tests of the persistent, on-disk, BarCache"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from fracta import BarCache
+from fracta.orm.types import Symbol, TF
+
+SYMBOL, TIMEFRAME = Symbol("TEST", source="unit"), TF(1, "m")
+
+
+def _bars(n: int, start: int = 0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-02", periods=n + start, freq="1min", tz="UTC")[start:],
+            "close": np.arange(start, start + n, dtype="float64"),
+            "volume": np.arange(start, start + n, dtype="int64"),
+        }
+    )
+
+
+def test_cold_merge_then_load(tmp_path):
+    cache = BarCache(tmp_path)
+    assert cache.load(SYMBOL, TIMEFRAME) is None
+
+    merged, changed = cache.merge(SYMBOL, TIMEFRAME, _bars(10))
+    assert changed
+    loaded = cache.load(SYMBOL, TIMEFRAME)
+    assert loaded is not None
+    pd.testing.assert_frame_equal(loaded, merged)
+    assert loaded["volume"].dtype == np.int64
+
+
+def test_delta_merge_replaces_the_tail(tmp_path):
+    cache = BarCache(tmp_path)
+    cache.merge(SYMBOL, TIMEFRAME, _bars(10))
+
+    _, changed = cache.merge(SYMBOL, TIMEFRAME, _bars(1, start=9))
+    assert not changed
+
+    tail = _bars(5, start=9)
+    tail.loc[0, "close"] = -1.0
+    merged, changed = cache.merge(SYMBOL, TIMEFRAME, tail)
+    assert changed
+    assert len(merged) == 14
+    assert merged["close"].iloc[9] == -1.0
+    pd.testing.assert_frame_equal(cache.load(SYMBOL, TIMEFRAME), merged)
+
+
+def test_loaded_data_outlives_a_rewrite(tmp_path):
+    cache = BarCache(tmp_path)
+    cache.merge(SYMBOL, TIMEFRAME, _bars(10))
+    loaded = cache.load(SYMBOL, TIMEFRAME)
+    assert loaded is not None
+    expected = loaded.copy()
+
+    # Truncates the column files the loaded frame was read from
+    cache.merge(SYMBOL, TIMEFRAME, _bars(2, start=1))
+    pd.testing.assert_frame_equal(loaded, expected)
+
+
+def test_evicts_least_recently_used_past_max_bytes(tmp_path):
+    cache = BarCache(tmp_path, max_bytes=None)
+    other = Symbol("OTHER", source="unit")
+    cache.merge(SYMBOL, TIMEFRAME, _bars(100))
+    cache.merge(other, TIMEFRAME, _bars(100))
+    cache.load(SYMBOL, TIMEFRAME)
+
+    cache.max_bytes = cache.nbytes - 1
+    cache.evict()
+    assert cache.load(other, TIMEFRAME) is None
+    assert cache.load(SYMBOL, TIMEFRAME) is not None
+    assert not (tmp_path / BarCache.key(other, TIMEFRAME)).exists()
+
+
+def test_evicts_by_age_across_sessions(tmp_path):
+    BarCache(tmp_path).merge(SYMBOL, TIMEFRAME, _bars(10))
+    meta = tmp_path / BarCache.key(SYMBOL, TIMEFRAME) / "meta.json"
+    os.utime(meta, (0, 0))
+
+    cache = BarCache(tmp_path, max_age=60)
+    assert cache.nbytes == 0
+    assert cache.load(SYMBOL, TIMEFRAME) is None
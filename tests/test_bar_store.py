@@ -0,0 +1,143 @@
+"""Tests of the columnar BarStore that backs a Series_DF"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fracta.dataframe_ext import BarStore, TickAggregator
+from fracta.orm.series_data import OhlcData
+
+
+def _frame(n: int = 5) -> pd.DataFrame:
+    index = pd.date_range("2024-01-02", periods=n, freq="1min", tz="UTC").as_unit("ns")
+    return pd.DataFrame(
+        {"close": np.arange(n, dtype="float64"), "volume": np.arange(n, dtype="int64"), "tag": list("abcde")[:n]},
+        index=index,
+    )
+
+
+def test_requires_datetime_index():
+    with pytest.raises(TypeError):
+        BarStore(pd.DataFrame({"close": [1.0, 2.0]}))
+
+
+def test_df_matches_source():
+    src = _frame()
+    store = BarStore(src)
+    assert len(store) == 5
+    assert store.columns == ["close", "volume", "tag"]
+    pd.testing.assert_frame_equal(store.df, src, check_freq=False)
+    assert store.first_time == src.index[0]
+    assert store.last_time == src.index[-1]
+
+
+def test_append_grows_and_keeps_dtypes():
+    store = BarStore(_frame())
+    start = store.capacity
+    for i in range(start):
+        store.append(store.last_time + pd.Timedelta(minutes=1), {"close": float(i), "volume": i, "tag": "z"})
+
+    assert len(store) == start + 5
+    assert store.capacity >= len(store)
+    assert store.column("volume").dtype == np.int64
+    assert store.df.index.is_monotonic_increasing
+    assert store.last("tag") == "z"
+
+
+def test_append_fills_missing_values():
+    store = BarStore(_frame())
+    store.append(store.last_time + pd.Timedelta(minutes=1), {"close": 9.0, "extra": 1.5})
+
+    assert store.last("extra") == 1.5
+    assert np.isnan(store.column("extra")[0])
+    # A missing integer is stored like Pandas would, as a NaN in a float column
+    assert store.column("volume").dtype == np.float64
+    assert np.isnan(store.column("volume")[-1])
+
+
+def test_update_last_writes_in_place():
+    store = BarStore(_frame())
+    close = store.df["close"]
+    store.update_last({"close": 42.0, "unknown": 1})
+
+    assert store.last("close") == 42.0
+    assert close.iloc[-1] == 42.0  # Shares memory with views that were already handed out
+    assert "unknown" not in store.columns
+
+
+def test_update_last_promotes_when_value_does_not_fit():
+    store = BarStore(_frame())
+    store.update_last({"volume": 2.5})
+
+    assert store.column("volume").dtype == np.float64
+    assert store.last("volume") == 2.5
+
+
+def test_filter_keeps_masked_rows():
+    store = BarStore(_frame())
+    store.filter(np.array([True, False, True, False, True]))
+
+    assert len(store) == 3
+    assert list(store.column("close")) == [0.0, 2.0, 4.0]
+    assert list(store.index) == list(_frame().index[[0, 2, 4]])
+
+
+def _ohlc(n: int = 5) -> pd.DataFrame:
+    index = pd.date_range("2024-01-02", periods=n, freq="1min", tz="UTC").as_unit("ns")
+    close = np.arange(n, dtype="float64") + 10
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": np.full(n, 100, "int64")},
+        index=index,
+    )
+
+
+def test_tick_aggregation_writes_last_bar():
+    store = BarStore(_ohlc())
+    ticks = TickAggregator(store, OhlcData)
+    ticks.tick(20.0, 5, accumulate=True)
+    ticks.tick(1.0, 5, accumulate=True)
+
+    bar = ticks.flush()
+    assert (bar.high, bar.low, bar.close) == (20.0, 1.0, 1.0)
+    assert bar.volume == 110
+
+
+def test_tick_aggregation_keeps_integer_volume():
+    store = BarStore(_ohlc())
+    ticks = TickAggregator(store, OhlcData)
+    ticks.tick(14.5, 7, accumulate=True)
+
+    assert store.column("volume").dtype == np.int64
+    assert store.last("volume") == 107
+
+    # A fractional volume promotes the column instead of truncating
+    ticks.tick(14.5, 0.5, accumulate=True)
+    assert store.column("volume").dtype == np.float64
+    assert store.last("volume") == 107.5
+
+
+def test_truncate_then_extend_reuses_capacity():
+    store = BarStore(_frame())
+    close = store.array("close")
+    tail = _frame(5).iloc[3:].copy()
+    tail["close"] = [30.0, 40.0]
+    tail["volume"] = [3, 4]
+
+    store.truncate(3)
+    store.extend(tail)
+    assert store.array("close") is close  # Written into the spare capacity, not re-allocated
+    assert list(store.column("close")) == [0.0, 1.0, 2.0, 30.0, 40.0]
+    assert store.column("volume").dtype == np.int64
+    assert list(store.index) == list(_frame().index)
+
+
+def test_extend_fills_missing_columns():
+    store = BarStore(_frame())
+    index = pd.date_range(store.last_time + pd.Timedelta(minutes=1), periods=2, freq="1min").as_unit("ns")
+    later = pd.DataFrame({"close": [5.0, 6.0]}, index=index)
+    store.extend(later)
+
+    assert len(store) == 7
+    assert store.last("tag") is None
+    assert store.column("volume").dtype == np.float64
+    assert np.isnan(store.column("volume")[-1])
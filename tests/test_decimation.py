@@ -0,0 +1,98 @@
+"""Tests of the level of detail decimation of transfer DataFrames"""
+
+import numpy as np
+import pandas as pd
+
+from fracta import decimation
+from fracta.orm.series_data import HistogramData, OhlcData, SingleValueData
+
+SPAN = 300  # 5 minute buckets of 1 minute bars
+T0 = 1_704_196_800  # 2024-01-02 12:00 UTC, a multiple of SPAN
+
+
+def _epoch(n: int) -> np.ndarray:
+    return T0 + 60 * np.arange(n, dtype="int64")
+
+
+def _ts(epoch: int) -> pd.Timestamp:
+    return pd.Timestamp(epoch, unit="s", tz="UTC")
+
+
+def test_bucket_starts_are_epoch_aligned():
+    epoch = np.array([T0 - 60, T0, T0 + 60, T0 + 300, T0 + 900], dtype="int64")
+    assert list(decimation.bucket_starts(epoch, SPAN)) == [0, 1, 3, 4]
+
+
+def test_ohlc_aggregates_like_a_resample():
+    n = 10
+    close = np.arange(n, dtype="float64")
+    xfer = pd.DataFrame({"time": _epoch(n), "open": close, "high": close + 1, "low": close - 1, "close": close})
+    out = decimation.decimate(xfer, SPAN, "ohlc")
+
+    assert list(out["time"]) == [T0, T0 + SPAN]
+    assert list(out["open"]) == [0.0, 5.0]
+    assert list(out["high"]) == [5.0, 10.0]
+    assert list(out["low"]) == [-1.0, 4.0]
+    assert list(out["close"]) == [4.0, 9.0]
+
+
+def test_extremes_keep_min_and_max_rows_in_time_order():
+    values = [5.0, 9.0, 1.0, 5.0, 5.0, 3.0, 2.0, 2.0, 8.0, 2.0]
+    xfer = pd.DataFrame({"time": _epoch(10), "value": values, "color": list("abcdefghij")})
+    out = decimation.decimate(xfer, SPAN, "extremes")
+
+    # Bucket 1: max at row 1 then min at row 2. Bucket 2: min at row 6 then max at row 8.
+    assert list(out["time"]) == list(_epoch(10)[[1, 2, 6, 8]])
+    assert list(out["value"]) == [9.0, 1.0, 2.0, 8.0]
+    assert list(out["color"]) == ["b", "c", "g", "i"]
+
+
+def test_extremes_of_a_flat_bucket_keep_one_row():
+    xfer = pd.DataFrame({"time": _epoch(5), "value": np.full(5, 4.0)})
+    out = decimation.decimate(xfer, SPAN, "extremes")
+    assert list(out["time"]) == [T0]
+
+
+def test_extremes_without_a_value_column_keep_bucket_starts():
+    xfer = pd.DataFrame({"time": _epoch(10), "color": list("abcdefghij")})
+    out = decimation.decimate(xfer, SPAN, "extremes")
+    assert list(out["color"]) == ["a", "f"]
+
+
+def test_sum_totals_each_bucket():
+    values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype="float64")
+    values[7] = np.nan
+    xfer = pd.DataFrame({"time": _epoch(10), "value": values, "color": list("abcdefghij")})
+    out = decimation.decimate(xfer, SPAN, "sum")
+
+    assert list(out["time"]) == [T0, T0 + SPAN]
+    assert list(out["value"]) == [15.0, 32.0]
+    assert list(out["color"]) == ["e", "j"]
+
+
+def test_last_bucket_keeps_the_ohlc_extremes():
+    close = np.array([10.0, 20.0, 15.0])
+    xfer = pd.DataFrame({"time": _epoch(3), "open": close, "high": close + 1, "low": close - 1, "close": close})
+    bucket = decimation.LastBucket(xfer, SPAN, "ohlc")
+
+    # Update to the most recent bar, and then a new bar, within the same bucket
+    shown = bucket.merge(OhlcData(_ts(T0 + 120), open=15.0, high=16.0, low=12.0, close=13.0))
+    assert (shown.time, shown.open, shown.high, shown.low) == (_ts(T0), 10.0, 21.0, 9.0)
+    shown = bucket.merge(OhlcData(_ts(T0 + 180), open=13.0, high=14.0, low=5.0, close=6.0))
+    assert (shown.open, shown.high, shown.low, shown.close) == (10.0, 21.0, 5.0, 6.0)
+
+    # A bar in the next bucket starts a new one
+    shown = bucket.merge(OhlcData(_ts(T0 + SPAN), open=6.0, high=7.0, low=5.5, close=6.5))
+    assert (shown.time, shown.open, shown.high, shown.low) == (_ts(T0 + SPAN), 6.0, 7.0, 5.5)
+
+
+def test_last_bucket_sums_volume():
+    xfer = pd.DataFrame({"time": _epoch(3), "value": [1.0, 2.0, 3.0]})
+    bucket = decimation.LastBucket(xfer, SPAN, "sum")
+
+    shown = bucket.merge(HistogramData(_ts(T0 + 120), 4.0, color="red"))
+    assert (shown.time, shown.value, shown.color) == (_ts(T0), 7.0, "red")
+    shown = bucket.merge(HistogramData(_ts(T0 + 180), 10.0))
+    assert shown.value == 17.0
+    shown = bucket.merge(SingleValueData(_ts(T0 + SPAN), 2.0))
+    assert (shown.time, shown.value) == (_ts(T0 + SPAN), 2.0)
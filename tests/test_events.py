@@ -0,0 +1,71 @@
+"""Tests of the Emitter call & response machinery"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fracta.events import CancelToken, Emitter, Events
+
+
+def _recording_emitter(**kwargs) -> tuple[Emitter, list]:
+    calls = []
+    emitter = Emitter(responder=lambda rsp, **_: calls.append(("responder", rsp)), **kwargs)
+    return emitter, calls
+
+
+def test_on_response_follows_the_sync_responder():
+    emitter, calls = _recording_emitter()
+    emitter += lambda x: x * 2
+    emitter(2, on_response=lambda: calls.append("ready"))
+    assert calls == [("responder", 4), "ready"]
+
+
+def test_on_response_follows_the_executor_responder():
+    async def run():
+        emitter, calls = _recording_emitter(executor=1)
+        emitter += lambda x: x * 2
+        emitter(3, on_response=lambda: calls.append("ready"))
+        await asyncio.gather(*emitter._tasks)  # pylint: disable=protected-access
+        emitter.shutdown()
+        return calls
+
+    assert asyncio.run(run()) == [("responder", 6), "ready"]
+
+
+def test_cancelled_responses_are_dropped():
+    async def run():
+        emitter, calls = _recording_emitter()
+
+        async def handler(x):
+            await asyncio.sleep(0)
+            return x
+
+        emitter += handler
+        token = CancelToken()
+        emitter(1, token=token, on_response=lambda: calls.append("ready"))
+        token.cancel()
+        await asyncio.sleep(0.01)
+        return calls
+
+    assert asyncio.run(run()) == []
+
+
+def test_emitter_owns_the_executors_it_creates():
+    emitter = Emitter(executor=2)
+    owned = emitter.executor
+    emitter.executor = 1  # Replacing an owned executor shuts it down
+    assert owned._shutdown  # type: ignore # pylint: disable=protected-access
+
+    given = ThreadPoolExecutor(1)
+    emitter.executor = given
+    emitter.shutdown()
+    assert not given._shutdown  # pylint: disable=protected-access
+    given.shutdown()
+
+
+def test_events_shutdown():
+    events = Events()
+    events.data_request.executor = 2
+    pool = events.data_request.executor
+    events.shutdown()
+    assert pool._shutdown  # type: ignore # pylint: disable=protected-access
+    assert events.data_request.executor is None
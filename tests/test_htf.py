@@ -0,0 +1,55 @@
+"""Tests of Higher-Timeframe data derived from a finer Series_DF"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fracta.dataframe_ext import HTF_DF, Series_DF
+from fracta.orm.series_data import OhlcData
+from fracta.orm.types import TF
+
+AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+def _minutes(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame(
+        {
+            # Starts mid-bin so the first derived bar is partial
+            "time": pd.date_range("2024-01-02 00:03", periods=n, freq="1min", tz="UTC"),
+            "open": close + rng.uniform(-0.5, 0.5, n),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(1, 100, n),
+        }
+    )
+
+
+def _expected(src: pd.DataFrame, freq: str) -> pd.DataFrame:
+    return src.set_index("time").resample(freq).agg(AGG).dropna()
+
+
+@pytest.mark.parametrize("timeframe, freq", [(TF(5, "m"), "5min"), (TF(1, "h"), "1h")])
+def test_resample_matches_pandas(timeframe, freq):
+    src = _minutes(500)
+    derived = Series_DF(src.copy()).resample(timeframe)
+
+    expected = _expected(src, freq)
+    got = derived.df[list(AGG)]
+    assert list(got.index) == list(expected.index)
+    np.testing.assert_allclose(got.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_streamed_updates_match_a_resample():
+    src = _minutes(300)
+    htf = HTF_DF(Series_DF(src.iloc[:200].copy()), TF(5, "m"))
+
+    for row in src.iloc[200:].itertuples():
+        htf.update(OhlcData(row.time, row.open, row.high, row.low, row.close, row.volume))
+
+    expected = _expected(src, "5min")
+    got = htf.data.df[list(AGG)]
+    assert list(got.index) == list(expected.index)
+    np.testing.assert_allclose(got.to_numpy(dtype=float), expected.to_numpy(dtype=float))
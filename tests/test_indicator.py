@@ -0,0 +1,60 @@
+"""Tests of the Indicator class analysis and update helpers"""
+
+from math import isnan
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from fracta.indicator import Indicator, _scalar_getter
+from fracta.indicator_meta import _overridden
+from fracta.indicators import SMA
+
+
+class _Source:
+    "Stand-in for an Indicator with a pd.Series output"
+
+    def __init__(self, last: Optional[float]):
+        self.last = last
+        self.series_reads = 0
+
+    def __last_value__(self, output: str) -> Optional[float]:
+        return self.last if output == "close" else None
+
+    def close(self) -> pd.Series:
+        self.series_reads += 1
+        return pd.Series([1.0, 2.0, 3.0])
+
+    def empty(self) -> pd.Series:
+        return pd.Series(dtype="float64")
+
+
+def test_scalar_getter_prefers_last_value():
+    src = _Source(last=7.0)
+    assert _scalar_getter(src.close)() == 7.0
+    assert src.series_reads == 0
+
+
+def test_scalar_getter_falls_back_to_the_series():
+    src = _Source(last=None)
+    assert _scalar_getter(src.close)() == 3.0
+    assert src.series_reads == 1
+    assert isnan(_scalar_getter(src.empty)())
+
+
+def test_overridden_compares_against_the_base_class():
+    # A subclass that happens to be named 'Indicator' is still analysed as a subclass
+    class Indicator(SMA):  # pylint: disable=redefined-outer-name,unused-variable
+        pass
+
+    assert Indicator.__bar_update__
+    assert _overridden(SMA, "update_bar")
+    assert not _overridden(SMA, "update_data")
+
+
+def test_update_method_is_required():
+    with pytest.raises(TypeError):
+
+        class _NoUpdate(Indicator):  # pylint: disable=unused-variable
+            def set_data(self, data: pd.Series, *_, **__):
+                pass
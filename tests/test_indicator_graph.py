@@ -0,0 +1,122 @@
+"""Tests of the IndicatorGraph's ordering and propagation"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from fracta.indicator import IndicatorGraph
+from fracta.util import CapturingQueue
+
+
+class _Node:
+    "Stand-in for an Indicator. Records the order its Watcher was notified in"
+
+    __concurrent__ = True
+
+    def __init__(self, js_id: str, graph: IndicatorGraph, calls: list[str]):
+        self.js_id = self.cls_name = js_id
+        self.parent_frame = SimpleNamespace(indicator_graph=graph)
+        self._watcher = SimpleNamespace(
+            notify_set=lambda: calls.append(f"set:{js_id}") or True,
+            notify_update=lambda: calls.append(f"update:{js_id}") or True,
+        )
+
+    def __repr__(self):
+        return self.js_id
+
+
+def _graph(*names: str, graph: IndicatorGraph | None = None) -> tuple[IndicatorGraph, dict[str, _Node], list[str]]:
+    graph, calls = graph or IndicatorGraph(), []
+    nodes = {name: _Node(name, graph, calls) for name in names}
+    for node in nodes.values():
+        graph.add(node)
+    return graph, nodes, calls
+
+
+def test_order_is_topological():
+    graph, n, _ = _graph("d", "c", "b", "a")
+    graph.link(n["a"], n["b"])
+    graph.link(n["b"], n["c"])
+    graph.link(n["a"], n["d"])
+    graph.link(n["c"], n["d"])
+
+    order = graph.order
+    for src, dep in (("a", "b"), ("b", "c"), ("a", "d"), ("c", "d")):
+        assert order.index(n[src]) < order.index(n[dep])
+
+
+def test_ties_keep_insertion_order():
+    graph, n, _ = _graph("a", "b", "c")
+    assert graph.order == [n["a"], n["b"], n["c"]]
+
+
+def test_sort_is_deferred_until_read():
+    graph, n, _ = _graph("a", "b", "c")
+    graph.link(n["c"], n["b"])
+    graph.link(n["b"], n["a"])
+    assert graph._dirty  # pylint: disable=protected-access
+    assert graph.order == [n["c"], n["b"], n["a"]]
+    assert not graph._dirty  # pylint: disable=protected-access
+
+
+def test_diamond_updates_each_node_once():
+    graph, n, calls = _graph("src", "left", "right", "sink", "other")
+    graph.link(n["src"], n["left"])
+    graph.link(n["src"], n["right"])
+    graph.link(n["left"], n["sink"])
+    graph.link(n["right"], n["sink"])
+
+    graph.propagate_update(n["src"])
+    assert calls == ["update:left", "update:right", "update:sink"]
+
+    calls.clear()
+    graph.propagate_set(n["right"])
+    assert calls == ["set:sink"]
+
+
+def test_unlink_and_cycles():
+    graph, n, _ = _graph("a", "b")
+    graph.link(n["a"], n["b"])
+    assert graph.creates_cycle(n["b"], n["a"])
+
+    graph.unlink(n["b"])
+    assert graph.dependents(n["a"]) == []
+    assert not graph.creates_cycle(n["b"], n["a"])
+
+
+class _ListQueue(list):
+    put = list.append
+
+
+def _concurrent_graph(executor) -> tuple[IndicatorGraph, dict[str, _Node], list[str], _ListQueue]:
+    queue = _ListQueue()
+    capturing = CapturingQueue(queue)
+    graph, n, calls = _graph("src", "a", "b", "sink", graph=IndicatorGraph(executor, capturing))
+    for node in n.values():
+        node._watcher.notify_set = lambda js_id=node.js_id: capturing.put(js_id) or True
+    graph.link(n["src"], n["a"])
+    graph.link(n["src"], n["b"])
+    graph.link(n["a"], n["sink"])
+    graph.link(n["b"], n["sink"])
+    return graph, n, calls, queue
+
+
+def test_concurrent_set_without_a_loop_runs_to_completion():
+    with ThreadPoolExecutor(2) as executor:
+        graph, n, _, queue = _concurrent_graph(executor)
+        graph.propagate_set(n["src"])
+    # Commands are forwarded in the topological order, regardless of which thread finished first
+    assert queue == ["a", "b", "sink"]
+
+
+def test_concurrent_set_is_awaited_on_the_event_loop():
+    async def run():
+        with ThreadPoolExecutor(2) as executor:
+            graph, n, _, queue = _concurrent_graph(executor)
+            graph.propagate_set(n["src"])
+            graph.propagate_set(n["b"])
+            assert queue == []  # Scheduled, not run, so the loop isn't blocked
+            await graph._set_task  # pylint: disable=protected-access
+            return queue
+
+    assert asyncio.run(run()) == ["a", "b", "sink", "sink"]
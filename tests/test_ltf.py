@@ -0,0 +1,39 @@
+"""Tests of the per-bar, Lower-Timeframe, slices of an LTF_DF"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fracta.dataframe_ext import LTF_DF, Series_DF
+from fracta.orm.series_data import SingleValueData
+
+
+def _values(n: int, freq: str) -> Series_DF:
+    time = pd.date_range("2024-01-02", periods=n, freq=freq, tz="UTC")
+    return Series_DF(pd.DataFrame({"time": time, "value": np.arange(n, dtype="float64")}))
+
+
+def test_ranges_match_a_time_filter():
+    minor, major = _values(120, "1min"), _values(8, "15min")
+    ltf = LTF_DF(minor, major)
+
+    for i, open_time in enumerate(major.store.index):
+        close_time = open_time + pd.Timedelta(minutes=15)
+        expected = minor.df[(minor.df.index >= open_time) & (minor.df.index < close_time)]
+        pd.testing.assert_frame_equal(ltf.bars(i), expected)
+    assert ltf.range(-1) == (105, 120)
+
+
+def test_ranges_extend_as_major_bars_are_appended():
+    minor, major = _values(120, "1min"), _values(7, "15min")
+    ltf = LTF_DF(minor, major)
+    assert ltf.range(-1) == (90, 120)
+
+    major.update(SingleValueData(major.next_bar_time, 7.0))
+    assert ltf.range(-2) == (90, 105)
+    assert ltf.range(-1) == (105, 120)
+
+
+def test_requires_a_lower_timeframe():
+    with pytest.raises(ValueError):
+        LTF_DF(_values(10, "15min"), _values(10, "1min"))
@@ -0,0 +1,72 @@
+"""Tests that the streaming statistics of fracta.rolling match their vectorized pandas equivalents"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fracta import rolling
+
+PERIOD = 14
+
+
+def _data(n: int = 300) -> pd.Series:
+    rng = np.random.default_rng(3)
+    values = 100 + np.cumsum(rng.normal(0, 1, n))
+    values[[40, 41, 150]] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-02", periods=n, freq="1min", tz="UTC"))
+
+
+def _rma(data: pd.Series, period: int) -> pd.Series:
+    values = data.to_numpy(dtype="float64", copy=True)
+    values[period - 1] = values[:period].mean()
+    values[: period - 1] = np.nan
+    return pd.Series(values, index=data.index).ewm(alpha=1 / period, adjust=False, ignore_na=True).mean()
+
+
+EXPECTED = {
+    rolling.RollingSum: lambda d: d.rolling(PERIOD).sum(),
+    rolling.RollingMean: lambda d: d.rolling(PERIOD).mean(),
+    rolling.RollingMax: lambda d: d.rolling(PERIOD).max(),
+    rolling.RollingMin: lambda d: d.rolling(PERIOD).min(),
+    rolling.EMA: lambda d: d.ewm(alpha=2 / (PERIOD + 1), adjust=False, ignore_na=True).mean(),
+    rolling.RMA: lambda d: _rma(d, PERIOD),
+}
+
+
+def _stream(stat: rolling.StreamingStat, data: pd.Series, n_seed: int, revise: bool = False) -> pd.Series:
+    "Seed the stat with the first n_seed values then stream the rest, optionally revising each bar first"
+    out = list(stat.seed(data.iloc[:n_seed]))
+    for x in data.iloc[n_seed:]:
+        if revise:
+            stat.update(x + 5.0, new_bar=True)
+            out.append(stat.update(x, new_bar=False))
+        else:
+            out.append(stat.update(x))
+    return pd.Series(out, index=data.index)
+
+
+@pytest.mark.parametrize("cls", list(EXPECTED.keys()), ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("n_seed", [5, 60])
+def test_streaming_matches_pandas(cls, n_seed):
+    data = _data()
+    pd.testing.assert_series_equal(_stream(cls(PERIOD), data, n_seed), EXPECTED[cls](data), check_freq=False)
+
+
+@pytest.mark.parametrize("cls", list(EXPECTED.keys()), ids=lambda cls: cls.__name__)
+def test_revising_the_last_bar(cls):
+    data = _data()
+    pd.testing.assert_series_equal(
+        _stream(cls(PERIOD), data, 60, revise=True), EXPECTED[cls](data), check_freq=False
+    )
+
+
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_rolling_std(ddof):
+    data = _data()
+    expected = data.rolling(PERIOD).std(ddof=ddof)
+    pd.testing.assert_series_equal(_stream(rolling.RollingStd(PERIOD, ddof), data, 60), expected, check_freq=False)
+
+
+def test_period_must_be_positive():
+    with pytest.raises(ValueError):
+        rolling.RollingMean(0)
@@ -0,0 +1,46 @@
+"""Tests of the shared memory fwd_queue transport"""
+
+import numpy as np
+import pandas as pd
+
+from fracta.shm_queue import ShmQueue
+
+
+def _transfer_df(n: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame({"time": np.arange(n, dtype="float64"), "value": np.arange(n, dtype="int64")})
+
+
+def test_dataframe_round_trip():
+    queue = ShmQueue(size=2**20, threshold=16)
+    try:
+        df = _transfer_df()
+        queue.put(("cmd", df))
+        cmd, out = queue.get(timeout=5)
+        assert cmd == "cmd"
+        pd.testing.assert_frame_equal(out, df)
+    finally:
+        queue.close()
+
+
+def test_sliced_dataframe_is_written_to_the_ring():
+    queue = ShmQueue(size=2**20, threshold=16)
+    try:
+        chunk = _transfer_df().iloc[400:]
+        queue.put(("cmd", chunk))
+        assert queue._headers.get(timeout=5)[1].kind == "df"  # pylint: disable=protected-access
+
+        queue.put(("cmd", chunk))
+        _, out = queue.get(timeout=5)
+        pd.testing.assert_frame_equal(out, chunk)
+    finally:
+        queue.close()
+
+
+def test_strings_round_trip():
+    queue = ShmQueue(size=2**20, threshold=16)
+    try:
+        script = "x" * 100
+        queue.put(("cmd", script, "short"))
+        assert queue.get(timeout=5) == ("cmd", script, "short")
+    finally:
+        queue.close()
@@ -0,0 +1,56 @@
+"""Tests of the DataFrames formatted for transfer to the screen"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fracta import series_common as sc
+from fracta.dataframe_ext import Series_DF
+from fracta.orm.series_data import SeriesType
+
+
+def _ohlcv(n: int = 20) -> pd.DataFrame:
+    close = np.arange(n, dtype="float64") + 100
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-02", periods=n, freq="1min", tz="UTC"),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.full(n, 10, dtype="int64"),
+        }
+    )
+
+
+def test_candlestick_columns_and_epoch():
+    src = _ohlcv()
+    xfer = sc.transfer_dataframe(Series_DF(src.copy()), SeriesType.Candlestick)
+
+    assert set(xfer.columns) == {"time", "open", "high", "low", "close"}
+    np.testing.assert_array_equal(xfer["time"], pd.DatetimeIndex(src["time"]).as_unit("s").asi8)
+    np.testing.assert_array_equal(xfer["close"], src["close"])
+
+
+def test_value_map_renames_the_displayed_column():
+    xfer = sc.transfer_dataframe(Series_DF(_ohlcv()), SeriesType.Histogram, {"value": "volume"})
+    assert list(xfer.columns) == ["time", "value"]
+    assert (xfer["value"] == 10).all()
+
+
+@pytest.mark.parametrize("as_series_df", [True, False])
+def test_rows_are_limited_to_the_range(as_series_df):
+    src = _ohlcv()
+    data = Series_DF(src.copy()) if as_series_df else src
+    start, end = src["time"].iloc[5], src["time"].iloc[12]
+
+    xfer = sc.transfer_dataframe(data, SeriesType.Line, {"value": "close"}, start, end)
+    np.testing.assert_array_equal(xfer["value"], src["close"].iloc[5:12])
+
+
+def test_pandas_series_is_displayed_as_values():
+    src = _ohlcv()
+    series = pd.Series(src["close"].to_numpy(), index=pd.DatetimeIndex(src["time"]))
+    xfer = sc.transfer_dataframe(series, SeriesType.Line)
+    assert list(xfer.columns) == ["time", "value"]
+    assert len(xfer) == len(src)